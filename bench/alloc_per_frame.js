@@ -0,0 +1,64 @@
+/**
+ * Heap allocated and time spent per rotated frame of the gridded field
+ *
+ *   node --expose-gc --min-semi-space-size=512 --max-semi-space-size=512 \
+ *     bench/alloc_per_frame.js [n_lat n_lon] [--lighting]
+ *
+ * Defaults to a 100 x 100 grid. Each frame sets the rotation and lets the
+ * view render on its animation frame, redrawing the field and overlays.
+ * heapUsed is compared across the measured frames; the young generation is
+ * pinned large enough (--min/max-semi-space-size) that no scavenge runs in
+ * between, so the difference is what the frames allocated. If a collection
+ * does run, the result is reported as invalid.
+ */
+
+const {PerformanceObserver} = require("perf_hooks")
+const {createView, flushFrames, makeGrid} = require("./harness")
+
+if (typeof gc !== "function") {
+  console.error("run with: node --expose-gc --min-semi-space-size=512 --max-semi-space-size=512 " +
+                "bench/alloc_per_frame.js")
+  process.exit(1)
+}
+
+const args = process.argv.slice(2)
+const enable_lighting = args.includes("--lighting")
+const [n_lat = 100, n_lon = 100] = args.filter((arg) => !arg.startsWith("--")).map(Number)
+
+const WARMUP_FRAMES = 40
+const FRAMES = 50
+
+// A fixed color range, so the frames do not depend on the value statistics
+const view = createView({...makeGrid(n_lat, n_lon), vmin: -20, vmax: 20, enable_lighting})
+
+let rotation = 0
+const frame = () => {
+  view.model.rotation = ++rotation % 360
+  flushFrames()
+}
+
+for (let i = 0; i < WARMUP_FRAMES; i++) frame()
+
+gc()
+let collections = 0
+const observer = new PerformanceObserver((list) => collections += list.getEntries().length)
+observer.observe({entryTypes: ["gc"]})
+
+const heap_before = process.memoryUsage().heapUsed
+const start = performance.now()
+for (let i = 0; i < FRAMES; i++) frame()
+const elapsed = performance.now() - start
+const allocated = process.memoryUsage().heapUsed - heap_before
+
+// GC entries are delivered asynchronously
+setImmediate(() => {
+  observer.disconnect()
+  const kib = allocated / FRAMES / 1024
+  const size = kib >= 1024 ? `${(kib / 1024).toFixed(2)} MiB` : `${kib.toFixed(1)} KiB`
+  console.log(`${n_lat}x${n_lon} grid, lighting ${enable_lighting ? "on" : "off"}: ` +
+              `${size} allocated/frame, ${(elapsed / FRAMES).toFixed(2)} ms/frame`)
+  if (collections > 0) {
+    console.log(`invalid: ${collections} garbage collections ran while measuring; ` +
+                `raise --min-semi-space-size`)
+  }
+})
@@ -0,0 +1,53 @@
+/**
+ * Time and draw calls per frame of line and trajectory overlays
+ *
+ *   node bench/arcs.js [n_lines]
+ *
+ * Defaults to 3000 two-point great-circle routes, then 300 ten-point
+ * trajectories at random altitudes, then an orbit of 5 rings of 300 points.
+ * Each overlay is drawn on its own over a minimal 2 x 3 grid.
+ */
+
+const {createView, drawCalls, flushFrames, makeGrid, random, timeit} = require("./harness")
+
+const n_lines = Number(process.argv[2] ?? 3000)
+const rand = random(3)
+const lon = () => 360 * rand() - 180
+const lat = () => 140 * rand() - 70
+
+const cases = {
+  [`${n_lines} routes`]: {
+    line_data: Array.from({length: n_lines}, () => ({coords: [[lon(), lat()], [lon(), lat()]]})),
+  },
+  "300 trajectories": {
+    trajectory_data: Array.from({length: 300}, () => ({
+      coords: Array.from({length: 10}, () => ({lon: lon(), lat: lat(), altitude: 300 * rand()})),
+    })),
+  },
+  "5 x 300 point orbit": {
+    trajectory_data: Array.from({length: 5}, (_, ring) => ({
+      coords: Array.from({length: 300}, (_, i) => ({
+        lon: 1.2 * i - 180,
+        lat: 10 * Math.sin(i / 20 + ring),
+        altitude: 100 * ring,
+      })),
+    })),
+  },
+}
+
+for (const [name, overlay] of Object.entries(cases)) {
+  const view = createView({...makeGrid(2, 3), ...overlay})
+  const frame = (i) => {
+    view.model.rotation = 6 * i % 360
+    flushFrames()
+  }
+
+  const ms = timeit(frame)
+  const before = drawCalls()
+  frame(0)
+  const after = drawCalls()
+  const calls = (method) => (after[method] ?? 0) - (before[method] ?? 0)
+
+  console.log(`${name}: ${ms.toFixed(1)} ms/frame, ${calls("stroke")} strokes and ` +
+              `${calls("lineTo")} lineTo calls/frame`)
+}
@@ -0,0 +1,60 @@
+/**
+ * Scrubbing through a values_cube with a bounded frame cache
+ *
+ *   node bench/frame_cache.js [n_time] [frame_cache_size] [--cube]
+ *
+ * Defaults to 30 frames of a 60 x 120 grid and a cache of 8. time_index is
+ * stepped 100 times by 7 frames, so most steps miss the cache. Each frame's
+ * cell colors are checked against a view given that frame alone as values,
+ * and the frame buffers the view used are counted; with a bounded cache
+ * there are never more of them than its size. --cube sets cube_color_range
+ * to "cube" instead of the default "frame".
+ */
+
+const {createView, flushFrames, makeGrid} = require("./harness")
+
+const args = process.argv.slice(2).filter((arg) => !arg.startsWith("--"))
+const n_time = Number(args[0] ?? 30)
+const frame_cache_size = Number(args[1] ?? 8)
+const cube_color_range = process.argv.includes("--cube") ? "cube" : "frame"
+const STEPS = 100
+
+const {n_lat, n_lon, lon_axis, lat_axis} = makeGrid()
+const n_values = n_lat * n_lon
+const values_cube = Float32Array.from({length: n_time * n_values},
+                                      (_, k) => 10 * Math.sin(k / 37) + 0.5 * k / n_values)
+
+// With cube_color_range "cube" the color range spans all frames, so a
+// single frame is compared with the same range
+let range = {}
+if (cube_color_range == "cube") {
+  range = {vmin: Infinity, vmax: -Infinity}
+  for (const value of values_cube) {
+    range.vmin = Math.min(range.vmin, value)
+    range.vmax = Math.max(range.vmax, value)
+  }
+}
+
+const view = createView({n_lat, n_lon, lon_axis, lat_axis, values: [], values_cube, frame_cache_size,
+                         cube_color_range})
+const frame_buffers = new Set()
+let mismatches = 0
+let elapsed = 0
+
+for (let step = 0; step < STEPS; step++) {
+  const time_index = 7 * step % n_time
+  const start = performance.now()
+  view.model.time_index = time_index
+  flushFrames()
+  elapsed += performance.now() - start
+  frame_buffers.add(view.cell_colors)
+
+  const values = values_cube.slice(time_index * n_values, (time_index + 1) * n_values)
+  const single = createView({n_lat, n_lon, lon_axis, lat_axis, values, ...range})
+  if (!view.cell_rgba.every((rgba, i) => rgba == single.cell_rgba[i])) {
+    mismatches++
+  }
+}
+
+console.log(`${n_time} frames, cache of ${frame_cache_size}, ${cube_color_range} range: ${(elapsed / STEPS).toFixed(2)} ms/step, ` +
+            `${frame_buffers.size} frame buffers, ${mismatches} of ${STEPS} frames differ`)
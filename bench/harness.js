@@ -0,0 +1,361 @@
+/**
+ * Node harness that drives the compiled GriddedSphereView without a browser
+ *
+ * The extension bundle is loaded with just enough of BokehJS stubbed out to
+ * define the models: properties and signals, LayoutDOM/LayoutDOMView and a
+ * DOM whose canvases hand out MockContext2D. Drawing therefore costs only the
+ * view's own work (projection, sorting, color lookup, allocation), which is
+ * what the benchmarks in this directory measure. Absolute timings are not
+ * those of a real canvas.
+ *
+ * The bundle defaults to bokeh_gridded_sphere/dist/bokeh_gridded_sphere.js;
+ * set BUNDLE to compare against a bundle built from another commit.
+ */
+
+const fs = require("fs")
+const path = require("path")
+
+const BUNDLE = process.env.BUNDLE ??
+  path.join(__dirname, "..", "bokeh_gridded_sphere", "dist", "bokeh_gridded_sphere.js")
+
+// Canvas 2D methods; the ones whose result the view reads come last
+const CONTEXT_METHODS = [
+  "arc", "beginPath", "clearRect", "clip", "closePath", "drawImage", "ellipse", "fill",
+  "fillRect", "fillText", "lineTo", "moveTo", "putImageData", "quadraticCurveTo", "rect",
+  "restore", "rotate", "save", "scale", "setLineDash", "setTransform", "stroke",
+  "strokeRect", "strokeText", "transform", "translate",
+  "createLinearGradient", "createImageData", "getImageData", "measureText",
+]
+
+// Every context handed out, for drawCalls()
+const contexts = []
+
+/**
+ * A 2D context that draws nothing and counts calls by method name
+ */
+class MockContext2D {
+  constructor(canvas) {
+    contexts.push(this)
+    this.canvas = canvas
+    this.counts = new Float64Array(CONTEXT_METHODS.length)
+    this.fillStyle = "#000000"
+    this.strokeStyle = "#000000"
+    this.lineWidth = 1
+    this.lineCap = "butt"
+    this.lineJoin = "miter"
+    this.globalAlpha = 1
+    this.font = "10px sans-serif"
+    this.textAlign = "start"
+    this.textBaseline = "alphabetic"
+  }
+
+  get calls() {
+    const calls = {}
+    CONTEXT_METHODS.forEach((name, i) => {
+      if (this.counts[i] > 0) calls[name] = this.counts[i]
+    })
+    return calls
+  }
+}
+
+// Counting through a fixed slot keeps the mock cheap next to the view's work
+CONTEXT_METHODS.forEach((name, i) => {
+  MockContext2D.prototype[name] = function() {
+    this.counts[i]++
+  }
+})
+
+// What the methods the view reads back return
+const results = {
+  createLinearGradient: () => ({addColorStop() {}}),
+  createImageData: (width, height) => ({width, height, data: new Uint8ClampedArray(4 * width * height)}),
+  getImageData: (x, y, width, height) => ({width, height, data: new Uint8ClampedArray(4 * width * height)}),
+  measureText: (text) => ({width: 6 * String(text).length}),
+}
+for (const [name, result] of Object.entries(results)) {
+  const i = CONTEXT_METHODS.indexOf(name)
+  MockContext2D.prototype[name] = function(...args) {
+    this.counts[i]++
+    return result(...args)
+  }
+}
+
+class MockElement {
+  constructor(tag) {
+    this.tag = tag
+    this.style = {}
+    this.children = []
+    this.width = 300
+    this.height = 150
+    this.innerHTML = ""
+    this.context = null
+  }
+
+  appendChild(child) {
+    this.children.push(child)
+    return child
+  }
+
+  addEventListener() {}
+  removeEventListener() {}
+
+  getBoundingClientRect() {
+    return {left: 0, top: 0, width: this.width, height: this.height}
+  }
+
+  getContext() {
+    return this.context ??= new MockContext2D(this)
+  }
+}
+
+/**
+ * Calls made so far on all contexts, by method name
+ */
+function drawCalls() {
+  const calls = {}
+  for (const ctx of contexts) {
+    for (const name in ctx.calls) {
+      calls[name] = (calls[name] ?? 0) + ctx.calls[name]
+    }
+  }
+  return calls
+}
+
+/**
+ * A BokehJS-style signal: handlers connected to it run on emit()
+ */
+class Signal {
+  constructor() {
+    this.slots = []
+  }
+
+  connect(slot) {
+    this.slots.push(slot)
+  }
+
+  disconnect(slot) {
+    this.slots = this.slots.filter((connected) => connected !== slot)
+  }
+
+  emit() {
+    for (const slot of this.slots) slot()
+  }
+}
+
+// Animation frames run only when the benchmark calls flushFrames()
+let frame_queue = []
+let frame_id = 0
+
+globalThis.window = globalThis
+globalThis.document = {createElement: (tag) => new MockElement(tag)}
+globalThis.requestAnimationFrame = (callback) => {
+  frame_queue.push([++frame_id, callback])
+  return frame_id
+}
+globalThis.cancelAnimationFrame = (id) => {
+  frame_queue = frame_queue.filter(([queued]) => queued != id)
+}
+
+/**
+ * Run the animation frame callbacks queued so far, as the browser would
+ * at timestamp `now`
+ */
+function flushFrames(now = performance.now()) {
+  const queued = frame_queue
+  frame_queue = []
+  for (const [, callback] of queued) callback(now)
+}
+
+class HasProps {
+  static defaults = {}
+
+  static define(props) {
+    // Property kinds are not checked; only the defaults are kept
+    const kind = new Proxy(function() {}, {get: () => kind, apply: () => kind})
+    this.defaults = {...this.defaults, ...props(kind)}
+  }
+
+  static override() {}
+
+  /**
+   * Properties are accessors, so assigning one emits its change signal and
+   * then the model's, as BokehJS does
+   */
+  constructor(attrs = {}) {
+    this.change = new Signal()
+    this.properties = {}
+    const values = {}
+    for (const [name, [, value]] of Object.entries(this.constructor.defaults)) {
+      values[name] = name in attrs ? attrs[name] : typeof value == "function" ? value() : value
+      const change = new Signal()
+      this.properties[name] = {name, change, get_value: () => values[name]}
+      Object.defineProperty(this, name, {
+        enumerable: true,
+        get: () => values[name],
+        set: (value) => {
+          values[name] = value
+          change.emit()
+          this.change.emit()
+        },
+      })
+    }
+  }
+}
+
+class LayoutDOMView {
+  constructor({model}) {
+    this.model = model
+    this.shadow_el = new MockElement("div")
+  }
+
+  connect(signal, slot) {
+    signal.connect(slot)
+  }
+
+  disconnect(signal, slot) {
+    signal.disconnect(slot)
+  }
+
+  on_change(properties, slot) {
+    for (const property of Array.isArray(properties) ? properties : [properties]) {
+      property.change.connect(slot)
+    }
+  }
+
+  connect_signals() {}
+  render() {}
+  remove() {}
+}
+
+const stubs = {
+  "core/properties": {},
+  "core/dom": {div: () => new MockElement("div")},
+  "core/logging": {logger: {warn: console.warn, info() {}, debug() {}}},
+  "core/util/color": {color2rgba},
+  "model": {Model: HasProps},
+  "models/layouts/layout_dom": {LayoutDOM: HasProps, LayoutDOMView},
+  "models/sources/columnar_data_source": {ColumnarDataSource: HasProps},
+  "models/sources/column_data_source": {ColumnDataSource: HasProps},
+  "base": {register_models() {}},
+}
+
+function color2rgba(color) {
+  const named = {black: "#000000", white: "#ffffff"}
+  let hex = named[color] ?? color
+  if (hex.length == 4) {
+    hex = "#" + hex[1] + hex[1] + hex[2] + hex[2] + hex[3] + hex[3]
+  }
+  return [
+    parseInt(hex.slice(1, 3), 16), parseInt(hex.slice(3, 5), 16), parseInt(hex.slice(5, 7), 16),
+    hex.length == 9 ? parseInt(hex.slice(7, 9), 16) : 255,
+  ]
+}
+
+/**
+ * Evaluate an extension bundle and return the exports of all its modules.
+ *
+ * Besides bundles built by `python -m bokeh_gridded_sphere`, this loads the
+ * ones Bokeh compiled from __implementation__ before the bundle was
+ * prebuilt, which name their modules differently.
+ */
+function loadBundle(file) {
+  let modules = {}
+  const Bokeh = {
+    register_plugin(plugin_modules) {
+      modules = plugin_modules
+    },
+  }
+  new Function("Bokeh", fs.readFileSync(file, "utf8").replace('root["Bokeh"]', "Bokeh"))
+    .call(globalThis, Bokeh)
+
+  const cache = {}
+  const require = (id) => {
+    if (id == "tslib") {
+      return {
+        __importStar: (m) => m,
+        __importDefault: (m) => m?.__esModule ? m : {default: m},
+      }
+    }
+    if (id.startsWith("@bokehjs/")) {
+      id = id.slice("@bokehjs/".length)
+    }
+    if (id in stubs) return stubs[id]
+
+    let mod = cache[id]
+    if (mod === undefined) {
+      if (modules[id] === undefined) {
+        throw new Error(`cannot find module '${id}' in ${file}`)
+      }
+      mod = cache[id] = {exports: {}}
+      const exports = mod.exports
+      const __esModule = () => Object.defineProperty(exports, "__esModule", {value: true})
+      const __esExport = (name, value) => exports[name] = value
+      modules[id].call(exports, require, mod, exports, __esModule, __esExport)
+    }
+    return mod.exports
+  }
+  return Object.keys(modules).map(require)
+}
+
+// Exports of every module in the bundle, e.g. to reach helpers like coarsenGrid
+const modules = loadBundle(BUNDLE)
+const {GriddedSphere, GriddedSphereView} = modules.find((exports) => "GriddedSphereView" in exports)
+
+/**
+ * A regular n_lat x n_lon test field on 1-D axes
+ */
+function makeGrid(n_lat = 60, n_lon = 120) {
+  const lon_axis = Float64Array.from({length: n_lon}, (_, j) => -180 + 360 * j / (n_lon - 1))
+  const lat_axis = Float64Array.from({length: n_lat}, (_, i) => -90 + 180 * i / (n_lat - 1))
+  const values = Float64Array.from({length: n_lat * n_lon}, (_, k) => 20 * Math.sin(k / 50))
+  return {n_lat, n_lon, lon_axis, lat_axis, values}
+}
+
+/**
+ * Create a GriddedSphere with the given properties and render its view the
+ * way BokehJS would. The default field is makeGrid(); overlays are empty.
+ */
+function createView(attrs = {}) {
+  const model = new GriddedSphere({...makeGrid(), show_coastlines: false, ...attrs})
+  const view = new GriddedSphereView({model})
+  view.connect_signals()
+  view.render()
+  return view
+}
+
+/**
+ * A column data source holding `data`, for the *_source properties
+ */
+function columnSource(data) {
+  return {
+    data,
+    change: new Signal(),
+    streaming: new Signal(),
+    patching: new Signal(),
+    columns: () => Object.keys(data),
+    get_column: (name) => data[name] ?? null,
+    get_length: () => Object.values(data)[0]?.length ?? 0,
+  }
+}
+
+/**
+ * A deterministic pseudo-random number generator on [0, 1)
+ */
+function random(seed = 1) {
+  return () => (seed = (seed * 16807) % 2147483647) / 2147483647
+}
+
+/**
+ * Mean milliseconds per call of `fn(i)` over `runs` calls, after `warmup`
+ */
+function timeit(fn, {warmup = 5, runs = 20} = {}) {
+  for (let i = 0; i < warmup; i++) fn(i)
+  const start = performance.now()
+  for (let i = 0; i < runs; i++) fn(warmup + i)
+  return (performance.now() - start) / runs
+}
+
+module.exports = {
+  BUNDLE, MockContext2D, GriddedSphere, GriddedSphereView, modules,
+  makeGrid, createView, columnSource, drawCalls, flushFrames, random, timeit,
+}
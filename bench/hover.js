@@ -0,0 +1,70 @@
+/**
+ * Time per hover over many scatter points and bars
+ *
+ *   node bench/hover.js [n_points] [--curvilinear]
+ *
+ * Defaults to 50000 scatter points and a tenth as many bars at random
+ * positions. After one render, the mouse is moved to 2000 random positions
+ * through the canvas' mousemove handler, which updates the tooltip.
+ * --curvilinear gives the field as a sheared 180 x 360 lon/lat mesh, which
+ * has no axes to locate cells with; with 0 points every hover on the
+ * sphere looks up a grid value.
+ */
+
+const {createView, random} = require("./harness")
+
+const args = process.argv.slice(2).filter((arg) => !arg.startsWith("--"))
+const n_points = Number(args[0] ?? 50000)
+const curvilinear = process.argv.includes("--curvilinear")
+const n_bars = Math.floor(n_points / 10)
+const HOVERS = 2000
+
+const rand = random(1)
+const scatter_data = Array.from({length: n_points}, (_, i) => ({
+  lon: 360 * rand() - 180,
+  lat: 180 * rand() - 90,
+  size: 1 + 8 * rand(),
+  label: `p${i}`,
+}))
+const bar_data = Array.from({length: n_bars}, (_, i) => ({
+  lon: 360 * rand() - 180,
+  lat: 180 * rand() - 90,
+  height: 500 * rand(),
+  label: `b${i}`,
+}))
+
+let field = {}
+if (curvilinear) {
+  const n_lat = 180
+  const n_lon = 360
+  const lons = new Float64Array(n_lat * n_lon)
+  const lats = new Float64Array(n_lat * n_lon)
+  const values = new Float64Array(n_lat * n_lon)
+  for (let i = 0; i < n_lat; i++) {
+    for (let j = 0; j < n_lon; j++) {
+      const k = i * n_lon + j
+      lons[k] = -180 + j + 0.5 * i / n_lat
+      lats[k] = -89.5 + i + 0.5 * Math.sin(j / 20)
+      values[k] = 20 * Math.sin(k / 50)
+    }
+  }
+  field = {n_lat, n_lon, lons, lats, values, lon_axis: [], lat_axis: []}
+}
+
+const view = createView({scatter_data, bar_data, ...field})
+const {canvas, tooltip_el} = view
+
+const moves = Array.from({length: HOVERS}, () => ({clientX: 800 * rand(), clientY: 800 * rand()}))
+const tooltips = []
+
+const start = performance.now()
+for (const move of moves) {
+  canvas.onmousemove(move)
+  tooltips.push(tooltip_el.style.display == "block" ? tooltip_el.innerHTML : "")
+}
+const elapsed = performance.now() - start
+
+// What the tooltips showed, to check that a faster hover finds the same items
+const shown = (prefix) => tooltips.filter((tooltip) => tooltip.startsWith(prefix)).length
+console.log(`${n_points} points, ${n_bars} bars: ${(elapsed / HOVERS).toFixed(3)} ms/hover; ` +
+            `tooltips: ${shown("p")} points, ${shown("b")} bars, ${shown("Value")} grid values`)
@@ -0,0 +1,33 @@
+/**
+ * Time per frame spent drawing many scatter points
+ *
+ *   node bench/scatter.js [n_points] [--source]
+ *
+ * Defaults to 100000 points at random positions, given as scatter_data
+ * records or, with --source, as typed-array columns of scatter_source. The
+ * field is a minimal 2 x 3 grid, so the frame time is the scatter overlay's.
+ */
+
+const {columnSource, createView, flushFrames, makeGrid, random, timeit} = require("./harness")
+
+const args = process.argv.slice(2)
+const use_source = args.includes("--source")
+const [n_points = 100000] = args.filter((arg) => !arg.startsWith("--")).map(Number)
+
+const rand = random(7)
+const lon = Float64Array.from({length: n_points}, () => 360 * rand() - 180)
+const lat = Float64Array.from({length: n_points}, () => 180 * rand() - 90)
+const size = new Float64Array(n_points).fill(3)
+
+const overlay = use_source ?
+  {scatter_source: columnSource({lon, lat, size})} :
+  {scatter_data: Array.from({length: n_points}, (_, i) => ({lon: lon[i], lat: lat[i], size: size[i]}))}
+const view = createView({...makeGrid(2, 3), ...overlay})
+
+const ms = timeit((i) => {
+  view.model.rotation = 6 * i % 360
+  flushFrames()
+})
+
+console.log(`${n_points} points as ${use_source ? "scatter_source" : "scatter_data"}: ` +
+            `${ms.toFixed(1)} ms/frame`)
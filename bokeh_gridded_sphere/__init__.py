@@ -0,0 +1,205 @@
+"""
+Bokeh extension for gridded data on a sphere: GriddedSphere and SphereGeometry
+
+The models live in ``models.py``; importing them from this package loads
+them on first use. The TypeScript sources in this directory are compiled
+ahead of time with ``bokeh build`` into ``dist/bokeh_gridded_sphere.js``
+(and ``.min.js``), which Bokeh inlines or serves like any other extension,
+so showing or saving a document never runs the TypeScript compiler. After
+editing the sources, rebuild with::
+
+    python -m bokeh_gridded_sphere
+
+The field's render worker is bundled separately first, from
+``render_worker.ts`` and the modules it imports, and embedded in the main
+bundle as ``dist/render_worker.json``.
+
+``package.json`` carries the package version, which Bokeh puts in the URL
+the bundle is served from, so browsers don't keep a bundle from another
+version. It must match ``__version__``. The build stamp next to the bundle
+records the version, the Bokeh version and a hash of the sources it was
+built from; the compiler only runs when they differ.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import warnings
+
+__version__ = "0.2.0"
+
+__all__ = ["GriddedSphere", "SphereGeometry", "build", "is_stale"]
+
+_EXT_DIR = os.path.dirname(os.path.abspath(__file__))
+_NAME = os.path.basename(_EXT_DIR)
+_STAMP = os.path.join(_EXT_DIR, "dist", _NAME + ".stamp")
+_PACKAGE_JSON = os.path.join(_EXT_DIR, "package.json")
+_SOURCE_EXTENSIONS = (".ts", ".js", ".json")
+
+# The render worker's entry and the modules it imports, none of which may
+# import BokehJS, and the loader that stands in for BokehJS in the worker
+_WORKER_ENTRY = "render_worker.ts"
+_WORKER_MODULES = ("quads.ts", "projections.ts", "rgba.ts")
+_WORKER_LOADER = "worker_loader.js"
+_WORKER_BUNDLE = os.path.join(_EXT_DIR, "dist", "render_worker.json")
+
+
+def __getattr__(name):
+    # The models import Bokeh and warn about a stale bundle, neither of
+    # which the build should wait for
+    if name in ("GriddedSphere", "SphereGeometry"):
+        from . import models
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _source_files():
+    return sorted(
+        name for name in os.listdir(_EXT_DIR)
+        if name.endswith(_SOURCE_EXTENSIONS)
+    )
+
+
+def source_hash():
+    """SHA-256 over the names and contents of the extension sources"""
+    sha = hashlib.sha256()
+    for name in _source_files():
+        sha.update(name.encode())
+        with open(os.path.join(_EXT_DIR, name), "rb") as f:
+            sha.update(f.read())
+    return sha.hexdigest()
+
+
+def _current_stamp():
+    import bokeh
+    return {
+        "version": __version__,
+        "bokeh_version": bokeh.__version__,
+        "sources": source_hash(),
+    }
+
+
+def _read_stamp():
+    try:
+        with open(_STAMP) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_stale():
+    """Whether the bundle is missing or was built from other sources"""
+    return _read_stamp() != _current_stamp()
+
+
+def build(rebuild=False):
+    """Compile the extension bundle if the sources changed since the last build
+
+    Returns True when the bundle is up to date afterwards.
+    """
+    with open(_PACKAGE_JSON) as f:
+        package_version = json.load(f)["version"]
+    if package_version != __version__:
+        raise ValueError(
+            f"package.json version {package_version} does not match "
+            f"__version__ {__version__}"
+        )
+
+    if not rebuild and not is_stale():
+        return True
+
+    if not _build_worker() or not _build_bundle():
+        return False
+
+    with open(_STAMP, "w") as f:
+        json.dump(_current_stamp(), f, indent=2)
+        f.write("\n")
+    return True
+
+
+def _build_bundle():
+    """Bundle the extension into ``dist/``
+
+    With a package.json present, ``bokeh build`` installs BokehJS from npm
+    instead of building against the installed Bokeh, so the sources are
+    built from a copy without it. Returns True on success.
+    """
+    sources = [name for name in _source_files() if name != "package.json"]
+    with tempfile.TemporaryDirectory() as tmp:
+        staging = _stage(tmp, _NAME, {name: name for name in sources})
+        os.mkdir(os.path.join(staging, "dist"))
+        shutil.copy(_WORKER_BUNDLE, os.path.join(staging, "dist"))
+
+        # bokeh.ext.json names the license relative to the extension
+        with open(os.path.join(_EXT_DIR, "bokeh.ext.json")) as f:
+            license_file = json.load(f).get("license", {}).get("file")
+        if license_file is not None:
+            shutil.copy(os.path.join(_EXT_DIR, license_file),
+                        os.path.normpath(os.path.join(staging, license_file)))
+
+        if not _bokeh_build(staging):
+            return False
+        for ext in (".js", ".min.js", ".js.map"):
+            shutil.copy(os.path.join(staging, "dist", _NAME + ext),
+                        os.path.join(_EXT_DIR, "dist"))
+    return True
+
+
+def _build_worker():
+    """Bundle the render worker on its own into ``dist/render_worker.json``
+
+    ``bokeh build`` only bundles sources under its base directory, so the
+    worker's entry and modules are built as an extension of their own in a
+    temporary directory. Returns True on success.
+    """
+    files = {"index.ts": _WORKER_ENTRY, "tsconfig.json": "tsconfig.json"}
+    files.update((name, name) for name in _WORKER_MODULES)
+    with tempfile.TemporaryDirectory() as tmp:
+        staging = _stage(tmp, "render_worker", files)
+        with open(os.path.join(staging, "bokeh.ext.json"), "w") as f:
+            f.write("{}\n")
+
+        if not _bokeh_build(staging):
+            return False
+        with open(os.path.join(staging, "dist", "render_worker.min.js")) as f:
+            bundle = f.read()
+
+    # The worker runs from a blob URL, where a source map can't be found
+    bundle = re.sub(r"^//# sourceMappingURL=.*$", "", bundle, flags=re.MULTILINE)
+    with open(os.path.join(_EXT_DIR, _WORKER_LOADER)) as f:
+        loader = f.read()
+    with open(_WORKER_BUNDLE, "w") as f:
+        json.dump({"source": loader + bundle}, f)
+        f.write("\n")
+    return True
+
+
+def _stage(tmp, name, files):
+    """Copy sources into a directory ``name`` under ``tmp``
+
+    ``files`` maps each file's name in the staging directory to its name
+    here. Returns the staging directory.
+    """
+    staging = os.path.join(tmp, name)
+    os.mkdir(staging)
+    for target, source in files.items():
+        shutil.copy(os.path.join(_EXT_DIR, source), os.path.join(staging, target))
+    return staging
+
+
+def _bokeh_build(directory):
+    from bokeh.ext import build as bokeh_build
+    return bokeh_build(directory, rebuild=True)
+
+
+def warn_if_stale():
+    """Warn when a source checkout's bundle no longer matches its sources"""
+    # Installed copies may not ship the sources; there is nothing to compare
+    if _source_files() and is_stale():
+        warnings.warn(
+            "the bokeh_gridded_sphere bundle is out of date with its sources or "
+            "this Bokeh version; run 'python -m bokeh_gridded_sphere' to rebuild it",
+            stacklevel=3,
+        )
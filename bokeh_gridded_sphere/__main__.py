@@ -0,0 +1,6 @@
+"""Rebuild the extension bundle: ``python -m bokeh_gridded_sphere [--rebuild]``"""
+import sys
+
+from bokeh_gridded_sphere import build
+
+sys.exit(0 if build(rebuild="--rebuild" in sys.argv[1:]) else 1)
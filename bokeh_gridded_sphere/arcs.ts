@@ -0,0 +1,171 @@
+/**
+ * Interpolated world-space geometry of line and trajectory overlays
+ */
+
+import type {Arrayable} from "@bokehjs/core/types"
+
+/**
+ * Largest distance in pixels between an interpolated arc and its chords
+ */
+export const ARC_TOLERANCE = 0.5
+
+/**
+ * Most chords a single arc between two input vertices is split into
+ */
+export const MAX_ARC_SEGMENTS = 256
+
+/**
+ * Sphere radius in pixels that arcs are interpolated for: the next power of
+ * two at or above the current scale, so zooming only interpolates again
+ * when it crosses one and never undersamples
+ */
+export function arcRadius(scale: number): number {
+  return 2 ** Math.ceil(Math.log2(Math.max(scale, 1)))
+}
+
+/**
+ * Chords needed for an arc of `angle` radians on a sphere of `radius`
+ * pixels, from the sagitta of each chord: radius * angle^2 / (8 n^2)
+ */
+function arcSegments(angle: number, radius: number): number {
+  if (!(angle > 1e-6)) return 1
+  const n = Math.ceil(angle * Math.sqrt(radius / (8 * ARC_TOLERANCE)))
+  return Math.max(1, Math.min(MAX_ARC_SEGMENTS, n))
+}
+
+/**
+ * Interpolated polylines, one per overlay item, stored back to back: item
+ * k spans vertices offsets[k] until offsets[k + 1], and its j-th input
+ * vertex is vertex knots[knot_offsets[k] + j]
+ */
+export class ArcSet {
+  constructor(readonly radius: number,
+              readonly xyz: Float32Array,
+              readonly offsets: Uint32Array,
+              readonly knots: Uint32Array,
+              readonly knot_offsets: Uint32Array) {}
+
+  get count(): number {
+    return this.offsets.length - 1
+  }
+}
+
+class ArcSetBuilder {
+  private readonly xyz: number[] = []
+  private readonly offsets: number[] = [0]
+  private readonly knots: number[] = []
+  private readonly knot_offsets: number[] = [0]
+
+  get vertex_count(): number {
+    return this.xyz.length / 3
+  }
+
+  vertex(x: number, y: number, z: number): void {
+    this.xyz.push(x, y, z)
+  }
+
+  knot(): void {
+    this.knots.push(this.vertex_count - 1)
+  }
+
+  end_item(): void {
+    this.offsets.push(this.vertex_count)
+    this.knot_offsets.push(this.knots.length)
+  }
+
+  build(radius: number): ArcSet {
+    return new ArcSet(radius, new Float32Array(this.xyz), new Uint32Array(this.offsets),
+                      new Uint32Array(this.knots), new Uint32Array(this.knot_offsets))
+  }
+}
+
+function unitVector(lon: number, lat: number): [number, number, number] {
+  const lat_rad = lat * Math.PI / 180
+  const lon_rad = lon * Math.PI / 180
+  return [
+    Math.cos(lat_rad) * Math.cos(-lon_rad),
+    Math.cos(lat_rad) * Math.sin(-lon_rad),
+    Math.sin(lat_rad),
+  ]
+}
+
+/**
+ * Great-circle arcs through the vertices of each line, as unit vectors
+ */
+export function greatCircleArcs(lons: Arrayable<Arrayable<number>>, lats: Arrayable<Arrayable<number>>,
+                                radius: number): ArcSet {
+  const builder = new ArcSetBuilder()
+
+  for (let k = 0; k < lons.length; k++) {
+    const line_lons = lons[k]
+    const line_lats = lats[k]
+    let x1 = NaN, y1 = NaN, z1 = NaN
+
+    for (let i = 0; i < line_lons.length; i++) {
+      const [x2, y2, z2] = unitVector(line_lons[i], line_lats[i])
+      if (i > 0) {
+        // Spherical linear interpolation; the end vertex is added below
+        const angle = Math.acos(Math.max(-1, Math.min(1, x1 * x2 + y1 * y2 + z1 * z2)))
+        const segments = arcSegments(angle, radius)
+        const sin_angle = Math.sin(angle)
+        for (let s = 1; s < segments; s++) {
+          const f = s / segments
+          const a = Math.sin((1 - f) * angle) / sin_angle
+          const b = Math.sin(f * angle) / sin_angle
+          builder.vertex(a * x1 + b * x2, a * y1 + b * y2, a * z1 + b * z2)
+        }
+      }
+      builder.vertex(x2, y2, z2)
+      builder.knot()
+      x1 = x2
+      y1 = y2
+      z1 = z2
+    }
+    builder.end_item()
+  }
+
+  return builder.build(radius)
+}
+
+/**
+ * Trajectories interpolated linearly in lon, lat and altitude between their
+ * vertices and lifted off the unit sphere by their altitude
+ */
+export function trajectoryArcs(lons: Arrayable<Arrayable<number>>, lats: Arrayable<Arrayable<number>>,
+                               altitudes: Arrayable<Arrayable<number> | null> | null,
+                               radius: number): ArcSet {
+  const builder = new ArcSetBuilder()
+  const lift = (altitude: number) => 1 + altitude * 0.0008
+
+  for (let k = 0; k < lons.length; k++) {
+    const traj_lons = lons[k]
+    const traj_lats = lats[k]
+    const traj_altitudes = altitudes?.[k] ?? null
+    const altitude = (i: number) => traj_altitudes !== null ? traj_altitudes[i] : 0
+
+    for (let i = 0; i < traj_lons.length; i++) {
+      if (i > 0) {
+        const lon0 = traj_lons[i - 1], lat0 = traj_lats[i - 1], alt0 = altitude(i - 1)
+        const d_lon = traj_lons[i] - lon0, d_lat = traj_lats[i] - lat0, d_alt = altitude(i) - alt0
+
+        // The path bends no faster than a great circle spanning its lon/lat extent
+        const angle = Math.hypot(d_lon, d_lat) * Math.PI / 180
+        const segments = arcSegments(angle, radius * Math.max(lift(alt0), lift(alt0 + d_alt)))
+
+        for (let s = 1; s < segments; s++) {
+          const t = s / segments
+          const [x, y, z] = unitVector(lon0 + t * d_lon, lat0 + t * d_lat)
+          const r = lift(alt0 + t * d_alt)
+          builder.vertex(r * x, r * y, r * z)
+        }
+      }
+      const [x, y, z] = unitVector(traj_lons[i], traj_lats[i])
+      const r = lift(altitude(i))
+      builder.vertex(r * x, r * y, r * z)
+      builder.knot()
+    }
+    builder.end_item()
+  }
+
+  return builder.build(radius)
+}
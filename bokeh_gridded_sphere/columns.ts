@@ -0,0 +1,72 @@
+/**
+ * Columnar access to overlay items: scatter points, bars, lines and trajectories
+ */
+
+import type {Arrayable} from "@bokehjs/core/types"
+import type {ColumnarDataSource} from "@bokehjs/models/sources/columnar_data_source"
+
+/**
+ * Overlay items as named columns with one entry per item, read the same way
+ * whether they come from a data source or from a list of per-item objects.
+ * Missing columns read as null, so the per-item defaults apply throughout.
+ */
+export class OverlayColumns {
+  constructor(readonly length: number, private readonly columns: Map<string, Arrayable<any>>) {}
+
+  get(name: string): Arrayable<any> | null {
+    return this.columns.get(name) ?? null
+  }
+}
+
+/**
+ * The columns of a data source, shared rather than copied; numeric columns
+ * sent from NumPy arrive as typed arrays
+ */
+export function sourceColumns(source: ColumnarDataSource): OverlayColumns {
+  const columns = new Map<string, Arrayable<any>>()
+  for (const name of source.columns()) {
+    const column = source.get_column(name)
+    if (column !== null) {
+      columns.set(name, column)
+    }
+  }
+  return new OverlayColumns(source.get_length() ?? 0, columns)
+}
+
+/**
+ * Transpose per-item objects into the named columns. Numeric columns become
+ * Float64Arrays, with NaN where an item leaves the key out.
+ */
+export function recordColumns(records: ArrayLike<{[key: string]: any}>, numeric: string[],
+                              other: string[] = []): OverlayColumns {
+  const n = records.length
+  const columns = new Map<string, Arrayable<any>>()
+
+  for (const name of numeric) {
+    const column = new Float64Array(n)
+    let present = false
+    for (let i = 0; i < n; i++) {
+      const value = records[i][name]
+      column[i] = value ?? NaN
+      present ||= value != null
+    }
+    if (present) {
+      columns.set(name, column)
+    }
+  }
+
+  for (const name of other) {
+    const column = new Array(n)
+    let present = false
+    for (let i = 0; i < n; i++) {
+      const value = records[i][name]
+      column[i] = value
+      present ||= value !== undefined
+    }
+    if (present) {
+      columns.set(name, column)
+    }
+  }
+
+  return new OverlayColumns(n, columns)
+}
@@ -0,0 +1,94 @@
+/*!
+ * BSD 3-Clause License
+ * 
+ * Copyright (c) 2026, Michael Stamatis
+ * 
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ * 
+ * 1. Redistributions of source code must retain the above copyright notice, this
+ *    list of conditions and the following disclaimer.
+ * 
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ * 
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ * 
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+'use strict';
+/*!
+ * Copyright (c) Anaconda, Inc., and Bokeh Contributors
+ * All rights reserved.
+ * 
+ * Redistribution and use in source and binary forms, with or without modification,
+ * are permitted provided that the following conditions are met:
+ * 
+ * Redistributions of source code must retain the above copyright notice,
+ * this list of conditions and the following disclaimer.
+ * 
+ * Redistributions in binary form must reproduce the above copyright notice,
+ * this list of conditions and the following disclaimer in the documentation
+ * and/or other materials provided with the distribution.
+ * 
+ * Neither the name of Anaconda nor the names of any contributors
+ * may be used to endorse or promote products derived from this software
+ * without specific prior written permission.
+ * 
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+ * LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+ * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+ * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+ * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+ * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+ * THE POSSIBILITY OF SUCH DAMAGE.
+ */
+(function(root, factory) {
+  factory(root["Bokeh"], undefined);
+})(this, function(Bokeh, version) {
+  let define;
+  return (function(modules, entry, aliases, externals) {
+    const bokeh = typeof Bokeh !== "undefined" ? (version != null ? Bokeh[version] : Bokeh) : null;
+    if (bokeh != null) {
+      return bokeh.register_plugin(modules, entry, aliases);
+    } else {
+      throw new Error("Cannot find Bokeh" + (version != null ? " " + version : "") + ". You have to load it prior to loading plugins.");
+    }
+  })
+({
+"2e6335d704": function _(e,r,t,o,s){o();const i=e("tslib"),_=i.__importStar(e("63371faa66"));t.GriddedSphere=_;const d=i.__importStar(e("193df65f18"));t.SphereGeometry=d;const a=e("@bokehjs/base");(0,a.register_models)(_),(0,a.register_models)(d)},
+"63371faa66": function _(t,e,s,i,r){var o;i();const l=t("@bokehjs/models/layouts/layout_dom"),a=t("@bokehjs/core/dom"),n=t("@bokehjs/core/logging"),h=t("@bokehjs/models/sources/columnar_data_source"),c=t("688dbd4807"),_=t("b3aec6ae18"),d=t("f96728cb0d"),g=t("a9c5ef6f34"),u=t("c13964bc57"),m=t("9d995a1495"),y=t("dbd06c3611"),v=t("cb223aef8f"),p=t("6425fa0b99"),f=t("09ec4f0ffb"),b=t("ac15b07256"),x=t("99ec8252b1"),w=t("9f21cf95f8"),k=t("193df65f18"),M=t("361c4d1868"),z=["lon","lat","size","border_width"],S=["color","border_color","label"],j=["lon","lat","height","width","border_width"],A=["color","border_color","label"],q=["width"],C=["lons","lats","color","label"],I=["width","point_size"],T=["lons","lats","altitudes","color","show_points","point_color","label"];class N extends l.LayoutDOMView{constructor(){super(...arguments),this.mouse_x=0,this.mouse_y=0,this.is_dragging=!1,this.drag_start_x=0,this.drag_start_y=0,this.drag_start_rotation=0,this.drag_start_tilt=0,this.dirty_layers=new Set,this.interacting=!1,this.lod_frame=!1,this.frame_stats=new Map,this.frame_colors=new u.FrameCache(32),this.cell_rgba_valid=!1,this.cell_rgba_version=0,this.quads=new g.QuadBuffer,this.edge_quads=new g.QuadBuffer,this.worker_rgba_version=-1,this.worker_options_warned=!1,this.trajectory_buckets=new Uint8Array(0),this.scatter_visible=new g.QuadBuffer,this.scatter_index=new m.ScreenIndex,this.bar_index=new m.ScreenIndex,this.scatter_xy=new Float64Array(0),this.bar_xy=new Float64Array(0)}get child_models(){return[]}connect_signals(){super.connect_signals();const{rotation:t,tilt:e,zoom:s}=this.model.properties;this.on_change([t,e,s],(()=>{this.interacting&&(this.lod_frame=!0),this.request_render("grid","overlays")})),this.connect(this.model.properties.palette.change,(()=>{this.color_lut=void 0,this.invalidate_cell_colors(),this.request_render("grid","colorbar")})),this.connect(this.model.properties.nan_color.change,(()=>{this.color_lut=void 0,this.invalidate_cell_rgba(),this.request_render("grid")})),this.on_change([this.model.properties.vmin,this.model.properties.vmax],(()=>{this.invalidate_cell_colors(),this.request_render("grid","colorbar")})),this.on_change([this.model.properties.values,this.model.properties.values_cube],(()=>{this.cube=void 0,this.value_stats=void 0,this.frame_stats.clear(),this.lod_levels=void 0,this.invalidate_cell_colors(),this.request_render("grid","colorbar")})),this.connect(this.model.properties.cube_color_range.change,(()=>{this.value_stats=void 0,this.frame_stats.clear(),this.lod_levels=void 0,this.invalidate_cell_colors(),this.request_render("grid","colorbar")})),this.connect(this.model.properties.values_patch.change,(()=>this.apply_values_patch())),this.connect(this.model.properties.time_index.change,(()=>{this.cell_colors=void 0,this.lod_levels=void 0,this.invalidate_cell_rgba(),this.request_render("grid","colorbar")})),this.connect(this.model.properties.frame_cache_size.change,(()=>{this.frame_colors.capacity=this.model.frame_cache_size})),this.connect(this.model.properties.playing.change,(()=>{this.model.playing?this.start_playback():this.stop_playback()})),this.connect(this.model.properties.background_color.change,(()=>{this.container_el&&(this.container_el.style.background=this.model.background_color),this.request_render("background","colorbar")})),this.connect(this.model.properties.colorbar_text_color.change,(()=>this.request_render("colorbar"))),this.connect(this.model.properties.colorbar_title.change,(()=>this.request_render("colorbar"))),this.connect(this.model.properties.show_colorbar.change,(()=>{this.colorbar_canvas&&(this.colorbar_canvas.style.display=this.model.show_colorbar?"block":"none")})),this.connect(this.model.properties.autorotate.change,(()=>{this.model.autorotate?this.start_autorotation():this.stop_autorotation()}));const{scatter_data:i,scatter_source:r,bar_data:o,bar_source:l}=this.model.properties,{line_data:a,line_source:n,trajectory_data:h,trajectory_source:c}=this.model.properties;this.connect_overlay(i,r,(()=>{this.scatter_columns=void 0,this.scatter_xyz=void 0,this.scatter_cells=void 0})),this.connect_overlay(o,l,(()=>this.bar_columns=void 0)),this.connect_overlay(a,n,(()=>{this.line_columns=void 0,this.line_arcs=void 0})),this.connect_overlay(h,c,(()=>{this.trajectory_columns=void 0,this.trajectory_arcs=void 0})),this.connect(this.model.properties.scatter_color.change,(()=>{this.scatter_cells=void 0,this.request_render("overlays")})),this.connect(this.model.properties.backface_culling.change,(()=>this.request_render("grid"))),this.connect(this.model.properties.grid_renderer.change,(()=>this.request_render("grid"))),this.connect(this.model.properties.lod_factors.change,(()=>{this.lod_levels=void 0}));const{enable_lighting:_,light_azimuth:d,light_elevation:g,light_intensity:u,ambient_light:m}=this.model.properties;this.on_change([d,g,u,m],(()=>{this.cell_shade=void 0})),this.on_change([_,d,g,u,m],(()=>{this.invalidate_cell_rgba(),this.request_render("grid")}));const{lons:y,lats:v,lon_axis:p,lat_axis:f,lon_start:b,lon_step:x,lat_start:w,lat_step:k,n_lat:M,n_lon:z}=this.model.properties;this.on_change([y,v,p,f,b,x,w,k,M,z],(()=>{this.invalidate_grid(),this.request_render("grid","colorbar")})),this.on_change([this.model.properties.coast_lons,this.model.properties.coast_lats],(()=>{this.coast_lines=void 0,this.request_render("overlays")})),this.on_change([this.model.properties.country_lons,this.model.properties.country_lats],(()=>{this.country_lines=void 0,this.request_render("overlays")}));let S=null;const j=()=>this.invalidate_geometry(),A=()=>{null!==S&&this.disconnect(S.change,j),S=this.model.geometry,null!==S&&this.connect(S.change,j)};this.connect(this.model.properties.geometry.change,(()=>{A(),this.invalidate_geometry()})),A()}connect_overlay(t,e,s){const i=()=>{s(),this.request_render("overlays")};let r=null;const o=()=>{null!==r&&(this.disconnect(r.change,i),this.disconnect(r.streaming,i),this.disconnect(r.patching,i)),r=e.get_value(),null!==r&&(this.connect(r.change,i),this.connect(r.streaming,i),this.connect(r.patching,i))};this.connect(t.change,i),this.connect(e.change,(()=>{o(),i()})),o()}invalidate_grid(){this.grid=void 0,this.grid_xyz=void 0,this.cell_shade=void 0,this.value_stats=void 0,this.frame_stats.clear(),this.lod_levels=void 0,this.invalidate_cell_colors(),this.lon_index=void 0,this.lat_index=void 0,this.cell_locator=void 0}invalidate_geometry(){this.invalidate_grid(),this.coast_lines=void 0,this.country_lines=void 0,this.request_render("grid","overlays","colorbar")}request_render(...t){for(const e of t)this.dirty_layers.add(e);void 0===this.render_frame_id&&(this.render_frame_id=requestAnimationFrame((()=>this.flush_render())))}flush_render(){this.render_frame_id=void 0;const t=this.dirty_layers;(t.has("background")||t.has("grid")||t.has("overlays"))&&this.render_sphere(t.has("grid"),t.has("overlays")),t.has("colorbar")&&this.render_colorbar(),t.clear()}get_grid(){if(void 0===this.grid){const t=null!==this.model.geometry?this.model.geometry.grid:null;this.grid=null!==t?t:(0,_.resolveGrid)(this.model)}return this.grid}get_color_lut(){return void 0===this.color_lut&&(this.color_lut=(0,d.getColorLUT)(this.model.palette,this.model.nan_color)),this.color_lut}n_frames(){const{n_lat:t,n_lon:e}=this.get_grid(),s=t*e;return s>0?Math.floor(this.model.values_cube.length/s):0}frame_index(){return Math.max(0,Math.min(this.n_frames()-1,this.model.time_index))}get_cube(){if(void 0===this.cube){const t=this.model.values_cube;this.cube=t instanceof Float32Array||t instanceof Float64Array?t:Float64Array.from(t)}return this.cube}get_values(){if(0==this.n_frames())return this.model.values;const{n_lat:t,n_lon:e}=this.get_grid(),s=t*e,i=this.frame_index();return this.get_cube().subarray(i*s,(i+1)*s)}get_value_stats(){if(this.n_frames()>0&&"frame"==this.model.cube_color_range){const t=this.frame_index();let e=this.frame_stats.get(t);return void 0===e&&(e=(0,d.computeValueStats)(this.get_values()),this.frame_stats.set(t,e)),e}if(void 0===this.value_stats){const t=this.n_frames()>0?this.get_cube():this.model.values;this.value_stats=(0,d.computeValueStats)(t)}return this.value_stats}get_value_range(){return(0,d.rangeFromStats)(this.get_value_stats(),this.model.vmin,this.model.vmax)}invalidate_cell_colors(){this.cell_colors=void 0,this.frame_colors.clear(),this.invalidate_cell_rgba()}invalidate_cell_rgba(){if(this.cell_rgba_valid=!1,void 0!==this.lod_levels)for(const t of this.lod_levels)t.cell_rgba=void 0}get_cell_colors(t){if(void 0===this.cell_colors){const{vmin:e,vmax:s}=this.get_value_range(),i=this.get_color_lut().length-1;let r;if(this.n_frames()>0){const e=this.frame_index(),s=this.frame_colors.get(e);if(void 0!==s)return this.cell_colors=s,s;r=this.frame_colors.allocate(e,Math.max(0,(t.n_lat-1)*(t.n_lon-1)))}this.cell_colors=(0,d.cellColorIndices)(this.get_values(),t.n_lat,t.n_lon,i,e,s,r)}return this.cell_colors}get_cell_rgba(t){if(!this.cell_rgba_valid||void 0===this.cell_rgba){const e=this.get_cell_colors(t),s=e.length,i=void 0!==this.cell_rgba&&this.cell_rgba.length==s?this.cell_rgba:new Uint32Array(s);this.cell_rgba=this.fill_cell_rgba(e,this.get_cell_shade(t),i),this.cell_rgba_valid=!0,this.cell_rgba_version++}return this.cell_rgba}fill_cell_rgba(t,e,s){const i=this.get_color_lut(),r=t.length;if(null===e)for(let e=0;e<r;e++)s[e]=i[t[e]];else for(let o=0;o<r;o++)s[o]=(0,d.shadeRGBA)(i[t[o]],e[o]);return s}get_cell_shade(t){return this.model.enable_lighting?(void 0===this.cell_shade&&(this.cell_shade=this.compute_cell_shade(t)),this.cell_shade):null}compute_cell_shade(t){const{n_lat:e,n_lon:s,lons:i,lats:r}=t,o=this.model.light_azimuth*Math.PI/180,l=this.model.light_elevation*Math.PI/180,a=Math.cos(l)*Math.sin(o),n=Math.cos(l)*Math.cos(o),h=Math.sin(l),c=new Float64Array(Math.max(0,(e-1)*(s-1)));for(let t=0;t<e-1;t++)for(let e=0;e<s-1;e++){const o=t*s+e,l=o+s,_=(i[o]+i[o+1]+i[l+1]+i[l])/4,d=(r[o]+r[o+1]+r[l+1]+r[l])/4;c[t*(s-1)+e]=this.calculate_lighting(_,d,a,n,h)}return c}get_lod_levels(t){if(void 0===this.lod_levels){const e=(0,M.buildLodPyramid)(t,this.get_values(),this.model.lod_factors);this.lod_levels=e.map((t=>({level:t})))}return this.lod_levels}get_lod_xyz(t){return void 0===t.xyz&&(t.xyz=(0,_.gridUnitVectors)(t.level.grid)),t.xyz}get_lod_rgba(t){if(void 0===t.cell_rgba){const{grid:e,values:s}=t.level,{vmin:i,vmax:r}=this.get_value_range(),o=this.get_color_lut().length-1,l=(0,d.cellColorIndices)(s,e.n_lat,e.n_lon,o,i,r),a=this.model.enable_lighting?this.compute_cell_shade(e):null;t.cell_rgba=this.fill_cell_rgba(l,a,new Uint32Array(l.length))}return t.cell_rgba}select_lod(t){const e=this.model.lod_frame_budget,s=this.cell_cost;if(!(e>0)||void 0===s||(t.n_lat-1)*(t.n_lon-1)*s<=e)return null;const i=this.get_lod_levels(t);for(const t of i){const{n_lat:i,n_lon:r}=t.level.grid;if((i-1)*(r-1)*s<=e)return t}return i.length>0?i[i.length-1]:null}schedule_refine(){void 0!==this.refine_timeout&&clearTimeout(this.refine_timeout),this.refine_timeout=window.setTimeout((()=>{this.refine_timeout=void 0,this.request_render("grid")}),150)}apply_values_patch(){const t=this.model.values_patch;if(null===t)return;const e=this.model.values,s=t.indices;if(this.n_frames()>0){for(let i=0;i<s.length;i++)s[i]>=0&&s[i]<e.length&&(e[s[i]]=t.values[i]);return}const{vmin:i,vmax:r}=this.get_value_range(),o=this.value_stats;let l=!1;for(let i=0;i<s.length;i++){const r=s[i];if(r<0||r>=e.length)continue;const a=e[r],n=t.values[i];e[r]=n,isNaN(a)?o.nan_count--:(a!=o.min||n<=a)&&(a!=o.max||n>=a)||(l=!0),isNaN(n)?o.nan_count++:(n<o.min&&(o.min=n),n>o.max&&(o.max=n))}l&&(this.value_stats=void 0),this.lod_levels=void 0;const a=this.get_value_range();a.vmin!=i||a.vmax!=r?(this.invalidate_cell_colors(),this.request_render("colorbar")):void 0!==this.cell_colors&&this.recolor_cells(s),this.request_render("grid")}recolor_cells(t){const e=this.get_grid(),{n_lat:s,n_lon:i}=e,r=this.cell_colors,o=this.cell_rgba_valid?this.cell_rgba:void 0,l=this.get_cell_shade(e),a=this.get_color_lut(),{vmin:n,vmax:h}=this.get_value_range(),c=a.length-1;for(let e=0;e<t.length;e++){const _=t[e],g=Math.floor(_/i),u=_%i;for(let t=Math.max(0,g-1);t<=Math.min(s-2,g);t++)for(let e=Math.max(0,u-1);e<=Math.min(i-2,u);e++){const s=t*(i-1)+e;if(r[s]=(0,d.cellColorIndex)(this.model.values,i,t,e,c,n,h),void 0!==o){const t=a[r[s]];o[s]=null!==l?(0,d.shadeRGBA)(t,l[s]):t}}}this.cell_rgba_version++}get_axis_indices(t,e){return void 0!==this.lon_index&&void 0!==this.lat_index||(this.lon_index=new y.AxisIndex(t),this.lat_index=new y.AxisIndex(e)),[this.lon_index,this.lat_index]}locate_grid_cell(t,e){const s=this.get_grid();if(null!==s.lon_axis&&null!==s.lat_axis){const[i,r]=this.get_axis_indices(s.lon_axis,s.lat_axis);t<i.min?t+=360:t>=i.min+360&&(t-=360);const o=r.cell(e),l=i.cell(t);return o<0||l<0?-1:o*(s.n_lon-1)+l}return void 0===this.cell_locator&&(this.cell_locator=new _.CellLocator(s)),this.cell_locator.locate(t,e)}get_grid_xyz(){if(void 0===this.grid_xyz){const t=this.get_grid(),e=this.model.geometry;this.grid_xyz=null!==e&&e.grid===t?e.grid_xyz:(0,_.gridUnitVectors)(t)}return this.grid_xyz}get_coast_lines(){if(void 0===this.coast_lines){const t=this.model.geometry;this.coast_lines=null!==t&&t.coast_lons.length>0?t.coast_lines:new f.PolylineSet((0,c.unitVectors)(this.model.coast_lons,this.model.coast_lats))}return this.coast_lines}get_country_lines(){if(void 0===this.country_lines){const t=this.model.geometry;this.country_lines=null!==t&&t.country_lons.length>0?t.country_lines:new f.PolylineSet((0,c.unitVectors)(this.model.country_lons,this.model.country_lats))}return this.country_lines}get_scatter_columns(){if(void 0===this.scatter_columns){const t=this.model.scatter_source;this.scatter_columns=null!==t?(0,b.sourceColumns)(t):(0,b.recordColumns)(this.model.scatter_data,z,S)}return this.scatter_columns}get_scatter_xyz(){if(void 0===this.scatter_xyz){const t=this.get_scatter_columns(),e=t.get("lon"),s=t.get("lat");this.scatter_xyz=null!==e&&null!==s?(0,c.unitVectors)(e,s):new Float32Array(0)}return this.scatter_xyz}get_scatter_cells(){if(void 0===this.scatter_cells){const t=this.get_scatter_columns(),e=t.get("size"),s=t.get("color"),i=t.get("border_color"),r=t.get("border_width"),o=this.marker_atlas??(this.marker_atlas=new p.MarkerAtlas);o.clear();const l=t.length,a=new Int32Array(l);let n="",h=NaN,c="",_=NaN,d=-1;for(let t=0;t<l;t++){const l=s?.[t]||this.model.scatter_color,g=e?.[t]||5,u=i?.[t]||"#000000",m=r?.[t]||1;l===n&&g===h&&u===c&&m===_||(n=l,h=g,c=u,_=m,d=o.get(n,h,c,_)),a[t]=d}this.scatter_cells=a}return this.scatter_cells}get_bar_columns(){if(void 0===this.bar_columns){const t=this.model.bar_source;this.bar_columns=null!==t?(0,b.sourceColumns)(t):(0,b.recordColumns)(this.model.bar_data,j,A)}return this.bar_columns}get_line_columns(){if(void 0===this.line_columns){const t=this.model.line_source;if(null!==t)this.line_columns=(0,b.sourceColumns)(t);else{const t=this.model.line_data.map((t=>({...t,lons:t.coords.map((t=>t[0])),lats:t.coords.map((t=>t[1]))})));this.line_columns=(0,b.recordColumns)(t,q,C)}}return this.line_columns}get_trajectory_columns(){if(void 0===this.trajectory_columns){const t=this.model.trajectory_source;if(null!==t)this.trajectory_columns=(0,b.sourceColumns)(t);else{const t=this.model.trajectory_data.map((t=>({...t,lons:t.coords.map((t=>t.lon)),lats:t.coords.map((t=>t.lat)),altitudes:t.coords.map((t=>t.altitude))})));this.trajectory_columns=(0,b.recordColumns)(t,I,T)}}return this.trajectory_columns}get_line_arcs(t){const e=(0,x.arcRadius)(t);if(void 0===this.line_arcs||this.line_arcs.radius!=e){const t=this.get_line_columns();this.line_arcs=(0,x.greatCircleArcs)(t.get("lons")??[],t.get("lats")??[],e)}return this.line_arcs}get_trajectory_arcs(t){const e=(0,x.arcRadius)(t);if(void 0===this.trajectory_arcs||this.trajectory_arcs.radius!=e){const t=this.get_trajectory_columns();this.trajectory_arcs=(0,x.trajectoryArcs)(t.get("lons")??[],t.get("lats")??[],t.get("altitudes"),e)}return this.trajectory_arcs}render(){super.render(),this.frame_colors.capacity=this.model.frame_cache_size;const t=this.model.width??800,e=this.model.height??800;this.container_el=(0,a.div)({style:{width:`${t+140}px`,height:`${e}px`,background:this.model.background_color,position:"relative",display:"flex",cursor:"grab"}}),this.stop_render_worker(),this.model.render_in_worker&&(0,w.workerRenderingSupported)()&&this.start_render_worker(this.container_el,t,e),this.canvas=document.createElement("canvas"),this.canvas.width=t,this.canvas.height=e,this.canvas.style.position="relative",this.container_el.appendChild(this.canvas),this.model.show_colorbar&&(this.colorbar_canvas=document.createElement("canvas"),this.colorbar_canvas.width=150,this.colorbar_canvas.height=e,this.colorbar_canvas.style.marginLeft="10px",this.container_el.appendChild(this.colorbar_canvas),this.colorbar_ctx=this.colorbar_canvas.getContext("2d")),this.tooltip_el=(0,a.div)({style:{position:"absolute",background:"rgba(0, 0, 0, 0.85)",color:"white",padding:"8px 12px",borderRadius:"6px",fontSize:"13px",fontFamily:"monospace",pointerEvents:"none",display:"none",zIndex:"1000",border:"1px solid rgba(255, 255, 255, 0.3)",whiteSpace:"nowrap"}}),this.container_el.appendChild(this.tooltip_el),this.setup_interactions(),this.shadow_el.appendChild(this.container_el),this.ctx=this.canvas.getContext("2d"),this.render_sphere(),this.render_colorbar(),this.model.autorotate&&this.start_autorotation(),this.model.playing&&this.start_playback()}render_colorbar(){if(!this.colorbar_ctx||!this.colorbar_canvas||!this.model.show_colorbar)return;const t=this.colorbar_ctx,e=this.colorbar_canvas,s=e.width,i=e.height;t.fillStyle=this.model.background_color,t.fillRect(0,0,s,i);const r=(0,d.getPalette)(this.model.palette),{vmin:o,vmax:l}=this.get_value_range(),a=.7*i,n=(i-a)/2,h=a/r.length;for(let e=0;e<r.length;e++)t.fillStyle=r[r.length-1-e],t.fillRect(35,n+e*h,30,h+1);t.strokeStyle=this.model.colorbar_text_color,t.lineWidth=1,t.strokeRect(35,n,30,a),t.fillStyle=this.model.colorbar_text_color,t.font="12px monospace",t.textAlign="left";for(let e=0;e<5;e++){const s=e/4,i=o+(l-o)*(1-s),r=n+s*a;t.beginPath(),t.moveTo(65,r),t.lineTo(70,r),t.stroke();const h=i.toFixed(1);t.fillText(h,75,r+4)}this.model.colorbar_title&&(t.save(),t.translate(12,i/2),t.rotate(-Math.PI/2),t.textAlign="center",t.font="bold 13px monospace",t.fillStyle=this.model.colorbar_text_color,t.fillText(this.model.colorbar_title,0,0),t.restore())}setup_interactions(){this.canvas&&(this.canvas.onmousedown=t=>{this.is_dragging=!0,this.drag_start_x=t.clientX,this.drag_start_y=t.clientY,this.drag_start_rotation=this.model.rotation,this.drag_start_tilt=this.model.tilt,this.container_el.style.cursor="grabbing",this.stop_autorotation(),this.rotation_resume_timeout&&clearTimeout(this.rotation_resume_timeout)},this.canvas.onmousemove=t=>{const e=this.canvas.getBoundingClientRect();if(this.mouse_x=t.clientX-e.left,this.mouse_y=t.clientY-e.top,this.is_dragging){const e=t.clientX-this.drag_start_x,s=t.clientY-this.drag_start_y;this.interacting=!0;const i=this.drag_start_rotation+.5*e;this.model.rotation=(i%360+360)%360;const r=this.drag_start_tilt-.5*s;this.model.tilt=Math.max(-90,Math.min(90,r)),this.interacting=!1}else this.model.enable_hover&&this.update_tooltip()},this.canvas.onmouseup=()=>{this.is_dragging=!1,this.container_el.style.cursor="grab",this.model.autorotate&&(this.rotation_resume_timeout&&clearTimeout(this.rotation_resume_timeout),this.rotation_resume_timeout=window.setTimeout((()=>{this.start_autorotation()}),1e3))},this.canvas.onmouseleave=()=>{this.is_dragging=!1,this.container_el.style.cursor="grab",this.tooltip_el&&(this.tooltip_el.style.display="none")},this.canvas.onwheel=t=>{t.preventDefault();const e=.1*-Math.sign(t.deltaY),s=this.model.zoom+e;this.interacting=!0,this.model.zoom=Math.max(.5,Math.min(8,s)),this.interacting=!1})}get_camera(){const t=this.model.width??800,e=this.model.height??800,s=-this.model.rotation*Math.PI/180,i=this.model.tilt*Math.PI/180;return{cos_angle:Math.cos(s),sin_angle:Math.sin(s),cos_tilt:Math.cos(i),sin_tilt:Math.sin(i),scale:Math.min(t,e)/2*.85*this.model.zoom,cx:t/2,cy:e/2}}render_sphere(t=!0,e=!0){if(!this.ctx)return;const s=this.ctx,i=this.model.width??800,r=this.model.height??800,o=this.get_camera(),{cos_angle:l,sin_angle:a,cos_tilt:n,sin_tilt:h,scale:c,cx:_,cy:d}=o;if(void 0!==this.render_worker)return this.lod_frame=!1,t&&this.post_worker_frame(o),(e||void 0===this.overlay_layer)&&(void 0===this.overlay_layer&&(this.overlay_layer=new v.CanvasLayer),this.overlay_layer.reset(i,r),this.draw_overlays(l,a,n,h,c,_,d)),s.clearRect(0,0,i,r),void s.drawImage(this.overlay_layer.canvas,0,0);(t||void 0===this.grid_layer)&&(void 0===this.grid_layer&&(this.grid_layer=new v.CanvasLayer),this.grid_layer.reset(i,r),this.draw_grid(l,a,n,h,c,_,d)),(e||void 0===this.overlay_layer)&&(void 0===this.overlay_layer&&(this.overlay_layer=new v.CanvasLayer),this.overlay_layer.reset(i,r),this.draw_overlays(l,a,n,h,c,_,d)),s.fillStyle=this.model.background_color,s.fillRect(0,0,i,r),s.drawImage(this.grid_layer.canvas,0,0),s.drawImage(this.overlay_layer.canvas,0,0)}start_render_worker(t,e,s){const i=document.createElement("canvas");let r;i.width=e,i.height=s,i.style.position="absolute",i.style.left="0",i.style.top="0",t.appendChild(i);try{r=(0,w.createRenderWorker)(i)}catch(t){return i.remove(),void n.logger.warn(`GriddedSphere: render worker unavailable, drawing on the main thread (${t})`)}r.addEventListener("error",(t=>{this.render_worker===r&&(n.logger.warn(`GriddedSphere: render worker failed, drawing on the main thread (${t.message})`),this.stop_render_worker(),this.request_render("grid"))})),this.render_worker=r,this.field_canvas=i}warn_worker_ignored_options(){if(this.worker_options_warned)return;const{lod_factors:t,lod_frame_budget:e}=this.model.properties,s=[];"raster"==this.model.grid_renderer&&s.push('grid_renderer="raster"');for(const i of[t,e])i.dirty&&s.push(i.attr);s.length>0&&(n.logger.warn(`GriddedSphere: ${s.join(", ")} ignored while render_in_worker is on`),this.worker_options_warned=!0)}post_worker_frame(t){this.warn_worker_ignored_options();const e=this.render_worker,s=(t,s=[])=>e.postMessage(t,s),i=this.get_grid(),r=this.get_grid_xyz();if(this.worker_xyz!==r){const t=r.slice();s({type:"grid",n_lat:i.n_lat,n_lon:i.n_lon,xyz:t},[t.buffer]),this.worker_xyz=r}const o=this.get_cell_rgba(i);if(this.worker_rgba_version!=this.cell_rgba_version){const t=o.slice();s({type:"colors",cell_rgba:t},[t.buffer]),this.worker_rgba_version=this.cell_rgba_version}s({type:"frame",width:this.model.width??800,height:this.model.height??800,camera:t,backface_culling:this.model.backface_culling})}stop_render_worker(){void 0!==this.render_worker&&(this.render_worker.terminate(),this.render_worker=void 0),this.field_canvas?.remove(),this.field_canvas=void 0,this.worker_xyz=void 0,this.worker_rgba_version=-1}draw_grid(t,e,s,i,r,o,l){const a=this.lod_frame;this.lod_frame=!1;const n=this.get_grid();if("raster"==this.model.grid_renderer&&null!==n.lon_axis&&null!==n.lat_axis)this.draw_grid_raster(n,t,e,s,i,r,o,l);else{const h=a?this.select_lod(n):null;null!==h?this.schedule_refine():void 0!==this.refine_timeout&&(clearTimeout(this.refine_timeout),this.refine_timeout=void 0);const c=null!==h?h.level.grid:n,_=null!==h?this.get_lod_xyz(h):this.get_grid_xyz(),d=null!==h?this.get_lod_rgba(h):this.get_cell_rgba(n),g=null!==h?h.screen:this.grid_screen,u=performance.now(),m=this.draw_grid_quads(c,_,d,g,t,e,s,i,r,o,l),y=performance.now()-u;null!==h?h.screen=m:this.grid_screen=m;const v=(c.n_lat-1)*(c.n_lon-1);if(v>0){const t=y/v;this.cell_cost=void 0===this.cell_cost?t:(this.cell_cost+t)/2}}}draw_overlays(t,e,s,i,r,o,l){const a=this.model.width??800,n=this.model.height??800;this.model.show_coastlines&&this.get_coast_lines().count>0&&this.draw_coastlines(t,e,s,i,r,o,l),this.model.show_countries&&this.get_country_lines().count>0&&this.draw_countries(t,e,s,i,r,o,l),this.scatter_index.reset(a,n),this.bar_index.reset(a,n),this.draw_lines(t,e,s,i,r,o,l),this.draw_trajectories(t,e,s,i,r,o,l),this.draw_bars(t,e,s,i,r,o,l),this.draw_scatter(t,e,s,i,r,o,l)}draw_grid_quads(t,e,s,i,r,o,l,a,n,h,_){return i=(0,c.projectUnitVectors)(e,r,o,l,a,n,h,_,i),this.grid_layer&&(0,g.drawGridQuads)(this.grid_layer.ctx,i,t.n_lat,t.n_lon,s,this.model.backface_culling,this.quads,this.edge_quads),i}draw_grid_raster(t,e,s,i,r,o,l,a){if(!this.grid_layer||null===t.lon_axis||null===t.lat_axis)return;const n=this.model.width??800,h=this.model.height??800;void 0!==this.raster_image&&this.raster_image.width==n&&this.raster_image.height==h||(this.raster_image=this.grid_layer.ctx.createImageData(n,h),this.raster_pixels=new Uint32Array(this.raster_image.data.buffer));const[c,_]=this.get_axis_indices(t.lon_axis,t.lat_axis);(0,y.rasterizeSphere)(this.raster_pixels,n,h,c,_,t.n_lon,this.get_cell_rgba(t),e,s,i,r,o,l,a),this.grid_layer.ctx.putImageData(this.raster_image,0,0)}draw_coastlines(t,e,s,i,r,o,l){this.overlay_layer&&(this.overlay_layer.ctx.strokeStyle=this.model.coastline_color,this.overlay_layer.ctx.lineWidth=this.model.coastline_width,this.stroke_polylines(this.get_coast_lines(),t,e,s,i,r,o,l))}draw_countries(t,e,s,i,r,o,l){this.overlay_layer&&(this.overlay_layer.ctx.strokeStyle=this.model.country_color,this.overlay_layer.ctx.lineWidth=this.model.country_width,this.stroke_polylines(this.get_country_lines(),t,e,s,i,r,o,l))}stroke_polylines(t,e,s,i,r,o,l,a){if(!this.overlay_layer)return;const n=s*i,h=e*i,_=-r,d=.5/o,{xyz:g,detail:u}=t,m=this.overlay_layer.ctx;m.beginPath();for(let y=0;y<t.count;y++){if(!t.cap_visible(y,n,h,_))continue;let v=!1;for(let n=t.start[y];n<t.end[y];n++){if(u[n]<d)continue;const t=g[3*n],h=g[3*n+1],_=g[3*n+2],y=t*e-h*s,p=t*s+h*e;if(p*i-_*r>c.HORIZON_DEPTH){const t=l+y*o,e=a-(p*r+_*i)*o;v?m.lineTo(t,e):(m.moveTo(t,e),v=!0)}else v=!1}}m.stroke()}draw_scatter(t,e,s,i,r,o,l){const a=this.get_scatter_columns();if(!this.overlay_layer||0==a.length)return;const n=this.overlay_layer.ctx,h=a.get("size"),_=a.get("color"),d=a.get("border_color"),g=a.get("border_width"),u=this.get_scatter_xyz(),m=this.get_scatter_cells(),y=this.marker_atlas,v=u.length/3,p=this.scatter_screen=(0,c.projectUnitVectors)(u,t,e,s,i,r,o,l,this.scatter_screen);this.scatter_xy.length<2*v&&(this.scatter_xy=new Float64Array(2*v));const f=this.scatter_visible;f.reset(v);for(let t=0;t<v;t++)if(p[3*t+2]>c.HORIZON_DEPTH){const e=p[3*t],s=p[3*t+1],i=(h?.[t]||5)+3;this.scatter_xy[2*t]=e,this.scatter_xy[2*t+1]=s,this.scatter_index.insert(t,e-i,s-i,e+i,s+i),f.push(t,p[3*t+2],0)}const b=f.sort_by_depth();for(let t=0;t<f.count;t++){const e=f.vertex[b[t]],s=m[e];s>=0?y.draw(n,s,p[3*e],p[3*e+1]):(n.beginPath(),n.arc(p[3*e],p[3*e+1],h?.[e]||5,0,2*Math.PI),n.fillStyle=_?.[e]||this.model.scatter_color,n.fill(),n.strokeStyle=d?.[e]||"#000000",n.lineWidth=g?.[e]||1,n.stroke())}}draw_trajectories(t,e,s,i,r,o,l){const a=this.get_trajectory_columns();if(!this.overlay_layer||0==a.length)return;const n=this.overlay_layer.ctx,h=a.get("color"),_=a.get("width"),d=a.get("show_points"),g=a.get("point_size"),u=a.get("point_color"),m=this.get_trajectory_arcs(r),y=this.trajectory_screen=(0,c.projectUnitVectors)(m.xyz,t,e,s,i,r,o,l,this.trajectory_screen),v=t=>{if(t>.1)return 1;if(t<-.3)return.08;{const e=(t- -.3)/.4;return.08+e*e*.92}};this.trajectory_buckets.length<y.length/3&&(this.trajectory_buckets=new Uint8Array(y.length/3));const p=this.trajectory_buckets,f=new Uint8Array(16);for(let t=0;t<m.count;t++){const e=h?.[t]||this.model.trajectory_color,s=_?.[t]||2.5,i=d?.[t]??!1,r=g?.[t]||4,o=u?.[t]||e;n.lineCap="round",n.lineJoin="round",n.strokeStyle=e,n.lineWidth=s;const l=m.offsets[t],a=m.offsets[t+1]-1;f.fill(0);for(let t=l;t<a;t++){const e=v((y[3*t+2]+y[3*t+5])/2),s=Math.round((e-.08)/.92*15);p[t]=s,f[s]=1}for(let t=0;t<16;t++)if(f[t]){n.globalAlpha=.08+.92*t/15,n.beginPath();for(let e=l;e<a;e++)p[e]==t&&(e!=l&&p[e-1]==t||n.moveTo(y[3*e],y[3*e+1]),n.lineTo(y[3*e+3],y[3*e+4]));n.stroke()}if(i)for(let e=m.knot_offsets[t];e<m.knot_offsets[t+1];e++){const t=m.knots[e];n.globalAlpha=v(y[3*t+2]),n.beginPath(),n.arc(y[3*t],y[3*t+1],r,0,2*Math.PI),n.fillStyle=o,n.fill(),n.strokeStyle="#000000",n.lineWidth=1,n.stroke()}n.globalAlpha=1}}draw_lines(t,e,s,i,r,o,l){const a=this.get_line_columns();if(!this.overlay_layer||0==a.length)return;const n=this.overlay_layer.ctx,h=a.get("color"),_=a.get("width"),d=this.get_line_arcs(r),g=this.line_screen=(0,c.projectUnitVectors)(d.xyz,t,e,s,i,r,o,l,this.line_screen);for(let t=0;t<d.count;t++){n.strokeStyle=h?.[t]||this.model.line_color,n.lineWidth=_?.[t]||2,n.beginPath();let e=!1;for(let s=d.offsets[t];s<d.offsets[t+1];s++)g[3*s+2]>c.HORIZON_DEPTH?e?n.lineTo(g[3*s],g[3*s+1]):(n.moveTo(g[3*s],g[3*s+1]),e=!0):e=!1;n.stroke()}}calculate_lighting(t,e,s,i,r){const o=t*Math.PI/180,l=e*Math.PI/180,a=Math.cos(l)*Math.cos(o)*s+Math.cos(l)*Math.sin(o)*i+Math.sin(l)*r,n=Math.max(0,a)*this.model.light_intensity,h=this.model.ambient_light+n;return Math.min(1,h)}draw_bars(t,e,s,i,r,o,l){const a=this.get_bar_columns(),n=a.get("lon"),h=a.get("lat");if(!this.overlay_layer||0==a.length||null===n||null===h)return;const _=this.overlay_layer.ctx,d=a.get("height"),g=a.get("width"),u=a.get("color"),m=a.get("border_color"),y=a.get("border_width"),v=a.get("label"),p=[];this.bar_xy.length<2*a.length&&(this.bar_xy=new Float64Array(2*a.length));for(let _=0;_<a.length;_++){const a=h[_]*Math.PI/180,f=-n[_]*Math.PI/180,b=Math.cos(a)*Math.cos(f),x=Math.cos(a)*Math.sin(f),w=Math.sin(a),k=1+8e-4*(d?.[_]||100),M=k*Math.cos(a)*Math.cos(f),z=k*Math.cos(a)*Math.sin(f),S=k*Math.sin(a),j=.025*(g?.[_]||2),A=.6*j,q=-Math.sin(f)*j/2,C=Math.cos(f)*j/2,I=-Math.cos(a)*Math.cos(f)*A/2,T=-Math.cos(a)*Math.sin(f)*A/2,N=Math.cos(a)*A/2,P=[{x:b-q-I,y:x-C-T,z:w-N},{x:b+q-I,y:x+C-T,z:w-N},{x:b+q+I,y:x+C+T,z:w+N},{x:b-q+I,y:x-C+T,z:w+N},{x:M-q-I,y:z-C-T,z:S-N},{x:M+q-I,y:z+C-T,z:S-N},{x:M+q+I,y:z+C+T,z:S+N},{x:M-q+I,y:z-C+T,z:S+N}].map((a=>{let n=a.x*t-a.y*e,h=a.x*e+a.y*t,c=a.z;const _=h*i+c*s;return{x:n,y:h*s-c*i,z:_,screen_x:o+n*r,screen_y:l-_*r}})),F=P.slice(0,4);if(F.reduce(((t,e)=>t+e.y),0)/4>c.HORIZON_DEPTH){const t=F.reduce(((t,e)=>t+e.screen_x),0)/4,e=F.reduce(((t,e)=>t+e.screen_y),0)/4,s=g?.[_]||2;this.bar_xy[2*_]=t,this.bar_xy[2*_+1]=e,this.bar_index.insert(_,t-s,e+Math.min(.2*-d?.[_],5),t+s,e+5)}if(P.some((t=>t.y>-.1))){const t=P.reduce(((t,e)=>t+e.y),0)/P.length;p.push({corners:P,color:u?.[_]||this.model.bar_color,border_color:m?.[_]||"#000000",border_width:y?.[_]||1,depth:t,label:v?.[_]})}}p.sort(((t,e)=>t.depth-e.depth));for(const t of p){const e=t.corners,s=t.color,i=[{indices:[0,1,5,4],shade:.5},{indices:[0,4,7,3],shade:.65},{indices:[1,2,6,5],shade:.75},{indices:[3,7,6,2],shade:.9},{indices:[4,5,6,7],shade:1}];for(const r of i){const i=r.indices.map((t=>e[t]));if(i.reduce(((t,e)=>t+e.y),0)/i.length<-.15)continue;const o=this.darkenColor(s,r.shade);_.fillStyle=o,_.strokeStyle=t.border_color,_.lineWidth=t.border_width,_.beginPath(),_.moveTo(i[0].screen_x,i[0].screen_y);for(let t=1;t<i.length;t++)_.lineTo(i[t].screen_x,i[t].screen_y);_.closePath(),_.fill(),_.stroke()}}}darkenColor(t,e){const s=parseInt(t.slice(1,3),16),i=parseInt(t.slice(3,5),16),r=parseInt(t.slice(5,7),16);return`#${Math.floor(s*e).toString(16).padStart(2,"0")}${Math.floor(i*e).toString(16).padStart(2,"0")}${Math.floor(r*e).toString(16).padStart(2,"0")}`}update_tooltip(){if(!this.tooltip_el||!this.canvas||!this.ctx)return;const t=this.mouse_x,e=this.mouse_y,s=this.get_bar_columns(),i=s.get("width"),r=s.get("height"),o=this.bar_xy,l=this.bar_index.find(t,e,(l=>{if(l>=s.length)return!1;const a=Math.abs(t-o[2*l]),n=e-o[2*l+1];return a<(i?.[l]||2)&&n>.2*-r?.[l]&&n<5}));if(l>=0){const i=s.get("label")?.[l];return this.tooltip_el.innerHTML=i||`Bar: ${Number(r?.[l]).toFixed(2)}`,this.tooltip_el.style.display="block",this.tooltip_el.style.left=`${t+15}px`,void(this.tooltip_el.style.top=e-30+"px")}const a=this.get_scatter_columns(),n=a.get("size"),h=this.scatter_xy,_=this.scatter_index.find(t,e,(s=>{if(s>=a.length)return!1;return Math.sqrt((t-h[2*s])**2+(e-h[2*s+1])**2)<(n?.[s]||5)+3}));if(_>=0){const s=a.get("label")?.[_],i=Number(a.get("lon")[_]),r=Number(a.get("lat")[_]);return this.tooltip_el.innerHTML=s||`(${i.toFixed(2)}, ${r.toFixed(2)})`,this.tooltip_el.style.display="block",this.tooltip_el.style.left=`${t+15}px`,void(this.tooltip_el.style.top=e-30+"px")}const{cos_angle:g,sin_angle:u,cos_tilt:m,sin_tilt:y,scale:v,cx:p,cy:f}=this.get_camera(),b=(0,c.unprojectSphere)((this.mouse_x-p)/v,(f-this.mouse_y)/v,g,u,m,y),x=null!==b?this.locate_grid_cell(b.lon,b.lat):-1,{n_lat:w,n_lon:k}=this.get_grid(),M=this.get_values();if(x>=0&&M.length>=w*k){const t=(0,d.cellValue)(M,k,Math.floor(x/(k-1)),x%(k-1));this.tooltip_el.innerHTML=`Value: ${t.toFixed(2)}`,this.tooltip_el.style.display="block",this.tooltip_el.style.left=`${this.mouse_x+15}px`,this.tooltip_el.style.top=this.mouse_y-30+"px"}else this.tooltip_el.style.display="none"}start_autorotation(){if(void 0!==this.animation_id)return;const t=()=>{this.model.autorotate&&!this.is_dragging&&(this.interacting=!0,this.model.rotation=(this.model.rotation+.5*this.model.rotation_speed)%360,this.interacting=!1,this.animation_id=requestAnimationFrame(t))};t()}stop_autorotation(){void 0!==this.animation_id&&(cancelAnimationFrame(this.animation_id),this.animation_id=void 0)}start_playback(){if(void 0!==this.playback_id)return;const t=e=>{if(this.playback_id=void 0,!this.model.playing)return;const s=this.n_frames(),i=1e3/Math.max(this.model.playback_fps,.001);if(void 0===this.playback_last)this.playback_last=e;else if(s>0&&e-this.playback_last>=i){this.playback_last=e;const t=this.frame_index()+1;if(t<s)this.model.time_index=t;else{if(!this.model.playback_loop)return void(this.model.playing=!1);this.model.time_index=0}}this.playback_id=requestAnimationFrame(t)};this.playback_id=requestAnimationFrame(t)}stop_playback(){void 0!==this.playback_id&&(cancelAnimationFrame(this.playback_id),this.playback_id=void 0),this.playback_last=void 0}remove(){this.stop_autorotation(),this.stop_playback(),this.stop_render_worker(),void 0!==this.render_frame_id&&(cancelAnimationFrame(this.render_frame_id),this.render_frame_id=void 0),this.rotation_resume_timeout&&clearTimeout(this.rotation_resume_timeout),void 0!==this.refine_timeout&&clearTimeout(this.refine_timeout),super.remove()}}s.GriddedSphereView=N,N.__name__="GriddedSphereView";class P extends l.LayoutDOM{constructor(t){super(t)}}s.GriddedSphere=P,o=P,P.__name__="GriddedSphere",P.__module__="bokeh_gridded_sphere",o.prototype.default_view=N,o.define((({Any:t,Arrayable:e,Bool:s,Enum:i,Float:r,Int:o,List:l,Nullable:a,Ref:n,String:c,Struct:_})=>({lons:[e(r),[]],lats:[e(r),[]],values:[e(r),[]],values_patch:[a(_({indices:e(o),values:e(r)})),null],values_cube:[e(r),[]],time_index:[o,0],playing:[s,!1],playback_fps:[r,4],playback_loop:[s,!0],frame_cache_size:[o,32],cube_color_range:[i("cube","frame"),"frame"],lon_axis:[e(r),[]],lat_axis:[e(r),[]],lon_start:[r,NaN],lon_step:[r,NaN],lat_start:[r,NaN],lat_step:[r,NaN],n_lat:[o,30],n_lon:[o,60],palette:[c,"Turbo256"],vmin:[r,NaN],vmax:[r,NaN],nan_color:[c,"#808080"],rotation:[r,0],tilt:[r,0],zoom:[r,1],autorotate:[s,!1],rotation_speed:[r,1],show_coastlines:[s,!0],coastline_color:[c,"#000000"],coastline_width:[r,.4],coast_lons:[e(a(r)),[]],coast_lats:[e(a(r)),[]],show_countries:[s,!1],country_color:[c,"#333333"],country_width:[r,.4],country_lons:[e(a(r)),[]],country_lats:[e(a(r)),[]],enable_hover:[s,!0],scatter_data:[l(t),[]],scatter_source:[a(n(h.ColumnarDataSource)),null],scatter_color:[c,"#ff0000"],line_data:[l(t),[]],line_source:[a(n(h.ColumnarDataSource)),null],line_color:[c,"#0000ff"],bar_data:[l(t),[]],bar_source:[a(n(h.ColumnarDataSource)),null],bar_color:[c,"#00ff00"],trajectory_data:[l(t),[]],trajectory_source:[a(n(h.ColumnarDataSource)),null],trajectory_color:[c,"#ff00ff"],show_colorbar:[s,!0],colorbar_title:[c,"Value"],background_color:[c,"#0a0a0a"],colorbar_text_color:[c,"#ffffff"],backface_culling:[s,!1],grid_renderer:[i("path","raster"),"path"],lod_factors:[l(o),[2,4,8]],lod_frame_budget:[r,30],render_in_worker:[s,!1],geometry:[a(n(k.SphereGeometry)),null],enable_lighting:[s,!1],light_azimuth:[r,-45],light_elevation:[r,45],light_intensity:[r,.8],ambient_light:[r,.3]})))},
+"688dbd4807": function _(t,n,a,e,r){function o(t,n){const a=t*Math.PI/180,e=n*Math.PI/180;let r=e;for(let t=0;t<10;t++){const t=-(r+Math.sin(r)-Math.PI*Math.sin(e))/(1+Math.cos(r));if(r+=t,Math.abs(t)<1e-6)break}return{x:2*Math.sqrt(2)/Math.PI*a*Math.cos(r/2),y:Math.sqrt(2)*Math.sin(r/2)}}function c(t,n){const a=t*Math.PI/180,e=n*Math.PI/180,r=e*e,o=r*r;return{x:a*(.8707+r*(r*(o*r*(.003971+-.001529*r)-.013791)-.131979)),y:e*(1.007226+r*(.015085+o*(.028874*r-.044475+-.005916*o)))}}function h(t,n){const a=[1,.9986,.9954,.99,.9822,.973,.96,.9427,.9216,.8962,.8679,.835,.7986,.7597,.7186,.6732,.6213,.5722,.5322],e=[0,.062,.124,.186,.248,.31,.372,.434,.4958,.5571,.6176,.6769,.7346,.7903,.8435,.8936,.9394,.9761,1],r=t*Math.PI/180;let o=n*Math.PI/180;const c=o<0?-1:1;o=Math.abs(o);const h=180*o/Math.PI,s=Math.floor(h/5),M=Math.min(s,17),i=(h-5*M)/5;return{x:.8487*(a[M]+(a[M+1]-a[M])*i)*r,y:1.3523*(e[M]+(e[M+1]-e[M])*i)*c}}function s(t,n){return{x:t*Math.PI/180,y:n*Math.PI/180}}e(),a.projectSphere=function(t,n,e,r,o,c){const h=n*Math.PI/180,s=t*Math.PI/180,M=Math.cos(h)*Math.cos(-s),i=Math.cos(h)*Math.sin(-s),u=Math.sin(h),l=M*r+i*e,P=l*o-u*c;return{x:M*e-i*r,y:l*c+u*o,depth:P,visible:P>a.HORIZON_DEPTH}},a.unprojectSphere=function(t,n,a,e,r,o){const c=t*t+n*n;if(!(c<=1))return null;const h=Math.sqrt(1-c),s=h*r+n*o,M=n*r-h*o,i=t*a+s*e,u=s*a-t*e;return{lon:180*-Math.atan2(u,i)/Math.PI,lat:180*Math.asin(Math.max(-1,Math.min(1,M)))/Math.PI}},a.unitVectors=function(t,n){const a=t.length,e=new Float32Array(3*a);for(let r=0;r<a;r++){const a=t[r],o=n[r];if(null===a||null===o){e[3*r]=e[3*r+1]=e[3*r+2]=NaN;continue}const c=o*Math.PI/180,h=a*Math.PI/180;e[3*r]=Math.cos(c)*Math.cos(-h),e[3*r+1]=Math.cos(c)*Math.sin(-h),e[3*r+2]=Math.sin(c)}return e},a.projectUnitVectors=function(t,n,a,e,r,o,c,h,s){const M=void 0!==s&&s.length==t.length?s:new Float32Array(t.length);for(let s=0;s<t.length;s+=3){const i=t[s],u=t[s+1],l=t[s+2],P=i*n-u*a,f=i*a+u*n;M[s]=c+P*o,M[s+1]=h-(f*r+l*e)*o,M[s+2]=f*e-l*r}return M},a.projectMollweide=o,a.projectNaturalEarth=c,a.projectRobinson=h,a.projectPlateCarree=s,a.getProjection=function(t){switch(t){case"mollweide":return o;case"natural_earth":default:return c;case"robinson":return h;case"plate_carree":return s}},a.getProjectionScale=function(t,n,a){const e=Math.min(n,a);switch(t){case"mollweide":return e/4;case"robinson":return e/3.8;default:return e/3.5}},a.HORIZON_DEPTH=-.15},
+"b3aec6ae18": function _(t,n,l,o,s){o(),l.regularAxis=e,l.meshAxes=i,l.resolveGrid=function(t){if(t.lons.length>0&&t.lons.length==t.lats.length){const n=i(t.lons,t.lats,t.n_lat,t.n_lon);return{n_lat:t.n_lat,n_lon:t.n_lon,lon_axis:null!==n?n.lon_axis:null,lat_axis:null!==n?n.lat_axis:null,lons:t.lons,lats:t.lats}}let n=t.lon_axis,l=t.lat_axis;0==n.length&&isFinite(t.lon_start)&&isFinite(t.lon_step)&&(n=e(t.lon_start,t.lon_step,t.n_lon));0==l.length&&isFinite(t.lat_start)&&isFinite(t.lat_step)&&(l=e(t.lat_start,t.lat_step,t.n_lat));const o=l.length,s=n.length,a=new Float64Array(o*s),r=new Float64Array(o*s);for(let t=0;t<o;t++)for(let o=0;o<s;o++)a[t*s+o]=n[o],r[t*s+o]=l[t];return{n_lat:o,n_lon:s,lon_axis:n,lat_axis:l,lons:a,lats:r}},l.gridUnitVectors=function(t){const{n_lat:n,n_lon:l,lon_axis:o,lat_axis:s}=t;if(null===o||null===s)return(0,a.unitVectors)(t.lons,t.lats);const r=new Float64Array(l),e=new Float64Array(l);for(let t=0;t<l;t++){const n=o[t]*Math.PI/180;r[t]=Math.cos(-n),e[t]=Math.sin(-n)}const i=new Float32Array(3*n*l);for(let t=0;t<n;t++){const n=s[t]*Math.PI/180,o=Math.cos(n),a=Math.sin(n);for(let n=0;n<l;n++){const s=3*(t*l+n);i[s]=o*r[n],i[s+1]=o*e[n],i[s+2]=a}}return i};const a=t("688dbd4807"),r=t("9d995a1495");function e(t,n,l){const o=new Float64Array(l);for(let s=0;s<l;s++)o[s]=t+s*n;return o}function i(t,n,l,o){if(l*o!=t.length||l<1||o<1)return null;const s=new Float64Array(o),a=new Float64Array(l);for(let n=0;n<o;n++)s[n]=t[n];for(let t=0;t<l;t++)a[t]=n[t*o];for(let r=0;r<l;r++)for(let l=0;l<o;l++){const e=r*o+l;if(t[e]!=s[l]||n[e]!=a[r])return null}return{lon_axis:s,lat_axis:a}}function c(t){return t-360*Math.floor((t+180)/360)}function _(t,n,l,o,s,a,r,e){const i=(t-s)*(o-a)-(l-s)*(n-a),c=(t-r)*(a-e)-(s-r)*(n-e),_=(t-l)*(e-o)-(r-l)*(n-o);return!((i<0||c<0||_<0)&&(i>0||c>0||_>0))}class h{constructor(t){this.grid=t;const{n_lat:n,n_lon:l,lons:o,lats:s}=t,a=Math.max(0,l-1),e=Math.max(0,n-1)*a;this.index=new r.ScreenIndex(Math.max(.5,Math.sqrt(64800/Math.max(1,e)))),this.index.reset(360,180);const i=[0,1,l+1,l];for(let t=0;t<n-1;t++)for(let n=0;n<a;n++){const r=t*l+n,e=c(o[r]);let _=e,h=e,u=1/0,f=-1/0;for(const t of i){const n=e+c(o[r+t]-e);_=Math.min(_,n),h=Math.max(h,n),u=Math.min(u,s[r+t]),f=Math.max(f,s[r+t])}if(isNaN(_+h+u+f))continue;const x=t*a+n;this.index.insert(x,_+180,u+90,h+180,f+90),_<-180?this.index.insert(x,_+540,u+90,h+540,f+90):h>180&&this.index.insert(x,_-180,u+90,h-180,f+90)}}locate(t,n){return t=c(t),this.index.find(t+180,n+90,(l=>this.contains(l,t,n)))}contains(t,n,l){const{n_lon:o,lons:s,lats:a}=this.grid,r=o-1,e=Math.floor(t/r)*o+t%r,i=n+c(s[e]-n),h=i+c(s[e+1]-i),u=i+c(s[e+o+1]-i),f=i+c(s[e+o]-i),x=a[e],M=a[e+1],d=a[e+o+1],g=a[e+o];return _(n,l,i,x,h,M,u,d)||_(n,l,i,x,u,d,f,g)}}l.CellLocator=h,h.__name__="CellLocator"},
+"9d995a1495": function _(t,s,i,h,e){h();class n{constructor(t=32){this.n_cols=0,this.n_rows=0,this.count=0,this.built=!1,this.boxes=new Float32Array(0),this.ids=new Uint32Array(0),this.starts=new Uint32Array(1),this.entries=new Uint32Array(0),this.cell_size=t}reset(t,s){this.n_cols=Math.max(1,Math.ceil(t/this.cell_size)),this.n_rows=Math.max(1,Math.ceil(s/this.cell_size)),this.count=0,this.built=!1}insert(t,s,i,h,e){if(!(h>=0&&e>=0&&s<this.n_cols*this.cell_size&&i<this.n_rows*this.cell_size))return;if(this.count==this.ids.length){const t=Math.max(64,2*this.count),s=new Float32Array(4*t),i=new Uint32Array(t);s.set(this.boxes),i.set(this.ids),this.boxes=s,this.ids=i}const n=this.count++;this.boxes[4*n]=s,this.boxes[4*n+1]=i,this.boxes[4*n+2]=h,this.boxes[4*n+3]=e,this.ids[n]=t,this.built=!1}find(t,s,i){const h=Math.floor(t/this.cell_size),e=Math.floor(s/this.cell_size);if(0==this.count||h<0||e<0||h>=this.n_cols||e>=this.n_rows)return-1;this.built||this.build();const n=e*this.n_cols+h,o=this.boxes;for(let h=this.starts[n];h<this.starts[n+1];h++){const e=this.entries[h];if(t>=o[4*e]&&t<=o[4*e+2]&&s>=o[4*e+1]&&s<=o[4*e+3]&&i(this.ids[e]))return this.ids[e]}return-1}bucket_range(t){const s=this.n_cols-1,i=this.n_rows-1,h=this.boxes;return[Math.max(0,Math.min(s,Math.floor(h[4*t]/this.cell_size))),Math.max(0,Math.min(i,Math.floor(h[4*t+1]/this.cell_size))),Math.max(0,Math.min(s,Math.floor(h[4*t+2]/this.cell_size))),Math.max(0,Math.min(i,Math.floor(h[4*t+3]/this.cell_size)))]}build(){const t=this.n_cols*this.n_rows,s=new Uint32Array(t+1);let i=0;for(let t=0;t<this.count;t++){const[h,e,n,o]=this.bucket_range(t);for(let t=e;t<=o;t++)for(let i=h;i<=n;i++)s[t*this.n_cols+i+1]++;i+=(n-h+1)*(o-e+1)}for(let i=0;i<t;i++)s[i+1]+=s[i];const h=this.entries.length>=i?this.entries:new Uint32Array(i),e=s.slice(0,t);for(let t=0;t<this.count;t++){const[s,i,n,o]=this.bucket_range(t);for(let r=i;r<=o;r++)for(let i=s;i<=n;i++)h[e[r*this.n_cols+i]++]=t}this.starts=s,this.entries=h,this.built=!0}}i.ScreenIndex=n,n.__name__="ScreenIndex"},
+"f96728cb0d": function _(f,e,c,d,b){d(),c.copper_r=c.copper=c.coolwarm_r=c.coolwarm=c.cool_r=c.cool=c.cividis_r=c.cividis=c.bwr_r=c.bwr=c.brg_r=c.brg=c.bone_r=c.bone=c.binary_r=c.binary=c.autumn_r=c.autumn=c.afmhot_r=c.afmhot=c.YlOrRd_r=c.YlOrRd=c.YlOrBr_r=c.YlOrBr=c.YlGn_r=c.YlGnBu_r=c.YlGnBu=c.YlGn=c.Wistia_r=c.Wistia=c.Spectral_r=c.Spectral=c.Set3_r=c.Set3=c.Set2_r=c.Set2=c.Set1_r=c.Set1=c.Reds_r=c.Reds=c.RdYlGn_r=c.RdYlGn=c.RdYlBu_r=c.RdYlBu=c.RdPu_r=c.RdPu=c.RdGy_r=c.RdGy=c.RdBu_r=c.RdBu=void 0,c.seismic=c.rainbow_r=c.rainbow=c.prism_r=c.prism=c.plasma_r=c.plasma=c.pink_r=c.pink=c.ocean_r=c.ocean=c.nipy_spectral_r=c.nipy_spectral=c.magma_r=c.magma=c.jet_r=c.jet=c.inferno_r=c.inferno=c.hsv_r=c.hsv=c.hot_r=c.hot=c.grey=c.gray_r=c.gray=c.gnuplot_r=c.gnuplot2_r=c.gnuplot2=c.gnuplot=c.gist_yerg=c.gist_yarg_r=c.gist_yarg=c.gist_stern_r=c.gist_stern=c.gist_rainbow_r=c.gist_rainbow=c.gist_ncar_r=c.gist_ncar=c.gist_heat_r=c.gist_heat=c.gist_grey=c.gist_gray_r=c.gist_gray=c.gist_earth_r=c.gist_earth=c.flag_r=c.flag=c.cubehelix_r=c.cubehelix=void 0,c.winter_r=c.winter=c.viridis_r=c.viridis=c.twilight_shifted_r=c.twilight_shifted=c.twilight_r=c.twilight=c.turbo_r=c.turbo=c.terrain_r=c.terrain=c.tab20c_r=c.tab20c=c.tab20b_r=c.tab20b=c.tab20_r=c.tab20=c.tab10_r=c.tab10=c.summer_r=c.summer=c.spring_r=c.spring=c.seismic_r=void 0,c.getPalette=t,c.valueToIndex=n,c.computeValueStats=function(f){let e=1/0,c=-1/0,d=0;for(let b=0;b<f.length;b++){const a=f[b];isNaN(a)?d++:(a<e&&(e=a),a>c&&(c=a))}return{min:e,max:c,nan_count:d}},c.rangeFromStats=function(f,e,c){let d=e,b=c;const a=f.min<=f.max;(void 0===d||isNaN(d))&&(d=a?f.min:0);(void 0===b||isNaN(b))&&(b=a?f.max:1);return{vmin:d,vmax:b}},c.cellColorIndices=function(f,e,c,d,b,a,r){const t=Math.max(0,c-1),n=Math.max(0,e-1)*t,_=void 0!==r&&r.length==n?r:new Int32Array(n);for(let r=0;r<e-1;r++)for(let e=0;e<t;e++)_[r*t+e]=s(f,c,r,e,d,b,a);return _},c.cellColorIndex=s,c.cellValue=_,c.shadeRGBA=function(f,e){if(r.LITTLE_ENDIAN){const c=255&f,d=f>>>8&255,b=f>>>16&255;return(0,r.packRGBA)(Math.floor(c*e),Math.floor(d*e),Math.floor(b*e),f>>>24)}{const c=f>>>24,d=f>>>16&255,b=f>>>8&255;return(0,r.packRGBA)(Math.floor(c*e),Math.floor(d*e),Math.floor(b*e),255&f)}},c.colorToRGBA=u,c.getPaletteRGBA=l,c.getColorLUT=function(f,e){const c=l(f),d=new Uint32Array(c.length+1);return d.set(c),d[c.length]=u(e),d};const a=f("@bokehjs/core/util/color"),r=f("cf654208bc");function t(f){switch(f){case"Accent":return c.Accent;case"Accent_r":return c.Accent_r;case"Blues":return c.Blues;case"Blues_r":return c.Blues_r;case"BrBG":return c.BrBG;case"BrBG_r":return c.BrBG_r;case"BuGn":return c.BuGn;case"BuGn_r":return c.BuGn_r;case"BuPu":return c.BuPu;case"BuPu_r":return c.BuPu_r;case"CMRmap":return c.CMRmap;case"CMRmap_r":return c.CMRmap_r;case"Dark2":return c.Dark2;case"Dark2_r":return c.Dark2_r;case"GnBu":return c.GnBu;case"GnBu_r":return c.GnBu_r;case"Grays":return c.Grays;case"Greens":return c.Greens;case"Greens_r":return c.Greens_r;case"Greys":return c.Greys;case"Greys_r":return c.Greys_r;case"OrRd":return c.OrRd;case"OrRd_r":return c.OrRd_r;case"Oranges":return c.Oranges;case"Oranges_r":return c.Oranges_r;case"PRGn":return c.PRGn;case"PRGn_r":return c.PRGn_r;case"Paired":return c.Paired;case"Paired_r":return c.Paired_r;case"Pastel1":return c.Pastel1;case"Pastel1_r":return c.Pastel1_r;case"Pastel2":return c.Pastel2;case"Pastel2_r":return c.Pastel2_r;case"PiYG":return c.PiYG;case"PiYG_r":return c.PiYG_r;case"PuBu":return c.PuBu;case"PuBuGn":return c.PuBuGn;case"PuBuGn_r":return c.PuBuGn_r;case"PuBu_r":return c.PuBu_r;case"PuOr":return c.PuOr;case"PuOr_r":return c.PuOr_r;case"PuRd":return c.PuRd;case"PuRd_r":return c.PuRd_r;case"Purples":return c.Purples;case"Purples_r":return c.Purples_r;case"RdBu":return c.RdBu;case"RdBu_r":return c.RdBu_r;case"RdGy":return c.RdGy;case"RdGy_r":return c.RdGy_r;case"RdPu":return c.RdPu;case"RdPu_r":return c.RdPu_r;case"RdYlBu":return c.RdYlBu;case"RdYlBu_r":return c.RdYlBu_r;case"RdYlGn":return c.RdYlGn;case"RdYlGn_r":return c.RdYlGn_r;case"Reds":return c.Reds;case"Reds_r":return c.Reds_r;case"Set1":return c.Set1;case"Set1_r":return c.Set1_r;case"Set2":return c.Set2;case"Set2_r":return c.Set2_r;case"Set3":return c.Set3;case"Set3_r":return c.Set3_r;case"Spectral":return c.Spectral;case"Spectral_r":return c.Spectral_r;case"Wistia":return c.Wistia;case"Wistia_r":return c.Wistia_r;case"YlGn":return c.YlGn;case"YlGnBu":return c.YlGnBu;case"YlGnBu_r":return c.YlGnBu_r;case"YlGn_r":return c.YlGn_r;case"YlOrBr":case"YlOrBr":return c.YlOrBr;case"YlOrBr_r":return c.YlOrBr_r;case"YlOrRd":return c.YlOrRd;case"YlOrRd_r":return c.YlOrRd_r;case"afmhot":return c.afmhot;case"afmhot_r":return c.afmhot_r;case"autumn":return c.autumn;case"autumn_r":return c.autumn_r;case"binary":return c.binary;case"binary_r":return c.binary_r;case"bone":return c.bone;case"bone_r":return c.bone_r;case"brg":return c.brg;case"brg_r":return c.brg_r;case"bwr":return c.bwr;case"bwr_r":return c.bwr_r;case"cividis":return c.cividis;case"cividis_r":return c.cividis_r;case"cool":return c.cool;case"cool_r":return c.cool_r;case"coolwarm":return c.coolwarm;case"coolwarm_r":return c.coolwarm_r;case"copper":return c.copper;case"copper_r":return c.copper_r;case"cubehelix":return c.cubehelix;case"cubehelix_r":return c.cubehelix_r;case"flag":return c.flag;case"flag_r":return c.flag_r;case"gist_earth":return c.gist_earth;case"gist_earth_r":return c.gist_earth_r;case"gist_gray":return c.gist_gray;case"gist_gray_r":return c.gist_gray_r;case"gist_grey":return c.gist_grey;case"gist_heat":return c.gist_heat;case"gist_heat_r":return c.gist_heat_r;case"gist_ncar":return c.gist_ncar;case"gist_ncar_r":return c.gist_ncar_r;case"gist_rainbow":return c.gist_rainbow;case"gist_rainbow_r":return c.gist_rainbow_r;case"gist_stern":return c.gist_stern;case"gist_stern_r":return c.gist_stern_r;case"gist_yarg":return c.gist_yarg;case"gist_yarg_r":return c.gist_yarg_r;case"gist_yerg":return c.gist_yerg;case"gnuplot":return c.gnuplot;case"gnuplot2":return c.gnuplot2;case"gnuplot2_r":return c.gnuplot2_r;case"gnuplot_r":return c.gnuplot_r;case"gray":return c.gray;case"gray_r":return c.gray_r;case"grey":return c.grey;case"hot":return c.hot;case"hot_r":return c.hot_r;case"hsv":return c.hsv;case"hsv_r":return c.hsv_r;case"inferno":return c.inferno;case"inferno_r":return c.inferno_r;case"jet":return c.jet;case"jet_r":return c.jet_r;case"magma":return c.magma;case"magma_r":return c.magma_r;case"nipy_spectral":return c.nipy_spectral;case"nipy_spectral_r":return c.nipy_spectral_r;case"ocean":return c.ocean;case"ocean_r":return c.ocean_r;case"pink":return c.pink;case"pink_r":return c.pink_r;case"plasma":return c.plasma;case"plasma_r":return c.plasma_r;case"prism":return c.prism;case"prism_r":return c.prism_r;case"rainbow":return c.rainbow;case"rainbow_r":return c.rainbow_r;case"seismic":return c.seismic;case"seismic_r":return c.seismic_r;case"spring":return c.spring;case"spring_r":return c.spring_r;case"summer":return c.summer;case"summer_r":return c.summer_r;case"tab10":return c.tab10;case"tab10_r":return c.tab10_r;case"tab20":return c.tab20;case"tab20_r":return c.tab20_r;case"tab20b":return c.tab20b;case"tab20b_r":return c.tab20b_r;case"tab20c":return c.tab20c;case"tab20c_r":return c.tab20c_r;case"terrain":return c.terrain;case"terrain_r":return c.terrain_r;case"turbo":return c.turbo;case"turbo_r":return c.turbo_r;case"twilight":return c.twilight;case"twilight_r":return c.twilight_r;case"twilight_shifted":return c.twilight_shifted;case"twilight_shifted_r":return c.twilight_shifted_r;case"viridis":return c.viridis;case"viridis_r":return c.viridis_r;case"winter":return c.winter;case"winter_r":return c.winter_r;case"Turbo256":default:return c.Turbo256;case"Viridis256":return c.Viridis256;case"Plasma256":return c.Plasma256;case"Inferno256":return c.Inferno256;case"Cividis256":return c.Cividis256}}function n(f,e,c,d){if(isNaN(f))return-1;const b=(f-c)/(d-c),a=Math.floor(b*(e-1));return Math.max(0,Math.min(e-1,a))}function s(f,e,c,d,b,a,r){const t=n(_(f,e,c,d),b,a,r);return t<0?b:t}function _(f,e,c,d){const b=c*e+d,a=b+e;return(f[b]+f[b+1]+f[a+1]+f[a])/4}function u(f){const[e,c,d,b]=(0,a.color2rgba)(f);return(0,r.packRGBA)(e,c,d,b)}c.Turbo256=["#30123b","#311542","#32184a","#341b51","#351e58","#36215f","#372566","#38286d","#392b74","#3a2e7b","#3b3181","#3c3488","#3c378e","#3d3a94","#3e3d9a","#3e40a0","#3e43a5","#3f46ab","#3f49b0","#3f4cb5","#3f52bf","#3f55c4","#3e58c8","#3e5bcc","#3e5ed0","#3d61d4","#3d64d8","#3c68dc","#3c6bdf","#3b6ee2","#3a71e5","#3974e8","#3977eb","#387aed","#377df0","#3680f2","#3583f4","#3486f6","#3389f8","#328cfa","#318ffc","#2f92fd","#2e95fe","#2d98ff","#2c9bff","#2b9eff","#2aa1ff","#2aa4ff","#29a7fe","#28aafe","#28adfd","#28b0fc","#28b2fb","#28b5fa","#28b8f9","#28bbf8","#28bef6","#28c1f5","#29c3f3","#29c6f2","#2ac9f0","#2accee","#2bceec","#2cd1ea","#2dd3e8","#2ed6e6","#2fd8e4","#31dbe1","#32dddf","#34e0dd","#36e2da","#38e4d8","#3ae6d5","#3ce8d2","#3fead0","#41eccd","#44eeca","#46f0c7","#49f1c4","#4cf3c1","#4ff5be","#52f6bb","#55f8b8","#58f9b4","#5bfbb1","#5efcae","#62fdab","#65fea8","#69ffa4","#6cffa1","#70ff9e","#73ff9b","#77ff98","#7aff95","#7eff92","#81ff8f","#85ff8c","#88ff89","#8cff87","#8fff84","#93ff81","#96fe7f","#9afe7c","#9dfd7a","#a1fd77","#a4fc75","#a7fc73","#abfb71","#aefa6f","#b2f96d","#b5f86b","#b8f769","#bcf667","#bff665","#c2f564","#c5f462","#c9f360","#ccf25f","#cff15d","#d2f05c","#d5ef5a","#d9ee59","#dced57","#dfec56","#e2eb55","#e5ea53","#e8e952","#ebe851","#eee750","#f1e64f","#f4e54e","#f7e34d","#f9e24c","#fce14b","#ffe049","#ffdf48","#ffde47","#ffdd46","#ffdb45","#ffda43","#ffd942","#ffd741","#ffd640","#ffd53e","#ffd33d","#ffd23c","#ffd03a","#ffcf39","#ffcd37","#ffcc36","#ffca35","#ffc933","#ffc732","#ffc630","#ffc42f","#ffc32d","#ffc12c","#ffc02a","#ffbe29","#ffbd27","#ffbb26","#ffba24","#ffb823","#ffb621","#ffb520","#ffb31e","#ffb21d","#ffb01b","#ffaf1a","#ffad18","#ffac17","#ffaa15","#ffa914","#ffa712","#ffa611","#ffa40f","#ffa30e","#ffa10c","#ffa00b","#ff9e09","#ff9d08","#ff9b06","#ff9a05","#ff9803","#ff9702","#ff9500"],c.Viridis256=["#440154","#440256","#450457","#450559","#46075a","#46085c","#460a5d","#460b5e","#470d60","#470e61","#471063","#471164","#471365","#481467","#481668","#481769","#48186a","#481a6c","#481b6d","#481c6e","#481d6f","#481f70","#482071","#482173","#482374","#482475","#482576","#482677","#482878","#482979","#472a7a","#472c7a","#472d7b","#472e7c","#472f7d","#46307e","#46327e","#46337f","#463480","#453581","#453781","#453882","#443983","#443a83","#443b84","#433d84","#433e85","#423f85","#424086","#424186","#414287","#414487","#404588","#404688","#3f4788","#3f4889","#3e4989","#3e4a89","#3e4c8a","#3d4d8a","#3d4e8a","#3c4f8a","#3c508b","#3b518b","#3b528b","#3a538b","#3a548c","#39558c","#39568c","#38588c","#38598c","#375a8c","#375b8d","#365c8d","#365d8d","#355e8d","#355f8d","#34608d","#34618d","#33628d","#33638d","#32648e","#32658e","#31668e","#31678e","#31688e","#30698e","#306a8e","#2f6b8e","#2f6c8e","#2e6d8e","#2e6e8e","#2e6f8e","#2d708e","#2d718e","#2c718e","#2c728e","#2c738e","#2b748e","#2b758e","#2a768e","#2a778e","#2a788e","#29798e","#297a8e","#297b8e","#287c8e","#287d8e","#277e8e","#277f8e","#27808e","#26818e","#26828e","#26828e","#25838e","#25848e","#25858e","#24868e","#24878e","#23888e","#23898e","#238a8d","#228b8d","#228c8d","#228d8d","#218e8d","#218f8d","#21908d","#21918c","#20928c","#20928c","#20938c","#1f948c","#1f958b","#1f968b","#1f978b","#1f988b","#1f998a","#1f9a8a","#1e9b8a","#1e9c89","#1e9d89","#1f9e89","#1f9f88","#1fa088","#1fa188","#1fa187","#1fa287","#20a386","#20a486","#21a585","#21a685","#22a785","#22a884","#23a983","#24aa83","#25ab82","#25ac82","#26ad81","#27ad81","#28ae80","#29af7f","#2ab07f","#2cb17e","#2db27d","#2eb37c","#2fb47c","#31b57b","#32b67a","#34b679","#35b779","#37b878","#38b977","#3aba76","#3bbb75","#3dbc74","#3fbc73","#40bd72","#42be71","#44bf70","#46c06f","#48c16e","#4ac16d","#4cc26c","#4ec36b","#50c46a","#52c569","#54c568","#56c667","#58c765","#5ac864","#5cc863","#5ec962","#60ca60","#63cb5f","#65cb5e","#67cc5c","#69cd5b","#6ccd5a","#6ece58","#70cf57","#73d056","#75d054","#77d153","#7ad151","#7cd250","#7fd34e","#81d34d","#84d44b","#86d549","#89d548","#8bd646","#8ed645","#90d743","#93d741","#95d840","#98d83e","#9bd93c","#9dd93b","#a0da39","#a2da37","#a5db36","#a8db34","#aadc32","#addc30","#b0dd2f","#b2dd2d","#b5de2b","#b8de29","#bade28","#bddf26","#c0df25","#c2df23","#c5e021","#c8e020","#cae11f","#cde11d","#d0e11c","#d2e21b","#d5e21a","#d8e219","#dae319","#dde318","#dfe318","#e2e418","#e5e419","#e7e419","#eae51a","#ece51b","#efe51c","#f1e51d","#f4e61e","#f6e620","#f8e621","#fbe723","#fde725"],c.Plasma256=["#0d0887","#100788","#130789","#16078a","#19068c","#1b068d","#1d068e","#20068f","#220690","#240691","#260591","#280592","#2a0593","#2c0594","#2e0595","#2f0596","#310597","#330597","#350498","#370499","#38049a","#3a049a","#3c049b","#3e049c","#3f049c","#41049d","#43039e","#44039e","#46039f","#48039f","#4903a0","#4b03a1","#4c02a1","#4e02a2","#5002a2","#5102a3","#5302a3","#5502a4","#5601a4","#5801a4","#5901a5","#5b01a5","#5c01a6","#5e01a6","#6001a6","#6100a7","#6300a7","#6400a7","#6600a7","#6700a8","#6900a8","#6a00a8","#6c00a8","#6e00a8","#6f00a8","#7100a8","#7201a8","#7401a8","#7501a8","#7701a8","#7801a8","#7a02a8","#7b02a8","#7d03a8","#7e03a8","#8004a8","#8104a7","#8305a7","#8405a7","#8606a6","#8707a6","#8808a6","#8a09a5","#8b0aa5","#8d0ba5","#8e0ca4","#8f0da4","#910ea3","#920fa3","#9410a2","#9511a1","#9613a1","#9814a0","#99159f","#9a169f","#9c179e","#9d189d","#9e199d","#a01a9c","#a11b9b","#a21d9a","#a31e9a","#a51f99","#a62098","#a72197","#a82296","#aa2395","#ab2494","#ac2694","#ad2793","#ae2892","#b02991","#b12a90","#b22b8f","#b32c8e","#b42e8d","#b52f8c","#b6308b","#b7318a","#b83289","#ba3388","#bb3488","#bc3587","#bd3786","#be3885","#bf3984","#c03a83","#c13b82","#c23c81","#c33d80","#c43e7f","#c5407e","#c6417d","#c7427c","#c8437b","#c9447a","#ca457a","#cb4679","#cc4778","#cc4977","#cd4a76","#ce4b75","#cf4c74","#d04d73","#d14e72","#d24f71","#d35171","#d45270","#d5536f","#d5546e","#d6556d","#d7566c","#d8576b","#d9586a","#da5a6a","#da5b69","#db5c68","#dc5d67","#dd5e66","#de5f65","#de6164","#df6263","#e06363","#e16462","#e26561","#e26660","#e3685f","#e4695e","#e56a5d","#e56b5d","#e66c5c","#e76e5b","#e76f5a","#e87059","#e97158","#e97257","#ea7457","#eb7556","#eb7655","#ec7754","#ed7953","#ed7a52","#ee7b52","#ef7c51","#ef7e50","#f07f4f","#f0804e","#f1814d","#f1834c","#f2844b","#f3854b","#f3864a","#f48849","#f48948","#f58b47","#f58c46","#f68d45","#f68f44","#f79044","#f79143","#f79342","#f89441","#f89540","#f9973f","#f9983e","#f99a3e","#fa9b3d","#fa9c3c","#fa9e3b","#fb9f3a","#fba139","#fba238","#fca338","#fca537","#fca636","#fca835","#fca934","#fdab33","#fdac33","#fdae32","#fdaf31","#fdb130","#fdb22f","#fdb42f","#fdb52e","#feb72d","#feb82c","#feba2c","#febb2b","#febd2a","#febe2a","#fec029","#fdc229","#fdc328","#fdc527","#fdc627","#fdc827","#fdca26","#fdcb26","#fccd25","#fcce25","#fcd025","#fcd225","#fbd324","#fbd524","#fbd724","#fad824","#fada24","#f9dc24","#f9dd25","#f8df25","#f8e125","#f7e225","#f7e425","#f6e626","#f6e826","#f5e926","#f5eb27","#f4ed27","#f3ee27","#f3f027","#f2f227","#f1f426","#f1f525","#f0f724","#f0f921"],c.Inferno256=["#000004","#010005","#010106","#010108","#020109","#02020b","#02020d","#03030f","#030312","#040414","#050416","#060518","#06051a","#07061c","#08071e","#090720","#0a0822","#0b0924","#0c0926","#0d0a29","#0e0b2b","#100b2d","#110c2f","#120d31","#130d34","#140e36","#150e38","#160f3b","#180f3d","#19103f","#1a1042","#1c1044","#1d1147","#1e1149","#20114b","#21114e","#221150","#241253","#251255","#271258","#29115a","#2a115c","#2c115f","#2d1161","#2f1163","#311165","#331067","#341069","#36106b","#38106c","#390f6e","#3b0f70","#3d0f71","#3f0f72","#400f74","#420f75","#440f76","#451077","#471078","#491078","#4a1079","#4c117a","#4e117b","#4f127b","#51127c","#52137c","#54137d","#56147d","#57157e","#59157e","#5a167e","#5c167f","#5d177f","#5f187f","#601880","#621980","#641a80","#651a80","#671b80","#681c81","#6a1c81","#6b1d81","#6d1d81","#6e1e81","#701f81","#721f81","#732081","#752181","#762181","#782281","#792282","#7b2382","#7c2382","#7e2482","#802582","#812581","#832681","#842681","#862781","#882781","#892881","#8b2981","#8c2981","#8e2a81","#902a81","#912b81","#932b80","#942c80","#962c80","#982d80","#992d80","#9b2e7f","#9c2e7f","#9e2f7f","#a02f7f","#a1307e","#a3307e","#a5317e","#a6317d","#a8327d","#aa337d","#ab337c","#ad347c","#ae347b","#b0357b","#b2357b","#b3367a","#b5367a","#b73779","#b83779","#ba3878","#bc3978","#bd3977","#bf3a77","#c03a76","#c23b75","#c43c75","#c53c74","#c73d73","#c83e73","#ca3e72","#cc3f71","#cd4071","#cf4070","#d0416f","#d2426f","#d3436e","#d5446d","#d6456c","#d8456c","#d9466b","#db476a","#dc4869","#de4968","#df4a68","#e04c67","#e24d66","#e34e65","#e44f64","#e55064","#e75263","#e85362","#e95462","#ea5661","#eb5760","#ec5860","#ed5a5f","#ee5b5e","#ef5d5e","#f05f5e","#f1605d","#f2625d","#f2645c","#f3655c","#f4675c","#f4695c","#f56b5c","#f66c5c","#f66e5c","#f7705c","#f7725c","#f8745c","#f8765c","#f9785d","#f9795d","#f97b5d","#fa7d5e","#fa7f5e","#fa815f","#fb835f","#fb8560","#fb8761","#fc8961","#fc8a62","#fc8c63","#fc8e64","#fc9065","#fd9266","#fd9467","#fd9668","#fd9869","#fd9a6a","#fd9b6b","#fe9d6c","#fe9f6d","#fea16e","#fea36f","#fea571","#fea772","#fea973","#feaa74","#feac76","#feae77","#feb078","#feb27a","#feb47b","#feb67c","#feb77e","#feb97f","#febb81","#febd82","#febf84","#fec185","#fec287","#fec488","#fec68a","#fec88c","#feca8d","#fecc8f","#fecd90","#fecf92","#fed194","#fed395","#fed597","#fed799","#fed89a","#fdda9c","#fddc9e","#fddea0","#fde0a1","#fde2a3","#fde3a5","#fde5a7","#fde7a9","#fde9aa","#fdebac","#fcecae","#fceeb0","#fcf0b2","#fcf2b4","#fcf4b6","#fcf6b8","#fcf7b9","#fcf9bb","#fcfbbd","#fcfdbf"],c.Cividis256=["#00204d","#00204e","#00214f","#002150","#002251","#002251","#002352","#002353","#002354","#002355","#002456","#002457","#002558","#002559","#00265a","#00265b","#00275c","#00275d","#00285e","#00285f","#002961","#002962","#002a63","#002a64","#002b66","#002b67","#002c68","#002c6a","#002d6b","#002d6d","#002e6e","#002e6f","#002f71","#002f72","#003074","#003075","#003177","#003178","#00327a","#00327b","#00337d","#00337e","#003480","#003481","#003583","#003584","#003586","#003687","#003788","#003789","#00388a","#00388b","#003a8c","#003a8d","#003b8e","#003c8f","#003c90","#003d91","#003e91","#003f92","#003f93","#004093","#004194","#004295","#004395","#004496","#004596","#004696","#004797","#004897","#004998","#004a98","#004b98","#004c99","#004d99","#004e99","#004f99","#00509a","#00519a","#00529a","#00539a","#00549a","#00559b","#00569b","#00579b","#00589b","#00599b","#005a9b","#005b9b","#005d9b","#005e9b","#005f9b","#00609b","#00619b","#00629b","#00639b","#00649b","#00659b","#00669b","#00679b","#00689b","#006a9a","#006b9a","#006c9a","#006d9a","#006e9a","#006f99","#007099","#007199","#007299","#007399","#007498","#007598","#007698","#007797","#007897","#007997","#007a96","#007b96","#007c96","#007d95","#007e95","#007f94","#008094","#008193","#008293","#008392","#008492","#008591","#008691","#008790","#00888f","#00898f","#008a8e","#008b8d","#008c8d","#008d8c","#008e8b","#008f8a","#008f8a","#009089","#009188","#009287","#009386","#009485","#009585","#009684","#009783","#009882","#009881","#009980","#009a7f","#009b7e","#009c7d","#009d7c","#009e7b","#009f7a","#00a078","#00a177","#00a276","#00a374","#00a473","#00a572","#00a671","#00a76f","#00a86e","#00a96d","#00aa6b","#00ab6a","#00ac69","#00ad67","#00ae66","#00af64","#00b063","#00b162","#00b260","#00b35f","#00b45d","#00b55c","#00b65a","#00b759","#00b857","#00b956","#00ba54","#00bb53","#00bc51","#00bd50","#00be4e","#00bf4d","#00c04b","#00c14a","#00c248","#00c347","#00c445","#00c544","#00c642","#00c741","#00c83f","#00c93e","#00ca3c","#00cb3b","#00cc39","#00cd38","#00ce36","#00cf35","#00d034","#00d132","#00d231","#00d330","#02d42e","#0bd52d","#12d62c","#18d72b","#1dd829","#21d928","#25da27","#29db26","#2cdc25","#2fdd24","#32de23","#35df22","#38e021","#3ae220","#3de31f","#3fe41e","#42e51d","#44e61d","#46e71c","#49e81b","#4be91b","#4dea1a","#4feb19","#51ec19","#53ed18","#55ee18","#57ef17","#59f017","#5bf117","#5df216","#5ff316","#61f416","#63f516","#65f615","#67f715","#69f815","#6bf915","#6dfa15","#6ffb15","#71fc15","#73fd15","#75fe15","#77ff15"],c.Accent=["#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666"],c.Accent_r=["#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#bf5b17","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#f0027f","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#386cb0","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#fdc086","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#beaed4","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f","#7fc97f"],c.Blues=["#f7fbff","#f6faff","#f5fafe","#f5f9fe","#f4f9fe","#f3f8fe","#f2f8fd","#f2f7fd","#f1f7fd","#f0f6fd","#eff6fc","#eef5fc","#eef5fc","#edf4fc","#ecf4fb","#ebf3fb","#eaf3fb","#eaf2fb","#e9f2fa","#e8f1fa","#e7f1fa","#e7f0fa","#e6f0f9","#e5eff9","#e4eff9","#e3eef9","#e3eef8","#e2edf8","#e1edf8","#e0ecf8","#dfecf7","#dfebf7","#deebf7","#ddeaf7","#dceaf6","#dce9f6","#dbe9f6","#dae8f6","#d9e8f5","#d9e7f5","#d8e7f5","#d7e6f5","#d6e6f4","#d6e5f4","#d5e5f4","#d4e4f4","#d3e4f3","#d3e3f3","#d2e3f3","#d1e2f3","#d0e2f2","#d0e1f2","#cfe1f2","#cee0f2","#cde0f1","#cddff1","#ccdff1","#cbdef1","#cadef0","#caddf0","#c9ddf0","#c8dcf0","#c7dcef","#c7dbef","#c6dbef","#c4daee","#c3daee","#c2d9ee","#c1d9ed","#bfd8ed","#bed8ec","#bdd7ec","#bcd7eb","#bad6eb","#b9d6ea","#b8d5ea","#b7d4ea","#b5d4e9","#b4d3e9","#b3d3e8","#b2d2e8","#b0d2e7","#afd1e7","#aed1e7","#add0e6","#abd0e6","#aacfe5","#a9cfe5","#a8cee4","#a6cee4","#a5cde3","#a4cce3","#a3cce3","#a1cbe2","#a0cbe2","#9fcae1","#9dcae1","#9cc9e1","#9ac8e0","#99c7e0","#97c6df","#95c5df","#94c4df","#92c4de","#91c3de","#8fc2de","#8dc1dd","#8cc0dd","#8abfdd","#89bedc","#87bddc","#85bcdc","#84bcdb","#82bbdb","#81badb","#7fb9da","#7db8da","#7cb7da","#7ab6d9","#79b5d9","#77b5d9","#75b4d8","#74b3d8","#72b2d8","#71b1d7","#6fb0d7","#6dafd7","#6caed6","#6aaed6","#69add5","#68acd5","#66abd4","#65aad4","#64a9d3","#63a8d3","#61a7d2","#60a7d2","#5fa6d1","#5da5d1","#5ca4d0","#5ba3d0","#5aa2cf","#58a1cf","#57a0ce","#56a0ce","#549fcd","#539ecd","#529dcc","#519ccc","#4f9bcb","#4e9acb","#4d99ca","#4b98ca","#4a98c9","#4997c9","#4896c8","#4695c8","#4594c7","#4493c7","#4292c6","#4191c6","#4090c5","#3f8fc5","#3e8ec4","#3d8dc4","#3c8cc3","#3b8bc2","#3a8ac2","#3989c1","#3888c1","#3787c0","#3686c0","#3585bf","#3484bf","#3383be","#3282be","#3181bd","#3080bd","#2f7fbc","#2e7ebc","#2d7dbb","#2c7cba","#2b7bba","#2a7ab9","#2979b9","#2777b8","#2676b8","#2575b7","#2474b7","#2373b6","#2272b6","#2171b5","#2070b4","#206fb4","#1f6eb3","#1e6db2","#1d6cb1","#1c6bb0","#1c6ab0","#1b69af","#1a68ae","#1967ad","#1966ad","#1865ac","#1764ab","#1663aa","#1562a9","#1561a9","#1460a8","#135fa7","#125ea6","#125da6","#115ca5","#105ba4","#0f5aa3","#0e59a2","#0e58a2","#0d57a1","#0c56a0","#0b559f","#0a549e","#0a539e","#09529d","#08519c","#08509b","#084f99","#084e98","#084d96","#084c95","#084b93","#084a91","#084990","#08488e","#08478d","#08468b","#08458a","#084488","#084387","#084285","#084184","#084082","#083e81","#083d7f","#083c7d","#083b7c","#083a7a","#083979","#083877","#083776","#083674","#083573","#083471","#083370","#08326e","#08316d","#08306b"],c.Blues_r=["#08306b","#08316d","#08326e","#083370","#083471","#083573","#083674","#083776","#083877","#083979","#083a7a","#083b7c","#083c7d","#083d7f","#083e81","#084082","#084184","#084285","#084387","#084488","#08458a","#08468b","#08478d","#08488e","#084990","#084a91","#084b93","#084c95","#084d96","#084e98","#084f99","#08509b","#08519c","#09529d","#0a539e","#0a549e","#0b559f","#0c56a0","#0d57a1","#0e58a2","#0e59a2","#0f5aa3","#105ba4","#115ca5","#125da6","#125ea6","#135fa7","#1460a8","#1561a9","#1562a9","#1663aa","#1764ab","#1865ac","#1966ad","#1967ad","#1a68ae","#1b69af","#1c6ab0","#1c6bb0","#1d6cb1","#1e6db2","#1f6eb3","#206fb4","#2070b4","#2171b5","#2272b6","#2373b6","#2474b7","#2575b7","#2676b8","#2777b8","#2979b9","#2a7ab9","#2b7bba","#2c7cba","#2d7dbb","#2e7ebc","#2f7fbc","#3080bd","#3181bd","#3282be","#3383be","#3484bf","#3585bf","#3686c0","#3787c0","#3888c1","#3989c1","#3a8ac2","#3b8bc2","#3c8cc3","#3d8dc4","#3e8ec4","#3f8fc5","#4090c5","#4191c6","#4292c6","#4493c7","#4594c7","#4695c8","#4896c8","#4997c9","#4a98c9","#4b98ca","#4d99ca","#4e9acb","#4f9bcb","#519ccc","#529dcc","#539ecd","#549fcd","#56a0ce","#57a0ce","#58a1cf","#5aa2cf","#5ba3d0","#5ca4d0","#5da5d1","#5fa6d1","#60a7d2","#61a7d2","#63a8d3","#64a9d3","#65aad4","#66abd4","#68acd5","#69add5","#6aaed6","#6caed6","#6dafd7","#6fb0d7","#71b1d7","#72b2d8","#74b3d8","#75b4d8","#77b5d9","#79b5d9","#7ab6d9","#7cb7da","#7db8da","#7fb9da","#81badb","#82bbdb","#84bcdb","#85bcdc","#87bddc","#89bedc","#8abfdd","#8cc0dd","#8dc1dd","#8fc2de","#91c3de","#92c4de","#94c4df","#95c5df","#97c6df","#99c7e0","#9ac8e0","#9cc9e1","#9dcae1","#9fcae1","#a0cbe2","#a1cbe2","#a3cce3","#a4cce3","#a5cde3","#a6cee4","#a8cee4","#a9cfe5","#aacfe5","#abd0e6","#add0e6","#aed1e7","#afd1e7","#b0d2e7","#b2d2e8","#b3d3e8","#b4d3e9","#b5d4e9","#b7d4ea","#b8d5ea","#b9d6ea","#bad6eb","#bcd7eb","#bdd7ec","#bed8ec","#bfd8ed","#c1d9ed","#c2d9ee","#c3daee","#c4daee","#c6dbef","#c7dbef","#c7dcef","#c8dcf0","#c9ddf0","#caddf0","#cadef0","#cbdef1","#ccdff1","#cddff1","#cde0f1","#cee0f2","#cfe1f2","#d0e1f2","#d0e2f2","#d1e2f3","#d2e3f3","#d3e3f3","#d3e4f3","#d4e4f4","#d5e5f4","#d6e5f4","#d6e6f4","#d7e6f5","#d8e7f5","#d9e7f5","#d9e8f5","#dae8f6","#dbe9f6","#dce9f6","#dceaf6","#ddeaf7","#deebf7","#dfebf7","#dfecf7","#e0ecf8","#e1edf8","#e2edf8","#e3eef8","#e3eef9","#e4eff9","#e5eff9","#e6f0f9","#e7f0fa","#e7f1fa","#e8f1fa","#e9f2fa","#eaf2fb","#eaf3fb","#ebf3fb","#ecf4fb","#edf4fc","#eef5fc","#eef5fc","#eff6fc","#f0f6fd","#f1f7fd","#f2f7fd","#f2f8fd","#f3f8fe","#f4f9fe","#f5f9fe","#f5fafe","#f6faff","#f7fbff"],c.BrBG=["#543005","#563105","#583305","#5b3406","#5d3506","#5f3606","#613806","#633906","#663a07","#683c07","#6a3d07","#6c3e07","#6e4007","#714108","#734208","#754308","#774508","#794608","#7c4709","#7e4909","#804a09","#824b09","#844c09","#874e0a","#894f0a","#8b500a","#8d520b","#8f540c","#91560d","#93580f","#955910","#975b12","#995d13","#9b5f14","#9d6116","#9f6317","#a16518","#a3671a","#a5691b","#a76a1d","#a96c1e","#ab6e1f","#ad7021","#af7222","#b17423","#b37625","#b57826","#b77928","#b97b29","#bb7d2a","#bd7f2c","#bf812d","#c08430","#c28633","#c38936","#c48b3a","#c58e3d","#c79040","#c89343","#c99546","#ca9849","#cc9a4c","#cd9d50","#cea053","#cfa256","#d1a559","#d2a75c","#d3aa5f","#d4ac62","#d6af65","#d7b169","#d8b46c","#d9b76f","#dbb972","#dcbc75","#ddbe78","#dec17b","#dfc37e","#e0c481","#e1c684","#e2c787","#e3c989","#e4ca8c","#e5cc8f","#e6cd92","#e7cf94","#e8d097","#e8d29a","#e9d39d","#ead59f","#ebd6a2","#ecd8a5","#edd9a8","#eedbaa","#efdcad","#f0deb0","#f1dfb3","#f1e1b5","#f2e2b8","#f3e4bb","#f4e5be","#f5e7c0","#f6e8c3","#f6e9c5","#f6e9c7","#f6eac9","#f6eacb","#f6ebcd","#f6ebcf","#f6ecd1","#f6ecd3","#f6edd5","#f6edd7","#f6eed9","#f6eedb","#f5efdc","#f5efde","#f5f0e0","#f5f0e2","#f5f1e4","#f5f1e6","#f5f2e8","#f5f2ea","#f5f3ec","#f5f3ee","#f5f4f0","#f5f4f2","#f5f5f4","#f4f5f5","#f2f4f4","#f0f4f3","#eff3f3","#edf3f2","#ebf3f2","#e9f2f1","#e7f2f0","#e6f1f0","#e4f1ef","#e2f0ee","#e0f0ee","#def0ed","#ddefed","#dbefec","#d9eeeb","#d7eeeb","#d5edea","#d4ede9","#d2ede9","#d0ece8","#ceece8","#ccebe7","#cbebe6","#c9eae6","#c7eae5","#c4e9e4","#c1e8e2","#bfe7e1","#bce5df","#b9e4de","#b6e3dd","#b4e2db","#b1e1da","#aee0d8","#abdfd7","#a8ddd5","#a6dcd4","#a3dbd3","#a0dad1","#9dd9d0","#9ad8ce","#98d7cd","#95d6cc","#92d4ca","#8fd3c9","#8dd2c7","#8ad1c6","#87d0c5","#84cfc3","#81cec2","#7fccc0","#7ccabe","#79c8bc","#76c6ba","#73c3b8","#70c1b6","#6dbfb4","#6abdb2","#67bbb0","#64b9ae","#61b7ac","#5eb5aa","#5bb3a8","#58b0a7","#55aea5","#52aca3","#4faaa1","#4da89f","#4aa69d","#47a49b","#44a299","#419f97","#3e9d95","#3b9b93","#389991","#35978f","#33958d","#31938b","#2f9189","#2d8f87","#2b8d85","#298b83","#278a82","#258880","#23867e","#21847c","#1f827a","#1d8078","#1a7e76","#187c74","#167a72","#147870","#12766e","#10746c","#0e726a","#0c7169","#0a6f67","#086d65","#066b63","#046961","#02675f","#01655d","#01645b","#016259","#016058","#015f56","#015d54","#015b52","#015a50","#01584f","#01564d","#01554b","#015349","#015147","#005046","#004e44","#004c42","#004b40","#00493e","#00483d","#00463b","#004439","#004337","#004135","#003f34","#003e32","#003c30"],c.BrBG_r=["#003c30","#003e32","#003f34","#004135","#004337","#004439","#00463b","#00483d","#00493e","#004b40","#004c42","#004e44","#005046","#015147","#015349","#01554b","#01564d","#01584f","#015a50","#015b52","#015d54","#015f56","#016058","#016259","#01645b","#01655d","#02675f","#046961","#066b63","#086d65","#0a6f67","#0c7169","#0e726a","#10746c","#12766e","#147870","#167a72","#187c74","#1a7e76","#1d8078","#1f827a","#21847c","#23867e","#258880","#278a82","#298b83","#2b8d85","#2d8f87","#2f9189","#31938b","#33958d","#35978f","#389991","#3b9b93","#3e9d95","#419f97","#44a299","#47a49b","#4aa69d","#4da89f","#4faaa1","#52aca3","#55aea5","#58b0a7","#5bb3a8","#5eb5aa","#61b7ac","#64b9ae","#67bbb0","#6abdb2","#6dbfb4","#70c1b6","#73c3b8","#76c6ba","#79c8bc","#7ccabe","#7fccc0","#81cec2","#84cfc3","#87d0c5","#8ad1c6","#8dd2c7","#8fd3c9","#92d4ca","#95d6cc","#98d7cd","#9ad8ce","#9dd9d0","#a0dad1","#a3dbd3","#a6dcd4","#a8ddd5","#abdfd7","#aee0d8","#b1e1da","#b4e2db","#b6e3dd","#b9e4de","#bce5df","#bfe7e1","#c1e8e2","#c4e9e4","#c7eae5","#c9eae6","#cbebe6","#ccebe7","#ceece8","#d0ece8","#d2ede9","#d4ede9","#d5edea","#d7eeeb","#d9eeeb","#dbefec","#ddefed","#def0ed","#e0f0ee","#e2f0ee","#e4f1ef","#e6f1f0","#e7f2f0","#e9f2f1","#ebf3f2","#edf3f2","#eff3f3","#f0f4f3","#f2f4f4","#f4f5f5","#f5f5f4","#f5f4f2","#f5f4f0","#f5f3ee","#f5f3ec","#f5f2ea","#f5f2e8","#f5f1e6","#f5f1e4","#f5f0e2","#f5f0e0","#f5efde","#f5efdc","#f6eedb","#f6eed9","#f6edd7","#f6edd5","#f6ecd3","#f6ecd1","#f6ebcf","#f6ebcd","#f6eacb","#f6eac9","#f6e9c7","#f6e9c5","#f6e8c3","#f5e7c0","#f4e5be","#f3e4bb","#f2e2b8","#f1e1b5","#f1dfb3","#f0deb0","#efdcad","#eedbaa","#edd9a8","#ecd8a5","#ebd6a2","#ead59f","#e9d39d","#e8d29a","#e8d097","#e7cf94","#e6cd92","#e5cc8f","#e4ca8c","#e3c989","#e2c787","#e1c684","#e0c481","#dfc37e","#dec17b","#ddbe78","#dcbc75","#dbb972","#d9b76f","#d8b46c","#d7b169","#d6af65","#d4ac62","#d3aa5f","#d2a75c","#d1a559","#cfa256","#cea053","#cd9d50","#cc9a4c","#ca9849","#c99546","#c89343","#c79040","#c58e3d","#c48b3a","#c38936","#c28633","#c08430","#bf812d","#bd7f2c","#bb7d2a","#b97b29","#b77928","#b57826","#b37625","#b17423","#af7222","#ad7021","#ab6e1f","#a96c1e","#a76a1d","#a5691b","#a3671a","#a16518","#9f6317","#9d6116","#9b5f14","#995d13","#975b12","#955910","#93580f","#91560d","#8f540c","#8d520b","#8b500a","#894f0a","#874e0a","#844c09","#824b09","#804a09","#7e4909","#7c4709","#794608","#774508","#754308","#734208","#714108","#6e4007","#6c3e07","#6a3d07","#683c07","#663a07","#633906","#613806","#5f3606","#5d3506","#5b3406","#583305","#563105","#543005"],c.BuGn=["#f7fcfd","#f6fcfd","#f6fcfd","#f5fbfd","#f5fbfc","#f4fbfc","#f4fbfc","#f3fafc","#f2fafc","#f2fafc","#f1fafc","#f1fafc","#f0f9fb","#f0f9fb","#eff9fb","#eff9fb","#eef8fb","#edf8fb","#edf8fb","#ecf8fb","#ecf8fa","#ebf7fa","#ebf7fa","#eaf7fa","#e9f7fa","#e9f7fa","#e8f6fa","#e8f6fa","#e7f6f9","#e7f6f9","#e6f5f9","#e5f5f9","#e5f5f9","#e4f5f8","#e3f4f8","#e3f4f7","#e2f4f7","#e1f4f6","#e0f3f5","#dff3f5","#dff3f4","#def2f4","#ddf2f3","#dcf2f2","#dbf2f2","#dbf1f1","#daf1f1","#d9f1f0","#d8f0ef","#d8f0ef","#d7f0ee","#d6f0ee","#d5efed","#d4efec","#d4efec","#d3eeeb","#d2eeeb","#d1eeea","#d1eee9","#d0ede9","#cfede8","#ceede8","#cdece7","#cdece6","#ccece6","#caebe5","#c8ebe4","#c7eae3","#c5e9e2","#c4e9e1","#c2e8e0","#c0e7df","#bfe7de","#bde6de","#bce6dd","#bae5dc","#b8e4db","#b7e4da","#b5e3d9","#b4e2d8","#b2e2d7","#b0e1d6","#afe1d5","#ade0d4","#acdfd4","#aadfd3","#a8ded2","#a7ddd1","#a5ddd0","#a4dccf","#a2dcce","#a0dbcd","#9fdacc","#9ddacb","#9cd9ca","#9ad8ca","#98d8c9","#97d7c7","#95d6c6","#94d6c5","#92d5c4","#90d4c3","#8fd4c2","#8dd3c0","#8cd2bf","#8ad2be","#88d1bd","#87d0bc","#85cfbb","#84cfb9","#82ceb8","#80cdb7","#7fcdb6","#7dccb5","#7ccbb4","#7acbb3","#78cab1","#77c9b0","#75c9af","#74c8ae","#72c7ad","#70c6ac","#6fc6aa","#6dc5a9","#6cc4a8","#6ac4a7","#68c3a6","#67c2a5","#65c2a3","#64c1a2","#63c0a0","#62c09f","#61bf9e","#60bf9c","#5ebe9b","#5dbd99","#5cbd98","#5bbc96","#5abb95","#59bb93","#57ba92","#56ba91","#55b98f","#54b88e","#53b88c","#52b78b","#51b689","#4fb688","#4eb586","#4db585","#4cb484","#4bb382","#4ab381","#48b27f","#47b17e","#46b17c","#45b07b","#44af79","#43af78","#41ae77","#40ad75","#3fac74","#3fab72","#3eaa70","#3da96f","#3ca86d","#3ba76c","#3aa66a","#39a569","#38a367","#37a266","#36a164","#35a063","#349f61","#339e60","#329d5e","#319c5c","#309b5b","#2f9a59","#2f9858","#2e9756","#2d9655","#2c9553","#2b9452","#2a9350","#29924f","#28914d","#27904c","#268f4a","#258d48","#248c47","#238b45","#228a44","#218944","#208843","#1f8742","#1e8741","#1d8640","#1c8540","#1a843f","#19833e","#18823d","#17813d","#16803c","#157f3b","#147e3a","#137d39","#127c39","#117b38","#107a37","#0e7936","#0d7836","#0c7735","#0b7734","#0a7633","#097532","#087432","#077331","#067230","#05712f","#03702e","#026f2e","#016e2d","#006d2c","#006c2c","#006b2b","#00692a","#00682a","#006729","#006529","#006428","#006328","#006227","#006027","#005f26","#005e26","#005c25","#005b25","#005a24","#005924","#005723","#005622","#005522","#005321","#005221","#005120","#005020","#004e1f","#004d1f","#004c1e","#004a1e","#00491d","#00481d","#00471c","#00451c","#00441b"],c.BuGn_r=["#00441b","#00451c","#00471c","#00481d","#00491d","#004a1e","#004c1e","#004d1f","#004e1f","#005020","#005120","#005221","#005321","#005522","#005622","#005723","#005924","#005a24","#005b25","#005c25","#005e26","#005f26","#006027","#006227","#006328","#006428","#006529","#006729","#00682a","#00692a","#006b2b","#006c2c","#006d2c","#016e2d","#026f2e","#03702e","#05712f","#067230","#077331","#087432","#097532","#0a7633","#0b7734","#0c7735","#0d7836","#0e7936","#107a37","#117b38","#127c39","#137d39","#147e3a","#157f3b","#16803c","#17813d","#18823d","#19833e","#1a843f","#1c8540","#1d8640","#1e8741","#1f8742","#208843","#218944","#228a44","#238b45","#248c47","#258d48","#268f4a","#27904c","#28914d","#29924f","#2a9350","#2b9452","#2c9553","#2d9655","#2e9756","#2f9858","#2f9a59","#309b5b","#319c5c","#329d5e","#339e60","#349f61","#35a063","#36a164","#37a266","#38a367","#39a569","#3aa66a","#3ba76c","#3ca86d","#3da96f","#3eaa70","#3fab72","#3fac74","#40ad75","#41ae77","#43af78","#44af79","#45b07b","#46b17c","#47b17e","#48b27f","#4ab381","#4bb382","#4cb484","#4db585","#4eb586","#4fb688","#51b689","#52b78b","#53b88c","#54b88e","#55b98f","#56ba91","#57ba92","#59bb93","#5abb95","#5bbc96","#5cbd98","#5dbd99","#5ebe9b","#60bf9c","#61bf9e","#62c09f","#63c0a0","#64c1a2","#65c2a3","#67c2a5","#68c3a6","#6ac4a7","#6cc4a8","#6dc5a9","#6fc6aa","#70c6ac","#72c7ad","#74c8ae","#75c9af","#77c9b0","#78cab1","#7acbb3","#7ccbb4","#7dccb5","#7fcdb6","#80cdb7","#82ceb8","#84cfb9","#85cfbb","#87d0bc","#88d1bd","#8ad2be","#8cd2bf","#8dd3c0","#8fd4c2","#90d4c3","#92d5c4","#94d6c5","#95d6c6","#97d7c7","#98d8c9","#9ad8ca","#9cd9ca","#9ddacb","#9fdacc","#a0dbcd","#a2dcce","#a4dccf","#a5ddd0","#a7ddd1","#a8ded2","#aadfd3","#acdfd4","#ade0d4","#afe1d5","#b0e1d6","#b2e2d7","#b4e2d8","#b5e3d9","#b7e4da","#b8e4db","#bae5dc","#bce6dd","#bde6de","#bfe7de","#c0e7df","#c2e8e0","#c4e9e1","#c5e9e2","#c7eae3","#c8ebe4","#caebe5","#ccece6","#cdece6","#cdece7","#ceede8","#cfede8","#d0ede9","#d1eee9","#d1eeea","#d2eeeb","#d3eeeb","#d4efec","#d4efec","#d5efed","#d6f0ee","#d7f0ee","#d8f0ef","#d8f0ef","#d9f1f0","#daf1f1","#dbf1f1","#dbf2f2","#dcf2f2","#ddf2f3","#def2f4","#dff3f4","#dff3f5","#e0f3f5","#e1f4f6","#e2f4f7","#e3f4f7","#e3f4f8","#e4f5f8","#e5f5f9","#e5f5f9","#e6f5f9","#e7f6f9","#e7f6f9","#e8f6fa","#e8f6fa","#e9f7fa","#e9f7fa","#eaf7fa","#ebf7fa","#ebf7fa","#ecf8fa","#ecf8fb","#edf8fb","#edf8fb","#eef8fb","#eff9fb","#eff9fb","#f0f9fb","#f0f9fb","#f1fafc","#f1fafc","#f2fafc","#f2fafc","#f3fafc","#f4fbfc","#f4fbfc","#f5fbfc","#f5fbfd","#f6fcfd","#f6fcfd","#f7fcfd"],c.BuPu=["#f7fcfd","#f6fbfd","#f6fbfc","#f5fafc","#f4fafc","#f3f9fc","#f3f9fb","#f2f8fb","#f1f8fb","#f1f7fa","#f0f7fa","#eff6fa","#eef6fa","#eef5f9","#edf5f9","#ecf4f9","#ebf4f8","#ebf3f8","#eaf3f8","#e9f2f8","#e9f2f7","#e8f1f7","#e7f1f7","#e6f0f7","#e6f0f6","#e5eff6","#e4eff6","#e4eef5","#e3eef5","#e2edf5","#e1edf5","#e1ecf4","#e0ecf4","#dfebf4","#deeaf3","#ddeaf3","#dce9f2","#dbe8f2","#dae7f1","#d9e6f1","#d8e6f0","#d7e5f0","#d6e4f0","#d4e3ef","#d3e2ef","#d2e2ee","#d1e1ee","#d0e0ed","#cfdfed","#cedfec","#cddeec","#ccddec","#cbdceb","#cadbeb","#c9dbea","#c8daea","#c7d9e9","#c6d8e9","#c5d8e9","#c4d7e8","#c3d6e8","#c2d5e7","#c1d4e7","#c0d4e6","#bfd3e6","#bed2e6","#bdd1e5","#bcd1e5","#bbd0e4","#bacfe4","#b9cee4","#b7cee3","#b6cde3","#b5cce3","#b4cce2","#b3cbe2","#b2cae1","#b1c9e1","#b0c9e1","#afc8e0","#aec7e0","#adc7e0","#acc6df","#abc5df","#aac4de","#a9c4de","#a8c3de","#a7c2dd","#a6c2dd","#a5c1dc","#a4c0dc","#a3bfdc","#a2bfdb","#a1bedb","#a0bddb","#9fbcda","#9ebcda","#9dbad9","#9db9d9","#9cb8d8","#9cb7d7","#9bb6d7","#9ab4d6","#9ab3d5","#99b2d5","#99b1d4","#98b0d3","#98aed3","#97add2","#96acd2","#96abd1","#95aad0","#95a8d0","#94a7cf","#94a6ce","#93a5ce","#92a4cd","#92a3cd","#91a1cc","#91a0cb","#909fcb","#909eca","#8f9dc9","#8f9bc9","#8e9ac8","#8d99c8","#8d98c7","#8c97c6","#8c95c6","#8c94c5","#8c93c4","#8c91c4","#8c90c3","#8c8fc2","#8c8dc2","#8c8cc1","#8c8bc0","#8c89c0","#8c88bf","#8c86be","#8c85be","#8c84bd","#8c82bc","#8c81bc","#8c80bb","#8c7eba","#8c7dba","#8c7cb9","#8c7ab8","#8c79b8","#8c78b7","#8c76b7","#8c75b6","#8c74b5","#8c72b5","#8c71b4","#8c70b3","#8c6eb3","#8c6db2","#8c6cb1","#8c6ab1","#8c69b0","#8c68af","#8c66af","#8b65ae","#8b64ad","#8b62ad","#8b61ac","#8b60ac","#8b5eab","#8b5daa","#8b5caa","#8a5aa9","#8a59a8","#8a58a8","#8a56a7","#8a55a7","#8a54a6","#8a52a5","#8a51a5","#8950a4","#894fa3","#894da3","#894ca2","#894ba2","#8949a1","#8948a0","#8947a0","#88459f","#88449e","#88439e","#88419d","#88409c","#883e9b","#873d9a","#873b99","#873a98","#873897","#873696","#863595","#863394","#863293","#863092","#852f91","#852d90","#852b8f","#852a8e","#85288d","#84278c","#84258b","#84248a","#842289","#832088","#831f86","#831d85","#831c84","#831a83","#821982","#821781","#821580","#82147f","#81127e","#81117d","#810f7c","#800f7b","#7e0e79","#7c0e78","#7b0d76","#790d75","#770c73","#760c71","#740b70","#730b6e","#710a6d","#6f0a6b","#6e096a","#6c0968","#6a0867","#690865","#670864","#650762","#640761","#62065f","#61065d","#5f055c","#5d055a","#5c0459","#5a0457","#580356","#570354","#550253","#540251","#520150","#50014e","#4f004d","#4d004b"],c.BuPu_r=["#4d004b","#4f004d","#50014e","#520150","#540251","#550253","#570354","#580356","#5a0457","#5c0459","#5d055a","#5f055c","#61065d","#62065f","#640761","#650762","#670864","#690865","#6a0867","#6c0968","#6e096a","#6f0a6b","#710a6d","#730b6e","#740b70","#760c71","#770c73","#790d75","#7b0d76","#7c0e78","#7e0e79","#800f7b","#810f7c","#81117d","#81127e","#82147f","#821580","#821781","#821982","#831a83","#831c84","#831d85","#831f86","#832088","#842289","#84248a","#84258b","#84278c","#85288d","#852a8e","#852b8f","#852d90","#852f91","#863092","#863293","#863394","#863595","#873696","#873897","#873a98","#873b99","#873d9a","#883e9b","#88409c","#88419d","#88439e","#88449e","#88459f","#8947a0","#8948a0","#8949a1","#894ba2","#894ca2","#894da3","#894fa3","#8950a4","#8a51a5","#8a52a5","#8a54a6","#8a55a7","#8a56a7","#8a58a8","#8a59a8","#8a5aa9","#8b5caa","#8b5daa","#8b5eab","#8b60ac","#8b61ac","#8b62ad","#8b64ad","#8b65ae","#8c66af","#8c68af","#8c69b0","#8c6ab1","#8c6cb1","#8c6db2","#8c6eb3","#8c70b3","#8c71b4","#8c72b5","#8c74b5","#8c75b6","#8c76b7","#8c78b7","#8c79b8","#8c7ab8","#8c7cb9","#8c7dba","#8c7eba","#8c80bb","#8c81bc","#8c82bc","#8c84bd","#8c85be","#8c86be","#8c88bf","#8c89c0","#8c8bc0","#8c8cc1","#8c8dc2","#8c8fc2","#8c90c3","#8c91c4","#8c93c4","#8c94c5","#8c95c6","#8c97c6","#8d98c7","#8d99c8","#8e9ac8","#8f9bc9","#8f9dc9","#909eca","#909fcb","#91a0cb","#91a1cc","#92a3cd","#92a4cd","#93a5ce","#94a6ce","#94a7cf","#95a8d0","#95aad0","#96abd1","#96acd2","#97add2","#98aed3","#98b0d3","#99b1d4","#99b2d5","#9ab3d5","#9ab4d6","#9bb6d7","#9cb7d7","#9cb8d8","#9db9d9","#9dbad9","#9ebcda","#9fbcda","#a0bddb","#a1bedb","#a2bfdb","#a3bfdc","#a4c0dc","#a5c1dc","#a6c2dd","#a7c2dd","#a8c3de","#a9c4de","#aac4de","#abc5df","#acc6df","#adc7e0","#aec7e0","#afc8e0","#b0c9e1","#b1c9e1","#b2cae1","#b3cbe2","#b4cce2","#b5cce3","#b6cde3","#b7cee3","#b9cee4","#bacfe4","#bbd0e4","#bcd1e5","#bdd1e5","#bed2e6","#bfd3e6","#c0d4e6","#c1d4e7","#c2d5e7","#c3d6e8","#c4d7e8","#c5d8e9","#c6d8e9","#c7d9e9","#c8daea","#c9dbea","#cadbeb","#cbdceb","#ccddec","#cddeec","#cedfec","#cfdfed","#d0e0ed","#d1e1ee","#d2e2ee","#d3e2ef","#d4e3ef","#d6e4f0","#d7e5f0","#d8e6f0","#d9e6f1","#dae7f1","#dbe8f2","#dce9f2","#ddeaf3","#deeaf3","#dfebf4","#e0ecf4","#e1ecf4","#e1edf5","#e2edf5","#e3eef5","#e4eef5","#e4eff6","#e5eff6","#e6f0f6","#e6f0f7","#e7f1f7","#e8f1f7","#e9f2f7","#e9f2f8","#eaf3f8","#ebf3f8","#ebf4f8","#ecf4f9","#edf5f9","#eef5f9","#eef6fa","#eff6fa","#f0f7fa","#f1f7fa","#f1f8fb","#f2f8fb","#f3f9fb","#f3f9fc","#f4fafc","#f5fafc","#f6fbfc","#f6fbfd","#f7fcfd"],c.CMRmap=["#000000","#010104","#020208","#04040c","#050510","#060614","#070718","#08081c","#0a0a20","#0b0b24","#0c0c28","#0d0d2c","#0e0e30","#101034","#111138","#12123c","#131340","#141444","#161648","#17174c","#181850","#191954","#1a1a58","#1c1c5c","#1d1d60","#1e1e64","#1f1f68","#20206c","#222270","#232374","#242478","#25257c","#262680","#282682","#292684","#2a2686","#2b2688","#2c268a","#2e268c","#2f268e","#302690","#312692","#322694","#342696","#352698","#36269a","#37269c","#38269e","#3a26a0","#3b26a2","#3c26a4","#3d26a6","#3e26a8","#4026aa","#4126ac","#4226ae","#4326b0","#4426b2","#4626b4","#4726b6","#4826b8","#4926ba","#4a26bc","#4c26be","#4d26bf","#5027bd","#5227bb","#5428b9","#5728b7","#5928b5","#5c29b3","#5e29b1","#602aaf","#632aad","#652aab","#682ba9","#6a2ba7","#6c2ca5","#6f2ca3","#712ca1","#732d9f","#762d9d","#782e9b","#7b2e99","#7d2e97","#802f95","#822f93","#843091","#87308f","#89308d","#8b318b","#8e3189","#903287","#933285","#953283","#973381","#9a337e","#9d347c","#a13479","#a43476","#a73573","#aa3570","#ad366e","#b1366b","#b43668","#b73765","#ba3762","#bd3860","#c1385d","#c4385a","#c73957","#ca3954","#cd3a52","#d13a4f","#d43a4c","#d73b49","#da3b46","#dd3c44","#e13c41","#e43c3e","#e73d3b","#ea3d38","#ed3e36","#f13e33","#f43e30","#f73f2d","#fa3f2a","#fd4028","#ff4126","#fe4324","#fd4523","#fc4722","#fb4921","#fb4b20","#fa4d1e","#f94f1d","#f8511c","#f7531b","#f7551a","#f65718","#f55917","#f45b16","#f35d15","#f35f14","#f26112","#f16311","#f06510","#ef670f","#ef690e","#ee6b0c","#ed6d0b","#ec6f0a","#eb7109","#eb7308","#ea7506","#e97705","#e87904","#e77b03","#e77d02","#e67f00","#e68100","#e68301","#e68502","#e68703","#e68904","#e68b05","#e68d05","#e68f06","#e69107","#e69308","#e69508","#e69709","#e6990a","#e69b0b","#e69d0c","#e69f0c","#e6a10d","#e6a30e","#e6a50f","#e6a710","#e6a910","#e6ab11","#e6ad12","#e6af13","#e6b114","#e6b314","#e6b515","#e6b716","#e6b917","#e6bb18","#e6bd18","#e6bf19","#e6c01c","#e6c11f","#e6c322","#e6c426","#e6c529","#e6c62c","#e6c72f","#e6c932","#e6ca36","#e6cb39","#e6cc3c","#e6cd3f","#e6cf42","#e6d046","#e6d149","#e6d24c","#e6d34f","#e6d552","#e6d656","#e6d759","#e6d85c","#e6d95f","#e6db62","#e6dc66","#e6dd69","#e6de6c","#e6df6f","#e6e172","#e6e276","#e6e379","#e6e47c","#e6e57f","#e6e683","#e7e787","#e8e88b","#e9e98f","#e9e993","#eaea97","#ebeb9b","#ecec9f","#ededa3","#ededa7","#eeeeab","#efefaf","#f0f0b3","#f1f1b7","#f1f1bb","#f2f2bf","#f3f3c3","#f4f4c7","#f5f5cb","#f5f5cf","#f6f6d3","#f7f7d7","#f8f8db","#f9f9df","#f9f9e3","#fafae7","#fbfbeb","#fcfcef","#fdfdf3","#fdfdf7","#fefefb","#ffffff"],c.CMRmap_r=["#ffffff","#fefefb","#fdfdf7","#fdfdf3","#fcfcef","#fbfbeb","#fafae7","#f9f9e3","#f9f9df","#f8f8db","#f7f7d7","#f6f6d3","#f5f5cf","#f5f5cb","#f4f4c7","#f3f3c3","#f2f2bf","#f1f1bb","#f1f1b7","#f0f0b3","#efefaf","#eeeeab","#ededa7","#ededa3","#ecec9f","#ebeb9b","#eaea97","#e9e993","#e9e98f","#e8e88b","#e7e787","#e6e683","#e6e57f","#e6e47c","#e6e379","#e6e276","#e6e172","#e6df6f","#e6de6c","#e6dd69","#e6dc66","#e6db62","#e6d95f","#e6d85c","#e6d759","#e6d656","#e6d552","#e6d34f","#e6d24c","#e6d149","#e6d046","#e6cf42","#e6cd3f","#e6cc3c","#e6cb39","#e6ca35","#e6c932","#e6c72f","#e6c62c","#e6c529","#e6c425","#e6c322","#e6c11f","#e6c01c","#e6bf19","#e6bd18","#e6bb18","#e6b917","#e6b716","#e6b515","#e6b314","#e6b114","#e6af13","#e6ad12","#e6ab11","#e6a910","#e6a710","#e6a50f","#e6a30e","#e6a10d","#e69f0d","#e69d0c","#e69b0b","#e6990a","#e69709","#e69509","#e69308","#e69107","#e68f06","#e68d05","#e68b05","#e68904","#e68703","#e68502","#e68301","#e68101","#e67f00","#e77d02","#e77b03","#e87904","#e97705","#ea7506","#eb7308","#eb7109","#ec6f0a","#ed6d0b","#ee6b0c","#ef690e","#ef670f","#f06510","#f16311","#f26112","#f35f14","#f35d15","#f45b16","#f55917","#f65718","#f7551a","#f7531b","#f8511c","#f94f1d","#fa4d1e","#fb4b20","#fb4921","#fc4722","#fd4523","#fe4324","#ff4126","#fd4028","#fa3f2a","#f73f2d","#f43e30","#f13e33","#ed3e36","#ea3d38","#e73d3b","#e43c3e","#e13c41","#dd3c44","#da3b46","#d73b49","#d43a4c","#d13a4f","#cd3a52","#ca3954","#c73957","#c4385a","#c1385d","#bd3860","#ba3762","#b73765","#b43668","#b1366b","#ad366e","#aa3570","#a73573","#a43476","#a13479","#9d347c","#9a337e","#983381","#953283","#933285","#903287","#8e3189","#8b318b","#89308d","#87308f","#843091","#822f93","#802f95","#7d2e97","#7b2e99","#782e9b","#762d9d","#742d9f","#712ca1","#6f2ca3","#6c2ca5","#6a2ba7","#682ba9","#652aab","#632aad","#602aaf","#5e29b1","#5b29b3","#5928b5","#5728b7","#5428b9","#5227bb","#5027bd","#4d26bf","#4c26be","#4a26bc","#4926ba","#4826b8","#4726b6","#4626b4","#4426b2","#4326b0","#4226ae","#4126ac","#4026aa","#3e26a8","#3d26a6","#3c26a4","#3b26a2","#3a26a0","#38269e","#37269c","#36269a","#352698","#342696","#322694","#312692","#302690","#2f268e","#2e268c","#2c268a","#2b2688","#2a2686","#292684","#282682","#262680","#25257c","#242478","#232374","#222270","#20206c","#1f1f68","#1e1e64","#1d1d60","#1c1c5c","#1a1a58","#191954","#181850","#17174c","#161648","#141444","#131340","#12123c","#111138","#101034","#0e0e30","#0d0d2c","#0c0c28","#0b0b24","#0a0a20","#08081c","#070718","#060614","#050510","#04040c","#020208","#010104","#000000"],c.Dark2=["#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666"],c.Dark2_r=["#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#666666","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#a6761d","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#e6ab02","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#66a61e","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#e7298a","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#7570b3","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#d95f02","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77","#1b9e77"],c.GnBu=["#f7fcf0","#f6fcef","#f6fbef","#f5fbee","#f4fbed","#f3fbed","#f3faec","#f2faeb","#f1faeb","#f1f9ea","#f0f9e9","#eff9e9","#eef9e8","#eef8e7","#edf8e7","#ecf8e6","#ebf7e5","#ebf7e5","#eaf7e4","#e9f7e3","#e9f6e3","#e8f6e2","#e7f6e2","#e6f6e1","#e6f5e0","#e5f5e0","#e4f5df","#e4f4de","#e3f4de","#e2f4dd","#e1f4dc","#e1f3dc","#e0f3db","#dff3da","#dff2da","#def2d9","#ddf2d8","#ddf2d7","#dcf1d7","#dcf1d6","#dbf1d5","#daf1d5","#daf0d4","#d9f0d3","#d8f0d3","#d8f0d2","#d7efd1","#d7efd1","#d6efd0","#d5efcf","#d5eece","#d4eece","#d3eecd","#d3eecc","#d2edcc","#d1edcb","#d1edca","#d0edca","#d0ecc9","#cfecc8","#ceecc8","#ceecc7","#cdebc6","#ccebc6","#ccebc5","#cbeac4","#c9eac4","#c8eac3","#c7e9c3","#c6e9c2","#c5e8c2","#c4e8c1","#c3e7c1","#c2e7c0","#c0e6c0","#bfe6bf","#bee6bf","#bde5be","#bce5be","#bbe4bd","#bae4bd","#b9e3bc","#b7e3bc","#b6e3bb","#b5e2bb","#b4e2ba","#b3e1ba","#b2e1b9","#b1e0b9","#afe0b8","#aedfb8","#addfb7","#acdfb7","#abdeb6","#aadeb6","#a9ddb5","#a7ddb5","#a6dcb6","#a5dcb6","#a3dbb7","#a2dbb7","#a0dab8","#9fdab8","#9ed9b8","#9cd9b9","#9bd8b9","#99d7ba","#98d7ba","#97d6bb","#95d6bb","#94d5bc","#92d5bc","#91d4bd","#8fd4bd","#8ed3be","#8dd3be","#8bd2bf","#8ad2bf","#88d1c0","#87d1c0","#86d0c0","#84cfc1","#83cfc1","#81cec2","#80cec2","#7fcdc3","#7dcdc3","#7cccc4","#7accc4","#79cbc5","#77cac5","#76c9c6","#75c8c6","#73c8c7","#72c7c7","#70c6c8","#6fc5c8","#6ec5c8","#6cc4c9","#6bc3c9","#69c2ca","#68c1ca","#67c1cb","#65c0cb","#64bfcc","#62becc","#61bdcd","#5fbdcd","#5ebcce","#5dbbce","#5bbacf","#5abacf","#58b9d0","#57b8d0","#56b7d0","#54b6d1","#53b6d1","#51b5d2","#50b4d2","#4fb3d3","#4db2d3","#4cb1d2","#4bb0d1","#4aafd1","#49add0","#48accf","#47abcf","#46aace","#45a8cd","#43a7cd","#42a6cc","#41a5cb","#40a4cb","#3fa2ca","#3ea1c9","#3da0c9","#3c9fc8","#3b9dc7","#3a9cc7","#389bc6","#379ac5","#3699c5","#3597c4","#3496c3","#3395c3","#3294c2","#3192c1","#3091c1","#2f90c0","#2d8fbf","#2c8ebf","#2b8cbe","#2a8bbe","#298abd","#2889bc","#2788bc","#2687bb","#2586bb","#2484ba","#2283ba","#2182b9","#2081b8","#1f80b8","#1e7fb7","#1d7eb7","#1c7cb6","#1b7bb6","#1a7ab5","#1979b5","#1878b4","#1677b3","#1576b3","#1475b2","#1373b2","#1272b1","#1171b1","#1070b0","#0f6faf","#0e6eaf","#0d6dae","#0b6cae","#0a6aad","#0969ad","#0868ac","#0867ab","#0866a9","#0864a8","#0863a7","#0862a5","#0861a4","#085fa3","#085ea1","#085da0","#085c9f","#085a9d","#08599c","#08589b","#085799","#085598","#085497","#085395","#085294","#085093","#084f91","#084e90","#084d8e","#084b8d","#084a8c","#08498a","#084889","#084688","#084586","#084485","#084384","#084182","#084081"],c.GnBu_r=["#084081","#084182","#084384","#084485","#084586","#084688","#084889","#08498a","#084a8c","#084b8d","#084d8e","#084e90","#084f91","#085093","#085294","#085395","#085497","#085598","#085799","#08589b","#08599c","#085a9d","#085c9f","#085da0","#085ea1","#085fa3","#0861a4","#0862a5","#0863a7","#0864a8","#0866a9","#0867ab","#0868ac","#0969ad","#0a6aad","#0b6cae","#0d6dae","#0e6eaf","#0f6faf","#1070b0","#1171b1","#1272b1","#1373b2","#1475b2","#1576b3","#1677b3","#1878b4","#1979b5","#1a7ab5","#1b7bb6","#1c7cb6","#1d7eb7","#1e7fb7","#1f80b8","#2081b8","#2182b9","#2283ba","#2484ba","#2586bb","#2687bb","#2788bc","#2889bc","#298abd","#2a8bbe","#2b8cbe","#2c8ebf","#2d8fbf","#2f90c0","#3091c1","#3192c1","#3294c2","#3395c3","#3496c3","#3597c4","#3699c5","#379ac5","#389bc6","#3a9cc7","#3b9dc7","#3c9fc8","#3da0c9","#3ea1c9","#3fa2ca","#40a4cb","#41a5cb","#42a6cc","#43a7cd","#45a8cd","#46aace","#47abcf","#48accf","#49add0","#4aafd1","#4bb0d1","#4cb1d2","#4db2d3","#4fb3d3","#50b4d2","#51b5d2","#53b6d1","#54b6d1","#56b7d0","#57b8d0","#58b9d0","#5abacf","#5bbacf","#5dbbce","#5ebcce","#5fbdcd","#61bdcd","#62becc","#64bfcc","#65c0cb","#67c1cb","#68c1ca","#69c2ca","#6bc3c9","#6cc4c9","#6ec5c8","#6fc5c8","#70c6c8","#72c7c7","#73c8c7","#75c8c6","#76c9c6","#77cac5","#79cbc5","#7accc4","#7cccc4","#7dcdc3","#7fcdc3","#80cec2","#81cec2","#83cfc1","#84cfc1","#86d0c0","#87d1c0","#88d1c0","#8ad2bf","#8bd2bf","#8dd3be","#8ed3be","#8fd4bd","#91d4bd","#92d5bc","#94d5bc","#95d6bb","#97d6bb","#98d7ba","#99d7ba","#9bd8b9","#9cd9b9","#9ed9b8","#9fdab8","#a0dab8","#a2dbb7","#a3dbb7","#a5dcb6","#a6dcb6","#a7ddb5","#a9ddb5","#aadeb6","#abdeb6","#acdfb7","#addfb7","#aedfb8","#afe0b8","#b1e0b9","#b2e1b9","#b3e1ba","#b4e2ba","#b5e2bb","#b6e3bb","#b7e3bc","#b9e3bc","#bae4bd","#bbe4bd","#bce5be","#bde5be","#bee6bf","#bfe6bf","#c0e6c0","#c2e7c0","#c3e7c1","#c4e8c1","#c5e8c2","#c6e9c2","#c7e9c3","#c8eac3","#c9eac4","#cbeac4","#ccebc5","#ccebc6","#cdebc6","#ceecc7","#ceecc8","#cfecc8","#d0ecc9","#d0edca","#d1edca","#d1edcb","#d2edcc","#d3eecc","#d3eecd","#d4eece","#d5eece","#d5efcf","#d6efd0","#d7efd1","#d7efd1","#d8f0d2","#d8f0d3","#d9f0d3","#daf0d4","#daf1d5","#dbf1d5","#dcf1d6","#dcf1d7","#ddf2d7","#ddf2d8","#def2d9","#dff2da","#dff3da","#e0f3db","#e1f3dc","#e1f4dc","#e2f4dd","#e3f4de","#e4f4de","#e4f5df","#e5f5e0","#e6f5e0","#e6f6e1","#e7f6e2","#e8f6e2","#e9f6e3","#e9f7e3","#eaf7e4","#ebf7e5","#ebf7e5","#ecf8e6","#edf8e7","#eef8e7","#eef9e8","#eff9e9","#f0f9e9","#f1f9ea","#f1faeb","#f2faeb","#f3faec","#f3fbed","#f4fbed","#f5fbee","#f6fbef","#f6fcef","#f7fcf0"],c.Grays=["#ffffff","#ffffff","#fefefe","#fefefe","#fdfdfd","#fdfdfd","#fcfcfc","#fcfcfc","#fbfbfb","#fbfbfb","#fafafa","#fafafa","#f9f9f9","#f9f9f9","#f8f8f8","#f8f8f8","#f7f7f7","#f7f7f7","#f7f7f7","#f6f6f6","#f6f6f6","#f5f5f5","#f5f5f5","#f4f4f4","#f4f4f4","#f3f3f3","#f3f3f3","#f2f2f2","#f2f2f2","#f1f1f1","#f1f1f1","#f0f0f0","#f0f0f0","#efefef","#eeeeee","#eeeeee","#ededed","#ececec","#ececec","#ebebeb","#eaeaea","#e9e9e9","#e9e9e9","#e8e8e8","#e7e7e7","#e7e7e7","#e6e6e6","#e5e5e5","#e4e4e4","#e4e4e4","#e3e3e3","#e2e2e2","#e1e1e1","#e1e1e1","#e0e0e0","#dfdfdf","#dfdfdf","#dedede","#dddddd","#dcdcdc","#dcdcdc","#dbdbdb","#dadada","#dadada","#d9d9d9","#d8d8d8","#d7d7d7","#d6d6d6","#d5d5d5","#d4d4d4","#d4d4d4","#d3d3d3","#d2d2d2","#d1d1d1","#d0d0d0","#cfcfcf","#cecece","#cdcdcd","#cccccc","#cccccc","#cbcbcb","#cacaca","#c9c9c9","#c8c8c8","#c7c7c7","#c6c6c6","#c5c5c5","#c5c5c5","#c4c4c4","#c3c3c3","#c2c2c2","#c1c1c1","#c0c0c0","#bfbfbf","#bebebe","#bebebe","#bdbdbd","#bbbbbb","#bababa","#b9b9b9","#b8b8b8","#b6b6b6","#b5b5b5","#b4b4b4","#b3b3b3","#b2b2b2","#b0b0b0","#afafaf","#aeaeae","#adadad","#ababab","#aaaaaa","#a9a9a9","#a8a8a8","#a7a7a7","#a5a5a5","#a4a4a4","#a3a3a3","#a2a2a2","#a0a0a0","#9f9f9f","#9e9e9e","#9d9d9d","#9c9c9c","#9a9a9a","#999999","#989898","#979797","#959595","#949494","#939393","#929292","#919191","#909090","#8f8f8f","#8e8e8e","#8d8d8d","#8c8c8c","#8a8a8a","#898989","#888888","#878787","#868686","#858585","#848484","#838383","#828282","#818181","#7f7f7f","#7e7e7e","#7d7d7d","#7c7c7c","#7b7b7b","#7a7a7a","#797979","#787878","#777777","#767676","#757575","#737373","#727272","#717171","#707070","#6f6f6f","#6e6e6e","#6d6d6d","#6c6c6c","#6b6b6b","#6a6a6a","#696969","#686868","#676767","#666666","#656565","#646464","#636363","#626262","#616161","#606060","#5f5f5f","#5e5e5e","#5d5d5d","#5c5c5c","#5b5b5b","#5a5a5a","#585858","#575757","#565656","#555555","#545454","#535353","#525252","#515151","#505050","#4e4e4e","#4d4d4d","#4b4b4b","#4a4a4a","#484848","#474747","#464646","#444444","#434343","#414141","#404040","#3f3f3f","#3d3d3d","#3c3c3c","#3a3a3a","#393939","#383838","#363636","#353535","#333333","#323232","#303030","#2f2f2f","#2e2e2e","#2c2c2c","#2b2b2b","#292929","#282828","#272727","#252525","#242424","#232323","#222222","#212121","#1f1f1f","#1e1e1e","#1d1d1d","#1c1c1c","#1b1b1b","#1a1a1a","#181818","#171717","#161616","#151515","#141414","#131313","#111111","#101010","#0f0f0f","#0e0e0e","#0d0d0d","#0c0c0c","#0a0a0a","#090909","#080808","#070707","#060606","#050505","#030303","#020202","#010101","#000000"],c.Greens=["#f7fcf5","#f6fcf4","#f6fcf4","#f5fbf3","#f5fbf2","#f4fbf2","#f4fbf1","#f3faf0","#f2faf0","#f2faef","#f1faee","#f1faee","#f0f9ed","#f0f9ec","#eff9ec","#eff9eb","#eef8ea","#edf8ea","#edf8e9","#ecf8e8","#ecf8e8","#ebf7e7","#ebf7e7","#eaf7e6","#e9f7e5","#e9f7e5","#e8f6e4","#e8f6e3","#e7f6e3","#e7f6e2","#e6f5e1","#e5f5e1","#e5f5e0","#e4f5df","#e3f4de","#e2f4dd","#e1f3dc","#e0f3db","#dff3da","#def2d9","#ddf2d8","#dcf2d7","#dbf1d6","#dbf1d5","#daf0d4","#d9f0d3","#d8f0d2","#d7efd1","#d6efd0","#d5efcf","#d4eece","#d3eecd","#d2edcc","#d1edcb","#d0edca","#cfecc9","#ceecc8","#cdecc7","#ccebc6","#cbebc5","#cbeac4","#caeac3","#c9eac2","#c8e9c1","#c7e9c0","#c6e8bf","#c4e8bd","#c3e7bc","#c2e7bb","#c1e6ba","#c0e6b9","#bee5b8","#bde5b6","#bce4b5","#bbe4b4","#bae3b3","#b8e3b2","#b7e2b1","#b6e2af","#b5e1ae","#b4e1ad","#b2e0ac","#b1e0ab","#b0dfaa","#afdfa8","#aedea7","#acdea6","#abdda5","#aadda4","#a9dca3","#a8dca2","#a7dba0","#a5db9f","#a4da9e","#a3da9d","#a2d99c","#a0d99b","#9fd899","#9ed798","#9cd797","#9bd696","#99d595","#98d594","#97d492","#95d391","#94d390","#92d28f","#91d28e","#90d18d","#8ed08b","#8dd08a","#8bcf89","#8ace88","#88ce87","#87cd86","#86cc85","#84cc83","#83cb82","#81ca81","#80ca80","#7fc97f","#7dc87e","#7cc87c","#7ac77b","#79c67a","#78c679","#76c578","#75c477","#73c476","#72c375","#70c274","#6ec173","#6dc072","#6bc072","#6abf71","#68be70","#66bd6f","#65bd6f","#63bc6e","#62bb6d","#60ba6c","#5eb96b","#5db96b","#5bb86a","#5ab769","#58b668","#56b567","#55b567","#53b466","#52b365","#50b264","#4eb264","#4db163","#4bb062","#4aaf61","#48ae60","#46ae60","#45ad5f","#43ac5e","#42ab5d","#40aa5d","#3fa95c","#3fa85b","#3ea75a","#3da65a","#3ca559","#3ba458","#3aa357","#39a257","#38a156","#37a055","#369f54","#359e53","#349d53","#339c52","#329b51","#319a50","#309950","#2f984f","#2f974e","#2e964d","#2d954d","#2c944c","#2b934b","#2a924a","#29914a","#289049","#278f48","#268e47","#258d47","#248c46","#238b45","#228a44","#218944","#208843","#1f8742","#1e8741","#1d8640","#1c8540","#1a843f","#19833e","#18823d","#17813d","#16803c","#157f3b","#147e3a","#137d39","#127c39","#117b38","#107a37","#0e7936","#0d7836","#0c7735","#0b7734","#0a7633","#097532","#087432","#077331","#067230","#05712f","#03702e","#026f2e","#016e2d","#006d2c","#006c2c","#006b2b","#00692a","#00682a","#006729","#006529","#006428","#006328","#006227","#006027","#005f26","#005e26","#005c25","#005b25","#005a24","#005924","#005723","#005622","#005522","#005321","#005221","#005120","#005020","#004e1f","#004d1f","#004c1e","#004a1e","#00491d","#00481d","#00471c","#00451c","#00441b"],c.Greens_r=["#00441b","#00451c","#00471c","#00481d","#00491d","#004a1e","#004c1e","#004d1f","#004e1f","#005020","#005120","#005221","#005321","#005522","#005622","#005723","#005924","#005a24","#005b25","#005c25","#005e26","#005f26","#006027","#006227","#006328","#006428","#006529","#006729","#00682a","#00692a","#006b2b","#006c2c","#006d2c","#016e2d","#026f2e","#03702e","#05712f","#067230","#077331","#087432","#097532","#0a7633","#0b7734","#0c7735","#0d7836","#0e7936","#107a37","#117b38","#127c39","#137d39","#147e3a","#157f3b","#16803c","#17813d","#18823d","#19833e","#1a843f","#1c8540","#1d8640","#1e8741","#1f8742","#208843","#218944","#228a44","#238b45","#248c46","#258d47","#268e47","#278f48","#289049","#29914a","#2a924a","#2b934b","#2c944c","#2d954d","#2e964d","#2f974e","#2f984f","#309950","#319a50","#329b51","#339c52","#349d53","#359e53","#369f54","#37a055","#38a156","#39a257","#3aa357","#3ba458","#3ca559","#3da65a","#3ea75a","#3fa85b","#3fa95c","#40aa5d","#42ab5d","#43ac5e","#45ad5f","#46ae60","#48ae60","#4aaf61","#4bb062","#4db163","#4eb264","#50b264","#52b365","#53b466","#55b567","#56b567","#58b668","#5ab769","#5bb86a","#5db96b","#5eb96b","#60ba6c","#62bb6d","#63bc6e","#65bd6f","#66bd6f","#68be70","#6abf71","#6bc072","#6dc072","#6ec173","#70c274","#72c375","#73c476","#75c477","#76c578","#78c679","#79c67a","#7ac77b","#7cc87c","#7dc87e","#7fc97f","#80ca80","#81ca81","#83cb82","#84cc83","#86cc85","#87cd86","#88ce87","#8ace88","#8bcf89","#8dd08a","#8ed08b","#90d18d","#91d28e","#92d28f","#94d390","#95d391","#97d492","#98d594","#99d595","#9bd696","#9cd797","#9ed798","#9fd899","#a0d99b","#a2d99c","#a3da9d","#a4da9e","#a5db9f","#a7dba0","#a8dca2","#a9dca3","#aadda4","#abdda5","#acdea6","#aedea7","#afdfa8","#b0dfaa","#b1e0ab","#b2e0ac","#b4e1ad","#b5e1ae","#b6e2af","#b7e2b1","#b8e3b2","#bae3b3","#bbe4b4","#bce4b5","#bde5b6","#bee5b8","#c0e6b9","#c1e6ba","#c2e7bb","#c3e7bc","#c4e8bd","#c6e8bf","#c7e9c0","#c8e9c1","#c9eac2","#caeac3","#cbeac4","#cbebc5","#ccebc6","#cdecc7","#ceecc8","#cfecc9","#d0edca","#d1edcb","#d2edcc","#d3eecd","#d4eece","#d5efcf","#d6efd0","#d7efd1","#d8f0d2","#d9f0d3","#daf0d4","#dbf1d5","#dbf1d6","#dcf2d7","#ddf2d8","#def2d9","#dff3da","#e0f3db","#e1f3dc","#e2f4dd","#e3f4de","#e4f5df","#e5f5e0","#e5f5e1","#e6f5e1","#e7f6e2","#e7f6e3","#e8f6e3","#e8f6e4","#e9f7e5","#e9f7e5","#eaf7e6","#ebf7e7","#ebf7e7","#ecf8e8","#ecf8e8","#edf8e9","#edf8ea","#eef8ea","#eff9eb","#eff9ec","#f0f9ec","#f0f9ed","#f1faee","#f1faee","#f2faef","#f2faf0","#f3faf0","#f4fbf1","#f4fbf2","#f5fbf2","#f5fbf3","#f6fcf4","#f6fcf4","#f7fcf5"],c.Greys=["#ffffff","#ffffff","#fefefe","#fefefe","#fdfdfd","#fdfdfd","#fcfcfc","#fcfcfc","#fbfbfb","#fbfbfb","#fafafa","#fafafa","#f9f9f9","#f9f9f9","#f8f8f8","#f8f8f8","#f7f7f7","#f7f7f7","#f7f7f7","#f6f6f6","#f6f6f6","#f5f5f5","#f5f5f5","#f4f4f4","#f4f4f4","#f3f3f3","#f3f3f3","#f2f2f2","#f2f2f2","#f1f1f1","#f1f1f1","#f0f0f0","#f0f0f0","#efefef","#eeeeee","#eeeeee","#ededed","#ececec","#ececec","#ebebeb","#eaeaea","#e9e9e9","#e9e9e9","#e8e8e8","#e7e7e7","#e7e7e7","#e6e6e6","#e5e5e5","#e4e4e4","#e4e4e4","#e3e3e3","#e2e2e2","#e1e1e1","#e1e1e1","#e0e0e0","#dfdfdf","#dfdfdf","#dedede","#dddddd","#dcdcdc","#dcdcdc","#dbdbdb","#dadada","#dadada","#d9d9d9","#d8d8d8","#d7d7d7","#d6d6d6","#d5d5d5","#d4d4d4","#d4d4d4","#d3d3d3","#d2d2d2","#d1d1d1","#d0d0d0","#cfcfcf","#cecece","#cdcdcd","#cccccc","#cccccc","#cbcbcb","#cacaca","#c9c9c9","#c8c8c8","#c7c7c7","#c6c6c6","#c5c5c5","#c5c5c5","#c4c4c4","#c3c3c3","#c2c2c2","#c1c1c1","#c0c0c0","#bfbfbf","#bebebe","#bebebe","#bdbdbd","#bbbbbb","#bababa","#b9b9b9","#b8b8b8","#b6b6b6","#b5b5b5","#b4b4b4","#b3b3b3","#b2b2b2","#b0b0b0","#afafaf","#aeaeae","#adadad","#ababab","#aaaaaa","#a9a9a9","#a8a8a8","#a7a7a7","#a5a5a5","#a4a4a4","#a3a3a3","#a2a2a2","#a0a0a0","#9f9f9f","#9e9e9e","#9d9d9d","#9c9c9c","#9a9a9a","#999999","#989898","#979797","#959595","#949494","#939393","#929292","#919191","#909090","#8f8f8f","#8e8e8e","#8d8d8d","#8c8c8c","#8a8a8a","#898989","#888888","#878787","#868686","#858585","#848484","#838383","#828282","#818181","#7f7f7f","#7e7e7e","#7d7d7d","#7c7c7c","#7b7b7b","#7a7a7a","#797979","#787878","#777777","#767676","#757575","#737373","#727272","#717171","#707070","#6f6f6f","#6e6e6e","#6d6d6d","#6c6c6c","#6b6b6b","#6a6a6a","#696969","#686868","#676767","#666666","#656565","#646464","#636363","#626262","#616161","#606060","#5f5f5f","#5e5e5e","#5d5d5d","#5c5c5c","#5b5b5b","#5a5a5a","#585858","#575757","#565656","#555555","#545454","#535353","#525252","#515151","#505050","#4e4e4e","#4d4d4d","#4b4b4b","#4a4a4a","#484848","#474747","#464646","#444444","#434343","#414141","#404040","#3f3f3f","#3d3d3d","#3c3c3c","#3a3a3a","#393939","#383838","#363636","#353535","#333333","#323232","#303030","#2f2f2f","#2e2e2e","#2c2c2c","#2b2b2b","#292929","#282828","#272727","#252525","#242424","#232323","#222222","#212121","#1f1f1f","#1e1e1e","#1d1d1d","#1c1c1c","#1b1b1b","#1a1a1a","#181818","#171717","#161616","#151515","#141414","#131313","#111111","#101010","#0f0f0f","#0e0e0e","#0d0d0d","#0c0c0c","#0a0a0a","#090909","#080808","#070707","#060606","#050505","#030303","#020202","#010101","#000000"],c.Greys_r=["#000000","#010101","#020202","#030303","#050505","#060606","#070707","#080808","#090909","#0a0a0a","#0c0c0c","#0d0d0d","#0e0e0e","#0f0f0f","#101010","#111111","#131313","#141414","#151515","#161616","#171717","#181818","#1a1a1a","#1b1b1b","#1c1c1c","#1d1d1d","#1e1e1e","#1f1f1f","#212121","#222222","#232323","#242424","#252525","#272727","#282828","#292929","#2b2b2b","#2c2c2c","#2e2e2e","#2f2f2f","#303030","#323232","#333333","#353535","#363636","#383838","#393939","#3a3a3a","#3c3c3c","#3d3d3d","#3f3f3f","#404040","#414141","#434343","#444444","#464646","#474747","#484848","#4a4a4a","#4b4b4b","#4d4d4d","#4e4e4e","#505050","#515151","#525252","#535353","#545454","#555555","#565656","#575757","#585858","#5a5a5a","#5b5b5b","#5c5c5c","#5d5d5d","#5e5e5e","#5f5f5f","#606060","#616161","#626262","#636363","#646464","#656565","#666666","#676767","#686868","#696969","#6a6a6a","#6b6b6b","#6c6c6c","#6d6d6d","#6e6e6e","#6f6f6f","#707070","#717171","#727272","#737373","#757575","#767676","#777777","#787878","#797979","#7a7a7a","#7b7b7b","#7c7c7c","#7d7d7d","#7e7e7e","#7f7f7f","#818181","#828282","#838383","#848484","#858585","#868686","#878787","#888888","#898989","#8a8a8a","#8c8c8c","#8d8d8d","#8e8e8e","#8f8f8f","#909090","#919191","#929292","#939393","#949494","#959595","#979797","#989898","#999999","#9a9a9a","#9c9c9c","#9d9d9d","#9e9e9e","#9f9f9f","#a0a0a0","#a2a2a2","#a3a3a3","#a4a4a4","#a5a5a5","#a7a7a7","#a8a8a8","#a9a9a9","#aaaaaa","#ababab","#adadad","#aeaeae","#afafaf","#b0b0b0","#b2b2b2","#b3b3b3","#b4b4b4","#b5b5b5","#b6b6b6","#b8b8b8","#b9b9b9","#bababa","#bbbbbb","#bdbdbd","#bebebe","#bebebe","#bfbfbf","#c0c0c0","#c1c1c1","#c2c2c2","#c3c3c3","#c4c4c4","#c5c5c5","#c5c5c5","#c6c6c6","#c7c7c7","#c8c8c8","#c9c9c9","#cacaca","#cbcbcb","#cccccc","#cccccc","#cdcdcd","#cecece","#cfcfcf","#d0d0d0","#d1d1d1","#d2d2d2","#d3d3d3","#d4d4d4","#d4d4d4","#d5d5d5","#d6d6d6","#d7d7d7","#d8d8d8","#d9d9d9","#dadada","#dadada","#dbdbdb","#dcdcdc","#dcdcdc","#dddddd","#dedede","#dfdfdf","#dfdfdf","#e0e0e0","#e1e1e1","#e1e1e1","#e2e2e2","#e3e3e3","#e4e4e4","#e4e4e4","#e5e5e5","#e6e6e6","#e7e7e7","#e7e7e7","#e8e8e8","#e9e9e9","#e9e9e9","#eaeaea","#ebebeb","#ececec","#ececec","#ededed","#eeeeee","#eeeeee","#efefef","#f0f0f0","#f0f0f0","#f1f1f1","#f1f1f1","#f2f2f2","#f2f2f2","#f3f3f3","#f3f3f3","#f4f4f4","#f4f4f4","#f5f5f5","#f5f5f5","#f6f6f6","#f6f6f6","#f7f7f7","#f7f7f7","#f7f7f7","#f8f8f8","#f8f8f8","#f9f9f9","#f9f9f9","#fafafa","#fafafa","#fbfbfb","#fbfbfb","#fcfcfc","#fcfcfc","#fdfdfd","#fdfdfd","#fefefe","#fefefe","#ffffff","#ffffff"],c.OrRd=["#fff7ec","#fff7eb","#fff6ea","#fff6e9","#fff5e7","#fff5e6","#fff4e5","#fff4e4","#fff3e3","#fff3e2","#fff2e1","#fff2e0","#fff1de","#fff1dd","#fff0dc","#fff0db","#feefda","#feefd9","#feefd8","#feeed7","#feeed5","#feedd4","#feedd3","#feecd2","#feecd1","#feebd0","#feebcf","#feeace","#feeacc","#fee9cb","#fee9ca","#fee8c9","#fee8c8","#fee7c7","#fee7c5","#fee6c4","#fee5c3","#fee5c1","#fee4c0","#fee4bf","#fee3bd","#fee2bc","#fee2bb","#fee1b9","#fee0b8","#fee0b7","#fedfb5","#fedfb4","#fddeb3","#fdddb1","#fdddb0","#fddcaf","#fddbad","#fddbac","#fddaab","#fdd9aa","#fdd9a8","#fdd8a7","#fdd8a6","#fdd7a4","#fdd6a3","#fdd6a2","#fdd5a0","#fdd49f","#fdd49e","#fdd39d","#fdd29c","#fdd19b","#fdd19b","#fdd09a","#fdcf99","#fdce98","#fdce97","#fdcd96","#fdcc96","#fdcb95","#fdca94","#fdca93","#fdc992","#fdc892","#fdc791","#fdc690","#fdc68f","#fdc58e","#fdc48d","#fdc38d","#fdc38c","#fdc28b","#fdc18a","#fdc089","#fdbf89","#fdbf88","#fdbe87","#fdbd86","#fdbc85","#fdbb85","#fdba83","#fdb982","#fdb881","#fdb67f","#fdb57e","#fdb37d","#fdb27b","#fdb07a","#fdaf79","#fdad77","#fdac76","#fdab75","#fda973","#fda872","#fda671","#fda56f","#fca36e","#fca26d","#fca06b","#fc9f6a","#fc9e69","#fc9c67","#fc9b66","#fc9964","#fc9863","#fc9662","#fc9560","#fc935f","#fc925e","#fc915c","#fc8f5b","#fc8e5a","#fc8c59","#fb8b58","#fb8a58","#fb8957","#fa8757","#fa8656","#f98556","#f98455","#f98254","#f88154","#f88053","#f77f53","#f77d52","#f67c52","#f67b51","#f67a51","#f57850","#f57750","#f4764f","#f4754f","#f4734e","#f3724e","#f3714d","#f2704c","#f26e4c","#f26d4b","#f16c4b","#f16a4a","#f0694a","#f06849","#f06749","#ef6548","#ef6447","#ee6246","#ed6145","#ec5f43","#ec5d42","#eb5c41","#ea5a3f","#e9583e","#e9573d","#e8553c","#e7533a","#e65239","#e55038","#e54e36","#e44d35","#e34b34","#e24933","#e24831","#e14630","#e0442f","#df432d","#df412c","#de3f2b","#dd3e2a","#dc3c28","#dc3a27","#db3926","#da3724","#d93523","#d93422","#d83221","#d7301f","#d62f1e","#d52d1d","#d42c1c","#d32a1b","#d2291a","#d12719","#cf2618","#ce2417","#cd2316","#cc2116","#cb2015","#ca1e14","#c91d13","#c71b12","#c61a11","#c51810","#c4170f","#c3150e","#c2140d","#c1120c","#c0110b","#be0f0a","#bd0e09","#bc0c08","#bb0b07","#ba0906","#b90805","#b80604","#b70503","#b50302","#b40201","#b30000","#b20000","#b00000","#ae0000","#ad0000","#ab0000","#a90000","#a80000","#a60000","#a50000","#a30000","#a10000","#a00000","#9e0000","#9c0000","#9b0000","#990000","#970000","#960000","#940000","#930000","#910000","#8f0000","#8e0000","#8c0000","#8a0000","#890000","#870000","#860000","#840000","#820000","#810000","#7f0000"],c.OrRd_r=["#7f0000","#810000","#820000","#840000","#860000","#870000","#890000","#8a0000","#8c0000","#8e0000","#8f0000","#910000","#930000","#940000","#960000","#970000","#990000","#9b0000","#9c0000","#9e0000","#a00000","#a10000","#a30000","#a50000","#a60000","#a80000","#a90000","#ab0000","#ad0000","#ae0000","#b00000","#b20000","#b30000","#b40201","#b50302","#b70503","#b80604","#b90805","#ba0906","#bb0b07","#bc0c08","#bd0e09","#be0f0a","#c0110b","#c1120c","#c2140d","#c3150e","#c4170f","#c51810","#c61a11","#c71b12","#c91d13","#ca1e14","#cb2015","#cc2116","#cd2316","#ce2417","#cf2618","#d12719","#d2291a","#d32a1b","#d42c1c","#d52d1d","#d62f1e","#d7301f","#d83221","#d93422","#d93523","#da3724","#db3926","#dc3a27","#dc3c28","#dd3e2a","#de3f2b","#df412c","#df432d","#e0442f","#e14630","#e24831","#e24933","#e34b34","#e44d35","#e54e36","#e55038","#e65239","#e7533a","#e8553c","#e9573d","#e9583e","#ea5a3f","#eb5c41","#ec5d42","#ec5f43","#ed6145","#ee6246","#ef6447","#ef6548","#f06749","#f06849","#f0694a","#f16a4a","#f16c4b","#f26d4b","#f26e4c","#f2704c","#f3714d","#f3724e","#f4734e","#f4754f","#f4764f","#f57750","#f57850","#f67a51","#f67b51","#f67c52","#f77d52","#f77f53","#f88053","#f88154","#f98254","#f98455","#f98556","#fa8656","#fa8757","#fb8957","#fb8a58","#fb8b58","#fc8c59","#fc8e5a","#fc8f5b","#fc915c","#fc925e","#fc935f","#fc9560","#fc9662","#fc9863","#fc9964","#fc9b66","#fc9c67","#fc9e69","#fc9f6a","#fca06b","#fca26d","#fca36e","#fda56f","#fda671","#fda872","#fda973","#fdab75","#fdac76","#fdad77","#fdaf79","#fdb07a","#fdb27b","#fdb37d","#fdb57e","#fdb67f","#fdb881","#fdb982","#fdba83","#fdbb85","#fdbc85","#fdbd86","#fdbe87","#fdbf88","#fdbf89","#fdc089","#fdc18a","#fdc28b","#fdc38c","#fdc38d","#fdc48d","#fdc58e","#fdc68f","#fdc690","#fdc791","#fdc892","#fdc992","#fdca93","#fdca94","#fdcb95","#fdcc96","#fdcd96","#fdce97","#fdce98","#fdcf99","#fdd09a","#fdd19b","#fdd19b","#fdd29c","#fdd39d","#fdd49e","#fdd49f","#fdd5a0","#fdd6a2","#fdd6a3","#fdd7a4","#fdd8a6","#fdd8a7","#fdd9a8","#fdd9aa","#fddaab","#fddbac","#fddbad","#fddcaf","#fdddb0","#fdddb1","#fddeb3","#fedfb4","#fedfb5","#fee0b7","#fee0b8","#fee1b9","#fee2bb","#fee2bc","#fee3bd","#fee4bf","#fee4c0","#fee5c1","#fee5c3","#fee6c4","#fee7c5","#fee7c7","#fee8c8","#fee8c9","#fee9ca","#fee9cb","#feeacc","#feeace","#feebcf","#feebd0","#feecd1","#feecd2","#feedd3","#feedd4","#feeed5","#feeed7","#feefd8","#feefd9","#feefda","#fff0db","#fff0dc","#fff1dd","#fff1de","#fff2e0","#fff2e1","#fff3e2","#fff3e3","#fff4e4","#fff4e5","#fff5e6","#fff5e7","#fff6e9","#fff6ea","#fff7eb","#fff7ec"],c.Oranges=["#fff5eb","#fff5ea","#fff4e9","#fff4e8","#fff3e7","#fff3e6","#fff2e6","#fff2e5","#fff1e4","#fff1e3","#fff0e2","#fff0e1","#ffefe0","#ffefdf","#ffeede","#ffeedd","#feeddc","#feeddc","#feeddb","#feecda","#feecd9","#feebd8","#feebd7","#feead6","#feead5","#fee9d4","#fee9d3","#fee8d2","#fee8d2","#fee7d1","#fee7d0","#fee6cf","#fee6ce","#fee5cc","#fee5cb","#fee4ca","#fee3c8","#fee2c7","#fee2c6","#fee1c4","#fee0c3","#fee0c1","#fedfc0","#fedebf","#fedebd","#feddbc","#fedcbb","#fedcb9","#fddbb8","#fddab6","#fdd9b5","#fdd9b4","#fdd8b2","#fdd7b1","#fdd7af","#fdd6ae","#fdd5ad","#fdd5ab","#fdd4aa","#fdd3a9","#fdd3a7","#fdd2a6","#fdd1a4","#fdd1a3","#fdd0a2","#fdcfa0","#fdce9e","#fdcd9c","#fdcb9b","#fdca99","#fdc997","#fdc895","#fdc794","#fdc692","#fdc590","#fdc48f","#fdc38d","#fdc28b","#fdc189","#fdc088","#fdbf86","#fdbe84","#fdbd83","#fdbb81","#fdba7f","#fdb97d","#fdb87c","#fdb77a","#fdb678","#fdb576","#fdb475","#fdb373","#fdb271","#fdb170","#fdb06e","#fdaf6c","#fdae6a","#fdad69","#fdac67","#fdab66","#fda965","#fda863","#fda762","#fda660","#fda55f","#fda45d","#fda35c","#fda25a","#fda159","#fda057","#fd9f56","#fd9e54","#fd9d53","#fd9c51","#fd9b50","#fd9a4e","#fd994d","#fd984b","#fd974a","#fd9649","#fd9547","#fd9446","#fd9344","#fd9243","#fd9141","#fd9040","#fd8f3e","#fd8e3d","#fd8c3b","#fc8b3a","#fc8a39","#fc8937","#fb8836","#fb8735","#fb8634","#fa8532","#fa8331","#f98230","#f9812e","#f9802d","#f87f2c","#f87e2b","#f87d29","#f77b28","#f77a27","#f67925","#f67824","#f67723","#f57622","#f57520","#f5741f","#f4721e","#f4711c","#f3701b","#f36f1a","#f36e19","#f26d17","#f26c16","#f26b15","#f16913","#f16813","#f06712","#ef6612","#ee6511","#ee6410","#ed6310","#ec620f","#eb610f","#eb600e","#ea5f0e","#e95e0d","#e85d0c","#e75c0c","#e75b0b","#e65a0b","#e5590a","#e4580a","#e45709","#e35608","#e25508","#e15407","#e15307","#e05206","#df5106","#de5005","#de4e05","#dd4d04","#dc4c03","#db4b03","#db4a02","#da4902","#d94801","#d84801","#d64701","#d54601","#d34601","#d14501","#d04501","#ce4401","#cd4401","#cb4302","#c94202","#c84202","#c64102","#c54102","#c34002","#c14002","#c03f02","#be3f02","#bd3e02","#bb3d02","#b93d02","#b83c02","#b63c02","#b53b02","#b33b02","#b13a03","#b03903","#ae3903","#ad3803","#ab3803","#a93703","#a83703","#a63603","#a53603","#a43503","#a23503","#a13403","#a03403","#9f3303","#9e3303","#9c3203","#9b3203","#9a3103","#993103","#973003","#963003","#952f03","#942f03","#932f03","#912e04","#902e04","#8f2d04","#8e2d04","#8c2c04","#8b2c04","#8a2b04","#892b04","#882a04","#862a04","#852904","#842904","#832804","#812804","#802704","#7f2704"],c.Oranges_r=["#7f2704","#802704","#812804","#832804","#842904","#852904","#862a04","#882a04","#892b04","#8a2b04","#8b2c04","#8c2c04","#8e2d04","#8f2d04","#902e04","#912e04","#932f03","#942f03","#952f03","#963003","#973003","#993103","#9a3103","#9b3203","#9c3203","#9e3303","#9f3303","#a03403","#a13403","#a23503","#a43503","#a53603","#a63603","#a83703","#a93703","#ab3803","#ad3803","#ae3903","#b03903","#b13a03","#b33b02","#b53b02","#b63c02","#b83c02","#b93d02","#bb3d02","#bd3e02","#be3f02","#c03f02","#c14002","#c34002","#c54102","#c64102","#c84202","#c94202","#cb4302","#cd4401","#ce4401","#d04501","#d14501","#d34601","#d54601","#d64701","#d84801","#d94801","#da4902","#db4a02","#db4b03","#dc4c03","#dd4d04","#de4e05","#de5005","#df5106","#e05206","#e15307","#e15407","#e25508","#e35608","#e45709","#e4580a","#e5590a","#e65a0b","#e75b0b","#e75c0c","#e85d0c","#e95e0d","#ea5f0e","#eb600e","#eb610f","#ec620f","#ed6310","#ee6410","#ee6511","#ef6612","#f06712","#f16813","#f16913","#f26b15","#f26c16","#f26d17","#f36e19","#f36f1a","#f3701b","#f4711c","#f4721e","#f5741f","#f57520","#f57622","#f67723","#f67824","#f67925","#f77a27","#f77b28","#f87d29","#f87e2b","#f87f2c","#f9802d","#f9812e","#f98230","#fa8331","#fa8532","#fb8634","#fb8735","#fb8836","#fc8937","#fc8a39","#fc8b3a","#fd8c3b","#fd8e3d","#fd8f3e","#fd9040","#fd9141","#fd9243","#fd9344","#fd9446","#fd9547","#fd9649","#fd974a","#fd984b","#fd994d","#fd9a4e","#fd9b50","#fd9c51","#fd9d53","#fd9e54","#fd9f56","#fda057","#fda159","#fda25a","#fda35c","#fda45d","#fda55f","#fda660","#fda762","#fda863","#fda965","#fdab66","#fdac67","#fdad69","#fdae6a","#fdaf6c","#fdb06e","#fdb170","#fdb271","#fdb373","#fdb475","#fdb576","#fdb678","#fdb77a","#fdb87c","#fdb97d","#fdba7f","#fdbb81","#fdbd83","#fdbe84","#fdbf86","#fdc088","#fdc189","#fdc28b","#fdc38d","#fdc48f","#fdc590","#fdc692","#fdc794","#fdc895","#fdc997","#fdca99","#fdcb9b","#fdcd9c","#fdce9e","#fdcfa0","#fdd0a2","#fdd1a3","#fdd1a4","#fdd2a6","#fdd3a7","#fdd3a9","#fdd4aa","#fdd5ab","#fdd5ad","#fdd6ae","#fdd7af","#fdd7b1","#fdd8b2","#fdd9b4","#fdd9b5","#fddab6","#fddbb8","#fedcb9","#fedcbb","#feddbc","#fedebd","#fedebf","#fedfc0","#fee0c1","#fee0c3","#fee1c4","#fee2c6","#fee2c7","#fee3c8","#fee4ca","#fee5cb","#fee5cc","#fee6ce","#fee6cf","#fee7d0","#fee7d1","#fee8d2","#fee8d2","#fee9d3","#fee9d4","#feead5","#feead6","#feebd7","#feebd8","#feecd9","#feecda","#feeddb","#feeddc","#feeddc","#ffeedd","#ffeede","#ffefdf","#ffefe0","#fff0e1","#fff0e2","#fff1e3","#fff1e4","#fff2e5","#fff2e6","#fff3e6","#fff3e7","#fff4e8","#fff4e9","#fff5ea","#fff5eb"],c.PRGn=["#40004b","#42024d","#44034f","#460552","#480754","#4b0856","#4d0a58","#4f0c5a","#510d5d","#530f5f","#551061","#571263","#591465","#5c1568","#5e176a","#60196c","#621a6e","#641c70","#661e73","#681f75","#6a2177","#6c2379","#6f247b","#71267e","#732880","#752982","#772b84","#782e85","#793187","#7b3488","#7c368a","#7e398c","#7f3c8d","#803f8f","#824190","#834492","#844793","#864a95","#874c97","#894f98","#8a529a","#8b559b","#8d579d","#8e5a9e","#8f5da0","#9160a2","#9262a3","#9465a5","#9568a6","#966ba8","#986da9","#9970ab","#9b72ac","#9c74ae","#9e76af","#9f78b1","#a17ab2","#a37cb3","#a47fb5","#a681b6","#a783b8","#a985b9","#ab87bb","#ac89bc","#ae8bbd","#b08dbf","#b18fc0","#b391c2","#b493c3","#b695c4","#b897c6","#b99ac7","#bb9cc9","#bc9eca","#bea0cb","#c0a2cd","#c1a4ce","#c3a6cf","#c4a8d0","#c6aad1","#c7abd2","#c9add3","#caafd4","#cbb1d5","#cdb3d6","#ceb5d7","#d0b7d8","#d1b8d9","#d3bada","#d4bcdb","#d6bedc","#d7c0dd","#d8c2de","#dac3df","#dbc5e0","#ddc7e1","#dec9e2","#e0cbe3","#e1cde4","#e3cee5","#e4d0e6","#e6d2e7","#e7d4e8","#e8d5e9","#e8d7e9","#e9d8ea","#ead9ea","#eadbeb","#ebdcec","#ebdeec","#ecdfed","#ede0ed","#ede2ee","#eee3ee","#efe4ef","#efe6f0","#f0e7f0","#f0e9f1","#f1eaf1","#f2ebf2","#f2edf3","#f3eef3","#f4eff4","#f4f1f4","#f5f2f5","#f5f4f6","#f6f5f6","#f7f6f7","#f6f7f6","#f5f7f5","#f4f6f3","#f3f6f2","#f2f6f1","#f1f5ef","#eff5ee","#eef5ec","#edf5eb","#ecf4ea","#ebf4e8","#e9f4e7","#e8f4e5","#e7f3e4","#e6f3e3","#e5f3e1","#e4f2e0","#e2f2de","#e1f2dd","#e0f2db","#dff1da","#def1d9","#ddf1d7","#dbf1d6","#daf0d4","#d9f0d3","#d7efd1","#d5eecf","#d3eecd","#d1edcb","#cfecc9","#cdebc7","#cbeac5","#c9e9c3","#c7e9c1","#c5e8bf","#c3e7bd","#c1e6bb","#bfe5b9","#bde4b7","#bbe4b5","#b9e3b3","#b7e2b1","#b5e1af","#b3e0ad","#b1e0ab","#afdfa9","#addea7","#abdda5","#a9dca3","#a7dba1","#a5da9f","#a2d89c","#9fd79a","#9cd597","#99d395","#96d192","#93d090","#90ce8d","#8dcc8b","#8aca89","#87c886","#84c784","#81c581","#7ec37f","#7bc17c","#78c07a","#75be77","#72bc75","#6fba72","#6cb970","#69b76d","#66b56b","#63b368","#60b266","#5db063","#5aae61","#58ac5f","#55aa5e","#53a85c","#50a65a","#4ea359","#4ba157","#499f55","#469d54","#449b52","#419951","#3f974f","#3c954d","#3a924c","#37904a","#358e48","#328c47","#308a45","#2e8843","#2b8642","#298440","#26823e","#247f3d","#217d3b","#1f7b39","#1c7938","#1a7736","#197535","#187334","#177133","#166f32","#156d31","#146b30","#13692f","#12672e","#11652d","#10632b","#0f612a","#0e5f29","#0d5c28","#0c5a27","#0b5826","#0a5625","#085424","#075223","#065022","#054e20","#044c1f","#034a1e","#02481d","#01461c","#00441b"],c.PRGn_r=["#00441b","#01461c","#02481d","#034a1e","#044c1f","#054e20","#065022","#075223","#085424","#0a5625","#0b5826","#0c5a27","#0d5c28","#0e5f29","#0f612a","#10632b","#11652d","#12672e","#13692f","#146b30","#156d31","#166f32","#177133","#187334","#197535","#1a7736","#1c7938","#1f7b39","#217d3b","#247f3d","#26823e","#298440","#2b8642","#2e8843","#308a45","#328c47","#358e48","#37904a","#3a924c","#3c954d","#3f974f","#419951","#449b52","#469d54","#499f55","#4ba157","#4ea359","#50a65a","#53a85c","#55aa5e","#58ac5f","#5aae61","#5db063","#60b266","#63b368","#66b56b","#69b76d","#6cb970","#6fba72","#72bc75","#75be77","#78c07a","#7bc17c","#7ec37f","#81c581","#84c784","#87c886","#8aca89","#8dcc8b","#90ce8d","#93d090","#96d192","#99d395","#9cd597","#9fd79a","#a2d89c","#a5da9f","#a7dba1","#a9dca3","#abdda5","#addea7","#afdfa9","#b1e0ab","#b3e0ad","#b5e1af","#b7e2b1","#b9e3b3","#bbe4b5","#bde4b7","#bfe5b9","#c1e6bb","#c3e7bd","#c5e8bf","#c7e9c1","#c9e9c3","#cbeac5","#cdebc7","#cfecc9","#d1edcb","#d3eecd","#d5eecf","#d7efd1","#d9f0d3","#daf0d4","#dbf1d6","#ddf1d7","#def1d9","#dff1da","#e0f2db","#e1f2dd","#e2f2de","#e4f2e0","#e5f3e1","#e6f3e3","#e7f3e4","#e8f4e5","#e9f4e7","#ebf4e8","#ecf4ea","#edf5eb","#eef5ec","#eff5ee","#f1f5ef","#f2f6f1","#f3f6f2","#f4f6f3","#f5f7f5","#f6f7f6","#f7f6f7","#f6f5f6","#f5f4f6","#f5f2f5","#f4f1f4","#f4eff4","#f3eef3","#f2edf3","#f2ebf2","#f1eaf1","#f0e9f1","#f0e7f0","#efe6f0","#efe4ef","#eee3ee","#ede2ee","#ede0ed","#ecdfed","#ebdeec","#ebdcec","#eadbeb","#ead9ea","#e9d8ea","#e8d7e9","#e8d5e9","#e7d4e8","#e6d2e7","#e4d0e6","#e3cee5","#e1cde4","#e0cbe3","#dec9e2","#ddc7e1","#dbc5e0","#dac3df","#d8c2de","#d7c0dd","#d6bedc","#d4bcdb","#d3bada","#d1b8d9","#d0b7d8","#ceb5d7","#cdb3d6","#cbb1d5","#caafd4","#c9add3","#c7abd2","#c6aad1","#c4a8d0","#c3a6cf","#c1a4ce","#c0a2cd","#bea0cb","#bc9eca","#bb9cc9","#b99ac7","#b897c6","#b695c4","#b493c3","#b391c2","#b18fc0","#b08dbf","#ae8bbd","#ac89bc","#ab87bb","#a985b9","#a783b8","#a681b6","#a47fb5","#a37cb3","#a17ab2","#9f78b1","#9e76af","#9c74ae","#9b72ac","#9970ab","#986da9","#966ba8","#9568a6","#9465a5","#9262a3","#9160a2","#8f5da0","#8e5a9e","#8d579d","#8b559b","#8a529a","#894f98","#874c97","#864a95","#844793","#834492","#824190","#803f8f","#7f3c8d","#7e398c","#7c368a","#7b3488","#793187","#782e85","#772b84","#752982","#732880","#71267e","#6f247b","#6c2379","#6a2177","#681f75","#661e73","#641c70","#621a6e","#60196c","#5e176a","#5c1568","#591465","#571263","#551061","#530f5f","#510d5d","#4f0c5a","#4d0a58","#4b0856","#480754","#460552","#44034f","#42024d","#40004b"],c.Paired=["#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928"],c.Paired_r=["#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#b15928","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#ffff99","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#6a3d9a","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#cab2d6","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#fdbf6f","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#e31a1c","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#fb9a99","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#33a02c","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#b2df8a","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#1f78b4","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3","#a6cee3"],c.Pastel1=["#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2"],c.Pastel1_r=["#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#f2f2f2","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#fddaec","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#e5d8bd","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#ffffcc","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#fed9a6","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#decbe4","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#b3cde3","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae","#fbb4ae"],c.Pastel2=["#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc"],c.Pastel2_r=["#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#cccccc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#f1e2cc","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#fff2ae","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#e6f5c9","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#f4cae4","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#cbd5e8","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#fdcdac","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd","#b3e2cd"],c.PiYG=["#8e0152","#900254","#920355","#940457","#970559","#99065a","#9b075c","#9d085e","#9f095f","#a10a61","#a40b63","#a60c65","#a80d66","#aa0e68","#ac0f6a","#ae106b","#b1116d","#b3126f","#b51370","#b71472","#b91574","#bb1675","#bd1777","#c01879","#c2197a","#c41a7c","#c51d7e","#c62080","#c72482","#c82884","#c92b86","#ca2f88","#cb3289","#cc368b","#cd3a8d","#ce3d8f","#cf4191","#d04493","#d14895","#d24c97","#d34f99","#d4539b","#d5579d","#d65a9f","#d75ea1","#d861a2","#d965a4","#da69a6","#db6ca8","#dc70aa","#dd73ac","#de77ae","#df79b0","#df7cb1","#e07eb3","#e181b5","#e283b7","#e286b8","#e388ba","#e48bbc","#e58dbe","#e590bf","#e692c1","#e795c3","#e897c4","#e89ac6","#e99cc8","#ea9fca","#eba1cb","#eba3cd","#eca6cf","#eda8d1","#eeabd2","#eeadd4","#efb0d6","#f0b2d7","#f1b5d9","#f1b7da","#f2b8db","#f2badc","#f3bcdd","#f3bdde","#f4bfdf","#f4c1df","#f5c2e0","#f5c4e1","#f5c6e2","#f6c7e3","#f6c9e3","#f7cbe4","#f7cce5","#f8cee6","#f8d0e7","#f9d1e8","#f9d3e8","#fad4e9","#fad6ea","#fbd8eb","#fbd9ec","#fcdbed","#fcdded","#fddeee","#fde0ef","#fde1ef","#fde2f0","#fce3f0","#fce4f0","#fce5f1","#fce5f1","#fbe6f1","#fbe7f2","#fbe8f2","#fbe9f2","#faeaf2","#faebf3","#faecf3","#faedf3","#f9eef4","#f9eef4","#f9eff4","#f9f0f5","#f9f1f5","#f8f2f5","#f8f3f6","#f8f4f6","#f8f5f6","#f7f6f7","#f7f7f7","#f7f7f6","#f6f7f5","#f5f7f3","#f5f7f2","#f4f7f0","#f3f7ef","#f3f6ed","#f2f6ec","#f1f6ea","#f1f6e8","#f0f6e7","#eff6e5","#eff6e4","#eef6e2","#edf6e1","#edf6df","#ecf6de","#ebf6dc","#ebf6db","#eaf5d9","#e9f5d8","#e9f5d6","#e8f5d5","#e7f5d3","#e7f5d2","#e6f5d0","#e4f4cd","#e2f3ca","#e1f3c7","#dff2c4","#ddf1c1","#dbf0bf","#d9f0bc","#d8efb9","#d6eeb6","#d4edb3","#d2ecb0","#d0ecad","#cfebaa","#cdeaa7","#cbe9a4","#c9e8a2","#c7e89f","#c6e79c","#c4e699","#c2e596","#c0e593","#bee490","#bde38d","#bbe28a","#b9e187","#b7e085","#b5df82","#b2dd7f","#b0dc7d","#aeda7a","#acd977","#a9d874","#a7d672","#a5d56f","#a3d36c","#a1d26a","#9ed067","#9ccf64","#9acd61","#98cc5f","#95cb5c","#93c959","#91c857","#8fc654","#8cc551","#8ac34f","#88c24c","#86c049","#83bf46","#81bd44","#7fbc41","#7dba40","#7bb93e","#79b73d","#77b53c","#75b43b","#73b239","#71b038","#6faf37","#6dad36","#6bac34","#69aa33","#67a832","#66a731","#64a52f","#62a32e","#60a22d","#5ea02c","#5c9e2a","#5a9d29","#589b28","#569927","#549825","#529624","#509423","#4e9322","#4c9121","#4b8f21","#498d20","#488c20","#468a20","#45881f","#43861f","#42841f","#40831e","#3f811e","#3d7f1e","#3c7d1d","#3a7b1d","#397a1d","#37781c","#36761c","#34741c","#33721c","#31711b","#306f1b","#2e6d1b","#2d6b1a","#2b691a","#2a681a","#286619","#276419"],c.PiYG_r=["#276419","#286619","#2a681a","#2b691a","#2d6b1a","#2e6d1b","#306f1b","#31711b","#33721c","#34741c","#36761c","#37781c","#397a1d","#3a7b1d","#3c7d1d","#3d7f1e","#3f811e","#40831e","#42841f","#43861f","#45881f","#468a20","#488c20","#498d20","#4b8f21","#4c9121","#4e9322","#509423","#529624","#549825","#569927","#589b28","#5a9d29","#5c9e2a","#5ea02c","#60a22d","#62a32e","#64a52f","#66a731","#67a832","#69aa33","#6bac34","#6dad36","#6faf37","#71b038","#73b239","#75b43b","#77b53c","#79b73d","#7bb93e","#7dba40","#7fbc41","#81bd44","#83bf46","#86c049","#88c24c","#8ac34f","#8cc551","#8fc654","#91c857","#93c959","#95cb5c","#98cc5f","#9acd61","#9ccf64","#9ed067","#a1d26a","#a3d36c","#a5d56f","#a7d672","#a9d874","#acd977","#aeda7a","#b0dc7d","#b2dd7f","#b5df82","#b7e085","#b9e187","#bbe28a","#bde38d","#bee490","#c0e593","#c2e596","#c4e699","#c6e79c","#c7e89f","#c9e8a2","#cbe9a4","#cdeaa7","#cfebaa","#d0ecad","#d2ecb0","#d4edb3","#d6eeb6","#d8efb9","#d9f0bc","#dbf0bf","#ddf1c1","#dff2c4","#e1f3c7","#e2f3ca","#e4f4cd","#e6f5d0","#e7f5d2","#e7f5d3","#e8f5d5","#e9f5d6","#e9f5d8","#eaf5d9","#ebf6db","#ebf6dc","#ecf6de","#edf6df","#edf6e1","#eef6e2","#eff6e4","#eff6e5","#f0f6e7","#f1f6e8","#f1f6ea","#f2f6ec","#f3f6ed","#f3f7ef","#f4f7f0","#f5f7f2","#f5f7f3","#f6f7f5","#f7f7f6","#f7f7f7","#f7f6f7","#f8f5f6","#f8f4f6","#f8f3f6","#f8f2f5","#f9f1f5","#f9f0f5","#f9eff4","#f9eef4","#f9eef4","#faedf3","#faecf3","#faebf3","#faeaf2","#fbe9f2","#fbe8f2","#fbe7f2","#fbe6f1","#fce5f1","#fce5f1","#fce4f0","#fce3f0","#fde2f0","#fde1ef","#fde0ef","#fddeee","#fcdded","#fcdbed","#fbd9ec","#fbd8eb","#fad6ea","#fad4e9","#f9d3e8","#f9d1e8","#f8d0e7","#f8cee6","#f7cce5","#f7cbe4","#f6c9e3","#f6c7e3","#f5c6e2","#f5c4e1","#f5c2e0","#f4c1df","#f4bfdf","#f3bdde","#f3bcdd","#f2badc","#f2b8db","#f1b7da","#f1b5d9","#f0b2d7","#efb0d6","#eeadd4","#eeabd2","#eda8d1","#eca6cf","#eba3cd","#eba1cb","#ea9fca","#e99cc8","#e89ac6","#e897c4","#e795c3","#e692c1","#e590bf","#e58dbe","#e48bbc","#e388ba","#e286b8","#e283b7","#e181b5","#e07eb3","#df7cb1","#df79b0","#de77ae","#dd73ac","#dc70aa","#db6ca8","#da69a6","#d965a4","#d861a2","#d75ea1","#d65a9f","#d5579d","#d4539b","#d34f99","#d24c97","#d14895","#d04493","#cf4191","#ce3d8f","#cd3a8d","#cc368b","#cb3289","#ca2f88","#c92b86","#c82884","#c72482","#c62080","#c51d7e","#c41a7c","#c2197a","#c01879","#bd1777","#bb1675","#b91574","#b71472","#b51370","#b3126f","#b1116d","#ae106b","#ac0f6a","#aa0e68","#a80d66","#a60c65","#a40b63","#a10a61","#9f095f","#9d085e","#9b075c","#99065a","#970559","#940457","#920355","#900254","#8e0152"],c.PuBu=["#fff7fb","#fef6fb","#fef6fa","#fdf5fa","#fdf5fa","#fcf4fa","#fbf4f9","#fbf3f9","#faf3f9","#faf2f8","#f9f2f8","#f8f1f8","#f8f1f8","#f7f0f7","#f7f0f7","#f6eff7","#f5eff6","#f5eef6","#f4eef6","#f4edf6","#f3edf5","#f2ecf5","#f2ecf5","#f1ebf5","#f1ebf4","#f0eaf4","#f0eaf4","#efe9f3","#eee9f3","#eee8f3","#ede8f3","#ede7f2","#ece7f2","#ebe6f2","#eae6f1","#e9e5f1","#e8e4f0","#e7e3f0","#e7e3f0","#e6e2ef","#e5e1ef","#e4e1ef","#e3e0ee","#e2dfee","#e1dfed","#e0deed","#e0dded","#dfddec","#dedcec","#dddbec","#dcdaeb","#dbdaeb","#dad9ea","#d9d8ea","#d9d8ea","#d8d7e9","#d7d6e9","#d6d6e9","#d5d5e8","#d4d4e8","#d3d4e7","#d2d3e7","#d2d2e7","#d1d2e6","#d0d1e6","#ced0e6","#cdd0e5","#cccfe5","#cacee5","#c9cee4","#c8cde4","#c6cce3","#c5cce3","#c4cbe3","#c2cbe2","#c1cae2","#c0c9e2","#bfc9e1","#bdc8e1","#bcc7e1","#bbc7e0","#b9c6e0","#b8c6e0","#b7c5df","#b5c4df","#b4c4df","#b3c3de","#b1c2de","#b0c2de","#afc1dd","#adc1dd","#acc0dd","#abbfdc","#a9bfdc","#a8bedc","#a7bddb","#a5bddb","#a4bcda","#a2bcda","#a1bbda","#9fbad9","#9ebad9","#9cb9d9","#9ab8d8","#99b8d8","#97b7d7","#96b6d7","#94b6d7","#93b5d6","#91b5d6","#8fb4d6","#8eb3d5","#8cb3d5","#8bb2d4","#89b1d4","#88b1d4","#86b0d3","#84b0d3","#83afd3","#81aed2","#80aed2","#7eadd1","#7dacd1","#7bacd1","#79abd0","#78abd0","#76aad0","#75a9cf","#73a9cf","#71a8ce","#6fa7ce","#6da6cd","#6ba5cd","#69a5cc","#67a4cc","#65a3cb","#63a2cb","#62a2cb","#60a1ca","#5ea0ca","#5c9fc9","#5a9ec9","#589ec8","#569dc8","#549cc7","#529bc7","#509ac6","#4e9ac6","#4c99c5","#4a98c5","#4897c4","#4697c4","#4496c3","#4295c3","#4094c3","#3f93c2","#3d93c2","#3b92c1","#3991c1","#3790c0","#358fc0","#348ebf","#328dbf","#308cbe","#2f8bbe","#2d8abd","#2c89bd","#2a88bc","#2987bc","#2786bb","#2685bb","#2484ba","#2383ba","#2182b9","#2081b9","#1e80b8","#1c7fb8","#1b7eb7","#197db7","#187cb6","#167bb6","#157ab5","#1379b5","#1278b4","#1077b4","#0f76b3","#0d75b3","#0c74b2","#0a73b2","#0872b1","#0771b1","#0570b0","#056faf","#056fae","#056ead","#056dac","#056dab","#056caa","#056ba9","#056ba7","#056aa6","#0569a5","#0569a4","#0568a3","#0567a2","#0567a1","#0566a0","#05659f","#04649e","#04649d","#04639b","#04629a","#046299","#046198","#046097","#046096","#045f95","#045e94","#045e93","#045d92","#045c90","#045b8f","#045b8e","#045a8d","#04598c","#04588a","#045788","#045687","#045585","#045483","#045382","#045280","#03517e","#034f7d","#034e7b","#034d79","#034c78","#034b76","#034a74","#034973","#034871","#03476f","#03466e","#03456c","#03446a","#034369","#034267","#034165","#023f64","#023e62","#023d60","#023c5f","#023b5d","#023a5b","#02395a","#023858"],c.PuBuGn=["#fff7fb","#fef6fb","#fef6fa","#fdf5fa","#fdf4fa","#fcf4f9","#fbf3f9","#fbf2f9","#faf2f8","#faf1f8","#f9f0f8","#f8f0f7","#f8eff7","#f7eef7","#f7eef6","#f6edf6","#f5ecf5","#f5ecf5","#f4ebf5","#f4eaf4","#f3eaf4","#f2e9f4","#f2e9f3","#f1e8f3","#f1e7f3","#f0e7f2","#f0e6f2","#efe5f2","#eee5f1","#eee4f1","#ede3f1","#ede3f0","#ece2f0","#ebe1f0","#eae1ef","#e9e0ef","#e8e0ef","#e7dfee","#e7dfee","#e6deee","#e5deed","#e4dded","#e3dded","#e2dced","#e1dcec","#e0dbec","#e0daec","#dfdaeb","#ded9eb","#ddd9eb","#dcd8ea","#dbd8ea","#dad7ea","#d9d7e9","#d9d6e9","#d8d6e9","#d7d5e8","#d6d5e8","#d5d4e8","#d4d4e7","#d3d3e7","#d2d2e7","#d2d2e7","#d1d1e6","#d0d1e6","#ced0e6","#cdd0e5","#cccfe5","#cacee5","#c9cee4","#c8cde4","#c6cce3","#c5cce3","#c4cbe3","#c2cbe2","#c1cae2","#c0c9e2","#bfc9e1","#bdc8e1","#bcc7e1","#bbc7e0","#b9c6e0","#b8c6e0","#b7c5df","#b5c4df","#b4c4df","#b3c3de","#b1c2de","#b0c2de","#afc1dd","#adc1dd","#acc0dd","#abbfdc","#a9bfdc","#a8bedc","#a7bddb","#a5bddb","#a3bcda","#a1bcda","#9fbbda","#9dbad9","#9bbad9","#99b9d9","#97b8d8","#95b8d8","#93b7d7","#91b6d7","#90b6d7","#8eb5d6","#8cb5d6","#8ab4d6","#88b3d5","#86b3d5","#84b2d4","#82b1d4","#80b1d4","#7eb0d3","#7cb0d3","#7aafd3","#78aed2","#76aed2","#74add1","#72acd1","#70acd1","#6eabd0","#6cabd0","#6aaad0","#68a9cf","#66a9cf","#65a8ce","#63a7ce","#62a6cd","#60a5cd","#5fa5cc","#5da4cc","#5ba3cb","#5aa2cb","#58a2cb","#57a1ca","#55a0ca","#549fc9","#529ec9","#519ec8","#4f9dc8","#4e9cc7","#4c9bc7","#4b9ac6","#499ac6","#4799c5","#4698c5","#4497c4","#4397c4","#4196c3","#4095c3","#3e94c3","#3d93c2","#3b93c2","#3a92c1","#3891c1","#3790c0","#3590bf","#338fbd","#328fbc","#308eba","#2e8eb8","#2d8db6","#2b8db5","#2a8cb3","#288cb1","#268bb0","#258bae","#238bac","#218aab","#208aa9","#1e89a7","#1d89a6","#1b88a4","#1988a2","#1887a0","#16879f","#14869d","#13869b","#11859a","#0f8598","#0e8496","#0c8495","#0b8393","#098391","#078390","#06828e","#04828c","#02818a","#028189","#028087","#027f86","#027f84","#027e83","#027d81","#027d80","#027c7e","#027b7d","#027b7b","#027a79","#027978","#027976","#027875","#027773","#027772","#017670","#01756f","#01756d","#01746c","#01736a","#017369","#017267","#017165","#017164","#017062","#016f61","#016f5f","#016e5e","#016d5c","#016d5b","#016c59","#016b58","#016a57","#016956","#016755","#016654","#016553","#016451","#016350","#01614f","#01604e","#015f4d","#015e4c","#015d4b","#015b4a","#015a49","#015948","#015846","#015745","#015544","#015443","#015342","#015241","#015140","#01503f","#014e3e","#014d3d","#014c3b","#014b3a","#014a39","#014838","#014737","#014636"],c.PuBuGn_r=["#014636","#014737","#014838","#014a39","#014b3a","#014c3b","#014d3d","#014e3e","#01503f","#015140","#015241","#015342","#015443","#015544","#015745","#015846","#015948","#015a49","#015b4a","#015d4b","#015e4c","#015f4d","#01604e","#01614f","#016350","#016451","#016553","#016654","#016755","#016956","#016a57","#016b58","#016c59","#016d5b","#016d5c","#016e5e","#016f5f","#016f61","#017062","#017164","#017165","#017267","#017369","#01736a","#01746c","#01756d","#01756f","#017670","#027772","#027773","#027875","#027976","#027978","#027a79","#027b7b","#027b7d","#027c7e","#027d80","#027d81","#027e83","#027f84","#027f86","#028087","#028189","#02818a","#04828c","#06828e","#078390","#098391","#0b8393","#0c8495","#0e8496","#0f8598","#11859a","#13869b","#14869d","#16879f","#1887a0","#1988a2","#1b88a4","#1d89a6","#1e89a7","#208aa9","#218aab","#238bac","#258bae","#268bb0","#288cb1","#2a8cb3","#2b8db5","#2d8db6","#2e8eb8","#308eba","#328fbc","#338fbd","#3590bf","#3790c0","#3891c1","#3a92c1","#3b93c2","#3d93c2","#3e94c3","#4095c3","#4196c3","#4397c4","#4497c4","#4698c5","#4799c5","#499ac6","#4b9ac6","#4c9bc7","#4e9cc7","#4f9dc8","#519ec8","#529ec9","#549fc9","#55a0ca","#57a1ca","#58a2cb","#5aa2cb","#5ba3cb","#5da4cc","#5fa5cc","#60a5cd","#62a6cd","#63a7ce","#65a8ce","#66a9cf","#68a9cf","#6aaad0","#6cabd0","#6eabd0","#70acd1","#72acd1","#74add1","#76aed2","#78aed2","#7aafd3","#7cb0d3","#7eb0d3","#80b1d4","#82b1d4","#84b2d4","#86b3d5","#88b3d5","#8ab4d6","#8cb5d6","#8eb5d6","#90b6d7","#91b6d7","#93b7d7","#95b8d8","#97b8d8","#99b9d9","#9bbad9","#9dbad9","#9fbbda","#a1bcda","#a3bcda","#a5bddb","#a7bddb","#a8bedc","#a9bfdc","#abbfdc","#acc0dd","#adc1dd","#afc1dd","#b0c2de","#b1c2de","#b3c3de","#b4c4df","#b5c4df","#b7c5df","#b8c6e0","#b9c6e0","#bbc7e0","#bcc7e1","#bdc8e1","#bfc9e1","#c0c9e2","#c1cae2","#c2cbe2","#c4cbe3","#c5cce3","#c6cce3","#c8cde4","#c9cee4","#cacee5","#cccfe5","#cdd0e5","#ced0e6","#d0d1e6","#d1d1e6","#d2d2e7","#d2d2e7","#d3d3e7","#d4d4e7","#d5d4e8","#d6d5e8","#d7d5e8","#d8d6e9","#d9d6e9","#d9d7e9","#dad7ea","#dbd8ea","#dcd8ea","#ddd9eb","#ded9eb","#dfdaeb","#e0daec","#e0dbec","#e1dcec","#e2dced","#e3dded","#e4dded","#e5deed","#e6deee","#e7dfee","#e7dfee","#e8e0ef","#e9e0ef","#eae1ef","#ebe1f0","#ece2f0","#ede3f0","#ede3f1","#eee4f1","#eee5f1","#efe5f2","#f0e6f2","#f0e7f2","#f1e7f3","#f1e8f3","#f2e9f3","#f2e9f4","#f3eaf4","#f4eaf4","#f4ebf5","#f5ecf5","#f5ecf5","#f6edf6","#f7eef6","#f7eef7","#f8eff7","#f8f0f7","#f9f0f8","#faf1f8","#faf2f8","#fbf2f9","#fbf3f9","#fcf4f9","#fdf4fa","#fdf5fa","#fef6fa","#fef6fb","#fff7fb"],c.PuBu_r=["#023858","#02395a","#023a5b","#023b5d","#023c5f","#023d60","#023e62","#023f64","#034165","#034267","#034369","#03446a","#03456c","#03466e","#03476f","#034871","#034973","#034a74","#034b76","#034c78","#034d79","#034e7b","#034f7d","#03517e","#045280","#045382","#045483","#045585","#045687","#045788","#04588a","#04598c","#045a8d","#045b8e","#045b8f","#045c90","#045d92","#045e93","#045e94","#045f95","#046096","#046097","#046198","#046299","#04629a","#04639b","#04649d","#04649e","#05659f","#0566a0","#0567a1","#0567a2","#0568a3","#0569a4","#0569a5","#056aa6","#056ba7","#056ba9","#056caa","#056dab","#056dac","#056ead","#056fae","#056faf","#0570b0","#0771b1","#0872b1","#0a73b2","#0c74b2","#0d75b3","#0f76b3","#1077b4","#1278b4","#1379b5","#157ab5","#167bb6","#187cb6","#197db7","#1b7eb7","#1c7fb8","#1e80b8","#2081b9","#2182b9","#2383ba","#2484ba","#2685bb","#2786bb","#2987bc","#2a88bc","#2c89bd","#2d8abd","#2f8bbe","#308cbe","#328dbf","#348ebf","#358fc0","#3790c0","#3991c1","#3b92c1","#3d93c2","#3f93c2","#4094c3","#4295c3","#4496c3","#4697c4","#4897c4","#4a98c5","#4c99c5","#4e9ac6","#509ac6","#529bc7","#549cc7","#569dc8","#589ec8","#5a9ec9","#5c9fc9","#5ea0ca","#60a1ca","#62a2cb","#63a2cb","#65a3cb","#67a4cc","#69a5cc","#6ba5cd","#6da6cd","#6fa7ce","#71a8ce","#73a9cf","#75a9cf","#76aad0","#78abd0","#79abd0","#7bacd1","#7dacd1","#7eadd1","#80aed2","#81aed2","#83afd3","#84b0d3","#86b0d3","#88b1d4","#89b1d4","#8bb2d4","#8cb3d5","#8eb3d5","#8fb4d6","#91b5d6","#93b5d6","#94b6d7","#96b6d7","#97b7d7","#99b8d8","#9ab8d8","#9cb9d9","#9ebad9","#9fbad9","#a1bbda","#a2bcda","#a4bcda","#a5bddb","#a7bddb","#a8bedc","#a9bfdc","#abbfdc","#acc0dd","#adc1dd","#afc1dd","#b0c2de","#b1c2de","#b3c3de","#b4c4df","#b5c4df","#b7c5df","#b8c6e0","#b9c6e0","#bbc7e0","#bcc7e1","#bdc8e1","#bfc9e1","#c0c9e2","#c1cae2","#c2cbe2","#c4cbe3","#c5cce3","#c6cce3","#c8cde4","#c9cee4","#cacee5","#cccfe5","#cdd0e5","#ced0e6","#d0d1e6","#d1d2e6","#d2d2e7","#d2d3e7","#d3d4e7","#d4d4e8","#d5d5e8","#d6d6e9","#d7d6e9","#d8d7e9","#d9d8ea","#d9d8ea","#dad9ea","#dbdaeb","#dcdaeb","#dddbec","#dedcec","#dfddec","#e0dded","#e0deed","#e1dfed","#e2dfee","#e3e0ee","#e4e1ef","#e5e1ef","#e6e2ef","#e7e3f0","#e7e3f0","#e8e4f0","#e9e5f1","#eae6f1","#ebe6f2","#ece7f2","#ede7f2","#ede8f3","#eee8f3","#eee9f3","#efe9f3","#f0eaf4","#f0eaf4","#f1ebf4","#f1ebf5","#f2ecf5","#f2ecf5","#f3edf5","#f4edf6","#f4eef6","#f5eef6","#f5eff6","#f6eff7","#f7f0f7","#f7f0f7","#f8f1f8","#f8f1f8","#f9f2f8","#faf2f8","#faf3f9","#fbf3f9","#fbf4f9","#fcf4fa","#fdf5fa","#fdf5fa","#fef6fa","#fef6fb","#fff7fb"],c.PuOr=["#7f3b08","#813c08","#833d08","#853e08","#874008","#894108","#8b4208","#8d4307","#8f4407","#914507","#934607","#954807","#974907","#9a4a07","#9c4b07","#9e4c07","#a04d07","#a24e07","#a44f07","#a65107","#a85206","#aa5306","#ac5406","#ae5506","#b05606","#b25706","#b45906","#b65a07","#b75c07","#b95e08","#bb5f08","#bd6109","#be630a","#c0640a","#c2660b","#c4680b","#c6690c","#c76b0c","#c96d0d","#cb6e0d","#cd700e","#ce720f","#d0730f","#d27510","#d47610","#d57811","#d77a11","#d97b12","#db7d12","#dc7f13","#de8013","#e08214","#e18417","#e2861a","#e3881d","#e58a20","#e68d23","#e78f27","#e8912a","#e9932d","#ea9530","#eb9733","#ed9936","#ee9b39","#ef9e3c","#f0a03f","#f1a242","#f2a446","#f3a649","#f4a84c","#f6aa4f","#f7ac52","#f8ae55","#f9b158","#fab35b","#fbb55e","#fcb761","#fdb965","#fdba68","#fdbc6b","#fdbd6e","#fdbf72","#fdc175","#fdc278","#fdc47b","#fdc57f","#fdc782","#fdc885","#fdca88","#fdcc8c","#fecd8f","#fecf92","#fed095","#fed299","#fed39c","#fed59f","#fed7a2","#fed8a6","#fedaa9","#fedbac","#feddaf","#fedeb3","#fee0b6","#fee1b9","#fde2bb","#fde3be","#fde4c0","#fde5c3","#fce5c5","#fce6c8","#fce7ca","#fce8cd","#fbe9cf","#fbead2","#fbebd5","#faecd7","#faedda","#faeedc","#faeedf","#f9efe1","#f9f0e4","#f9f1e6","#f9f2e9","#f8f3ec","#f8f4ee","#f8f5f1","#f7f6f3","#f7f7f6","#f6f6f7","#f5f5f6","#f4f4f6","#f3f3f5","#f2f2f5","#f0f1f4","#eff0f4","#eeeef3","#ededf3","#ebecf3","#eaebf2","#e9eaf2","#e8e9f1","#e7e8f1","#e5e7f0","#e4e5f0","#e3e4ef","#e2e3ef","#e1e2ee","#dfe1ee","#dee0ed","#dddfed","#dcddec","#dadcec","#d9dbeb","#d8daeb","#d7d8ea","#d5d6e9","#d4d4e8","#d2d3e7","#d1d1e6","#cfcfe5","#cecde4","#cccbe3","#cbc9e2","#c9c8e1","#c8c6e0","#c6c4df","#c5c2de","#c3c0dd","#c2bedc","#c0bddb","#bfbbda","#bdb9d9","#bcb7d8","#bab5d7","#b9b3d6","#b7b1d5","#b6b0d4","#b4aed3","#b3acd2","#b1aad1","#afa8d0","#ada6ce","#aba3cd","#a9a1cb","#a79fca","#a59dc8","#a39bc7","#a198c5","#9f96c4","#9d94c2","#9b92c1","#9990bf","#988dbe","#968bbc","#9489bb","#9287b9","#9085b8","#8e82b6","#8c80b5","#8a7eb3","#887cb2","#867ab0","#8477af","#8275ad","#8073ac","#7e70ab","#7d6da9","#7b6aa8","#7967a6","#7764a5","#7661a4","#745ea2","#725ba1","#70589f","#6f559e","#6d529c","#6b4f9b","#6a4c9a","#684998","#664697","#644395","#634094","#613d93","#5f3a91","#5d3790","#5c348e","#5a318d","#582e8c","#572b8a","#552889","#532687","#522584","#502382","#4f2280","#4d207d","#4c1f7b","#4a1d78","#491c76","#471a74","#451871","#44176f","#42156c","#41146a","#3f1268","#3e1165","#3c0f63","#3b0e61","#390c5e","#380b5c","#360959","#350857","#330655","#320552","#300350","#2f024d","#2d004b"],c.PuOr_r=["#2d004b","#2f024d","#300350","#320552","#330655","#350857","#360959","#380b5c","#390c5e","#3b0e61","#3c0f63","#3e1165","#3f1268","#41146a","#42156c","#44176f","#451871","#471a74","#491c76","#4a1d78","#4c1f7b","#4d207d","#4f2280","#502382","#522584","#532687","#552889","#572b8a","#582e8c","#5a318d","#5c348e","#5d3790","#5f3a91","#613d93","#634094","#644395","#664697","#684998","#6a4c9a","#6b4f9b","#6d529c","#6f559e","#70589f","#725ba1","#745ea2","#7661a4","#7764a5","#7967a6","#7b6aa8","#7d6da9","#7e70ab","#8073ac","#8275ad","#8477af","#867ab0","#887cb2","#8a7eb3","#8c80b5","#8e82b6","#9085b8","#9287b9","#9489bb","#968bbc","#988dbe","#9990bf","#9b92c1","#9d94c2","#9f96c4","#a198c5","#a39bc7","#a59dc8","#a79fca","#a9a1cb","#aba3cd","#ada6ce","#afa8d0","#b1aad1","#b3acd2","#b4aed3","#b6b0d4","#b7b1d5","#b9b3d6","#bab5d7","#bcb7d8","#bdb9d9","#bfbbda","#c0bddb","#c2bedc","#c3c0dd","#c5c2de","#c6c4df","#c8c6e0","#c9c8e1","#cbc9e2","#cccbe3","#cecde4","#cfcfe5","#d1d1e6","#d2d3e7","#d4d4e8","#d5d6e9","#d7d8ea","#d8daeb","#d9dbeb","#dadcec","#dcddec","#dddfed","#dee0ed","#dfe1ee","#e1e2ee","#e2e3ef","#e3e4ef","#e4e5f0","#e5e7f0","#e7e8f1","#e8e9f1","#e9eaf2","#eaebf2","#ebecf3","#ededf3","#eeeef3","#eff0f4","#f0f1f4","#f2f2f5","#f3f3f5","#f4f4f6","#f5f5f6","#f6f6f7","#f7f7f6","#f7f6f3","#f8f5f1","#f8f4ee","#f8f3ec","#f9f2e9","#f9f1e6","#f9f0e4","#f9efe1","#faeedf","#faeedc","#faedda","#faecd7","#fbebd5","#fbead2","#fbe9cf","#fce8cd","#fce7ca","#fce6c8","#fce5c5","#fde5c3","#fde4c0","#fde3be","#fde2bb","#fee1b9","#fee0b6","#fedeb3","#feddaf","#fedbac","#fedaa9","#fed8a6","#fed7a2","#fed59f","#fed39c","#fed299","#fed095","#fecf92","#fecd8f","#fdcc8c","#fdca88","#fdc885","#fdc782","#fdc57f","#fdc47b","#fdc278","#fdc175","#fdbf72","#fdbd6e","#fdbc6b","#fdba68","#fdb965","#fcb761","#fbb55e","#fab35b","#f9b158","#f8ae55","#f7ac52","#f6aa4f","#f4a84c","#f3a649","#f2a446","#f1a242","#f0a03f","#ef9e3c","#ee9b39","#ed9936","#eb9733","#ea9530","#e9932d","#e8912a","#e78f27","#e68d23","#e58a20","#e3881d","#e2861a","#e18417","#e08214","#de8013","#dc7f13","#db7d12","#d97b12","#d77a11","#d57811","#d47610","#d27510","#d0730f","#ce720f","#cd700e","#cb6e0d","#c96d0d","#c76b0c","#c6690c","#c4680b","#c2660b","#c0640a","#be630a","#bd6109","#bb5f08","#b95e08","#b75c07","#b65a07","#b45906","#b25706","#b05606","#ae5506","#ac5406","#aa5306","#a85206","#a65107","#a44f07","#a24e07","#a04d07","#9e4c07","#9c4b07","#9a4a07","#974907","#954807","#934607","#914507","#8f4407","#8d4307","#8b4208","#894108","#874008","#853e08","#833d08","#813c08","#7f3b08"],c.PuRd=["#f7f4f9","#f6f3f9","#f6f3f8","#f5f2f8","#f5f2f8","#f4f1f7","#f4f0f7","#f3f0f7","#f3eff6","#f2eff6","#f2eef6","#f1edf6","#f1edf5","#f0ecf5","#f0ecf5","#efebf4","#efeaf4","#eeeaf4","#eee9f3","#ede9f3","#ede8f3","#ece7f2","#ece7f2","#ebe6f2","#ebe6f1","#eae5f1","#eae5f1","#e9e4f1","#e9e3f0","#e8e3f0","#e8e2f0","#e7e2ef","#e7e1ef","#e6e0ee","#e6deee","#e5dded","#e5dcec","#e4dbec","#e3d9eb","#e3d8ea","#e2d7ea","#e2d6e9","#e1d4e8","#e0d3e8","#e0d2e7","#dfd1e6","#dfcfe6","#decee5","#ddcde4","#ddcce4","#dccae3","#dcc9e2","#dbc8e2","#dac6e1","#dac5e0","#d9c4e0","#d9c3df","#d8c1de","#d7c0de","#d7bfdd","#d6bedc","#d6bcdc","#d5bbdb","#d4bada","#d4b9da","#d4b8d9","#d3b6d9","#d3b5d8","#d3b4d7","#d2b3d7","#d2b2d6","#d1b1d6","#d1afd5","#d1aed4","#d0add4","#d0acd3","#d0abd3","#cfaad2","#cfa8d2","#cfa7d1","#cea6d0","#cea5d0","#cea4cf","#cda3cf","#cda1ce","#cda0cd","#cc9fcd","#cc9ecc","#cc9dcc","#cb9ccb","#cb9bca","#cb99ca","#ca98c9","#ca97c9","#ca96c8","#c995c7","#c993c7","#ca92c6","#cb90c5","#cb8fc5","#cc8ec4","#cd8cc3","#cd8bc2","#ce89c2","#cf88c1","#cf86c0","#d085c0","#d183bf","#d282be","#d280bd","#d37fbd","#d47dbc","#d47cbb","#d57aba","#d679ba","#d677b9","#d776b8","#d874b8","#d873b7","#d972b6","#da70b5","#db6fb5","#db6db4","#dc6cb3","#dd6ab3","#dd69b2","#de67b1","#df66b0","#df64af","#df62ae","#e060ad","#e05eac","#e05dab","#e05ba9","#e159a8","#e157a7","#e155a6","#e153a5","#e251a3","#e24fa2","#e24da1","#e24ca0","#e34a9f","#e3489e","#e3469c","#e3449b","#e4429a","#e44099","#e43e98","#e43d96","#e53b95","#e53994","#e53793","#e53592","#e63390","#e6318f","#e62f8e","#e62d8d","#e72c8c","#e72a8a","#e72989","#e62887","#e52786","#e42684","#e32682","#e32581","#e2247f","#e1237e","#e0237c","#df227a","#df2179","#de2177","#dd2075","#dc1f74","#dc1e72","#db1e71","#da1d6f","#d91c6d","#d81c6c","#d81b6a","#d71a68","#d61967","#d51965","#d41863","#d41762","#d31760","#d2165f","#d1155d","#d1145b","#d0145a","#cf1358","#ce1256","#cd1256","#cb1155","#c91054","#c81054","#c60f53","#c40f53","#c30e52","#c10e51","#bf0d51","#bd0c50","#bc0c50","#ba0b4f","#b80b4e","#b70a4e","#b50a4d","#b3094d","#b2094c","#b0084b","#ae074b","#ad074a","#ab064a","#a90649","#a70548","#a60548","#a40447","#a20347","#a10346","#9f0245","#9d0245","#9c0144","#9a0144","#980043","#970042","#950041","#940040","#92003f","#91003d","#8f003c","#8d003b","#8c003a","#8a0039","#890038","#870037","#860036","#840034","#830033","#810032","#800031","#7e0030","#7d002f","#7b002e","#79002d","#78002b","#76002a","#750029","#730028","#720027","#700026","#6f0025","#6d0024","#6c0022","#6a0021","#690020","#67001f"],c.PuRd_r=["#67001f","#690020","#6a0021","#6c0022","#6d0024","#6f0025","#700026","#720027","#730028","#750029","#76002a","#78002b","#79002d","#7b002e","#7d002f","#7e0030","#800031","#810032","#830033","#840034","#860036","#870037","#890038","#8a0039","#8c003a","#8d003b","#8f003c","#91003d","#92003f","#940040","#950041","#970042","#980043","#9a0144","#9c0144","#9d0245","#9f0245","#a10346","#a20347","#a40447","#a60548","#a70548","#a90649","#ab064a","#ad074a","#ae074b","#b0084b","#b2094c","#b3094d","#b50a4d","#b70a4e","#b80b4e","#ba0b4f","#bc0c50","#bd0c50","#bf0d51","#c10e51","#c30e52","#c40f53","#c60f53","#c81054","#c91054","#cb1155","#cd1256","#ce1256","#cf1358","#d0145a","#d1145b","#d1155d","#d2165f","#d31760","#d41762","#d41863","#d51965","#d61967","#d71a68","#d81b6a","#d81c6c","#d91c6d","#da1d6f","#db1e71","#dc1e72","#dc1f74","#dd2075","#de2177","#df2179","#df227a","#e0237c","#e1237e","#e2247f","#e32581","#e32682","#e42684","#e52786","#e62887","#e72989","#e72a8a","#e72c8c","#e62d8d","#e62f8e","#e6318f","#e63390","#e53592","#e53793","#e53994","#e53b95","#e43d96","#e43e98","#e44099","#e4429a","#e3449b","#e3469c","#e3489e","#e34a9f","#e24ca0","#e24da1","#e24fa2","#e251a3","#e153a5","#e155a6","#e157a7","#e159a8","#e05ba9","#e05dab","#e05eac","#e060ad","#df62ae","#df64af","#df66b0","#de67b1","#dd69b2","#dd6ab3","#dc6cb3","#db6db4","#db6fb5","#da70b5","#d972b6","#d873b7","#d874b8","#d776b8","#d677b9","#d679ba","#d57aba","#d47cbb","#d47dbc","#d37fbd","#d280bd","#d282be","#d183bf","#d085c0","#cf86c0","#cf88c1","#ce89c2","#cd8bc2","#cd8cc3","#cc8ec4","#cb8fc5","#cb90c5","#ca92c6","#c993c7","#c995c7","#ca96c8","#ca97c9","#ca98c9","#cb99ca","#cb9bca","#cb9ccb","#cc9dcc","#cc9ecc","#cc9fcd","#cda0cd","#cda1ce","#cda3cf","#cea4cf","#cea5d0","#cea6d0","#cfa7d1","#cfa8d2","#cfaad2","#d0abd3","#d0acd3","#d0add4","#d1aed4","#d1afd5","#d1b1d6","#d2b2d6","#d2b3d7","#d3b4d7","#d3b5d8","#d3b6d9","#d4b8d9","#d4b9da","#d4bada","#d5bbdb","#d6bcdc","#d6bedc","#d7bfdd","#d7c0de","#d8c1de","#d9c3df","#d9c4e0","#dac5e0","#dac6e1","#dbc8e2","#dcc9e2","#dccae3","#ddcce4","#ddcde4","#decee5","#dfcfe6","#dfd1e6","#e0d2e7","#e0d3e8","#e1d4e8","#e2d6e9","#e2d7ea","#e3d8ea","#e3d9eb","#e4dbec","#e5dcec","#e5dded","#e6deee","#e6e0ee","#e7e1ef","#e7e2ef","#e8e2f0","#e8e3f0","#e9e3f0","#e9e4f1","#eae5f1","#eae5f1","#ebe6f1","#ebe6f2","#ece7f2","#ece7f2","#ede8f3","#ede9f3","#eee9f3","#eeeaf4","#efeaf4","#efebf4","#f0ecf5","#f0ecf5","#f1edf5","#f1edf6","#f2eef6","#f2eff6","#f3eff6","#f3f0f7","#f4f0f7","#f4f1f7","#f5f2f8","#f5f2f8","#f6f3f8","#f6f3f9","#f7f4f9"],c.Purples=["#fcfbfd","#fcfbfd","#fbfafc","#fbfafc","#faf9fc","#faf9fc","#faf8fb","#f9f8fb","#f9f7fb","#f8f7fb","#f8f7fa","#f8f6fa","#f7f6fa","#f7f5fa","#f6f5f9","#f6f4f9","#f5f4f9","#f5f4f9","#f5f3f8","#f4f3f8","#f4f2f8","#f3f2f8","#f3f1f7","#f3f1f7","#f2f0f7","#f2f0f7","#f1f0f6","#f1eff6","#f1eff6","#f0eef6","#f0eef5","#efedf5","#efedf5","#eeecf5","#eeecf4","#edebf4","#ecebf4","#eceaf3","#ebe9f3","#eae9f3","#eae8f2","#e9e8f2","#e8e7f2","#e8e6f2","#e7e6f1","#e6e5f1","#e6e5f1","#e5e4f0","#e4e3f0","#e4e3f0","#e3e2ef","#e2e2ef","#e2e1ef","#e1e0ee","#e0e0ee","#e0dfee","#dfdfed","#dedeed","#dedded","#ddddec","#dcdcec","#dcdcec","#dbdbec","#dadaeb","#dadaeb","#d9d9ea","#d8d8ea","#d7d7e9","#d6d6e9","#d5d5e9","#d4d4e8","#d3d3e8","#d2d2e7","#d1d2e7","#d0d1e6","#cfd0e6","#cecfe5","#cecee5","#cdcde4","#cccce4","#cbcbe3","#cacae3","#c9c9e2","#c8c8e2","#c7c8e1","#c6c7e1","#c5c6e1","#c4c5e0","#c3c4e0","#c2c3df","#c1c2df","#c0c1de","#bfc0de","#bebfdd","#bebedd","#bdbedc","#bcbddc","#bbbbdb","#babadb","#b9b9da","#b8b8d9","#b7b7d9","#b6b6d8","#b5b5d7","#b4b4d7","#b3b3d6","#b2b2d5","#b1b1d5","#b0afd4","#afaed4","#aeadd3","#aeacd2","#adabd2","#acaad1","#aba9d0","#aaa8d0","#a9a7cf","#a8a6cf","#a7a4ce","#a6a3cd","#a5a2cd","#a4a1cc","#a3a0cb","#a29fcb","#a19eca","#a09dca","#9f9cc9","#9e9bc8","#9e9ac8","#9d99c7","#9c98c7","#9b97c6","#9a96c6","#9995c6","#9894c5","#9793c5","#9692c4","#9591c4","#9490c3","#9390c3","#928fc3","#918ec2","#908dc2","#8f8cc1","#8e8bc1","#8e8ac0","#8d89c0","#8c88bf","#8b87bf","#8a86bf","#8986be","#8885be","#8784bd","#8683bd","#8582bc","#8481bc","#8380bb","#827fbb","#817ebb","#807dba","#807cba","#7f7bb9","#7e79b8","#7d78b7","#7d77b7","#7c75b6","#7b74b5","#7b72b4","#7a71b4","#7970b3","#796eb2","#786db2","#776cb1","#776ab0","#7669af","#7567af","#7566ae","#7465ad","#7363ad","#7262ac","#7261ab","#715faa","#705eaa","#705ca9","#6f5ba8","#6e5aa8","#6e58a7","#6d57a6","#6c55a5","#6c54a5","#6b53a4","#6a51a3","#6950a3","#694fa2","#684da1","#674ca1","#674ba0","#66499f","#65489f","#65479e","#64459e","#63449d","#63439c","#62429c","#61409b","#613f9a","#603e9a","#5f3c99","#5e3b98","#5e3a98","#5d3897","#5c3797","#5c3696","#5b3495","#5a3395","#5a3294","#593093","#582f93","#582e92","#572c92","#562b91","#552a90","#552890","#54278f","#53268f","#53258e","#52238d","#51228d","#51218c","#50208c","#4f1f8b","#4f1d8b","#4e1c8a","#4d1b89","#4d1a89","#4c1888","#4c1788","#4b1687","#4a1587","#4a1486","#491285","#481185","#481084","#470f84","#460d83","#460c83","#450b82","#440a82","#440981","#430780","#420680","#42057f","#41047f","#40027e","#40017e","#3f007d"],c.Purples_r=["#3f007d","#40017e","#40027e","#41047f","#42057f","#420680","#430780","#440981","#440a82","#450b82","#460c83","#460d83","#470f84","#481084","#481185","#491285","#4a1486","#4a1587","#4b1687","#4c1788","#4c1888","#4d1a89","#4d1b89","#4e1c8a","#4f1d8b","#4f1f8b","#50208c","#51218c","#51228d","#52238d","#53258e","#53268f","#54278f","#552890","#552a90","#562b91","#572c92","#582e92","#582f93","#593093","#5a3294","#5a3395","#5b3495","#5c3696","#5c3797","#5d3897","#5e3a98","#5e3b98","#5f3c99","#603e9a","#613f9a","#61409b","#62429c","#63439c","#63449d","#64459e","#65479e","#65489f","#66499f","#674ba0","#674ca1","#684da1","#694fa2","#6950a3","#6a51a3","#6b53a4","#6c54a5","#6c55a5","#6d57a6","#6e58a7","#6e5aa8","#6f5ba8","#705ca9","#705eaa","#715faa","#7261ab","#7262ac","#7363ad","#7465ad","#7566ae","#7567af","#7669af","#776ab0","#776cb1","#786db2","#796eb2","#7970b3","#7a71b4","#7b72b4","#7b74b5","#7c75b6","#7d77b7","#7d78b7","#7e79b8","#7f7bb9","#807cba","#807dba","#817ebb","#827fbb","#8380bb","#8481bc","#8582bc","#8683bd","#8784bd","#8885be","#8986be","#8a86bf","#8b87bf","#8c88bf","#8d89c0","#8e8ac0","#8e8bc1","#8f8cc1","#908dc2","#918ec2","#928fc3","#9390c3","#9490c3","#9591c4","#9692c4","#9793c5","#9894c5","#9995c6","#9a96c6","#9b97c6","#9c98c7","#9d99c7","#9e9ac8","#9e9bc8","#9f9cc9","#a09dca","#a19eca","#a29fcb","#a3a0cb","#a4a1cc","#a5a2cd","#a6a3cd","#a7a4ce","#a8a6cf","#a9a7cf","#aaa8d0","#aba9d0","#acaad1","#adabd2","#aeacd2","#aeadd3","#afaed4","#b0afd4","#b1b1d5","#b2b2d5","#b3b3d6","#b4b4d7","#b5b5d7","#b6b6d8","#b7b7d9","#b8b8d9","#b9b9da","#babadb","#bbbbdb","#bcbddc","#bdbedc","#bebedd","#bebfdd","#bfc0de","#c0c1de","#c1c2df","#c2c3df","#c3c4e0","#c4c5e0","#c5c6e1","#c6c7e1","#c7c8e1","#c8c8e2","#c9c9e2","#cacae3","#cbcbe3","#cccce4","#cdcde4","#cecee5","#cecfe5","#cfd0e6","#d0d1e6","#d1d2e7","#d2d2e7","#d3d3e8","#d4d4e8","#d5d5e9","#d6d6e9","#d7d7e9","#d8d8ea","#d9d9ea","#dadaeb","#dadaeb","#dbdbec","#dcdcec","#dcdcec","#ddddec","#dedded","#dedeed","#dfdfed","#e0dfee","#e0e0ee","#e1e0ee","#e2e1ef","#e2e2ef","#e3e2ef","#e4e3f0","#e4e3f0","#e5e4f0","#e6e5f1","#e6e5f1","#e7e6f1","#e8e6f2","#e8e7f2","#e9e8f2","#eae8f2","#eae9f3","#ebe9f3","#eceaf3","#ecebf4","#edebf4","#eeecf4","#eeecf5","#efedf5","#efedf5","#f0eef5","#f0eef6","#f1eff6","#f1eff6","#f1f0f6","#f2f0f7","#f2f0f7","#f3f1f7","#f3f1f7","#f3f2f8","#f4f2f8","#f4f3f8","#f5f3f8","#f5f4f9","#f5f4f9","#f6f4f9","#f6f5f9","#f7f5fa","#f7f6fa","#f8f6fa","#f8f7fa","#f8f7fb","#f9f7fb","#f9f8fb","#faf8fb","#faf9fc","#faf9fc","#fbfafc","#fbfafc","#fcfbfd","#fcfbfd"],c.RdBu=["#67001f","#6a011f","#6d0220","#700320","#730421","#760521","#790622","#7c0722","#7f0823","#810823","#840924","#870a24","#8a0b25","#8d0c25","#900d26","#930e26","#960f27","#991027","#9c1127","#9f1228","#a21328","#a51429","#a81529","#ab162a","#ae172a","#b1182b","#b3192c","#b41c2d","#b61f2e","#b72230","#b82531","#ba2832","#bb2a34","#bd2d35","#be3036","#bf3338","#c13639","#c2383a","#c43b3c","#c53e3d","#c6413e","#c84440","#c94741","#cb4942","#cc4c44","#ce4f45","#cf5246","#d05548","#d25849","#d35a4a","#d55d4c","#d6604d","#d7634f","#d86551","#da6853","#db6b55","#dc6e57","#dd7059","#de735c","#df765e","#e17860","#e27b62","#e37e64","#e48066","#e58368","#e6866a","#e8896c","#e98b6e","#ea8e70","#eb9172","#ec9374","#ee9677","#ef9979","#f09c7b","#f19e7d","#f2a17f","#f3a481","#f4a683","#f5a886","#f5aa89","#f5ac8b","#f6af8e","#f6b191","#f6b394","#f7b596","#f7b799","#f7b99c","#f8bb9e","#f8bda1","#f8bfa4","#f9c2a7","#f9c4a9","#f9c6ac","#fac8af","#facab1","#fbccb4","#fbceb7","#fbd0b9","#fcd3bc","#fcd5bf","#fcd7c2","#fdd9c4","#fddbc7","#fddcc9","#fdddcb","#fcdecd","#fcdfcf","#fce0d0","#fce2d2","#fbe3d4","#fbe4d6","#fbe5d8","#fbe6da","#fae7dc","#fae8de","#fae9df","#faeae1","#f9ebe3","#f9ede5","#f9eee7","#f9efe9","#f9f0eb","#f8f1ed","#f8f2ef","#f8f3f0","#f8f4f2","#f7f5f4","#f7f6f6","#f6f7f7","#f5f6f7","#f3f5f6","#f2f5f6","#f0f4f6","#eff3f5","#edf2f5","#ecf2f5","#eaf1f5","#e9f0f4","#e7f0f4","#e6eff4","#e4eef4","#e3edf3","#e1edf3","#e0ecf3","#deebf2","#ddebf2","#dbeaf2","#dae9f2","#d8e9f1","#d7e8f1","#d5e7f1","#d4e6f1","#d2e6f0","#d1e5f0","#cfe4ef","#cce2ef","#cae1ee","#c7e0ed","#c5dfec","#c2ddec","#c0dceb","#bddbea","#bbdaea","#b8d8e9","#b6d7e8","#b3d6e8","#b1d5e7","#aed3e6","#acd2e5","#a9d1e5","#a7d0e4","#a5cee3","#a2cde3","#a0cce2","#9dcbe1","#9bc9e0","#98c8e0","#96c7df","#93c6de","#90c4dd","#8dc2dc","#8ac0db","#87beda","#84bcd9","#81bad8","#7eb8d7","#7bb6d6","#78b4d5","#75b2d4","#71b0d3","#6eaed2","#6bacd1","#68abd0","#65a9cf","#62a7ce","#5fa5cd","#5ca3cb","#59a1ca","#569fc9","#529dc8","#4f9bc7","#4c99c6","#4997c5","#4695c4","#4393c3","#4291c2","#408fc1","#3f8ec0","#3e8cbf","#3c8abe","#3b88be","#3a87bd","#3885bc","#3783bb","#3681ba","#3480b9","#337eb8","#327cb7","#307ab6","#2f79b5","#2e77b5","#2c75b4","#2b73b3","#2a71b2","#2870b1","#276eb0","#266caf","#246aae","#2369ad","#2267ac","#2065ab","#1f63a8","#1e61a5","#1d5fa2","#1c5c9f","#1b5a9c","#1a5899","#195696","#185493","#175290","#15508d","#144e8a","#134c87","#124984","#114781","#10457e","#0f437b","#0e4179","#0d3f76","#0c3d73","#0a3b70","#09386d","#08366a","#073467","#063264","#053061"],c.RdBu_r=["#053061","#063264","#073467","#08366a","#09386d","#0a3b70","#0c3d73","#0d3f76","#0e4179","#0f437b","#10457e","#114781","#124984","#134c87","#144e8a","#15508d","#175290","#185493","#195696","#1a5899","#1b5a9c","#1c5c9f","#1d5fa2","#1e61a5","#1f63a8","#2065ab","#2267ac","#2369ad","#246aae","#266caf","#276eb0","#2870b1","#2a71b2","#2b73b3","#2c75b4","#2e77b5","#2f79b5","#307ab6","#327cb7","#337eb8","#3480b9","#3681ba","#3783bb","#3885bc","#3a87bd","#3b88be","#3c8abe","#3e8cbf","#3f8ec0","#408fc1","#4291c2","#4393c3","#4695c4","#4997c5","#4c99c6","#4f9bc7","#529dc8","#569fc9","#59a1ca","#5ca3cb","#5fa5cd","#62a7ce","#65a9cf","#68abd0","#6bacd1","#6eaed2","#71b0d3","#75b2d4","#78b4d5","#7bb6d6","#7eb8d7","#81bad8","#84bcd9","#87beda","#8ac0db","#8dc2dc","#90c4dd","#93c6de","#96c7df","#98c8e0","#9bc9e0","#9dcbe1","#a0cce2","#a2cde3","#a5cee3","#a7d0e4","#a9d1e5","#acd2e5","#aed3e6","#b1d5e7","#b3d6e8","#b6d7e8","#b8d8e9","#bbdaea","#bddbea","#c0dceb","#c2ddec","#c5dfec","#c7e0ed","#cae1ee","#cce2ef","#cfe4ef","#d1e5f0","#d2e6f0","#d4e6f1","#d5e7f1","#d7e8f1","#d8e9f1","#dae9f2","#dbeaf2","#ddebf2","#deebf2","#e0ecf3","#e1edf3","#e3edf3","#e4eef4","#e6eff4","#e7f0f4","#e9f0f4","#eaf1f5","#ecf2f5","#edf2f5","#eff3f5","#f0f4f6","#f2f5f6","#f3f5f6","#f5f6f7","#f6f7f7","#f7f6f6","#f7f5f4","#f8f4f2","#f8f3f0","#f8f2ef","#f8f1ed","#f9f0eb","#f9efe9","#f9eee7","#f9ede5","#f9ebe3","#faeae1","#fae9df","#fae8de","#fae7dc","#fbe6da","#fbe5d8","#fbe4d6","#fbe3d4","#fce2d2","#fce0d0","#fcdfcf","#fcdecd","#fdddcb","#fddcc9","#fddbc7","#fdd9c4","#fcd7c2","#fcd5bf","#fcd3bc","#fbd0b9","#fbceb7","#fbccb4","#facab1","#fac8af","#f9c6ac","#f9c4a9","#f9c2a7","#f8bfa4","#f8bda1","#f8bb9e","#f7b99c","#f7b799","#f7b596","#f6b394","#f6b191","#f6af8e","#f5ac8b","#f5aa89","#f5a886","#f4a683","#f3a481","#f2a17f","#f19e7d","#f09c7b","#ef9979","#ee9677","#ec9374","#eb9172","#ea8e70","#e98b6e","#e8896c","#e6866a","#e58368","#e48066","#e37e64","#e27b62","#e17860","#df765e","#de735c","#dd7059","#dc6e57","#db6b55","#da6853","#d86551","#d7634f","#d6604d","#d55d4c","#d35a4a","#d25849","#d05548","#cf5246","#ce4f45","#cc4c44","#cb4942","#c94741","#c84440","#c6413e","#c53e3d","#c43b3c","#c2383a","#c13639","#bf3338","#be3036","#bd2d35","#bb2a34","#ba2832","#b82531","#b72230","#b61f2e","#b41c2d","#b3192c","#b1182b","#ae172a","#ab162a","#a81529","#a51429","#a21328","#9f1228","#9c1127","#991027","#960f27","#930e26","#900d26","#8d0c25","#8a0b25","#870a24","#840924","#810823","#7f0823","#7c0722","#790622","#760521","#730421","#700320","#6d0220","#6a011f","#67001f"],c.RdGy=["#67001f","#6a011f","#6d0220","#700320","#730421","#760521","#790622","#7c0722","#7f0823","#810823","#840924","#870a24","#8a0b25","#8d0c25","#900d26","#930e26","#960f27","#991027","#9c1127","#9f1228","#a21328","#a51429","#a81529","#ab162a","#ae172a","#b1182b","#b3192c","#b41c2d","#b61f2e","#b72230","#b82531","#ba2832","#bb2a34","#bd2d35","#be3036","#bf3338","#c13639","#c2383a","#c43b3c","#c53e3d","#c6413e","#c84440","#c94741","#cb4942","#cc4c44","#ce4f45","#cf5246","#d05548","#d25849","#d35a4a","#d55d4c","#d6604d","#d7634f","#d86551","#da6853","#db6b55","#dc6e57","#dd7059","#de735c","#df765e","#e17860","#e27b62","#e37e64","#e48066","#e58368","#e6866a","#e8896c","#e98b6e","#ea8e70","#eb9172","#ec9374","#ee9677","#ef9979","#f09c7b","#f19e7d","#f2a17f","#f3a481","#f4a683","#f5a886","#f5aa89","#f5ac8b","#f6af8e","#f6b191","#f6b394","#f7b596","#f7b799","#f7b99c","#f8bb9e","#f8bda1","#f8bfa4","#f9c2a7","#f9c4a9","#f9c6ac","#fac8af","#facab1","#fbccb4","#fbceb7","#fbd0b9","#fcd3bc","#fcd5bf","#fcd7c2","#fdd9c4","#fddbc7","#fddcc9","#fddecb","#fddfce","#fde1d0","#fde2d2","#fde3d4","#fee5d6","#fee6d9","#fee8db","#fee9dd","#feebdf","#feece1","#feede4","#feefe6","#fef0e8","#fef2ea","#fef3ec","#fef4ef","#fef6f1","#fff7f3","#fff9f5","#fffaf7","#fffbfa","#fffdfc","#fffefe","#fefefe","#fdfdfd","#fcfcfc","#fbfbfb","#fafafa","#f8f8f8","#f7f7f7","#f6f6f6","#f5f5f5","#f3f3f3","#f2f2f2","#f1f1f1","#f0f0f0","#efefef","#ededed","#ececec","#ebebeb","#eaeaea","#e9e9e9","#e7e7e7","#e6e6e6","#e5e5e5","#e4e4e4","#e2e2e2","#e1e1e1","#e0e0e0","#dfdfdf","#dddddd","#dcdcdc","#dadada","#d9d9d9","#d7d7d7","#d6d6d6","#d4d4d4","#d3d3d3","#d1d1d1","#d0d0d0","#cecece","#cdcdcd","#cbcbcb","#cacaca","#c8c8c8","#c7c7c7","#c5c5c5","#c4c4c4","#c2c2c2","#c1c1c1","#bfbfbf","#bebebe","#bcbcbc","#bbbbbb","#b9b9b9","#b7b7b7","#b5b5b5","#b3b3b3","#b1b1b1","#afafaf","#adadad","#ababab","#a9a9a9","#a7a7a7","#a5a5a5","#a3a3a3","#a1a1a1","#9f9f9f","#9d9d9d","#9b9b9b","#999999","#979797","#959595","#939393","#919191","#8f8f8f","#8d8d8d","#8b8b8b","#898989","#878787","#858585","#828282","#808080","#7e7e7e","#7c7c7c","#797979","#777777","#757575","#737373","#707070","#6e6e6e","#6c6c6c","#696969","#676767","#656565","#636363","#606060","#5e5e5e","#5c5c5c","#5a5a5a","#575757","#555555","#535353","#505050","#4e4e4e","#4c4c4c","#4a4a4a","#484848","#464646","#444444","#424242","#404040","#3e3e3e","#3c3c3c","#3a3a3a","#383838","#363636","#343434","#323232","#303030","#2e2e2e","#2c2c2c","#2a2a2a","#282828","#262626","#242424","#222222","#202020","#1e1e1e","#1c1c1c","#1a1a1a"],c.RdGy_r=["#1a1a1a","#1c1c1c","#1e1e1e","#202020","#222222","#242424","#262626","#282828","#2a2a2a","#2c2c2c","#2e2e2e","#303030","#323232","#343434","#363636","#383838","#3a3a3a","#3c3c3c","#3e3e3e","#404040","#424242","#444444","#464646","#484848","#4a4a4a","#4c4c4c","#4e4e4e","#505050","#535353","#555555","#575757","#5a5a5a","#5c5c5c","#5e5e5e","#606060","#636363","#656565","#676767","#696969","#6c6c6c","#6e6e6e","#707070","#737373","#757575","#777777","#797979","#7c7c7c","#7e7e7e","#808080","#828282","#858585","#878787","#898989","#8b8b8b","#8d8d8d","#8f8f8f","#919191","#939393","#959595","#979797","#999999","#9b9b9b","#9d9d9d","#9f9f9f","#a1a1a1","#a3a3a3","#a5a5a5","#a7a7a7","#a9a9a9","#ababab","#adadad","#afafaf","#b1b1b1","#b3b3b3","#b5b5b5","#b7b7b7","#b9b9b9","#bbbbbb","#bcbcbc","#bebebe","#bfbfbf","#c1c1c1","#c2c2c2","#c4c4c4","#c5c5c5","#c7c7c7","#c8c8c8","#cacaca","#cbcbcb","#cdcdcd","#cecece","#d0d0d0","#d1d1d1","#d3d3d3","#d4d4d4","#d6d6d6","#d7d7d7","#d9d9d9","#dadada","#dcdcdc","#dddddd","#dfdfdf","#e0e0e0","#e1e1e1","#e2e2e2","#e4e4e4","#e5e5e5","#e6e6e6","#e7e7e7","#e9e9e9","#eaeaea","#ebebeb","#ececec","#ededed","#efefef","#f0f0f0","#f1f1f1","#f2f2f2","#f3f3f3","#f5f5f5","#f6f6f6","#f7f7f7","#f8f8f8","#fafafa","#fbfbfb","#fcfcfc","#fdfdfd","#fefefe","#fffefe","#fffdfc","#fffbfa","#fffaf7","#fff9f5","#fff7f3","#fef6f1","#fef4ef","#fef3ec","#fef2ea","#fef0e8","#feefe6","#feede4","#feece1","#feebdf","#fee9dd","#fee8db","#fee6d9","#fee5d6","#fde3d4","#fde2d2","#fde1d0","#fddfce","#fddecb","#fddcc9","#fddbc7","#fdd9c4","#fcd7c2","#fcd5bf","#fcd3bc","#fbd0b9","#fbceb7","#fbccb4","#facab1","#fac8af","#f9c6ac","#f9c4a9","#f9c2a7","#f8bfa4","#f8bda1","#f8bb9e","#f7b99c","#f7b799","#f7b596","#f6b394","#f6b191","#f6af8e","#f5ac8b","#f5aa89","#f5a886","#f4a683","#f3a481","#f2a17f","#f19e7d","#f09c7b","#ef9979","#ee9677","#ec9374","#eb9172","#ea8e70","#e98b6e","#e8896c","#e6866a","#e58368","#e48066","#e37e64","#e27b62","#e17860","#df765e","#de735c","#dd7059","#dc6e57","#db6b55","#da6853","#d86551","#d7634f","#d6604d","#d55d4c","#d35a4a","#d25849","#d05548","#cf5246","#ce4f45","#cc4c44","#cb4942","#c94741","#c84440","#c6413e","#c53e3d","#c43b3c","#c2383a","#c13639","#bf3338","#be3036","#bd2d35","#bb2a34","#ba2832","#b82531","#b72230","#b61f2e","#b41c2d","#b3192c","#b1182b","#ae172a","#ab162a","#a81529","#a51429","#a21328","#9f1228","#9c1127","#991027","#960f27","#930e26","#900d26","#8d0c25","#8a0b25","#870a24","#840924","#810823","#7f0823","#7c0722","#790622","#760521","#730421","#700320","#6d0220","#6a011f","#67001f"],c.RdPu=["#fff7f3","#fff6f2","#fff6f2","#fff5f1","#fff4f0","#fff3f0","#fff3ef","#fff2ee","#fef1ed","#fef1ed","#fef0ec","#feefeb","#feeeeb","#feeeea","#feede9","#feece9","#feebe8","#feebe7","#feeae7","#fee9e6","#fee9e5","#fee8e5","#fee7e4","#fee6e3","#fde6e2","#fde5e2","#fde4e1","#fde4e0","#fde3e0","#fde2df","#fde1de","#fde1de","#fde0dd","#fddfdc","#fddedb","#fdddda","#fdddd9","#fddcd8","#fddbd7","#fddad7","#fdd9d6","#fdd8d5","#fdd7d4","#fdd7d3","#fdd6d2","#fdd5d1","#fdd4d0","#fdd3cf","#fcd2ce","#fcd1cd","#fcd1cd","#fcd0cc","#fccfcb","#fcceca","#fccdc9","#fcccc8","#fcccc7","#fccbc6","#fccac5","#fcc9c4","#fcc8c3","#fcc7c3","#fcc6c2","#fcc6c1","#fcc5c0","#fcc4c0","#fcc2bf","#fcc1bf","#fcc0bf","#fcbfbe","#fcbebe","#fcbcbd","#fbbbbd","#fbbabd","#fbb9bc","#fbb8bc","#fbb6bc","#fbb5bb","#fbb4bb","#fbb3bb","#fbb2ba","#fbb0ba","#fbafba","#fbaeb9","#fbadb9","#fbacb9","#fbaab8","#fba9b8","#faa8b8","#faa7b7","#faa6b7","#faa5b7","#faa3b6","#faa2b6","#faa1b6","#faa0b5","#fa9eb5","#fa9db4","#fa9bb4","#fa99b3","#fa97b2","#f996b2","#f994b1","#f992b0","#f991b0","#f98faf","#f98dae","#f98bae","#f98aad","#f988ad","#f986ac","#f984ab","#f883ab","#f881aa","#f87fa9","#f87ea9","#f87ca8","#f87aa8","#f878a7","#f877a6","#f875a6","#f873a5","#f871a4","#f770a4","#f76ea3","#f76ca3","#f76ba2","#f769a1","#f767a1","#f666a1","#f564a0","#f462a0","#f361a0","#f35f9f","#f25d9f","#f15c9f","#f05a9e","#ef599e","#ee579e","#ee559d","#ed549d","#ec529d","#eb509c","#ea4f9c","#ea4d9c","#e94b9c","#e84a9b","#e7489b","#e6479b","#e5459a","#e5439a","#e4429a","#e34099","#e23e99","#e13d99","#e13b98","#e03a98","#df3898","#de3697","#dd3597","#dc3397","#db3196","#d93095","#d82e94","#d62d93","#d52b93","#d32992","#d22891","#d02690","#cf258f","#cd238f","#cc218e","#ca208d","#c91e8c","#c71d8c","#c61b8b","#c4198a","#c31889","#c21688","#c01588","#bf1387","#bd1186","#bc1085","#ba0e84","#b90d84","#b70b83","#b60982","#b40881","#b30681","#b10580","#b0037f","#ae017e","#ad017e","#ab017e","#aa017d","#a8017d","#a6017d","#a5017d","#a3017d","#a1017c","#a0017c","#9e017c","#9c017c","#9b017b","#99017b","#98017b","#96017b","#94017b","#93017a","#91017a","#8f017a","#8e017a","#8c0179","#8b0179","#890179","#870179","#860179","#840178","#820178","#810178","#7f0178","#7d0177","#7c0177","#7a0177","#790177","#770176","#760176","#740175","#730175","#710175","#6f0174","#6e0174","#6c0173","#6b0173","#690173","#680172","#660172","#650171","#630171","#620171","#600070","#5f0070","#5d006f","#5b006f","#5a006e","#58006e","#57006e","#55006d","#54006d","#52006c","#51006c","#4f006c","#4e006b","#4c006b","#4b006a","#49006a"],c.RdPu_r=["#49006a","#4b006a","#4c006b","#4e006b","#4f006c","#51006c","#52006c","#54006d","#55006d","#57006e","#58006e","#5a006e","#5b006f","#5d006f","#5f0070","#600070","#620171","#630171","#650171","#660172","#680172","#690173","#6b0173","#6c0173","#6e0174","#6f0174","#710175","#730175","#740175","#760176","#770176","#790177","#7a0177","#7c0177","#7d0177","#7f0178","#810178","#820178","#840178","#860179","#870179","#890179","#8b0179","#8c0179","#8e017a","#8f017a","#91017a","#93017a","#94017b","#96017b","#98017b","#99017b","#9b017b","#9c017c","#9e017c","#a0017c","#a1017c","#a3017d","#a5017d","#a6017d","#a8017d","#aa017d","#ab017e","#ad017e","#ae017e","#b0037f","#b10580","#b30681","#b40881","#b60982","#b70b83","#b90d84","#ba0e84","#bc1085","#bd1186","#bf1387","#c01588","#c21688","#c31889","#c4198a","#c61b8b","#c71d8c","#c91e8c","#ca208d","#cc218e","#cd238f","#cf258f","#d02690","#d22891","#d32992","#d52b93","#d62d93","#d82e94","#d93095","#db3196","#dc3397","#dd3597","#de3697","#df3898","#e03a98","#e13b98","#e13d99","#e23e99","#e34099","#e4429a","#e5439a","#e5459a","#e6479b","#e7489b","#e84a9b","#e94b9c","#ea4d9c","#ea4f9c","#eb509c","#ec529d","#ed549d","#ee559d","#ee579e","#ef599e","#f05a9e","#f15c9f","#f25d9f","#f35f9f","#f361a0","#f462a0","#f564a0","#f666a1","#f767a1","#f769a1","#f76ba2","#f76ca3","#f76ea3","#f770a4","#f871a4","#f873a5","#f875a6","#f877a6","#f878a7","#f87aa8","#f87ca8","#f87ea9","#f87fa9","#f881aa","#f883ab","#f984ab","#f986ac","#f988ad","#f98aad","#f98bae","#f98dae","#f98faf","#f991b0","#f992b0","#f994b1","#f996b2","#fa97b2","#fa99b3","#fa9bb4","#fa9db4","#fa9eb5","#faa0b5","#faa1b6","#faa2b6","#faa3b6","#faa5b7","#faa6b7","#faa7b7","#faa8b8","#fba9b8","#fbaab8","#fbacb9","#fbadb9","#fbaeb9","#fbafba","#fbb0ba","#fbb2ba","#fbb3bb","#fbb4bb","#fbb5bb","#fbb6bc","#fbb8bc","#fbb9bc","#fbbabd","#fbbbbd","#fcbcbd","#fcbebe","#fcbfbe","#fcc0bf","#fcc1bf","#fcc2bf","#fcc4c0","#fcc5c0","#fcc6c1","#fcc6c2","#fcc7c3","#fcc8c3","#fcc9c4","#fccac5","#fccbc6","#fcccc7","#fcccc8","#fccdc9","#fcceca","#fccfcb","#fcd0cc","#fcd1cd","#fcd1cd","#fcd2ce","#fdd3cf","#fdd4d0","#fdd5d1","#fdd6d2","#fdd7d3","#fdd7d4","#fdd8d5","#fdd9d6","#fddad7","#fddbd7","#fddcd8","#fdddd9","#fdddda","#fddedb","#fddfdc","#fde0dd","#fde1de","#fde1de","#fde2df","#fde3e0","#fde4e0","#fde4e1","#fde5e2","#fde6e2","#fee6e3","#fee7e4","#fee8e5","#fee9e5","#fee9e6","#feeae7","#feebe7","#feebe8","#feece9","#feede9","#feeeea","#feeeeb","#feefeb","#fef0ec","#fef1ed","#fef1ed","#fff2ee","#fff3ef","#fff3f0","#fff4f0","#fff5f1","#fff6f2","#fff6f2","#fff7f3"],c.RdYlBu=["#a50026","#a70226","#a90426","#ab0626","#ad0826","#af0926","#b10b26","#b30d26","#b50f26","#b71126","#b91326","#bb1526","#bd1726","#be1827","#c01a27","#c21c27","#c41e27","#c62027","#c82227","#ca2427","#cc2627","#ce2827","#d02927","#d22b27","#d42d27","#d62f27","#d83128","#d93429","#da362a","#db382b","#dc3b2c","#dd3d2d","#de402e","#e0422f","#e14430","#e24731","#e34933","#e44c34","#e54e35","#e65036","#e75337","#e95538","#ea5739","#eb5a3a","#ec5c3b","#ed5f3c","#ee613e","#ef633f","#f16640","#f26841","#f36b42","#f46d43","#f47044","#f57245","#f57547","#f57748","#f67a49","#f67c4a","#f67f4b","#f7814c","#f7844e","#f8864f","#f88950","#f88c51","#f98e52","#f99153","#f99355","#fa9656","#fa9857","#fa9b58","#fb9d59","#fba05b","#fba35c","#fca55d","#fca85e","#fcaa5f","#fdad60","#fdaf62","#fdb164","#fdb366","#fdb567","#fdb769","#fdb96b","#fdbb6d","#fdbd6f","#fdbf71","#fdc173","#fdc374","#fdc576","#fdc778","#fec87a","#feca7c","#fecc7e","#fece7f","#fed081","#fed283","#fed485","#fed687","#fed889","#feda8a","#fedc8c","#fede8e","#fee090","#fee192","#fee294","#fee496","#fee597","#fee699","#fee79b","#fee99d","#feea9f","#feeba1","#feeca2","#feeda4","#feefa6","#fff0a8","#fff1aa","#fff2ac","#fff3ad","#fff5af","#fff6b1","#fff7b3","#fff8b5","#fffab7","#fffbb9","#fffcba","#fffdbc","#fffebe","#feffc0","#fdfec2","#fcfec5","#fbfdc7","#fafdc9","#f8fccb","#f7fcce","#f6fbd0","#f5fbd2","#f3fbd4","#f2fad6","#f1fad9","#f0f9db","#eff9dd","#edf8df","#ecf8e2","#ebf7e4","#eaf7e6","#e9f6e8","#e7f6eb","#e6f5ed","#e5f5ef","#e4f4f1","#e2f4f4","#e1f3f6","#e0f3f8","#def2f7","#dcf1f7","#daf0f6","#d8eff6","#d6eef5","#d4edf4","#d1ecf4","#cfebf3","#cdeaf3","#cbe9f2","#c9e8f2","#c7e7f1","#c5e6f0","#c3e5f0","#c1e4ef","#bfe3ef","#bde2ee","#bbe1ed","#b9e0ed","#b6dfec","#b4deec","#b2ddeb","#b0dcea","#aedbea","#acdae9","#aad8e9","#a8d6e8","#a6d5e7","#a3d3e6","#a1d1e5","#9fd0e4","#9dcee3","#9bcce2","#99cae1","#97c9e0","#94c7df","#92c5de","#90c3dd","#8ec2dc","#8cc0db","#8abeda","#87bdd9","#85bbd9","#83b9d8","#81b7d7","#7fb6d6","#7db4d5","#7ab2d4","#78b0d3","#76afd2","#74add1","#72abd0","#70a9cf","#6ea6ce","#6da4cc","#6ba2cb","#69a0ca","#679ec9","#659bc8","#6399c7","#6297c6","#6095c4","#5e93c3","#5c90c2","#5a8ec1","#588cc0","#578abf","#5588be","#5385bd","#5183bb","#4f81ba","#4d7fb9","#4b7db8","#4a7ab7","#4878b6","#4676b5","#4574b3","#4471b2","#436fb1","#426cb0","#416aaf","#4167ad","#4065ac","#3f62ab","#3e60aa","#3e5ea8","#3d5ba7","#3c59a6","#3b56a5","#3a54a4","#3a51a2","#394fa1","#384ca0","#374a9f","#36479e","#36459c","#35429b","#34409a","#333d99","#333b97","#323896","#313695"],c.RdYlBu_r=["#313695","#323896","#333b97","#333d99","#34409a","#35429b","#36459c","#36479e","#374a9f","#384ca0","#394fa1","#3a51a2","#3a54a4","#3b56a5","#3c59a6","#3d5ba7","#3e5ea8","#3e60aa","#3f62ab","#4065ac","#4167ad","#416aaf","#426cb0","#436fb1","#4471b2","#4574b3","#4676b5","#4878b6","#4a7ab7","#4b7db8","#4d7fb9","#4f81ba","#5183bb","#5385bd","#5588be","#578abf","#588cc0","#5a8ec1","#5c90c2","#5e93c3","#6095c4","#6297c6","#6399c7","#659bc8","#679ec9","#69a0ca","#6ba2cb","#6da4cc","#6ea6ce","#70a9cf","#72abd0","#74add1","#76afd2","#78b0d3","#7ab2d4","#7db4d5","#7fb6d6","#81b7d7","#83b9d8","#85bbd9","#87bdd9","#8abeda","#8cc0db","#8ec2dc","#90c3dd","#92c5de","#94c7df","#97c9e0","#99cae1","#9bcce2","#9dcee3","#9fd0e4","#a1d1e5","#a3d3e6","#a6d5e7","#a8d6e8","#aad8e9","#acdae9","#aedbea","#b0dcea","#b2ddeb","#b4deec","#b6dfec","#b9e0ed","#bbe1ed","#bde2ee","#bfe3ef","#c1e4ef","#c3e5f0","#c5e6f0","#c7e7f1","#c9e8f2","#cbe9f2","#cdeaf3","#cfebf3","#d1ecf4","#d4edf4","#d6eef5","#d8eff6","#daf0f6","#dcf1f7","#def2f7","#e0f3f8","#e1f3f6","#e2f4f4","#e4f4f1","#e5f5ef","#e6f5ed","#e7f6eb","#e9f6e8","#eaf7e6","#ebf7e4","#ecf8e2","#edf8df","#eff9dd","#f0f9db","#f1fad9","#f2fad6","#f3fbd4","#f5fbd2","#f6fbd0","#f7fcce","#f8fccb","#fafdc9","#fbfdc7","#fcfec5","#fdfec2","#feffc0","#fffebe","#fffdbc","#fffcba","#fffbb9","#fffab7","#fff8b5","#fff7b3","#fff6b1","#fff5af","#fff3ad","#fff2ac","#fff1aa","#fff0a8","#feefa6","#feeda4","#feeca2","#feeba1","#feea9f","#fee99d","#fee79b","#fee699","#fee597","#fee496","#fee294","#fee192","#fee090","#fede8e","#fedc8c","#feda8a","#fed889","#fed687","#fed485","#fed283","#fed081","#fece7f","#fecc7e","#feca7c","#fec87a","#fdc778","#fdc576","#fdc374","#fdc173","#fdbf71","#fdbd6f","#fdbb6d","#fdb96b","#fdb769","#fdb567","#fdb366","#fdb164","#fdaf62","#fdad60","#fcaa5f","#fca85e","#fca55d","#fba35c","#fba05b","#fb9d59","#fa9b58","#fa9857","#fa9656","#f99355","#f99153","#f98e52","#f88c51","#f88950","#f8864f","#f7844e","#f7814c","#f67f4b","#f67c4a","#f67a49","#f57748","#f57547","#f57245","#f47044","#f46d43","#f36b42","#f26841","#f16640","#ef633f","#ee613e","#ed5f3c","#ec5c3b","#eb5a3a","#ea5739","#e95538","#e75337","#e65036","#e54e35","#e44c34","#e34933","#e24731","#e14430","#e0422f","#de402e","#dd3d2d","#dc3b2c","#db382b","#da362a","#d93429","#d83128","#d62f27","#d42d27","#d22b27","#d02927","#ce2827","#cc2627","#ca2427","#c82227","#c62027","#c41e27","#c21c27","#c01a27","#be1827","#bd1726","#bb1526","#b91326","#b71126","#b50f26","#b30d26","#b10b26","#af0926","#ad0826","#ab0626","#a90426","#a70226","#a50026"],c.RdYlGn=["#a50026","#a70226","#a90426","#ab0626","#ad0826","#af0926","#b10b26","#b30d26","#b50f26","#b71126","#b91326","#bb1526","#bd1726","#be1827","#c01a27","#c21c27","#c41e27","#c62027","#c82227","#ca2427","#cc2627","#ce2827","#d02927","#d22b27","#d42d27","#d62f27","#d83128","#d93429","#da362a","#db382b","#dc3b2c","#dd3d2d","#de402e","#e0422f","#e14430","#e24731","#e34933","#e44c34","#e54e35","#e65036","#e75337","#e95538","#ea5739","#eb5a3a","#ec5c3b","#ed5f3c","#ee613e","#ef633f","#f16640","#f26841","#f36b42","#f46d43","#f47044","#f57245","#f57547","#f57748","#f67a49","#f67c4a","#f67f4b","#f7814c","#f7844e","#f8864f","#f88950","#f88c51","#f98e52","#f99153","#f99355","#fa9656","#fa9857","#fa9b58","#fb9d59","#fba05b","#fba35c","#fca55d","#fca85e","#fcaa5f","#fdad60","#fdaf62","#fdb163","#fdb365","#fdb567","#fdb768","#fdb96a","#fdbb6c","#fdbd6d","#fdbf6f","#fdc171","#fdc372","#fdc574","#fdc776","#fec877","#feca79","#fecc7b","#fece7c","#fed07e","#fed27f","#fed481","#fed683","#fed884","#feda86","#fedc88","#fede89","#fee08b","#fee18d","#fee28f","#fee491","#fee593","#fee695","#fee797","#fee999","#feea9b","#feeb9d","#feec9f","#feeda1","#feefa3","#fff0a6","#fff1a8","#fff2aa","#fff3ac","#fff5ae","#fff6b0","#fff7b2","#fff8b4","#fffab6","#fffbb8","#fffcba","#fffdbc","#fffebe","#feffbe","#fdfebc","#fbfdba","#fafdb8","#f8fcb6","#f7fcb4","#f5fbb2","#f4fab0","#f2faae","#f1f9ac","#eff8aa","#eef8a8","#ecf7a6","#ebf7a3","#e9f6a1","#e8f59f","#e6f59d","#e5f49b","#e3f399","#e2f397","#e0f295","#dff293","#ddf191","#dcf08f","#daf08d","#d9ef8b","#d7ee8a","#d5ed88","#d3ec87","#d1ec86","#cfeb85","#cdea83","#cbe982","#c9e881","#c7e77f","#c5e67e","#c3e67d","#c1e57b","#bfe47a","#bde379","#bbe278","#b9e176","#b7e075","#b5df74","#b3df72","#b1de71","#afdd70","#addc6f","#abdb6d","#a9da6c","#a7d96b","#a5d86a","#a2d76a","#a0d669","#9dd569","#9bd469","#98d368","#96d268","#93d168","#91d068","#8ecf67","#8ccd67","#89cc67","#87cb67","#84ca66","#82c966","#7fc866","#7dc765","#7ac665","#78c565","#75c465","#73c264","#70c164","#6ec064","#6bbf64","#69be63","#66bd63","#63bc62","#60ba62","#5db961","#5ab760","#57b65f","#54b45f","#51b35e","#4eb15d","#4bb05c","#48ae5c","#45ad5b","#42ac5a","#3faa59","#3ca959","#39a758","#36a657","#33a456","#30a356","#2da155","#2aa054","#279f53","#249d53","#219c52","#1e9a51","#1b9950","#199750","#18954f","#17934e","#16914d","#15904c","#148e4b","#138c4a","#128a49","#118848","#108647","#0f8446","#0e8245","#0d8044","#0c7f43","#0b7d42","#0a7b41","#097940","#08773f","#07753e","#06733d","#05713c","#04703b","#036e3a","#026c39","#016a38","#006837"],c.RdYlGn_r=["#006837","#016a38","#026c39","#036e3a","#04703b","#05713c","#06733d","#07753e","#08773f","#097940","#0a7b41","#0b7d42","#0c7f43","#0d8044","#0e8245","#0f8446","#108647","#118848","#128a49","#138c4a","#148e4b","#15904c","#16914d","#17934e","#18954f","#199750","#1b9950","#1e9a51","#219c52","#249d53","#279f53","#2aa054","#2da155","#30a356","#33a456","#36a657","#39a758","#3ca959","#3faa59","#42ac5a","#45ad5b","#48ae5c","#4bb05c","#4eb15d","#51b35e","#54b45f","#57b65f","#5ab760","#5db961","#60ba62","#63bc62","#66bd63","#69be63","#6bbf64","#6ec064","#70c164","#73c264","#75c465","#78c565","#7ac665","#7dc765","#7fc866","#82c966","#84ca66","#87cb67","#89cc67","#8ccd67","#8ecf67","#91d068","#93d168","#96d268","#98d368","#9bd469","#9dd569","#a0d669","#a2d76a","#a5d86a","#a7d96b","#a9da6c","#abdb6d","#addc6f","#afdd70","#b1de71","#b3df72","#b5df74","#b7e075","#b9e176","#bbe278","#bde379","#bfe47a","#c1e57b","#c3e67d","#c5e67e","#c7e77f","#c9e881","#cbe982","#cdea83","#cfeb85","#d1ec86","#d3ec87","#d5ed88","#d7ee8a","#d9ef8b","#daf08d","#dcf08f","#ddf191","#dff293","#e0f295","#e2f397","#e3f399","#e5f49b","#e6f59d","#e8f59f","#e9f6a1","#ebf7a3","#ecf7a6","#eef8a8","#eff8aa","#f1f9ac","#f2faae","#f4fab0","#f5fbb2","#f7fcb4","#f8fcb6","#fafdb8","#fbfdba","#fdfebc","#feffbe","#fffebe","#fffdbc","#fffcba","#fffbb8","#fffab6","#fff8b4","#fff7b2","#fff6b0","#fff5ae","#fff3ac","#fff2aa","#fff1a8","#fff0a6","#feefa3","#feeda1","#feec9f","#feeb9d","#feea9b","#fee999","#fee797","#fee695","#fee593","#fee491","#fee28f","#fee18d","#fee08b","#fede89","#fedc88","#feda86","#fed884","#fed683","#fed481","#fed27f","#fed07e","#fece7c","#fecc7b","#feca79","#fec877","#fdc776","#fdc574","#fdc372","#fdc171","#fdbf6f","#fdbd6d","#fdbb6c","#fdb96a","#fdb768","#fdb567","#fdb365","#fdb163","#fdaf62","#fdad60","#fcaa5f","#fca85e","#fca55d","#fba35c","#fba05b","#fb9d59","#fa9b58","#fa9857","#fa9656","#f99355","#f99153","#f98e52","#f88c51","#f88950","#f8864f","#f7844e","#f7814c","#f67f4b","#f67c4a","#f67a49","#f57748","#f57547","#f57245","#f47044","#f46d43","#f36b42","#f26841","#f16640","#ef633f","#ee613e","#ed5f3c","#ec5c3b","#eb5a3a","#ea5739","#e95538","#e75337","#e65036","#e54e35","#e44c34","#e34933","#e24731","#e14430","#e0422f","#de402e","#dd3d2d","#dc3b2c","#db382b","#da362a","#d93429","#d83128","#d62f27","#d42d27","#d22b27","#d02927","#ce2827","#cc2627","#ca2427","#c82227","#c62027","#c41e27","#c21c27","#c01a27","#be1827","#bd1726","#bb1526","#b91326","#b71126","#b50f26","#b30d26","#b10b26","#af0926","#ad0826","#ab0626","#a90426","#a70226","#a50026"],c.Reds=["#fff5f0","#fff4ef","#fff4ee","#fff3ed","#fff2ec","#fff2eb","#fff1ea","#fff0e9","#fff0e8","#ffefe8","#ffeee7","#ffeee6","#ffede5","#ffece4","#ffece3","#ffebe2","#feeae1","#feeae0","#fee9df","#fee8de","#fee8dd","#fee7dc","#fee7db","#fee6da","#fee5d9","#fee5d8","#fee4d8","#fee3d7","#fee3d6","#fee2d5","#fee1d4","#fee1d3","#fee0d2","#fedfd0","#fedecf","#fedccd","#fedbcc","#fedaca","#fed9c9","#fed8c7","#fdd7c6","#fdd5c4","#fdd4c2","#fdd3c1","#fdd2bf","#fdd1be","#fdd0bc","#fdcebb","#fdcdb9","#fdccb8","#fdcbb6","#fdcab5","#fdc9b3","#fdc7b2","#fdc6b0","#fdc5ae","#fcc4ad","#fcc3ab","#fcc2aa","#fcc1a8","#fcbfa7","#fcbea5","#fcbda4","#fcbca2","#fcbba1","#fcb99f","#fcb89e","#fcb79c","#fcb69b","#fcb499","#fcb398","#fcb296","#fcb095","#fcaf93","#fcae92","#fcad90","#fcab8f","#fcaa8d","#fca98c","#fca78b","#fca689","#fca588","#fca486","#fca285","#fca183","#fca082","#fc9e80","#fc9d7f","#fc9c7d","#fc9b7c","#fc997a","#fc9879","#fc9777","#fc9576","#fc9474","#fc9373","#fc9272","#fc9070","#fc8f6f","#fc8e6e","#fc8d6d","#fc8b6b","#fc8a6a","#fc8969","#fc8767","#fc8666","#fc8565","#fc8464","#fc8262","#fc8161","#fc8060","#fc7f5f","#fb7d5d","#fb7c5c","#fb7b5b","#fb7a5a","#fb7858","#fb7757","#fb7656","#fb7555","#fb7353","#fb7252","#fb7151","#fb7050","#fb6e4e","#fb6d4d","#fb6c4c","#fb6b4b","#fb694a","#fa6849","#fa6648","#fa6547","#f96346","#f96245","#f96044","#f85f43","#f85d42","#f75c41","#f75b40","#f7593f","#f6583e","#f6563d","#f6553c","#f5533b","#f5523a","#f4503a","#f44f39","#f44d38","#f34c37","#f34a36","#f34935","#f24734","#f24633","#f14432","#f14331","#f14130","#f0402f","#f03f2e","#f03d2d","#ef3c2c","#ee3a2c","#ed392b","#ec382b","#eb372a","#ea362a","#e93529","#e83429","#e63328","#e53228","#e43027","#e32f27","#e22e27","#e12d26","#e02c26","#de2b25","#dd2a25","#dc2924","#db2824","#da2723","#d92523","#d82422","#d72322","#d52221","#d42121","#d32020","#d21f20","#d11e1f","#d01d1f","#cf1c1f","#ce1a1e","#cc191e","#cb181d","#ca181d","#c9181d","#c8171c","#c7171c","#c5171c","#c4161c","#c3161b","#c2161b","#c1161b","#bf151b","#be151a","#bd151a","#bc141a","#bb141a","#b91419","#b81419","#b71319","#b61319","#b51318","#b31218","#b21218","#b11218","#b01217","#af1117","#ad1117","#ac1117","#ab1016","#aa1016","#a91016","#a81016","#a60f15","#a50f15","#a30f15","#a10e15","#9f0e14","#9d0d14","#9c0d14","#9a0c14","#980c13","#960b13","#940b13","#920a13","#900a12","#8e0912","#8c0912","#8a0812","#880811","#860811","#840711","#820711","#800610","#7e0610","#7c0510","#7a0510","#79040f","#77040f","#75030f","#73030f","#71020e","#6f020e","#6d010e","#6b010e","#69000d","#67000d"],c.Reds_r=["#67000d","#69000d","#6b010e","#6d010e","#6f020e","#71020e","#73030f","#75030f","#77040f","#79040f","#7a0510","#7c0510","#7e0610","#800610","#820711","#840711","#860811","#880811","#8a0812","#8c0912","#8e0912","#900a12","#920a13","#940b13","#960b13","#980c13","#9a0c14","#9c0d14","#9d0d14","#9f0e14","#a10e15","#a30f15","#a50f15","#a60f15","#a81016","#a91016","#aa1016","#ab1016","#ac1117","#ad1117","#af1117","#b01217","#b11218","#b21218","#b31218","#b51318","#b61319","#b71319","#b81419","#b91419","#bb141a","#bc141a","#bd151a","#be151a","#bf151b","#c1161b","#c2161b","#c3161b","#c4161c","#c5171c","#c7171c","#c8171c","#c9181d","#ca181d","#cb181d","#cc191e","#ce1a1e","#cf1c1f","#d01d1f","#d11e1f","#d21f20","#d32020","#d42121","#d52221","#d72322","#d82422","#d92523","#da2723","#db2824","#dc2924","#dd2a25","#de2b25","#e02c26","#e12d26","#e22e27","#e32f27","#e43027","#e53228","#e63328","#e83429","#e93529","#ea362a","#eb372a","#ec382b","#ed392b","#ee3a2c","#ef3c2c","#f03d2d","#f03f2e","#f0402f","#f14130","#f14331","#f14432","#f24633","#f24734","#f34935","#f34a36","#f34c37","#f44d38","#f44f39","#f4503a","#f5523a","#f5533b","#f6553c","#f6563d","#f6583e","#f7593f","#f75b40","#f75c41","#f85d42","#f85f43","#f96044","#f96245","#f96346","#fa6547","#fa6648","#fa6849","#fb694a","#fb6b4b","#fb6c4c","#fb6d4d","#fb6e4e","#fb7050","#fb7151","#fb7252","#fb7353","#fb7555","#fb7656","#fb7757","#fb7858","#fb7a5a","#fb7b5b","#fb7c5c","#fb7d5d","#fc7f5f","#fc8060","#fc8161","#fc8262","#fc8464","#fc8565","#fc8666","#fc8767","#fc8969","#fc8a6a","#fc8b6b","#fc8d6d","#fc8e6e","#fc8f6f","#fc9070","#fc9272","#fc9373","#fc9474","#fc9576","#fc9777","#fc9879","#fc997a","#fc9b7c","#fc9c7d","#fc9d7f","#fc9e80","#fca082","#fca183","#fca285","#fca486","#fca588","#fca689","#fca78b","#fca98c","#fcaa8d","#fcab8f","#fcad90","#fcae92","#fcaf93","#fcb095","#fcb296","#fcb398","#fcb499","#fcb69b","#fcb79c","#fcb89e","#fcb99f","#fcbba1","#fcbca2","#fcbda4","#fcbea5","#fcbfa7","#fcc1a8","#fcc2aa","#fcc3ab","#fcc4ad","#fdc5ae","#fdc6b0","#fdc7b2","#fdc9b3","#fdcab5","#fdcbb6","#fdccb8","#fdcdb9","#fdcebb","#fdd0bc","#fdd1be","#fdd2bf","#fdd3c1","#fdd4c2","#fdd5c4","#fdd7c6","#fed8c7","#fed9c9","#fedaca","#fedbcc","#fedccd","#fedecf","#fedfd0","#fee0d2","#fee1d3","#fee1d4","#fee2d5","#fee3d6","#fee3d7","#fee4d8","#fee5d8","#fee5d9","#fee6da","#fee7db","#fee7dc","#fee8dd","#fee8de","#fee9df","#feeae0","#feeae1","#ffebe2","#ffece3","#ffece4","#ffede5","#ffeee6","#ffeee7","#ffefe8","#fff0e8","#fff0e9","#fff1ea","#fff2eb","#fff2ec","#fff3ed","#fff4ee","#fff4ef","#fff5f0"],c.Set1=["#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999"],c.Set1_r=["#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#999999","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#f781bf","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#a65628","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ffff33","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#ff7f00","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#984ea3","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#4daf4a","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#377eb8","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c","#e41a1c"],c.Set2=["#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3"],c.Set2_r=["#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#b3b3b3","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#e5c494","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#ffd92f","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#a6d854","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#e78ac3","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#8da0cb","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#fc8d62","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5","#66c2a5"],c.Set3=["#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f"],c.Set3_r=["#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ffed6f","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#ccebc5","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#bc80bd","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#fccde5","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#b3de69","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#fdb462","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#80b1d3","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#fb8072","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#bebada","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#ffffb3","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7","#8dd3c7"],c.Spectral=["#9e0142","#a00343","#a20643","#a40844","#a70b44","#a90d45","#ab0f45","#ad1246","#af1446","#b11747","#b41947","#b61b48","#b81e48","#ba2049","#bc2249","#be254a","#c1274a","#c32a4b","#c52c4b","#c72e4c","#c9314c","#cb334d","#cd364d","#d0384e","#d23a4e","#d43d4f","#d63f4f","#d7414e","#d8434e","#d9444d","#da464d","#dc484c","#dd4a4c","#de4c4b","#df4e4b","#e1504b","#e2514a","#e3534a","#e45549","#e55749","#e75948","#e85b48","#e95c47","#ea5e47","#eb6046","#ed6246","#ee6445","#ef6645","#f06744","#f26944","#f36b43","#f46d43","#f47044","#f57245","#f57547","#f57748","#f67a49","#f67c4a","#f67f4b","#f7814c","#f7844e","#f8864f","#f88950","#f88c51","#f98e52","#f99153","#f99355","#fa9656","#fa9857","#fa9b58","#fb9d59","#fba05b","#fba35c","#fca55d","#fca85e","#fcaa5f","#fdad60","#fdaf62","#fdb163","#fdb365","#fdb567","#fdb768","#fdb96a","#fdbb6c","#fdbd6d","#fdbf6f","#fdc171","#fdc372","#fdc574","#fdc776","#fec877","#feca79","#fecc7b","#fece7c","#fed07e","#fed27f","#fed481","#fed683","#fed884","#feda86","#fedc88","#fede89","#fee08b","#fee18d","#fee28f","#fee491","#fee593","#fee695","#fee797","#fee999","#feea9b","#feeb9d","#feec9f","#feeda1","#feefa3","#fff0a6","#fff1a8","#fff2aa","#fff3ac","#fff5ae","#fff6b0","#fff7b2","#fff8b4","#fffab6","#fffbb8","#fffcba","#fffdbc","#fffebe","#ffffbe","#fefebd","#fdfebb","#fcfeba","#fbfdb8","#fafdb7","#f9fcb5","#f8fcb4","#f7fcb2","#f6fbb0","#f5fbaf","#f4faad","#f3faac","#f2faaa","#f1f9a9","#f0f9a7","#eff9a6","#eef8a4","#edf8a3","#ecf7a1","#ebf7a0","#eaf79e","#e9f69d","#e8f69b","#e7f59a","#e6f598","#e4f498","#e1f399","#dff299","#ddf19a","#daf09a","#d8ef9b","#d6ee9b","#d3ed9c","#d1ed9c","#cfec9d","#cdeb9d","#caea9e","#c8e99e","#c6e89f","#c3e79f","#c1e6a0","#bfe5a0","#bce4a0","#bae3a1","#b8e2a1","#b5e1a2","#b3e0a2","#b1dfa3","#aedea3","#acdda4","#aadca4","#a7dba4","#a4daa4","#a2d9a4","#9fd8a4","#9cd7a4","#99d6a4","#97d5a4","#94d4a4","#91d3a4","#8fd2a4","#8cd1a4","#89d0a4","#86cfa5","#84cea5","#81cda5","#7ecca5","#7ccaa5","#79c9a5","#76c8a5","#74c7a5","#71c6a5","#6ec5a5","#6bc4a5","#69c3a5","#66c2a5","#64c0a6","#62bda7","#60bba8","#5eb9a9","#5cb7aa","#5ab4ab","#58b2ac","#56b0ad","#54aead","#52abae","#50a9af","#4ea7b0","#4ba4b1","#49a2b2","#47a0b3","#459eb4","#439bb5","#4199b6","#3f97b7","#3d95b8","#3b92b9","#3990ba","#378ebb","#358bbc","#3389bd","#3387bc","#3585bb","#3682ba","#3880b9","#3a7eb8","#3b7cb7","#3d79b6","#3f77b5","#4175b4","#4273b3","#4471b2","#466eb1","#486cb0","#496aaf","#4b68ae","#4d65ad","#4e63ac","#5061aa","#525fa9","#545ca8","#555aa7","#5758a6","#5956a5","#5b53a4","#5c51a3","#5e4fa2"],c.Spectral_r=["#5e4fa2","#5c51a3","#5b53a4","#5956a5","#5758a6","#555aa7","#545ca8","#525fa9","#5061aa","#4e63ac","#4d65ad","#4b68ae","#496aaf","#486cb0","#466eb1","#4471b2","#4273b3","#4175b4","#3f77b5","#3d79b6","#3b7cb7","#3a7eb8","#3880b9","#3682ba","#3585bb","#3387bc","#3389bd","#358bbc","#378ebb","#3990ba","#3b92b9","#3d95b8","#3f97b7","#4199b6","#439bb5","#459eb4","#47a0b3","#49a2b2","#4ba4b1","#4ea7b0","#50a9af","#52abae","#54aead","#56b0ad","#58b2ac","#5ab4ab","#5cb7aa","#5eb9a9","#60bba8","#62bda7","#64c0a6","#66c2a5","#69c3a5","#6bc4a5","#6ec5a5","#71c6a5","#74c7a5","#76c8a5","#79c9a5","#7ccaa5","#7ecca5","#81cda5","#84cea5","#86cfa5","#89d0a4","#8cd1a4","#8fd2a4","#91d3a4","#94d4a4","#97d5a4","#99d6a4","#9cd7a4","#9fd8a4","#a2d9a4","#a4daa4","#a7dba4","#aadca4","#acdda4","#aedea3","#b1dfa3","#b3e0a2","#b5e1a2","#b8e2a1","#bae3a1","#bce4a0","#bfe5a0","#c1e6a0","#c3e79f","#c6e89f","#c8e99e","#caea9e","#cdeb9d","#cfec9d","#d1ed9c","#d3ed9c","#d6ee9b","#d8ef9b","#daf09a","#ddf19a","#dff299","#e1f399","#e4f498","#e6f598","#e7f59a","#e8f69b","#e9f69d","#eaf79e","#ebf7a0","#ecf7a1","#edf8a3","#eef8a4","#eff9a6","#f0f9a7","#f1f9a9","#f2faaa","#f3faac","#f4faad","#f5fbaf","#f6fbb0","#f7fcb2","#f8fcb4","#f9fcb5","#fafdb7","#fbfdb8","#fcfeba","#fdfebb","#fefebd","#ffffbe","#fffebe","#fffdbc","#fffcba","#fffbb8","#fffab6","#fff8b4","#fff7b2","#fff6b0","#fff5ae","#fff3ac","#fff2aa","#fff1a8","#fff0a6","#feefa3","#feeda1","#feec9f","#feeb9d","#feea9b","#fee999","#fee797","#fee695","#fee593","#fee491","#fee28f","#fee18d","#fee08b","#fede89","#fedc88","#feda86","#fed884","#fed683","#fed481","#fed27f","#fed07e","#fece7c","#fecc7b","#feca79","#fec877","#fdc776","#fdc574","#fdc372","#fdc171","#fdbf6f","#fdbd6d","#fdbb6c","#fdb96a","#fdb768","#fdb567","#fdb365","#fdb163","#fdaf62","#fdad60","#fcaa5f","#fca85e","#fca55d","#fba35c","#fba05b","#fb9d59","#fa9b58","#fa9857","#fa9656","#f99355","#f99153","#f98e52","#f88c51","#f88950","#f8864f","#f7844e","#f7814c","#f67f4b","#f67c4a","#f67a49","#f57748","#f57547","#f57245","#f47044","#f46d43","#f36b43","#f26944","#f06744","#ef6645","#ee6445","#ed6246","#eb6046","#ea5e47","#e95c47","#e85b48","#e75948","#e55749","#e45549","#e3534a","#e2514a","#e1504b","#df4e4b","#de4c4b","#dd4a4c","#dc484c","#da464d","#d9444d","#d8434e","#d7414e","#d63f4f","#d43d4f","#d23a4e","#d0384e","#cd364d","#cb334d","#c9314c","#c72e4c","#c52c4b","#c32a4b","#c1274a","#be254a","#bc2249","#ba2049","#b81e48","#b61b48","#b41947","#b11747","#af1446","#ad1246","#ab0f45","#a90d45","#a70b44","#a40844","#a20643","#a00343","#9e0142"],c.Wistia=["#e4ff7a","#e4ff78","#e5fe77","#e5fe75","#e6fe74","#e6fd72","#e7fd71","#e7fc6f","#e7fc6e","#e8fc6c","#e8fb6b","#e9fb69","#e9fb68","#eafa66","#eafa65","#eafa63","#ebf962","#ebf960","#ecf95f","#ecf85d","#ecf85c","#edf75a","#edf759","#eef757","#eef656","#eff654","#eff653","#eff551","#f0f550","#f0f54e","#f1f44d","#f1f44b","#f2f34a","#f2f348","#f2f347","#f3f245","#f3f244","#f4f242","#f4f141","#f5f13f","#f5f13e","#f5f03c","#f6f03b","#f6ef39","#f7ef38","#f7ef36","#f7ee35","#f8ee33","#f8ee32","#f9ed30","#f9ed2f","#faed2d","#faec2c","#faec2a","#fbec29","#fbeb27","#fceb26","#fcea24","#fdea23","#fdea21","#fde920","#fee91e","#fee91d","#ffe81b","#ffe81a","#ffe719","#ffe619","#ffe619","#ffe518","#ffe418","#ffe417","#ffe317","#ffe217","#ffe216","#ffe116","#ffe015","#ffe015","#ffdf15","#ffde14","#ffde14","#ffdd13","#ffdc13","#ffdc13","#ffdb12","#ffda12","#ffda11","#ffd911","#ffd811","#ffd810","#ffd710","#ffd60f","#ffd60f","#ffd50e","#ffd40e","#ffd40e","#ffd30d","#ffd20d","#ffd20c","#ffd10c","#ffd00c","#ffd00b","#ffcf0b","#ffce0a","#ffce0a","#ffcd0a","#ffcc09","#ffcc09","#ffcb08","#ffca08","#ffc908","#ffc907","#ffc807","#ffc706","#ffc706","#ffc606","#ffc505","#ffc505","#ffc404","#ffc304","#ffc303","#ffc203","#ffc103","#ffc102","#ffc002","#ffbf01","#ffbf01","#ffbe01","#ffbd00","#ffbd00","#ffbc00","#ffbc00","#ffbb00","#ffbb00","#ffba00","#ffba00","#ffba00","#ffb900","#ffb900","#ffb800","#ffb800","#ffb700","#ffb700","#ffb600","#ffb600","#ffb500","#ffb500","#ffb500","#ffb400","#ffb400","#ffb300","#ffb300","#ffb200","#ffb200","#ffb100","#ffb100","#ffb000","#ffb000","#ffb000","#ffaf00","#ffaf00","#ffae00","#ffae00","#ffad00","#ffad00","#ffac00","#ffac00","#ffab00","#ffab00","#ffab00","#ffaa00","#ffaa00","#ffa900","#ffa900","#ffa800","#ffa800","#ffa700","#ffa700","#ffa600","#ffa600","#ffa600","#ffa500","#ffa500","#ffa400","#ffa400","#ffa300","#ffa300","#ffa200","#ffa200","#ffa100","#ffa100","#ffa100","#ffa000","#ffa000","#ff9f00","#ff9f00","#ff9e00","#ff9e00","#ff9d00","#ff9d00","#ff9c00","#ff9b00","#ff9b00","#fe9a00","#fe9a00","#fe9900","#fe9900","#fe9800","#fe9800","#fe9700","#fe9700","#fe9600","#fe9600","#fe9500","#fe9500","#fe9400","#fe9400","#fe9300","#fe9300","#fe9200","#fe9200","#fe9100","#fe9100","#fe9000","#fe9000","#fd8f00","#fd8f00","#fd8e00","#fd8d00","#fd8d00","#fd8c00","#fd8c00","#fd8b00","#fd8b00","#fd8a00","#fd8a00","#fd8900","#fd8900","#fd8800","#fd8800","#fd8700","#fd8700","#fd8600","#fd8600","#fd8500","#fd8500","#fc8400","#fc8400","#fc8300","#fc8300","#fc8200","#fc8200","#fc8100","#fc8100","#fc8000","#fc8000","#fc7f00"],c.Wistia_r=["#fc7f00","#fc8000","#fc8000","#fc8100","#fc8100","#fc8200","#fc8200","#fc8300","#fc8300","#fc8400","#fc8400","#fd8500","#fd8500","#fd8600","#fd8600","#fd8700","#fd8700","#fd8800","#fd8800","#fd8900","#fd8900","#fd8a00","#fd8a00","#fd8b00","#fd8b00","#fd8c00","#fd8c00","#fd8d00","#fd8d00","#fd8e00","#fd8f00","#fd8f00","#fe9000","#fe9000","#fe9100","#fe9100","#fe9200","#fe9200","#fe9300","#fe9300","#fe9400","#fe9400","#fe9500","#fe9500","#fe9600","#fe9600","#fe9700","#fe9700","#fe9800","#fe9800","#fe9900","#fe9900","#fe9a00","#fe9a00","#ff9b00","#ff9b00","#ff9c00","#ff9d00","#ff9d00","#ff9e00","#ff9e00","#ff9f00","#ff9f00","#ffa000","#ffa000","#ffa100","#ffa100","#ffa100","#ffa200","#ffa200","#ffa300","#ffa300","#ffa400","#ffa400","#ffa500","#ffa500","#ffa600","#ffa600","#ffa600","#ffa700","#ffa700","#ffa800","#ffa800","#ffa900","#ffa900","#ffaa00","#ffaa00","#ffab00","#ffab00","#ffab00","#ffac00","#ffac00","#ffad00","#ffad00","#ffae00","#ffae00","#ffaf00","#ffaf00","#ffb000","#ffb000","#ffb000","#ffb100","#ffb100","#ffb200","#ffb200","#ffb300","#ffb300","#ffb400","#ffb400","#ffb500","#ffb500","#ffb500","#ffb600","#ffb600","#ffb700","#ffb700","#ffb800","#ffb800","#ffb900","#ffb900","#ffba00","#ffba00","#ffba00","#ffbb00","#ffbb00","#ffbc00","#ffbc00","#ffbd00","#ffbd00","#ffbe01","#ffbf01","#ffbf01","#ffc002","#ffc102","#ffc103","#ffc203","#ffc303","#ffc304","#ffc404","#ffc505","#ffc505","#ffc606","#ffc706","#ffc706","#ffc807","#ffc907","#ffc908","#ffca08","#ffcb08","#ffcc09","#ffcc09","#ffcd0a","#ffce0a","#ffce0a","#ffcf0b","#ffd00b","#ffd00c","#ffd10c","#ffd20c","#ffd20d","#ffd30d","#ffd40e","#ffd40e","#ffd50e","#ffd60f","#ffd60f","#ffd710","#ffd810","#ffd811","#ffd911","#ffda11","#ffda12","#ffdb12","#ffdc13","#ffdc13","#ffdd13","#ffde14","#ffde14","#ffdf15","#ffe015","#ffe015","#ffe116","#ffe216","#ffe217","#ffe317","#ffe417","#ffe418","#ffe518","#ffe619","#ffe619","#ffe719","#ffe81a","#ffe81b","#fee91d","#fee91e","#fde920","#fdea21","#fdea23","#fcea24","#fceb26","#fbeb27","#fbec29","#faec2a","#faec2c","#faed2d","#f9ed2f","#f9ed30","#f8ee32","#f8ee33","#f7ee35","#f7ef36","#f7ef38","#f6ef39","#f6f03b","#f5f03c","#f5f13e","#f5f13f","#f4f141","#f4f242","#f3f244","#f3f245","#f2f347","#f2f348","#f2f34a","#f1f44b","#f1f44d","#f0f54e","#f0f550","#eff551","#eff653","#eff654","#eef656","#eef757","#edf759","#edf75a","#ecf85c","#ecf85d","#ecf95f","#ebf960","#ebf962","#eafa63","#eafa65","#eafa66","#e9fb68","#e9fb69","#e8fb6b","#e8fc6c","#e7fc6e","#e7fc6f","#e7fd71","#e6fd72","#e6fe74","#e5fe75","#e5fe77","#e4ff78","#e4ff7a"],c.YlGn=["#ffffe5","#ffffe4","#feffe2","#feffe1","#feffdf","#feffde","#fdfedd","#fdfedb","#fdfeda","#fdfed9","#fcfed7","#fcfed6","#fcfed4","#fcfed3","#fbfed2","#fbfed0","#fbfdcf","#fbfdce","#fafdcc","#fafdcb","#fafdc9","#fafdc8","#f9fdc7","#f9fdc5","#f9fdc4","#f9fdc2","#f8fdc1","#f8fcc0","#f8fcbe","#f8fcbd","#f7fcbc","#f7fcba","#f7fcb9","#f6fcb8","#f5fbb8","#f4fbb7","#f3fab6","#f2fab5","#f1fab5","#f0f9b4","#eff9b3","#eef9b3","#edf8b2","#edf8b1","#ecf7b1","#ebf7b0","#eaf7af","#e9f6af","#e8f6ae","#e7f6ad","#e6f5ac","#e5f5ac","#e4f4ab","#e3f4aa","#e2f4aa","#e1f3a9","#e0f3a8","#dff3a8","#def2a7","#ddf2a6","#ddf1a6","#dcf1a5","#dbf1a4","#daf0a4","#d9f0a3","#d7efa2","#d6efa2","#d5eea1","#d3eda0","#d2eda0","#d0ec9f","#cfec9e","#ceeb9e","#ccea9d","#cbea9c","#c9e99c","#c8e99b","#c7e89a","#c5e89a","#c4e799","#c3e698","#c1e698","#c0e597","#bee596","#bde496","#bce395","#bae394","#b9e294","#b8e293","#b6e192","#b5e092","#b3e091","#b2df90","#b1df90","#afde8f","#aedd8e","#acdd8e","#abdc8d","#a9db8c","#a7db8c","#a6da8b","#a4d98a","#a2d88a","#a1d889","#9fd788","#9dd688","#9cd687","#9ad587","#98d486","#97d385","#95d385","#93d284","#92d183","#90d083","#8ed082","#8dcf81","#8bce81","#89ce80","#88cd7f","#86cc7f","#84cb7e","#83cb7d","#81ca7d","#7fc97c","#7ec97b","#7cc87b","#7ac77a","#79c679","#77c679","#75c578","#74c477","#72c376","#70c275","#6fc174","#6dc073","#6bc072","#69bf72","#68be71","#66bd70","#64bc6f","#62bb6e","#61bb6d","#5fba6c","#5db96b","#5cb86b","#5ab76a","#58b669","#56b568","#55b567","#53b466","#51b365","#4fb264","#4eb163","#4cb063","#4ab062","#49af61","#47ae60","#45ad5f","#43ac5e","#42ab5d","#40aa5c","#3fa95c","#3fa85b","#3ea75a","#3da559","#3ca458","#3ba358","#3aa257","#39a056","#389f55","#379e54","#369d54","#359c53","#349a52","#339951","#329850","#31974f","#30954f","#2f944e","#2f934d","#2e924c","#2d914b","#2c8f4b","#2b8e4a","#2a8d49","#298c48","#288a47","#278946","#268846","#258745","#248644","#238443","#228343","#218242","#208242","#1f8142","#1e8041","#1d7f41","#1c7e40","#1a7d40","#197c40","#187b3f","#177b3f","#167a3f","#15793e","#14783e","#13773d","#12763d","#11753d","#10743c","#0e743c","#0d733c","#0c723b","#0b713b","#0a703a","#096f3a","#086e3a","#076d39","#066d39","#056c39","#036b38","#026a38","#016937","#006837","#006737","#006636","#006536","#006435","#006335","#006234","#006034","#005f34","#005e33","#005d33","#005c32","#005b32","#005a31","#005931","#005830","#005730","#005530","#00542f","#00532f","#00522e","#00512e","#00502d","#004f2d","#004e2d","#004d2c","#004c2c","#004a2b","#00492b","#00482a","#00472a","#004629","#004529"],c.YlGnBu=["#ffffd9","#feffd8","#feffd6","#fdfed5","#fdfed4","#fcfed3","#fcfed1","#fbfdd0","#fafdcf","#fafdce","#f9fdcc","#f9fdcb","#f8fcca","#f8fcc9","#f7fcc7","#f7fcc6","#f6fbc5","#f5fbc4","#f5fbc2","#f4fbc1","#f4fbc0","#f3fabf","#f3fabd","#f2fabc","#f1fabb","#f1faba","#f0f9b8","#f0f9b7","#eff9b6","#eff9b5","#eef8b3","#edf8b2","#edf8b1","#ecf7b1","#eaf7b1","#e9f7b1","#e8f6b1","#e7f6b1","#e6f5b2","#e5f5b2","#e3f4b2","#e2f4b2","#e1f3b2","#e0f3b2","#dff2b2","#ddf2b2","#dcf1b2","#dbf1b2","#daf0b3","#d9f0b3","#d7efb3","#d6efb3","#d5efb3","#d4eeb3","#d3eeb3","#d1edb3","#d0edb3","#cfecb3","#ceecb3","#cdebb4","#cbebb4","#caeab4","#c9eab4","#c8e9b4","#c6e9b4","#c4e8b4","#c2e7b4","#c0e6b5","#bde5b5","#bbe4b5","#b9e4b5","#b7e3b6","#b4e2b6","#b2e1b6","#b0e0b6","#aedfb6","#abdeb7","#a9ddb7","#a7dcb7","#a5dcb7","#a2dbb8","#a0dab8","#9ed9b8","#9cd8b8","#99d7b8","#97d6b9","#95d5b9","#92d5b9","#90d4b9","#8ed3ba","#8cd2ba","#89d1ba","#87d0ba","#85cfba","#83cebb","#80cebb","#7ecdbb","#7cccbb","#7acbbc","#78cbbc","#76cabc","#75c9bd","#73c8bd","#71c8bd","#6fc7bd","#6dc6be","#6bc6be","#69c5be","#67c4be","#65c3bf","#63c3bf","#61c2bf","#5fc1c0","#5dc0c0","#5bc0c0","#59bfc0","#57bec1","#55bec1","#53bdc1","#52bcc2","#50bbc2","#4ebbc2","#4cbac2","#4ab9c3","#48b9c3","#46b8c3","#44b7c4","#42b6c4","#40b5c4","#3fb4c4","#3eb3c4","#3db2c4","#3cb1c3","#3bb0c3","#3aaec3","#39adc3","#37acc3","#36abc3","#35aac3","#34a9c3","#33a7c2","#32a6c2","#31a5c2","#2fa4c2","#2ea3c2","#2da2c2","#2ca1c2","#2b9fc2","#2a9ec1","#299dc1","#289cc1","#269bc1","#259ac1","#2498c1","#2397c1","#2296c1","#2195c0","#2094c0","#1f93c0","#1d91c0","#1d90c0","#1d8ebf","#1d8dbe","#1e8bbd","#1e8abd","#1e88bc","#1e86bb","#1e85ba","#1e83ba","#1f82b9","#1f80b8","#1f7eb7","#1f7db6","#1f7bb6","#1f7ab5","#1f78b4","#2076b3","#2075b3","#2073b2","#2072b1","#2070b0","#206eb0","#216daf","#216bae","#216aad","#2168ad","#2166ac","#2165ab","#2163aa","#2262aa","#2260a9","#225ea8","#225da8","#225ca7","#225aa6","#2259a6","#2258a5","#2356a4","#2355a4","#2354a3","#2352a3","#2351a2","#2350a1","#234fa1","#234da0","#234c9f","#234b9f","#23499e","#24489d","#24479d","#24459c","#24449c","#24439b","#24419a","#24409a","#243f99","#243d98","#243c98","#253b97","#253997","#253896","#253795","#253595","#253494","#243392","#233390","#22328f","#21318d","#21308b","#203089","#1f2f87","#1e2e85","#1d2e83","#1c2d81","#1b2c80","#1a2b7e","#192b7c","#182a7a","#172978","#172976","#162874","#152772","#142670","#13266f","#12256d","#11246b","#102369","#0f2367","#0e2265","#0d2163","#0d2161","#0c2060","#0b1f5e","#0a1e5c","#091e5a","#081d58"],c.YlGnBu_r=["#081d58","#091e5a","#0a1e5c","#0b1f5e","#0c2060","#0d2161","#0d2163","#0e2265","#0f2367","#102369","#11246b","#12256d","#13266f","#142670","#152772","#162874","#172976","#172978","#182a7a","#192b7c","#1a2b7e","#1b2c80","#1c2d81","#1d2e83","#1e2e85","#1f2f87","#203089","#21308b","#21318d","#22328f","#233390","#243392","#253494","#253595","#253795","#253896","#253997","#253b97","#243c98","#243d98","#243f99","#24409a","#24419a","#24439b","#24449c","#24459c","#24479d","#24489d","#23499e","#234b9f","#234c9f","#234da0","#234fa1","#2350a1","#2351a2","#2352a3","#2354a3","#2355a4","#2356a4","#2258a5","#2259a6","#225aa6","#225ca7","#225da8","#225ea8","#2260a9","#2262aa","#2163aa","#2165ab","#2166ac","#2168ad","#216aad","#216bae","#216daf","#206eb0","#2070b0","#2072b1","#2073b2","#2075b3","#2076b3","#1f78b4","#1f7ab5","#1f7bb6","#1f7db6","#1f7eb7","#1f80b8","#1f82b9","#1e83ba","#1e85ba","#1e86bb","#1e88bc","#1e8abd","#1e8bbd","#1d8dbe","#1d8ebf","#1d90c0","#1d91c0","#1f93c0","#2094c0","#2195c0","#2296c1","#2397c1","#2498c1","#259ac1","#269bc1","#289cc1","#299dc1","#2a9ec1","#2b9fc2","#2ca1c2","#2da2c2","#2ea3c2","#2fa4c2","#31a5c2","#32a6c2","#33a7c2","#34a9c3","#35aac3","#36abc3","#37acc3","#39adc3","#3aaec3","#3bb0c3","#3cb1c3","#3db2c4","#3eb3c4","#3fb4c4","#40b5c4","#42b6c4","#44b7c4","#46b8c3","#48b9c3","#4ab9c3","#4cbac2","#4ebbc2","#50bbc2","#52bcc2","#53bdc1","#55bec1","#57bec1","#59bfc0","#5bc0c0","#5dc0c0","#5fc1c0","#61c2bf","#63c3bf","#65c3bf","#67c4be","#69c5be","#6bc6be","#6dc6be","#6fc7bd","#71c8bd","#73c8bd","#75c9bd","#76cabc","#78cbbc","#7acbbc","#7cccbb","#7ecdbb","#80cebb","#83cebb","#85cfba","#87d0ba","#89d1ba","#8cd2ba","#8ed3ba","#90d4b9","#92d5b9","#95d5b9","#97d6b9","#99d7b8","#9cd8b8","#9ed9b8","#a0dab8","#a2dbb8","#a5dcb7","#a7dcb7","#a9ddb7","#abdeb7","#aedfb6","#b0e0b6","#b2e1b6","#b4e2b6","#b7e3b6","#b9e4b5","#bbe4b5","#bde5b5","#c0e6b5","#c2e7b4","#c4e8b4","#c6e9b4","#c8e9b4","#c9eab4","#caeab4","#cbebb4","#cdebb4","#ceecb3","#cfecb3","#d0edb3","#d1edb3","#d3eeb3","#d4eeb3","#d5efb3","#d6efb3","#d7efb3","#d9f0b3","#daf0b3","#dbf1b2","#dcf1b2","#ddf2b2","#dff2b2","#e0f3b2","#e1f3b2","#e2f4b2","#e3f4b2","#e5f5b2","#e6f5b2","#e7f6b1","#e8f6b1","#e9f7b1","#eaf7b1","#ecf7b1","#edf8b1","#edf8b2","#eef8b3","#eff9b5","#eff9b6","#f0f9b7","#f0f9b8","#f1faba","#f1fabb","#f2fabc","#f3fabd","#f3fabf","#f4fbc0","#f4fbc1","#f5fbc2","#f5fbc4","#f6fbc5","#f7fcc6","#f7fcc7","#f8fcc9","#f8fcca","#f9fdcb","#f9fdcc","#fafdce","#fafdcf","#fbfdd0","#fcfed1","#fcfed3","#fdfed4","#fdfed5","#feffd6","#feffd8","#ffffd9"],c.YlGn_r=["#004529","#004629","#00472a","#00482a","#00492b","#004a2b","#004c2c","#004d2c","#004e2d","#004f2d","#00502d","#00512e","#00522e","#00532f","#00542f","#005530","#005730","#005830","#005931","#005a31","#005b32","#005c32","#005d33","#005e33","#005f34","#006034","#006234","#006335","#006435","#006536","#006636","#006737","#006837","#016937","#026a38","#036b38","#056c39","#066d39","#076d39","#086e3a","#096f3a","#0a703a","#0b713b","#0c723b","#0d733c","#0e743c","#10743c","#11753d","#12763d","#13773d","#14783e","#15793e","#167a3f","#177b3f","#187b3f","#197c40","#1a7d40","#1c7e40","#1d7f41","#1e8041","#1f8142","#208242","#218242","#228343","#238443","#248644","#258745","#268846","#278946","#288a47","#298c48","#2a8d49","#2b8e4a","#2c8f4b","#2d914b","#2e924c","#2f934d","#2f944e","#30954f","#31974f","#329850","#339951","#349a52","#359c53","#369d54","#379e54","#389f55","#39a056","#3aa257","#3ba358","#3ca458","#3da559","#3ea75a","#3fa85b","#3fa95c","#40aa5c","#42ab5d","#43ac5e","#45ad5f","#47ae60","#49af61","#4ab062","#4cb063","#4eb163","#4fb264","#51b365","#53b466","#55b567","#56b568","#58b669","#5ab76a","#5cb86b","#5db96b","#5fba6c","#61bb6d","#62bb6e","#64bc6f","#66bd70","#68be71","#69bf72","#6bc072","#6dc073","#6fc174","#70c275","#72c376","#74c477","#75c578","#77c679","#79c679","#7ac77a","#7cc87b","#7ec97b","#7fc97c","#81ca7d","#83cb7d","#84cb7e","#86cc7f","#88cd7f","#89ce80","#8bce81","#8dcf81","#8ed082","#90d083","#92d183","#93d284","#95d385","#97d385","#98d486","#9ad587","#9cd687","#9dd688","#9fd788","#a1d889","#a2d88a","#a4d98a","#a6da8b","#a7db8c","#a9db8c","#abdc8d","#acdd8e","#aedd8e","#afde8f","#b1df90","#b2df90","#b3e091","#b5e092","#b6e192","#b8e293","#b9e294","#bae394","#bce395","#bde496","#bee596","#c0e597","#c1e698","#c3e698","#c4e799","#c5e89a","#c7e89a","#c8e99b","#c9e99c","#cbea9c","#ccea9d","#ceeb9e","#cfec9e","#d0ec9f","#d2eda0","#d3eda0","#d5eea1","#d6efa2","#d7efa2","#d9f0a3","#daf0a4","#dbf1a4","#dcf1a5","#ddf1a6","#ddf2a6","#def2a7","#dff3a8","#e0f3a8","#e1f3a9","#e2f4aa","#e3f4aa","#e4f4ab","#e5f5ac","#e6f5ac","#e7f6ad","#e8f6ae","#e9f6af","#eaf7af","#ebf7b0","#ecf7b1","#edf8b1","#edf8b2","#eef9b3","#eff9b3","#f0f9b4","#f1fab5","#f2fab5","#f3fab6","#f4fbb7","#f5fbb8","#f6fcb8","#f7fcb9","#f7fcba","#f7fcbc","#f8fcbd","#f8fcbe","#f8fcc0","#f8fdc1","#f9fdc2","#f9fdc4","#f9fdc5","#f9fdc7","#fafdc8","#fafdc9","#fafdcb","#fafdcc","#fbfdce","#fbfdcf","#fbfed0","#fbfed2","#fcfed3","#fcfed4","#fcfed6","#fcfed7","#fdfed9","#fdfeda","#fdfedb","#fdfedd","#feffde","#feffdf","#feffe1","#feffe2","#ffffe4","#ffffe5"],c.YlOrBr=["#ffffe5","#ffffe4","#fffee2","#fffee1","#fffee0","#fffedf","#fffddd","#fffddc","#fffddb","#fffdd9","#fffcd8","#fffcd7","#fffcd6","#fffcd4","#fffbd3","#fffbd2","#fffbd0","#fffbcf","#ffface","#fffacd","#fffacb","#fffaca","#fff9c9","#fff9c7","#fff9c6","#fff9c5","#fff8c4","#fff8c2","#fff8c1","#fff8c0","#fff7be","#fff7bd","#fff7bc","#fff6ba","#fff6b9","#fff5b8","#fff4b6","#fff4b5","#fff3b4","#fff3b2","#fff2b1","#fff1b0","#fff1ae","#fff0ad","#ffefac","#ffefaa","#ffeea9","#ffeea8","#feeda6","#feeca5","#feeca4","#feeba2","#feeaa1","#feeaa0","#fee99e","#fee89d","#fee89b","#fee79a","#fee799","#fee697","#fee596","#fee595","#fee493","#fee392","#fee390","#fee28e","#fee18c","#fee08a","#fedf88","#fede86","#fedd84","#fedc82","#fedb80","#feda7e","#fed97c","#fed87a","#fed778","#fed676","#fed573","#fed471","#fed36f","#fed26d","#fed16b","#fed069","#fecf67","#fece65","#fecd63","#fecc61","#fecb5f","#feca5d","#fec95b","#fec859","#fec857","#fec754","#fec652","#fec550","#fec34f","#fec24d","#fec14c","#febf4b","#febe4a","#febd49","#febb47","#feba46","#feb945","#feb744","#feb643","#feb541","#feb340","#feb23f","#feb13e","#feaf3d","#feae3b","#fead3a","#feab39","#feaa38","#fea937","#fea736","#fea634","#fea433","#fea332","#fea231","#fea030","#fe9f2e","#fe9e2d","#fe9c2c","#fe9b2b","#fe9a2a","#fe9829","#fd9728","#fd9627","#fc9427","#fb9326","#fb9225","#fa9125","#fa8f24","#f98e23","#f98d23","#f88b22","#f88a21","#f78921","#f68820","#f6861f","#f5851f","#f5841e","#f4821d","#f4811d","#f3801c","#f27f1b","#f27d1b","#f17c1a","#f17b1a","#f07919","#f07818","#ef7718","#ee7617","#ee7416","#ed7316","#ed7215","#ec7014","#eb6f14","#ea6e13","#e96d13","#e86c12","#e76b11","#e66a11","#e56910","#e46710","#e3660f","#e2650f","#e1640e","#e0630d","#df620d","#de610c","#dd5f0c","#dc5e0b","#db5d0b","#da5c0a","#d95b09","#d85a09","#d75908","#d65808","#d55607","#d45507","#d35406","#d25306","#d15205","#d05104","#cf5004","#ce4f03","#cd4d03","#cc4c02","#cb4b02","#c94b02","#c84a02","#c64902","#c44802","#c34802","#c14702","#c04602","#be4503","#bc4503","#bb4403","#b94303","#b84203","#b64203","#b44103","#b34003","#b13f03","#b03f03","#ae3e03","#ac3d03","#ab3c03","#a93c03","#a83b03","#a63a03","#a43904","#a33904","#a13804","#a03704","#9e3604","#9c3604","#9b3504","#993404","#983404","#963304","#943304","#933204","#913204","#903104","#8e3104","#8c3004","#8b3005","#892f05","#882f05","#862e05","#842e05","#832d05","#812d05","#802d05","#7e2c05","#7c2c05","#7b2b05","#792b05","#782a05","#762a05","#742905","#732905","#712806","#702806","#6e2706","#6c2706","#6b2606","#692606","#682506","#662506"],c.YlOrBr_r=["#662506","#682506","#692606","#6b2606","#6c2706","#6e2706","#702806","#712806","#732905","#742905","#762a05","#782a05","#792b05","#7b2b05","#7c2c05","#7e2c05","#802d05","#812d05","#832d05","#842e05","#862e05","#882f05","#892f05","#8b3005","#8c3004","#8e3104","#903104","#913204","#933204","#943304","#963304","#983404","#993404","#9b3504","#9c3604","#9e3604","#a03704","#a13804","#a33904","#a43904","#a63a03","#a83b03","#a93c03","#ab3c03","#ac3d03","#ae3e03","#b03f03","#b13f03","#b34003","#b44103","#b64203","#b84203","#b94303","#bb4403","#bc4503","#be4503","#c04602","#c14702","#c34802","#c44802","#c64902","#c84a02","#c94b02","#cb4b02","#cc4c02","#cd4d03","#ce4f03","#cf5004","#d05104","#d15205","#d25306","#d35406","#d45507","#d55607","#d65808","#d75908","#d85a09","#d95b09","#da5c0a","#db5d0b","#dc5e0b","#dd5f0c","#de610c","#df620d","#e0630d","#e1640e","#e2650f","#e3660f","#e46710","#e56910","#e66a11","#e76b11","#e86c12","#e96d13","#ea6e13","#eb6f14","#ec7014","#ed7215","#ed7316","#ee7416","#ee7617","#ef7718","#f07818","#f07919","#f17b1a","#f17c1a","#f27d1b","#f27f1b","#f3801c","#f4811d","#f4821d","#f5841e","#f5851f","#f6861f","#f68820","#f78921","#f88a21","#f88b22","#f98d23","#f98e23","#fa8f24","#fa9125","#fb9225","#fb9326","#fc9427","#fd9627","#fd9728","#fe9829","#fe9a2a","#fe9b2b","#fe9c2c","#fe9e2d","#fe9f2e","#fea030","#fea231","#fea332","#fea433","#fea634","#fea736","#fea937","#feaa38","#feab39","#fead3a","#feae3b","#feaf3d","#feb13e","#feb23f","#feb340","#feb541","#feb643","#feb744","#feb945","#feba46","#febb47","#febd49","#febe4a","#febf4b","#fec14c","#fec24d","#fec34f","#fec550","#fec652","#fec754","#fec857","#fec859","#fec95b","#feca5d","#fecb5f","#fecc61","#fecd63","#fece65","#fecf67","#fed069","#fed16b","#fed26d","#fed36f","#fed471","#fed573","#fed676","#fed778","#fed87a","#fed97c","#feda7e","#fedb80","#fedc82","#fedd84","#fede86","#fedf88","#fee08a","#fee18c","#fee28e","#fee390","#fee392","#fee493","#fee595","#fee596","#fee697","#fee799","#fee79a","#fee89b","#fee89d","#fee99e","#feeaa0","#feeaa1","#feeba2","#feeca4","#feeca5","#feeda6","#ffeea8","#ffeea9","#ffefaa","#ffefac","#fff0ad","#fff1ae","#fff1b0","#fff2b1","#fff3b2","#fff3b4","#fff4b5","#fff4b6","#fff5b8","#fff6b9","#fff6ba","#fff7bc","#fff7bd","#fff7be","#fff8c0","#fff8c1","#fff8c2","#fff8c4","#fff9c5","#fff9c6","#fff9c7","#fff9c9","#fffaca","#fffacb","#fffacd","#ffface","#fffbcf","#fffbd0","#fffbd2","#fffbd3","#fffcd4","#fffcd6","#fffcd7","#fffcd8","#fffdd9","#fffddb","#fffddc","#fffddd","#fffedf","#fffee0","#fffee1","#fffee2","#ffffe4","#ffffe5"],c.YlOrRd=["#ffffcc","#fffecb","#fffec9","#fffdc8","#fffdc6","#fffcc5","#fffcc4","#fffbc2","#fffac1","#fffac0","#fff9be","#fff9bd","#fff8bb","#fff8ba","#fff7b9","#fff7b7","#fff6b6","#fff5b5","#fff5b3","#fff4b2","#fff4b0","#fff3af","#fff3ae","#fff2ac","#fff1ab","#fff1a9","#fff0a8","#fff0a7","#ffefa5","#ffefa4","#ffeea3","#ffeda1","#ffeda0","#ffec9f","#ffec9d","#ffeb9c","#ffea9b","#ffea99","#ffe998","#ffe997","#ffe895","#ffe794","#ffe793","#ffe691","#ffe590","#ffe58f","#ffe48d","#ffe48c","#fee38b","#fee289","#fee288","#fee187","#fee085","#fee084","#fedf83","#fede82","#fede80","#fedd7f","#fedd7e","#fedc7c","#fedb7b","#fedb7a","#feda78","#fed977","#fed976","#fed774","#fed673","#fed572","#fed470","#fed36f","#fed16e","#fed06c","#fecf6b","#fece6a","#fecc68","#fecb67","#feca66","#fec965","#fec863","#fec662","#fec561","#fec45f","#fec35e","#fec15d","#fec05b","#febf5a","#febe59","#febd57","#febb56","#feba55","#feb953","#feb852","#feb651","#feb54f","#feb44e","#feb34d","#feb24c","#feb04b","#feaf4b","#feae4a","#fead4a","#feac49","#feab49","#fea948","#fea848","#fea747","#fea647","#fea546","#fea446","#fea245","#fea145","#fea044","#fd9f44","#fd9e43","#fd9d43","#fd9c42","#fd9a42","#fd9941","#fd9841","#fd9740","#fd9640","#fd953f","#fd933f","#fd923e","#fd913e","#fd903d","#fd8f3d","#fd8e3c","#fd8c3c","#fd8a3b","#fd883b","#fd863a","#fd8439","#fd8239","#fd8038","#fd7e38","#fd7c37","#fd7a37","#fd7836","#fd7636","#fd7435","#fd7234","#fd7034","#fd6e33","#fc6c33","#fc6a32","#fc6832","#fc6631","#fc6430","#fc6330","#fc612f","#fc5f2f","#fc5d2e","#fc5b2e","#fc592d","#fc572c","#fc552c","#fc532b","#fc512b","#fc4f2a","#fc4d2a","#fb4b29","#fa4a29","#f94828","#f84628","#f84528","#f74327","#f64227","#f54026","#f43e26","#f43d25","#f33b25","#f23924","#f13824","#f13624","#f03523","#ef3323","#ee3122","#ed3022","#ed2e21","#ec2c21","#eb2b21","#ea2920","#e92720","#e9261f","#e8241f","#e7231e","#e6211e","#e61f1d","#e51e1d","#e41c1d","#e31a1c","#e2191c","#e1191d","#e0181d","#df171d","#dd161d","#dc151e","#db141e","#da141e","#d9131f","#d7121f","#d6111f","#d51020","#d41020","#d30f20","#d10e21","#d00d21","#cf0c21","#ce0c22","#cd0b22","#cb0a22","#ca0923","#c90823","#c80723","#c70723","#c50624","#c40524","#c30424","#c20325","#c10325","#c00225","#be0126","#bd0026","#bb0026","#b90026","#b70026","#b60026","#b40026","#b20026","#b00026","#ae0026","#ac0026","#aa0026","#a80026","#a60026","#a40026","#a20026","#a10026","#9f0026","#9d0026","#9b0026","#990026","#970026","#950026","#930026","#910026","#8f0026","#8d0026","#8b0026","#8a0026","#880026","#860026","#840026","#820026","#800026"],c.YlOrRd_r=["#800026","#820026","#840026","#860026","#880026","#8a0026","#8b0026","#8d0026","#8f0026","#910026","#930026","#950026","#970026","#990026","#9b0026","#9d0026","#9f0026","#a10026","#a20026","#a40026","#a60026","#a80026","#aa0026","#ac0026","#ae0026","#b00026","#b20026","#b40026","#b60026","#b70026","#b90026","#bb0026","#bd0026","#be0126","#c00225","#c10325","#c20325","#c30424","#c40524","#c50624","#c70723","#c80723","#c90823","#ca0923","#cb0a22","#cd0b22","#ce0c22","#cf0c21","#d00d21","#d10e21","#d30f20","#d41020","#d51020","#d6111f","#d7121f","#d9131f","#da141e","#db141e","#dc151e","#dd161d","#df171d","#e0181d","#e1191d","#e2191c","#e31a1c","#e41c1d","#e51e1d","#e61f1d","#e6211e","#e7231e","#e8241f","#e9261f","#e92720","#ea2920","#eb2b21","#ec2c21","#ed2e21","#ed3022","#ee3122","#ef3323","#f03523","#f13624","#f13824","#f23924","#f33b25","#f43d25","#f43e26","#f54026","#f64227","#f74327","#f84528","#f84628","#f94828","#fa4a29","#fb4b29","#fc4d2a","#fc4f2a","#fc512b","#fc532b","#fc552c","#fc572c","#fc592d","#fc5b2e","#fc5d2e","#fc5f2f","#fc612f","#fc6330","#fc6430","#fc6631","#fc6832","#fc6a32","#fc6c33","#fd6e33","#fd7034","#fd7234","#fd7435","#fd7636","#fd7836","#fd7a37","#fd7c37","#fd7e38","#fd8038","#fd8239","#fd8439","#fd863a","#fd883b","#fd8a3b","#fd8c3c","#fd8e3c","#fd8f3d","#fd903d","#fd913e","#fd923e","#fd933f","#fd953f","#fd9640","#fd9740","#fd9841","#fd9941","#fd9a42","#fd9c42","#fd9d43","#fd9e43","#fd9f44","#fea044","#fea145","#fea245","#fea446","#fea546","#fea647","#fea747","#fea848","#fea948","#feab49","#feac49","#fead4a","#feae4a","#feaf4b","#feb04b","#feb24c","#feb34d","#feb44e","#feb54f","#feb651","#feb852","#feb953","#feba55","#febb56","#febd57","#febe59","#febf5a","#fec05b","#fec15d","#fec35e","#fec45f","#fec561","#fec662","#fec863","#fec965","#feca66","#fecb67","#fecc68","#fece6a","#fecf6b","#fed06c","#fed16e","#fed36f","#fed470","#fed572","#fed673","#fed774","#fed976","#fed977","#feda78","#fedb7a","#fedb7b","#fedc7c","#fedd7e","#fedd7f","#fede80","#fede82","#fedf83","#fee084","#fee085","#fee187","#fee288","#fee289","#fee38b","#ffe48c","#ffe48d","#ffe58f","#ffe590","#ffe691","#ffe793","#ffe794","#ffe895","#ffe997","#ffe998","#ffea99","#ffea9b","#ffeb9c","#ffec9d","#ffec9f","#ffeda0","#ffeda1","#ffeea3","#ffefa4","#ffefa5","#fff0a7","#fff0a8","#fff1a9","#fff1ab","#fff2ac","#fff3ae","#fff3af","#fff4b0","#fff4b2","#fff5b3","#fff5b5","#fff6b6","#fff7b7","#fff7b9","#fff8ba","#fff8bb","#fff9bd","#fff9be","#fffac0","#fffac1","#fffbc2","#fffcc4","#fffcc5","#fffdc6","#fffdc8","#fffec9","#fffecb","#ffffcc"],c.afmhot=["#000000","#020000","#040000","#060000","#080000","#0a0000","#0c0000","#0e0000","#100000","#120000","#140000","#160000","#180000","#1a0000","#1c0000","#1e0000","#200000","#220000","#240000","#260000","#280000","#2a0000","#2c0000","#2e0000","#300000","#320000","#340000","#360000","#380000","#3a0000","#3c0000","#3e0000","#400000","#420000","#440000","#460000","#480000","#4a0000","#4c0000","#4e0000","#500000","#520000","#540000","#560000","#580000","#5a0000","#5c0000","#5e0000","#600000","#620000","#640000","#660000","#680000","#6a0000","#6c0000","#6e0000","#700000","#720000","#740000","#760000","#780000","#7a0000","#7c0000","#7e0000","#800000","#820200","#840400","#860700","#880800","#8a0a00","#8c0d00","#8e0f00","#901000","#921200","#941400","#961700","#981800","#9a1a00","#9c1d00","#9e1f00","#a02000","#a22200","#a42400","#a62700","#a82800","#aa2a00","#ac2d00","#ae2f00","#b03000","#b23200","#b43400","#b63700","#b83800","#ba3a00","#bc3d00","#be3f00","#c04000","#c24200","#c44400","#c64600","#c84800","#ca4a00","#cc4d00","#ce4e00","#d05000","#d25200","#d45400","#d65600","#d85800","#da5a00","#dc5d00","#de5e00","#e06000","#e26200","#e46400","#e66600","#e86800","#ea6a00","#ec6d00","#ee6e00","#f07000","#f27200","#f47400","#f67600","#f87800","#fa7a00","#fc7d00","#fe7e00","#ff8001","#ff8203","#ff8405","#ff8607","#ff8809","#ff8b0b","#ff8c0d","#ff8e0f","#ff9011","#ff9213","#ff9415","#ff9617","#ff9919","#ff9b1b","#ff9c1d","#ff9e1f","#ffa021","#ffa223","#ffa425","#ffa627","#ffa829","#ffab2b","#ffac2d","#ffae2f","#ffb031","#ffb233","#ffb435","#ffb637","#ffb939","#ffbb3b","#ffbc3d","#ffbe3f","#ffc041","#ffc243","#ffc445","#ffc647","#ffc849","#ffcb4b","#ffcc4d","#ffce4f","#ffd051","#ffd253","#ffd455","#ffd657","#ffd959","#ffdb5b","#ffdc5d","#ffde5f","#ffe061","#ffe263","#ffe465","#ffe667","#ffe869","#ffeb6b","#ffec6d","#ffee6f","#fff071","#fff273","#fff475","#fff677","#fff979","#fffb7b","#fffc7d","#fffe7f","#ffff81","#ffff83","#ffff85","#ffff87","#ffff89","#ffff8b","#ffff8d","#ffff8f","#ffff91","#ffff93","#ffff95","#ffff97","#ffff99","#ffff9b","#ffff9d","#ffff9f","#ffffa1","#ffffa3","#ffffa5","#ffffa7","#ffffa9","#ffffab","#ffffad","#ffffaf","#ffffb1","#ffffb3","#ffffb5","#ffffb7","#ffffb9","#ffffbb","#ffffbd","#ffffbf","#ffffc1","#ffffc3","#ffffc5","#ffffc7","#ffffc9","#ffffcb","#ffffcd","#ffffcf","#ffffd1","#ffffd3","#ffffd5","#ffffd7","#ffffd9","#ffffdb","#ffffdd","#ffffdf","#ffffe1","#ffffe3","#ffffe5","#ffffe7","#ffffe9","#ffffeb","#ffffed","#ffffef","#fffff1","#fffff3","#fffff5","#fffff7","#fffff9","#fffffb","#fffffd","#ffffff"],c.afmhot_r=["#ffffff","#fffffd","#fffffb","#fffff9","#fffff7","#fffff5","#fffff3","#fffff1","#ffffef","#ffffed","#ffffeb","#ffffe9","#ffffe7","#ffffe5","#ffffe3","#ffffe1","#ffffdf","#ffffdd","#ffffdb","#ffffd9","#ffffd7","#ffffd5","#ffffd3","#ffffd1","#ffffcf","#ffffcd","#ffffcb","#ffffc9","#ffffc7","#ffffc5","#ffffc3","#ffffc1","#ffffbf","#ffffbd","#ffffbb","#ffffb9","#ffffb7","#ffffb5","#ffffb3","#ffffb1","#ffffaf","#ffffad","#ffffab","#ffffa9","#ffffa7","#ffffa5","#ffffa3","#ffffa1","#ffff9f","#ffff9d","#ffff9b","#ffff99","#ffff97","#ffff95","#ffff93","#ffff91","#ffff8f","#ffff8d","#ffff8b","#ffff89","#ffff87","#ffff85","#ffff83","#ffff81","#fffe7f","#fffc7d","#fffb7b","#fff979","#fff777","#fff575","#fff273","#fff071","#ffee6f","#ffec6d","#ffeb6b","#ffe869","#ffe667","#ffe465","#ffe263","#ffe061","#ffde5f","#ffdc5d","#ffdb5b","#ffd959","#ffd757","#ffd555","#ffd253","#ffd051","#ffce4f","#ffcc4d","#ffcb4b","#ffc849","#ffc647","#ffc445","#ffc243","#ffc041","#ffbe3f","#ffbc3d","#ffbb3b","#ffb939","#ffb737","#ffb535","#ffb233","#ffb031","#ffae2f","#ffac2d","#ffab2b","#ffa829","#ffa627","#ffa425","#ffa223","#ffa021","#ff9e1f","#ff9c1d","#ff9b1b","#ff9919","#ff9717","#ff9515","#ff9213","#ff9011","#ff8e0f","#ff8c0d","#ff8b0b","#ff8809","#ff8607","#ff8405","#ff8203","#ff8001","#fe7e00","#fc7d00","#fa7b00","#f87900","#f67700","#f47400","#f27200","#f07000","#ee6e00","#ec6d00","#ea6b00","#e86900","#e66600","#e46400","#e26200","#e06000","#de5e00","#dc5d00","#da5b00","#d85900","#d65700","#d45400","#d25200","#d05000","#ce4e00","#cc4d00","#ca4b00","#c84900","#c64600","#c44400","#c24200","#c04000","#be3f00","#bc3d00","#ba3b00","#b83900","#b63700","#b43400","#b23200","#b03000","#ae2f00","#ac2d00","#aa2b00","#a82900","#a62600","#a42400","#a22200","#a02000","#9e1f00","#9c1d00","#9a1b00","#981900","#961700","#941400","#921200","#901000","#8e0f00","#8c0d00","#8a0b00","#880900","#860600","#840400","#820200","#800000","#7e0000","#7c0000","#7a0000","#780000","#760000","#740000","#720000","#700000","#6e0000","#6c0000","#6a0000","#680000","#660000","#640000","#620000","#600000","#5e0000","#5c0000","#5a0000","#580000","#560000","#540000","#520000","#500000","#4e0000","#4c0000","#4a0000","#480000","#460000","#440000","#420000","#400000","#3e0000","#3c0000","#3a0000","#380000","#360000","#340000","#320000","#300000","#2e0000","#2c0000","#2a0000","#280000","#260000","#240000","#220000","#200000","#1e0000","#1c0000","#1a0000","#180000","#160000","#140000","#120000","#100000","#0e0000","#0c0000","#0a0000","#080000","#060000","#040000","#020000","#000000"],c.autumn=["#ff0000","#ff0100","#ff0200","#ff0300","#ff0400","#ff0500","#ff0600","#ff0700","#ff0800","#ff0900","#ff0a00","#ff0b00","#ff0c00","#ff0d00","#ff0e00","#ff0f00","#ff1000","#ff1100","#ff1200","#ff1300","#ff1400","#ff1500","#ff1600","#ff1700","#ff1800","#ff1900","#ff1a00","#ff1b00","#ff1c00","#ff1d00","#ff1e00","#ff1f00","#ff2000","#ff2100","#ff2200","#ff2300","#ff2400","#ff2500","#ff2600","#ff2700","#ff2800","#ff2900","#ff2a00","#ff2b00","#ff2c00","#ff2d00","#ff2e00","#ff2f00","#ff3000","#ff3100","#ff3200","#ff3300","#ff3400","#ff3500","#ff3600","#ff3700","#ff3800","#ff3900","#ff3a00","#ff3b00","#ff3c00","#ff3d00","#ff3e00","#ff3f00","#ff4000","#ff4100","#ff4200","#ff4300","#ff4400","#ff4500","#ff4600","#ff4700","#ff4800","#ff4900","#ff4a00","#ff4b00","#ff4c00","#ff4d00","#ff4e00","#ff4f00","#ff5000","#ff5100","#ff5200","#ff5300","#ff5400","#ff5500","#ff5600","#ff5700","#ff5800","#ff5900","#ff5a00","#ff5b00","#ff5c00","#ff5d00","#ff5e00","#ff5f00","#ff6000","#ff6100","#ff6200","#ff6300","#ff6400","#ff6500","#ff6600","#ff6700","#ff6800","#ff6900","#ff6a00","#ff6b00","#ff6c00","#ff6d00","#ff6e00","#ff6f00","#ff7000","#ff7100","#ff7200","#ff7300","#ff7400","#ff7500","#ff7600","#ff7700","#ff7800","#ff7900","#ff7a00","#ff7b00","#ff7c00","#ff7d00","#ff7e00","#ff7f00","#ff8000","#ff8100","#ff8200","#ff8300","#ff8400","#ff8500","#ff8600","#ff8700","#ff8800","#ff8900","#ff8a00","#ff8b00","#ff8c00","#ff8d00","#ff8e00","#ff8f00","#ff9000","#ff9100","#ff9200","#ff9300","#ff9400","#ff9500","#ff9600","#ff9700","#ff9800","#ff9900","#ff9a00","#ff9b00","#ff9c00","#ff9d00","#ff9e00","#ff9f00","#ffa000","#ffa100","#ffa200","#ffa300","#ffa400","#ffa500","#ffa600","#ffa700","#ffa800","#ffa900","#ffaa00","#ffab00","#ffac00","#ffad00","#ffae00","#ffaf00","#ffb000","#ffb100","#ffb200","#ffb300","#ffb400","#ffb500","#ffb600","#ffb700","#ffb800","#ffb900","#ffba00","#ffbb00","#ffbc00","#ffbd00","#ffbe00","#ffbf00","#ffc000","#ffc100","#ffc200","#ffc300","#ffc400","#ffc500","#ffc600","#ffc700","#ffc800","#ffc900","#ffca00","#ffcb00","#ffcc00","#ffcd00","#ffce00","#ffcf00","#ffd000","#ffd100","#ffd200","#ffd300","#ffd400","#ffd500","#ffd600","#ffd700","#ffd800","#ffd900","#ffda00","#ffdb00","#ffdc00","#ffdd00","#ffde00","#ffdf00","#ffe000","#ffe100","#ffe200","#ffe300","#ffe400","#ffe500","#ffe600","#ffe700","#ffe800","#ffe900","#ffea00","#ffeb00","#ffec00","#ffed00","#ffee00","#ffef00","#fff000","#fff100","#fff200","#fff300","#fff400","#fff500","#fff600","#fff700","#fff800","#fff900","#fffa00","#fffb00","#fffc00","#fffd00","#fffe00","#ffff00"],c.autumn_r=["#ffff00","#fffe00","#fffd00","#fffc00","#fffb00","#fffa00","#fff900","#fff800","#fff700","#fff600","#fff500","#fff400","#fff300","#fff200","#fff100","#fff000","#ffef00","#ffee00","#ffed00","#ffec00","#ffeb00","#ffea00","#ffe900","#ffe800","#ffe700","#ffe600","#ffe500","#ffe400","#ffe300","#ffe200","#ffe100","#ffe000","#ffdf00","#ffde00","#ffdd00","#ffdc00","#ffdb00","#ffda00","#ffd900","#ffd800","#ffd700","#ffd600","#ffd500","#ffd400","#ffd300","#ffd200","#ffd100","#ffd000","#ffcf00","#ffce00","#ffcd00","#ffcc00","#ffcb00","#ffca00","#ffc900","#ffc800","#ffc700","#ffc600","#ffc500","#ffc400","#ffc300","#ffc200","#ffc100","#ffc000","#ffbf00","#ffbe00","#ffbd00","#ffbc00","#ffbb00","#ffba00","#ffb900","#ffb800","#ffb700","#ffb600","#ffb500","#ffb400","#ffb300","#ffb200","#ffb100","#ffb000","#ffaf00","#ffae00","#ffad00","#ffac00","#ffab00","#ffaa00","#ffa900","#ffa800","#ffa700","#ffa600","#ffa500","#ffa400","#ffa300","#ffa200","#ffa100","#ffa000","#ff9f00","#ff9e00","#ff9d00","#ff9c00","#ff9b00","#ff9a00","#ff9900","#ff9800","#ff9700","#ff9600","#ff9500","#ff9400","#ff9300","#ff9200","#ff9100","#ff9000","#ff8f00","#ff8e00","#ff8d00","#ff8c00","#ff8b00","#ff8a00","#ff8900","#ff8800","#ff8700","#ff8600","#ff8500","#ff8400","#ff8300","#ff8200","#ff8100","#ff8000","#ff7f00","#ff7e00","#ff7d00","#ff7c00","#ff7b00","#ff7a00","#ff7900","#ff7800","#ff7700","#ff7600","#ff7500","#ff7400","#ff7300","#ff7200","#ff7100","#ff7000","#ff6f00","#ff6e00","#ff6d00","#ff6c00","#ff6b00","#ff6a00","#ff6900","#ff6800","#ff6700","#ff6600","#ff6500","#ff6400","#ff6300","#ff6200","#ff6100","#ff6000","#ff5f00","#ff5e00","#ff5d00","#ff5c00","#ff5b00","#ff5a00","#ff5900","#ff5800","#ff5700","#ff5600","#ff5500","#ff5400","#ff5300","#ff5200","#ff5100","#ff5000","#ff4f00","#ff4e00","#ff4d00","#ff4c00","#ff4b00","#ff4a00","#ff4900","#ff4800","#ff4700","#ff4600","#ff4500","#ff4400","#ff4300","#ff4200","#ff4100","#ff4000","#ff3f00","#ff3e00","#ff3d00","#ff3c00","#ff3b00","#ff3a00","#ff3900","#ff3800","#ff3700","#ff3600","#ff3500","#ff3400","#ff3300","#ff3200","#ff3100","#ff3000","#ff2f00","#ff2e00","#ff2d00","#ff2c00","#ff2b00","#ff2a00","#ff2900","#ff2800","#ff2700","#ff2600","#ff2500","#ff2400","#ff2300","#ff2200","#ff2100","#ff2000","#ff1f00","#ff1e00","#ff1d00","#ff1c00","#ff1b00","#ff1a00","#ff1900","#ff1800","#ff1700","#ff1600","#ff1500","#ff1400","#ff1300","#ff1200","#ff1100","#ff1000","#ff0f00","#ff0e00","#ff0d00","#ff0c00","#ff0b00","#ff0a00","#ff0900","#ff0800","#ff0700","#ff0600","#ff0500","#ff0400","#ff0300","#ff0200","#ff0100","#ff0000"],c.binary=["#ffffff","#fefefe","#fdfdfd","#fcfcfc","#fbfbfb","#fafafa","#f9f9f9","#f8f8f8","#f7f7f7","#f6f6f6","#f5f5f5","#f4f4f4","#f3f3f3","#f2f2f2","#f1f1f1","#f0f0f0","#efefef","#eeeeee","#ededed","#ececec","#ebebeb","#eaeaea","#e9e9e9","#e8e8e8","#e7e7e7","#e6e6e6","#e5e5e5","#e4e4e4","#e3e3e3","#e2e2e2","#e1e1e1","#e0e0e0","#dfdfdf","#dedede","#dddddd","#dcdcdc","#dbdbdb","#dadada","#d9d9d9","#d8d8d8","#d7d7d7","#d6d6d6","#d5d5d5","#d4d4d4","#d3d3d3","#d2d2d2","#d1d1d1","#d0d0d0","#cfcfcf","#cecece","#cdcdcd","#cccccc","#cbcbcb","#cacaca","#c9c9c9","#c8c8c8","#c7c7c7","#c6c6c6","#c5c5c5","#c4c4c4","#c3c3c3","#c2c2c2","#c1c1c1","#c0c0c0","#bfbfbf","#bebebe","#bdbdbd","#bcbcbc","#bbbbbb","#bababa","#b9b9b9","#b8b8b8","#b7b7b7","#b6b6b6","#b5b5b5","#b4b4b4","#b3b3b3","#b2b2b2","#b1b1b1","#b0b0b0","#afafaf","#aeaeae","#adadad","#acacac","#ababab","#aaaaaa","#a9a9a9","#a8a8a8","#a7a7a7","#a6a6a6","#a5a5a5","#a4a4a4","#a3a3a3","#a2a2a2","#a1a1a1","#a0a0a0","#9f9f9f","#9e9e9e","#9d9d9d","#9c9c9c","#9b9b9b","#9a9a9a","#999999","#989898","#979797","#969696","#959595","#949494","#939393","#929292","#919191","#909090","#8f8f8f","#8e8e8e","#8d8d8d","#8c8c8c","#8b8b8b","#8a8a8a","#898989","#888888","#878787","#868686","#858585","#848484","#838383","#828282","#818181","#808080","#7f7f7f","#7e7e7e","#7d7d7d","#7c7c7c","#7b7b7b","#7a7a7a","#797979","#787878","#777777","#767676","#757575","#747474","#737373","#727272","#717171","#707070","#6f6f6f","#6e6e6e","#6d6d6d","#6c6c6c","#6b6b6b","#6a6a6a","#696969","#686868","#676767","#666666","#656565","#646464","#636363","#626262","#616161","#606060","#5f5f5f","#5e5e5e","#5d5d5d","#5c5c5c","#5b5b5b","#5a5a5a","#595959","#585858","#575757","#565656","#555555","#545454","#535353","#525252","#515151","#505050","#4f4f4f","#4e4e4e","#4d4d4d","#4c4c4c","#4b4b4b","#4a4a4a","#494949","#484848","#474747","#464646","#454545","#444444","#434343","#424242","#414141","#404040","#3f3f3f","#3e3e3e","#3d3d3d","#3c3c3c","#3b3b3b","#3a3a3a","#393939","#383838","#373737","#363636","#353535","#343434","#333333","#323232","#313131","#303030","#2f2f2f","#2e2e2e","#2d2d2d","#2c2c2c","#2b2b2b","#2a2a2a","#292929","#282828","#272727","#262626","#252525","#242424","#232323","#222222","#212121","#202020","#1f1f1f","#1e1e1e","#1d1d1d","#1c1c1c","#1b1b1b","#1a1a1a","#191919","#181818","#171717","#161616","#151515","#141414","#131313","#121212","#111111","#101010","#0f0f0f","#0e0e0e","#0d0d0d","#0c0c0c","#0b0b0b","#0a0a0a","#090909","#080808","#070707","#060606","#050505","#040404","#030303","#020202","#010101","#000000"],c.binary_r=["#000000","#010101","#020202","#030303","#040404","#050505","#060606","#070707","#080808","#090909","#0a0a0a","#0b0b0b","#0c0c0c","#0d0d0d","#0e0e0e","#0f0f0f","#101010","#111111","#121212","#131313","#141414","#151515","#161616","#171717","#181818","#191919","#1a1a1a","#1b1b1b","#1c1c1c","#1d1d1d","#1e1e1e","#1f1f1f","#202020","#212121","#222222","#232323","#242424","#252525","#262626","#272727","#282828","#292929","#2a2a2a","#2b2b2b","#2c2c2c","#2d2d2d","#2e2e2e","#2f2f2f","#303030","#313131","#323232","#333333","#343434","#353535","#363636","#373737","#383838","#393939","#3a3a3a","#3b3b3b","#3c3c3c","#3d3d3d","#3e3e3e","#3f3f3f","#404040","#414141","#424242","#434343","#444444","#454545","#464646","#474747","#484848","#494949","#4a4a4a","#4b4b4b","#4c4c4c","#4d4d4d","#4e4e4e","#4f4f4f","#505050","#515151","#525252","#535353","#545454","#555555","#565656","#575757","#585858","#595959","#5a5a5a","#5b5b5b","#5c5c5c","#5d5d5d","#5e5e5e","#5f5f5f","#606060","#616161","#626262","#636363","#646464","#656565","#666666","#676767","#686868","#696969","#6a6a6a","#6b6b6b","#6c6c6c","#6d6d6d","#6e6e6e","#6f6f6f","#707070","#717171","#727272","#737373","#747474","#757575","#767676","#777777","#787878","#797979","#7a7a7a","#7b7b7b","#7c7c7c","#7d7d7d","#7e7e7e","#7f7f7f","#808080","#818181","#828282","#838383","#848484","#858585","#868686","#878787","#888888","#898989","#8a8a8a","#8b8b8b","#8c8c8c","#8d8d8d","#8e8e8e","#8f8f8f","#909090","#919191","#929292","#939393","#949494","#959595","#969696","#979797","#989898","#999999","#9a9a9a","#9b9b9b","#9c9c9c","#9d9d9d","#9e9e9e","#9f9f9f","#a0a0a0","#a1a1a1","#a2a2a2","#a3a3a3","#a4a4a4","#a5a5a5","#a6a6a6","#a7a7a7","#a8a8a8","#a9a9a9","#aaaaaa","#ababab","#acacac","#adadad","#aeaeae","#afafaf","#b0b0b0","#b1b1b1","#b2b2b2","#b3b3b3","#b4b4b4","#b5b5b5","#b6b6b6","#b7b7b7","#b8b8b8","#b9b9b9","#bababa","#bbbbbb","#bcbcbc","#bdbdbd","#bebebe","#bfbfbf","#c0c0c0","#c1c1c1","#c2c2c2","#c3c3c3","#c4c4c4","#c5c5c5","#c6c6c6","#c7c7c7","#c8c8c8","#c9c9c9","#cacaca","#cbcbcb","#cccccc","#cdcdcd","#cecece","#cfcfcf","#d0d0d0","#d1d1d1","#d2d2d2","#d3d3d3","#d4d4d4","#d5d5d5","#d6d6d6","#d7d7d7","#d8d8d8","#d9d9d9","#dadada","#dbdbdb","#dcdcdc","#dddddd","#dedede","#dfdfdf","#e0e0e0","#e1e1e1","#e2e2e2","#e3e3e3","#e4e4e4","#e5e5e5","#e6e6e6","#e7e7e7","#e8e8e8","#e9e9e9","#eaeaea","#ebebeb","#ececec","#ededed","#eeeeee","#efefef","#f0f0f0","#f1f1f1","#f2f2f2","#f3f3f3","#f4f4f4","#f5f5f5","#f6f6f6","#f7f7f7","#f8f8f8","#f9f9f9","#fafafa","#fbfbfb","#fcfcfc","#fdfdfd","#fefefe","#ffffff"],c.bone=["#000000","#010101","#020202","#030304","#040305","#040406","#050507","#060609","#07070a","#08080b","#09090c","#0a0a0d","#0a0a0f","#0b0b10","#0c0c11","#0d0d12","#0e0e13","#0f0f15","#101016","#111117","#121118","#12121a","#13131b","#14141c","#15151d","#16161e","#171720","#181821","#181822","#191923","#1a1a25","#1b1b26","#1c1c27","#1d1d28","#1e1e29","#1f1f2b","#201f2c","#20202d","#21212e","#22222f","#232331","#242432","#252533","#262634","#262636","#272737","#282838","#292939","#2a2a3a","#2b2b3c","#2c2c3d","#2d2d3e","#2e2d3f","#2e2e41","#2f2f42","#303043","#313144","#323245","#333347","#343448","#343449","#35354a","#36364b","#37374d","#38384e","#39394f","#3a3a50","#3b3b52","#3c3b53","#3c3c54","#3d3d55","#3e3e56","#3f3f58","#404059","#41415a","#42425b","#42425d","#43435e","#44445f","#454560","#464661","#474763","#484864","#494965","#4a4966","#4a4a67","#4b4b69","#4c4c6a","#4d4d6b","#4e4e6c","#4f4f6e","#50506f","#505070","#515171","#525372","#535473","#545574","#555675","#565776","#575976","#575a77","#585b78","#595c79","#5a5d7a","#5b5f7b","#5c607c","#5d617d","#5e627d","#5e637e","#5f657f","#606680","#616781","#626882","#636983","#646b84","#656c84","#666d85","#666e86","#676f87","#687188","#697289","#6a738a","#6b748b","#6c758b","#6c778c","#6d788d","#6e798e","#6f7a8f","#707b90","#717d91","#727e92","#737f92","#738093","#748194","#758395","#768496","#778597","#788698","#798799","#7a8999","#7a8a9a","#7b8b9b","#7c8c9c","#7d8d9d","#7e8f9e","#7f909f","#8091a0","#8192a0","#8194a1","#8295a2","#8396a3","#8497a4","#8598a5","#869aa6","#879ba7","#889ca7","#889da8","#899ea9","#8aa0aa","#8ba1ab","#8ca2ac","#8da3ad","#8ea4ae","#8fa6ae","#8fa7af","#90a8b0","#91a9b1","#92aab2","#93acb3","#94adb4","#95aeb5","#96afb5","#96b0b6","#97b2b7","#98b3b8","#99b4b9","#9ab5ba","#9bb6bb","#9cb8bc","#9db9bc","#9dbabd","#9ebbbe","#9fbcbf","#a0bec0","#a1bfc1","#a2c0c2","#a3c1c3","#a4c2c3","#a4c4c4","#a5c5c5","#a6c6c6","#a7c7c7","#a9c8c8","#aac9c9","#accaca","#adcaca","#aecbcb","#b0cccc","#b1cdcd","#b2cece","#b4cfcf","#b5d0d0","#b7d1d1","#b8d2d1","#b9d2d2","#bbd3d3","#bcd4d4","#bdd5d5","#bfd6d6","#c0d7d7","#c1d8d8","#c3d8d8","#c4d9d9","#c6dada","#c7dbdb","#c8dcdc","#cadddd","#cbdede","#ccdfdf","#cee0df","#cfe0e0","#d1e1e1","#d2e2e2","#d3e3e3","#d5e4e4","#d6e5e5","#d7e6e6","#d9e6e6","#dae7e7","#dbe8e8","#dde9e9","#deeaea","#e0ebeb","#e1ecec","#e2eded","#e4eeed","#e5eeee","#e6efef","#e8f0f0","#e9f1f1","#eaf2f2","#ecf3f3","#edf4f4","#eff4f4","#f0f5f5","#f1f6f6","#f3f7f7","#f4f8f8","#f5f9f9","#f7fafa","#f8fbfb","#fafcfb","#fbfcfc","#fcfdfd","#fefefe","#ffffff"],c.bone_r=["#ffffff","#fefefe","#fcfdfd","#fbfcfc","#fafcfb","#f8fbfb","#f7fafa","#f5f9f9","#f4f8f8","#f3f7f7","#f1f6f6","#f0f5f5","#eff4f4","#edf4f4","#ecf3f3","#eaf2f2","#e9f1f1","#e8f0f0","#e6efef","#e5eeee","#e4eeed","#e2eded","#e1ecec","#e0ebeb","#deeaea","#dde9e9","#dbe8e8","#dae7e7","#d9e6e6","#d7e6e6","#d6e5e5","#d5e4e4","#d3e3e3","#d2e2e2","#d1e1e1","#cfe0e0","#cee0df","#ccdfdf","#cbdede","#cadddd","#c8dcdc","#c7dbdb","#c6dada","#c4d9d9","#c3d8d8","#c1d8d8","#c0d7d7","#bfd6d6","#bdd5d5","#bcd4d4","#bbd3d3","#b9d2d2","#b8d2d1","#b7d1d1","#b5d0d0","#b4cfcf","#b2cece","#b1cdcd","#b0cccc","#aecbcb","#adcaca","#accaca","#aac9c9","#a9c8c8","#a7c7c7","#a6c6c6","#a5c5c5","#a4c4c4","#a4c2c3","#a3c1c3","#a2c0c2","#a1bfc1","#a0bec0","#9fbcbf","#9ebbbe","#9dbabd","#9db9bc","#9cb8bc","#9bb6bb","#9ab5ba","#99b4b9","#98b3b8","#97b2b7","#96b0b6","#96afb5","#95aeb5","#94adb4","#93acb3","#92aab2","#91a9b1","#90a8b0","#90a7af","#8fa6ae","#8ea4ae","#8da3ad","#8ca2ac","#8ba1ab","#8aa0aa","#899ea9","#889da8","#889ca7","#879ba7","#869aa6","#8598a5","#8497a4","#8396a3","#8295a2","#8294a1","#8192a0","#8091a0","#7f909f","#7e8f9e","#7d8d9d","#7c8c9c","#7b8b9b","#7a8a9a","#7a8999","#798799","#788698","#778597","#768496","#758395","#748194","#738093","#737f92","#727e92","#717d91","#707b90","#6f7a8f","#6e798e","#6d788d","#6c778c","#6c758b","#6b748b","#6a738a","#697289","#687188","#676f87","#666e86","#666d85","#656c84","#646b84","#636983","#626882","#616781","#606680","#5f657f","#5e637e","#5e627d","#5d617d","#5c607c","#5b5f7b","#5a5d7a","#595c79","#585b78","#575a77","#575976","#565776","#555675","#545574","#535473","#525372","#515171","#505070","#50506f","#4f4f6e","#4e4e6c","#4d4d6b","#4c4c6a","#4b4b69","#4a4a67","#494966","#494965","#484864","#474763","#464661","#454560","#44445f","#43435e","#42425d","#42425b","#41415a","#404059","#3f3f58","#3e3e56","#3d3d55","#3c3c54","#3b3b53","#3b3b52","#3a3a50","#39394f","#38384e","#37374d","#36364b","#35354a","#343449","#343448","#333347","#323245","#313144","#303043","#2f2f42","#2e2e41","#2d2d3f","#2d2d3e","#2c2c3d","#2b2b3c","#2a2a3a","#292939","#282838","#272737","#272636","#262634","#252533","#242432","#232331","#22222f","#21212e","#20202d","#201f2c","#1f1f2b","#1e1e29","#1d1d28","#1c1c27","#1b1b26","#1a1a25","#191923","#181822","#181821","#171720","#16161e","#15151d","#14141c","#13131b","#12121a","#111118","#111117","#101016","#0f0f15","#0e0e13","#0d0d12","#0c0c11","#0b0b10","#0a0a0f","#0a0a0d","#09090c","#08080b","#07070a","#060609","#050507","#040406","#030305","#030304","#020202","#010101","#000000"],c.brg=["#0000ff","#0200fd","#0400fb","#0600f9","#0800f7","#0a00f5","#0c00f3","#0e00f1","#1000ef","#1200ed","#1400eb","#1600e9","#1800e7","#1a00e5","#1c00e3","#1e00e1","#2000df","#2200dd","#2400db","#2600d9","#2800d7","#2a00d5","#2c00d3","#2e00d1","#3000cf","#3200cd","#3400cb","#3600c9","#3800c7","#3a00c5","#3c00c3","#3e00c1","#4000bf","#4200bd","#4400bb","#4600b9","#4800b7","#4a00b5","#4c00b3","#4e00b1","#5000af","#5200ad","#5400ab","#5600a9","#5800a7","#5a00a5","#5c00a3","#5e00a1","#60009f","#62009d","#64009b","#660099","#680097","#6a0095","#6c0093","#6e0091","#70008f","#72008d","#74008b","#760089","#780087","#7a0085","#7c0083","#7e0081","#80007f","#82007d","#84007b","#860079","#880077","#8a0075","#8c0073","#8e0071","#90006f","#92006d","#94006b","#960069","#980067","#9a0065","#9c0063","#9e0061","#a0005f","#a2005d","#a4005b","#a60059","#a80057","#aa0055","#ac0053","#ae0051","#b0004f","#b2004d","#b4004b","#b60049","#b80047","#ba0045","#bc0043","#be0041","#c0003f","#c2003d","#c4003b","#c60039","#c80037","#ca0035","#cc0033","#ce0031","#d0002f","#d2002d","#d4002b","#d60029","#d80027","#da0025","#dc0023","#de0021","#e0001f","#e2001d","#e4001b","#e60019","#e80017","#ea0015","#ec0013","#ee0011","#f0000f","#f2000d","#f4000b","#f60009","#f80007","#fa0005","#fc0003","#fe0001","#fe0100","#fc0300","#fa0500","#f80700","#f60900","#f40b00","#f20d00","#f00f00","#ee1100","#ec1300","#ea1500","#e81700","#e61900","#e41b00","#e21d00","#e01f00","#de2100","#dc2300","#da2500","#d82700","#d62900","#d42b00","#d22d00","#d02f00","#ce3100","#cc3300","#ca3500","#c83700","#c63900","#c43b00","#c23d00","#c03f00","#be4100","#bc4300","#ba4500","#b84700","#b64900","#b44b00","#b24d00","#b04f00","#ae5100","#ac5300","#aa5500","#a85700","#a65900","#a45b00","#a25d00","#a05f00","#9e6100","#9c6300","#9a6500","#986700","#966900","#946b00","#926d00","#906f00","#8e7100","#8c7300","#8a7500","#887700","#867900","#847b00","#827d00","#807f00","#7e8100","#7c8300","#7a8500","#788700","#768900","#748b00","#728d00","#708f00","#6e9100","#6c9300","#6a9500","#689700","#669900","#649b00","#629d00","#609f00","#5ea100","#5ca300","#5aa500","#58a700","#56a900","#54ab00","#52ad00","#50af00","#4eb100","#4cb300","#4ab500","#48b700","#46b900","#44bb00","#42bd00","#40bf00","#3ec100","#3cc300","#3ac500","#38c700","#36c900","#34cb00","#32cd00","#30cf00","#2ed100","#2cd300","#2ad500","#28d700","#26d900","#24db00","#22dd00","#20df00","#1ee100","#1ce300","#1ae500","#18e700","#16e900","#14eb00","#12ed00","#10ef00","#0ef100","#0cf300","#0af500","#08f700","#06f900","#04fb00","#02fd00","#00ff00"],c.brg_r=["#00ff00","#02fd00","#04fb00","#06f900","#08f700","#0af500","#0cf300","#0ef100","#10ef00","#12ed00","#14eb00","#16e900","#18e700","#1ae500","#1ce300","#1ee100","#20df00","#22dd00","#24db00","#26d900","#28d700","#2ad500","#2cd300","#2ed100","#30cf00","#32cd00","#34cb00","#36c900","#38c700","#3ac500","#3cc300","#3ec100","#40bf00","#42bd00","#44bb00","#46b900","#48b700","#4ab500","#4cb300","#4eb100","#50af00","#52ad00","#54ab00","#56a900","#58a700","#5aa500","#5ca300","#5ea100","#609f00","#629d00","#649b00","#669900","#689700","#6a9500","#6c9300","#6e9100","#708f00","#728d00","#748b00","#768900","#788700","#7a8500","#7c8300","#7e8100","#807f00","#827d00","#847b00","#867900","#887700","#8a7500","#8c7300","#8e7100","#906f00","#926d00","#946b00","#966900","#986700","#9a6500","#9c6300","#9e6100","#a05f00","#a25d00","#a45b00","#a65900","#a85700","#aa5500","#ac5300","#ae5100","#b04f00","#b24d00","#b44b00","#b64900","#b84700","#ba4500","#bc4300","#be4100","#c03f00","#c23d00","#c43b00","#c63900","#c83700","#ca3500","#cc3300","#ce3100","#d02f00","#d22d00","#d42b00","#d62900","#d82700","#da2500","#dc2300","#de2100","#e01f00","#e21d00","#e41b00","#e61900","#e81700","#ea1500","#ec1300","#ee1100","#f00f00","#f20d00","#f40b00","#f60900","#f80700","#fa0500","#fc0300","#fe0100","#fe0001","#fc0003","#fa0005","#f80007","#f60009","#f4000b","#f2000d","#f0000f","#ee0011","#ec0013","#ea0015","#e80017","#e60019","#e4001b","#e2001d","#e0001f","#de0021","#dc0023","#da0025","#d80027","#d60029","#d4002b","#d2002d","#d0002f","#ce0031","#cc0033","#ca0035","#c80037","#c60039","#c4003b","#c2003d","#c0003f","#be0041","#bc0043","#ba0045","#b80047","#b60049","#b4004b","#b2004d","#b0004f","#ae0051","#ac0053","#aa0055","#a80057","#a60059","#a4005b","#a2005d","#a0005f","#9e0061","#9c0063","#9a0065","#980067","#960069","#94006b","#92006d","#90006f","#8e0071","#8c0073","#8a0075","#880077","#860079","#84007b","#82007d","#80007f","#7e0081","#7c0083","#7a0085","#780087","#760089","#74008b","#72008d","#70008f","#6e0091","#6c0093","#6a0095","#680097","#660099","#64009b","#62009d","#60009f","#5e00a1","#5c00a3","#5a00a5","#5800a7","#5600a9","#5400ab","#5200ad","#5000af","#4e00b1","#4c00b3","#4a00b5","#4800b7","#4600b9","#4400bb","#4200bd","#4000bf","#3e00c1","#3c00c3","#3a00c5","#3800c7","#3600c9","#3400cb","#3200cd","#3000cf","#2e00d1","#2c00d3","#2a00d5","#2800d7","#2600d9","#2400db","#2200dd","#2000df","#1e00e1","#1c00e3","#1a00e5","#1800e7","#1600e9","#1400eb","#1200ed","#1000ef","#0e00f1","#0c00f3","#0a00f5","#0800f7","#0600f9","#0400fb","#0200fd","#0000ff"],c.bwr=["#0000ff","#0202ff","#0404ff","#0606ff","#0808ff","#0a0aff","#0c0cff","#0e0eff","#1010ff","#1212ff","#1414ff","#1616ff","#1818ff","#1a1aff","#1c1cff","#1e1eff","#2020ff","#2222ff","#2424ff","#2626ff","#2828ff","#2a2aff","#2c2cff","#2e2eff","#3030ff","#3232ff","#3434ff","#3636ff","#3838ff","#3a3aff","#3c3cff","#3e3eff","#4040ff","#4242ff","#4444ff","#4646ff","#4848ff","#4a4aff","#4c4cff","#4e4eff","#5050ff","#5252ff","#5454ff","#5656ff","#5858ff","#5a5aff","#5c5cff","#5e5eff","#6060ff","#6262ff","#6464ff","#6666ff","#6868ff","#6a6aff","#6c6cff","#6e6eff","#7070ff","#7272ff","#7474ff","#7676ff","#7878ff","#7a7aff","#7c7cff","#7e7eff","#8080ff","#8282ff","#8484ff","#8686ff","#8888ff","#8a8aff","#8c8cff","#8e8eff","#9090ff","#9292ff","#9494ff","#9696ff","#9898ff","#9a9aff","#9c9cff","#9e9eff","#a0a0ff","#a2a2ff","#a4a4ff","#a6a6ff","#a8a8ff","#aaaaff","#acacff","#aeaeff","#b0b0ff","#b2b2ff","#b4b4ff","#b6b6ff","#b8b8ff","#babaff","#bcbcff","#bebeff","#c0c0ff","#c2c2ff","#c4c4ff","#c6c6ff","#c8c8ff","#cacaff","#ccccff","#ceceff","#d0d0ff","#d2d2ff","#d4d4ff","#d6d6ff","#d8d8ff","#dadaff","#dcdcff","#dedeff","#e0e0ff","#e2e2ff","#e4e4ff","#e6e6ff","#e8e8ff","#eaeaff","#ececff","#eeeeff","#f0f0ff","#f2f2ff","#f4f4ff","#f6f6ff","#f8f8ff","#fafaff","#fcfcff","#fefeff","#fffefe","#fffcfc","#fffafa","#fff8f8","#fff6f6","#fff4f4","#fff2f2","#fff0f0","#ffeeee","#ffecec","#ffeaea","#ffe8e8","#ffe6e6","#ffe4e4","#ffe2e2","#ffe0e0","#ffdede","#ffdcdc","#ffdada","#ffd8d8","#ffd6d6","#ffd4d4","#ffd2d2","#ffd0d0","#ffcece","#ffcccc","#ffcaca","#ffc8c8","#ffc6c6","#ffc4c4","#ffc2c2","#ffc0c0","#ffbebe","#ffbcbc","#ffbaba","#ffb8b8","#ffb6b6","#ffb4b4","#ffb2b2","#ffb0b0","#ffaeae","#ffacac","#ffaaaa","#ffa8a8","#ffa6a6","#ffa4a4","#ffa2a2","#ffa0a0","#ff9e9e","#ff9c9c","#ff9a9a","#ff9898","#ff9696","#ff9494","#ff9292","#ff9090","#ff8e8e","#ff8c8c","#ff8a8a","#ff8888","#ff8686","#ff8484","#ff8282","#ff8080","#ff7e7e","#ff7c7c","#ff7a7a","#ff7878","#ff7676","#ff7474","#ff7272","#ff7070","#ff6e6e","#ff6c6c","#ff6a6a","#ff6868","#ff6666","#ff6464","#ff6262","#ff6060","#ff5e5e","#ff5c5c","#ff5a5a","#ff5858","#ff5656","#ff5454","#ff5252","#ff5050","#ff4e4e","#ff4c4c","#ff4a4a","#ff4848","#ff4646","#ff4444","#ff4242","#ff4040","#ff3e3e","#ff3c3c","#ff3a3a","#ff3838","#ff3636","#ff3434","#ff3232","#ff3030","#ff2e2e","#ff2c2c","#ff2a2a","#ff2828","#ff2626","#ff2424","#ff2222","#ff2020","#ff1e1e","#ff1c1c","#ff1a1a","#ff1818","#ff1616","#ff1414","#ff1212","#ff1010","#ff0e0e","#ff0c0c","#ff0a0a","#ff0808","#ff0606","#ff0404","#ff0202","#ff0000"],c.bwr_r=["#ff0000","#ff0202","#ff0404","#ff0606","#ff0808","#ff0a0a","#ff0c0c","#ff0e0e","#ff1010","#ff1212","#ff1414","#ff1616","#ff1818","#ff1a1a","#ff1c1c","#ff1e1e","#ff2020","#ff2222","#ff2424","#ff2626","#ff2828","#ff2a2a","#ff2c2c","#ff2e2e","#ff3030","#ff3232","#ff3434","#ff3636","#ff3838","#ff3a3a","#ff3c3c","#ff3e3e","#ff4040","#ff4242","#ff4444","#ff4646","#ff4848","#ff4a4a","#ff4c4c","#ff4e4e","#ff5050","#ff5252","#ff5454","#ff5656","#ff5858","#ff5a5a","#ff5c5c","#ff5e5e","#ff6060","#ff6262","#ff6464","#ff6666","#ff6868","#ff6a6a","#ff6c6c","#ff6e6e","#ff7070","#ff7272","#ff7474","#ff7676","#ff7878","#ff7a7a","#ff7c7c","#ff7e7e","#ff8080","#ff8282","#ff8484","#ff8686","#ff8888","#ff8a8a","#ff8c8c","#ff8e8e","#ff9090","#ff9292","#ff9494","#ff9696","#ff9898","#ff9a9a","#ff9c9c","#ff9e9e","#ffa0a0","#ffa2a2","#ffa4a4","#ffa6a6","#ffa8a8","#ffaaaa","#ffacac","#ffaeae","#ffb0b0","#ffb2b2","#ffb4b4","#ffb6b6","#ffb8b8","#ffbaba","#ffbcbc","#ffbebe","#ffc0c0","#ffc2c2","#ffc4c4","#ffc6c6","#ffc8c8","#ffcaca","#ffcccc","#ffcece","#ffd0d0","#ffd2d2","#ffd4d4","#ffd6d6","#ffd8d8","#ffdada","#ffdcdc","#ffdede","#ffe0e0","#ffe2e2","#ffe4e4","#ffe6e6","#ffe8e8","#ffeaea","#ffecec","#ffeeee","#fff0f0","#fff2f2","#fff4f4","#fff6f6","#fff8f8","#fffafa","#fffcfc","#fffefe","#fefeff","#fcfcff","#fafaff","#f8f8ff","#f6f6ff","#f4f4ff","#f2f2ff","#f0f0ff","#eeeeff","#ececff","#eaeaff","#e8e8ff","#e6e6ff","#e4e4ff","#e2e2ff","#e0e0ff","#dedeff","#dcdcff","#dadaff","#d8d8ff","#d6d6ff","#d4d4ff","#d2d2ff","#d0d0ff","#ceceff","#ccccff","#cacaff","#c8c8ff","#c6c6ff","#c4c4ff","#c2c2ff","#c0c0ff","#bebeff","#bcbcff","#babaff","#b8b8ff","#b6b6ff","#b4b4ff","#b2b2ff","#b0b0ff","#aeaeff","#acacff","#aaaaff","#a8a8ff","#a6a6ff","#a4a4ff","#a2a2ff","#a0a0ff","#9e9eff","#9c9cff","#9a9aff","#9898ff","#9696ff","#9494ff","#9292ff","#9090ff","#8e8eff","#8c8cff","#8a8aff","#8888ff","#8686ff","#8484ff","#8282ff","#8080ff","#7e7eff","#7c7cff","#7a7aff","#7878ff","#7676ff","#7474ff","#7272ff","#7070ff","#6e6eff","#6c6cff","#6a6aff","#6868ff","#6666ff","#6464ff","#6262ff","#6060ff","#5e5eff","#5c5cff","#5a5aff","#5858ff","#5656ff","#5454ff","#5252ff","#5050ff","#4e4eff","#4c4cff","#4a4aff","#4848ff","#4646ff","#4444ff","#4242ff","#4040ff","#3e3eff","#3c3cff","#3a3aff","#3838ff","#3636ff","#3434ff","#3232ff","#3030ff","#2e2eff","#2c2cff","#2a2aff","#2828ff","#2626ff","#2424ff","#2222ff","#2020ff","#1e1eff","#1c1cff","#1a1aff","#1818ff","#1616ff","#1414ff","#1212ff","#1010ff","#0e0eff","#0c0cff","#0a0aff","#0808ff","#0606ff","#0404ff","#0202ff","#0000ff"],c.cividis=["#00224e","#00234f","#002451","#002553","#002554","#002656","#002758","#002859","#00285b","#00295d","#002a5f","#002a61","#002b62","#002c64","#002c66","#002d68","#002e6a","#002e6c","#002f6d","#00306f","#003070","#003170","#003171","#013271","#053371","#083370","#0c3470","#0f3570","#123570","#143670","#163770","#18376f","#1a386f","#1c396f","#1e3a6f","#203a6f","#213b6e","#233c6e","#243c6e","#263d6e","#273e6e","#293f6e","#2a3f6d","#2b406d","#2d416d","#2e416d","#2f426d","#31436d","#32436d","#33446d","#34456c","#35456c","#36466c","#38476c","#39486c","#3a486c","#3b496c","#3c4a6c","#3d4a6c","#3e4b6c","#3f4c6c","#404c6c","#414d6c","#424e6c","#434e6c","#444f6c","#45506c","#46516c","#47516c","#48526c","#49536c","#4a536c","#4b546c","#4c556c","#4d556c","#4e566c","#4f576c","#50576c","#51586d","#52596d","#535a6d","#545a6d","#555b6d","#555c6d","#565c6d","#575d6d","#585e6d","#595e6e","#5a5f6e","#5b606e","#5c616e","#5d616e","#5e626e","#5e636f","#5f636f","#60646f","#61656f","#62656f","#636670","#646770","#656870","#656870","#666970","#676a71","#686a71","#696b71","#6a6c71","#6b6d72","#6c6d72","#6c6e72","#6d6f72","#6e6f73","#6f7073","#707173","#717274","#727274","#727374","#737475","#747475","#757575","#767676","#777776","#777777","#787877","#797977","#7a7a78","#7b7a78","#7c7b78","#7d7c78","#7e7c78","#7e7d78","#7f7e78","#807f78","#817f78","#828079","#838179","#848279","#858279","#868379","#878478","#888578","#898578","#8a8678","#8b8778","#8c8878","#8d8878","#8e8978","#8f8a78","#908b78","#918b78","#928c78","#928d78","#938e78","#948e77","#958f77","#969077","#979177","#989277","#999277","#9a9376","#9b9476","#9c9576","#9d9576","#9e9676","#9f9775","#a09875","#a19975","#a29975","#a39a74","#a49b74","#a59c74","#a69c74","#a79d73","#a89e73","#a99f73","#aaa073","#aba072","#aca172","#ada272","#aea371","#afa471","#b0a571","#b1a570","#b3a670","#b4a76f","#b5a86f","#b6a96f","#b7a96e","#b8aa6e","#b9ab6d","#baac6d","#bbad6d","#bcae6c","#bdae6c","#beaf6b","#bfb06b","#c0b16a","#c1b26a","#c2b369","#c3b369","#c4b468","#c5b568","#c6b667","#c7b767","#c8b866","#c9b965","#cbb965","#ccba64","#cdbb63","#cebc63","#cfbd62","#d0be62","#d1bf61","#d2c060","#d3c05f","#d4c15f","#d5c25e","#d6c35d","#d7c45c","#d9c55c","#dac65b","#dbc75a","#dcc859","#ddc858","#dec958","#dfca57","#e0cb56","#e1cc55","#e2cd54","#e4ce53","#e5cf52","#e6d051","#e7d150","#e8d24f","#e9d34e","#ead34c","#ebd44b","#edd54a","#eed649","#efd748","#f0d846","#f1d945","#f2da44","#f3db42","#f5dc41","#f6dd3f","#f7de3e","#f8df3c","#f9e03a","#fbe138","#fce236","#fde334","#fee434","#fee535","#fee636","#fee838"],c.cividis_r=["#fee838","#fee636","#fee535","#fee434","#fde334","#fce236","#fbe138","#f9e03a","#f8df3c","#f7de3e","#f6dd3f","#f5dc41","#f3db42","#f2da44","#f1d945","#f0d846","#efd748","#eed649","#edd54a","#ebd44b","#ead34c","#e9d34e","#e8d24f","#e7d150","#e6d051","#e5cf52","#e4ce53","#e2cd54","#e1cc55","#e0cb56","#dfca57","#dec958","#ddc858","#dcc859","#dbc75a","#dac65b","#d9c55c","#d7c45c","#d6c35d","#d5c25e","#d4c15f","#d3c05f","#d2c060","#d1bf61","#d0be62","#cfbd62","#cebc63","#cdbb63","#ccba64","#cbb965","#c9b965","#c8b866","#c7b767","#c6b667","#c5b568","#c4b468","#c3b369","#c2b369","#c1b26a","#c0b16a","#bfb06b","#beaf6b","#bdae6c","#bcae6c","#bbad6d","#baac6d","#b9ab6d","#b8aa6e","#b7a96e","#b6a96f","#b5a86f","#b4a76f","#b3a670","#b1a570","#b0a571","#afa471","#aea371","#ada272","#aca172","#aba072","#aaa073","#a99f73","#a89e73","#a79d73","#a69c74","#a59c74","#a49b74","#a39a74","#a29975","#a19975","#a09875","#9f9775","#9e9676","#9d9576","#9c9576","#9b9476","#9a9376","#999277","#989277","#979177","#969077","#958f77","#948e77","#938e78","#928d78","#928c78","#918b78","#908b78","#8f8a78","#8e8978","#8d8878","#8c8878","#8b8778","#8a8678","#898578","#888578","#878478","#868379","#858279","#848279","#838179","#828079","#817f78","#807f78","#7f7e78","#7e7d78","#7e7c78","#7d7c78","#7c7b78","#7b7a78","#7a7a78","#797977","#787877","#777777","#777776","#767676","#757575","#747475","#737475","#727374","#727274","#717274","#707173","#6f7073","#6e6f73","#6d6f72","#6c6e72","#6c6d72","#6b6d72","#6a6c71","#696b71","#686a71","#676a71","#666970","#656870","#656870","#646770","#636670","#62656f","#61656f","#60646f","#5f636f","#5e636f","#5e626e","#5d616e","#5c616e","#5b606e","#5a5f6e","#595e6e","#585e6d","#575d6d","#565c6d","#555c6d","#555b6d","#545a6d","#535a6d","#52596d","#51586d","#50576c","#4f576c","#4e566c","#4d556c","#4c556c","#4b546c","#4a536c","#49536c","#48526c","#47516c","#46516c","#45506c","#444f6c","#434e6c","#424e6c","#414d6c","#404c6c","#3f4c6c","#3e4b6c","#3d4a6c","#3c4a6c","#3b496c","#3a486c","#39486c","#38476c","#36466c","#35456c","#34456c","#33446d","#32436d","#31436d","#2f426d","#2e416d","#2d416d","#2b406d","#2a3f6d","#293f6e","#273e6e","#263d6e","#243c6e","#233c6e","#213b6e","#203a6f","#1e3a6f","#1c396f","#1a386f","#18376f","#163770","#143670","#123570","#0f3570","#0c3470","#083370","#053371","#013271","#003171","#003170","#003070","#00306f","#002f6d","#002e6c","#002e6a","#002d68","#002c66","#002c64","#002b62","#002a61","#002a5f","#00295d","#00285b","#002859","#002758","#002656","#002554","#002553","#002451","#00234f","#00224e"],c.cool=["#00ffff","#01feff","#02fdff","#03fcff","#04fbff","#05faff","#06f9ff","#07f8ff","#08f7ff","#09f6ff","#0af5ff","#0bf4ff","#0cf3ff","#0df2ff","#0ef1ff","#0ff0ff","#10efff","#11eeff","#12edff","#13ecff","#14ebff","#15eaff","#16e9ff","#17e8ff","#18e7ff","#19e6ff","#1ae5ff","#1be4ff","#1ce3ff","#1de2ff","#1ee1ff","#1fe0ff","#20dfff","#21deff","#22ddff","#23dcff","#24dbff","#25daff","#26d9ff","#27d8ff","#28d7ff","#29d6ff","#2ad5ff","#2bd4ff","#2cd3ff","#2dd2ff","#2ed1ff","#2fd0ff","#30cfff","#31ceff","#32cdff","#33ccff","#34cbff","#35caff","#36c9ff","#37c8ff","#38c7ff","#39c6ff","#3ac5ff","#3bc4ff","#3cc3ff","#3dc2ff","#3ec1ff","#3fc0ff","#40bfff","#41beff","#42bdff","#43bcff","#44bbff","#45baff","#46b9ff","#47b8ff","#48b7ff","#49b6ff","#4ab5ff","#4bb4ff","#4cb3ff","#4db2ff","#4eb1ff","#4fb0ff","#50afff","#51aeff","#52adff","#53acff","#54abff","#55aaff","#56a9ff","#57a8ff","#58a7ff","#59a6ff","#5aa5ff","#5ba4ff","#5ca3ff","#5da2ff","#5ea1ff","#5fa0ff","#609fff","#619eff","#629dff","#639cff","#649bff","#659aff","#6699ff","#6798ff","#6897ff","#6996ff","#6a95ff","#6b94ff","#6c93ff","#6d92ff","#6e91ff","#6f90ff","#708fff","#718eff","#728dff","#738cff","#748bff","#758aff","#7689ff","#7788ff","#7887ff","#7986ff","#7a85ff","#7b84ff","#7c83ff","#7d82ff","#7e81ff","#7f80ff","#807fff","#817eff","#827dff","#837cff","#847bff","#857aff","#8679ff","#8778ff","#8877ff","#8976ff","#8a75ff","#8b74ff","#8c73ff","#8d72ff","#8e71ff","#8f70ff","#906fff","#916eff","#926dff","#936cff","#946bff","#956aff","#9669ff","#9768ff","#9867ff","#9966ff","#9a65ff","#9b64ff","#9c63ff","#9d62ff","#9e61ff","#9f60ff","#a05fff","#a15eff","#a25dff","#a35cff","#a45bff","#a55aff","#a659ff","#a758ff","#a857ff","#a956ff","#aa55ff","#ab54ff","#ac53ff","#ad52ff","#ae51ff","#af50ff","#b04fff","#b14eff","#b24dff","#b34cff","#b44bff","#b54aff","#b649ff","#b748ff","#b847ff","#b946ff","#ba45ff","#bb44ff","#bc43ff","#bd42ff","#be41ff","#bf40ff","#c03fff","#c13eff","#c23dff","#c33cff","#c43bff","#c53aff","#c639ff","#c738ff","#c837ff","#c936ff","#ca35ff","#cb34ff","#cc33ff","#cd32ff","#ce31ff","#cf30ff","#d02fff","#d12eff","#d22dff","#d32cff","#d42bff","#d52aff","#d629ff","#d728ff","#d827ff","#d926ff","#da25ff","#db24ff","#dc23ff","#dd22ff","#de21ff","#df20ff","#e01fff","#e11eff","#e21dff","#e31cff","#e41bff","#e51aff","#e619ff","#e718ff","#e817ff","#e916ff","#ea15ff","#eb14ff","#ec13ff","#ed12ff","#ee11ff","#ef10ff","#f00fff","#f10eff","#f20dff","#f30cff","#f40bff","#f50aff","#f609ff","#f708ff","#f807ff","#f906ff","#fa05ff","#fb04ff","#fc03ff","#fd02ff","#fe01ff","#ff00ff"],c.cool_r=["#ff00ff","#fe01ff","#fd02ff","#fc03ff","#fb04ff","#fa05ff","#f906ff","#f807ff","#f708ff","#f609ff","#f50aff","#f40bff","#f30cff","#f20dff","#f10eff","#f00fff","#ef10ff","#ee11ff","#ed12ff","#ec13ff","#eb14ff","#ea15ff","#e916ff","#e817ff","#e718ff","#e619ff","#e51aff","#e41bff","#e31cff","#e21dff","#e11eff","#e01fff","#df20ff","#de21ff","#dd22ff","#dc23ff","#db24ff","#da25ff","#d926ff","#d827ff","#d728ff","#d629ff","#d52aff","#d42bff","#d32cff","#d22dff","#d12eff","#d02fff","#cf30ff","#ce31ff","#cd32ff","#cc33ff","#cb34ff","#ca35ff","#c936ff","#c837ff","#c738ff","#c639ff","#c53aff","#c43bff","#c33cff","#c23dff","#c13eff","#c03fff","#bf40ff","#be41ff","#bd42ff","#bc43ff","#bb44ff","#ba45ff","#b946ff","#b847ff","#b748ff","#b649ff","#b54aff","#b44bff","#b34cff","#b24dff","#b14eff","#b04fff","#af50ff","#ae51ff","#ad52ff","#ac53ff","#ab54ff","#aa55ff","#a956ff","#a857ff","#a758ff","#a659ff","#a55aff","#a45bff","#a35cff","#a25dff","#a15eff","#a05fff","#9f60ff","#9e61ff","#9d62ff","#9c63ff","#9b64ff","#9a65ff","#9966ff","#9867ff","#9768ff","#9669ff","#956aff","#946bff","#936cff","#926dff","#916eff","#906fff","#8f70ff","#8e71ff","#8d72ff","#8c73ff","#8b74ff","#8a75ff","#8976ff","#8877ff","#8778ff","#8679ff","#857aff","#847bff","#837cff","#827dff","#817eff","#807fff","#7f80ff","#7e81ff","#7d82ff","#7c83ff","#7b84ff","#7a85ff","#7986ff","#7887ff","#7788ff","#7689ff","#758aff","#748bff","#738cff","#728dff","#718eff","#708fff","#6f90ff","#6e91ff","#6d92ff","#6c93ff","#6b94ff","#6a95ff","#6996ff","#6897ff","#6798ff","#6699ff","#659aff","#649bff","#639cff","#629dff","#619eff","#609fff","#5fa0ff","#5ea1ff","#5da2ff","#5ca3ff","#5ba4ff","#5aa5ff","#59a6ff","#58a7ff","#57a8ff","#56a9ff","#55aaff","#54abff","#53acff","#52adff","#51aeff","#50afff","#4fb0ff","#4eb1ff","#4db2ff","#4cb3ff","#4bb4ff","#4ab5ff","#49b6ff","#48b7ff","#47b8ff","#46b9ff","#45baff","#44bbff","#43bcff","#42bdff","#41beff","#40bfff","#3fc0ff","#3ec1ff","#3dc2ff","#3cc3ff","#3bc4ff","#3ac5ff","#39c6ff","#38c7ff","#37c8ff","#36c9ff","#35caff","#34cbff","#33ccff","#32cdff","#31ceff","#30cfff","#2fd0ff","#2ed1ff","#2dd2ff","#2cd3ff","#2bd4ff","#2ad5ff","#29d6ff","#28d7ff","#27d8ff","#26d9ff","#25daff","#24dbff","#23dcff","#22ddff","#21deff","#20dfff","#1fe0ff","#1ee1ff","#1de2ff","#1ce3ff","#1be4ff","#1ae5ff","#19e6ff","#18e7ff","#17e8ff","#16e9ff","#15eaff","#14ebff","#13ecff","#12edff","#11eeff","#10efff","#0ff0ff","#0ef1ff","#0df2ff","#0cf3ff","#0bf4ff","#0af5ff","#09f6ff","#08f7ff","#07f8ff","#06f9ff","#05faff","#04fbff","#03fcff","#02fdff","#01feff","#00ffff"],c.coolwarm=["#3b4cc0","#3c4ec2","#3d50c3","#3e51c5","#3f53c6","#4055c8","#4257c9","#4358cb","#445acc","#455cce","#465ecf","#485fd1","#4961d2","#4a63d3","#4b64d5","#4c66d6","#4e68d8","#4f69d9","#506bda","#516ddb","#536edd","#5470de","#5572df","#5673e0","#5875e1","#5977e3","#5a78e4","#5b7ae5","#5d7ce6","#5e7de7","#5f7fe8","#6180e9","#6282ea","#6384eb","#6485ec","#6687ed","#6788ee","#688aef","#6a8bef","#6b8df0","#6c8ff1","#6e90f2","#6f92f3","#7093f3","#7295f4","#7396f5","#7597f6","#7699f6","#779af7","#799cf8","#7a9df8","#7b9ff9","#7da0f9","#7ea1fa","#80a3fa","#81a4fb","#82a6fb","#84a7fc","#85a8fc","#86a9fc","#88abfd","#89acfd","#8badfd","#8caffe","#8db0fe","#8fb1fe","#90b2fe","#92b4fe","#93b5fe","#94b6ff","#96b7ff","#97b8ff","#98b9ff","#9abbff","#9bbcff","#9dbdff","#9ebeff","#9fbfff","#a1c0ff","#a2c1ff","#a3c2fe","#a5c3fe","#a6c4fe","#a7c5fe","#a9c6fd","#aac7fd","#abc8fd","#adc9fd","#aec9fc","#afcafc","#b1cbfc","#b2ccfb","#b3cdfb","#b5cdfa","#b6cefa","#b7cff9","#b9d0f9","#bad0f8","#bbd1f8","#bcd2f7","#bed2f6","#bfd3f6","#c0d4f5","#c1d4f4","#c3d5f4","#c4d5f3","#c5d6f2","#c6d6f1","#c7d7f0","#c9d7f0","#cad8ef","#cbd8ee","#ccd9ed","#cdd9ec","#cedaeb","#cfdaea","#d1dae9","#d2dbe8","#d3dbe7","#d4dbe6","#d5dbe5","#d6dce4","#d7dce3","#d8dce2","#d9dce1","#dadce0","#dbdcde","#dcdddd","#dddcdc","#dedcdb","#dfdbd9","#e0dbd8","#e1dad6","#e2dad5","#e3d9d3","#e4d9d2","#e5d8d1","#e6d7cf","#e7d7ce","#e8d6cc","#e9d5cb","#ead5c9","#ead4c8","#ebd3c6","#ecd3c5","#edd2c3","#edd1c2","#eed0c0","#efcfbf","#efcebd","#f0cdbb","#f1cdba","#f1ccb8","#f2cbb7","#f2cab5","#f2c9b4","#f3c8b2","#f3c7b1","#f4c6af","#f4c5ad","#f5c4ac","#f5c2aa","#f5c1a9","#f5c0a7","#f6bfa6","#f6bea4","#f6bda2","#f7bca1","#f7ba9f","#f7b99e","#f7b89c","#f7b79b","#f7b599","#f7b497","#f7b396","#f7b194","#f7b093","#f7af91","#f7ad90","#f7ac8e","#f7aa8c","#f7a98b","#f7a889","#f7a688","#f6a586","#f6a385","#f6a283","#f5a081","#f59f80","#f59d7e","#f59c7d","#f49a7b","#f4987a","#f39778","#f39577","#f39475","#f29274","#f29072","#f18f71","#f18d6f","#f08b6e","#f08a6c","#ef886b","#ee8669","#ee8468","#ed8366","#ec8165","#ec7f63","#eb7d62","#ea7b60","#e97a5f","#e9785d","#e8765c","#e7745b","#e67259","#e57058","#e46e56","#e36c55","#e36b54","#e26952","#e16751","#e0654f","#df634e","#de614d","#dd5f4b","#dc5d4a","#da5a49","#d95847","#d85646","#d75445","#d65244","#d55042","#d44e41","#d24b40","#d1493f","#d0473d","#cf453c","#cd423b","#cc403a","#cb3e38","#ca3b37","#c83836","#c73635","#c53334","#c43032","#c32e31","#c12b30","#c0282f","#be242e","#bd1f2d","#bb1b2c","#ba162b","#b8122a","#b70d28","#b50927","#b40426"],c.coolwarm_r=["#b40426","#b50927","#b70d28","#b8122a","#ba162b","#bb1b2c","#bd1f2d","#be242e","#c0282f","#c12b30","#c32e31","#c43032","#c53334","#c73635","#c83836","#ca3b37","#cb3e38","#cc403a","#cd423b","#cf453c","#d0473d","#d1493f","#d24b40","#d44e41","#d55042","#d65244","#d75445","#d85646","#d95847","#da5a49","#dc5d4a","#dd5f4b","#de614d","#df634e","#e0654f","#e16751","#e26952","#e36b54","#e36c55","#e46e56","#e57058","#e67259","#e7745b","#e8765c","#e9785d","#e97a5f","#ea7b60","#eb7d62","#ec7f63","#ec8165","#ed8366","#ee8468","#ee8669","#ef886b","#f08a6c","#f08b6e","#f18d6f","#f18f71","#f29072","#f29274","#f39475","#f39577","#f39778","#f4987a","#f49a7b","#f59c7d","#f59d7e","#f59f80","#f5a081","#f6a283","#f6a385","#f6a586","#f7a688","#f7a889","#f7a98b","#f7aa8c","#f7ac8e","#f7ad90","#f7af91","#f7b093","#f7b194","#f7b396","#f7b497","#f7b599","#f7b79b","#f7b89c","#f7b99e","#f7ba9f","#f7bca1","#f6bda2","#f6bea4","#f6bfa6","#f5c0a7","#f5c1a9","#f5c2aa","#f5c4ac","#f4c5ad","#f4c6af","#f3c7b1","#f3c8b2","#f2c9b4","#f2cab5","#f2cbb7","#f1ccb8","#f1cdba","#f0cdbb","#efcebd","#efcfbf","#eed0c0","#edd1c2","#edd2c3","#ecd3c5","#ebd3c6","#ead4c8","#ead5c9","#e9d5cb","#e8d6cc","#e7d7ce","#e6d7cf","#e5d8d1","#e4d9d2","#e3d9d3","#e2dad5","#e1dad6","#e0dbd8","#dfdbd9","#dedcdb","#dddcdc","#dcdddd","#dbdcde","#dadce0","#d9dce1","#d8dce2","#d7dce3","#d6dce4","#d5dbe5","#d4dbe6","#d3dbe7","#d2dbe8","#d1dae9","#cfdaea","#cedaeb","#cdd9ec","#ccd9ed","#cbd8ee","#cad8ef","#c9d7f0","#c7d7f0","#c6d6f1","#c5d6f2","#c4d5f3","#c3d5f4","#c1d4f4","#c0d4f5","#bfd3f6","#bed2f6","#bcd2f7","#bbd1f8","#bad0f8","#b9d0f9","#b7cff9","#b6cefa","#b5cdfa","#b3cdfb","#b2ccfb","#b1cbfc","#afcafc","#aec9fc","#adc9fd","#abc8fd","#aac7fd","#a9c6fd","#a7c5fe","#a6c4fe","#a5c3fe","#a3c2fe","#a2c1ff","#a1c0ff","#9fbfff","#9ebeff","#9dbdff","#9bbcff","#9abbff","#98b9ff","#97b8ff","#96b7ff","#94b6ff","#93b5fe","#92b4fe","#90b2fe","#8fb1fe","#8db0fe","#8caffe","#8badfd","#89acfd","#88abfd","#86a9fc","#85a8fc","#84a7fc","#82a6fb","#81a4fb","#80a3fa","#7ea1fa","#7da0f9","#7b9ff9","#7a9df8","#799cf8","#779af7","#7699f6","#7597f6","#7396f5","#7295f4","#7093f3","#6f92f3","#6e90f2","#6c8ff1","#6b8df0","#6a8bef","#688aef","#6788ee","#6687ed","#6485ec","#6384eb","#6282ea","#6180e9","#5f7fe8","#5e7de7","#5d7ce6","#5b7ae5","#5a78e4","#5977e3","#5875e1","#5673e0","#5572df","#5470de","#536edd","#516ddb","#506bda","#4f69d9","#4e68d8","#4c66d6","#4b64d5","#4a63d3","#4961d2","#485fd1","#465ecf","#455cce","#445acc","#4358cb","#4257c9","#4055c8","#3f53c6","#3e51c5","#3d50c3","#3c4ec2","#3b4cc0"],c.copper=["#000000","#010100","#020201","#040201","#050302","#060402","#070503","#090503","#0a0604","#0b0704","#0c0805","#0e0905","#0f0906","#100a06","#110b07","#130c07","#140c08","#150d08","#160e09","#170f09","#19100a","#1a100a","#1b110b","#1c120b","#1e130c","#1f140c","#20140d","#21150d","#23160e","#24170e","#25170f","#26180f","#281910","#291a10","#2a1b11","#2b1b11","#2c1c12","#2e1d12","#2f1e13","#301e13","#311f14","#332014","#342115","#352215","#362216","#382316","#392417","#3a2517","#3b2518","#3d2618","#3e2719","#3f2819","#40291a","#41291a","#432a1b","#442b1b","#452c1c","#462d1c","#482d1d","#492e1d","#4a2f1e","#4b301e","#4d301f","#4e311f","#4f3220","#503320","#523421","#533421","#543522","#553622","#563723","#583723","#593824","#5a3924","#5b3a25","#5d3b25","#5e3b26","#5f3c26","#603d27","#623e27","#633e28","#643f28","#654029","#674129","#68422a","#69422a","#6a432b","#6b442b","#6d452c","#6e462c","#6f462d","#70472d","#72482e","#73492e","#74492f","#754a2f","#774b30","#784c30","#794d31","#7a4d31","#7c4e32","#7d4f32","#7e5033","#7f5033","#805134","#825234","#835335","#845435","#855436","#875536","#885637","#895737","#8a5738","#8c5838","#8d5939","#8e5a39","#8f5b3a","#915b3a","#925c3b","#935d3b","#945e3c","#955f3c","#975f3d","#98603d","#99613e","#9a623e","#9c623f","#9d633f","#9e6440","#9f6540","#a16641","#a26641","#a36742","#a46842","#a66943","#a76943","#a86a44","#a96b44","#aa6c45","#ac6d45","#ad6d46","#ae6e46","#af6f47","#b17047","#b27048","#b37148","#b47249","#b67349","#b7744a","#b8744a","#b9754b","#bb764b","#bc774c","#bd784c","#be784d","#bf794d","#c17a4e","#c27b4e","#c37b4f","#c47c4f","#c67d50","#c77e50","#c87f51","#c97f51","#cb8052","#cc8152","#cd8253","#ce8253","#d08354","#d18454","#d28555","#d38655","#d48656","#d68756","#d78857","#d88957","#d98958","#db8a58","#dc8b59","#dd8c59","#de8d5a","#e08d5a","#e18e5b","#e28f5b","#e3905c","#e5915c","#e6915d","#e7925d","#e8935e","#e9945e","#eb945f","#ec955f","#ed9660","#ee9760","#f09861","#f19861","#f29962","#f39a62","#f59b63","#f69b63","#f79c64","#f89d64","#fa9e64","#fb9f65","#fc9f65","#fda066","#fea166","#ffa267","#ffa267","#ffa368","#ffa468","#ffa569","#ffa669","#ffa66a","#ffa76a","#ffa86b","#ffa96b","#ffaa6c","#ffaa6c","#ffab6d","#ffac6d","#ffad6e","#ffad6e","#ffae6f","#ffaf6f","#ffb070","#ffb170","#ffb171","#ffb271","#ffb372","#ffb472","#ffb473","#ffb573","#ffb674","#ffb774","#ffb875","#ffb875","#ffb976","#ffba76","#ffbb77","#ffbb77","#ffbc78","#ffbd78","#ffbe79","#ffbf79","#ffbf7a","#ffc07a","#ffc17b","#ffc27b","#ffc37c","#ffc37c","#ffc47d","#ffc57d","#ffc67e","#ffc67e","#ffc77f"],c.copper_r=["#ffc77f","#ffc67e","#ffc67e","#ffc57d","#ffc47d","#ffc37c","#ffc37c","#ffc27b","#ffc17b","#ffc07a","#ffbf7a","#ffbf79","#ffbe79","#ffbd78","#ffbc78","#ffbb77","#ffbb77","#ffba76","#ffb976","#ffb875","#ffb875","#ffb774","#ffb674","#ffb573","#ffb473","#ffb472","#ffb372","#ffb271","#ffb171","#ffb170","#ffb070","#ffaf6f","#ffae6f","#ffad6e","#ffad6e","#ffac6d","#ffab6d","#ffaa6c","#ffaa6c","#ffa96b","#ffa86b","#ffa76a","#ffa66a","#ffa669","#ffa569","#ffa468","#ffa368","#ffa267","#ffa267","#fea166","#fda066","#fc9f65","#fb9f65","#fa9e64","#f89d64","#f79c64","#f69b63","#f59b63","#f39a62","#f29962","#f19861","#f09861","#ee9760","#ed9660","#ec955f","#eb945f","#e9945e","#e8935e","#e7925d","#e6915d","#e5915c","#e3905c","#e28f5b","#e18e5b","#e08d5a","#de8d5a","#dd8c59","#dc8b59","#db8a58","#d98958","#d88957","#d78857","#d68756","#d48656","#d38655","#d28555","#d18454","#d08354","#ce8253","#cd8253","#cc8152","#cb8052","#c97f51","#c87f51","#c77e50","#c67d50","#c47c4f","#c37b4f","#c27b4e","#c17a4e","#bf794d","#be784d","#bd784c","#bc774c","#bb764b","#b9754b","#b8744a","#b7744a","#b67349","#b47249","#b37148","#b27048","#b17047","#af6f47","#ae6e46","#ad6d46","#ac6d45","#aa6c45","#a96b44","#a86a44","#a76943","#a66943","#a46842","#a36742","#a26641","#a16641","#9f6540","#9e6440","#9d633f","#9c623f","#9a623e","#99613e","#98603d","#975f3d","#955f3c","#945e3c","#935d3b","#925c3b","#915b3a","#8f5b3a","#8e5a39","#8d5939","#8c5838","#8a5738","#895737","#885637","#875536","#855436","#845435","#835335","#825234","#805134","#7f5033","#7e5033","#7d4f32","#7c4e32","#7a4d31","#794d31","#784c30","#774b30","#754a2f","#74492f","#73492e","#72482e","#70472d","#6f462d","#6e462c","#6d452c","#6b442b","#6a432b","#69422a","#68422a","#674129","#654029","#643f28","#633e28","#623e27","#603d27","#5f3c26","#5e3b26","#5d3b25","#5b3a25","#5a3924","#593824","#583723","#563723","#553622","#543522","#533421","#523421","#503320","#4f3220","#4e311f","#4d301f","#4b301e","#4a2f1e","#492e1d","#482d1d","#462d1c","#452c1c","#442b1b","#432a1b","#41291a","#40291a","#3f2819","#3e2719","#3d2618","#3b2518","#3a2517","#392417","#382316","#362216","#352215","#342115","#332014","#311f14","#301e13","#2f1e13","#2e1d12","#2c1c12","#2b1b11","#2a1b11","#291a10","#281910","#26180f","#25170f","#24170e","#23160e","#21150d","#20140d","#1f140c","#1e130c","#1c120b","#1b110b","#1a100a","#19100a","#170f09","#160e09","#150d08","#140c08","#130c07","#110b07","#100a06","#0f0906","#0e0905","#0c0805","#0b0704","#0a0604","#090503","#070503","#060402","#050302","#040201","#020201","#010100","#000000"],c.cubehelix=["#000000","#020102","#030103","#050205","#070206","#080308","#0a030a","#0b040c","#0c050e","#0e050f","#0f0611","#100713","#110815","#120817","#130919","#140a1b","#150b1d","#160c1f","#160d21","#170e23","#180f25","#181027","#191129","#19122b","#19132d","#1a142f","#1a1631","#1a1733","#1a1835","#1b1a36","#1b1b38","#1b1c3a","#1b1e3b","#1b1f3d","#1a213e","#1a2240","#1a2441","#1a2543","#1a2744","#192845","#192a46","#192c47","#192d48","#182f49","#18314a","#18324b","#17344c","#17364c","#17374d","#16394d","#163b4e","#163d4e","#163f4e","#16404e","#15424e","#15444f","#15464e","#15474e","#15494e","#154b4e","#154d4e","#154e4d","#15504d","#15524c","#16534c","#16554b","#16574b","#17584a","#175a49","#185b48","#195d48","#195e47","#1a6046","#1b6145","#1c6344","#1d6443","#1e6542","#1f6741","#206840","#22693f","#236a3e","#256b3d","#266c3c","#286d3b","#2a6e3a","#2b6f39","#2d7038","#2f7137","#317236","#337335","#357435","#387434","#3a7533","#3c7632","#3f7632","#417731","#447731","#467830","#497830","#4c792f","#4e792f","#51792f","#54792f","#577a2f","#5a7a2f","#5d7a2f","#607a2f","#637a2f","#667a30","#697b30","#6c7b31","#6f7b31","#727b32","#757b33","#787b34","#7b7a35","#7e7a36","#817a37","#847a38","#877a3a","#8a7a3b","#8d7a3d","#907a3e","#937a40","#967a42","#997944","#9c7946","#9f7948","#a1794a","#a4794c","#a7794f","#a97951","#ac7954","#ae7956","#b17959","#b3795b","#b5795e","#b77961","#b97964","#bc7967","#be796a","#bf796d","#c17a70","#c37a73","#c57a76","#c67a79","#c87b7c","#c97b7f","#ca7c83","#cc7c86","#cd7d89","#ce7d8c","#cf7e8f","#d07e93","#d17f96","#d18099","#d2809c","#d381a0","#d382a3","#d383a6","#d484a9","#d485ac","#d486af","#d487b2","#d588b5","#d589b8","#d48abb","#d48cbe","#d48dc1","#d48ec3","#d490c6","#d391c9","#d392cb","#d294ce","#d295d0","#d297d2","#d198d4","#d09ad7","#d09cd9","#cf9ddb","#cf9fdd","#cea1df","#cda2e0","#cca4e2","#cca6e4","#cba8e5","#caa9e7","#caabe8","#c9ade9","#c8afea","#c8b1ec","#c7b2ed","#c6b4ee","#c6b6ee","#c5b8ef","#c5baf0","#c4bcf1","#c4bdf1","#c3bff2","#c3c1f2","#c2c3f2","#c2c5f3","#c2c6f3","#c2c8f3","#c1caf3","#c1ccf3","#c1cdf3","#c1cff3","#c1d1f3","#c2d2f3","#c2d4f3","#c2d6f3","#c2d7f3","#c3d9f3","#c3daf2","#c4dcf2","#c4ddf2","#c5dff2","#c6e0f1","#c6e1f1","#c7e3f1","#c8e4f0","#c9e5f0","#cae7f0","#cbe8f0","#cce9ef","#cdeaef","#cfebef","#d0ecef","#d1edef","#d3eeef","#d4efef","#d6f0ef","#d7f1ef","#d9f2ef","#dbf3ef","#dcf3ef","#def4ef","#e0f5f0","#e2f6f0","#e3f6f0","#e5f7f1","#e7f8f1","#e9f8f2","#ebf9f3","#edfaf4","#effaf4","#f0fbf5","#f2fbf6","#f4fcf7","#f6fcf8","#f8fdfa","#fafdfb","#fbfefc","#fdfefe","#ffffff"],c.cubehelix_r=["#ffffff","#fdfefe","#fbfefc","#fafdfb","#f8fdfa","#f6fcf8","#f4fcf7","#f2fbf6","#f0fbf5","#effaf4","#edfaf4","#ebf9f3","#e9f8f2","#e7f8f1","#e5f7f1","#e3f6f0","#e2f6f0","#e0f5f0","#def4ef","#dcf3ef","#dbf3ef","#d9f2ef","#d7f1ef","#d6f0ef","#d4efef","#d3eeef","#d1edef","#d0ecef","#cfebef","#cdeaef","#cce9ef","#cbe8f0","#cae7f0","#c9e5f0","#c8e4f0","#c7e3f1","#c6e1f1","#c6e0f1","#c5dff2","#c4ddf2","#c4dcf2","#c3daf2","#c3d9f3","#c2d7f3","#c2d6f3","#c2d4f3","#c2d2f3","#c1d1f3","#c1cff3","#c1cdf3","#c1ccf3","#c1caf3","#c2c8f3","#c2c6f3","#c2c5f3","#c2c3f2","#c3c1f2","#c3bff2","#c4bdf1","#c4bcf1","#c5baf0","#c5b8ef","#c6b6ee","#c6b4ee","#c7b2ed","#c8b1ec","#c8afea","#c9ade9","#caabe8","#caa9e7","#cba8e5","#cca6e4","#cca4e2","#cda2e0","#cea1df","#cf9fdd","#cf9ddb","#d09cd9","#d09ad7","#d198d4","#d297d2","#d295d0","#d294ce","#d392cb","#d391c9","#d490c6","#d48ec3","#d48dc1","#d48cbe","#d48abb","#d589b8","#d588b5","#d487b2","#d486af","#d485ac","#d484a9","#d383a6","#d382a3","#d381a0","#d2809c","#d18099","#d17f96","#d07e93","#cf7e8f","#ce7d8c","#cd7d89","#cc7c86","#ca7c83","#c97b7f","#c87b7c","#c67a79","#c57a76","#c37a73","#c17a70","#bf796d","#be796a","#bc7967","#b97964","#b77961","#b5795e","#b3795b","#b17959","#ae7956","#ac7954","#a97951","#a7794f","#a4794c","#a1794a","#9f7948","#9c7946","#997944","#967a42","#937a40","#907a3e","#8d7a3d","#8a7a3b","#877a3a","#847a38","#817a37","#7e7a36","#7b7a35","#787b34","#757b33","#727b32","#6f7b31","#6c7b31","#697b30","#667a30","#637a2f","#607a2f","#5d7a2f","#5a7a2f","#577a2f","#54792f","#51792f","#4e792f","#4c792f","#497830","#467830","#447731","#417731","#3f7632","#3c7632","#3a7533","#387434","#357435","#337335","#317236","#2f7137","#2d7038","#2b6f39","#2a6e3a","#286d3b","#266c3c","#256b3d","#236a3e","#22693f","#206840","#1f6741","#1e6542","#1d6443","#1c6344","#1b6145","#1a6046","#195e47","#195d48","#185b48","#175a49","#17584a","#16574b","#16554b","#16534c","#15524c","#15504d","#154e4d","#154d4e","#154b4e","#15494e","#15474e","#15464e","#15444f","#15424e","#16404e","#163f4e","#163d4e","#163b4e","#16394d","#17374d","#17364c","#17344c","#18324b","#18314a","#182f49","#192d48","#192c47","#192a46","#192845","#1a2744","#1a2543","#1a2441","#1a2240","#1a213e","#1b1f3d","#1b1e3b","#1b1c3a","#1b1b38","#1b1a36","#1a1835","#1a1733","#1a1631","#1a142f","#19132d","#19122b","#191129","#181027","#180f25","#170e23","#160d21","#160c1f","#150b1d","#140a1b","#130919","#120817","#110815","#100713","#0f0611","#0e050f","#0c050e","#0b040c","#0a030a","#080308","#070206","#050205","#030103","#020102","#000000"],c.flag=["#ff0000","#ff6035","#ffb37e","#ffeac6","#ffffff","#cdeeff","#85b9ff","#3c69ff","#0009ff","#0000d0","#000088","#00003f","#000000","#2c0000","#730000","#bc0000","#fc0000","#ff4f29","#ffa570","#ffe2b9","#fffefa","#d9f4ff","#93c6ff","#497aff","#081cff","#0000dd","#000096","#00004d","#00000b","#1f0000","#650000","#af0000","#f10000","#ff3d1c","#ff9662","#ffd9ab","#fffbee","#e6f9ff","#a1d1ff","#578aff","#132fff","#0000e9","#0000a4","#00005b","#000016","#130000","#570000","#a10000","#e60000","#ff2a11","#ff8654","#ffce9d","#fff8e3","#f1fcff","#afdbff","#659aff","#1f41ff","#0000f4","#0000b2","#000069","#000022","#080000","#490000","#930000","#d90000","#ff1805","#ff7646","#ffc38f","#fff3d6","#fcfeff","#bce4ff","#73a8ff","#2c53ff","#0000ff","#0000c0","#000077","#00002f","#000000","#3c0000","#850000","#cd0000","#ff0500","#ff6539","#ffb681","#ffecca","#ffffff","#caecff","#81b6ff","#3965ff","#0005ff","#0000cd","#000085","#00003c","#000000","#2f0000","#770000","#c00000","#ff0000","#ff532c","#ffa873","#ffe4bc","#fffefc","#d6f3ff","#8fc3ff","#4676ff","#0518ff","#0000d9","#000093","#000049","#000008","#220000","#690000","#b20000","#f40000","#ff411f","#ff9a65","#ffdbaf","#fffcf1","#e3f8ff","#9dceff","#5486ff","#112aff","#0000e6","#0000a1","#000057","#000013","#160000","#5b0000","#a40000","#e90000","#ff2f13","#ff8a57","#ffd1a1","#fff9e6","#eefbff","#abd9ff","#6296ff","#1c3dff","#0000f1","#0000af","#000065","#00001f","#0b0000","#4d0000","#960000","#dd0000","#ff1c08","#ff7a49","#ffc693","#fff4d9","#fafeff","#b9e2ff","#70a5ff","#294fff","#0000fc","#0000bc","#000073","#00002c","#000000","#3f0000","#880000","#d00000","#ff0900","#ff693c","#ffb985","#ffeecd","#ffffff","#c6eaff","#7eb3ff","#3560ff","#0000ff","#0000ca","#000081","#000039","#000000","#320000","#7a0000","#c30000","#ff0000","#ff582f","#ffac77","#ffe6c0","#ffffff","#d3f1ff","#8cc0ff","#4372ff","#0313ff","#0000d6","#00008f","#000046","#000005","#260000","#6c0000","#b60000","#f70000","#ff4622","#ff9d69","#ffdeb2","#fffdf4","#e0f7ff","#9acbff","#5082ff","#0e26ff","#0000e3","#00009d","#000054","#000011","#190000","#5e0000","#a80000","#ec0000","#ff3316","#ff8e5b","#ffd4a4","#fffae9","#ecfbff","#a8d6ff","#5e92ff","#1938ff","#0000ee","#0000ab","#000062","#00001c","#0e0000","#500000","#9a0000","#e00000","#ff210b","#ff7e4d","#ffc996","#fff5dd","#f7fdff","#b6e0ff","#6ca1ff","#264aff","#0000fa","#0000b9","#000070","#000029","#030000","#430000","#8c0000","#d30000","#ff0e00","#ff6d3f","#ffbc88","#ffefd0","#ffffff","#c3e8ff","#7aafff","#325cff","#0000ff","#0000c6","#00007e","#000035","#000000"],c.flag_r=["#000000","#000035","#00007e","#0000c6","#0000ff","#325cff","#7aafff","#c3e8ff","#ffffff","#ffefd0","#ffbc88","#ff6d3f","#ff0e00","#d30000","#8c0000","#430000","#030000","#000029","#000070","#0000b9","#0000fa","#264aff","#6ca1ff","#b6e0ff","#f7fdff","#fff5dd","#ffc996","#ff7e4d","#ff210b","#e00000","#9a0000","#500000","#0e0000","#00001c","#000062","#0000ab","#0000ee","#1938ff","#5e92ff","#a8d6ff","#ecfbff","#fffae9","#ffd4a4","#ff8e5b","#ff3316","#ec0000","#a80000","#5e0000","#190000","#000011","#000054","#00009d","#0000e3","#0e26ff","#5082ff","#9acbff","#e0f7ff","#fffdf4","#ffdeb2","#ff9d69","#ff4622","#f70000","#b60000","#6c0000","#260000","#000005","#000046","#00008f","#0000d6","#0313ff","#4372ff","#8cc0ff","#d3f1ff","#ffffff","#ffe6c0","#ffac77","#ff582f","#ff0000","#c30000","#7a0000","#320000","#000000","#000039","#000081","#0000ca","#0000ff","#3560ff","#7eb3ff","#c6eaff","#ffffff","#ffeecd","#ffb985","#ff693c","#ff0900","#d00000","#880000","#3f0000","#000000","#00002c","#000073","#0000bc","#0000fc","#294fff","#70a5ff","#b9e2ff","#fafeff","#fff4d9","#ffc693","#ff7a49","#ff1c08","#dd0000","#960000","#4d0000","#0b0000","#00001f","#000065","#0000af","#0000f1","#1c3dff","#6296ff","#abd9ff","#eefbff","#fff9e6","#ffd1a1","#ff8a57","#ff2f13","#e90000","#a40000","#5b0000","#160000","#000013","#000057","#0000a1","#0000e6","#112aff","#5486ff","#9dceff","#e3f8ff","#fffcf1","#ffdbaf","#ff9a65","#ff411f","#f40000","#b20000","#690000","#220000","#000008","#000049","#000093","#0000d9","#0518ff","#4676ff","#8fc3ff","#d6f3ff","#fffefc","#ffe4bc","#ffa873","#ff532c","#ff0000","#c00000","#770000","#2f0000","#000000","#00003c","#000085","#0000cd","#0005ff","#3965ff","#81b6ff","#caecff","#ffffff","#ffecca","#ffb681","#ff6539","#ff0500","#cd0000","#850000","#3c0000","#000000","#00002f","#000077","#0000c0","#0000ff","#2c53ff","#73a8ff","#bce4ff","#fcfeff","#fff3d6","#ffc38f","#ff7646","#ff1805","#d90000","#930000","#490000","#080000","#000022","#000069","#0000b2","#0000f4","#1f41ff","#659aff","#afdbff","#f1fcff","#fff8e3","#ffce9d","#ff8654","#ff2a11","#e60000","#a10000","#570000","#130000","#000016","#00005b","#0000a4","#0000e9","#132fff","#578aff","#a1d1ff","#e6f9ff","#fffbee","#ffd9ab","#ff9662","#ff3d1c","#f10000","#af0000","#650000","#1f0000","#00000b","#00004d","#000096","#0000dd","#081cff","#497aff","#93c6ff","#d9f4ff","#fffefa","#ffe2b9","#ffa570","#ff4f29","#fc0000","#bc0000","#730000","#2c0000","#000000","#00003f","#000088","#0000d0","#0009ff","#3c69ff","#85b9ff","#cdeeff","#ffffff","#ffeac6","#ffb37e","#ff6035","#ff0000"],c.gist_earth=["#000000","#01002b","#010039","#020043","#03004e","#030059","#040064","#05006e","#050274","#060574","#070774","#070975","#080b75","#090e75","#091075","#0a1275","#0b1575","#0b1776","#0c1976","#0d1c76","#0d1e76","#0e2076","#0f2277","#0f2577","#102777","#112977","#112c77","#122e77","#133078","#133278","#143478","#153778","#153978","#163b79","#173d79","#173f79","#184179","#194379","#194579","#1a477a","#1b497a","#1b4b7a","#1c4d7a","#1d4f7a","#1d517b","#1e537b","#1f557b","#1f577b","#20597b","#215a7b","#215c7c","#225e7c","#23607c","#23627c","#24647c","#25657d","#25677d","#26687d","#276a7d","#276b7d","#286d7d","#296f7e","#29707e","#2a727e","#2b737e","#2b757e","#2c777f","#2d787f","#2d7a7f","#2e7b7f","#2f7d7f","#2f7e7f","#308080","#30817e","#31817d","#31827c","#32827b","#328379","#338378","#338477","#348576","#348575","#358673","#358672","#368771","#368770","#37886e","#37896d","#38896c","#388a6b","#388a6a","#398b68","#398c67","#3a8c66","#3a8d65","#3b8d63","#3b8e62","#3c8e61","#3c8f60","#3d905f","#3d905d","#3e915c","#3e915b","#3f925a","#3f9258","#409357","#409456","#409455","#419554","#419552","#429651","#429650","#43974f","#43984d","#44984c","#44994b","#45994a","#459a49","#479a47","#4a9b46","#4c9c47","#4e9c47","#509d48","#539d48","#559e49","#579f4a","#599f4a","#5ba04b","#5ea04b","#60a14c","#62a14c","#64a24d","#67a34e","#69a34e","#6ba44f","#6da44f","#6fa450","#72a551","#74a551","#76a652","#78a652","#7aa752","#7ca753","#7da853","#7fa853","#81a854","#82a954","#84a954","#86aa55","#87aa55","#89ab55","#8aab56","#8cab56","#8eac56","#8fac56","#91ad57","#93ad57","#94ae57","#96ae58","#98af58","#99af58","#9baf59","#9db059","#9eb059","#a0b15a","#a2b15a","#a3b25a","#a5b25b","#a7b25b","#a8b35b","#aab35c","#abb45c","#adb45c","#afb55c","#b0b55d","#b2b65d","#b4b65d","#b5b65e","#b7b75e","#b7b65e","#b8b55f","#b8b45f","#b9b35f","#b9b360","#b9b260","#bab160","#bab061","#bbaf61","#bbae61","#bcad62","#bcac62","#bcac62","#bdab62","#bdaa63","#bea963","#bea863","#bfa764","#bfa664","#bfa664","#c0a565","#c0a465","#c1a367","#c2a46a","#c3a46c","#c4a46f","#c5a571","#c6a574","#c7a676","#c8a779","#caa87b","#cba97e","#ccaa80","#cdaa82","#ceab85","#cfac87","#d0ad8a","#d1ae8c","#d3af8f","#d4b091","#d5b194","#d6b196","#d7b298","#d8b49b","#d9b59d","#dab7a0","#dbb8a2","#ddb9a5","#debba7","#dfbcaa","#e0bdad","#e1bfb0","#e2c1b3","#e3c3b6","#e4c5b9","#e6c7bc","#e7c9bf","#e8cbc2","#e9cdc5","#eacfc8","#ebd1cb","#ecd3ce","#edd5d1","#eed8d4","#f0dad7","#f1dcda","#f2dedd","#f3e1e0","#f4e4e3","#f5e7e6","#f6eae9","#f7ecec","#f9efef","#faf2f2","#fbf5f5","#fcf8f8","#fdfbfb"],c.gist_earth_r=["#fdfbfb","#fcf8f8","#fbf5f5","#faf2f2","#f9efef","#f7ecec","#f6eae9","#f5e7e6","#f4e4e3","#f3e1e0","#f2dedd","#f1dcda","#f0dad7","#eed8d4","#edd5d1","#ecd3ce","#ebd1cb","#eacfc8","#e9cdc5","#e8cbc2","#e7c9bf","#e6c7bc","#e4c5b9","#e3c3b6","#e2c1b3","#e1bfb0","#e0bdad","#dfbcaa","#debba7","#ddb9a5","#dbb8a2","#dab7a0","#d9b59d","#d8b49b","#d7b298","#d6b196","#d5b194","#d4b091","#d3af8f","#d1ae8c","#d0ad8a","#cfac87","#ceab85","#cdaa82","#ccaa80","#cba97e","#caa87b","#c8a779","#c7a676","#c6a574","#c5a571","#c4a46f","#c3a46c","#c2a46a","#c1a367","#c0a465","#c0a565","#bfa664","#bfa664","#bfa764","#bea863","#bea963","#bdaa63","#bdab62","#bcac62","#bcac62","#bcad62","#bbae61","#bbaf61","#bab061","#bab160","#b9b260","#b9b360","#b9b35f","#b8b45f","#b8b55f","#b7b65e","#b7b75e","#b5b65e","#b4b65d","#b2b65d","#b0b55d","#afb55c","#adb45c","#abb45c","#aab35c","#a8b35b","#a7b25b","#a5b25b","#a3b25a","#a2b15a","#a0b15a","#9eb059","#9db059","#9baf59","#99af58","#98af58","#96ae58","#94ae57","#93ad57","#91ad57","#8fac56","#8eac56","#8cab56","#8aab56","#89ab55","#87aa55","#86aa55","#84a954","#82a954","#81a854","#7fa853","#7da853","#7ca753","#7aa752","#78a652","#76a652","#74a551","#72a551","#6fa450","#6da44f","#6ba44f","#69a34e","#67a34e","#64a24d","#62a14c","#60a14c","#5ea04b","#5ba04b","#599f4a","#579f4a","#559e49","#539d48","#509d48","#4e9c47","#4c9c47","#4a9b46","#479a47","#459a49","#45994a","#44994b","#44984c","#43984d","#43974f","#429650","#429651","#419552","#419554","#409455","#409456","#409357","#3f9258","#3f925a","#3e915b","#3e915c","#3d905d","#3d905f","#3c8f60","#3c8e61","#3b8e62","#3b8d63","#3a8d65","#3a8c66","#398c67","#398b68","#388a6a","#388a6b","#38896c","#37896d","#37886e","#368770","#368771","#358672","#358673","#348575","#348576","#338477","#338378","#328379","#32827b","#31827c","#31817d","#30817e","#308080","#2f7e7f","#2f7d7f","#2e7b7f","#2d7a7f","#2d787f","#2c777f","#2b757e","#2b737e","#2a727e","#29707e","#296f7e","#286d7d","#276b7d","#276a7d","#26687d","#25677d","#25657d","#24647c","#23627c","#23607c","#225e7c","#215c7c","#215a7b","#20597b","#1f577b","#1f557b","#1e537b","#1d517b","#1d4f7a","#1c4d7a","#1b4b7a","#1b497a","#1a477a","#194579","#194379","#184179","#173f79","#173d79","#163b79","#153978","#153778","#143478","#133278","#133078","#122e77","#112c77","#112977","#102777","#0f2577","#0f2277","#0e2076","#0d1e76","#0d1c76","#0c1976","#0b1776","#0b1575","#0a1275","#091075","#090e75","#080b75","#070975","#070774","#060574","#050274","#05006e","#040064","#030059","#03004e","#020043","#010039","#01002b","#000000"],c.gist_gray=["#000000","#010101","#020202","#030303","#040404","#050505","#060606","#070707","#080808","#090909","#0a0a0a","#0b0b0b","#0c0c0c","#0d0d0d","#0e0e0e","#0f0f0f","#101010","#111111","#121212","#131313","#141414","#151515","#161616","#171717","#181818","#191919","#1a1a1a","#1b1b1b","#1c1c1c","#1d1d1d","#1e1e1e","#1f1f1f","#202020","#212121","#222222","#232323","#242424","#252525","#262626","#272727","#282828","#292929","#2a2a2a","#2b2b2b","#2c2c2c","#2d2d2d","#2e2e2e","#2f2f2f","#303030","#313131","#323232","#333333","#343434","#353535","#363636","#373737","#383838","#393939","#3a3a3a","#3b3b3b","#3c3c3c","#3d3d3d","#3e3e3e","#3f3f3f","#404040","#414141","#424242","#434343","#444444","#454545","#464646","#474747","#484848","#494949","#4a4a4a","#4b4b4b","#4c4c4c","#4d4d4d","#4e4e4e","#4f4f4f","#505050","#515151","#525252","#535353","#545454","#555555","#565656","#575757","#585858","#595959","#5a5a5a","#5b5b5b","#5c5c5c","#5d5d5d","#5e5e5e","#5f5f5f","#606060","#616161","#626262","#636363","#646464","#656565","#666666","#676767","#686868","#696969","#6a6a6a","#6b6b6b","#6c6c6c","#6d6d6d","#6e6e6e","#6f6f6f","#707070","#717171","#727272","#737373","#747474","#757575","#767676","#777777","#787878","#797979","#7a7a7a","#7b7b7b","#7c7c7c","#7d7d7d","#7e7e7e","#7f7f7f","#808080","#818181","#828282","#838383","#848484","#858585","#868686","#878787","#888888","#898989","#8a8a8a","#8b8b8b","#8c8c8c","#8d8d8d","#8e8e8e","#8f8f8f","#909090","#919191","#929292","#939393","#949494","#959595","#969696","#979797","#989898","#999999","#9a9a9a","#9b9b9b","#9c9c9c","#9d9d9d","#9e9e9e","#9f9f9f","#a0a0a0","#a1a1a1","#a2a2a2","#a3a3a3","#a4a4a4","#a5a5a5","#a6a6a6","#a7a7a7","#a8a8a8","#a9a9a9","#aaaaaa","#ababab","#acacac","#adadad","#aeaeae","#afafaf","#b0b0b0","#b1b1b1","#b2b2b2","#b3b3b3","#b4b4b4","#b5b5b5","#b6b6b6","#b7b7b7","#b8b8b8","#b9b9b9","#bababa","#bbbbbb","#bcbcbc","#bdbdbd","#bebebe","#bfbfbf","#c0c0c0","#c1c1c1","#c2c2c2","#c3c3c3","#c4c4c4","#c5c5c5","#c6c6c6","#c7c7c7","#c8c8c8","#c9c9c9","#cacaca","#cbcbcb","#cccccc","#cdcdcd","#cecece","#cfcfcf","#d0d0d0","#d1d1d1","#d2d2d2","#d3d3d3","#d4d4d4","#d5d5d5","#d6d6d6","#d7d7d7","#d8d8d8","#d9d9d9","#dadada","#dbdbdb","#dcdcdc","#dddddd","#dedede","#dfdfdf","#e0e0e0","#e1e1e1","#e2e2e2","#e3e3e3","#e4e4e4","#e5e5e5","#e6e6e6","#e7e7e7","#e8e8e8","#e9e9e9","#eaeaea","#ebebeb","#ececec","#ededed","#eeeeee","#efefef","#f0f0f0","#f1f1f1","#f2f2f2","#f3f3f3","#f4f4f4","#f5f5f5","#f6f6f6","#f7f7f7","#f8f8f8","#f9f9f9","#fafafa","#fbfbfb","#fcfcfc","#fdfdfd","#fefefe","#ffffff"],c.gist_gray_r=["#ffffff","#fefefe","#fdfdfd","#fcfcfc","#fbfbfb","#fafafa","#f9f9f9","#f8f8f8","#f7f7f7","#f6f6f6","#f5f5f5","#f4f4f4","#f3f3f3","#f2f2f2","#f1f1f1","#f0f0f0","#efefef","#eeeeee","#ededed","#ececec","#ebebeb","#eaeaea","#e9e9e9","#e8e8e8","#e7e7e7","#e6e6e6","#e5e5e5","#e4e4e4","#e3e3e3","#e2e2e2","#e1e1e1","#e0e0e0","#dfdfdf","#dedede","#dddddd","#dcdcdc","#dbdbdb","#dadada","#d9d9d9","#d8d8d8","#d7d7d7","#d6d6d6","#d5d5d5","#d4d4d4","#d3d3d3","#d2d2d2","#d1d1d1","#d0d0d0","#cfcfcf","#cecece","#cdcdcd","#cccccc","#cbcbcb","#cacaca","#c9c9c9","#c8c8c8","#c7c7c7","#c6c6c6","#c5c5c5","#c4c4c4","#c3c3c3","#c2c2c2","#c1c1c1","#c0c0c0","#bfbfbf","#bebebe","#bdbdbd","#bcbcbc","#bbbbbb","#bababa","#b9b9b9","#b8b8b8","#b7b7b7","#b6b6b6","#b5b5b5","#b4b4b4","#b3b3b3","#b2b2b2","#b1b1b1","#b0b0b0","#afafaf","#aeaeae","#adadad","#acacac","#ababab","#aaaaaa","#a9a9a9","#a8a8a8","#a7a7a7","#a6a6a6","#a5a5a5","#a4a4a4","#a3a3a3","#a2a2a2","#a1a1a1","#a0a0a0","#9f9f9f","#9e9e9e","#9d9d9d","#9c9c9c","#9b9b9b","#9a9a9a","#999999","#989898","#979797","#969696","#959595","#949494","#939393","#929292","#919191","#909090","#8f8f8f","#8e8e8e","#8d8d8d","#8c8c8c","#8b8b8b","#8a8a8a","#898989","#888888","#878787","#868686","#858585","#848484","#838383","#828282","#818181","#808080","#7f7f7f","#7e7e7e","#7d7d7d","#7c7c7c","#7b7b7b","#7a7a7a","#797979","#787878","#777777","#767676","#757575","#747474","#737373","#727272","#717171","#707070","#6f6f6f","#6e6e6e","#6d6d6d","#6c6c6c","#6b6b6b","#6a6a6a","#696969","#686868","#676767","#666666","#656565","#646464","#636363","#626262","#616161","#606060","#5f5f5f","#5e5e5e","#5d5d5d","#5c5c5c","#5b5b5b","#5a5a5a","#595959","#585858","#575757","#565656","#555555","#545454","#535353","#525252","#515151","#505050","#4f4f4f","#4e4e4e","#4d4d4d","#4c4c4c","#4b4b4b","#4a4a4a","#494949","#484848","#474747","#464646","#454545","#444444","#434343","#424242","#414141","#404040","#3f3f3f","#3e3e3e","#3d3d3d","#3c3c3c","#3b3b3b","#3a3a3a","#393939","#383838","#373737","#363636","#353535","#343434","#333333","#323232","#313131","#303030","#2f2f2f","#2e2e2e","#2d2d2d","#2c2c2c","#2b2b2b","#2a2a2a","#292929","#282828","#272727","#262626","#252525","#242424","#232323","#222222","#212121","#202020","#1f1f1f","#1e1e1e","#1d1d1d","#1c1c1c","#1b1b1b","#1a1a1a","#191919","#181818","#171717","#161616","#151515","#141414","#131313","#121212","#111111","#101010","#0f0f0f","#0e0e0e","#0d0d0d","#0c0c0c","#0b0b0b","#0a0a0a","#090909","#080808","#070707","#060606","#050505","#040404","#030303","#020202","#010101","#000000"],c.gist_grey=["#000000","#010101","#020202","#030303","#040404","#050505","#060606","#070707","#080808","#090909","#0a0a0a","#0b0b0b","#0c0c0c","#0d0d0d","#0e0e0e","#0f0f0f","#101010","#111111","#121212","#131313","#141414","#151515","#161616","#171717","#181818","#191919","#1a1a1a","#1b1b1b","#1c1c1c","#1d1d1d","#1e1e1e","#1f1f1f","#202020","#212121","#222222","#232323","#242424","#252525","#262626","#272727","#282828","#292929","#2a2a2a","#2b2b2b","#2c2c2c","#2d2d2d","#2e2e2e","#2f2f2f","#303030","#313131","#323232","#333333","#343434","#353535","#363636","#373737","#383838","#393939","#3a3a3a","#3b3b3b","#3c3c3c","#3d3d3d","#3e3e3e","#3f3f3f","#404040","#414141","#424242","#434343","#444444","#454545","#464646","#474747","#484848","#494949","#4a4a4a","#4b4b4b","#4c4c4c","#4d4d4d","#4e4e4e","#4f4f4f","#505050","#515151","#525252","#535353","#545454","#555555","#565656","#575757","#585858","#595959","#5a5a5a","#5b5b5b","#5c5c5c","#5d5d5d","#5e5e5e","#5f5f5f","#606060","#616161","#626262","#636363","#646464","#656565","#666666","#676767","#686868","#696969","#6a6a6a","#6b6b6b","#6c6c6c","#6d6d6d","#6e6e6e","#6f6f6f","#707070","#717171","#727272","#737373","#747474","#757575","#767676","#777777","#787878","#797979","#7a7a7a","#7b7b7b","#7c7c7c","#7d7d7d","#7e7e7e","#7f7f7f","#808080","#818181","#828282","#838383","#848484","#858585","#868686","#878787","#888888","#898989","#8a8a8a","#8b8b8b","#8c8c8c","#8d8d8d","#8e8e8e","#8f8f8f","#909090","#919191","#929292","#939393","#949494","#959595","#969696","#979797","#989898","#999999","#9a9a9a","#9b9b9b","#9c9c9c","#9d9d9d","#9e9e9e","#9f9f9f","#a0a0a0","#a1a1a1","#a2a2a2","#a3a3a3","#a4a4a4","#a5a5a5","#a6a6a6","#a7a7a7","#a8a8a8","#a9a9a9","#aaaaaa","#ababab","#acacac","#adadad","#aeaeae","#afafaf","#b0b0b0","#b1b1b1","#b2b2b2","#b3b3b3","#b4b4b4","#b5b5b5","#b6b6b6","#b7b7b7","#b8b8b8","#b9b9b9","#bababa","#bbbbbb","#bcbcbc","#bdbdbd","#bebebe","#bfbfbf","#c0c0c0","#c1c1c1","#c2c2c2","#c3c3c3","#c4c4c4","#c5c5c5","#c6c6c6","#c7c7c7","#c8c8c8","#c9c9c9","#cacaca","#cbcbcb","#cccccc","#cdcdcd","#cecece","#cfcfcf","#d0d0d0","#d1d1d1","#d2d2d2","#d3d3d3","#d4d4d4","#d5d5d5","#d6d6d6","#d7d7d7","#d8d8d8","#d9d9d9","#dadada","#dbdbdb","#dcdcdc","#dddddd","#dedede","#dfdfdf","#e0e0e0","#e1e1e1","#e2e2e2","#e3e3e3","#e4e4e4","#e5e5e5","#e6e6e6","#e7e7e7","#e8e8e8","#e9e9e9","#eaeaea","#ebebeb","#ececec","#ededed","#eeeeee","#efefef","#f0f0f0","#f1f1f1","#f2f2f2","#f3f3f3","#f4f4f4","#f5f5f5","#f6f6f6","#f7f7f7","#f8f8f8","#f9f9f9","#fafafa","#fbfbfb","#fcfcfc","#fdfdfd","#fefefe","#ffffff"],c.gist_heat=["#000000","#020000","#030000","#040000","#060000","#080000","#090000","#0a0000","#0c0000","#0e0000","#0f0000","#100000","#120000","#140000","#150000","#160000","#180000","#1a0000","#1b0000","#1c0000","#1e0000","#200000","#210000","#220000","#240000","#260000","#270000","#280000","#2a0000","#2c0000","#2d0000","#2e0000","#300000","#310000","#330000","#350000","#360000","#370000","#390000","#3b0000","#3c0000","#3d0000","#3f0000","#400000","#420000","#430000","#450000","#460000","#480000","#4a0000","#4b0000","#4d0000","#4e0000","#500000","#510000","#520000","#540000","#560000","#570000","#580000","#5a0000","#5b0000","#5d0000","#5e0000","#600000","#620000","#630000","#650000","#660000","#680000","#690000","#6a0000","#6c0000","#6e0000","#6f0000","#700000","#720000","#730000","#750000","#760000","#780000","#7a0000","#7b0000","#7d0000","#7e0000","#800000","#810000","#820000","#840000","#850000","#870000","#880000","#8a0000","#8b0000","#8d0000","#8e0000","#900000","#920000","#930000","#940000","#960000","#980000","#990000","#9b0000","#9c0000","#9e0000","#9f0000","#a00000","#a20000","#a30000","#a50000","#a60000","#a80000","#aa0000","#ab0000","#ac0000","#ae0000","#b00000","#b10000","#b20000","#b40000","#b50000","#b70000","#b80000","#ba0000","#bb0000","#bd0000","#be0000","#c00100","#c20300","#c30500","#c40700","#c60900","#c80b00","#c90d00","#cb0f00","#cc1100","#ce1300","#cf1500","#d01700","#d21900","#d41b00","#d51d00","#d61f00","#d82100","#da2300","#db2500","#dc2700","#de2900","#e02b00","#e12d00","#e22f00","#e43100","#e53300","#e73500","#e83700","#ea3900","#ec3b00","#ed3d00","#ee3f00","#f04100","#f24300","#f34500","#f44700","#f64900","#f84b00","#f94d00","#fb4f00","#fc5100","#fe5300","#ff5500","#ff5700","#ff5900","#ff5b00","#ff5d00","#ff5f00","#ff6100","#ff6300","#ff6500","#ff6700","#ff6900","#ff6b00","#ff6d00","#ff6f00","#ff7100","#ff7300","#ff7500","#ff7700","#ff7900","#ff7b00","#ff7d00","#ff7f00","#ff8103","#ff8307","#ff850b","#ff870f","#ff8913","#ff8b17","#ff8d1b","#ff8f1f","#ff9123","#ff9327","#ff952b","#ff972f","#ff9933","#ff9b37","#ff9d3b","#ff9f3f","#ffa143","#ffa347","#ffa54b","#ffa74f","#ffa953","#ffab57","#ffad5b","#ffaf5f","#ffb163","#ffb367","#ffb56b","#ffb76f","#ffb973","#ffbb77","#ffbd7b","#ffbf7f","#ffc183","#ffc387","#ffc58b","#ffc78f","#ffc993","#ffcb97","#ffcd9b","#ffcf9f","#ffd1a3","#ffd3a7","#ffd5ab","#ffd7af","#ffd9b3","#ffdbb7","#ffddbb","#ffdfbf","#ffe1c3","#ffe3c7","#ffe5cb","#ffe7cf","#ffe9d3","#ffebd7","#ffeddb","#ffefdf","#fff1e3","#fff3e7","#fff5eb","#fff7ef","#fff9f3","#fffbf7","#fffdfb","#ffffff"],c.gist_heat_r=["#ffffff","#fffdfb","#fffbf7","#fff9f3","#fff7ef","#fff5eb","#fff3e7","#fff1e3","#ffefdf","#ffeddb","#ffebd7","#ffe9d3","#ffe7cf","#ffe5cb","#ffe3c7","#ffe1c3","#ffdfbf","#ffddbb","#ffdbb7","#ffd9b3","#ffd7af","#ffd5ab","#ffd3a7","#ffd1a3","#ffcf9f","#ffcd9b","#ffcb97","#ffc993","#ffc78f","#ffc58b","#ffc387","#ffc183","#ffbf7f","#ffbd7b","#ffbb77","#ffb973","#ffb76f","#ffb56b","#ffb367","#ffb163","#ffaf5f","#ffad5b","#ffab57","#ffa953","#ffa74f","#ffa54b","#ffa347","#ffa143","#ff9f3f","#ff9d3b","#ff9b37","#ff9933","#ff972f","#ff952b","#ff9327","#ff9123","#ff8f1f","#ff8d1b","#ff8b17","#ff8913","#ff870f","#ff850b","#ff8307","#ff8103","#ff7f00","#ff7d00","#ff7b00","#ff7900","#ff7700","#ff7500","#ff7300","#ff7100","#ff6f00","#ff6d00","#ff6b00","#ff6900","#ff6700","#ff6500","#ff6300","#ff6100","#ff5f00","#ff5d00","#ff5b00","#ff5900","#ff5700","#ff5500","#fe5300","#fc5100","#fb4f00","#f94d00","#f84b00","#f64900","#f44700","#f34500","#f24300","#f04100","#ee3f00","#ed3d00","#ec3b00","#ea3900","#e93700","#e73500","#e53300","#e43100","#e22f00","#e12d00","#e02b00","#de2900","#dc2700","#db2500","#da2300","#d82100","#d61f00","#d51d00","#d41b00","#d21900","#d11700","#cf1500","#ce1300","#cc1100","#cb0f00","#c90d00","#c80b00","#c60900","#c40700","#c30500","#c20300","#c00100","#be0000","#bd0000","#bc0000","#ba0000","#b90000","#b70000","#b50000","#b40000","#b20000","#b10000","#b00000","#ae0000","#ac0000","#ab0000","#aa0000","#a80000","#a60000","#a50000","#a40000","#a20000","#a10000","#9f0000","#9e0000","#9c0000","#9b0000","#990000","#980000","#960000","#940000","#930000","#920000","#900000","#8e0000","#8d0000","#8c0000","#8a0000","#890000","#870000","#850000","#840000","#820000","#810000","#800000","#7e0000","#7c0000","#7b0000","#7a0000","#780000","#760000","#750000","#740000","#720000","#710000","#6f0000","#6e0000","#6c0000","#6a0000","#690000","#680000","#660000","#640000","#630000","#620000","#600000","#5e0000","#5d0000","#5c0000","#5a0000","#590000","#570000","#560000","#540000","#520000","#510000","#500000","#4e0000","#4c0000","#4b0000","#4a0000","#480000","#460000","#450000","#440000","#420000","#410000","#3f0000","#3d0000","#3c0000","#3b0000","#390000","#380000","#360000","#340000","#330000","#310000","#300000","#2f0000","#2d0000","#2c0000","#2a0000","#290000","#270000","#250000","#240000","#230000","#210000","#200000","#1e0000","#1c0000","#1b0000","#190000","#180000","#170000","#150000","#140000","#120000","#110000","#0f0000","#0d0000","#0c0000","#0b0000","#090000","#080000","#060000","#040000","#030000","#010000","#000000"],c.gist_ncar=["#000080","#000777","#000f6d","#001664","#001d5a","#002451","#002c48","#00333e","#003a35","#00422b","#004922","#005019","#00580f","#005f06","#005816","#005127","#004b37","#004448","#003d59","#003669","#002f7a","#00298b","#00229b","#001bac","#0014bc","#000ecd","#0007de","#0000ee","#000eff","#001cff","#002aff","#0038ff","#0047ff","#0055ff","#0063ff","#0071ff","#007fff","#008dff","#009bff","#00a9ff","#00b8ff","#00c0ff","#00c6ff","#00caff","#00ceff","#00d3ff","#00d7ff","#00dcff","#00e0ff","#00e5ff","#00e9ff","#00edff","#00f2ff","#00f6f8","#00fbf2","#00ffeb","#00ffe5","#00fede","#00fed8","#00fdd1","#00fdcb","#00fcc4","#00fcbd","#00fbb7","#00fbb0","#00faaa","#00faa3","#00fa9d","#00fa92","#00fa88","#00fa7d","#00fb73","#00fb68","#00fc5e","#00fc54","#00fd49","#00fd3f","#00fd34","#00fe2a","#00fe1f","#06ff15","#0dff0b","#13fb00","#19f700","#20f400","#26f000","#2dec00","#33e800","#39e500","#40e100","#46dd00","#4cd900","#53d600","#59d200","#60ce00","#66d100","#68d500","#6ad800","#6cdb00","#6ede00","#70e200","#72e500","#74e800","#76eb00","#78ef00","#7af200","#7cf500","#7ef804","#80fc08","#84ff0c","#89ff10","#8dff14","#92ff18","#96ff1c","#9bff20","#9fff24","#a4ff28","#a9ff2c","#adff30","#b2ff34","#b6ff38","#bbff3c","#bfff38","#c4ff34","#c8ff30","#cdff2c","#d2ff28","#d6ff24","#dbff20","#dfff1c","#e4ff18","#e8ff14","#edff10","#f1ff0c","#f6fd08","#fafa04","#fff800","#fff500","#fff300","#fff000","#ffee00","#ffeb00","#ffe900","#ffe600","#ffe400","#ffe100","#ffdf00","#ffdc00","#ffda00","#ffd801","#ffd502","#ffd303","#ffd004","#ffce05","#ffcb06","#ffc908","#ffc609","#ffc40a","#ffc10b","#ffbf0c","#ffbc0d","#ffba0e","#ffb20d","#ffaa0c","#ffa10b","#ff990a","#ff9109","#ff8908","#ff8107","#ff7807","#ff7006","#ff6805","#ff6004","#ff5803","#ff5002","#ff4701","#ff4300","#ff3e00","#ff3900","#ff3400","#ff3000","#ff2b00","#ff2600","#ff2100","#ff1d00","#ff1800","#ff1300","#ff0e00","#ff0a00","#ff0512","#ff0023","#ff0035","#ff0047","#ff0058","#ff006a","#ff007c","#ff008e","#ff009f","#ff00b1","#ff00c3","#ff00d5","#ff00e6","#ff00f8","#f803fc","#f107ff","#ea0aff","#e40eff","#dd11ff","#d615ff","#cf18ff","#c81cff","#c11fff","#ba22ff","#b326ff","#ac29ff","#a62dff","#9f33fe","#a439fd","#aa3ffb","#b044fa","#b64af9","#bc50f8","#c256f7","#c85cf5","#ce62f4","#d468f3","#da6ef2","#e074f1","#e67aef","#eb80ee","#ec84ef","#ed89ef","#ee8df0","#ee92f1","#ef97f1","#f09bf2","#f0a0f2","#f1a5f3","#f2a9f4","#f3aef4","#f3b3f5","#f4b7f5","#f5bcf6","#f5c0f7","#f6c5f7","#f7caf8","#f8cef9","#f8d3f9","#f9d8fa","#fadcfa","#fae1fb","#fbe5fc","#fceafc","#fdeffd","#fdf3fd","#fef8fe"],c.gist_ncar_r=["#fef8fe","#fdf3fd","#fdeffd","#fceafc","#fbe5fc","#fae1fb","#fadcfa","#f9d8fa","#f8d3f9","#f8cef9","#f7caf8","#f6c5f7","#f5c0f7","#f5bcf6","#f4b7f5","#f3b3f5","#f3aef4","#f2a9f4","#f1a5f3","#f0a0f2","#f09bf2","#ef97f1","#ee92f1","#ee8df0","#ed89ef","#ec84ef","#eb80ee","#e67aef","#e074f1","#da6ef2","#d468f3","#ce62f4","#c85cf5","#c256f7","#bc50f8","#b64af9","#b044fa","#aa3ffb","#a439fd","#9f33fe","#a62dff","#ac29ff","#b326ff","#ba22ff","#c11fff","#c81cff","#cf18ff","#d615ff","#dd11ff","#e40eff","#ea0aff","#f107ff","#f803fc","#ff00f8","#ff00e6","#ff00d5","#ff00c3","#ff00b1","#ff009f","#ff008e","#ff007c","#ff006a","#ff0058","#ff0047","#ff0035","#ff0023","#ff0512","#ff0a00","#ff0e00","#ff1300","#ff1800","#ff1d00","#ff2100","#ff2600","#ff2b00","#ff3000","#ff3400","#ff3900","#ff3e00","#ff4300","#ff4701","#ff5002","#ff5803","#ff6004","#ff6805","#ff7006","#ff7807","#ff8107","#ff8908","#ff9109","#ff990a","#ffa10b","#ffaa0c","#ffb20d","#ffba0e","#ffbc0d","#ffbf0c","#ffc10b","#ffc40a","#ffc609","#ffc908","#ffcb06","#ffce05","#ffd004","#ffd303","#ffd502","#ffd801","#ffda00","#ffdc00","#ffdf00","#ffe100","#ffe400","#ffe600","#ffe900","#ffeb00","#ffee00","#fff000","#fff300","#fff500","#fff800","#fafa04","#f6fd08","#f1ff0c","#edff10","#e8ff14","#e4ff18","#dfff1c","#dbff20","#d6ff24","#d2ff28","#cdff2c","#c8ff30","#c4ff34","#bfff38","#bbff3c","#b6ff38","#b2ff34","#adff30","#a9ff2c","#a4ff28","#9fff24","#9bff20","#96ff1c","#92ff18","#8dff14","#89ff10","#84ff0c","#80fc08","#7ef804","#7cf500","#7af200","#78ef00","#76eb00","#74e800","#72e500","#70e200","#6ede00","#6cdb00","#6ad800","#68d500","#66d100","#60ce00","#59d200","#53d600","#4cd900","#46dd00","#40e100","#39e500","#33e800","#2dec00","#26f000","#20f400","#19f700","#13fb00","#0dff0b","#06ff15","#00fe1f","#00fe2a","#00fd34","#00fd3f","#00fd49","#00fc54","#00fc5e","#00fb68","#00fb73","#00fa7d","#00fa88","#00fa92","#00fa9d","#00faa3","#00faaa","#00fbb0","#00fbb7","#00fcbd","#00fcc4","#00fdcb","#00fdd1","#00fed8","#00fede","#00ffe5","#00ffeb","#00fbf2","#00f6f8","#00f2ff","#00edff","#00e9ff","#00e5ff","#00e0ff","#00dcff","#00d7ff","#00d3ff","#00ceff","#00caff","#00c6ff","#00c0ff","#00b8ff","#00a9ff","#009bff","#008dff","#007fff","#0071ff","#0063ff","#0055ff","#0047ff","#0038ff","#002aff","#001cff","#000eff","#0000ee","#0007de","#000ecd","#0014bc","#001bac","#00229b","#00298b","#002f7a","#003669","#003d59","#004448","#004b37","#005127","#005816","#005f06","#00580f","#005019","#004922","#00422b","#003a35","#00333e","#002c48","#002451","#001d5a","#001664","#000f6d","#000777","#000080"],c.gist_rainbow=["#ff0029","#ff0023","#ff001e","#ff0019","#ff0013","#ff000e","#ff0009","#ff0003","#ff0200","#ff0700","#ff0d00","#ff1200","#ff1800","#ff1d00","#ff2200","#ff2800","#ff2d00","#ff3300","#ff3800","#ff3d00","#ff4300","#ff4800","#ff4e00","#ff5300","#ff5800","#ff5e00","#ff6300","#ff6900","#ff6e00","#ff7300","#ff7900","#ff7e00","#ff8400","#ff8900","#ff8e00","#ff9400","#ff9900","#ff9f00","#ffa400","#ffa900","#ffaf00","#ffb400","#ffba00","#ffbf00","#ffc400","#ffca00","#ffcf00","#ffd500","#ffda00","#ffe000","#ffe500","#ffea00","#fff000","#fff500","#fffb00","#feff00","#f9ff00","#f3ff00","#eeff00","#e8ff00","#e3ff00","#deff00","#d8ff00","#d3ff00","#cdff00","#c8ff00","#c3ff00","#bdff00","#b8ff00","#b2ff00","#adff00","#a8ff00","#a2ff00","#9dff00","#97ff00","#92ff00","#8dff00","#87ff00","#82ff00","#7cff00","#77ff00","#72ff00","#6cff00","#67ff00","#61ff00","#5cff00","#56ff00","#51ff00","#4cff00","#46ff00","#41ff00","#3bff00","#36ff00","#31ff00","#2bff00","#26ff00","#20ff00","#1bff00","#16ff00","#10ff00","#0bff00","#05ff00","#00ff00","#00ff05","#00ff0b","#00ff10","#00ff16","#00ff1b","#00ff20","#00ff26","#00ff2b","#00ff30","#00ff36","#00ff3b","#00ff41","#00ff46","#00ff4b","#00ff51","#00ff56","#00ff5b","#00ff61","#00ff66","#00ff6c","#00ff71","#00ff76","#00ff7c","#00ff81","#00ff86","#00ff8c","#00ff91","#00ff97","#00ff9c","#00ffa1","#00ffa7","#00ffac","#00ffb1","#00ffb7","#00ffbc","#00ffc2","#00ffc7","#00ffcc","#00ffd2","#00ffd7","#00ffdc","#00ffe2","#00ffe7","#00ffed","#00fff2","#00fff7","#00fffd","#00fcff","#00f6ff","#00f1ff","#00ecff","#00e6ff","#00e1ff","#00dbff","#00d6ff","#00d0ff","#00cbff","#00c6ff","#00c0ff","#00bbff","#00b5ff","#00b0ff","#00aaff","#00a5ff","#00a0ff","#009aff","#0095ff","#008fff","#008aff","#0084ff","#007fff","#0079ff","#0074ff","#006fff","#0069ff","#0064ff","#005eff","#0059ff","#0053ff","#004eff","#0049ff","#0043ff","#003eff","#0038ff","#0033ff","#002dff","#0028ff","#0023ff","#001dff","#0018ff","#0012ff","#000dff","#0007ff","#0002ff","#0400ff","#0900ff","#0e00ff","#1400ff","#1900ff","#1f00ff","#2400ff","#2a00ff","#2f00ff","#3400ff","#3a00ff","#3f00ff","#4500ff","#4a00ff","#5000ff","#5500ff","#5a00ff","#6000ff","#6500ff","#6b00ff","#7000ff","#7600ff","#7b00ff","#8100ff","#8600ff","#8b00ff","#9100ff","#9600ff","#9c00ff","#a100ff","#a700ff","#ac00ff","#b100ff","#b700ff","#bc00ff","#c200ff","#c700ff","#cd00ff","#d200ff","#d700ff","#dd00ff","#e200ff","#e800ff","#ed00ff","#f300ff","#f800ff","#fe00ff","#ff00fb","#ff00f6","#ff00f0","#ff00eb","#ff00e5","#ff00e0","#ff00da","#ff00d5","#ff00d0","#ff00ca","#ff00c5","#ff00bf"],c.gist_rainbow_r=["#ff00bf","#ff00c5","#ff00ca","#ff00d0","#ff00d5","#ff00da","#ff00e0","#ff00e5","#ff00eb","#ff00f0","#ff00f6","#ff00fb","#fe00ff","#f800ff","#f300ff","#ed00ff","#e800ff","#e200ff","#dd00ff","#d700ff","#d200ff","#cd00ff","#c700ff","#c200ff","#bc00ff","#b700ff","#b100ff","#ac00ff","#a700ff","#a100ff","#9c00ff","#9600ff","#9100ff","#8b00ff","#8600ff","#8100ff","#7b00ff","#7600ff","#7000ff","#6b00ff","#6500ff","#6000ff","#5a00ff","#5500ff","#5000ff","#4a00ff","#4500ff","#3f00ff","#3a00ff","#3400ff","#2f00ff","#2a00ff","#2400ff","#1f00ff","#1900ff","#1400ff","#0e00ff","#0900ff","#0400ff","#0002ff","#0007ff","#000dff","#0012ff","#0018ff","#001dff","#0023ff","#0028ff","#002dff","#0033ff","#0038ff","#003eff","#0043ff","#0049ff","#004eff","#0053ff","#0059ff","#005eff","#0064ff","#0069ff","#006fff","#0074ff","#0079ff","#007fff","#0084ff","#008aff","#008fff","#0095ff","#009aff","#00a0ff","#00a5ff","#00aaff","#00b0ff","#00b5ff","#00bbff","#00c0ff","#00c6ff","#00cbff","#00d0ff","#00d6ff","#00dbff","#00e1ff","#00e6ff","#00ecff","#00f1ff","#00f6ff","#00fcff","#00fffd","#00fff7","#00fff2","#00ffed","#00ffe7","#00ffe2","#00ffdc","#00ffd7","#00ffd2","#00ffcc","#00ffc7","#00ffc2","#00ffbc","#00ffb7","#00ffb1","#00ffac","#00ffa7","#00ffa1","#00ff9c","#00ff97","#00ff91","#00ff8c","#00ff86","#00ff81","#00ff7c","#00ff76","#00ff71","#00ff6c","#00ff66","#00ff61","#00ff5b","#00ff56","#00ff51","#00ff4b","#00ff46","#00ff41","#00ff3b","#00ff36","#00ff30","#00ff2b","#00ff26","#00ff20","#00ff1b","#00ff16","#00ff10","#00ff0b","#00ff05","#00ff00","#05ff00","#0bff00","#10ff00","#16ff00","#1bff00","#20ff00","#26ff00","#2bff00","#31ff00","#36ff00","#3bff00","#41ff00","#46ff00","#4cff00","#51ff00","#56ff00","#5cff00","#61ff00","#67ff00","#6cff00","#72ff00","#77ff00","#7cff00","#82ff00","#87ff00","#8dff00","#92ff00","#97ff00","#9dff00","#a2ff00","#a8ff00","#adff00","#b2ff00","#b8ff00","#bdff00","#c3ff00","#c8ff00","#cdff00","#d3ff00","#d8ff00","#deff00","#e3ff00","#e8ff00","#eeff00","#f3ff00","#f9ff00","#feff00","#fffb00","#fff500","#fff000","#ffea00","#ffe500","#ffe000","#ffda00","#ffd500","#ffcf00","#ffca00","#ffc400","#ffbf00","#ffba00","#ffb400","#ffaf00","#ffa900","#ffa400","#ff9f00","#ff9900","#ff9400","#ff8e00","#ff8900","#ff8400","#ff7e00","#ff7900","#ff7300","#ff6e00","#ff6900","#ff6300","#ff5e00","#ff5800","#ff5300","#ff4e00","#ff4800","#ff4300","#ff3d00","#ff3800","#ff3300","#ff2d00","#ff2800","#ff2200","#ff1d00","#ff1800","#ff1200","#ff0d00","#ff0700","#ff0200","#ff0003","#ff0009","#ff000e","#ff0013","#ff0019","#ff001e","#ff0023","#ff0029"],c.gist_stern=["#000000","#120102","#250204","#370306","#490408","#5b050a","#6e060c","#80070e","#920810","#a50912","#b70a14","#c90b16","#db0c18","#ee0d1a","#ff0e1c","#fa0f1e","#f51020","#f01122","#eb1224","#e61326","#e11428","#dc152a","#d7162c","#d2172e","#cd1830","#c81932","#c31a34","#be1b36","#b91c38","#b41d3a","#af1e3c","#aa1f3e","#a52040","#a02142","#9b2244","#962346","#912448","#8c254a","#87264c","#82274e","#7d2850","#782952","#732a54","#6e2b56","#692c58","#642d5a","#5f2e5c","#5a2f5e","#553060","#503162","#4b3264","#463366","#413468","#3c356a","#37366c","#32376e","#2d3870","#293972","#243a74","#1f3b76","#1a3c78","#153d7a","#103e7c","#0b3f7e","#404080","#414182","#424284","#434386","#444488","#45458a","#46468c","#47478e","#484890","#494992","#4a4a94","#4b4b96","#4c4c98","#4d4d9a","#4e4e9c","#4f4f9e","#5050a0","#5151a2","#5252a4","#5353a6","#5454a8","#5555aa","#5656ac","#5757ae","#5858b0","#5959b2","#5a5ab4","#5b5bb6","#5c5cb8","#5d5dba","#5e5ebc","#5f5fbe","#6060c0","#6161c2","#6262c4","#6363c6","#6464c8","#6565ca","#6666cc","#6767ce","#6868d0","#6969d2","#6a6ad4","#6b6bd6","#6c6cd8","#6d6dda","#6e6edc","#6f6fde","#7070e0","#7171e2","#7272e4","#7373e6","#7474e8","#7575ea","#7676ec","#7777ee","#7878f0","#7979f2","#7a7af4","#7b7bf6","#7c7cf8","#7d7dfa","#7e7efc","#7f7ffe","#8080fd","#8181f9","#8282f4","#8383f0","#8484ec","#8585e8","#8686e3","#8787df","#8888db","#8989d7","#8a8ad2","#8b8bce","#8c8cca","#8d8dc6","#8e8ec1","#8f8fbd","#9090b9","#9191b5","#9292b0","#9393ac","#9494a8","#9595a4","#96969f","#97979b","#989897","#999992","#9a9a8e","#9b9b8a","#9c9c86","#9d9d81","#9e9e7d","#9f9f79","#a0a075","#a1a170","#a2a26c","#a3a368","#a4a464","#a5a55f","#a6a65b","#a7a757","#a8a853","#a9a94e","#aaaa4a","#abab46","#acac42","#adad3d","#aeae39","#afaf35","#b0b031","#b1b12c","#b2b228","#b3b324","#b4b420","#b5b51b","#b6b617","#b7b713","#b8b80f","#b9b90a","#baba06","#bbbb02","#bcbc02","#bdbd06","#bebe0a","#bfbf0d","#c0c011","#c1c115","#c2c219","#c3c31d","#c4c420","#c5c524","#c6c628","#c7c72c","#c8c82f","#c9c933","#caca37","#cbcb3b","#cccc3f","#cdcd42","#cece46","#cfcf4a","#d0d04e","#d1d151","#d2d255","#d3d359","#d4d45d","#d5d561","#d6d664","#d7d768","#d8d86c","#d9d970","#dada73","#dbdb77","#dcdc7b","#dddd7f","#dede82","#dfdf86","#e0e08a","#e1e18e","#e2e292","#e3e395","#e4e499","#e5e59d","#e6e6a1","#e7e7a4","#e8e8a8","#e9e9ac","#eaeab0","#ebebb4","#ececb7","#ededbb","#eeeebf","#efefc3","#f0f0c6","#f1f1ca","#f2f2ce","#f3f3d2","#f4f4d5","#f5f5d9","#f6f6dd","#f7f7e1","#f8f8e5","#f9f9e8","#fafaec","#fbfbf0","#fcfcf4","#fdfdf7","#fefefb","#ffffff"],c.gist_stern_r=["#ffffff","#fefefb","#fdfdf7","#fcfcf4","#fbfbf0","#fafaec","#f9f9e8","#f8f8e5","#f7f7e1","#f6f6dd","#f5f5d9","#f4f4d5","#f3f3d2","#f2f2ce","#f1f1ca","#f0f0c6","#efefc3","#eeeebf","#ededbb","#ececb7","#ebebb4","#eaeab0","#e9e9ac","#e8e8a8","#e7e7a4","#e6e6a1","#e5e59d","#e4e499","#e3e395","#e2e292","#e1e18e","#e0e08a","#dfdf86","#dede82","#dddd7f","#dcdc7b","#dbdb77","#dada73","#d9d970","#d8d86c","#d7d768","#d6d664","#d5d561","#d4d45d","#d3d359","#d2d255","#d1d151","#d0d04e","#cfcf4a","#cece46","#cdcd42","#cccc3f","#cbcb3b","#caca37","#c9c933","#c8c82f","#c7c72c","#c6c628","#c5c524","#c4c420","#c3c31d","#c2c219","#c1c115","#c0c011","#bfbf0d","#bebe0a","#bdbd06","#bcbc02","#bbbb02","#baba06","#b9b90a","#b8b80f","#b7b713","#b6b617","#b5b51b","#b4b420","#b3b324","#b2b228","#b1b12c","#b0b031","#afaf35","#aeae39","#adad3d","#acac42","#abab46","#aaaa4a","#a9a94e","#a8a853","#a7a757","#a6a65b","#a5a55f","#a4a464","#a3a368","#a2a26c","#a1a170","#a0a075","#9f9f79","#9e9e7d","#9d9d81","#9c9c86","#9b9b8a","#9a9a8e","#999992","#989897","#97979b","#96969f","#9595a4","#9494a8","#9393ac","#9292b0","#9191b5","#9090b9","#8f8fbd","#8e8ec1","#8d8dc6","#8c8cca","#8b8bce","#8a8ad2","#8989d7","#8888db","#8787df","#8686e3","#8585e8","#8484ec","#8383f0","#8282f4","#8181f9","#8080fd","#7f7ffe","#7e7efc","#7d7dfa","#7c7cf8","#7b7bf6","#7a7af4","#7979f2","#7878f0","#7777ee","#7676ec","#7575ea","#7474e8","#7373e6","#7272e4","#7171e2","#7070e0","#6f6fde","#6e6edc","#6d6dda","#6c6cd8","#6b6bd6","#6a6ad4","#6969d2","#6868d0","#6767ce","#6666cc","#6565ca","#6464c8","#6363c6","#6262c4","#6161c2","#6060c0","#5f5fbe","#5e5ebc","#5d5dba","#5c5cb8","#5b5bb6","#5a5ab4","#5959b2","#5858b0","#5757ae","#5656ac","#5555aa","#5454a8","#5353a6","#5252a4","#5151a2","#5050a0","#4f4f9e","#4e4e9c","#4d4d9a","#4c4c98","#4b4b96","#4a4a94","#494992","#484890","#47478e","#46468c","#45458a","#444488","#434386","#424284","#414182","#404080","#0b3f7e","#103e7c","#153d7a","#1a3c78","#1f3b76","#243a74","#293972","#2d3870","#32376e","#37366c","#3c356a","#413468","#463366","#4b3264","#503162","#553060","#5a2f5e","#5f2e5c","#642d5a","#692c58","#6e2b56","#732a54","#782952","#7d2850","#82274e","#87264c","#8c254a","#912448","#962346","#9b2244","#a02142","#a52040","#aa1f3e","#af1e3c","#b41d3a","#b91c38","#be1b36","#c31a34","#c81932","#cd1830","#d2172e","#d7162c","#dc152a","#e11428","#e61326","#eb1224","#f01122","#f51020","#fa0f1e","#ff0e1c","#ee0d1a","#db0c18","#c90b16","#b70a14","#a50912","#920810","#80070e","#6e060c","#5b050a","#490408","#370306","#250204","#120102","#000000"],c.gist_yarg=["#ffffff","#fefefe","#fdfdfd","#fcfcfc","#fbfbfb","#fafafa","#f9f9f9","#f8f8f8","#f7f7f7","#f6f6f6","#f5f5f5","#f4f4f4","#f3f3f3","#f2f2f2","#f1f1f1","#f0f0f0","#efefef","#eeeeee","#ededed","#ececec","#ebebeb","#eaeaea","#e9e9e9","#e8e8e8","#e7e7e7","#e6e6e6","#e5e5e5","#e4e4e4","#e3e3e3","#e2e2e2","#e1e1e1","#e0e0e0","#dfdfdf","#dedede","#dddddd","#dcdcdc","#dbdbdb","#dadada","#d9d9d9","#d8d8d8","#d7d7d7","#d6d6d6","#d5d5d5","#d4d4d4","#d3d3d3","#d2d2d2","#d1d1d1","#d0d0d0","#cfcfcf","#cecece","#cdcdcd","#cccccc","#cbcbcb","#cacaca","#c9c9c9","#c8c8c8","#c7c7c7","#c6c6c6","#c5c5c5","#c4c4c4","#c3c3c3","#c2c2c2","#c1c1c1","#c0c0c0","#bfbfbf","#bebebe","#bdbdbd","#bcbcbc","#bbbbbb","#bababa","#b9b9b9","#b8b8b8","#b7b7b7","#b6b6b6","#b5b5b5","#b4b4b4","#b3b3b3","#b2b2b2","#b1b1b1","#b0b0b0","#afafaf","#aeaeae","#adadad","#acacac","#ababab","#aaaaaa","#a9a9a9","#a8a8a8","#a7a7a7","#a6a6a6","#a5a5a5","#a4a4a4","#a3a3a3","#a2a2a2","#a1a1a1","#a0a0a0","#9f9f9f","#9e9e9e","#9d9d9d","#9c9c9c","#9b9b9b","#9a9a9a","#999999","#989898","#979797","#969696","#959595","#949494","#939393","#929292","#919191","#909090","#8f8f8f","#8e8e8e","#8d8d8d","#8c8c8c","#8b8b8b","#8a8a8a","#898989","#888888","#878787","#868686","#858585","#848484","#838383","#828282","#818181","#808080","#7f7f7f","#7e7e7e","#7d7d7d","#7c7c7c","#7b7b7b","#7a7a7a","#797979","#787878","#777777","#767676","#757575","#747474","#737373","#727272","#717171","#707070","#6f6f6f","#6e6e6e","#6d6d6d","#6c6c6c","#6b6b6b","#6a6a6a","#696969","#686868","#676767","#666666","#656565","#646464","#636363","#626262","#616161","#606060","#5f5f5f","#5e5e5e","#5d5d5d","#5c5c5c","#5b5b5b","#5a5a5a","#595959","#585858","#575757","#565656","#555555","#545454","#535353","#525252","#515151","#505050","#4f4f4f","#4e4e4e","#4d4d4d","#4c4c4c","#4b4b4b","#4a4a4a","#494949","#484848","#474747","#464646","#454545","#444444","#434343","#424242","#414141","#404040","#3f3f3f","#3e3e3e","#3d3d3d","#3c3c3c","#3b3b3b","#3a3a3a","#393939","#383838","#373737","#363636","#353535","#343434","#333333","#323232","#313131","#303030","#2f2f2f","#2e2e2e","#2d2d2d","#2c2c2c","#2b2b2b","#2a2a2a","#292929","#282828","#272727","#262626","#252525","#242424","#232323","#222222","#212121","#202020","#1f1f1f","#1e1e1e","#1d1d1d","#1c1c1c","#1b1b1b","#1a1a1a","#191919","#181818","#171717","#161616","#151515","#141414","#131313","#121212","#111111","#101010","#0f0f0f","#0e0e0e","#0d0d0d","#0c0c0c","#0b0b0b","#0a0a0a","#090909","#080808","#070707","#060606","#050505","#040404","#030303","#020202","#010101","#000000"],c.gist_yarg_r=["#000000","#010101","#020202","#030303","#040404","#050505","#060606","#070707","#080808","#090909","#0a0a0a","#0b0b0b","#0c0c0c","#0d0d0d","#0e0e0e","#0f0f0f","#101010","#111111","#121212","#131313","#141414","#151515","#161616","#171717","#181818","#191919","#1a1a1a","#1b1b1b","#1c1c1c","#1d1d1d","#1e1e1e","#1f1f1f","#202020","#212121","#222222","#232323","#242424","#252525","#262626","#272727","#282828","#292929","#2a2a2a","#2b2b2b","#2c2c2c","#2d2d2d","#2e2e2e","#2f2f2f","#303030","#313131","#323232","#333333","#343434","#353535","#363636","#373737","#383838","#393939","#3a3a3a","#3b3b3b","#3c3c3c","#3d3d3d","#3e3e3e","#3f3f3f","#404040","#414141","#424242","#434343","#444444","#454545","#464646","#474747","#484848","#494949","#4a4a4a","#4b4b4b","#4c4c4c","#4d4d4d","#4e4e4e","#4f4f4f","#505050","#515151","#525252","#535353","#545454","#555555","#565656","#575757","#585858","#595959","#5a5a5a","#5b5b5b","#5c5c5c","#5d5d5d","#5e5e5e","#5f5f5f","#606060","#616161","#626262","#636363","#646464","#656565","#666666","#676767","#686868","#696969","#6a6a6a","#6b6b6b","#6c6c6c","#6d6d6d","#6e6e6e","#6f6f6f","#707070","#717171","#727272","#737373","#747474","#757575","#767676","#777777","#787878","#797979","#7a7a7a","#7b7b7b","#7c7c7c","#7d7d7d","#7e7e7e","#7f7f7f","#808080","#818181","#828282","#838383","#848484","#858585","#868686","#878787","#888888","#898989","#8a8a8a","#8b8b8b","#8c8c8c","#8d8d8d","#8e8e8e","#8f8f8f","#909090","#919191","#929292","#939393","#949494","#959595","#969696","#979797","#989898","#999999","#9a9a9a","#9b9b9b","#9c9c9c","#9d9d9d","#9e9e9e","#9f9f9f","#a0a0a0","#a1a1a1","#a2a2a2","#a3a3a3","#a4a4a4","#a5a5a5","#a6a6a6","#a7a7a7","#a8a8a8","#a9a9a9","#aaaaaa","#ababab","#acacac","#adadad","#aeaeae","#afafaf","#b0b0b0","#b1b1b1","#b2b2b2","#b3b3b3","#b4b4b4","#b5b5b5","#b6b6b6","#b7b7b7","#b8b8b8","#b9b9b9","#bababa","#bbbbbb","#bcbcbc","#bdbdbd","#bebebe","#bfbfbf","#c0c0c0","#c1c1c1","#c2c2c2","#c3c3c3","#c4c4c4","#c5c5c5","#c6c6c6","#c7c7c7","#c8c8c8","#c9c9c9","#cacaca","#cbcbcb","#cccccc","#cdcdcd","#cecece","#cfcfcf","#d0d0d0","#d1d1d1","#d2d2d2","#d3d3d3","#d4d4d4","#d5d5d5","#d6d6d6","#d7d7d7","#d8d8d8","#d9d9d9","#dadada","#dbdbdb","#dcdcdc","#dddddd","#dedede","#dfdfdf","#e0e0e0","#e1e1e1","#e2e2e2","#e3e3e3","#e4e4e4","#e5e5e5","#e6e6e6","#e7e7e7","#e8e8e8","#e9e9e9","#eaeaea","#ebebeb","#ececec","#ededed","#eeeeee","#efefef","#f0f0f0","#f1f1f1","#f2f2f2","#f3f3f3","#f4f4f4","#f5f5f5","#f6f6f6","#f7f7f7","#f8f8f8","#f9f9f9","#fafafa","#fbfbfb","#fcfcfc","#fdfdfd","#fefefe","#ffffff"],c.gist_yerg=["#ffffff","#fefefe","#fdfdfd","#fcfcfc","#fbfbfb","#fafafa","#f9f9f9","#f8f8f8","#f7f7f7","#f6f6f6","#f5f5f5","#f4f4f4","#f3f3f3","#f2f2f2","#f1f1f1","#f0f0f0","#efefef","#eeeeee","#ededed","#ececec","#ebebeb","#eaeaea","#e9e9e9","#e8e8e8","#e7e7e7","#e6e6e6","#e5e5e5","#e4e4e4","#e3e3e3","#e2e2e2","#e1e1e1","#e0e0e0","#dfdfdf","#dedede","#dddddd","#dcdcdc","#dbdbdb","#dadada","#d9d9d9","#d8d8d8","#d7d7d7","#d6d6d6","#d5d5d5","#d4d4d4","#d3d3d3","#d2d2d2","#d1d1d1","#d0d0d0","#cfcfcf","#cecece","#cdcdcd","#cccccc","#cbcbcb","#cacaca","#c9c9c9","#c8c8c8","#c7c7c7","#c6c6c6","#c5c5c5","#c4c4c4","#c3c3c3","#c2c2c2","#c1c1c1","#c0c0c0","#bfbfbf","#bebebe","#bdbdbd","#bcbcbc","#bbbbbb","#bababa","#b9b9b9","#b8b8b8","#b7b7b7","#b6b6b6","#b5b5b5","#b4b4b4","#b3b3b3","#b2b2b2","#b1b1b1","#b0b0b0","#afafaf","#aeaeae","#adadad","#acacac","#ababab","#aaaaaa","#a9a9a9","#a8a8a8","#a7a7a7","#a6a6a6","#a5a5a5","#a4a4a4","#a3a3a3","#a2a2a2","#a1a1a1","#a0a0a0","#9f9f9f","#9e9e9e","#9d9d9d","#9c9c9c","#9b9b9b","#9a9a9a","#999999","#989898","#979797","#969696","#959595","#949494","#939393","#929292","#919191","#909090","#8f8f8f","#8e8e8e","#8d8d8d","#8c8c8c","#8b8b8b","#8a8a8a","#898989","#888888","#878787","#868686","#858585","#848484","#838383","#828282","#818181","#808080","#7f7f7f","#7e7e7e","#7d7d7d","#7c7c7c","#7b7b7b","#7a7a7a","#797979","#787878","#777777","#767676","#757575","#747474","#737373","#727272","#717171","#707070","#6f6f6f","#6e6e6e","#6d6d6d","#6c6c6c","#6b6b6b","#6a6a6a","#696969","#686868","#676767","#666666","#656565","#646464","#636363","#626262","#616161","#606060","#5f5f5f","#5e5e5e","#5d5d5d","#5c5c5c","#5b5b5b","#5a5a5a","#595959","#585858","#575757","#565656","#555555","#545454","#535353","#525252","#515151","#505050","#4f4f4f","#4e4e4e","#4d4d4d","#4c4c4c","#4b4b4b","#4a4a4a","#494949","#484848","#474747","#464646","#454545","#444444","#434343","#424242","#414141","#404040","#3f3f3f","#3e3e3e","#3d3d3d","#3c3c3c","#3b3b3b","#3a3a3a","#393939","#383838","#373737","#363636","#353535","#343434","#333333","#323232","#313131","#303030","#2f2f2f","#2e2e2e","#2d2d2d","#2c2c2c","#2b2b2b","#2a2a2a","#292929","#282828","#272727","#262626","#252525","#242424","#232323","#222222","#212121","#202020","#1f1f1f","#1e1e1e","#1d1d1d","#1c1c1c","#1b1b1b","#1a1a1a","#191919","#181818","#171717","#161616","#151515","#141414","#131313","#121212","#111111","#101010","#0f0f0f","#0e0e0e","#0d0d0d","#0c0c0c","#0b0b0b","#0a0a0a","#090909","#080808","#070707","#060606","#050505","#040404","#030303","#020202","#010101","#000000"],c.gnuplot=["#000000","#100006","#17000d","#1c0013","#200019","#24001f","#270026","#2a002c","#2d0032","#300038","#32003e","#350044","#37004a","#3a0050","#3c0056","#3e005c","#400062","#420068","#44006d","#460073","#470079","#49007e","#4b0084","#4d0089","#4e008e","#500093","#510098","#53009d","#5400a2","#5600a7","#5700ac","#5900b0","#5a01b5","#5c01b9","#5d01be","#5e01c2","#6001c6","#6101ca","#6201cd","#6401d1","#6501d5","#6601d8","#6701db","#6901de","#6a01e1","#6b01e4","#6c01e7","#6d02ea","#6f02ec","#7002ee","#7102f1","#7202f3","#7302f4","#7402f6","#7502f8","#7603f9","#7703fa","#7903fb","#7a03fc","#7b03fd","#7c03fe","#7d03fe","#7e04ff","#7f04ff","#8004ff","#8104ff","#8204ff","#8305fe","#8405fe","#8505fd","#8605fc","#8706fb","#8706fa","#8806f8","#8906f7","#8a06f5","#8b07f3","#8c07f2","#8d07ef","#8e08ed","#8f08eb","#9008e8","#9108e6","#9109e3","#9209e0","#9309dd","#940ada","#950ad6","#960ad3","#970bcf","#970bcb","#980cc8","#990cc4","#9a0cc0","#9b0dbb","#9c0db7","#9c0eb3","#9d0eae","#9e0ea9","#9f0fa5","#a00fa0","#a0109b","#a11096","#a21191","#a3118c","#a41286","#a41281","#a5137b","#a61376","#a71470","#a7146b","#a81565","#a9165f","#aa1659","#aa1753","#ab174d","#ac1847","#ad1941","#ad193b","#ae1a35","#af1b2f","#b01b29","#b01c22","#b11d1c","#b21d16","#b31e10","#b31f09","#b42003","#b52000","#b52100","#b62200","#b72300","#b72300","#b82400","#b92500","#ba2600","#ba2700","#bb2800","#bc2800","#bc2900","#bd2a00","#be2b00","#be2c00","#bf2d00","#c02e00","#c02f00","#c13000","#c23100","#c23200","#c33300","#c43400","#c43500","#c53600","#c63700","#c63800","#c73900","#c73a00","#c83c00","#c93d00","#c93e00","#ca3f00","#cb4000","#cb4100","#cc4300","#cc4400","#cd4500","#ce4600","#ce4800","#cf4900","#d04a00","#d04c00","#d14d00","#d14e00","#d25000","#d35100","#d35200","#d45400","#d45500","#d55700","#d65800","#d65a00","#d75b00","#d75d00","#d85e00","#d96000","#d96100","#da6300","#da6500","#db6600","#dc6800","#dc6900","#dd6b00","#dd6d00","#de6f00","#de7000","#df7200","#e07400","#e07600","#e17700","#e17900","#e27b00","#e27d00","#e37f00","#e48100","#e48300","#e58400","#e58600","#e68800","#e68a00","#e78c00","#e78e00","#e89000","#e99300","#e99500","#ea9700","#ea9900","#eb9b00","#eb9d00","#ec9f00","#eca200","#eda400","#eda600","#eea800","#eeab00","#efad00","#f0af00","#f0b200","#f1b400","#f1b600","#f2b900","#f2bb00","#f3be00","#f3c000","#f4c300","#f4c500","#f5c800","#f5ca00","#f6cd00","#f6cf00","#f7d200","#f7d500","#f8d700","#f8da00","#f9dd00","#f9df00","#fae200","#fae500","#fbe800","#fbeb00","#fced00","#fcf000","#fdf300","#fdf600","#fef900","#fefc00","#ffff00"],c.gnuplot2=["#000000","#000004","#000008","#00000c","#000010","#000014","#000018","#00001c","#000020","#000024","#000028","#00002c","#000030","#000034","#000038","#00003c","#000040","#000044","#000048","#00004c","#000050","#000054","#000058","#00005c","#000060","#000064","#000068","#00006c","#000070","#000074","#000078","#00007c","#000080","#000084","#000088","#00008c","#000090","#000094","#000098","#00009c","#0000a0","#0000a4","#0000a8","#0000ac","#0000b0","#0000b4","#0000b8","#0000bc","#0000c0","#0000c4","#0000c8","#0000cc","#0000d0","#0000d4","#0000d8","#0000dc","#0000e0","#0000e4","#0000e8","#0000ec","#0000f0","#0000f4","#0000f8","#0000fc","#0100ff","#0400ff","#0700ff","#0a00ff","#0d00ff","#1000ff","#1400ff","#1700ff","#1a00ff","#1d00ff","#2000ff","#2300ff","#2600ff","#2900ff","#2d00ff","#3000ff","#3300ff","#3600ff","#3900ff","#3c00ff","#3f00ff","#4200ff","#4600ff","#4900ff","#4c00ff","#4f00ff","#5200ff","#5500ff","#5800ff","#5b00ff","#5f00ff","#6200ff","#6500ff","#6800ff","#6b00ff","#6e00ff","#7100ff","#7400ff","#7800ff","#7b00ff","#7e00ff","#8100ff","#8400ff","#8700ff","#8a02fd","#8d04fb","#9106f9","#9408f7","#970af5","#9a0cf3","#9d0ef1","#a010ef","#a312ed","#a614eb","#aa16e9","#ad18e7","#b01ae5","#b31ce3","#b61ee1","#b920df","#bc22dd","#bf24db","#c326d9","#c628d7","#c92ad5","#cc2cd3","#cf2ed1","#d230cf","#d532cd","#d834cb","#dc36c9","#df38c7","#e23ac5","#e53cc3","#e83ec1","#eb40bf","#ee42bd","#f144bb","#f546b9","#f848b7","#fb4ab5","#fe4cb3","#ff4eb1","#ff50af","#ff52ad","#ff54ab","#ff56a9","#ff58a7","#ff5aa5","#ff5ca3","#ff5ea1","#ff609f","#ff629d","#ff649b","#ff6699","#ff6897","#ff6a95","#ff6c93","#ff6e91","#ff708f","#ff728d","#ff748b","#ff7689","#ff7887","#ff7a85","#ff7c83","#ff7e81","#ff807f","#ff827d","#ff847b","#ff8679","#ff8877","#ff8a75","#ff8c73","#ff8e71","#ff906f","#ff926d","#ff946b","#ff9669","#ff9867","#ff9a65","#ff9c63","#ff9e61","#ffa05f","#ffa25d","#ffa45b","#ffa659","#ffa857","#ffaa55","#ffac53","#ffae51","#ffb04f","#ffb24d","#ffb44b","#ffb649","#ffb847","#ffba45","#ffbc43","#ffbe41","#ffc03f","#ffc23d","#ffc43b","#ffc639","#ffc837","#ffca35","#ffcc33","#ffce31","#ffd02f","#ffd22d","#ffd42b","#ffd629","#ffd827","#ffda25","#ffdc23","#ffde21","#ffe01f","#ffe21d","#ffe41b","#ffe619","#ffe817","#ffea15","#ffec13","#ffee11","#fff00f","#fff20d","#fff40b","#fff609","#fff807","#fffa05","#fffc03","#fffe01","#ffff05","#ffff11","#ffff1e","#ffff2a","#ffff37","#ffff43","#ffff50","#ffff5c","#ffff69","#ffff75","#ffff82","#ffff8e","#ffff9b","#ffffa7","#ffffb4","#ffffc0","#ffffcd","#ffffda","#ffffe6","#fffff3","#ffffff"],c.gnuplot2_r=["#ffffff","#fffff3","#ffffe6","#ffffda","#ffffcd","#ffffc0","#ffffb4","#ffffa7","#ffff9b","#ffff8e","#ffff82","#ffff76","#ffff69","#ffff5c","#ffff50","#ffff43","#ffff37","#ffff2a","#ffff1e","#ffff11","#ffff05","#fffe01","#fffc03","#fffa05","#fff807","#fff609","#fff40b","#fff20d","#fff00f","#ffee11","#ffec13","#ffea15","#ffe817","#ffe619","#ffe41b","#ffe21d","#ffe01f","#ffde21","#ffdc23","#ffda25","#ffd827","#ffd629","#ffd42b","#ffd22d","#ffd02f","#ffce31","#ffcc33","#ffca35","#ffc837","#ffc639","#ffc43b","#ffc23d","#ffc03f","#ffbe41","#ffbc43","#ffba45","#ffb847","#ffb649","#ffb44b","#ffb24d","#ffb04f","#ffae51","#ffac53","#ffaa55","#ffa857","#ffa659","#ffa45b","#ffa25d","#ffa05f","#ff9e61","#ff9c63","#ff9a65","#ff9867","#ff9669","#ff946b","#ff926d","#ff906f","#ff8e71","#ff8c73","#ff8a75","#ff8877","#ff8679","#ff847b","#ff827d","#ff807f","#ff7e81","#ff7c83","#ff7a85","#ff7887","#ff7689","#ff748b","#ff728d","#ff708f","#ff6e91","#ff6c93","#ff6a95","#ff6897","#ff6699","#ff649b","#ff629d","#ff609f","#ff5ea1","#ff5ca3","#ff5aa5","#ff58a7","#ff56a9","#ff54ab","#ff52ad","#ff50af","#ff4eb1","#fe4cb3","#fb4ab5","#f848b7","#f546b9","#f144bb","#ee42bd","#eb40bf","#e83ec1","#e53cc3","#e23ac5","#df38c7","#dc36c9","#d834cb","#d532cd","#d230cf","#cf2ed1","#cc2cd3","#c92ad5","#c628d7","#c326d9","#bf24db","#bc22dd","#b920df","#b61ee1","#b31ce3","#b01ae5","#ad18e7","#aa16e9","#a614eb","#a312ed","#a010ef","#9d0ef1","#9a0cf3","#970af5","#9408f7","#9106f9","#8d04fb","#8a02fd","#8700ff","#8400ff","#8100ff","#7e00ff","#7b00ff","#7800ff","#7400ff","#7100ff","#6e00ff","#6b00ff","#6800ff","#6500ff","#6200ff","#5f00ff","#5b00ff","#5800ff","#5500ff","#5200ff","#4f00ff","#4c00ff","#4900ff","#4600ff","#4200ff","#3f00ff","#3c00ff","#3900ff","#3600ff","#3300ff","#3000ff","#2d00ff","#2900ff","#2600ff","#2300ff","#2000ff","#1d00ff","#1a00ff","#1700ff","#1400ff","#1000ff","#0d00ff","#0a00ff","#0700ff","#0400ff","#0100ff","#0000fc","#0000f8","#0000f4","#0000f0","#0000ec","#0000e8","#0000e4","#0000e0","#0000dc","#0000d8","#0000d4","#0000d0","#0000cc","#0000c8","#0000c4","#0000c0","#0000bc","#0000b8","#0000b4","#0000b0","#0000ac","#0000a8","#0000a4","#0000a0","#00009c","#000098","#000094","#000090","#00008c","#000088","#000084","#000080","#00007c","#000078","#000074","#000070","#00006c","#000068","#000064","#000060","#00005c","#000058","#000054","#000050","#00004c","#000048","#000044","#000040","#00003c","#000038","#000034","#000030","#00002c","#000028","#000024","#000020","#00001c","#000018","#000014","#000010","#00000c","#000008","#000004","#000000"],c.gnuplot_r=["#ffff00","#fefc00","#fef900","#fdf600","#fdf300","#fcf000","#fced00","#fbeb00","#fbe800","#fae500","#fae200","#f9df00","#f9dd00","#f8da00","#f8d700","#f7d500","#f7d200","#f6cf00","#f6cd00","#f5ca00","#f5c800","#f4c500","#f4c300","#f3c000","#f3be00","#f2bb00","#f2b900","#f1b600","#f1b400","#f0b200","#f0af00","#efad00","#eeab00","#eea800","#eda600","#eda400","#eca200","#ec9f00","#eb9d00","#eb9b00","#ea9900","#ea9700","#e99500","#e99300","#e89000","#e78e00","#e78c00","#e68a00","#e68800","#e58600","#e58400","#e48300","#e48100","#e37f00","#e27d00","#e27b00","#e17900","#e17700","#e07600","#e07400","#df7200","#de7000","#de6f00","#dd6d00","#dd6b00","#dc6900","#dc6800","#db6600","#da6500","#da6300","#d96100","#d96000","#d85e00","#d75d00","#d75b00","#d65a00","#d65800","#d55700","#d45500","#d45400","#d35200","#d35100","#d25000","#d14e00","#d14d00","#d04c00","#d04a00","#cf4900","#ce4800","#ce4600","#cd4500","#cc4400","#cc4300","#cb4100","#cb4000","#ca3f00","#c93e00","#c93d00","#c83c00","#c73a00","#c73900","#c63800","#c63700","#c53600","#c43500","#c43400","#c33300","#c23200","#c23100","#c13000","#c02f00","#c02e00","#bf2d00","#be2c00","#be2b00","#bd2a00","#bc2900","#bc2800","#bb2800","#ba2700","#ba2600","#b92500","#b82400","#b72300","#b72300","#b62200","#b52100","#b52000","#b42003","#b31f09","#b31e10","#b21d16","#b11d1c","#b01c22","#b01b29","#af1b2f","#ae1a35","#ad193b","#ad1941","#ac1847","#ab174d","#aa1753","#aa1659","#a9165f","#a81565","#a7146b","#a71470","#a61376","#a5137b","#a41281","#a41286","#a3118c","#a21191","#a11096","#a0109b","#a00fa0","#9f0fa5","#9e0ea9","#9d0eae","#9c0eb3","#9c0db7","#9b0dbb","#9a0cc0","#990cc4","#980cc8","#970bcb","#970bcf","#960ad3","#950ad6","#940ada","#9309dd","#9209e0","#9109e3","#9108e6","#9008e8","#8f08eb","#8e08ed","#8d07ef","#8c07f2","#8b07f3","#8a06f5","#8906f7","#8806f8","#8706fa","#8706fb","#8605fc","#8505fd","#8405fe","#8305fe","#8204ff","#8104ff","#8004ff","#7f04ff","#7e04ff","#7d03fe","#7c03fe","#7b03fd","#7a03fc","#7903fb","#7703fa","#7603f9","#7502f8","#7402f6","#7302f4","#7202f3","#7102f1","#7002ee","#6f02ec","#6d02ea","#6c01e7","#6b01e4","#6a01e1","#6901de","#6701db","#6601d8","#6501d5","#6401d1","#6201cd","#6101ca","#6001c6","#5e01c2","#5d01be","#5c01b9","#5a01b5","#5900b0","#5700ac","#5600a7","#5400a2","#53009d","#510098","#500093","#4e008e","#4d0089","#4b0084","#49007e","#470079","#460073","#44006d","#420068","#400062","#3e005c","#3c0056","#3a0050","#37004a","#350044","#32003e","#300038","#2d0032","#2a002c","#270026","#24001f","#200019","#1c0013","#17000d","#100006","#000000"],c.gray=["#000000","#010101","#020202","#030303","#040404","#050505","#060606","#070707","#080808","#090909","#0a0a0a","#0b0b0b","#0c0c0c","#0d0d0d","#0e0e0e","#0f0f0f","#101010","#111111","#121212","#131313","#141414","#151515","#161616","#171717","#181818","#191919","#1a1a1a","#1b1b1b","#1c1c1c","#1d1d1d","#1e1e1e","#1f1f1f","#202020","#212121","#222222","#232323","#242424","#252525","#262626","#272727","#282828","#292929","#2a2a2a","#2b2b2b","#2c2c2c","#2d2d2d","#2e2e2e","#2f2f2f","#303030","#313131","#323232","#333333","#343434","#353535","#363636","#373737","#383838","#393939","#3a3a3a","#3b3b3b","#3c3c3c","#3d3d3d","#3e3e3e","#3f3f3f","#404040","#414141","#424242","#434343","#444444","#454545","#464646","#474747","#484848","#494949","#4a4a4a","#4b4b4b","#4c4c4c","#4d4d4d","#4e4e4e","#4f4f4f","#505050","#515151","#525252","#535353","#545454","#555555","#565656","#575757","#585858","#595959","#5a5a5a","#5b5b5b","#5c5c5c","#5d5d5d","#5e5e5e","#5f5f5f","#606060","#616161","#626262","#636363","#646464","#656565","#666666","#676767","#686868","#696969","#6a6a6a","#6b6b6b","#6c6c6c","#6d6d6d","#6e6e6e","#6f6f6f","#707070","#717171","#727272","#737373","#747474","#757575","#767676","#777777","#787878","#797979","#7a7a7a","#7b7b7b","#7c7c7c","#7d7d7d","#7e7e7e","#7f7f7f","#808080","#818181","#828282","#838383","#848484","#858585","#868686","#878787","#888888","#898989","#8a8a8a","#8b8b8b","#8c8c8c","#8d8d8d","#8e8e8e","#8f8f8f","#909090","#919191","#929292","#939393","#949494","#959595","#969696","#979797","#989898","#999999","#9a9a9a","#9b9b9b","#9c9c9c","#9d9d9d","#9e9e9e","#9f9f9f","#a0a0a0","#a1a1a1","#a2a2a2","#a3a3a3","#a4a4a4","#a5a5a5","#a6a6a6","#a7a7a7","#a8a8a8","#a9a9a9","#aaaaaa","#ababab","#acacac","#adadad","#aeaeae","#afafaf","#b0b0b0","#b1b1b1","#b2b2b2","#b3b3b3","#b4b4b4","#b5b5b5","#b6b6b6","#b7b7b7","#b8b8b8","#b9b9b9","#bababa","#bbbbbb","#bcbcbc","#bdbdbd","#bebebe","#bfbfbf","#c0c0c0","#c1c1c1","#c2c2c2","#c3c3c3","#c4c4c4","#c5c5c5","#c6c6c6","#c7c7c7","#c8c8c8","#c9c9c9","#cacaca","#cbcbcb","#cccccc","#cdcdcd","#cecece","#cfcfcf","#d0d0d0","#d1d1d1","#d2d2d2","#d3d3d3","#d4d4d4","#d5d5d5","#d6d6d6","#d7d7d7","#d8d8d8","#d9d9d9","#dadada","#dbdbdb","#dcdcdc","#dddddd","#dedede","#dfdfdf","#e0e0e0","#e1e1e1","#e2e2e2","#e3e3e3","#e4e4e4","#e5e5e5","#e6e6e6","#e7e7e7","#e8e8e8","#e9e9e9","#eaeaea","#ebebeb","#ececec","#ededed","#eeeeee","#efefef","#f0f0f0","#f1f1f1","#f2f2f2","#f3f3f3","#f4f4f4","#f5f5f5","#f6f6f6","#f7f7f7","#f8f8f8","#f9f9f9","#fafafa","#fbfbfb","#fcfcfc","#fdfdfd","#fefefe","#ffffff"],c.gray_r=["#ffffff","#fefefe","#fdfdfd","#fcfcfc","#fbfbfb","#fafafa","#f9f9f9","#f8f8f8","#f7f7f7","#f6f6f6","#f5f5f5","#f4f4f4","#f3f3f3","#f2f2f2","#f1f1f1","#f0f0f0","#efefef","#eeeeee","#ededed","#ececec","#ebebeb","#eaeaea","#e9e9e9","#e8e8e8","#e7e7e7","#e6e6e6","#e5e5e5","#e4e4e4","#e3e3e3","#e2e2e2","#e1e1e1","#e0e0e0","#dfdfdf","#dedede","#dddddd","#dcdcdc","#dbdbdb","#dadada","#d9d9d9","#d8d8d8","#d7d7d7","#d6d6d6","#d5d5d5","#d4d4d4","#d3d3d3","#d2d2d2","#d1d1d1","#d0d0d0","#cfcfcf","#cecece","#cdcdcd","#cccccc","#cbcbcb","#cacaca","#c9c9c9","#c8c8c8","#c7c7c7","#c6c6c6","#c5c5c5","#c4c4c4","#c3c3c3","#c2c2c2","#c1c1c1","#c0c0c0","#bfbfbf","#bebebe","#bdbdbd","#bcbcbc","#bbbbbb","#bababa","#b9b9b9","#b8b8b8","#b7b7b7","#b6b6b6","#b5b5b5","#b4b4b4","#b3b3b3","#b2b2b2","#b1b1b1","#b0b0b0","#afafaf","#aeaeae","#adadad","#acacac","#ababab","#aaaaaa","#a9a9a9","#a8a8a8","#a7a7a7","#a6a6a6","#a5a5a5","#a4a4a4","#a3a3a3","#a2a2a2","#a1a1a1","#a0a0a0","#9f9f9f","#9e9e9e","#9d9d9d","#9c9c9c","#9b9b9b","#9a9a9a","#999999","#989898","#979797","#969696","#959595","#949494","#939393","#929292","#919191","#909090","#8f8f8f","#8e8e8e","#8d8d8d","#8c8c8c","#8b8b8b","#8a8a8a","#898989","#888888","#878787","#868686","#858585","#848484","#838383","#828282","#818181","#808080","#7f7f7f","#7e7e7e","#7d7d7d","#7c7c7c","#7b7b7b","#7a7a7a","#797979","#787878","#777777","#767676","#757575","#747474","#737373","#727272","#717171","#707070","#6f6f6f","#6e6e6e","#6d6d6d","#6c6c6c","#6b6b6b","#6a6a6a","#696969","#686868","#676767","#666666","#656565","#646464","#636363","#626262","#616161","#606060","#5f5f5f","#5e5e5e","#5d5d5d","#5c5c5c","#5b5b5b","#5a5a5a","#595959","#585858","#575757","#565656","#555555","#545454","#535353","#525252","#515151","#505050","#4f4f4f","#4e4e4e","#4d4d4d","#4c4c4c","#4b4b4b","#4a4a4a","#494949","#484848","#474747","#464646","#454545","#444444","#434343","#424242","#414141","#404040","#3f3f3f","#3e3e3e","#3d3d3d","#3c3c3c","#3b3b3b","#3a3a3a","#393939","#383838","#373737","#363636","#353535","#343434","#333333","#323232","#313131","#303030","#2f2f2f","#2e2e2e","#2d2d2d","#2c2c2c","#2b2b2b","#2a2a2a","#292929","#282828","#272727","#262626","#252525","#242424","#232323","#222222","#212121","#202020","#1f1f1f","#1e1e1e","#1d1d1d","#1c1c1c","#1b1b1b","#1a1a1a","#191919","#181818","#171717","#161616","#151515","#141414","#131313","#121212","#111111","#101010","#0f0f0f","#0e0e0e","#0d0d0d","#0c0c0c","#0b0b0b","#0a0a0a","#090909","#080808","#070707","#060606","#050505","#040404","#030303","#020202","#010101","#000000"],c.grey=["#000000","#010101","#020202","#030303","#040404","#050505","#060606","#070707","#080808","#090909","#0a0a0a","#0b0b0b","#0c0c0c","#0d0d0d","#0e0e0e","#0f0f0f","#101010","#111111","#121212","#131313","#141414","#151515","#161616","#171717","#181818","#191919","#1a1a1a","#1b1b1b","#1c1c1c","#1d1d1d","#1e1e1e","#1f1f1f","#202020","#212121","#222222","#232323","#242424","#252525","#262626","#272727","#282828","#292929","#2a2a2a","#2b2b2b","#2c2c2c","#2d2d2d","#2e2e2e","#2f2f2f","#303030","#313131","#323232","#333333","#343434","#353535","#363636","#373737","#383838","#393939","#3a3a3a","#3b3b3b","#3c3c3c","#3d3d3d","#3e3e3e","#3f3f3f","#404040","#414141","#424242","#434343","#444444","#454545","#464646","#474747","#484848","#494949","#4a4a4a","#4b4b4b","#4c4c4c","#4d4d4d","#4e4e4e","#4f4f4f","#505050","#515151","#525252","#535353","#545454","#555555","#565656","#575757","#585858","#595959","#5a5a5a","#5b5b5b","#5c5c5c","#5d5d5d","#5e5e5e","#5f5f5f","#606060","#616161","#626262","#636363","#646464","#656565","#666666","#676767","#686868","#696969","#6a6a6a","#6b6b6b","#6c6c6c","#6d6d6d","#6e6e6e","#6f6f6f","#707070","#717171","#727272","#737373","#747474","#757575","#767676","#777777","#787878","#797979","#7a7a7a","#7b7b7b","#7c7c7c","#7d7d7d","#7e7e7e","#7f7f7f","#808080","#818181","#828282","#838383","#848484","#858585","#868686","#878787","#888888","#898989","#8a8a8a","#8b8b8b","#8c8c8c","#8d8d8d","#8e8e8e","#8f8f8f","#909090","#919191","#929292","#939393","#949494","#959595","#969696","#979797","#989898","#999999","#9a9a9a","#9b9b9b","#9c9c9c","#9d9d9d","#9e9e9e","#9f9f9f","#a0a0a0","#a1a1a1","#a2a2a2","#a3a3a3","#a4a4a4","#a5a5a5","#a6a6a6","#a7a7a7","#a8a8a8","#a9a9a9","#aaaaaa","#ababab","#acacac","#adadad","#aeaeae","#afafaf","#b0b0b0","#b1b1b1","#b2b2b2","#b3b3b3","#b4b4b4","#b5b5b5","#b6b6b6","#b7b7b7","#b8b8b8","#b9b9b9","#bababa","#bbbbbb","#bcbcbc","#bdbdbd","#bebebe","#bfbfbf","#c0c0c0","#c1c1c1","#c2c2c2","#c3c3c3","#c4c4c4","#c5c5c5","#c6c6c6","#c7c7c7","#c8c8c8","#c9c9c9","#cacaca","#cbcbcb","#cccccc","#cdcdcd","#cecece","#cfcfcf","#d0d0d0","#d1d1d1","#d2d2d2","#d3d3d3","#d4d4d4","#d5d5d5","#d6d6d6","#d7d7d7","#d8d8d8","#d9d9d9","#dadada","#dbdbdb","#dcdcdc","#dddddd","#dedede","#dfdfdf","#e0e0e0","#e1e1e1","#e2e2e2","#e3e3e3","#e4e4e4","#e5e5e5","#e6e6e6","#e7e7e7","#e8e8e8","#e9e9e9","#eaeaea","#ebebeb","#ececec","#ededed","#eeeeee","#efefef","#f0f0f0","#f1f1f1","#f2f2f2","#f3f3f3","#f4f4f4","#f5f5f5","#f6f6f6","#f7f7f7","#f8f8f8","#f9f9f9","#fafafa","#fbfbfb","#fcfcfc","#fdfdfd","#fefefe","#ffffff"],c.hot=["#0b0000","#0d0000","#100000","#120000","#150000","#180000","#1a0000","#1d0000","#200000","#220000","#250000","#270000","#2a0000","#2d0000","#2f0000","#320000","#350000","#370000","#3a0000","#3c0000","#3f0000","#420000","#440000","#470000","#4a0000","#4c0000","#4f0000","#510000","#540000","#570000","#590000","#5c0000","#5f0000","#610000","#640000","#660000","#690000","#6c0000","#6e0000","#710000","#740000","#760000","#790000","#7b0000","#7e0000","#810000","#830000","#860000","#890000","#8b0000","#8e0000","#900000","#930000","#960000","#980000","#9b0000","#9e0000","#a00000","#a30000","#a50000","#a80000","#ab0000","#ad0000","#b00000","#b30000","#b50000","#b80000","#ba0000","#bd0000","#c00000","#c20000","#c50000","#c80000","#ca0000","#cd0000","#cf0000","#d20000","#d50000","#d70000","#da0000","#dd0000","#df0000","#e20000","#e40000","#e70000","#ea0000","#ec0000","#ef0000","#f20000","#f40000","#f70000","#f90000","#fc0000","#ff0000","#ff0200","#ff0500","#ff0800","#ff0a00","#ff0d00","#ff1000","#ff1200","#ff1500","#ff1700","#ff1a00","#ff1d00","#ff1f00","#ff2200","#ff2500","#ff2700","#ff2a00","#ff2c00","#ff2f00","#ff3200","#ff3400","#ff3700","#ff3a00","#ff3c00","#ff3f00","#ff4100","#ff4400","#ff4700","#ff4900","#ff4c00","#ff4f00","#ff5100","#ff5400","#ff5600","#ff5900","#ff5c00","#ff5e00","#ff6100","#ff6400","#ff6600","#ff6900","#ff6b00","#ff6e00","#ff7100","#ff7300","#ff7600","#ff7900","#ff7b00","#ff7e00","#ff8000","#ff8300","#ff8600","#ff8800","#ff8b00","#ff8e00","#ff9000","#ff9300","#ff9500","#ff9800","#ff9b00","#ff9d00","#ffa000","#ffa200","#ffa500","#ffa800","#ffaa00","#ffad00","#ffb000","#ffb200","#ffb500","#ffb700","#ffba00","#ffbd00","#ffbf00","#ffc200","#ffc500","#ffc700","#ffca00","#ffcc00","#ffcf00","#ffd200","#ffd400","#ffd700","#ffda00","#ffdc00","#ffdf00","#ffe100","#ffe400","#ffe700","#ffe900","#ffec00","#ffef00","#fff100","#fff400","#fff600","#fff900","#fffc00","#fffe00","#ffff03","#ffff07","#ffff0b","#ffff0f","#ffff13","#ffff17","#ffff1b","#ffff1f","#ffff22","#ffff26","#ffff2a","#ffff2e","#ffff32","#ffff36","#ffff3a","#ffff3e","#ffff42","#ffff46","#ffff4a","#ffff4e","#ffff52","#ffff56","#ffff5a","#ffff5e","#ffff61","#ffff65","#ffff69","#ffff6d","#ffff71","#ffff75","#ffff79","#ffff7d","#ffff81","#ffff85","#ffff89","#ffff8d","#ffff91","#ffff95","#ffff99","#ffff9d","#ffffa0","#ffffa4","#ffffa8","#ffffac","#ffffb0","#ffffb4","#ffffb8","#ffffbc","#ffffc0","#ffffc4","#ffffc8","#ffffcc","#ffffd0","#ffffd4","#ffffd8","#ffffdc","#ffffdf","#ffffe3","#ffffe7","#ffffeb","#ffffef","#fffff3","#fffff7","#fffffb","#ffffff"],c.hot_r=["#ffffff","#fffffb","#fffff7","#fffff3","#ffffef","#ffffeb","#ffffe7","#ffffe3","#ffffdf","#ffffdc","#ffffd8","#ffffd4","#ffffd0","#ffffcc","#ffffc8","#ffffc4","#ffffc0","#ffffbc","#ffffb8","#ffffb4","#ffffb0","#ffffac","#ffffa8","#ffffa4","#ffffa0","#ffff9d","#ffff99","#ffff95","#ffff91","#ffff8d","#ffff89","#ffff85","#ffff81","#ffff7d","#ffff79","#ffff75","#ffff71","#ffff6d","#ffff69","#ffff65","#ffff61","#ffff5e","#ffff5a","#ffff56","#ffff52","#ffff4e","#ffff4a","#ffff46","#ffff42","#ffff3e","#ffff3a","#ffff36","#ffff32","#ffff2e","#ffff2a","#ffff26","#ffff22","#ffff1f","#ffff1b","#ffff17","#ffff13","#ffff0f","#ffff0b","#ffff07","#ffff03","#fffe00","#fffc00","#fff900","#fff600","#fff400","#fff100","#ffef00","#ffec00","#ffe900","#ffe700","#ffe400","#ffe100","#ffdf00","#ffdc00","#ffda00","#ffd700","#ffd400","#ffd200","#ffcf00","#ffcc00","#ffca00","#ffc700","#ffc500","#ffc200","#ffbf00","#ffbd00","#ffba00","#ffb700","#ffb500","#ffb200","#ffb000","#ffad00","#ffaa00","#ffa800","#ffa500","#ffa200","#ffa000","#ff9d00","#ff9b00","#ff9800","#ff9500","#ff9300","#ff9000","#ff8e00","#ff8b00","#ff8800","#ff8600","#ff8300","#ff8000","#ff7e00","#ff7b00","#ff7900","#ff7600","#ff7300","#ff7100","#ff6e00","#ff6b00","#ff6900","#ff6600","#ff6400","#ff6100","#ff5e00","#ff5c00","#ff5900","#ff5600","#ff5400","#ff5100","#ff4f00","#ff4c00","#ff4900","#ff4700","#ff4400","#ff4100","#ff3f00","#ff3c00","#ff3a00","#ff3700","#ff3400","#ff3200","#ff2f00","#ff2c00","#ff2a00","#ff2700","#ff2500","#ff2200","#ff1f00","#ff1d00","#ff1a00","#ff1700","#ff1500","#ff1200","#ff1000","#ff0d00","#ff0a00","#ff0800","#ff0500","#ff0200","#ff0000","#fc0000","#f90000","#f70000","#f40000","#f20000","#ef0000","#ec0000","#ea0000","#e70000","#e40000","#e20000","#df0000","#dd0000","#da0000","#d70000","#d50000","#d20000","#cf0000","#cd0000","#ca0000","#c80000","#c50000","#c20000","#c00000","#bd0000","#ba0000","#b80000","#b50000","#b30000","#b00000","#ad0000","#ab0000","#a80000","#a50000","#a30000","#a00000","#9e0000","#9b0000","#980000","#960000","#930000","#900000","#8e0000","#8b0000","#890000","#860000","#830000","#810000","#7e0000","#7b0000","#790000","#760000","#740000","#710000","#6e0000","#6c0000","#690000","#660000","#640000","#610000","#5f0000","#5c0000","#590000","#570000","#540000","#510000","#4f0000","#4c0000","#4a0000","#470000","#440000","#420000","#3f0000","#3c0000","#3a0000","#370000","#350000","#320000","#2f0000","#2d0000","#2a0000","#270000","#250000","#220000","#200000","#1d0000","#1a0000","#180000","#150000","#120000","#100000","#0d0000","#0b0000"],c.hsv=["#ff0000","#ff0600","#ff0c00","#ff1200","#ff1800","#ff1e00","#ff2300","#ff2900","#ff2f00","#ff3500","#ff3b00","#ff4100","#ff4700","#ff4d00","#ff5300","#ff5900","#ff5f00","#ff6400","#ff6a00","#ff7000","#ff7600","#ff7c00","#ff8200","#ff8800","#ff8e00","#ff9400","#ff9a00","#ff9f00","#ffa500","#ffab00","#ffb100","#ffb700","#ffbd00","#ffc300","#ffc900","#ffcf00","#ffd500","#ffdb00","#ffe000","#ffe600","#ffec00","#fef100","#fcf500","#faf900","#f8fd00","#f4ff00","#eeff00","#e8ff00","#e2ff00","#ddff00","#d7ff00","#d1ff00","#cbff00","#c5ff00","#bfff00","#b9ff00","#b3ff00","#adff00","#a7ff00","#a2ff00","#9cff00","#96ff00","#90ff00","#8aff00","#84ff00","#7eff00","#78ff00","#72ff00","#6cff00","#66ff00","#61ff00","#5bff00","#55ff00","#4fff00","#49ff00","#43ff00","#3dff00","#37ff00","#31ff00","#2bff00","#25ff00","#20ff00","#1aff00","#14ff00","#0eff00","#08ff00","#06ff04","#04ff08","#02ff0c","#00ff10","#00ff16","#00ff1b","#00ff21","#00ff27","#00ff2d","#00ff33","#00ff39","#00ff3f","#00ff45","#00ff4b","#00ff51","#00ff57","#00ff5c","#00ff62","#00ff68","#00ff6e","#00ff74","#00ff7a","#00ff80","#00ff86","#00ff8c","#00ff92","#00ff97","#00ff9d","#00ffa3","#00ffa9","#00ffaf","#00ffb5","#00ffbb","#00ffc1","#00ffc7","#00ffcd","#00ffd3","#00ffd8","#00ffde","#00ffe4","#00ffea","#00fff0","#00fff6","#00fffc","#00fcff","#00f6ff","#00f0ff","#00eaff","#00e5ff","#00dfff","#00d9ff","#00d3ff","#00cdff","#00c7ff","#00c1ff","#00bbff","#00b5ff","#00afff","#00aaff","#00a4ff","#009eff","#0098ff","#0092ff","#008cff","#0086ff","#0080ff","#007aff","#0074ff","#006eff","#0069ff","#0063ff","#005dff","#0057ff","#0051ff","#004bff","#0045ff","#003fff","#0039ff","#0033ff","#002dff","#0028ff","#0022ff","#001cff","#0016ff","#0010ff","#020cff","#0408ff","#0604ff","#0800ff","#0e00ff","#1300ff","#1900ff","#1f00ff","#2500ff","#2b00ff","#3100ff","#3700ff","#3d00ff","#4300ff","#4900ff","#4f00ff","#5400ff","#5a00ff","#6000ff","#6600ff","#6c00ff","#7200ff","#7800ff","#7e00ff","#8400ff","#8a00ff","#9000ff","#9500ff","#9b00ff","#a100ff","#a700ff","#ad00ff","#b300ff","#b900ff","#bf00ff","#c500ff","#cb00ff","#d000ff","#d600ff","#dc00ff","#e200ff","#e800ff","#ee00ff","#f400ff","#f800fd","#fa00f9","#fc00f5","#fe00f1","#ff00ed","#ff00e7","#ff00e1","#ff00db","#ff00d5","#ff00cf","#ff00c9","#ff00c3","#ff00bd","#ff00b7","#ff00b1","#ff00ac","#ff00a6","#ff00a0","#ff009a","#ff0094","#ff008e","#ff0088","#ff0082","#ff007c","#ff0076","#ff0071","#ff006b","#ff0065","#ff005f","#ff0059","#ff0053","#ff004d","#ff0047","#ff0041","#ff003b","#ff0035","#ff0030","#ff002a","#ff0024","#ff001e","#ff0018"],c.hsv_r=["#ff0018","#ff001e","#ff0024","#ff002a","#ff0030","#ff0035","#ff003b","#ff0041","#ff0047","#ff004d","#ff0053","#ff0059","#ff005f","#ff0065","#ff006b","#ff0071","#ff0076","#ff007c","#ff0082","#ff0088","#ff008e","#ff0094","#ff009a","#ff00a0","#ff00a6","#ff00ac","#ff00b1","#ff00b7","#ff00bd","#ff00c3","#ff00c9","#ff00cf","#ff00d5","#ff00db","#ff00e1","#ff00e7","#ff00ed","#fe00f1","#fc00f5","#fa00f9","#f800fd","#f400ff","#ee00ff","#e800ff","#e200ff","#dc00ff","#d600ff","#d000ff","#cb00ff","#c500ff","#bf00ff","#b900ff","#b300ff","#ad00ff","#a700ff","#a100ff","#9b00ff","#9500ff","#9000ff","#8a00ff","#8400ff","#7e00ff","#7800ff","#7200ff","#6c00ff","#6600ff","#6000ff","#5a00ff","#5400ff","#4f00ff","#4900ff","#4300ff","#3d00ff","#3700ff","#3100ff","#2b00ff","#2500ff","#1f00ff","#1900ff","#1300ff","#0e00ff","#0800ff","#0604ff","#0408ff","#020cff","#0010ff","#0016ff","#001cff","#0022ff","#0028ff","#002dff","#0033ff","#0039ff","#003fff","#0045ff","#004bff","#0051ff","#0057ff","#005dff","#0063ff","#0069ff","#006eff","#0074ff","#007aff","#0080ff","#0086ff","#008cff","#0092ff","#0098ff","#009eff","#00a4ff","#00aaff","#00afff","#00b5ff","#00bbff","#00c1ff","#00c7ff","#00cdff","#00d3ff","#00d9ff","#00dfff","#00e5ff","#00eaff","#00f0ff","#00f6ff","#00fcff","#00fffc","#00fff6","#00fff0","#00ffea","#00ffe4","#00ffde","#00ffd8","#00ffd3","#00ffcd","#00ffc7","#00ffc1","#00ffbb","#00ffb5","#00ffaf","#00ffa9","#00ffa3","#00ff9d","#00ff97","#00ff92","#00ff8c","#00ff86","#00ff80","#00ff7a","#00ff74","#00ff6e","#00ff68","#00ff62","#00ff5c","#00ff57","#00ff51","#00ff4b","#00ff45","#00ff3f","#00ff39","#00ff33","#00ff2d","#00ff27","#00ff21","#00ff1b","#00ff16","#00ff10","#02ff0c","#04ff08","#06ff04","#08ff00","#0eff00","#14ff00","#1aff00","#20ff00","#25ff00","#2bff00","#31ff00","#37ff00","#3dff00","#43ff00","#49ff00","#4fff00","#55ff00","#5bff00","#61ff00","#66ff00","#6cff00","#72ff00","#78ff00","#7eff00","#84ff00","#8aff00","#90ff00","#96ff00","#9cff00","#a2ff00","#a7ff00","#adff00","#b3ff00","#b9ff00","#bfff00","#c5ff00","#cbff00","#d1ff00","#d7ff00","#ddff00","#e2ff00","#e8ff00","#eeff00","#f4ff00","#f8fd00","#faf900","#fcf500","#fef100","#ffec00","#ffe600","#ffe000","#ffdb00","#ffd500","#ffcf00","#ffc900","#ffc300","#ffbd00","#ffb700","#ffb100","#ffab00","#ffa500","#ff9f00","#ff9a00","#ff9400","#ff8e00","#ff8800","#ff8200","#ff7c00","#ff7600","#ff7000","#ff6a00","#ff6400","#ff5f00","#ff5900","#ff5300","#ff4d00","#ff4700","#ff4100","#ff3b00","#ff3500","#ff2f00","#ff2900","#ff2300","#ff1e00","#ff1800","#ff1200","#ff0c00","#ff0600","#ff0000"],c.inferno=["#000004","#010005","#010106","#010108","#02010a","#02020c","#02020e","#030210","#040312","#040314","#050417","#060419","#07051b","#08051d","#09061f","#0a0722","#0b0724","#0c0826","#0d0829","#0e092b","#10092d","#110a30","#120a32","#140b34","#150b37","#160b39","#180c3c","#190c3e","#1b0c41","#1c0c43","#1e0c45","#1f0c48","#210c4a","#230c4c","#240c4f","#260c51","#280b53","#290b55","#2b0b57","#2d0b59","#2f0a5b","#310a5c","#320a5e","#340a5f","#360961","#380962","#390963","#3b0964","#3d0965","#3e0966","#400a67","#420a68","#440a68","#450a69","#470b6a","#490b6a","#4a0c6b","#4c0c6b","#4d0d6c","#4f0d6c","#510e6c","#520e6d","#540f6d","#550f6d","#57106e","#59106e","#5a116e","#5c126e","#5d126e","#5f136e","#61136e","#62146e","#64156e","#65156e","#67166e","#69166e","#6a176e","#6c186e","#6d186e","#6f196e","#71196e","#721a6e","#741a6e","#751b6e","#771c6d","#781c6d","#7a1d6d","#7c1d6d","#7d1e6d","#7f1e6c","#801f6c","#82206c","#84206b","#85216b","#87216b","#88226a","#8a226a","#8c2369","#8d2369","#8f2469","#902568","#922568","#932667","#952667","#972766","#982766","#9a2865","#9b2964","#9d2964","#9f2a63","#a02a63","#a22b62","#a32c61","#a52c60","#a62d60","#a82e5f","#a92e5e","#ab2f5e","#ad305d","#ae305c","#b0315b","#b1325a","#b3325a","#b43359","#b63458","#b73557","#b93556","#ba3655","#bc3754","#bd3853","#bf3952","#c03a51","#c13a50","#c33b4f","#c43c4e","#c63d4d","#c73e4c","#c83f4b","#ca404a","#cb4149","#cc4248","#ce4347","#cf4446","#d04545","#d24644","#d34743","#d44842","#d54a41","#d74b3f","#d84c3e","#d94d3d","#da4e3c","#db503b","#dd513a","#de5238","#df5337","#e05536","#e15635","#e25734","#e35933","#e45a31","#e55c30","#e65d2f","#e75e2e","#e8602d","#e9612b","#ea632a","#eb6429","#eb6628","#ec6726","#ed6925","#ee6a24","#ef6c23","#ef6e21","#f06f20","#f1711f","#f1731d","#f2741c","#f3761b","#f37819","#f47918","#f57b17","#f57d15","#f67e14","#f68013","#f78212","#f78410","#f8850f","#f8870e","#f8890c","#f98b0b","#f98c0a","#f98e09","#fa9008","#fa9207","#fa9407","#fb9606","#fb9706","#fb9906","#fb9b06","#fb9d07","#fc9f07","#fca108","#fca309","#fca50a","#fca60c","#fca80d","#fcaa0f","#fcac11","#fcae12","#fcb014","#fcb216","#fcb418","#fbb61a","#fbb81d","#fbba1f","#fbbc21","#fbbe23","#fac026","#fac228","#fac42a","#fac62d","#f9c72f","#f9c932","#f9cb35","#f8cd37","#f8cf3a","#f7d13d","#f7d340","#f6d543","#f6d746","#f5d949","#f5db4c","#f4dd4f","#f4df53","#f4e156","#f3e35a","#f3e55d","#f2e661","#f2e865","#f2ea69","#f1ec6d","#f1ed71","#f1ef75","#f1f179","#f2f27d","#f2f482","#f3f586","#f3f68a","#f4f88e","#f5f992","#f6fa96","#f8fb9a","#f9fc9d","#fafda1","#fcffa4"],c.inferno_r=["#fcffa4","#fafda1","#f9fc9d","#f8fb9a","#f6fa96","#f5f992","#f4f88e","#f3f68a","#f3f586","#f2f482","#f2f27d","#f1f179","#f1ef75","#f1ed71","#f1ec6d","#f2ea69","#f2e865","#f2e661","#f3e55d","#f3e35a","#f4e156","#f4df53","#f4dd4f","#f5db4c","#f5d949","#f6d746","#f6d543","#f7d340","#f7d13d","#f8cf3a","#f8cd37","#f9cb35","#f9c932","#f9c72f","#fac62d","#fac42a","#fac228","#fac026","#fbbe23","#fbbc21","#fbba1f","#fbb81d","#fbb61a","#fcb418","#fcb216","#fcb014","#fcae12","#fcac11","#fcaa0f","#fca80d","#fca60c","#fca50a","#fca309","#fca108","#fc9f07","#fb9d07","#fb9b06","#fb9906","#fb9706","#fb9606","#fa9407","#fa9207","#fa9008","#f98e09","#f98c0a","#f98b0b","#f8890c","#f8870e","#f8850f","#f78410","#f78212","#f68013","#f67e14","#f57d15","#f57b17","#f47918","#f37819","#f3761b","#f2741c","#f1731d","#f1711f","#f06f20","#ef6e21","#ef6c23","#ee6a24","#ed6925","#ec6726","#eb6628","#eb6429","#ea632a","#e9612b","#e8602d","#e75e2e","#e65d2f","#e55c30","#e45a31","#e35933","#e25734","#e15635","#e05536","#df5337","#de5238","#dd513a","#db503b","#da4e3c","#d94d3d","#d84c3e","#d74b3f","#d54a41","#d44842","#d34743","#d24644","#d04545","#cf4446","#ce4347","#cc4248","#cb4149","#ca404a","#c83f4b","#c73e4c","#c63d4d","#c43c4e","#c33b4f","#c13a50","#c03a51","#bf3952","#bd3853","#bc3754","#ba3655","#b93556","#b73557","#b63458","#b43359","#b3325a","#b1325a","#b0315b","#ae305c","#ad305d","#ab2f5e","#a92e5e","#a82e5f","#a62d60","#a52c60","#a32c61","#a22b62","#a02a63","#9f2a63","#9d2964","#9b2964","#9a2865","#982766","#972766","#952667","#932667","#922568","#902568","#8f2469","#8d2369","#8c2369","#8a226a","#88226a","#87216b","#85216b","#84206b","#82206c","#801f6c","#7f1e6c","#7d1e6d","#7c1d6d","#7a1d6d","#781c6d","#771c6d","#751b6e","#741a6e","#721a6e","#71196e","#6f196e","#6d186e","#6c186e","#6a176e","#69166e","#67166e","#65156e","#64156e","#62146e","#61136e","#5f136e","#5d126e","#5c126e","#5a116e","#59106e","#57106e","#550f6d","#540f6d","#520e6d","#510e6c","#4f0d6c","#4d0d6c","#4c0c6b","#4a0c6b","#490b6a","#470b6a","#450a69","#440a68","#420a68","#400a67","#3e0966","#3d0965","#3b0964","#390963","#380962","#360961","#340a5f","#320a5e","#310a5c","#2f0a5b","#2d0b59","#2b0b57","#290b55","#280b53","#260c51","#240c4f","#230c4c","#210c4a","#1f0c48","#1e0c45","#1c0c43","#1b0c41","#190c3e","#180c3c","#160b39","#150b37","#140b34","#120a32","#110a30","#10092d","#0e092b","#0d0829","#0c0826","#0b0724","#0a0722","#09061f","#08051d","#07051b","#060419","#050417","#040314","#040312","#030210","#02020e","#02020c","#02010a","#010108","#010106","#010005","#000004"],c.jet=["#000080","#000084","#000089","#00008d","#000092","#000096","#00009b","#00009f","#0000a4","#0000a8","#0000ad","#0000b2","#0000b6","#0000bb","#0000bf","#0000c4","#0000c8","#0000cd","#0000d1","#0000d6","#0000da","#0000df","#0000e3","#0000e8","#0000ed","#0000f1","#0000f6","#0000fa","#0000ff","#0000ff","#0000ff","#0000ff","#0000ff","#0004ff","#0008ff","#000cff","#0010ff","#0014ff","#0018ff","#001cff","#0020ff","#0024ff","#0028ff","#002cff","#0030ff","#0034ff","#0038ff","#003cff","#0040ff","#0044ff","#0048ff","#004cff","#0050ff","#0054ff","#0058ff","#005cff","#0060ff","#0064ff","#0068ff","#006cff","#0070ff","#0074ff","#0078ff","#007cff","#0080ff","#0084ff","#0088ff","#008cff","#0090ff","#0094ff","#0098ff","#009cff","#00a0ff","#00a4ff","#00a8ff","#00acff","#00b0ff","#00b4ff","#00b8ff","#00bcff","#00c0ff","#00c4ff","#00c8ff","#00ccff","#00d0ff","#00d4ff","#00d8ff","#00dcfe","#00e0fb","#00e4f8","#02e8f4","#06ecf1","#09f0ee","#0cf4eb","#0ff8e7","#13fce4","#16ffe1","#19ffde","#1cffdb","#1fffd7","#23ffd4","#26ffd1","#29ffce","#2cffca","#30ffc7","#33ffc4","#36ffc1","#39ffbe","#3cffba","#40ffb7","#43ffb4","#46ffb1","#49ffad","#4dffaa","#50ffa7","#53ffa4","#56ffa0","#5aff9d","#5dff9a","#60ff97","#63ff94","#66ff90","#6aff8d","#6dff8a","#70ff87","#73ff83","#77ff80","#7aff7d","#7dff7a","#80ff77","#83ff73","#87ff70","#8aff6d","#8dff6a","#90ff66","#94ff63","#97ff60","#9aff5d","#9dff5a","#a0ff56","#a4ff53","#a7ff50","#aaff4d","#adff49","#b1ff46","#b4ff43","#b7ff40","#baff3c","#beff39","#c1ff36","#c4ff33","#c7ff30","#caff2c","#ceff29","#d1ff26","#d4ff23","#d7ff1f","#dbff1c","#deff19","#e1ff16","#e4ff13","#e7ff0f","#ebff0c","#eeff09","#f1fc06","#f4f802","#f8f500","#fbf100","#feed00","#ffea00","#ffe600","#ffe200","#ffde00","#ffdb00","#ffd700","#ffd300","#ffd000","#ffcc00","#ffc800","#ffc400","#ffc100","#ffbd00","#ffb900","#ffb600","#ffb200","#ffae00","#ffab00","#ffa700","#ffa300","#ff9f00","#ff9c00","#ff9800","#ff9400","#ff9100","#ff8d00","#ff8900","#ff8600","#ff8200","#ff7e00","#ff7a00","#ff7700","#ff7300","#ff6f00","#ff6c00","#ff6800","#ff6400","#ff6000","#ff5d00","#ff5900","#ff5500","#ff5200","#ff4e00","#ff4a00","#ff4700","#ff4300","#ff3f00","#ff3b00","#ff3800","#ff3400","#ff3000","#ff2d00","#ff2900","#ff2500","#ff2200","#ff1e00","#ff1a00","#ff1600","#ff1300","#fa0f00","#f60b00","#f10800","#ed0400","#e80000","#e40000","#df0000","#da0000","#d60000","#d10000","#cd0000","#c80000","#c40000","#bf0000","#bb0000","#b60000","#b20000","#ad0000","#a80000","#a40000","#9f0000","#9b0000","#960000","#920000","#8d0000","#890000","#840000","#800000"],c.jet_r=["#800000","#840000","#890000","#8d0000","#920000","#960000","#9b0000","#9f0000","#a40000","#a80000","#ad0000","#b20000","#b60000","#bb0000","#bf0000","#c40000","#c80000","#cd0000","#d10000","#d60000","#da0000","#df0000","#e40000","#e80000","#ed0400","#f10800","#f60b00","#fa0f00","#ff1300","#ff1600","#ff1a00","#ff1e00","#ff2200","#ff2500","#ff2900","#ff2d00","#ff3000","#ff3400","#ff3800","#ff3b00","#ff3f00","#ff4300","#ff4700","#ff4a00","#ff4e00","#ff5200","#ff5500","#ff5900","#ff5d00","#ff6000","#ff6400","#ff6800","#ff6c00","#ff6f00","#ff7300","#ff7700","#ff7a00","#ff7e00","#ff8200","#ff8600","#ff8900","#ff8d00","#ff9100","#ff9400","#ff9800","#ff9c00","#ff9f00","#ffa300","#ffa700","#ffab00","#ffae00","#ffb200","#ffb600","#ffb900","#ffbd00","#ffc100","#ffc400","#ffc800","#ffcc00","#ffd000","#ffd300","#ffd700","#ffdb00","#ffde00","#ffe200","#ffe600","#ffea00","#feed00","#fbf100","#f8f500","#f4f802","#f1fc06","#eeff09","#ebff0c","#e7ff0f","#e4ff13","#e1ff16","#deff19","#dbff1c","#d7ff1f","#d4ff23","#d1ff26","#ceff29","#caff2c","#c7ff30","#c4ff33","#c1ff36","#beff39","#baff3c","#b7ff40","#b4ff43","#b1ff46","#adff49","#aaff4d","#a7ff50","#a4ff53","#a0ff56","#9dff5a","#9aff5d","#97ff60","#94ff63","#90ff66","#8dff6a","#8aff6d","#87ff70","#83ff73","#80ff77","#7dff7a","#7aff7d","#77ff80","#73ff83","#70ff87","#6dff8a","#6aff8d","#66ff90","#63ff94","#60ff97","#5dff9a","#5aff9d","#56ffa0","#53ffa4","#50ffa7","#4dffaa","#49ffad","#46ffb1","#43ffb4","#40ffb7","#3cffba","#39ffbe","#36ffc1","#33ffc4","#30ffc7","#2cffca","#29ffce","#26ffd1","#23ffd4","#1fffd7","#1cffdb","#19ffde","#16ffe1","#13fce4","#0ff8e7","#0cf4eb","#09f0ee","#06edf1","#02e8f4","#00e4f8","#00e0fb","#00dcfe","#00d8ff","#00d4ff","#00d0ff","#00ccff","#00c8ff","#00c4ff","#00c0ff","#00bcff","#00b8ff","#00b4ff","#00b0ff","#00adff","#00a8ff","#00a4ff","#00a0ff","#009cff","#0098ff","#0094ff","#0090ff","#008cff","#0088ff","#0084ff","#0080ff","#007dff","#0078ff","#0075ff","#0070ff","#006dff","#0068ff","#0065ff","#0060ff","#005dff","#0058ff","#0055ff","#0050ff","#004dff","#0048ff","#0045ff","#0040ff","#003dff","#0038ff","#0035ff","#0030ff","#002dff","#0028ff","#0025ff","#0020ff","#001dff","#0018ff","#0015ff","#0010ff","#000dff","#0008ff","#0005ff","#0000ff","#0000ff","#0000ff","#0000ff","#0000ff","#0000fa","#0000f6","#0000f1","#0000ed","#0000e8","#0000e4","#0000df","#0000da","#0000d6","#0000d1","#0000cd","#0000c8","#0000c4","#0000bf","#0000bb","#0000b6","#0000b2","#0000ad","#0000a8","#0000a4","#00009f","#00009b","#000096","#000092","#00008d","#000089","#000084","#000080"],c.magma=["#000004","#010005","#010106","#010108","#020109","#02020b","#02020d","#03030f","#030312","#040414","#050416","#060518","#06051a","#07061c","#08071e","#090720","#0a0822","#0b0924","#0c0926","#0d0a29","#0e0b2b","#100b2d","#110c2f","#120d31","#130d34","#140e36","#150e38","#160f3b","#180f3d","#19103f","#1a1042","#1c1044","#1d1147","#1e1149","#20114b","#21114e","#221150","#241253","#251255","#271258","#29115a","#2a115c","#2c115f","#2d1161","#2f1163","#311165","#331067","#341069","#36106b","#38106c","#390f6e","#3b0f70","#3d0f71","#3f0f72","#400f74","#420f75","#440f76","#451077","#471078","#491078","#4a1079","#4c117a","#4e117b","#4f127b","#51127c","#52137c","#54137d","#56147d","#57157e","#59157e","#5a167e","#5c167f","#5d177f","#5f187f","#601880","#621980","#641a80","#651a80","#671b80","#681c81","#6a1c81","#6b1d81","#6d1d81","#6e1e81","#701f81","#721f81","#732081","#752181","#762181","#782281","#792282","#7b2382","#7c2382","#7e2482","#802582","#812581","#832681","#842681","#862781","#882781","#892881","#8b2981","#8c2981","#8e2a81","#902a81","#912b81","#932b80","#942c80","#962c80","#982d80","#992d80","#9b2e7f","#9c2e7f","#9e2f7f","#a02f7f","#a1307e","#a3307e","#a5317e","#a6317d","#a8327d","#aa337d","#ab337c","#ad347c","#ae347b","#b0357b","#b2357b","#b3367a","#b5367a","#b73779","#b83779","#ba3878","#bc3978","#bd3977","#bf3a77","#c03a76","#c23b75","#c43c75","#c53c74","#c73d73","#c83e73","#ca3e72","#cc3f71","#cd4071","#cf4070","#d0416f","#d2426f","#d3436e","#d5446d","#d6456c","#d8456c","#d9466b","#db476a","#dc4869","#de4968","#df4a68","#e04c67","#e24d66","#e34e65","#e44f64","#e55064","#e75263","#e85362","#e95462","#ea5661","#eb5760","#ec5860","#ed5a5f","#ee5b5e","#ef5d5e","#f05f5e","#f1605d","#f2625d","#f2645c","#f3655c","#f4675c","#f4695c","#f56b5c","#f66c5c","#f66e5c","#f7705c","#f7725c","#f8745c","#f8765c","#f9785d","#f9795d","#f97b5d","#fa7d5e","#fa7f5e","#fa815f","#fb835f","#fb8560","#fb8761","#fc8961","#fc8a62","#fc8c63","#fc8e64","#fc9065","#fd9266","#fd9467","#fd9668","#fd9869","#fd9a6a","#fd9b6b","#fe9d6c","#fe9f6d","#fea16e","#fea36f","#fea571","#fea772","#fea973","#feaa74","#feac76","#feae77","#feb078","#feb27a","#feb47b","#feb67c","#feb77e","#feb97f","#febb81","#febd82","#febf84","#fec185","#fec287","#fec488","#fec68a","#fec88c","#feca8d","#fecc8f","#fecd90","#fecf92","#fed194","#fed395","#fed597","#fed799","#fed89a","#fdda9c","#fddc9e","#fddea0","#fde0a1","#fde2a3","#fde3a5","#fde5a7","#fde7a9","#fde9aa","#fdebac","#fcecae","#fceeb0","#fcf0b2","#fcf2b4","#fcf4b6","#fcf6b8","#fcf7b9","#fcf9bb","#fcfbbd","#fcfdbf"],c.magma_r=["#fcfdbf","#fcfbbd","#fcf9bb","#fcf7b9","#fcf6b8","#fcf4b6","#fcf2b4","#fcf0b2","#fceeb0","#fcecae","#fdebac","#fde9aa","#fde7a9","#fde5a7","#fde3a5","#fde2a3","#fde0a1","#fddea0","#fddc9e","#fdda9c","#fed89a","#fed799","#fed597","#fed395","#fed194","#fecf92","#fecd90","#fecc8f","#feca8d","#fec88c","#fec68a","#fec488","#fec287","#fec185","#febf84","#febd82","#febb81","#feb97f","#feb77e","#feb67c","#feb47b","#feb27a","#feb078","#feae77","#feac76","#feaa74","#fea973","#fea772","#fea571","#fea36f","#fea16e","#fe9f6d","#fe9d6c","#fd9b6b","#fd9a6a","#fd9869","#fd9668","#fd9467","#fd9266","#fc9065","#fc8e64","#fc8c63","#fc8a62","#fc8961","#fb8761","#fb8560","#fb835f","#fa815f","#fa7f5e","#fa7d5e","#f97b5d","#f9795d","#f9785d","#f8765c","#f8745c","#f7725c","#f7705c","#f66e5c","#f66c5c","#f56b5c","#f4695c","#f4675c","#f3655c","#f2645c","#f2625d","#f1605d","#f05f5e","#ef5d5e","#ee5b5e","#ed5a5f","#ec5860","#eb5760","#ea5661","#e95462","#e85362","#e75263","#e55064","#e44f64","#e34e65","#e24d66","#e04c67","#df4a68","#de4968","#dc4869","#db476a","#d9466b","#d8456c","#d6456c","#d5446d","#d3436e","#d2426f","#d0416f","#cf4070","#cd4071","#cc3f71","#ca3e72","#c83e73","#c73d73","#c53c74","#c43c75","#c23b75","#c03a76","#bf3a77","#bd3977","#bc3978","#ba3878","#b83779","#b73779","#b5367a","#b3367a","#b2357b","#b0357b","#ae347b","#ad347c","#ab337c","#aa337d","#a8327d","#a6317d","#a5317e","#a3307e","#a1307e","#a02f7f","#9e2f7f","#9c2e7f","#9b2e7f","#992d80","#982d80","#962c80","#942c80","#932b80","#912b81","#902a81","#8e2a81","#8c2981","#8b2981","#892881","#882781","#862781","#842681","#832681","#812581","#802582","#7e2482","#7c2382","#7b2382","#792282","#782281","#762181","#752181","#732081","#721f81","#701f81","#6e1e81","#6d1d81","#6b1d81","#6a1c81","#681c81","#671b80","#651a80","#641a80","#621980","#601880","#5f187f","#5d177f","#5c167f","#5a167e","#59157e","#57157e","#56147d","#54137d","#52137c","#51127c","#4f127b","#4e117b","#4c117a","#4a1079","#491078","#471078","#451077","#440f76","#420f75","#400f74","#3f0f72","#3d0f71","#3b0f70","#390f6e","#38106c","#36106b","#341069","#331067","#311165","#2f1163","#2d1161","#2c115f","#2a115c","#29115a","#271258","#251255","#241253","#221150","#21114e","#20114b","#1e1149","#1d1147","#1c1044","#1a1042","#19103f","#180f3d","#160f3b","#150e38","#140e36","#130d34","#120d31","#110c2f","#100b2d","#0e0b2b","#0d0a29","#0c0926","#0b0924","#0a0822","#090720","#08071e","#07061c","#06051a","#060518","#050416","#040414","#030312","#03030f","#02020d","#02020b","#020109","#010108","#010106","#010005","#000004"],c.nipy_spectral=["#000000","#09000b","#130015","#1c0020","#25002b","#2f0035","#380040","#41004b","#4b0055","#540060","#5d006b","#670075","#700080","#770088","#79008a","#7a008b","#7b008c","#7d008e","#7e008f","#7f0090","#810092","#820093","#830094","#850096","#860097","#870098","#83009a","#78009b","#6d009c","#63009e","#58009f","#4d00a0","#4300a2","#3800a3","#2d00a4","#2300a6","#1800a7","#0d00a8","#0300aa","#0000ad","#0000b1","#0000b5","#0000b9","#0000bd","#0000c1","#0000c5","#0000c9","#0000cd","#0000d1","#0000d5","#0000d9","#0000dd","#0009dd","#0013dd","#001cdd","#0025dd","#002fdd","#0038dd","#0041dd","#004bdd","#0054dd","#005ddd","#0067dd","#0070dd","#0078dd","#007add","#007ddd","#0080dd","#0082dd","#0085dd","#0088dd","#008add","#008ddd","#0090dd","#0092dd","#0095dd","#0098dd","#009adb","#009bd7","#009cd3","#009ecf","#009fcb","#00a0c7","#00a2c3","#00a3bf","#00a4bb","#00a6b7","#00a7b3","#00a8af","#00aaab","#00aaa8","#00aaa5","#00aaa3","#00aaa0","#00aa9d","#00aa9b","#00aa98","#00aa95","#00aa93","#00aa90","#00aa8d","#00aa8b","#00aa88","#00a97d","#00a773","#00a668","#00a55d","#00a353","#00a248","#00a13d","#009f33","#009e28","#009d1d","#009b13","#009a08","#009a00","#009c00","#009f00","#00a200","#00a400","#00a700","#00aa00","#00ac00","#00af00","#00b200","#00b400","#00b700","#00ba00","#00bc00","#00bf00","#00c200","#00c400","#00c700","#00ca00","#00cc00","#00cf00","#00d200","#00d400","#00d700","#00da00","#00dc00","#00df00","#00e200","#00e400","#00e700","#00ea00","#00ec00","#00ef00","#00f200","#00f400","#00f700","#00fa00","#00fc00","#00ff00","#0fff00","#1dff00","#2cff00","#3bff00","#49ff00","#58ff00","#67ff00","#75ff00","#84ff00","#93ff00","#a1ff00","#b0ff00","#bcff00","#c0fd00","#c4fc00","#c8fb00","#ccf900","#d0f800","#d4f700","#d8f500","#dcf400","#e0f300","#e4f100","#e8f000","#ecef00","#efed00","#f0ea00","#f1e700","#f3e500","#f4e200","#f5df00","#f7dd00","#f8da00","#f9d700","#fbd500","#fcd200","#fdcf00","#ffcd00","#ffc900","#ffc500","#ffc100","#ffbd00","#ffb900","#ffb500","#ffb100","#ffad00","#ffa900","#ffa500","#ffa100","#ff9d00","#ff9900","#ff8d00","#ff8100","#ff7500","#ff6900","#ff5d00","#ff5100","#ff4500","#ff3900","#ff2d00","#ff2100","#ff1500","#ff0900","#fe0000","#fc0000","#f90000","#f60000","#f40000","#f10000","#ee0000","#ec0000","#e90000","#e60000","#e40000","#e10000","#de0000","#dc0000","#db0000","#da0000","#d80000","#d70000","#d60000","#d40000","#d30000","#d20000","#d00000","#cf0000","#ce0000","#cc0000","#cc0c0c","#cc1c1c","#cc2c2c","#cc3c3c","#cc4c4c","#cc5c5c","#cc6c6c","#cc7c7c","#cc8c8c","#cc9c9c","#ccacac","#ccbcbc","#cccccc"],c.nipy_spectral_r=["#cccccc","#ccbcbc","#ccacac","#cc9c9c","#cc8c8c","#cc7c7c","#cc6c6c","#cc5c5c","#cc4c4c","#cc3c3c","#cc2c2c","#cc1c1c","#cc0c0c","#cc0000","#ce0000","#cf0000","#d00000","#d20000","#d30000","#d40000","#d60000","#d70000","#d80000","#da0000","#db0000","#dc0000","#de0000","#e10000","#e40000","#e60000","#e90000","#ec0000","#ee0000","#f10000","#f40000","#f60000","#f90000","#fc0000","#fe0000","#ff0900","#ff1500","#ff2100","#ff2d00","#ff3900","#ff4500","#ff5100","#ff5d00","#ff6900","#ff7500","#ff8100","#ff8d00","#ff9900","#ff9d00","#ffa100","#ffa500","#ffa900","#ffad00","#ffb100","#ffb500","#ffb900","#ffbd00","#ffc100","#ffc500","#ffc900","#ffcd00","#fdcf00","#fcd200","#fbd500","#f9d700","#f8da00","#f7dd00","#f5df00","#f4e200","#f3e500","#f1e700","#f0ea00","#efed00","#ecef00","#e8f000","#e4f100","#e0f300","#dcf400","#d8f500","#d4f700","#d0f800","#ccf900","#c8fb00","#c4fc00","#c0fd00","#bcff00","#b0ff00","#a1ff00","#93ff00","#84ff00","#75ff00","#67ff00","#58ff00","#49ff00","#3bff00","#2cff00","#1dff00","#0fff00","#00ff00","#00fc00","#00fa00","#00f700","#00f400","#00f200","#00ef00","#00ec00","#00ea00","#00e700","#00e400","#00e200","#00df00","#00dc00","#00da00","#00d700","#00d400","#00d200","#00cf00","#00cc00","#00ca00","#00c700","#00c400","#00c200","#00bf00","#00bc00","#00ba00","#00b700","#00b400","#00b200","#00af00","#00ac00","#00aa00","#00a700","#00a400","#00a200","#009f00","#009c00","#009a00","#009a08","#009b13","#009d1d","#009e28","#009f33","#00a13d","#00a248","#00a353","#00a55d","#00a668","#00a773","#00a97d","#00aa88","#00aa8b","#00aa8d","#00aa90","#00aa93","#00aa95","#00aa98","#00aa9b","#00aa9d","#00aaa0","#00aaa3","#00aaa5","#00aaa8","#00aaab","#00a8af","#00a7b3","#00a6b7","#00a4bb","#00a3bf","#00a2c3","#00a0c7","#009fcb","#009ecf","#009cd3","#009bd7","#009adb","#0098dd","#0095dd","#0092dd","#0090dd","#008ddd","#008add","#0088dd","#0085dd","#0082dd","#0080dd","#007ddd","#007add","#0078dd","#0070dd","#0067dd","#005ddd","#0054dd","#004bdd","#0041dd","#0038dd","#002fdd","#0025dd","#001cdd","#0013dd","#0009dd","#0000dd","#0000d9","#0000d5","#0000d1","#0000cd","#0000c9","#0000c5","#0000c1","#0000bd","#0000b9","#0000b5","#0000b1","#0000ad","#0300aa","#0d00a8","#1800a7","#2300a6","#2d00a4","#3800a3","#4300a2","#4d00a0","#58009f","#63009e","#6d009c","#78009b","#83009a","#870098","#860097","#850096","#830094","#820093","#810092","#7f0090","#7e008f","#7d008e","#7b008c","#7a008b","#79008a","#770088","#700080","#670075","#5d006b","#540060","#4b0055","#41004b","#380040","#2f0035","#25002b","#1c0020","#130015","#09000b","#000000"],c.ocean=["#008000","#007e01","#007c02","#007b03","#007a04","#007805","#007606","#007507","#007408","#007209","#00700a","#006f0b","#006e0c","#006c0d","#006a0e","#00690f","#006810","#006611","#006412","#006313","#006214","#006015","#005e16","#005d17","#005c18","#005a19","#00581a","#00571b","#00561c","#00541d","#00521e","#00511f","#005020","#004e21","#004c22","#004b23","#004a24","#004825","#004626","#004527","#004428","#004229","#00402a","#003f2b","#003e2c","#003c2d","#003b2e","#00392f","#003830","#003631","#003432","#003333","#003134","#003035","#002f36","#002d37","#002c38","#002a39","#00283a","#00273b","#00263c","#00243d","#00233e","#00213f","#002040","#001e41","#001d42","#001b43","#001944","#001845","#001646","#001547","#001448","#001249","#00114a","#000f4b","#000e4c","#000c4d","#000a4e","#00094f","#000850","#000651","#000552","#000353","#000154","#000055","#000156","#000357","#000458","#000659","#00075a","#00095b","#000a5c","#000c5d","#000e5e","#000f5f","#001060","#001261","#001362","#001563","#001764","#001865","#001a66","#001b67","#001d68","#001e69","#00206a","#00216b","#00226c","#00246d","#00266e","#00276f","#002870","#002a71","#002b72","#002d73","#002f74","#003075","#003176","#003377","#003478","#003679","#00377a","#00397b","#003a7c","#003c7d","#003e7e","#003f7f","#004080","#004281","#004382","#004583","#004684","#004885","#004a86","#004b87","#004d88","#004e89","#00508a","#00518b","#00538c","#00548d","#00568e","#00578f","#005890","#005a91","#005b92","#005d93","#005e94","#006095","#006296","#006397","#006498","#006699","#00679a","#00699b","#006b9c","#006c9d","#006e9e","#006f9f","#0070a0","#0072a1","#0073a2","#0075a3","#0076a4","#0078a5","#007aa6","#007ba7","#007da8","#007ea9","#0080aa","#0381ab","#0682ac","#0984ad","#0c85ae","#0f87af","#1288b0","#158ab1","#188bb2","#1b8db3","#1e8eb4","#2190b5","#2492b6","#2793b7","#2a94b8","#2d96b9","#3097ba","#3399bb","#369bbc","#399cbd","#3c9ebe","#3f9fbf","#42a0c0","#45a2c1","#48a3c2","#4ba5c3","#4ea6c4","#51a8c5","#54aac6","#57abc7","#5aacc8","#5daec9","#60b0ca","#63b1cb","#66b3cc","#69b4cd","#6cb6ce","#6fb7cf","#72b9d0","#75bad1","#78bcd2","#7bbdd3","#7ebed4","#81c0d5","#84c2d6","#87c3d7","#8ac4d8","#8dc6d9","#90c7da","#93c9db","#96cbdc","#99ccdd","#9ccede","#9fcfdf","#a2d0e0","#a5d2e1","#a8d3e2","#abd5e3","#aed6e4","#b1d8e5","#b4dae6","#b7dbe7","#badce8","#bddee9","#c0e0ea","#c3e1eb","#c6e2ec","#c9e4ed","#cce5ee","#cfe7ef","#d2e8f0","#d5eaf1","#d8ebf2","#dbedf3","#deeef4","#e1f0f5","#e4f2f6","#e7f3f7","#eaf4f8","#edf6f9","#f0f7fa","#f3f9fb","#f6fbfc","#f9fcfd","#fcfefe","#ffffff"],c.ocean_r=["#ffffff","#fcfefe","#f9fcfd","#f6fbfc","#f3f9fb","#f0f7fa","#edf6f9","#eaf4f8","#e7f3f7","#e4f2f6","#e1f0f5","#deeef4","#dbedf3","#d8ebf2","#d5eaf1","#d2e8f0","#cfe7ef","#cce5ee","#c9e4ed","#c6e2ec","#c3e1eb","#c0e0ea","#bddee9","#badce8","#b7dbe7","#b4dae6","#b1d8e5","#aed7e4","#abd5e3","#a8d3e2","#a5d2e1","#a2d0e0","#9fcfdf","#9ccede","#99ccdd","#96cbdc","#93c9db","#90c8da","#8dc6d9","#8ac4d8","#87c3d7","#84c2d6","#81c0d5","#7ebed4","#7bbdd3","#78bcd2","#75bad1","#72b9d0","#6fb7cf","#6cb6ce","#69b4cd","#66b3cc","#63b1cb","#60b0ca","#5daec9","#5aacc8","#57abc7","#54aac6","#51a8c5","#4ea6c4","#4ba5c3","#48a3c2","#45a2c1","#42a0c0","#3f9fbf","#3c9ebe","#399cbd","#369bbc","#3399bb","#3098ba","#2d96b9","#2a94b8","#2793b7","#2492b6","#2190b5","#1e8eb4","#1b8db3","#188bb2","#158ab1","#1288b0","#0f87af","#0c85ae","#0984ad","#0682ac","#0381ab","#0080aa","#007ea9","#007da8","#007ba7","#007aa6","#0078a5","#0076a4","#0075a3","#0073a2","#0072a1","#0070a0","#006f9f","#006e9e","#006c9d","#006b9c","#00699b","#00689a","#006699","#006498","#006397","#006296","#006095","#005e94","#005d93","#005b92","#005a91","#005890","#00578f","#00568e","#00548d","#00538c","#00518b","#00508a","#004e89","#004d88","#004b87","#004a86","#004885","#004684","#004583","#004382","#004281","#004080","#003f7f","#003e7e","#003c7d","#003b7c","#00397b","#00377a","#003679","#003478","#003377","#003176","#003075","#002f74","#002d73","#002b72","#002a71","#002870","#00276f","#00266e","#00246d","#00236c","#00216b","#00206a","#001e69","#001d68","#001b67","#001a66","#001865","#001764","#001563","#001362","#001261","#001060","#000f5f","#000e5e","#000c5d","#000b5c","#00095b","#00075a","#000659","#000458","#000357","#000156","#000055","#000154","#000353","#000552","#000651","#000850","#00094f","#000a4e","#000c4d","#000d4c","#000f4b","#00114a","#001249","#001448","#001547","#001646","#001845","#001944","#001b43","#001d42","#001e41","#002040","#00213f","#00223e","#00243d","#00253c","#00273b","#00293a","#002a39","#002c38","#002d37","#002e36","#003035","#003134","#003333","#003532","#003631","#003830","#00392f","#003a2e","#003c2d","#003d2c","#003f2b","#00412a","#004229","#004428","#004527","#004626","#004825","#004924","#004b23","#004d22","#004e21","#005020","#00511f","#00521e","#00541d","#00551c","#00571b","#00591a","#005a19","#005c18","#005d17","#005e16","#006015","#006114","#006313","#006512","#006611","#006810","#00690f","#006a0e","#006c0d","#006d0c","#006f0b","#00710a","#007209","#007408","#007507","#007606","#007805","#007904","#007b03","#007d02","#007e01","#008000"],c.pink=["#1e0000","#230606","#280d0d","#2d1313","#321a1a","#351d1d","#391f1f","#3c2222","#402525","#422727","#452929","#482b2b","#4b2d2d","#4d2f2f","#503131","#523232","#553434","#573636","#593737","#5b3939","#5e3a3a","#603c3c","#623d3d","#643e3e","#664040","#684141","#694242","#6b4444","#6d4545","#6f4646","#714747","#724949","#744a4a","#764b4b","#774c4c","#794d4d","#7b4e4e","#7c4f4f","#7e5050","#7f5151","#815252","#825353","#845454","#855555","#875656","#885757","#8a5858","#8b5959","#8d5a5a","#8e5b5b","#8f5c5c","#915d5d","#925e5e","#935f5f","#956060","#966161","#976262","#996262","#9a6363","#9b6464","#9c6565","#9e6666","#9f6767","#a06767","#a16868","#a36969","#a46a6a","#a56b6b","#a66c6c","#a76c6c","#a96d6d","#aa6e6e","#ab6f6f","#ac6f6f","#ad7070","#ae7171","#af7272","#b17272","#b27373","#b37474","#b47575","#b57575","#b67676","#b77777","#b87777","#b97878","#ba7979","#bb7a7a","#bc7a7a","#bd7b7b","#be7c7c","#c07c7c","#c17d7d","#c27e7e","#c27f7e","#c2817f","#c38280","#c38480","#c48581","#c48782","#c58882","#c58a83","#c68b84","#c68c84","#c68e85","#c78f86","#c79186","#c89287","#c89387","#c99588","#c99689","#c99789","#ca988a","#ca9a8b","#cb9b8b","#cb9c8c","#cb9e8c","#cc9f8d","#cca08e","#cda18e","#cda28f","#cea48f","#cea590","#cea691","#cfa791","#cfa892","#d0aa92","#d0ab93","#d0ac94","#d1ad94","#d1ae95","#d2af95","#d2b096","#d2b296","#d3b397","#d3b497","#d4b598","#d4b699","#d4b799","#d5b89a","#d5b99a","#d6ba9b","#d6bb9b","#d6bc9c","#d7bd9c","#d7be9d","#d8bf9e","#d8c09e","#d8c19f","#d9c29f","#d9c3a0","#dac4a0","#dac5a1","#dac6a1","#dbc7a2","#dbc8a2","#dcc9a3","#dccaa3","#dccba4","#ddcca4","#ddcda5","#ddcea5","#decfa6","#ded0a6","#dfd1a7","#dfd2a7","#dfd3a8","#e0d4a8","#e0d5a9","#e1d6a9","#e1d7aa","#e1d8aa","#e2d8ab","#e2d9ab","#e2daac","#e3dbac","#e3dcad","#e4ddad","#e4deae","#e4dfae","#e5e0af","#e5e0af","#e5e1b0","#e6e2b0","#e6e3b1","#e6e4b1","#e7e5b2","#e7e6b2","#e8e7b3","#e8e7b3","#e8e8b4","#e9e9b5","#e9e9b6","#e9e9b8","#eaeab9","#eaeaba","#ebebbc","#ebebbd","#ebebbe","#ececc0","#ececc1","#ececc2","#ededc4","#ededc5","#ededc6","#eeeec7","#eeeec9","#eeeeca","#efefcb","#efefcc","#f0f0ce","#f0f0cf","#f0f0d0","#f1f1d1","#f1f1d3","#f1f1d4","#f2f2d5","#f2f2d6","#f2f2d7","#f3f3d8","#f3f3da","#f3f3db","#f4f4dc","#f4f4dd","#f4f4de","#f5f5df","#f5f5e0","#f5f5e2","#f6f6e3","#f6f6e4","#f7f7e5","#f7f7e6","#f7f7e7","#f8f8e8","#f8f8e9","#f8f8ea","#f9f9eb","#f9f9ed","#f9f9ee","#fafaef","#fafaf0","#fafaf1","#fbfbf2","#fbfbf3","#fbfbf4","#fcfcf5","#fcfcf6","#fcfcf7","#fdfdf8","#fdfdf9","#fdfdfa","#fefefb","#fefefc","#fefefd","#fffffe","#ffffff"],c.pink_r=["#ffffff","#fffffe","#fefefd","#fefefc","#fefefb","#fdfdfa","#fdfdf9","#fdfdf8","#fcfcf7","#fcfcf6","#fcfcf5","#fbfbf4","#fbfbf3","#fbfbf2","#fafaf1","#fafaf0","#fafaef","#f9f9ee","#f9f9ed","#f9f9eb","#f8f8ea","#f8f8e9","#f8f8e8","#f7f7e7","#f7f7e6","#f7f7e5","#f6f6e4","#f6f6e3","#f5f5e2","#f5f5e0","#f5f5df","#f4f4de","#f4f4dd","#f4f4dc","#f3f3db","#f3f3da","#f3f3d8","#f2f2d7","#f2f2d6","#f2f2d5","#f1f1d4","#f1f1d3","#f1f1d1","#f0f0d0","#f0f0cf","#f0f0ce","#efefcc","#efefcb","#eeeeca","#eeeec9","#eeeec7","#ededc6","#ededc5","#ededc4","#ececc2","#ececc1","#ececc0","#ebebbe","#ebebbd","#ebebbc","#eaeaba","#eaeab9","#e9e9b8","#e9e9b6","#e9e9b5","#e8e8b4","#e8e7b3","#e8e7b3","#e7e6b2","#e7e5b2","#e6e4b1","#e6e3b1","#e6e2b0","#e5e1b0","#e5e0af","#e5e0af","#e4dfae","#e4deae","#e4ddad","#e3dcad","#e3dbac","#e2daac","#e2d9ab","#e2d8ab","#e1d8aa","#e1d7aa","#e1d6a9","#e0d5a9","#e0d4a8","#dfd3a8","#dfd2a7","#dfd1a7","#ded0a6","#decfa6","#ddcea5","#ddcda5","#ddcca4","#dccba4","#dccaa3","#dcc9a3","#dbc8a2","#dbc7a2","#dac6a1","#dac5a1","#dac4a0","#d9c3a0","#d9c29f","#d8c19f","#d8c09e","#d8bf9e","#d7be9d","#d7bd9c","#d6bc9c","#d6bb9b","#d6ba9b","#d5b99a","#d5b89a","#d4b799","#d4b699","#d4b598","#d3b497","#d3b397","#d2b296","#d2b096","#d2af95","#d1ae95","#d1ad94","#d0ac94","#d0ab93","#d0aa92","#cfa892","#cfa791","#cea691","#cea590","#cea48f","#cda28f","#cda18e","#cca08e","#cc9f8d","#cb9e8c","#cb9c8c","#cb9b8b","#ca9a8b","#ca988a","#c99789","#c99689","#c99588","#c89387","#c89287","#c79186","#c78f86","#c68e85","#c68c84","#c68b84","#c58a83","#c58882","#c48782","#c48581","#c38480","#c38280","#c2817f","#c27f7e","#c27e7e","#c17d7d","#c07c7c","#be7c7c","#bd7b7b","#bc7a7a","#bb7a7a","#ba7979","#b97878","#b87777","#b77777","#b67676","#b57575","#b47575","#b37474","#b27373","#b17272","#af7272","#ae7171","#ad7070","#ac6f6f","#ab6f6f","#aa6e6e","#a96d6d","#a76c6c","#a66c6c","#a56b6b","#a46a6a","#a36969","#a16868","#a06767","#9f6767","#9e6666","#9c6565","#9b6464","#9a6363","#996262","#976262","#966161","#956060","#935f5f","#925e5e","#915d5d","#8f5c5c","#8e5b5b","#8d5a5a","#8b5959","#8a5858","#885757","#875656","#855555","#845454","#825353","#815252","#7f5151","#7e5050","#7c4f4f","#7b4e4e","#794d4d","#774c4c","#764b4b","#744a4a","#724949","#714747","#6f4646","#6d4545","#6b4444","#694242","#684141","#664040","#643e3e","#623d3d","#603c3c","#5e3a3a","#5b3939","#593737","#573636","#553434","#523232","#503131","#4d2f2f","#4b2d2d","#482b2b","#452929","#422727","#402525","#3c2222","#391f1f","#351d1d","#321a1a","#2d1313","#280d0d","#230606","#1e0000"],c.plasma=["#0d0887","#100788","#130789","#16078a","#19068c","#1b068d","#1d068e","#20068f","#220690","#240691","#260591","#280592","#2a0593","#2c0594","#2e0595","#2f0596","#310597","#330597","#350498","#370499","#38049a","#3a049a","#3c049b","#3e049c","#3f049c","#41049d","#43039e","#44039e","#46039f","#48039f","#4903a0","#4b03a1","#4c02a1","#4e02a2","#5002a2","#5102a3","#5302a3","#5502a4","#5601a4","#5801a4","#5901a5","#5b01a5","#5c01a6","#5e01a6","#6001a6","#6100a7","#6300a7","#6400a7","#6600a7","#6700a8","#6900a8","#6a00a8","#6c00a8","#6e00a8","#6f00a8","#7100a8","#7201a8","#7401a8","#7501a8","#7701a8","#7801a8","#7a02a8","#7b02a8","#7d03a8","#7e03a8","#8004a8","#8104a7","#8305a7","#8405a7","#8606a6","#8707a6","#8808a6","#8a09a5","#8b0aa5","#8d0ba5","#8e0ca4","#8f0da4","#910ea3","#920fa3","#9410a2","#9511a1","#9613a1","#9814a0","#99159f","#9a169f","#9c179e","#9d189d","#9e199d","#a01a9c","#a11b9b","#a21d9a","#a31e9a","#a51f99","#a62098","#a72197","#a82296","#aa2395","#ab2494","#ac2694","#ad2793","#ae2892","#b02991","#b12a90","#b22b8f","#b32c8e","#b42e8d","#b52f8c","#b6308b","#b7318a","#b83289","#ba3388","#bb3488","#bc3587","#bd3786","#be3885","#bf3984","#c03a83","#c13b82","#c23c81","#c33d80","#c43e7f","#c5407e","#c6417d","#c7427c","#c8437b","#c9447a","#ca457a","#cb4679","#cc4778","#cc4977","#cd4a76","#ce4b75","#cf4c74","#d04d73","#d14e72","#d24f71","#d35171","#d45270","#d5536f","#d5546e","#d6556d","#d7566c","#d8576b","#d9586a","#da5a6a","#da5b69","#db5c68","#dc5d67","#dd5e66","#de5f65","#de6164","#df6263","#e06363","#e16462","#e26561","#e26660","#e3685f","#e4695e","#e56a5d","#e56b5d","#e66c5c","#e76e5b","#e76f5a","#e87059","#e97158","#e97257","#ea7457","#eb7556","#eb7655","#ec7754","#ed7953","#ed7a52","#ee7b51","#ef7c51","#ef7e50","#f07f4f","#f0804e","#f1814d","#f1834c","#f2844b","#f3854b","#f3874a","#f48849","#f48948","#f58b47","#f58c46","#f68d45","#f68f44","#f79044","#f79143","#f79342","#f89441","#f89540","#f9973f","#f9983e","#f99a3e","#fa9b3d","#fa9c3c","#fa9e3b","#fb9f3a","#fba139","#fba238","#fca338","#fca537","#fca636","#fca835","#fca934","#fdab33","#fdac33","#fdae32","#fdaf31","#fdb130","#fdb22f","#fdb42f","#fdb52e","#feb72d","#feb82c","#feba2c","#febb2b","#febd2a","#febe2a","#fec029","#fdc229","#fdc328","#fdc527","#fdc627","#fdc827","#fdca26","#fdcb26","#fccd25","#fcce25","#fcd025","#fcd225","#fbd324","#fbd524","#fbd724","#fad824","#fada24","#f9dc24","#f9dd25","#f8df25","#f8e125","#f7e225","#f7e425","#f6e626","#f6e826","#f5e926","#f5eb27","#f4ed27","#f3ee27","#f3f027","#f2f227","#f1f426","#f1f525","#f0f724","#f0f921"],c.plasma_r=["#f0f921","#f0f724","#f1f525","#f1f426","#f2f227","#f3f027","#f3ee27","#f4ed27","#f5eb27","#f5e926","#f6e826","#f6e626","#f7e425","#f7e225","#f8e125","#f8df25","#f9dd25","#f9dc24","#fada24","#fad824","#fbd724","#fbd524","#fbd324","#fcd225","#fcd025","#fcce25","#fccd25","#fdcb26","#fdca26","#fdc827","#fdc627","#fdc527","#fdc328","#fdc229","#fec029","#febe2a","#febd2a","#febb2b","#feba2c","#feb82c","#feb72d","#fdb52e","#fdb42f","#fdb22f","#fdb130","#fdaf31","#fdae32","#fdac33","#fdab33","#fca934","#fca835","#fca636","#fca537","#fca338","#fba238","#fba139","#fb9f3a","#fa9e3b","#fa9c3c","#fa9b3d","#f99a3e","#f9983e","#f9973f","#f89540","#f89441","#f79342","#f79143","#f79044","#f68f44","#f68d45","#f58c46","#f58b47","#f48948","#f48849","#f3874a","#f3854b","#f2844b","#f1834c","#f1814d","#f0804e","#f07f4f","#ef7e50","#ef7c51","#ee7b51","#ed7a52","#ed7953","#ec7754","#eb7655","#eb7556","#ea7457","#e97257","#e97158","#e87059","#e76f5a","#e76e5b","#e66c5c","#e56b5d","#e56a5d","#e4695e","#e3685f","#e26660","#e26561","#e16462","#e06363","#df6263","#de6164","#de5f65","#dd5e66","#dc5d67","#db5c68","#da5b69","#da5a6a","#d9586a","#d8576b","#d7566c","#d6556d","#d5546e","#d5536f","#d45270","#d35171","#d24f71","#d14e72","#d04d73","#cf4c74","#ce4b75","#cd4a76","#cc4977","#cc4778","#cb4679","#ca457a","#c9447a","#c8437b","#c7427c","#c6417d","#c5407e","#c43e7f","#c33d80","#c23c81","#c13b82","#c03a83","#bf3984","#be3885","#bd3786","#bc3587","#bb3488","#ba3388","#b83289","#b7318a","#b6308b","#b52f8c","#b42e8d","#b32c8e","#b22b8f","#b12a90","#b02991","#ae2892","#ad2793","#ac2694","#ab2494","#aa2395","#a82296","#a72197","#a62098","#a51f99","#a31e9a","#a21d9a","#a11b9b","#a01a9c","#9e199d","#9d189d","#9c179e","#9a169f","#99159f","#9814a0","#9613a1","#9511a1","#9410a2","#920fa3","#910ea3","#8f0da4","#8e0ca4","#8d0ba5","#8b0aa5","#8a09a5","#8808a6","#8707a6","#8606a6","#8405a7","#8305a7","#8104a7","#8004a8","#7e03a8","#7d03a8","#7b02a8","#7a02a8","#7801a8","#7701a8","#7501a8","#7401a8","#7201a8","#7100a8","#6f00a8","#6e00a8","#6c00a8","#6a00a8","#6900a8","#6700a8","#6600a7","#6400a7","#6300a7","#6100a7","#6001a6","#5e01a6","#5c01a6","#5b01a5","#5901a5","#5801a4","#5601a4","#5502a4","#5302a3","#5102a3","#5002a2","#4e02a2","#4c02a1","#4b03a1","#4903a0","#48039f","#46039f","#44039e","#43039e","#41049d","#3f049c","#3e049c","#3c049b","#3a049a","#38049a","#370499","#350498","#330597","#310597","#2f0596","#2e0595","#2c0594","#2a0593","#280592","#260591","#240691","#220690","#20068f","#1d068e","#1b068d","#19068c","#16078a","#130789","#100788","#0d0887"],c.prism=["#ff0000","#ff0000","#ff2100","#ff5200","#ff8200","#ffb000","#ffd800","#fff700","#e3ff00","#b2ff00","#81ff00","#53fe00","#2be200","#0bbd39","#00917d","#0061b9","#0030e9","#0001ff","#1a00ff","#3e00ff","#6a00fe","#9a00d7","#cb00a3","#fa0063","#ff001d","#ff0000","#ff0e00","#ff3e00","#ff6f00","#ff9e00","#ffc900","#ffec00","#f5ff00","#c6ff00","#95ff00","#65ff00","#3aef00","#17cd1d","#00a363","#0074a2","#0043d7","#0013fe","#0d00ff","#2e00ff","#5700ff","#8600e9","#b700b9","#e7007e","#ff003a","#ff0000","#ff0000","#ff2a00","#ff5b00","#ff8c00","#ffb900","#ffdf00","#fffc00","#d9ff00","#a9ff00","#78ff00","#4bf900","#24dc00","#06b547","#00878a","#0057c4","#0026f0","#0300ff","#2000ff","#4600ff","#7300f8","#a300ce","#d40097","#ff0056","#ff000f","#ff0000","#ff1700","#ff4800","#ff7900","#ffa700","#ffd000","#fff100","#ecff00","#bcff00","#8bff00","#5cff00","#32e900","#11c52b","#009a70","#006bae","#0039e0","#000aff","#1300ff","#3600ff","#6000ff","#8f00e1","#c100af","#f00071","#ff002c","#ff0000","#ff0500","#ff3400","#ff6500","#ff9500","#ffc100","#ffe500","#ffff00","#d0ff00","#9fff00","#6fff00","#42f400","#1dd50e","#01ac55","#007e96","#004dcd","#001df7","#0800ff","#2700ff","#4e00ff","#7c00f1","#ad00c4","#dd008b","#ff0048","#ff0001","#ff0000","#ff2100","#ff5100","#ff8200","#ffb000","#ffd700","#fff700","#e3ff00","#b3ff00","#82ff00","#54fe00","#2be300","#0bbd39","#00917d","#0061b9","#0030e8","#0001ff","#1900ff","#3e00ff","#6900fe","#9900d8","#ca00a3","#f90064","#ff001e","#ff0000","#ff0e00","#ff3d00","#ff6f00","#ff9e00","#ffc800","#ffeb00","#f6ff00","#c6ff00","#95ff00","#66ff00","#3bef00","#17cd1c","#00a462","#0075a2","#0044d7","#0014fe","#0d00ff","#2e00ff","#5700ff","#8600e9","#b700ba","#e7007e","#ff003a","#ff0000","#ff0000","#ff2a00","#ff5b00","#ff8b00","#ffb800","#ffde00","#fffb00","#daff00","#a9ff00","#78ff00","#4bfa00","#24dc00","#06b546","#008889","#0057c3","#0027f0","#0300ff","#2000ff","#4600ff","#7200f8","#a300cf","#d40097","#ff0056","#ff0010","#ff0000","#ff1700","#ff4700","#ff7800","#ffa700","#ffd000","#fff100","#edff00","#bdff00","#8cff00","#5dff00","#33e900","#11c62a","#009b6f","#006bad","#003ae0","#000bff","#1300ff","#3500ff","#6000ff","#8f00e1","#c000af","#f00071","#ff002c","#ff0000","#ff0500","#ff3300","#ff6500","#ff9400","#ffc000","#ffe500","#ffff00","#d0ff00","#9fff00","#6fff00","#43f500","#1dd50d","#01ad54","#007f95","#004ecd","#001df7","#0800ff","#2600ff","#4e00ff","#7c00f1","#ac00c5","#dd008b","#ff0049","#ff0001","#ff0000","#ff2000","#ff5100","#ff8200","#ffaf00","#ffd700","#fff600","#e4ff00","#b3ff00","#82ff00","#54ff00"],c.prism_r=["#54ff00","#82ff00","#b3ff00","#e4ff00","#fff600","#ffd700","#ffaf00","#ff8200","#ff5100","#ff2000","#ff0000","#ff0001","#ff0049","#dd008b","#ac00c5","#7c00f1","#4e00ff","#2600ff","#0800ff","#001df7","#004ecd","#007f95","#01ad54","#1dd50d","#43f500","#6fff00","#9fff00","#d0ff00","#ffff00","#ffe500","#ffc000","#ff9400","#ff6500","#ff3300","#ff0500","#ff0000","#ff002c","#f00071","#c000af","#8f00e1","#6000ff","#3500ff","#1300ff","#000bff","#003ae0","#006bad","#009b6f","#11c62a","#33e900","#5dff00","#8cff00","#bdff00","#edff00","#fff100","#ffd000","#ffa700","#ff7800","#ff4700","#ff1700","#ff0000","#ff0010","#ff0056","#d40097","#a300cf","#7200f8","#4600ff","#2000ff","#0300ff","#0027f0","#0057c3","#008889","#06b546","#24dc00","#4bfa00","#78ff00","#a9ff00","#daff00","#fffb00","#ffde00","#ffb800","#ff8b00","#ff5b00","#ff2a00","#ff0000","#ff0000","#ff003a","#e7007e","#b700ba","#8600e9","#5700ff","#2e00ff","#0d00ff","#0014fe","#0044d7","#0075a2","#00a462","#17cd1c","#3bef00","#66ff00","#95ff00","#c6ff00","#f6ff00","#ffeb00","#ffc800","#ff9e00","#ff6f00","#ff3d00","#ff0e00","#ff0000","#ff001e","#f90064","#ca00a3","#9900d8","#6900fe","#3e00ff","#1900ff","#0001ff","#0030e8","#0061b9","#00917d","#0bbd39","#2be300","#54fe00","#82ff00","#b3ff00","#e3ff00","#fff700","#ffd700","#ffb000","#ff8200","#ff5100","#ff2100","#ff0000","#ff0001","#ff0048","#dd008b","#ad00c4","#7c00f1","#4e00ff","#2700ff","#0800ff","#001df7","#004dcd","#007e96","#01ac55","#1dd50e","#42f400","#6fff00","#9fff00","#d0ff00","#ffff00","#ffe500","#ffc100","#ff9500","#ff6500","#ff3400","#ff0500","#ff0000","#ff002c","#f00071","#c100af","#8f00e1","#6000ff","#3600ff","#1300ff","#000aff","#0039e0","#006bae","#009a70","#11c52b","#32e900","#5cff00","#8bff00","#bcff00","#ecff00","#fff100","#ffd000","#ffa700","#ff7900","#ff4800","#ff1700","#ff0000","#ff000f","#ff0056","#d40097","#a300ce","#7300f8","#4600ff","#2000ff","#0300ff","#0026f0","#0057c4","#00878a","#06b547","#24dc00","#4bf900","#78ff00","#a9ff00","#d9ff00","#fffc00","#ffdf00","#ffb900","#ff8c00","#ff5b00","#ff2a00","#ff0000","#ff0000","#ff003a","#e7007e","#b700b9","#8600e9","#5700ff","#2e00ff","#0d00ff","#0013fe","#0043d7","#0074a2","#00a363","#17cd1d","#3aef00","#65ff00","#95ff00","#c6ff00","#f5ff00","#ffec00","#ffc900","#ff9e00","#ff6f00","#ff3e00","#ff0e00","#ff0000","#ff001d","#fa0063","#cb00a3","#9a00d7","#6a00fe","#3e00ff","#1a00ff","#0001ff","#0030e9","#0061b9","#00917d","#0bbd39","#2be200","#53fe00","#81ff00","#b2ff00","#e3ff00","#fff700","#ffd800","#ffb000","#ff8200","#ff5200","#ff2100","#ff0000","#ff0000"],c.rainbow=["#8000ff","#7e03ff","#7c06ff","#7a09ff","#780dff","#7610ff","#7413ff","#7216ff","#7019ff","#6e1cff","#6c1fff","#6a22fe","#6826fe","#6629fe","#642cfe","#622ffe","#6032fe","#5e35fe","#5c38fd","#5a3bfd","#583efd","#5641fd","#5444fd","#5247fc","#504afc","#4e4dfc","#4c50fc","#4a53fb","#4856fb","#4659fb","#445cfb","#425ffa","#4062fa","#3e65fa","#3c68f9","#396bf9","#386df9","#3670f8","#3473f8","#3176f8","#3079f7","#2e7bf7","#2c7ef7","#2981f6","#2884f6","#2686f5","#2489f5","#218cf4","#208ef4","#1e91f3","#1c93f3","#1996f3","#1898f2","#169bf2","#149df1","#11a0f1","#10a2f0","#0ea5ef","#0ca7ef","#09a9ee","#08acee","#06aeed","#04b0ed","#01b3ec","#00b5eb","#02b7eb","#04b9ea","#07bbea","#08bee9","#0ac0e8","#0dc2e8","#0fc4e7","#10c6e6","#12c8e6","#14cae5","#17cbe4","#18cde4","#1acfe3","#1dd1e2","#1fd3e1","#20d5e1","#22d6e0","#24d8df","#27dade","#28dbde","#2adddd","#2ddedc","#2fe0db","#30e1da","#32e3da","#34e4d9","#37e6d8","#38e7d7","#3ae8d6","#3dead5","#3febd5","#40ecd4","#42edd3","#44eed2","#46efd1","#48f1d0","#4af2cf","#4df3ce","#4ef3cd","#50f4cc","#52f5cb","#54f6cb","#56f7ca","#58f8c9","#5af8c8","#5df9c7","#5efac6","#60fac5","#62fbc4","#64fbc3","#66fcc2","#68fcc1","#6afdc0","#6dfdbf","#6efebe","#70febc","#72febb","#74feba","#76ffb9","#78ffb8","#7affb7","#7dffb6","#7effb5","#80ffb4","#82ffb3","#84ffb2","#86ffb0","#88ffaf","#8bfeae","#8cfead","#8efeac","#90feab","#92fda9","#94fda8","#96fca7","#99fca6","#9bfba5","#9cfba4","#9efaa2","#a0faa1","#a2f9a0","#a4f89f","#a6f89d","#a8f79c","#abf69b","#acf59a","#aef498","#b0f397","#b2f396","#b4f295","#b6f193","#b9ef92","#bbee91","#bced8f","#beec8e","#c0eb8d","#c2ea8c","#c4e88a","#c6e789","#c8e688","#cbe486","#cce385","#cee184","#d0e082","#d2de81","#d4dd80","#d6db7e","#d9da7d","#dbd87b","#dcd67a","#ded579","#e0d377","#e2d176","#e4cf74","#e6cd73","#e8cb72","#ebca70","#ecc86f","#eec66d","#f0c46c","#f2c26b","#f4c069","#f6be68","#f9bb66","#fbb965","#fcb763","#feb562","#ffb360","#ffb05f","#ffae5e","#ffac5c","#ffa95b","#ffa759","#ffa558","#ffa256","#ffa055","#ff9d53","#ff9b52","#ff9850","#ff964f","#ff934d","#ff914c","#ff8e4a","#ff8c49","#ff8947","#ff8646","#ff8444","#ff8143","#ff7e41","#ff7b40","#ff793e","#ff763d","#ff733b","#ff703a","#ff6d38","#ff6b37","#ff6835","#ff6533","#ff6232","#ff5f30","#ff5c2f","#ff592d","#ff562c","#ff532a","#ff5029","#ff4d27","#ff4a26","#ff4724","#ff4422","#ff4121","#ff3e1f","#ff3b1e","#ff381c","#ff351b","#ff3219","#ff2f18","#ff2c16","#ff2914","#ff2613","#ff2211","#ff1f10","#ff1c0e","#ff190d","#ff160b","#ff1309","#ff1008","#ff0d06","#ff0905","#ff0603","#ff0302","#ff0000"],c.rainbow_r=["#ff0000","#ff0302","#ff0603","#ff0905","#ff0d06","#ff1008","#ff1309","#ff160b","#ff190d","#ff1c0e","#ff1f10","#ff2211","#ff2613","#ff2914","#ff2c16","#ff2f18","#ff3219","#ff351b","#ff381c","#ff3b1e","#ff3e1f","#ff4121","#ff4422","#ff4724","#ff4a26","#ff4d27","#ff5029","#ff532a","#ff562c","#ff592d","#ff5c2f","#ff5f30","#ff6232","#ff6533","#ff6835","#ff6b37","#ff6d38","#ff703a","#ff733b","#ff763d","#ff793e","#ff7b40","#ff7e41","#ff8143","#ff8444","#ff8646","#ff8947","#ff8c49","#ff8e4a","#ff914c","#ff934d","#ff964f","#ff9850","#ff9b52","#ff9d53","#ffa055","#ffa256","#ffa558","#ffa759","#ffa95b","#ffac5c","#ffae5e","#ffb05f","#ffb360","#feb562","#fcb763","#fbb965","#f9bb66","#f7be68","#f5c069","#f2c26b","#f0c46c","#eec66d","#ecc86f","#ebca70","#e8cb72","#e6cd73","#e4cf74","#e2d176","#e0d377","#ded579","#dcd67a","#dbd87b","#d9da7d","#d7db7e","#d5dd7f","#d2de81","#d0e082","#cee184","#cce385","#cbe486","#c8e688","#c6e789","#c4e88a","#c2ea8c","#c0eb8d","#beec8e","#bced8f","#bbee91","#b9ef92","#b7f193","#b5f295","#b2f396","#b0f397","#aef498","#acf59a","#abf69b","#a8f79c","#a6f89d","#a4f89f","#a2f9a0","#a0faa1","#9efaa2","#9cfba4","#9bfba5","#99fca6","#97fca7","#95fda8","#92fda9","#90feab","#8efeac","#8cfead","#8bfeae","#88ffaf","#86ffb0","#84ffb2","#82ffb3","#80ffb4","#7effb5","#7dffb6","#7bffb7","#79ffb8","#77ffb9","#74feba","#72febb","#70febc","#6efebe","#6dfdbf","#6bfdc0","#69fcc1","#66fcc2","#64fbc3","#62fbc4","#60fac5","#5efac6","#5df9c7","#5bf8c8","#59f8c9","#57f7ca","#54f6cb","#52f5cb","#50f4cc","#4ef3cd","#4df3ce","#4bf2cf","#49f1d0","#46efd1","#44eed2","#42edd3","#40ecd4","#3febd5","#3dead5","#3be8d6","#39e7d7","#37e6d8","#34e4d9","#32e3da","#30e1da","#2fe0db","#2ddedc","#2bdddd","#29dbde","#26dade","#24d8df","#22d6e0","#20d5e1","#1fd3e1","#1dd1e2","#1bcfe3","#19cde4","#17cbe4","#14cae5","#12c8e6","#10c6e6","#0fc4e7","#0dc2e8","#0bc0e8","#09bee9","#06bbea","#04b9ea","#02b7eb","#00b5eb","#01b3ec","#03b0ed","#05aeed","#07acee","#09a9ee","#0ca7ef","#0ea5ef","#10a2f0","#11a0f1","#139df1","#159bf2","#1798f2","#1a96f3","#1c93f3","#1e91f3","#208ef4","#218cf4","#2389f5","#2586f5","#2784f6","#2981f6","#2c7ef7","#2e7bf7","#3079f7","#3176f8","#3373f8","#3570f8","#376df9","#3a6bf9","#3c68f9","#3e65fa","#4062fa","#425ffa","#435cfb","#4559fb","#4756fb","#4953fb","#4c50fc","#4e4dfc","#504afc","#5247fc","#5344fd","#5541fd","#573efd","#5a3bfd","#5c38fd","#5e35fe","#6032fe","#622ffe","#632cfe","#6529fe","#6726fe","#6922fe","#6c1fff","#6e1cff","#7019ff","#7216ff","#7313ff","#7510ff","#770dff","#7a09ff","#7c06ff","#7e03ff","#8000ff"],c.seismic=["#00004c","#00004f","#000052","#000055","#000058","#00005a","#00005d","#000060","#000063","#000066","#000068","#00006b","#00006e","#000071","#000074","#000076","#000079","#00007c","#00007f","#000082","#000084","#000087","#00008a","#00008d","#000090","#000092","#000095","#000098","#00009b","#00009e","#0000a0","#0000a3","#0000a6","#0000a9","#0000ac","#0000ae","#0000b1","#0000b4","#0000b7","#0000ba","#0000bc","#0000bf","#0000c2","#0000c5","#0000c8","#0000ca","#0000cd","#0000d0","#0000d3","#0000d6","#0000d8","#0000db","#0000de","#0000e1","#0000e4","#0000e6","#0000e9","#0000ec","#0000ef","#0000f2","#0000f4","#0000f7","#0000fa","#0000fd","#0101ff","#0505ff","#0909ff","#0d0dff","#1111ff","#1515ff","#1919ff","#1d1dff","#2121ff","#2525ff","#2929ff","#2d2dff","#3131ff","#3535ff","#3939ff","#3d3dff","#4141ff","#4545ff","#4949ff","#4d4dff","#5151ff","#5555ff","#5959ff","#5d5dff","#6161ff","#6565ff","#6969ff","#6d6dff","#7171ff","#7575ff","#7979ff","#7d7dff","#8181ff","#8585ff","#8989ff","#8d8dff","#9191ff","#9595ff","#9999ff","#9d9dff","#a1a1ff","#a5a5ff","#a9a9ff","#adadff","#b1b1ff","#b5b5ff","#b9b9ff","#bdbdff","#c1c1ff","#c5c5ff","#c9c9ff","#cdcdff","#d1d1ff","#d5d5ff","#d9d9ff","#ddddff","#e1e1ff","#e5e5ff","#e9e9ff","#ededff","#f1f1ff","#f5f5ff","#f9f9ff","#fdfdff","#fffdfd","#fff9f9","#fff5f5","#fff1f1","#ffeded","#ffe9e9","#ffe5e5","#ffe1e1","#ffdddd","#ffd9d9","#ffd5d5","#ffd1d1","#ffcdcd","#ffc9c9","#ffc5c5","#ffc1c1","#ffbdbd","#ffb9b9","#ffb5b5","#ffb1b1","#ffadad","#ffa9a9","#ffa5a5","#ffa1a1","#ff9d9d","#ff9999","#ff9595","#ff9191","#ff8d8d","#ff8989","#ff8585","#ff8181","#ff7d7d","#ff7979","#ff7575","#ff7171","#ff6d6d","#ff6969","#ff6565","#ff6161","#ff5d5d","#ff5959","#ff5555","#ff5151","#ff4d4d","#ff4949","#ff4545","#ff4141","#ff3d3d","#ff3939","#ff3535","#ff3131","#ff2d2d","#ff2929","#ff2525","#ff2121","#ff1d1d","#ff1919","#ff1515","#ff1111","#ff0d0d","#ff0909","#ff0505","#ff0101","#fe0000","#fc0000","#fa0000","#f80000","#f60000","#f40000","#f20000","#f00000","#ee0000","#ec0000","#ea0000","#e80000","#e60000","#e30000","#e20000","#e00000","#de0000","#dc0000","#da0000","#d80000","#d60000","#d30000","#d20000","#d00000","#ce0000","#cc0000","#ca0000","#c80000","#c60000","#c30000","#c20000","#c00000","#be0000","#bc0000","#ba0000","#b80000","#b60000","#b30000","#b20000","#b00000","#ae0000","#ac0000","#aa0000","#a80000","#a60000","#a30000","#a20000","#a00000","#9e0000","#9c0000","#9a0000","#980000","#960000","#930000","#920000","#900000","#8e0000","#8c0000","#8a0000","#880000","#860000","#840000","#820000","#800000"],c.seismic_r=["#800000","#820000","#840000","#860000","#880000","#8a0000","#8c0000","#8e0000","#900000","#920000","#930000","#960000","#980000","#9a0000","#9c0000","#9e0000","#a00000","#a20000","#a30000","#a60000","#a80000","#aa0000","#ac0000","#ae0000","#b00000","#b20000","#b30000","#b60000","#b80000","#ba0000","#bc0000","#be0000","#c00000","#c20000","#c30000","#c60000","#c80000","#ca0000","#cc0000","#ce0000","#d00000","#d20000","#d30000","#d60000","#d80000","#da0000","#dc0000","#de0000","#e00000","#e20000","#e30000","#e60000","#e80000","#ea0000","#ec0000","#ee0000","#f00000","#f20000","#f30000","#f60000","#f80000","#fa0000","#fc0000","#fe0000","#ff0101","#ff0505","#ff0909","#ff0d0d","#ff1111","#ff1515","#ff1919","#ff1d1d","#ff2121","#ff2525","#ff2929","#ff2d2d","#ff3131","#ff3535","#ff3939","#ff3d3d","#ff4141","#ff4545","#ff4949","#ff4d4d","#ff5151","#ff5555","#ff5959","#ff5d5d","#ff6161","#ff6565","#ff6969","#ff6d6d","#ff7171","#ff7575","#ff7979","#ff7d7d","#ff8181","#ff8585","#ff8989","#ff8d8d","#ff9191","#ff9595","#ff9999","#ff9d9d","#ffa1a1","#ffa5a5","#ffa9a9","#ffadad","#ffb1b1","#ffb5b5","#ffb9b9","#ffbdbd","#ffc1c1","#ffc5c5","#ffc9c9","#ffcdcd","#ffd1d1","#ffd5d5","#ffd9d9","#ffdddd","#ffe1e1","#ffe5e5","#ffe9e9","#ffeded","#fff1f1","#fff5f5","#fff9f9","#fffdfd","#fdfdff","#f9f9ff","#f5f5ff","#f1f1ff","#ededff","#e9e9ff","#e5e5ff","#e1e1ff","#ddddff","#d9d9ff","#d5d5ff","#d1d1ff","#cdcdff","#c9c9ff","#c5c5ff","#c1c1ff","#bdbdff","#b9b9ff","#b5b5ff","#b1b1ff","#adadff","#a9a9ff","#a5a5ff","#a1a1ff","#9d9dff","#9999ff","#9595ff","#9191ff","#8d8dff","#8989ff","#8585ff","#8181ff","#7d7dff","#7979ff","#7575ff","#7171ff","#6d6dff","#6969ff","#6565ff","#6161ff","#5d5dff","#5959ff","#5555ff","#5151ff","#4d4dff","#4949ff","#4545ff","#4141ff","#3d3dff","#3939ff","#3535ff","#3131ff","#2d2dff","#2929ff","#2525ff","#2121ff","#1d1dff","#1919ff","#1515ff","#1111ff","#0d0dff","#0909ff","#0505ff","#0101ff","#0000fd","#0000fa","#0000f7","#0000f4","#0000f2","#0000ef","#0000ec","#0000e9","#0000e6","#0000e4","#0000e1","#0000de","#0000db","#0000d8","#0000d6","#0000d3","#0000d0","#0000cd","#0000cb","#0000c8","#0000c5","#0000c2","#0000bf","#0000bc","#0000ba","#0000b7","#0000b4","#0000b1","#0000ae","#0000ac","#0000a9","#0000a6","#0000a3","#0000a0","#00009e","#00009b","#000098","#000095","#000093","#000090","#00008d","#00008a","#000087","#000084","#000082","#00007f","#00007c","#000079","#000077","#000074","#000071","#00006e","#00006b","#000068","#000066","#000063","#000060","#00005d","#00005b","#000058","#000055","#000052","#00004f","#00004c"],c.spring=["#ff00ff","#ff01fe","#ff02fd","#ff03fc","#ff04fb","#ff05fa","#ff06f9","#ff07f8","#ff08f7","#ff09f6","#ff0af5","#ff0bf4","#ff0cf3","#ff0df2","#ff0ef1","#ff0ff0","#ff10ef","#ff11ee","#ff12ed","#ff13ec","#ff14eb","#ff15ea","#ff16e9","#ff17e8","#ff18e7","#ff19e6","#ff1ae5","#ff1be4","#ff1ce3","#ff1de2","#ff1ee1","#ff1fe0","#ff20df","#ff21de","#ff22dd","#ff23dc","#ff24db","#ff25da","#ff26d9","#ff27d8","#ff28d7","#ff29d6","#ff2ad5","#ff2bd4","#ff2cd3","#ff2dd2","#ff2ed1","#ff2fd0","#ff30cf","#ff31ce","#ff32cd","#ff33cc","#ff34cb","#ff35ca","#ff36c9","#ff37c8","#ff38c7","#ff39c6","#ff3ac5","#ff3bc4","#ff3cc3","#ff3dc2","#ff3ec1","#ff3fc0","#ff40bf","#ff41be","#ff42bd","#ff43bc","#ff44bb","#ff45ba","#ff46b9","#ff47b8","#ff48b7","#ff49b6","#ff4ab5","#ff4bb4","#ff4cb3","#ff4db2","#ff4eb1","#ff4fb0","#ff50af","#ff51ae","#ff52ad","#ff53ac","#ff54ab","#ff55aa","#ff56a9","#ff57a8","#ff58a7","#ff59a6","#ff5aa5","#ff5ba4","#ff5ca3","#ff5da2","#ff5ea1","#ff5fa0","#ff609f","#ff619e","#ff629d","#ff639c","#ff649b","#ff659a","#ff6699","#ff6798","#ff6897","#ff6996","#ff6a95","#ff6b94","#ff6c93","#ff6d92","#ff6e91","#ff6f90","#ff708f","#ff718e","#ff728d","#ff738c","#ff748b","#ff758a","#ff7689","#ff7788","#ff7887","#ff7986","#ff7a85","#ff7b84","#ff7c83","#ff7d82","#ff7e81","#ff7f80","#ff807f","#ff817e","#ff827d","#ff837c","#ff847b","#ff857a","#ff8679","#ff8778","#ff8877","#ff8976","#ff8a75","#ff8b74","#ff8c73","#ff8d72","#ff8e71","#ff8f70","#ff906f","#ff916e","#ff926d","#ff936c","#ff946b","#ff956a","#ff9669","#ff9768","#ff9867","#ff9966","#ff9a65","#ff9b64","#ff9c63","#ff9d62","#ff9e61","#ff9f60","#ffa05f","#ffa15e","#ffa25d","#ffa35c","#ffa45b","#ffa55a","#ffa659","#ffa758","#ffa857","#ffa956","#ffaa55","#ffab54","#ffac53","#ffad52","#ffae51","#ffaf50","#ffb04f","#ffb14e","#ffb24d","#ffb34c","#ffb44b","#ffb54a","#ffb649","#ffb748","#ffb847","#ffb946","#ffba45","#ffbb44","#ffbc43","#ffbd42","#ffbe41","#ffbf40","#ffc03f","#ffc13e","#ffc23d","#ffc33c","#ffc43b","#ffc53a","#ffc639","#ffc738","#ffc837","#ffc936","#ffca35","#ffcb34","#ffcc33","#ffcd32","#ffce31","#ffcf30","#ffd02f","#ffd12e","#ffd22d","#ffd32c","#ffd42b","#ffd52a","#ffd629","#ffd728","#ffd827","#ffd926","#ffda25","#ffdb24","#ffdc23","#ffdd22","#ffde21","#ffdf20","#ffe01f","#ffe11e","#ffe21d","#ffe31c","#ffe41b","#ffe51a","#ffe619","#ffe718","#ffe817","#ffe916","#ffea15","#ffeb14","#ffec13","#ffed12","#ffee11","#ffef10","#fff00f","#fff10e","#fff20d","#fff30c","#fff40b","#fff50a","#fff609","#fff708","#fff807","#fff906","#fffa05","#fffb04","#fffc03","#fffd02","#fffe01","#ffff00"],c.spring_r=["#ffff00","#fffe01","#fffd02","#fffc03","#fffb04","#fffa05","#fff906","#fff807","#fff708","#fff609","#fff50a","#fff40b","#fff30c","#fff20d","#fff10e","#fff00f","#ffef10","#ffee11","#ffed12","#ffec13","#ffeb14","#ffea15","#ffe916","#ffe817","#ffe718","#ffe619","#ffe51a","#ffe41b","#ffe31c","#ffe21d","#ffe11e","#ffe01f","#ffdf20","#ffde21","#ffdd22","#ffdc23","#ffdb24","#ffda25","#ffd926","#ffd827","#ffd728","#ffd629","#ffd52a","#ffd42b","#ffd32c","#ffd22d","#ffd12e","#ffd02f","#ffcf30","#ffce31","#ffcd32","#ffcc33","#ffcb34","#ffca35","#ffc936","#ffc837","#ffc738","#ffc639","#ffc53a","#ffc43b","#ffc33c","#ffc23d","#ffc13e","#ffc03f","#ffbf40","#ffbe41","#ffbd42","#ffbc43","#ffbb44","#ffba45","#ffb946","#ffb847","#ffb748","#ffb649","#ffb54a","#ffb44b","#ffb34c","#ffb24d","#ffb14e","#ffb04f","#ffaf50","#ffae51","#ffad52","#ffac53","#ffab54","#ffaa55","#ffa956","#ffa857","#ffa758","#ffa659","#ffa55a","#ffa45b","#ffa35c","#ffa25d","#ffa15e","#ffa05f","#ff9f60","#ff9e61","#ff9d62","#ff9c63","#ff9b64","#ff9a65","#ff9966","#ff9867","#ff9768","#ff9669","#ff956a","#ff946b","#ff936c","#ff926d","#ff916e","#ff906f","#ff8f70","#ff8e71","#ff8d72","#ff8c73","#ff8b74","#ff8a75","#ff8976","#ff8877","#ff8778","#ff8679","#ff857a","#ff847b","#ff837c","#ff827d","#ff817e","#ff807f","#ff7f80","#ff7e81","#ff7d82","#ff7c83","#ff7b84","#ff7a85","#ff7986","#ff7887","#ff7788","#ff7689","#ff758a","#ff748b","#ff738c","#ff728d","#ff718e","#ff708f","#ff6f90","#ff6e91","#ff6d92","#ff6c93","#ff6b94","#ff6a95","#ff6996","#ff6897","#ff6798","#ff6699","#ff659a","#ff649b","#ff639c","#ff629d","#ff619e","#ff609f","#ff5fa0","#ff5ea1","#ff5da2","#ff5ca3","#ff5ba4","#ff5aa5","#ff59a6","#ff58a7","#ff57a8","#ff56a9","#ff55aa","#ff54ab","#ff53ac","#ff52ad","#ff51ae","#ff50af","#ff4fb0","#ff4eb1","#ff4db2","#ff4cb3","#ff4bb4","#ff4ab5","#ff49b6","#ff48b7","#ff47b8","#ff46b9","#ff45ba","#ff44bb","#ff43bc","#ff42bd","#ff41be","#ff40bf","#ff3fc0","#ff3ec1","#ff3dc2","#ff3cc3","#ff3bc4","#ff3ac5","#ff39c6","#ff38c7","#ff37c8","#ff36c9","#ff35ca","#ff34cb","#ff33cc","#ff32cd","#ff31ce","#ff30cf","#ff2fd0","#ff2ed1","#ff2dd2","#ff2cd3","#ff2bd4","#ff2ad5","#ff29d6","#ff28d7","#ff27d8","#ff26d9","#ff25da","#ff24db","#ff23dc","#ff22dd","#ff21de","#ff20df","#ff1fe0","#ff1ee1","#ff1de2","#ff1ce3","#ff1be4","#ff1ae5","#ff19e6","#ff18e7","#ff17e8","#ff16e9","#ff15ea","#ff14eb","#ff13ec","#ff12ed","#ff11ee","#ff10ef","#ff0ff0","#ff0ef1","#ff0df2","#ff0cf3","#ff0bf4","#ff0af5","#ff09f6","#ff08f7","#ff07f8","#ff06f9","#ff05fa","#ff04fb","#ff03fc","#ff02fd","#ff01fe","#ff00ff"],c.summer=["#008066","#018066","#028066","#038166","#048266","#058266","#068266","#078366","#088466","#098466","#0a8466","#0b8566","#0c8666","#0d8666","#0e8666","#0f8766","#108866","#118866","#128866","#138966","#148a66","#158a66","#168a66","#178b66","#188c66","#198c66","#1a8c66","#1b8d66","#1c8e66","#1d8e66","#1e8e66","#1f8f66","#209066","#219066","#229066","#239166","#249266","#259266","#269266","#279366","#289366","#299466","#2a9466","#2b9566","#2c9666","#2d9666","#2e9666","#2f9766","#309866","#319866","#329866","#339966","#349a66","#359a66","#369a66","#379b66","#389c66","#399c66","#3a9c66","#3b9d66","#3c9e66","#3d9e66","#3e9e66","#3f9f66","#40a066","#41a066","#42a066","#43a166","#44a266","#45a266","#46a266","#47a366","#48a366","#49a466","#4aa466","#4ba566","#4ca666","#4da666","#4ea666","#4fa766","#50a866","#51a866","#52a866","#53a966","#54aa66","#55aa66","#56ab66","#57ab66","#58ac66","#59ac66","#5aac66","#5bad66","#5cae66","#5dae66","#5eae66","#5faf66","#60b066","#61b066","#62b066","#63b166","#64b266","#65b266","#66b266","#67b366","#68b366","#69b466","#6ab466","#6bb566","#6cb666","#6db666","#6eb666","#6fb766","#70b866","#71b866","#72b866","#73b966","#74ba66","#75ba66","#76bb66","#77bb66","#78bc66","#79bc66","#7abc66","#7bbd66","#7cbe66","#7dbe66","#7ebe66","#7fbf66","#80c066","#81c066","#82c066","#83c166","#84c266","#85c266","#86c266","#87c366","#88c366","#89c466","#8ac466","#8bc566","#8cc666","#8dc666","#8ec666","#8fc766","#90c866","#91c866","#92c866","#93c966","#94ca66","#95ca66","#96cb66","#97cb66","#98cc66","#99cc66","#9acc66","#9bcd66","#9cce66","#9dce66","#9ece66","#9fcf66","#a0d066","#a1d066","#a2d066","#a3d166","#a4d266","#a5d266","#a6d266","#a7d366","#a8d366","#a9d466","#aad466","#abd566","#acd666","#add666","#aed666","#afd766","#b0d866","#b1d866","#b2d866","#b3d966","#b4da66","#b5da66","#b6db66","#b7db66","#b8dc66","#b9dc66","#badc66","#bbdd66","#bcde66","#bdde66","#bede66","#bfdf66","#c0e066","#c1e066","#c2e066","#c3e166","#c4e266","#c5e266","#c6e266","#c7e366","#c8e366","#c9e466","#cae466","#cbe566","#cce666","#cde666","#cee666","#cfe766","#d0e866","#d1e866","#d2e866","#d3e966","#d4ea66","#d5ea66","#d6eb66","#d7eb66","#d8ec66","#d9ec66","#daec66","#dbed66","#dcee66","#ddee66","#deee66","#dfef66","#e0f066","#e1f066","#e2f066","#e3f166","#e4f266","#e5f266","#e6f266","#e7f366","#e8f366","#e9f466","#eaf466","#ebf566","#ecf666","#edf666","#eef666","#eff766","#f0f866","#f1f866","#f2f866","#f3f966","#f4fa66","#f5fa66","#f6fb66","#f7fb66","#f8fc66","#f9fc66","#fafc66","#fbfd66","#fcfe66","#fdfe66","#fefe66","#ffff66"],c.summer_r=["#ffff66","#fefe66","#fdfe66","#fcfe66","#fbfd66","#fafc66","#f9fc66","#f8fc66","#f7fb66","#f6fa66","#f5fa66","#f4fa66","#f3f966","#f2f866","#f1f866","#f0f866","#eff766","#eef666","#edf666","#ecf666","#ebf566","#eaf466","#e9f466","#e8f466","#e7f366","#e6f266","#e5f266","#e4f266","#e3f166","#e2f066","#e1f066","#e0f066","#dfef66","#deee66","#ddee66","#dcee66","#dbed66","#daec66","#d9ec66","#d8ec66","#d7eb66","#d6eb66","#d5ea66","#d4ea66","#d3e966","#d2e866","#d1e866","#d0e866","#cfe766","#cee666","#cde666","#cce666","#cbe566","#cae466","#c9e466","#c8e366","#c7e366","#c6e266","#c5e266","#c4e266","#c3e166","#c2e066","#c1e066","#c0e066","#bfdf66","#bede66","#bdde66","#bcde66","#bbdd66","#badc66","#b9dc66","#b8dc66","#b7db66","#b6db66","#b5da66","#b4da66","#b3d966","#b2d866","#b1d866","#b0d866","#afd766","#aed666","#add666","#acd666","#abd566","#aad466","#a9d466","#a8d366","#a7d366","#a6d266","#a5d266","#a4d266","#a3d166","#a2d066","#a1d066","#a0d066","#9fcf66","#9ece66","#9dce66","#9cce66","#9bcd66","#9acc66","#99cc66","#98cc66","#97cb66","#96cb66","#95ca66","#94ca66","#93c966","#92c866","#91c866","#90c866","#8fc766","#8ec666","#8dc666","#8cc666","#8bc566","#8ac466","#89c466","#88c366","#87c366","#86c266","#85c266","#84c266","#83c166","#82c066","#81c066","#80c066","#7fbf66","#7ebe66","#7dbe66","#7cbe66","#7bbd66","#7abc66","#79bc66","#78bc66","#77bb66","#76bb66","#75ba66","#74ba66","#73b966","#72b866","#71b866","#70b866","#6fb766","#6eb666","#6db666","#6cb666","#6bb566","#6ab466","#69b466","#68b366","#67b366","#66b266","#65b266","#64b266","#63b166","#62b066","#61b066","#60b066","#5faf66","#5eae66","#5dae66","#5cae66","#5bad66","#5aac66","#59ac66","#58ac66","#57ab66","#56ab66","#55aa66","#54aa66","#53a966","#52a866","#51a866","#50a866","#4fa766","#4ea666","#4da666","#4ca666","#4ba566","#4aa466","#49a466","#48a366","#47a366","#46a266","#45a266","#44a266","#43a166","#42a066","#41a066","#40a066","#3f9f66","#3e9e66","#3d9e66","#3c9e66","#3b9d66","#3a9c66","#399c66","#389c66","#379b66","#369b66","#359a66","#349a66","#339966","#329866","#319866","#309866","#2f9766","#2e9666","#2d9666","#2c9666","#2b9566","#2a9466","#299466","#289366","#279366","#269266","#259266","#249266","#239166","#229066","#219066","#209066","#1f8f66","#1e8e66","#1d8e66","#1c8e66","#1b8d66","#1a8c66","#198c66","#188c66","#178b66","#168b66","#158a66","#148a66","#138966","#128866","#118866","#108866","#0f8766","#0e8666","#0d8666","#0c8666","#0b8566","#0a8466","#098466","#088466","#078366","#068266","#058266","#048266","#038166","#028066","#018066","#008066"],c.tab10=["#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf"],c.tab10_r=["#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4"],c.tab20=["#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5"],c.tab20_r=["#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#9edae5","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#17becf","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#dbdb8d","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#bcbd22","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#c7c7c7","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#7f7f7f","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#f7b6d2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#e377c2","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#c49c94","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#8c564b","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#c5b0d5","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#9467bd","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#ff9896","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#d62728","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#98df8a","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#2ca02c","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ffbb78","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#ff7f0e","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#aec7e8","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4","#1f77b4"],c.tab20b=["#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6"],c.tab20b_r=["#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#de9ed6","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#ce6dbd","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#a55194","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#7b4173","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#e7969c","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#d6616b","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#ad494a","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#843c39","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7cb94","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#e7ba52","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#bd9e39","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#8c6d31","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#cedb9c","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#b5cf6b","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#8ca252","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#637939","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#9c9ede","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#6b6ecf","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#5254a3","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79","#393b79"],c.tab20c=["#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9"],c.tab20c_r=["#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#d9d9d9","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#bdbdbd","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#969696","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#636363","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#dadaeb","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#bcbddc","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#9e9ac8","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#756bb1","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#c7e9c0","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#a1d99b","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#74c476","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#31a354","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdd0a2","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fdae6b","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#fd8d3c","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#e6550d","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#c6dbef","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#9ecae1","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#6baed6","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd","#3182bd"],c.terrain=["#333399","#32369c","#30389e","#2f3ba1","#2e3ea4","#2c40a6","#2b43a9","#2a46ac","#2848ae","#274bb1","#264eb4","#2450b6","#2353b9","#2256bc","#2058be","#1f5bc1","#1e5ec4","#1c60c6","#1b63c9","#1a66cc","#1868ce","#176bd1","#166ed4","#1470d6","#1373d9","#1276dc","#1078de","#0f7be1","#0e7ee4","#0c80e6","#0b83e9","#0a86ec","#0888ee","#078bf1","#068ef4","#0490f6","#0393f9","#0296fc","#0098fe","#009afa","#009cf4","#009eef","#00a0e8","#00a2e2","#00a4dc","#00a6d7","#00a8d0","#00aacb","#00acc4","#00aebf","#00b0b9","#00b2b2","#00b4ac","#00b6a7","#00b8a0","#00bb9b","#00bc94","#00be8f","#00c088","#00c382","#00c47d","#00c677","#00c970","#00cb6b","#01cc66","#05cd67","#09ce68","#0dcf69","#11cf69","#15d06a","#19d16b","#1dd26c","#21d36d","#25d36d","#29d46e","#2dd56f","#31d670","#35d771","#39d771","#3dd872","#41d973","#45da74","#49db75","#4ddb75","#51dc76","#55dd77","#59de78","#5ddf79","#61df79","#65e07a","#69e17b","#6de27c","#71e37d","#75e37d","#79e47e","#7de57f","#81e680","#85e781","#89e781","#8de882","#91e983","#95ea84","#99eb85","#9deb85","#a1ec86","#a5ed87","#a9ee88","#adef89","#b1ef89","#b5f08a","#b9f18b","#bdf28c","#c1f38d","#c5f38d","#c9f48e","#cdf58f","#d1f690","#d5f791","#d9f791","#ddf892","#e1f993","#e5fa94","#e9fb95","#edfb95","#f1fc96","#f5fd97","#f9fe98","#fdff99","#fefe98","#fcfb97","#faf996","#f8f695","#f6f394","#f4f193","#f2ee92","#f0ec91","#eee990","#ece78f","#eae48e","#e8e28d","#e6df8b","#e4dc8a","#e2da89","#e0d788","#ded587","#dcd286","#dad085","#d8cd84","#d6cb83","#d4c882","#d2c581","#d0c380","#cec07f","#ccbe7d","#cabb7c","#c8b97b","#c6b67a","#c4b379","#c2b178","#c0ae77","#beac76","#bca975","#baa774","#b8a473","#b6a272","#b49f70","#b29c6f","#b09a6e","#ae976d","#ac956c","#aa926b","#a8906a","#a68d69","#a48b68","#a28867","#a08566","#9e8365","#9c8064","#9a7e62","#987b61","#967960","#94765f","#92735e","#90715d","#8e6e5c","#8c6c5b","#8a695a","#886759","#866458","#846257","#825f56","#805c54","#815e56","#836059","#85635c","#87655e","#896861","#8b6b64","#8d6d66","#8f7069","#91726c","#93756e","#957771","#977a74","#997c76","#9b7f79","#9d827c","#9f847e","#a18781","#a38984","#a58c86","#a78e89","#a9918c","#ab938e","#ad9691","#af9994","#b19b96","#b39e99","#b5a09c","#b7a39f","#b9a5a1","#bba8a4","#bdaba7","#bfada9","#c1b0ac","#c3b2af","#c5b5b1","#c7b7b4","#c9bab7","#cbbcb9","#cdbfbc","#cfc2bf","#d1c4c1","#d3c7c4","#d5c9c7","#d7ccc9","#d9cecc","#dbd1cf","#ddd3d1","#dfd6d4","#e1d9d7","#e3dbd9","#e5dedc","#e7e0df","#e9e3e2","#ebe5e4","#ede8e7","#efebea","#f1edec","#f3f0ef","#f5f2f2","#f7f5f4","#f9f7f7","#fbfafa","#fdfcfc","#ffffff"],c.terrain_r=["#ffffff","#fdfcfc","#fbfafa","#f9f7f7","#f7f5f4","#f5f2f2","#f3f0ef","#f1edec","#efebea","#ede8e7","#ebe5e4","#e9e3e2","#e7e0df","#e5dedc","#e3dbd9","#e1d9d7","#dfd6d4","#ddd3d1","#dbd1cf","#d9cecc","#d7ccc9","#d5c9c7","#d3c7c4","#d1c4c1","#cfc2bf","#cdbfbc","#cbbcb9","#c9bab7","#c7b7b4","#c5b5b1","#c3b2af","#c1b0ac","#bfada9","#bdaba7","#bba8a4","#b9a5a1","#b7a39f","#b5a09c","#b39e99","#b19b96","#af9994","#ad9691","#ab938e","#a9918c","#a78e89","#a58c86","#a38984","#a18781","#9f847e","#9d827c","#9b7f79","#997c76","#977a74","#957771","#93756e","#91726c","#8f7069","#8d6d66","#8b6b64","#896861","#87655e","#85635c","#836059","#815e56","#805c54","#825f56","#846257","#866458","#886759","#8a695a","#8c6c5b","#8e6e5c","#90715d","#92735e","#94765f","#967960","#987b61","#9a7e62","#9c8064","#9e8365","#a08566","#a28867","#a48b68","#a68d69","#a8906a","#aa926b","#ac956c","#ae976d","#b09a6e","#b29c6f","#b49f70","#b6a272","#b8a473","#baa774","#bca975","#beac76","#c0ae77","#c2b178","#c4b379","#c6b67a","#c8b97b","#cabb7c","#ccbe7d","#cec07f","#d0c380","#d2c581","#d4c882","#d6cb83","#d8cd84","#dad085","#dcd286","#ded587","#e0d788","#e2da89","#e4dc8a","#e6df8c","#e8e28d","#eae48e","#ece78f","#eee990","#f0ec91","#f2ee92","#f4f193","#f6f394","#f8f695","#faf996","#fcfb97","#fefe98","#fdff99","#f9fe98","#f5fd97","#f1fc96","#edfb95","#e9fb95","#e5fa94","#e1f993","#ddf892","#d9f791","#d5f791","#d1f690","#cdf58f","#c9f48e","#c5f38d","#c1f38d","#bdf28c","#b9f18b","#b5f08a","#b1ef89","#adef89","#a9ee88","#a5ed87","#a1ec86","#9deb85","#99eb85","#95ea84","#91e983","#8de882","#89e781","#85e781","#81e680","#7de57f","#79e47e","#75e37d","#71e37d","#6de27c","#69e17b","#65e07a","#61df79","#5ddf79","#59de78","#55dd77","#51dc76","#4ddb75","#49db75","#45da74","#41d973","#3dd872","#39d771","#35d771","#31d670","#2dd56f","#29d46e","#25d36d","#21d36d","#1dd26c","#19d16b","#15d06a","#11cf69","#0dcf69","#09ce68","#05cd67","#01cc66","#00cb6a","#00c971","#00c676","#00c47d","#00c382","#00c088","#00be8e","#00bc94","#00bb9b","#00b8a0","#00b6a6","#00b4ac","#00b2b2","#00b0b8","#00aebe","#00acc4","#00abcb","#00a8d0","#00a6d7","#00a4dc","#00a3e2","#00a0e8","#009eee","#009cf4","#009afa","#0098fe","#0296fc","#0393f9","#0490f6","#068ef4","#078bf1","#0888ee","#0a86ec","#0b83e9","#0c80e6","#0e7ee4","#0f7be1","#1078de","#1276dc","#1373d9","#1470d6","#166ed4","#176bd1","#1868ce","#1a66cc","#1b63c9","#1c60c6","#1e5ec4","#1f5bc1","#2058be","#2256bc","#2353b9","#2450b6","#264eb4","#274bb1","#2848ae","#2a46ac","#2b43a9","#2c40a6","#2e3ea4","#2f3ba1","#30389e","#32369c","#333399"],c.turbo=["#30123b","#321543","#33184a","#341b51","#351e58","#36215f","#372466","#38276d","#392a73","#3a2d79","#3b2f80","#3c3286","#3d358b","#3e3891","#3f3b97","#3f3e9c","#4040a2","#4143a7","#4146ac","#4249b1","#424bb5","#434eba","#4451bf","#4454c3","#4456c7","#4559cb","#455ccf","#455ed3","#4661d6","#4664da","#4666dd","#4669e0","#466be3","#476ee6","#4771e9","#4773eb","#4776ee","#4778f0","#477bf2","#467df4","#4680f6","#4682f8","#4685fa","#4687fb","#458afc","#458cfd","#448ffe","#4391fe","#4294ff","#4196ff","#4099ff","#3e9bfe","#3d9efe","#3ba0fd","#3aa3fc","#38a5fb","#37a8fa","#35abf8","#33adf7","#31aff5","#2fb2f4","#2eb4f2","#2cb7f0","#2ab9ee","#28bceb","#27bee9","#25c0e7","#23c3e4","#22c5e2","#20c7df","#1fc9dd","#1ecbda","#1ccdd8","#1bd0d5","#1ad2d2","#1ad4d0","#19d5cd","#18d7ca","#18d9c8","#18dbc5","#18ddc2","#18dec0","#18e0bd","#19e2bb","#19e3b9","#1ae4b6","#1ce6b4","#1de7b2","#1fe9af","#20eaac","#22ebaa","#25eca7","#27eea4","#2aefa1","#2cf09e","#2ff19b","#32f298","#35f394","#38f491","#3cf58e","#3ff68a","#43f787","#46f884","#4af880","#4ef97d","#52fa7a","#55fa76","#59fb73","#5dfc6f","#61fc6c","#65fd69","#69fd66","#6dfe62","#71fe5f","#75fe5c","#79fe59","#7dff56","#80ff53","#84ff51","#88ff4e","#8bff4b","#8fff49","#92ff47","#96fe44","#99fe42","#9cfe40","#9ffd3f","#a1fd3d","#a4fc3c","#a7fc3a","#a9fb39","#acfb38","#affa37","#b1f936","#b4f836","#b7f735","#b9f635","#bcf534","#bef434","#c1f334","#c3f134","#c6f034","#c8ef34","#cbed34","#cdec34","#d0ea34","#d2e935","#d4e735","#d7e535","#d9e436","#dbe236","#dde037","#dfdf37","#e1dd37","#e3db38","#e5d938","#e7d739","#e9d539","#ebd339","#ecd13a","#eecf3a","#efcd3a","#f1cb3a","#f2c93a","#f4c73a","#f5c53a","#f6c33a","#f7c13a","#f8be39","#f9bc39","#faba39","#fbb838","#fbb637","#fcb336","#fcb136","#fdae35","#fdac34","#fea933","#fea732","#fea431","#fea130","#fe9e2f","#fe9b2d","#fe992c","#fe962b","#fe932a","#fe9029","#fd8d27","#fd8a26","#fc8725","#fc8423","#fb8122","#fb7e21","#fa7b1f","#f9781e","#f9751d","#f8721c","#f76f1a","#f66c19","#f56918","#f46617","#f36315","#f26014","#f15d13","#f05b12","#ef5811","#ed5510","#ec530f","#eb500e","#ea4e0d","#e84b0c","#e7490c","#e5470b","#e4450a","#e2430a","#e14109","#df3f08","#dd3d08","#dc3b07","#da3907","#d83706","#d63506","#d43305","#d23105","#d02f05","#ce2d04","#cc2b04","#ca2a04","#c82803","#c52603","#c32503","#c12302","#be2102","#bc2002","#b91e02","#b71d02","#b41b01","#b21a01","#af1801","#ac1701","#a91601","#a71401","#a41301","#a11201","#9e1001","#9b0f01","#980e01","#950d01","#920b01","#8e0a01","#8b0902","#880802","#850702","#810602","#7e0502","#7a0403"],c.turbo_r=["#7a0403","#7e0502","#810602","#850702","#880802","#8b0902","#8e0a01","#920b01","#950d01","#980e01","#9b0f01","#9e1001","#a11201","#a41301","#a71401","#a91601","#ac1701","#af1801","#b21a01","#b41b01","#b71d02","#b91e02","#bc2002","#be2102","#c12302","#c32503","#c52603","#c82803","#ca2a04","#cc2b04","#ce2d04","#d02f05","#d23105","#d43305","#d63506","#d83706","#da3907","#dc3b07","#dd3d08","#df3f08","#e14109","#e2430a","#e4450a","#e5470b","#e7490c","#e84b0c","#ea4e0d","#eb500e","#ec530f","#ed5510","#ef5811","#f05b12","#f15d13","#f26014","#f36315","#f46617","#f56918","#f66c19","#f76f1a","#f8721c","#f9751d","#f9781e","#fa7b1f","#fb7e21","#fb8122","#fc8423","#fc8725","#fd8a26","#fd8d27","#fe9029","#fe932a","#fe962b","#fe992c","#fe9b2d","#fe9e2f","#fea130","#fea431","#fea732","#fea933","#fdac34","#fdae35","#fcb136","#fcb336","#fbb637","#fbb838","#faba39","#f9bc39","#f8be39","#f7c13a","#f6c33a","#f5c53a","#f4c73a","#f2c93a","#f1cb3a","#efcd3a","#eecf3a","#ecd13a","#ebd339","#e9d539","#e7d739","#e5d938","#e3db38","#e1dd37","#dfdf37","#dde037","#dbe236","#d9e436","#d7e535","#d4e735","#d2e935","#d0ea34","#cdec34","#cbed34","#c8ef34","#c6f034","#c3f134","#c1f334","#bef434","#bcf534","#b9f635","#b7f735","#b4f836","#b1f936","#affa37","#acfb38","#a9fb39","#a7fc3a","#a4fc3c","#a1fd3d","#9ffd3f","#9cfe40","#99fe42","#96fe44","#92ff47","#8fff49","#8bff4b","#88ff4e","#84ff51","#80ff53","#7dff56","#79fe59","#75fe5c","#71fe5f","#6dfe62","#69fd66","#65fd69","#61fc6c","#5dfc6f","#59fb73","#55fa76","#52fa7a","#4ef97d","#4af880","#46f884","#43f787","#3ff68a","#3cf58e","#38f491","#35f394","#32f298","#2ff19b","#2cf09e","#2aefa1","#27eea4","#25eca7","#22ebaa","#20eaac","#1fe9af","#1de7b2","#1ce6b4","#1ae4b6","#19e3b9","#19e2bb","#18e0bd","#18dec0","#18ddc2","#18dbc5","#18d9c8","#18d7ca","#19d5cd","#1ad4d0","#1ad2d2","#1bd0d5","#1ccdd8","#1ecbda","#1fc9dd","#20c7df","#22c5e2","#23c3e4","#25c0e7","#27bee9","#28bceb","#2ab9ee","#2cb7f0","#2eb4f2","#2fb2f4","#31aff5","#33adf7","#35abf8","#37a8fa","#38a5fb","#3aa3fc","#3ba0fd","#3d9efe","#3e9bfe","#4099ff","#4196ff","#4294ff","#4391fe","#448ffe","#458cfd","#458afc","#4687fb","#4685fa","#4682f8","#4680f6","#467df4","#477bf2","#4778f0","#4776ee","#4773eb","#4771e9","#476ee6","#466be3","#4669e0","#4666dd","#4664da","#4661d6","#455ed3","#455ccf","#4559cb","#4456c7","#4454c3","#4451bf","#434eba","#424bb5","#4249b1","#4146ac","#4143a7","#4040a2","#3f3e9c","#3f3b97","#3e3891","#3d358b","#3c3286","#3b2f80","#3a2d79","#392a73","#38276d","#372466","#36215f","#351e58","#341b51","#33184a","#321543","#30123b"],c.twilight=["#e2d9e2","#e1d9e2","#e0d9e2","#ded9e1","#ddd9e0","#dcd9df","#dad8df","#d8d8de","#d6d7dd","#d4d6dc","#d2d5db","#d0d4d9","#cdd3d8","#cbd2d7","#c8d0d6","#c5cfd5","#c2ced4","#bfccd3","#bccbd1","#b9c9d0","#b6c8cf","#b3c6ce","#b0c5cd","#adc3cd","#aac2cc","#a7c0cb","#a4beca","#a1bdc9","#9ebbc9","#9cb9c8","#99b8c8","#96b6c7","#93b4c6","#92b3c6","#8eb1c5","#8cafc5","#89adc5","#88acc4","#85a9c4","#82a7c3","#80a5c3","#7fa5c3","#7ca2c2","#7aa0c2","#789ec2","#779dc2","#759ac1","#7398c1","#7196c1","#7195c0","#6e92c0","#6d90c0","#6c8ebf","#6b8dbf","#698abf","#6888be","#6786be","#6785be","#6682bd","#657fbd","#647dbc","#647cbc","#6379bb","#6277bb","#6275ba","#6172ba","#6171b9","#606eb8","#606cb8","#6069b7","#6067b6","#5f65b5","#5f62b4","#5f60b4","#5f5fb3","#5f5bb2","#5f59b1","#5f57b0","#5e54ae","#5e52ad","#5e4fac","#5e4dab","#5e4caa","#5e48a8","#5e46a6","#5e43a5","#5d41a3","#5d3ea1","#5d3ca0","#5d3a9e","#5c389d","#5c359a","#5b3298","#5b3095","#5a2e93","#5a2b90","#59298e","#58278b","#58268a","#572385","#562182","#551f7f","#531e7c","#521c79","#511a75","#4f1972","#4f1970","#4c176b","#4b1668","#491564","#471461","#46145e","#44135a","#421257","#411256","#3f1251","#3d114e","#3c114b","#3a1149","#391146","#371144","#361142","#361141","#34113e","#33113c","#32123a","#311339","#301437","#301437","#311337","#331237","#341238","#341238","#361139","#381139","#3a113a","#3b113b","#3d113c","#3f123d","#41123d","#43123e","#461240","#481341","#4a1342","#4d1443","#4f1444","#521545","#541546","#561546","#591648","#5c1749","#5f174a","#61184b","#64194b","#67194c","#691a4d","#6c1b4e","#6f1c4e","#711d4f","#741e4f","#761f4f","#792050","#7b2150","#7e2250","#7f2350","#832550","#852650","#872750","#8a2950","#8c2a50","#8e2c50","#902e50","#922f50","#943150","#963350","#983550","#9a3750","#9c3950","#9e3b50","#a03d50","#a03e50","#a34150","#a54350","#a64550","#a84750","#a94950","#ab4b50","#ac4d51","#ae5051","#af5251","#b15452","#b25652","#b35953","#b55b53","#b65d54","#b75f55","#b86155","#b96456","#ba6657","#bb6958","#bc6b59","#bd6e5a","#be705b","#bf725d","#c0755e","#c1775f","#c27a61","#c27c63","#c37f64","#c48166","#c58468","#c5866a","#c6876b","#c68b6e","#c78e71","#c89073","#c89275","#c99578","#c9977b","#ca9a7d","#ca9c80","#cb9f83","#cca186","#cca389","#cda68c","#cda88f","#ceab92","#cfad96","#cfae97","#d0b29c","#d1b4a0","#d1b6a3","#d2b8a7","#d3baaa","#d4bdad","#d5bfb1","#d6c1b4","#d7c3b8","#d8c5bb","#d8c7be","#d9c9c2","#dacbc5","#dbccc8","#dccecb","#dccfcd","#ddd1d1","#ded3d3","#dfd4d6","#dfd5d8","#e0d6da","#e0d7db","#e1d8dd","#e1d8df","#e2d9e0","#e2d9e1","#e2d9e2"],c.twilight_r=["#e2d9e2","#e2d9e1","#e2d8df","#e1d8de","#e1d7dc","#e0d7da","#e0d6d9","#dfd4d7","#ded3d4","#ded2d2","#ddd0cf","#dccfcd","#dccdca","#dbcbc6","#dacac3","#d9c8c0","#d8c6bd","#d7c4b9","#d6c2b6","#d5c0b3","#d4beaf","#d4bcac","#d3b9a8","#d2b7a5","#d1b5a1","#d0b39e","#d0b09b","#cfae97","#ceac94","#cea991","#cda78e","#cca58b","#cca287","#cca186","#cb9d82","#ca9b7f","#ca997c","#c9977b","#c89477","#c89174","#c78f72","#c78e71","#c68a6d","#c6876b","#c58569","#c58468","#c48065","#c37d63","#c27b62","#c27a61","#c0765f","#c0745d","#bf715c","#be705b","#bd6c5a","#bc6a58","#bb6857","#ba6657","#b96356","#b86155","#b65e54","#b65d54","#b45a53","#b35752","#b15552","#b05351","#af5251","#ad4e51","#ac4c50","#aa4a50","#a94850","#a74650","#a54450","#a44250","#a34150","#a03e50","#9f3c50","#9d3a50","#9b3850","#993650","#973450","#953250","#943150","#912f50","#8f2d50","#8d2b50","#8b2a50","#882850","#862750","#842550","#832550","#7f2350","#7d2150","#7a2050","#781f4f","#751e4f","#721d4f","#701c4e","#6f1c4e","#6b1b4d","#681a4d","#65194c","#63184b","#60184a","#5d1749","#5b1648","#591648","#561546","#531545","#501444","#4e1443","#4b1342","#491341","#471340","#461240","#42123e","#40123d","#3e113c","#3c113b","#3a113a","#39113a","#371139","#361139","#341238","#331237","#321237","#311337","#2f1436","#301338","#31123a","#32123b","#33113d","#34113e","#361141","#371143","#381145","#3a1148","#3b114a","#3d114d","#3e1150","#401253","#411256","#431359","#45135c","#47145f","#481563","#4a1566","#4c1669","#4c176b","#4f1970","#501a74","#511b77","#531d7a","#541e7e","#552081","#562284","#572487","#58268a","#59288d","#592a8f","#5a2d92","#5b2f94","#5b3196","#5c3499","#5c359a","#5c389d","#5d3b9f","#5d3da1","#5d40a2","#5d42a4","#5e45a6","#5e47a7","#5e49a9","#5e4caa","#5e4eab","#5e51ad","#5e53ae","#5f55af","#5f58b0","#5f5ab1","#5f5bb2","#5f5fb3","#5f61b4","#5f64b5","#6066b6","#6068b6","#606ab7","#606db8","#616fb9","#6171b9","#6173ba","#6276ba","#6278bb","#637abb","#647cbc","#647ebc","#657fbd","#6683bd","#6785be","#6887be","#6989be","#6a8bbf","#6b8dbf","#6c8fbf","#6e91c0","#6f93c0","#7195c0","#7297c1","#7499c1","#769bc1","#779dc2","#799fc2","#7aa0c2","#7da3c3","#7fa5c3","#81a6c3","#84a8c4","#86aac4","#88acc4","#8aaec5","#8db0c5","#8fb1c6","#92b3c6","#95b5c7","#97b7c7","#9ab8c8","#9dbac8","#a0bcc9","#a1bdc9","#a6bfca","#a9c1cb","#acc2cc","#afc4cd","#b2c6ce","#b5c7cf","#b8c9d0","#bbcad1","#beccd2","#c1cdd3","#c4ced4","#c7d0d5","#c9d1d7","#ccd2d8","#ced3d9","#d0d4d9","#d3d6db","#d5d6dc","#d7d7dd","#d9d8de","#dbd8df","#dcd9e0","#ded9e1","#dfd9e1","#e0d9e2","#e1d9e2","#e2d9e2"],c.twilight_shifted=["#301437","#311339","#32123a","#33113c","#34113e","#351140","#361142","#371144","#391146","#3a1149","#3c114b","#3d114e","#3f1251","#411254","#421257","#44135a","#46145e","#471461","#491564","#4b1668","#4c176b","#4e186f","#4f1972","#511a75","#521c79","#531e7c","#551f7f","#562182","#572385","#572588","#58278b","#59298e","#5a2b90","#5a2d92","#5b3095","#5b3298","#5c359a","#5c369b","#5d3a9e","#5d3ca0","#5d3ea1","#5d40a2","#5e43a5","#5e46a6","#5e48a8","#5e49a9","#5e4dab","#5e4fac","#5e52ad","#5e53ae","#5f57b0","#5f59b1","#5f5bb2","#5f5db2","#5f60b4","#5f62b4","#5f65b5","#6066b6","#6069b7","#606cb8","#606eb8","#616fb9","#6172ba","#6275ba","#6277bb","#6379bb","#637abb","#647dbc","#657fbd","#6682bd","#6684bd","#6786be","#6888be","#698abf","#6a8bbf","#6c8ebf","#6d90c0","#6e92c0","#7094c0","#7196c1","#7398c1","#759ac1","#769bc1","#789ec2","#7aa0c2","#7ca2c2","#7ea4c3","#80a5c3","#82a7c3","#85a9c4","#86aac4","#89adc5","#8cafc5","#8eb1c5","#91b2c6","#93b4c6","#96b6c7","#99b8c8","#9ab8c8","#9ebbc9","#a1bdc9","#a4beca","#a7c0cb","#aac2cc","#adc3cd","#b0c5cd","#b2c6ce","#b6c8cf","#b9c9d0","#bccbd1","#bfccd3","#c2ced4","#c5cfd5","#c8d0d6","#c9d1d7","#cdd3d8","#d0d4d9","#d2d5db","#d4d6dc","#d6d7dd","#d8d8de","#dad8df","#dbd8df","#ddd9e0","#ded9e1","#e0d9e2","#e1d9e2","#e2d9e2","#e2d9e1","#e2d9e0","#e1d8df","#e1d8dd","#e1d7dc","#e0d6da","#dfd5d8","#dfd4d6","#ded3d3","#ddd1d1","#ddd0ce","#dccecb","#dbccc8","#dacbc5","#d9c9c2","#d8c7be","#d8c5bb","#d7c3b8","#d6c1b4","#d5bfb1","#d4beaf","#d3baaa","#d2b8a7","#d1b6a3","#d1b4a0","#d0b29c","#cfaf99","#cfad96","#ceab92","#cda88f","#cda68c","#cca389","#cca186","#cb9f83","#ca9c80","#ca9a7d","#ca997c","#c99578","#c89275","#c89073","#c78e71","#c68b6e","#c6896c","#c5866a","#c58468","#c48166","#c37f64","#c27c63","#c27a61","#c1775f","#c0755e","#bf725d","#bf715c","#bd6e5a","#bc6b59","#bb6958","#ba6657","#b96456","#b86255","#b75f55","#b65d54","#b55b53","#b35953","#b25652","#b15452","#af5251","#ae5051","#ac4d51","#ac4c50","#a94950","#a84750","#a64550","#a54350","#a34150","#a13f50","#a03d50","#9e3b50","#9c3950","#9a3750","#983550","#963350","#943150","#922f50","#902e50","#8f2d50","#8c2a50","#8a2950","#872750","#852650","#832550","#802350","#7e2250","#7b2150","#792050","#761f4f","#741e4f","#711d4f","#6f1c4e","#6c1b4e","#691a4d","#681a4d","#64194b","#61184b","#5f174a","#5c1749","#591648","#571647","#541546","#521545","#4f1444","#4d1443","#4a1342","#481341","#461240","#43123e","#41123d","#40123d","#3d113c","#3b113b","#3a113a","#381139","#361139","#351138","#341238","#331237","#311337","#301437","#2f1436"],c.twilight_shifted_r=["#2f1436","#311337","#321237","#331237","#341238","#361138","#371139","#39113a","#3a113a","#3c113b","#3e113c","#40123d","#42123e","#44123f","#471340","#491341","#4b1342","#4e1443","#501444","#531545","#561546","#581647","#5b1648","#5d1749","#60184a","#63184b","#65194c","#681a4d","#6b1b4d","#6d1b4e","#701c4e","#721d4f","#751e4f","#761f4f","#7a2050","#7d2150","#7f2350","#802350","#842550","#862750","#882850","#8a2950","#8d2b50","#8f2d50","#912f50","#922f50","#953250","#973450","#993650","#9a3750","#9d3a50","#9f3c50","#a03e50","#a13f50","#a44250","#a54450","#a74650","#a84750","#aa4a50","#ac4c50","#ad4e51","#ae5051","#b05351","#b15552","#b35752","#b45a53","#b55b53","#b65e54","#b86155","#b96356","#ba6557","#bb6857","#bc6a58","#bd6c5a","#bd6e5a","#bf715c","#c0745d","#c0765f","#c17960","#c27b62","#c37d63","#c48065","#c48166","#c58569","#c6876b","#c68a6d","#c78c6f","#c78f72","#c89174","#c89477","#c99578","#ca997c","#ca9b7f","#cb9d82","#cba085","#cca287","#cca58b","#cda78e","#cda88f","#ceac94","#cfae97","#d0b09b","#d0b39e","#d1b5a1","#d2b7a5","#d3b9a8","#d3baaa","#d4beaf","#d5c0b3","#d6c2b6","#d7c4b9","#d8c6bd","#d9c8c0","#dacac3","#dacbc5","#dccdca","#dccfcd","#ddd0cf","#ded2d2","#ded3d4","#dfd4d7","#e0d6d9","#e0d6da","#e1d7dc","#e1d8de","#e2d8df","#e2d9e1","#e2d9e2","#e1d9e2","#e0d9e2","#dfd9e1","#ded9e1","#ddd9e0","#dbd8df","#d9d8de","#d7d7dd","#d5d6dc","#d3d6db","#d1d5da","#ced3d9","#ccd2d8","#c9d1d7","#c7d0d5","#c4ced4","#c1cdd3","#beccd2","#bbcad1","#b8c9d0","#b6c8cf","#b2c6ce","#afc4cd","#acc2cc","#a9c1cb","#a6bfca","#a3beca","#a0bcc9","#9dbac8","#9ab8c8","#97b7c7","#95b5c7","#92b3c6","#8fb1c6","#8db0c5","#8aaec5","#89adc5","#86aac4","#84a8c4","#81a6c3","#7fa5c3","#7da3c3","#7ba1c2","#799fc2","#779dc2","#769bc1","#7499c1","#7297c1","#7195c0","#6f93c0","#6e91c0","#6c8fbf","#6c8ebf","#6a8bbf","#6989be","#6887be","#6785be","#6683bd","#6580bd","#647ebc","#647cbc","#637abb","#6278bb","#6276ba","#6173ba","#6171b9","#616fb9","#606db8","#606cb8","#6068b6","#6066b6","#5f64b5","#5f61b4","#5f5fb3","#5f5db2","#5f5ab1","#5f58b0","#5f55af","#5e53ae","#5e51ad","#5e4eab","#5e4caa","#5e49a9","#5e47a7","#5e46a6","#5d42a4","#5d40a2","#5d3da1","#5d3b9f","#5c389d","#5c369b","#5c3499","#5b3196","#5b2f94","#5a2d92","#592a8f","#59288d","#58268a","#572487","#562284","#562182","#541e7e","#531d7a","#511b77","#501a74","#4f1970","#4d176d","#4c1669","#4a1566","#481563","#47145f","#45135c","#431359","#411256","#401253","#3e1150","#3d114e","#3b114a","#3a1148","#381145","#371143","#361141","#34113f","#33113d","#32123b","#31123a","#301338","#301437"],c.viridis=["#440154","#440256","#450457","#450559","#46075a","#46085c","#460a5d","#460b5e","#470d60","#470e61","#471063","#471164","#471365","#481467","#481668","#481769","#48186a","#481a6c","#481b6d","#481c6e","#481d6f","#481f70","#482071","#482173","#482374","#482475","#482576","#482677","#482878","#482979","#472a7a","#472c7a","#472d7b","#472e7c","#472f7d","#46307e","#46327e","#46337f","#463480","#453581","#453781","#453882","#443983","#443a83","#443b84","#433d84","#433e85","#423f85","#424086","#424186","#414287","#414487","#404588","#404688","#3f4788","#3f4889","#3e4989","#3e4a89","#3e4c8a","#3d4d8a","#3d4e8a","#3c4f8a","#3c508b","#3b518b","#3b528b","#3a538b","#3a548c","#39558c","#39568c","#38588c","#38598c","#375a8c","#375b8d","#365c8d","#365d8d","#355e8d","#355f8d","#34608d","#34618d","#33628d","#33638d","#32648e","#32658e","#31668e","#31678e","#31688e","#30698e","#306a8e","#2f6b8e","#2f6c8e","#2e6d8e","#2e6e8e","#2e6f8e","#2d708e","#2d718e","#2c718e","#2c728e","#2c738e","#2b748e","#2b758e","#2a768e","#2a778e","#2a788e","#29798e","#297a8e","#297b8e","#287c8e","#287d8e","#277e8e","#277f8e","#27808e","#26818e","#26828e","#26828e","#25838e","#25848e","#25858e","#24868e","#24878e","#23888e","#23898e","#238a8d","#228b8d","#228c8d","#228d8d","#218e8d","#218f8d","#21908d","#21918c","#20928c","#20928c","#20938c","#1f948c","#1f958b","#1f968b","#1f978b","#1f988b","#1f998a","#1f9a8a","#1e9b8a","#1e9c89","#1e9d89","#1f9e89","#1f9f88","#1fa088","#1fa188","#1fa187","#1fa287","#20a386","#20a486","#21a585","#21a685","#22a785","#22a884","#23a983","#24aa83","#25ab82","#25ac82","#26ad81","#27ad81","#28ae80","#29af7f","#2ab07f","#2cb17e","#2db27d","#2eb37c","#2fb47c","#31b57b","#32b67a","#34b679","#35b779","#37b878","#38b977","#3aba76","#3bbb75","#3dbc74","#3fbc73","#40bd72","#42be71","#44bf70","#46c06f","#48c16e","#4ac16d","#4cc26c","#4ec36b","#50c46a","#52c569","#54c568","#56c667","#58c765","#5ac864","#5cc863","#5ec962","#60ca60","#63cb5f","#65cb5e","#67cc5c","#69cd5b","#6ccd5a","#6ece58","#70cf57","#73d056","#75d054","#77d153","#7ad151","#7cd250","#7fd34e","#81d34d","#84d44b","#86d549","#89d548","#8bd646","#8ed645","#90d743","#93d741","#95d840","#98d83e","#9bd93c","#9dd93b","#a0da39","#a2da37","#a5db36","#a8db34","#aadc32","#addc30","#b0dd2f","#b2dd2d","#b5de2b","#b8de29","#bade28","#bddf26","#c0df25","#c2df23","#c5e021","#c8e020","#cae11f","#cde11d","#d0e11c","#d2e21b","#d5e21a","#d8e219","#dae319","#dde318","#dfe318","#e2e418","#e5e419","#e7e419","#eae51a","#ece51b","#efe51c","#f1e51d","#f4e61e","#f6e620","#f8e621","#fbe723","#fde725"],c.viridis_r=["#fde725","#fbe723","#f8e621","#f6e620","#f4e61e","#f1e51d","#efe51c","#ece51b","#eae51a","#e7e419","#e5e419","#e2e418","#dfe318","#dde318","#dae319","#d8e219","#d5e21a","#d2e21b","#d0e11c","#cde11d","#cae11f","#c8e020","#c5e021","#c2df23","#c0df25","#bddf26","#bade28","#b8de29","#b5de2b","#b2dd2d","#b0dd2f","#addc30","#aadc32","#a8db34","#a5db36","#a2da37","#a0da39","#9dd93b","#9bd93c","#98d83e","#95d840","#93d741","#90d743","#8ed645","#8bd646","#89d548","#86d549","#84d44b","#81d34d","#7fd34e","#7cd250","#7ad151","#77d153","#75d054","#73d056","#70cf57","#6ece58","#6ccd5a","#69cd5b","#67cc5c","#65cb5e","#63cb5f","#60ca60","#5ec962","#5cc863","#5ac864","#58c765","#56c667","#54c568","#52c569","#50c46a","#4ec36b","#4cc26c","#4ac16d","#48c16e","#46c06f","#44bf70","#42be71","#40bd72","#3fbc73","#3dbc74","#3bbb75","#3aba76","#38b977","#37b878","#35b779","#34b679","#32b67a","#31b57b","#2fb47c","#2eb37c","#2db27d","#2cb17e","#2ab07f","#29af7f","#28ae80","#27ad81","#26ad81","#25ac82","#25ab82","#24aa83","#23a983","#22a884","#22a785","#21a685","#21a585","#20a486","#20a386","#1fa287","#1fa187","#1fa188","#1fa088","#1f9f88","#1f9e89","#1e9d89","#1e9c89","#1e9b8a","#1f9a8a","#1f998a","#1f988b","#1f978b","#1f968b","#1f958b","#1f948c","#20938c","#20928c","#20928c","#21918c","#21908d","#218f8d","#218e8d","#228d8d","#228c8d","#228b8d","#238a8d","#23898e","#23888e","#24878e","#24868e","#25858e","#25848e","#25838e","#26828e","#26828e","#26818e","#27808e","#277f8e","#277e8e","#287d8e","#287c8e","#297b8e","#297a8e","#29798e","#2a788e","#2a778e","#2a768e","#2b758e","#2b748e","#2c738e","#2c728e","#2c718e","#2d718e","#2d708e","#2e6f8e","#2e6e8e","#2e6d8e","#2f6c8e","#2f6b8e","#306a8e","#30698e","#31688e","#31678e","#31668e","#32658e","#32648e","#33638d","#33628d","#34618d","#34608d","#355f8d","#355e8d","#365d8d","#365c8d","#375b8d","#375a8c","#38598c","#38588c","#39568c","#39558c","#3a548c","#3a538b","#3b528b","#3b518b","#3c508b","#3c4f8a","#3d4e8a","#3d4d8a","#3e4c8a","#3e4a89","#3e4989","#3f4889","#3f4788","#404688","#404588","#414487","#414287","#424186","#424086","#423f85","#433e85","#433d84","#443b84","#443a83","#443983","#453882","#453781","#453581","#463480","#46337f","#46327e","#46307e","#472f7d","#472e7c","#472d7b","#472c7a","#472a7a","#482979","#482878","#482677","#482576","#482475","#482374","#482173","#482071","#481f70","#481d6f","#481c6e","#481b6d","#481a6c","#48186a","#481769","#481668","#481467","#471365","#471164","#471063","#470e61","#470d60","#460b5e","#460a5d","#46085c","#46075a","#450559","#450457","#440256","#440154"],c.winter=["#0000ff","#0001fe","#0002fe","#0003fe","#0004fd","#0005fc","#0006fc","#0007fc","#0008fb","#0009fa","#000afa","#000bfa","#000cf9","#000df8","#000ef8","#000ff8","#0010f7","#0011f6","#0012f6","#0013f6","#0014f5","#0015f4","#0016f4","#0017f4","#0018f3","#0019f2","#001af2","#001bf2","#001cf1","#001df0","#001ef0","#001ff0","#0020ef","#0021ee","#0022ee","#0023ee","#0024ed","#0025ec","#0026ec","#0027ec","#0028eb","#0029eb","#002aea","#002bea","#002ce9","#002de8","#002ee8","#002fe8","#0030e7","#0031e6","#0032e6","#0033e6","#0034e5","#0035e4","#0036e4","#0037e3","#0038e3","#0039e2","#003ae2","#003be2","#003ce1","#003de0","#003ee0","#003fe0","#0040df","#0041de","#0042de","#0043de","#0044dd","#0045dc","#0046dc","#0047dc","#0048db","#0049db","#004ada","#004bda","#004cd9","#004dd8","#004ed8","#004fd8","#0050d7","#0051d6","#0052d6","#0053d6","#0054d5","#0055d4","#0056d4","#0057d3","#0058d3","#0059d2","#005ad2","#005bd2","#005cd1","#005dd0","#005ed0","#005fd0","#0060cf","#0061ce","#0062ce","#0063ce","#0064cd","#0065cc","#0066cc","#0067cc","#0068cb","#0069cb","#006aca","#006bca","#006cc9","#006dc8","#006ec8","#006fc8","#0070c7","#0071c6","#0072c6","#0073c6","#0074c5","#0075c4","#0076c4","#0077c3","#0078c3","#0079c2","#007ac2","#007bc2","#007cc1","#007dc0","#007ec0","#007fc0","#0080bf","#0081be","#0082be","#0083be","#0084bd","#0085bc","#0086bc","#0087bc","#0088bb","#0089bb","#008aba","#008bba","#008cb9","#008db8","#008eb8","#008fb8","#0090b7","#0091b6","#0092b6","#0093b6","#0094b5","#0095b4","#0096b4","#0097b3","#0098b3","#0099b2","#009ab2","#009bb2","#009cb1","#009db0","#009eb0","#009fb0","#00a0af","#00a1ae","#00a2ae","#00a3ae","#00a4ad","#00a5ac","#00a6ac","#00a7ac","#00a8ab","#00a9ab","#00aaaa","#00abaa","#00aca9","#00ada8","#00aea8","#00afa8","#00b0a7","#00b1a6","#00b2a6","#00b3a6","#00b4a5","#00b5a4","#00b6a4","#00b7a3","#00b8a3","#00b9a2","#00baa2","#00bba2","#00bca1","#00bda0","#00bea0","#00bfa0","#00c09f","#00c19e","#00c29e","#00c39e","#00c49d","#00c59c","#00c69c","#00c79c","#00c89b","#00c99b","#00ca9a","#00cb9a","#00cc99","#00cd98","#00ce98","#00cf98","#00d097","#00d196","#00d296","#00d396","#00d495","#00d594","#00d694","#00d793","#00d893","#00d992","#00da92","#00db92","#00dc91","#00dd90","#00de90","#00df90","#00e08f","#00e18e","#00e28e","#00e38e","#00e48d","#00e58c","#00e68c","#00e78c","#00e88b","#00e98b","#00ea8a","#00eb8a","#00ec89","#00ed88","#00ee88","#00ef88","#00f087","#00f186","#00f286","#00f386","#00f485","#00f584","#00f684","#00f784","#00f883","#00f982","#00fa82","#00fb82","#00fc81","#00fd80","#00fe80","#00ff80"],c.winter_r=["#00ff80","#00fe80","#00fd80","#00fc81","#00fb82","#00fa82","#00f982","#00f883","#00f784","#00f684","#00f584","#00f485","#00f386","#00f286","#00f186","#00f087","#00ef88","#00ee88","#00ed88","#00ec89","#00eb8a","#00ea8a","#00e98a","#00e88b","#00e78c","#00e68c","#00e58c","#00e48d","#00e38e","#00e28e","#00e18e","#00e08f","#00df90","#00de90","#00dd90","#00dc91","#00db92","#00da92","#00d992","#00d893","#00d793","#00d694","#00d594","#00d495","#00d396","#00d296","#00d196","#00d097","#00cf98","#00ce98","#00cd98","#00cc99","#00cb9a","#00ca9a","#00c99a","#00c89b","#00c79c","#00c69c","#00c59c","#00c49d","#00c39e","#00c29e","#00c19e","#00c09f","#00bfa0","#00bea0","#00bda0","#00bca1","#00bba2","#00baa2","#00b9a2","#00b8a3","#00b7a3","#00b6a4","#00b5a4","#00b4a5","#00b3a6","#00b2a6","#00b1a6","#00b0a7","#00afa8","#00aea8","#00ada8","#00aca9","#00abaa","#00aaaa","#00a9ab","#00a8ab","#00a7ac","#00a6ac","#00a5ac","#00a4ad","#00a3ae","#00a2ae","#00a1ae","#00a0af","#009fb0","#009eb0","#009db0","#009cb1","#009bb2","#009ab2","#0099b2","#0098b3","#0097b3","#0096b4","#0095b4","#0094b5","#0093b6","#0092b6","#0091b6","#0090b7","#008fb8","#008eb8","#008db8","#008cb9","#008bba","#008aba","#0089bb","#0088bb","#0087bc","#0086bc","#0085bc","#0084bd","#0083be","#0082be","#0081be","#0080bf","#007fc0","#007ec0","#007dc0","#007cc1","#007bc2","#007ac2","#0079c2","#0078c3","#0077c3","#0076c4","#0075c4","#0074c5","#0073c6","#0072c6","#0071c6","#0070c7","#006fc8","#006ec8","#006dc8","#006cc9","#006bca","#006aca","#0069cb","#0068cb","#0067cc","#0066cc","#0065cc","#0064cd","#0063ce","#0062ce","#0061ce","#0060cf","#005fd0","#005ed0","#005dd0","#005cd1","#005bd2","#005ad2","#0059d2","#0058d3","#0057d3","#0056d4","#0055d4","#0054d5","#0053d6","#0052d6","#0051d6","#0050d7","#004fd8","#004ed8","#004dd8","#004cd9","#004bda","#004ada","#0049db","#0048db","#0047dc","#0046dc","#0045dc","#0044dd","#0043de","#0042de","#0041de","#0040df","#003fe0","#003ee0","#003de0","#003ce1","#003be2","#003ae2","#0039e2","#0038e3","#0037e3","#0036e4","#0035e4","#0034e5","#0033e6","#0032e6","#0031e6","#0030e7","#002fe8","#002ee8","#002de8","#002ce9","#002bea","#002aea","#0029eb","#0028eb","#0027ec","#0026ec","#0025ec","#0024ed","#0023ee","#0022ee","#0021ee","#0020ef","#001ff0","#001ef0","#001df0","#001cf1","#001bf2","#001af2","#0019f2","#0018f3","#0017f3","#0016f4","#0015f4","#0014f5","#0013f6","#0012f6","#0011f6","#0010f7","#000ff8","#000ef8","#000df8","#000cf9","#000bfa","#000afa","#0009fb","#0008fb","#0007fc","#0006fc","#0005fc","#0004fd","#0003fe","#0002fe","#0001fe","#0000ff"];const i=new Map;function l(f){let e=i.get(f);if(void 0===e){const c=t(f);e=new Uint32Array(c.length);for(let f=0;f<c.length;f++)e[f]=u(c[f]);i.set(f,e)}return e}},
+"cf654208bc": function _(n,r,t,u,A){u(),t.packRGBA=function(n,r,u,A=255){return t.LITTLE_ENDIAN?(A<<24|u<<16|r<<8|n)>>>0:(n<<24|r<<16|u<<8|A)>>>0},t.unpackRGBA=function(n){return t.LITTLE_ENDIAN?[255&n,n>>>8&255,n>>>16&255,n>>>24]:[n>>>24,n>>>16&255,n>>>8&255,255&n]},t.LITTLE_ENDIAN=1==new Uint8Array(new Uint32Array([1]).buffer)[0]},
+"a9c5ef6f34": function _(t,s,r,e,i){e(),r.drawGridQuads=function(t,s,r,e,i,o,h,c){const l=Math.max(0,(r-1)*(e-1));h.reset(l),c.reset(o?0:l);for(let t=0;t<r-1;t++)for(let r=0;r<e-1;r++){const a=t*e+r,l=a+1,d=a+e,_=d+1,p=s[3*a+2],y=s[3*l+2],u=s[3*_+2],f=s[3*d+2],w=(p+y+u+f)/4,A=w>0;if(A||!o&&(p>n.HORIZON_DEPTH||y>n.HORIZON_DEPTH||u>n.HORIZON_DEPTH||f>n.HORIZON_DEPTH)){(A?h:c).push(a,w,i[t*(e-1)+r])}}c.count>0&&a(t,c,c.sort_by_depth(),s,e);a(t,h,null,s,e)};const n=t("688dbd4807"),o=t("cf654208bc");class h{constructor(){this.count=0,this.depth=new Float32Array(0),this.vertex=new Uint32Array(0),this.color=new Uint32Array(0),this.depth_bits=new Uint32Array(0),this.order=new Uint32Array(0),this.keys=new Uint32Array(0),this.order_tmp=new Uint32Array(0),this.keys_tmp=new Uint32Array(0),this.histogram=new Uint32Array(256)}reset(t){this.depth.length<t&&(this.depth=new Float32Array(t),this.depth_bits=new Uint32Array(this.depth.buffer),this.vertex=new Uint32Array(t),this.color=new Uint32Array(t),this.order=new Uint32Array(t),this.keys=new Uint32Array(t),this.order_tmp=new Uint32Array(t),this.keys_tmp=new Uint32Array(t)),this.count=0}push(t,s,r){const e=this.count++;this.vertex[e]=t,this.depth[e]=s,this.color[e]=r}sort_by_depth(){const t=this.count,s=this.depth_bits,r=this.keys,e=this.order;for(let i=0;i<t;i++){const t=s[i];r[i]=2147483648&t?~t>>>0:(2147483648|t)>>>0,e[i]=i}return this.radix_pass(0,r,e,this.keys_tmp,this.order_tmp),this.radix_pass(8,this.keys_tmp,this.order_tmp,r,e),this.radix_pass(16,r,e,this.keys_tmp,this.order_tmp),this.radix_pass(24,this.keys_tmp,this.order_tmp,r,e),e}radix_pass(t,s,r,e,i){const n=this.count,o=this.histogram;o.fill(0);for(let r=0;r<n;r++)o[s[r]>>>t&255]++;let h=0;for(let t=0;t<256;t++){const s=o[t];o[t]=h,h+=s}for(let h=0;h<n;h++){const n=o[s[h]>>>t&255]++;e[n]=s[h],i[n]=r[h]}}}function a(t,s,r,e,i){let n=-1;t.lineWidth=1.1;for(let o=0;o<s.count;o++){const h=null!==r?r[o]:o,a=s.color[h];if(a!=n){const s=l(a);t.fillStyle=s,t.strokeStyle=s,n=a}const c=3*s.vertex[h],d=c+3,_=c+3*i,p=_+3;t.beginPath(),t.moveTo(e[c],e[c+1]),t.lineTo(e[d],e[d+1]),t.lineTo(e[p],e[p+1]),t.lineTo(e[_],e[_+1]),t.closePath(),t.fill(),t.stroke()}}r.QuadBuffer=h,h.__name__="QuadBuffer";const c=new Map;function l(t){let s=c.get(t);if(void 0===s){c.size>=65536&&c.clear();const[r,e,i,n]=(0,o.unpackRGBA)(t);s=255==n?`#${(1<<24|r<<16|e<<8|i).toString(16).slice(1)}`:`rgba(${r},${e},${i},${n/255})`,c.set(t,s)}return s}},
+"c13964bc57": function _(e,t,s,a,r){a();class i{constructor(e){this.frames=new Map,this.max_frames=Math.max(1,e)}get capacity(){return this.max_frames}set capacity(e){for(this.max_frames=Math.max(1,e);this.frames.size>this.max_frames;)this.evict()}get(e){const t=this.frames.get(e);return void 0!==t&&(this.frames.delete(e),this.frames.set(e,t)),t}allocate(e,t){let s;return this.frames.delete(e),this.frames.size>=this.max_frames&&(s=this.evict()),void 0!==s&&s.length==t||(s=new Int32Array(t)),this.frames.set(e,s),s}clear(){this.frames.clear()}evict(){for(const[e,t]of this.frames)return this.frames.delete(e),t}}s.FrameCache=i,i.__name__="FrameCache"},
+"dbd06c3611": function _(t,i,s,h,n){h(),s.rasterizeSphere=function(t,i,s,h,n,a,e,o,l,r,M,c,f,m){t.fill(0);const x=Math.max(0,Math.floor(f-c)),u=Math.min(i,Math.ceil(f+c)),d=Math.max(0,Math.floor(m-c)),p=Math.min(s,Math.ceil(m+c)),_=h.min,g=a-1;for(let s=d;s<p;s++){const a=(m-(s+.5))/c;for(let m=x;m<u;m++){const x=(m+.5-f)/c,u=x*x+a*a;if(u>1)continue;const d=Math.sqrt(1-u),p=d*r+a*M,I=a*r-d*M,b=x*o+p*l,A=p*o-x*l,P=180*Math.asin(Math.max(-1,Math.min(1,I)))/Math.PI;let q=180*-Math.atan2(A,b)/Math.PI;q<_?q+=360:q>=_+360&&(q-=360);const z=n.cell(P),S=h.cell(q);z<0||S<0||(t[s*i+m]=e[z*g+S])}}};class a{constructor(t){this.axis=t,this.n=t.length;const i=t[0],s=t[this.n-1];this.descending=s<i,this.lo=Math.min(i,s),this.hi=Math.max(i,s),this.step=(s-i)/(this.n-1);let h=this.n>=2;for(let i=1;i<this.n&&h;i++)h=Math.abs(t[i]-t[i-1]-this.step)<=1e-4*Math.abs(this.step);this.uniform=h}get min(){return this.lo}cell(t){if(!(t>=this.lo&&t<=this.hi)||this.n<2)return-1;if(this.uniform)return Math.min(this.n-2,Math.floor((t-this.axis[0])/this.step));let i=0,s=this.n-1;for(;s-i>1;){const h=i+s>>1;this.axis[h]<=t!=this.descending?i=h:s=h}return i}}s.AxisIndex=a,a.__name__="AxisIndex"},
+"cb223aef8f": function _(t,a,s,c,e){c();class n{constructor(){this.canvas=document.createElement("canvas"),this.ctx=this.canvas.getContext("2d")}reset(t,a){this.canvas.width!=t||this.canvas.height!=a?(this.canvas.width=t,this.canvas.height=a):this.ctx.clearRect(0,0,t,a)}}s.CanvasLayer=n,n.__name__="CanvasLayer"},
+"6425fa0b99": function _(t,s,i,h,e){h();class a{constructor(t=512,s=64){this.keys=new Map,this.cells=[],this.x=0,this.y=0,this.row_height=0,this.size=t,this.max_size=s,this.canvas=document.createElement("canvas"),this.canvas.width=t,this.canvas.height=t,this.ctx=this.canvas.getContext("2d")}get count(){return this.cells.length/3}clear(){this.keys.clear(),this.cells=[],this.x=this.y=this.row_height=0,this.ctx.clearRect(0,0,this.size,this.size)}get(t,s,i,h){const e=`${t}|${s}|${i}|${h}`,a=this.keys.get(e);if(void 0!==a)return a;const c=Math.ceil(2*(s+h/2))+2;if(c>this.max_size)return this.keys.set(e,-1),-1;if(this.x+c>this.size&&(this.x=0,this.y+=this.row_height,this.row_height=0),this.y+c>this.size)return this.keys.set(e,-1),-1;const r=this.ctx;r.beginPath(),r.arc(this.x+c/2,this.y+c/2,s,0,2*Math.PI),r.fillStyle=t,r.fill(),r.strokeStyle=i,r.lineWidth=h,r.stroke();const n=this.count;return this.cells.push(this.x,this.y,c),this.keys.set(e,n),this.x+=c,this.row_height=Math.max(this.row_height,c),n}draw(t,s,i,h){const e=this.cells,a=e[3*s],c=e[3*s+1],r=e[3*s+2],n=r/2;t.drawImage(this.canvas,a,c,r,r,Math.round(i-n),Math.round(h-n),r,r)}}i.MarkerAtlas=a,a.__name__="MarkerAtlas"},
+"09ec4f0ffb": function _(t,s,e,a,n){a();const h=t("688dbd4807");class i{constructor(t){this.xyz=t;const s=Math.floor(t.length/3),e=[],a=[];let n=-1;for(let h=0;h<=s;h++)h==s||isNaN(t[3*h])?(n>=0&&h-n>1&&(e.push(n),a.push(h)),n=-1):n<0&&(n=h);this.start=new Uint32Array(e),this.end=new Uint32Array(a),this.caps=new Float32Array(5*e.length),this.detail=new Float32Array(s);for(let t=0;t<e.length;t++)this.compute_cap(t),this.compute_detail(e[t],a[t]-1)}get count(){return this.start.length}compute_cap(t){const s=this.xyz;let e=0,a=0,n=0;for(let h=this.start[t];h<this.end[t];h++)e+=s[3*h],a+=s[3*h+1],n+=s[3*h+2];const h=Math.sqrt(e*e+a*a+n*n);let i=-1;if(h>1e-9){e/=h,a/=h,n/=h,i=1;for(let h=this.start[t];h<this.end[t];h++)i=Math.min(i,e*s[3*h]+a*s[3*h+1]+n*s[3*h+2]);i=Math.max(-1,i-1e-5)}const o=5*t;this.caps[o]=e,this.caps[o+1]=a,this.caps[o+2]=n,this.caps[o+3]=i,this.caps[o+4]=Math.sqrt(1-i*i)}compute_detail(t,s){const e=this.xyz,a=this.detail;a[t]=1/0,a[s]=1/0;const n=[t,s,1/0];for(;n.length>0;){const t=n.pop(),s=n.pop(),h=n.pop();if(s-h<2)continue;const i=e[3*h],o=e[3*h+1],c=e[3*h+2],r=e[3*s],l=e[3*s+1],p=e[3*s+2];let u=o*p-c*l,f=c*r-i*p,M=i*l-o*r;const _=Math.sqrt(u*u+f*f+M*M),d=_<1e-9;d||(u/=_,f/=_,M/=_);let m=-1,y=h+1;for(let t=h+1;t<s;t++){const s=e[3*t],a=e[3*t+1],n=e[3*t+2],h=d?Math.sqrt((s-i)**2+(a-o)**2+(n-c)**2):Math.abs(s*u+a*f+n*M);h>m&&(m=h,y=t)}const g=Math.min(m,t);a[y]=g,n.push(h,y,g,y,s,g)}}cap_visible(t,s,e,a){const n=5*t,i=this.caps,o=i[n]*s+i[n+1]*e+i[n+2]*a,c=i[n+3];if(o>=c)return!0;return o*c+Math.sqrt(Math.max(0,1-o*o))*i[n+4]>h.HORIZON_DEPTH}}e.PolylineSet=i,i.__name__="PolylineSet"},
+"ac15b07256": function _(n,t,o,e,s){e(),o.sourceColumns=function(n){const t=new Map;for(const o of n.columns()){const e=n.get_column(o);null!==e&&t.set(o,e)}return new l(n.get_length()??0,t)},o.recordColumns=function(n,t,o=[]){const e=n.length,s=new Map;for(const o of t){const t=new Float64Array(e);let l=!1;for(let s=0;s<e;s++){const e=n[s][o];t[s]=e??NaN,l||(l=null!=e)}l&&s.set(o,t)}for(const t of o){const o=new Array(e);let l=!1;for(let s=0;s<e;s++){const e=n[s][t];o[s]=e,l||(l=void 0!==e)}l&&s.set(t,o)}return new l(e,s)};class l{constructor(n,t){this.length=n,this.columns=t}get(n){return this.columns.get(n)??null}}o.OverlayColumns=l,l.__name__="OverlayColumns"},
+"99ec8252b1": function _(t,n,s,e,o){function h(t,n){if(!(t>1e-6))return 1;const e=Math.ceil(t*Math.sqrt(n/(8*s.ARC_TOLERANCE)));return Math.max(1,Math.min(s.MAX_ARC_SEGMENTS,e))}e(),s.arcRadius=function(t){return 2**Math.ceil(Math.log2(Math.max(t,1)))},s.greatCircleArcs=function(t,n,s){const e=new i;for(let o=0;o<t.length;o++){const r=t[o],i=n[o];let c=NaN,f=NaN,u=NaN;for(let t=0;t<r.length;t++){const[n,o,l]=a(r[t],i[t]);if(t>0){const t=Math.acos(Math.max(-1,Math.min(1,c*n+f*o+u*l))),r=h(t,s),i=Math.sin(t);for(let s=1;s<r;s++){const h=s/r,a=Math.sin((1-h)*t)/i,M=Math.sin(h*t)/i;e.vertex(a*c+M*n,a*f+M*o,a*u+M*l)}}e.vertex(n,o,l),e.knot(),c=n,f=o,u=l}e.end_item()}return e.build(s)},s.trajectoryArcs=function(t,n,s,e){const o=new i,r=t=>1+8e-4*t;for(let i=0;i<t.length;i++){const c=t[i],f=n[i],u=s?.[i]??null,l=t=>null!==u?u[t]:0;for(let t=0;t<c.length;t++){if(t>0){const n=c[t-1],s=f[t-1],i=l(t-1),u=c[t]-n,M=f[t]-s,_=l(t)-i,x=h(Math.hypot(u,M)*Math.PI/180,e*Math.max(r(i),r(i+_)));for(let t=1;t<x;t++){const e=t/x,[h,c,f]=a(n+e*u,s+e*M),l=r(i+e*_);o.vertex(l*h,l*c,l*f)}}const[n,s,i]=a(c[t],f[t]),u=r(l(t));o.vertex(u*n,u*s,u*i),o.knot()}o.end_item()}return o.build(e)},s.ARC_TOLERANCE=.5,s.MAX_ARC_SEGMENTS=256;class r{constructor(t,n,s,e,o){this.radius=t,this.xyz=n,this.offsets=s,this.knots=e,this.knot_offsets=o}get count(){return this.offsets.length-1}}s.ArcSet=r,r.__name__="ArcSet";class i{constructor(){this.xyz=[],this.offsets=[0],this.knots=[],this.knot_offsets=[0]}get vertex_count(){return this.xyz.length/3}vertex(t,n,s){this.xyz.push(t,n,s)}knot(){this.knots.push(this.vertex_count-1)}end_item(){this.offsets.push(this.vertex_count),this.knot_offsets.push(this.knots.length)}build(t){return new r(t,new Float32Array(this.xyz),new Uint32Array(this.offsets),new Uint32Array(this.knots),new Uint32Array(this.knot_offsets))}}function a(t,n){const s=n*Math.PI/180,e=t*Math.PI/180;return[Math.cos(s)*Math.cos(-e),Math.cos(s)*Math.sin(-e),Math.sin(s)]}i.__name__="ArcSetBuilder"},
+"9f21cf95f8": function _(e,t,n,r,o){r(),n.workerRenderingSupported=function(){return"undefined"!=typeof Worker&&"undefined"!=typeof OffscreenCanvas&&"function"==typeof HTMLCanvasElement.prototype.transferControlToOffscreen},n.createRenderWorker=function(e){void 0===a&&(a=URL.createObjectURL(new Blob([f.default.source],{type:"text/javascript"})));const t=e.transferControlToOffscreen(),n=new Worker(a);return n.postMessage({type:"init",canvas:t},[t]),n};const f=e("tslib").__importDefault(e("a8e8c8e130"));let a},
+"a8e8c8e130": function _(t,e,n,r,o){r();n.default={source:'/**\n * Stand-in for BokehJS at the start of the render worker script\n *\n * The worker bundle is built like any extension bundle, so it registers\n * itself with Bokeh.register_plugin(). Inside the worker there is no BokehJS;\n * this provides just enough of it to load the bundle\'s modules and run its\n * entry. The bundle has no external modules, so none are resolved here.\n */\nself.Bokeh = {\n  register_plugin(modules, entry) {\n    const cache = {}\n\n    const require = (id) => {\n      let mod = cache[id]\n      if (mod === undefined) {\n        if (modules[id] === undefined) {\n          throw new Error(`render worker: cannot find module \'${id}\'`)\n        }\n        mod = cache[id] = {exports: {}}\n        const exports = mod.exports\n\n        const __esModule = () => {\n          Object.defineProperty(exports, "__esModule", {value: true})\n        }\n        const __esExport = (name, value) => {\n          Object.defineProperty(exports, name, {enumerable: true, get: () => value})\n        }\n        modules[id].call(exports, require, mod, exports, __esModule, __esExport)\n      }\n      return mod.exports\n    }\n\n    return require(entry)\n  },\n}\n\'use strict\';\n/*!\n * Copyright (c) Anaconda, Inc., and Bokeh Contributors\n * All rights reserved.\n * \n * Redistribution and use in source and binary forms, with or without modification,\n * are permitted provided that the following conditions are met:\n * \n * Redistributions of source code must retain the above copyright notice,\n * this list of conditions and the following disclaimer.\n * \n * Redistributions in binary form must reproduce the above copyright notice,\n * this list of conditions and the following disclaimer in the documentation\n * and/or other materials provided with the distribution.\n * \n * Neither the name of Anaconda nor the names of any contributors\n * may be used to endorse or promote products derived from this software\n * without specific prior written permission.\n * \n * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"\n * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE\n * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE\n * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE\n * LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR\n * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF\n * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS\n * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN\n * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)\n * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF\n * THE POSSIBILITY OF SUCH DAMAGE.\n */\n(function(root, factory) {\n  factory(root["Bokeh"], undefined);\n})(this, function(Bokeh, version) {\n  let define;\n  return (function(modules, entry, aliases, externals) {\n    const bokeh = typeof Bokeh !== "undefined" ? (version != null ? Bokeh[version] : Bokeh) : null;\n    if (bokeh != null) {\n      return bokeh.register_plugin(modules, entry, aliases);\n    } else {\n      throw new Error("Cannot find Bokeh" + (version != null ? " " + version : "") + ". You have to load it prior to loading plugins.");\n    }\n  })\n({\n"1b4abce553": function _(e,t,n,a,c){a();const l=e("688dbd4807"),s=e("a9c5ef6f34");let i,r=null,o=0,u=0,d=new Float32Array(0),f=new Uint32Array(0);const h=new s.QuadBuffer,g=new s.QuadBuffer;let w=null;function _(){const e=w;if(w=null,null===e||null===r)return;const{width:t,height:n,backface_culling:a}=e,c=r.canvas;c.width!=t||c.height!=n?(c.width=t,c.height=n):r.clearRect(0,0,t,n);const _=Math.max(0,(o-1)*(u-1));if(f.length!=_||d.length!=3*o*u)return;const{cos_angle:b,sin_angle:m,cos_tilt:y,sin_tilt:k,scale:x,cx:Q,cy:p}=e.camera;i=(0,l.projectUnitVectors)(d,b,m,y,k,x,Q,p,i),(0,s.drawGridQuads)(r,i,o,u,f,a,h,g)}self.onmessage=e=>{const t=e.data;switch(t.type){case"init":r=t.canvas.getContext("2d");break;case"grid":o=t.n_lat,u=t.n_lon,d=t.xyz;break;case"colors":f=t.cell_rgba;break;case"frame":null===w&&setTimeout(_,0),w=t}}},\n"688dbd4807": function _(t,n,a,e,r){function o(t,n){const a=t*Math.PI/180,e=n*Math.PI/180;let r=e;for(let t=0;t<10;t++){const t=-(r+Math.sin(r)-Math.PI*Math.sin(e))/(1+Math.cos(r));if(r+=t,Math.abs(t)<1e-6)break}return{x:2*Math.sqrt(2)/Math.PI*a*Math.cos(r/2),y:Math.sqrt(2)*Math.sin(r/2)}}function c(t,n){const a=t*Math.PI/180,e=n*Math.PI/180,r=e*e,o=r*r;return{x:a*(.8707+r*(r*(o*r*(.003971+-.001529*r)-.013791)-.131979)),y:e*(1.007226+r*(.015085+o*(.028874*r-.044475+-.005916*o)))}}function h(t,n){const a=[1,.9986,.9954,.99,.9822,.973,.96,.9427,.9216,.8962,.8679,.835,.7986,.7597,.7186,.6732,.6213,.5722,.5322],e=[0,.062,.124,.186,.248,.31,.372,.434,.4958,.5571,.6176,.6769,.7346,.7903,.8435,.8936,.9394,.9761,1],r=t*Math.PI/180;let o=n*Math.PI/180;const c=o<0?-1:1;o=Math.abs(o);const h=180*o/Math.PI,s=Math.floor(h/5),M=Math.min(s,17),i=(h-5*M)/5;return{x:.8487*(a[M]+(a[M+1]-a[M])*i)*r,y:1.3523*(e[M]+(e[M+1]-e[M])*i)*c}}function s(t,n){return{x:t*Math.PI/180,y:n*Math.PI/180}}e(),a.projectSphere=function(t,n,e,r,o,c){const h=n*Math.PI/180,s=t*Math.PI/180,M=Math.cos(h)*Math.cos(-s),i=Math.cos(h)*Math.sin(-s),u=Math.sin(h),l=M*r+i*e,P=l*o-u*c;return{x:M*e-i*r,y:l*c+u*o,depth:P,visible:P>a.HORIZON_DEPTH}},a.unprojectSphere=function(t,n,a,e,r,o){const c=t*t+n*n;if(!(c<=1))return null;const h=Math.sqrt(1-c),s=h*r+n*o,M=n*r-h*o,i=t*a+s*e,u=s*a-t*e;return{lon:180*-Math.atan2(u,i)/Math.PI,lat:180*Math.asin(Math.max(-1,Math.min(1,M)))/Math.PI}},a.unitVectors=function(t,n){const a=t.length,e=new Float32Array(3*a);for(let r=0;r<a;r++){const a=t[r],o=n[r];if(null===a||null===o){e[3*r]=e[3*r+1]=e[3*r+2]=NaN;continue}const c=o*Math.PI/180,h=a*Math.PI/180;e[3*r]=Math.cos(c)*Math.cos(-h),e[3*r+1]=Math.cos(c)*Math.sin(-h),e[3*r+2]=Math.sin(c)}return e},a.projectUnitVectors=function(t,n,a,e,r,o,c,h,s){const M=void 0!==s&&s.length==t.length?s:new Float32Array(t.length);for(let s=0;s<t.length;s+=3){const i=t[s],u=t[s+1],l=t[s+2],P=i*n-u*a,f=i*a+u*n;M[s]=c+P*o,M[s+1]=h-(f*r+l*e)*o,M[s+2]=f*e-l*r}return M},a.projectMollweide=o,a.projectNaturalEarth=c,a.projectRobinson=h,a.projectPlateCarree=s,a.getProjection=function(t){switch(t){case"mollweide":return o;case"natural_earth":default:return c;case"robinson":return h;case"plate_carree":return s}},a.getProjectionScale=function(t,n,a){const e=Math.min(n,a);switch(t){case"mollweide":return e/4;case"robinson":return e/3.8;default:return e/3.5}},a.HORIZON_DEPTH=-.15},\n"a9c5ef6f34": function _(t,s,r,e,i){e(),r.drawGridQuads=function(t,s,r,e,i,o,h,c){const l=Math.max(0,(r-1)*(e-1));h.reset(l),c.reset(o?0:l);for(let t=0;t<r-1;t++)for(let r=0;r<e-1;r++){const a=t*e+r,l=a+1,d=a+e,_=d+1,p=s[3*a+2],y=s[3*l+2],u=s[3*_+2],f=s[3*d+2],w=(p+y+u+f)/4,A=w>0;if(A||!o&&(p>n.HORIZON_DEPTH||y>n.HORIZON_DEPTH||u>n.HORIZON_DEPTH||f>n.HORIZON_DEPTH)){(A?h:c).push(a,w,i[t*(e-1)+r])}}c.count>0&&a(t,c,c.sort_by_depth(),s,e);a(t,h,null,s,e)};const n=t("688dbd4807"),o=t("cf654208bc");class h{constructor(){this.count=0,this.depth=new Float32Array(0),this.vertex=new Uint32Array(0),this.color=new Uint32Array(0),this.depth_bits=new Uint32Array(0),this.order=new Uint32Array(0),this.keys=new Uint32Array(0),this.order_tmp=new Uint32Array(0),this.keys_tmp=new Uint32Array(0),this.histogram=new Uint32Array(256)}reset(t){this.depth.length<t&&(this.depth=new Float32Array(t),this.depth_bits=new Uint32Array(this.depth.buffer),this.vertex=new Uint32Array(t),this.color=new Uint32Array(t),this.order=new Uint32Array(t),this.keys=new Uint32Array(t),this.order_tmp=new Uint32Array(t),this.keys_tmp=new Uint32Array(t)),this.count=0}push(t,s,r){const e=this.count++;this.vertex[e]=t,this.depth[e]=s,this.color[e]=r}sort_by_depth(){const t=this.count,s=this.depth_bits,r=this.keys,e=this.order;for(let i=0;i<t;i++){const t=s[i];r[i]=2147483648&t?~t>>>0:(2147483648|t)>>>0,e[i]=i}return this.radix_pass(0,r,e,this.keys_tmp,this.order_tmp),this.radix_pass(8,this.keys_tmp,this.order_tmp,r,e),this.radix_pass(16,r,e,this.keys_tmp,this.order_tmp),this.radix_pass(24,this.keys_tmp,this.order_tmp,r,e),e}radix_pass(t,s,r,e,i){const n=this.count,o=this.histogram;o.fill(0);for(let r=0;r<n;r++)o[s[r]>>>t&255]++;let h=0;for(let t=0;t<256;t++){const s=o[t];o[t]=h,h+=s}for(let h=0;h<n;h++){const n=o[s[h]>>>t&255]++;e[n]=s[h],i[n]=r[h]}}}function a(t,s,r,e,i){let n=-1;t.lineWidth=1.1;for(let o=0;o<s.count;o++){const h=null!==r?r[o]:o,a=s.color[h];if(a!=n){const s=l(a);t.fillStyle=s,t.strokeStyle=s,n=a}const c=3*s.vertex[h],d=c+3,_=c+3*i,p=_+3;t.beginPath(),t.moveTo(e[c],e[c+1]),t.lineTo(e[d],e[d+1]),t.lineTo(e[p],e[p+1]),t.lineTo(e[_],e[_+1]),t.closePath(),t.fill(),t.stroke()}}r.QuadBuffer=h,h.__name__="QuadBuffer";const c=new Map;function l(t){let s=c.get(t);if(void 0===s){c.size>=65536&&c.clear();const[r,e,i,n]=(0,o.unpackRGBA)(t);s=255==n?`#${(1<<24|r<<16|e<<8|i).toString(16).slice(1)}`:`rgba(${r},${e},${i},${n/255})`,c.set(t,s)}return s}},\n"cf654208bc": function _(n,r,t,u,A){u(),t.packRGBA=function(n,r,u,A=255){return t.LITTLE_ENDIAN?(A<<24|u<<16|r<<8|n)>>>0:(n<<24|r<<16|u<<8|A)>>>0},t.unpackRGBA=function(n){return t.LITTLE_ENDIAN?[255&n,n>>>8&255,n>>>16&255,n>>>24]:[n>>>24,n>>>16&255,n>>>8&255,255&n]},t.LITTLE_ENDIAN=1==new Uint8Array(new Uint32Array([1]).buffer)[0]},\n}, "1b4abce553", {"index":"1b4abce553","projections":"688dbd4807","quads":"a9c5ef6f34","rgba":"cf654208bc"}, {});});\n'}},
+"193df65f18": function _(t,s,n,_,o){var i;_();const e=t("@bokehjs/model"),l=t("b3aec6ae18"),r=t("688dbd4807"),a=t("09ec4f0ffb");class c extends e.Model{constructor(t){super(t)}connect_signals(){super.connect_signals();const{coast_lons:t,coast_lats:s,country_lons:n,country_lats:_}=this.properties;this.on_change([t,s],(()=>{this._coast_lines=void 0})),this.on_change([n,_],(()=>{this._country_lines=void 0}));const{lons:o,lats:i,lon_axis:e,lat_axis:l,lon_start:r,lon_step:a,lat_start:c,lat_step:h,n_lat:d,n_lon:u}=this.properties;this.on_change([o,i,e,l,r,a,c,h,d,u],(()=>{this._grid=void 0,this._grid_xyz=void 0}))}get coast_lines(){return void 0===this._coast_lines&&(this._coast_lines=new a.PolylineSet((0,r.unitVectors)(this.coast_lons,this.coast_lats))),this._coast_lines}get country_lines(){return void 0===this._country_lines&&(this._country_lines=new a.PolylineSet((0,r.unitVectors)(this.country_lons,this.country_lats))),this._country_lines}get grid(){if(void 0===this._grid){const t=(0,l.resolveGrid)(this);this._grid=t.n_lat>0&&t.n_lon>0?t:null}return this._grid}get grid_xyz(){const t=this.grid;return null===t?null:(void 0===this._grid_xyz&&(this._grid_xyz=(0,l.gridUnitVectors)(t)),this._grid_xyz)}}n.SphereGeometry=c,i=c,c.__name__="SphereGeometry",c.__module__="bokeh_gridded_sphere",i.define((({Arrayable:t,Float:s,Int:n,Nullable:_})=>({coast_lons:[t(_(s)),[]],coast_lats:[t(_(s)),[]],country_lons:[t(_(s)),[]],country_lats:[t(_(s)),[]],lons:[t(s),[]],lats:[t(s),[]],lon_axis:[t(s),[]],lat_axis:[t(s),[]],lon_start:[s,NaN],lon_step:[s,NaN],lat_start:[s,NaN],lat_step:[s,NaN],n_lat:[n,0],n_lon:[n,0]})))},
+"361c4d1868": function _(t,n,l,o,a){function r(t,n){const l=t>0?Math.ceil((t-1)/n)+1:0,o=new Int32Array(l);for(let a=0;a<l;a++)o[a]=Math.min(a*n,t-1);return o}function e(t,n,l){const{n_lat:o,n_lon:a}=t,e=r(o,l),s=r(a,l),i=e.length,f=s.length,c=l>>1,_=new Float64Array(i*f),h=new Float64Array(i*f);for(let n=0;n<i;n++)for(let l=0;l<f;l++){const o=e[n]*a+s[l];_[n*f+l]=t.lons[o],h[n*f+l]=t.lats[o]}let u=null,y=null;if(null!==t.lon_axis&&null!==t.lat_axis){u=new Float64Array(f),y=new Float64Array(i);for(let n=0;n<f;n++)u[n]=t.lon_axis[s[n]];for(let n=0;n<i;n++)y[n]=t.lat_axis[e[n]]}const M=new Float64Array(o*f),A=new Float64Array(o*f),m=Math.min(n.length,o*a);for(let t=0;t<o;t++)for(let l=0;l<f;l++){const o=Math.max(0,s[l]-c),r=Math.min(a-1,s[l]+c);let e=0,i=0;for(let l=o;l<=r;l++){const o=t*a+l,r=o<m?n[o]:NaN;isNaN(r)||(e+=r,i++)}M[t*f+l]=e,A[t*f+l]=i}const w=new Float64Array(i*f);for(let t=0;t<i;t++){const n=Math.max(0,e[t]-c),l=Math.min(o-1,e[t]+c);for(let o=0;o<f;o++){let a=0,r=0;for(let t=n;t<=l;t++)a+=M[t*f+o],r+=A[t*f+o];w[t*f+o]=r>0?a/r:NaN}}return{factor:l,grid:{n_lat:i,n_lon:f,lon_axis:u,lat_axis:y,lons:_,lats:h},values:w}}o(),l.coarsenGrid=e,l.buildLodPyramid=function(t,n,l){const o=Array.from(l).filter((t=>t>=2)).sort(((t,n)=>t-n)),a=[];let r=(t.n_lat-1)*(t.n_lon-1);for(const l of o){const o=Math.floor(l),s=Math.ceil((t.n_lat-1)/o)+1,i=Math.ceil((t.n_lon-1)/o)+1,f=(s-1)*(i-1);s<2||i<2||f>=r||(a.push(e(t,n,o)),r=f)}return a}},
+}, "2e6335d704", {"index":"2e6335d704","gridded_sphere":"63371faa66","projections":"688dbd4807","grid":"b3aec6ae18","spatial":"9d995a1495","palettes":"f96728cb0d","rgba":"cf654208bc","quads":"a9c5ef6f34","frames":"c13964bc57","raster":"dbd06c3611","layers":"cb223aef8f","sprites":"6425fa0b99","polylines":"09ec4f0ffb","columns":"ac15b07256","arcs":"99ec8252b1","offscreen":"9f21cf95f8","dist/render_worker.json":"a8e8c8e130","sphere_geometry":"193df65f18","lod":"361c4d1868"}, {});});
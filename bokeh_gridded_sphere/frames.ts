@@ -0,0 +1,69 @@
+/**
+ * Bounded cache of per-frame cell colors for time-series cubes
+ */
+
+/**
+ * Least-recently-used cache of per-cell palette indices, keyed by frame.
+ *
+ * When the cache is full, the buffer of the evicted frame is handed out
+ * again for the next one, so scrubbing through a long series settles into
+ * a fixed set of buffers instead of allocating per frame.
+ */
+export class FrameCache {
+  private max_frames: number
+  // Map iteration order is insertion order, so the first key is the LRU one
+  private readonly frames = new Map<number, Int32Array>()
+
+  constructor(capacity: number) {
+    this.max_frames = Math.max(1, capacity)
+  }
+
+  get capacity(): number {
+    return this.max_frames
+  }
+
+  set capacity(capacity: number) {
+    this.max_frames = Math.max(1, capacity)
+    while (this.frames.size > this.max_frames) {
+      this.evict()
+    }
+  }
+
+  get(frame: number): Int32Array | undefined {
+    const colors = this.frames.get(frame)
+    if (colors !== undefined) {
+      this.frames.delete(frame)
+      this.frames.set(frame, colors)
+    }
+    return colors
+  }
+
+  /**
+   * Buffer of `length` entries to be filled for `frame`, recycled from the
+   * least recently used frame when the cache is full
+   */
+  allocate(frame: number, length: number): Int32Array {
+    this.frames.delete(frame)
+    let colors: Int32Array | undefined
+    if (this.frames.size >= this.max_frames) {
+      colors = this.evict()
+    }
+    if (colors === undefined || colors.length != length) {
+      colors = new Int32Array(length)
+    }
+    this.frames.set(frame, colors)
+    return colors
+  }
+
+  clear(): void {
+    this.frames.clear()
+  }
+
+  private evict(): Int32Array | undefined {
+    for (const [frame, colors] of this.frames) {
+      this.frames.delete(frame)
+      return colors
+    }
+    return undefined
+  }
+}
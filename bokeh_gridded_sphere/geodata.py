@@ -0,0 +1,69 @@
+"""
+Bundled coastline and country boundary geometry
+
+Each dataset is an ``.npz`` file in the package's ``data`` directory holding
+float32 ``lons``/``lats`` of all vertices and an int32 ``offsets`` array
+where segment ``k`` spans ``offsets[k]:offsets[k + 1]``. Files are only read
+the first time a dataset is requested and then cached for the process.
+"""
+import functools
+import os
+import pathlib
+from importlib import resources
+
+import numpy as np
+
+
+def _data_file(name, directory):
+    if directory is None:
+        return resources.files(__package__) / "data" / (name + ".npz")
+    return pathlib.Path(directory) / (name + ".npz")
+
+
+@functools.lru_cache(maxsize=None)
+def load_polylines(name, directory=None):
+    """Return ``(lons, lats)`` of a dataset, or ``None`` if missing.
+
+    Datasets are read from the package data unless ``directory`` is given.
+    Segments are separated by NaN, which is how the view splits polylines.
+    The arrays are shared by every caller, so they are made read-only.
+    """
+    path = _data_file(name, directory)
+    if not path.is_file():
+        return None
+
+    with path.open("rb") as f, np.load(f) as data:
+        lons, lats, offsets = data["lons"], data["lats"], data["offsets"]
+
+    # One NaN after every segment but the last
+    n_segments = len(offsets) - 1
+    positions = offsets[1:-1] if n_segments > 1 else offsets[:0]
+    result = []
+    for coords in (lons, lats):
+        array = np.insert(coords, positions, np.nan).astype(np.float32)
+        array.setflags(write=False)
+        result.append(array)
+    return tuple(result)
+
+
+def save_polylines(name, lons, lats, directory=None):
+    """Write None/NaN-separated polylines as a dataset.
+
+    Without ``directory`` this writes into the package data, which needs a
+    source checkout.
+    """
+    lons = np.array(lons, dtype=np.float64)
+    lats = np.array(lats, dtype=np.float64)
+    gaps = np.isnan(lons) | np.isnan(lats)
+
+    # Segment boundaries in the compacted arrays, dropping empty segments
+    segment_id = np.cumsum(gaps)[~gaps]
+    starts = np.flatnonzero(np.diff(segment_id, prepend=-1))
+    offsets = np.append(starts, len(segment_id)).astype(np.int32)
+
+    np.savez_compressed(
+        os.fspath(_data_file(name, directory)),
+        lons=lons[~gaps].astype(np.float32),
+        lats=lats[~gaps].astype(np.float32),
+        offsets=offsets,
+    )
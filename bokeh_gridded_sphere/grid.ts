@@ -0,0 +1,255 @@
+/**
+ * Grid definition utilities for gridded sphere data
+ */
+
+import type {Arrayable} from "@bokehjs/core/types"
+import {unitVectors} from "./projections"
+import {ScreenIndex} from "./spatial"
+
+export interface GridSource {
+  lons: Arrayable<number>
+  lats: Arrayable<number>
+  lon_axis: Arrayable<number>
+  lat_axis: Arrayable<number>
+  lon_start: number
+  lon_step: number
+  lat_start: number
+  lat_step: number
+  n_lat: number
+  n_lon: number
+}
+
+export interface Grid {
+  n_lat: number
+  n_lon: number
+  // 1-D axes for regular grids, null for curvilinear grids
+  lon_axis: Arrayable<number> | null
+  lat_axis: Arrayable<number> | null
+  // Per-vertex coordinates, row-major n_lat x n_lon
+  lons: Arrayable<number>
+  lats: Arrayable<number>
+}
+
+/**
+ * Build a regularly spaced axis from start, step and count
+ */
+export function regularAxis(start: number, step: number, count: number): Float64Array {
+  const axis = new Float64Array(count)
+  for (let i = 0; i < count; i++) {
+    axis[i] = start + i * step
+  }
+  return axis
+}
+
+/**
+ * Recover the 1-D axes of a full mesh that is actually a regular grid
+ * (every row shares the same lons and every column the same lat).
+ * Returns null for curvilinear meshes.
+ */
+export function meshAxes(
+  lons: Arrayable<number>,
+  lats: Arrayable<number>,
+  n_lat: number,
+  n_lon: number
+): {lon_axis: Float64Array, lat_axis: Float64Array} | null {
+  if (n_lat * n_lon != lons.length || n_lat < 1 || n_lon < 1) {
+    return null
+  }
+
+  const lon_axis = new Float64Array(n_lon)
+  const lat_axis = new Float64Array(n_lat)
+  for (let j = 0; j < n_lon; j++) {
+    lon_axis[j] = lons[j]
+  }
+  for (let i = 0; i < n_lat; i++) {
+    lat_axis[i] = lats[i * n_lon]
+  }
+
+  for (let i = 0; i < n_lat; i++) {
+    for (let j = 0; j < n_lon; j++) {
+      const k = i * n_lon + j
+      if (lons[k] != lon_axis[j] || lats[k] != lat_axis[i]) {
+        return null
+      }
+    }
+  }
+
+  return {lon_axis, lat_axis}
+}
+
+/**
+ * Resolve the grid layout from model properties.
+ *
+ * A full lon/lat mesh takes precedence (curvilinear grids), then explicit
+ * 1-D axes, then start/step with n_lon/n_lat. For regular grids the vertex
+ * mesh is generated here instead of being sent from Python, and a full mesh
+ * that turns out to be regular gets its axes recovered.
+ */
+export function resolveGrid(src: GridSource): Grid {
+  if (src.lons.length > 0 && src.lons.length == src.lats.length) {
+    const axes = meshAxes(src.lons, src.lats, src.n_lat, src.n_lon)
+    return {
+      n_lat: src.n_lat,
+      n_lon: src.n_lon,
+      lon_axis: axes !== null ? axes.lon_axis : null,
+      lat_axis: axes !== null ? axes.lat_axis : null,
+      lons: src.lons,
+      lats: src.lats,
+    }
+  }
+
+  let lon_axis: Arrayable<number> = src.lon_axis
+  let lat_axis: Arrayable<number> = src.lat_axis
+  if (lon_axis.length == 0 && isFinite(src.lon_start) && isFinite(src.lon_step)) {
+    lon_axis = regularAxis(src.lon_start, src.lon_step, src.n_lon)
+  }
+  if (lat_axis.length == 0 && isFinite(src.lat_start) && isFinite(src.lat_step)) {
+    lat_axis = regularAxis(src.lat_start, src.lat_step, src.n_lat)
+  }
+
+  const n_lat = lat_axis.length
+  const n_lon = lon_axis.length
+  const lons = new Float64Array(n_lat * n_lon)
+  const lats = new Float64Array(n_lat * n_lon)
+  for (let i = 0; i < n_lat; i++) {
+    for (let j = 0; j < n_lon; j++) {
+      lons[i * n_lon + j] = lon_axis[j]
+      lats[i * n_lon + j] = lat_axis[i]
+    }
+  }
+
+  return {n_lat, n_lon, lon_axis, lat_axis, lons, lats}
+}
+
+/**
+ * Unit-sphere positions for every grid vertex, packed as [x, y, z, ...].
+ *
+ * Regular grids are separable, so only n_lat + n_lon cos/sin pairs are
+ * evaluated instead of one per vertex.
+ */
+export function gridUnitVectors(grid: Grid): Float32Array {
+  const {n_lat, n_lon, lon_axis, lat_axis} = grid
+  if (lon_axis === null || lat_axis === null) {
+    return unitVectors(grid.lons, grid.lats)
+  }
+
+  const cos_lon = new Float64Array(n_lon)
+  const sin_lon = new Float64Array(n_lon)
+  for (let j = 0; j < n_lon; j++) {
+    const lon_rad = lon_axis[j] * Math.PI / 180
+    cos_lon[j] = Math.cos(-lon_rad)
+    sin_lon[j] = Math.sin(-lon_rad)
+  }
+
+  const xyz = new Float32Array(3 * n_lat * n_lon)
+  for (let i = 0; i < n_lat; i++) {
+    const lat_rad = lat_axis[i] * Math.PI / 180
+    const cos_lat = Math.cos(lat_rad)
+    const sin_lat = Math.sin(lat_rad)
+    for (let j = 0; j < n_lon; j++) {
+      const k = 3 * (i * n_lon + j)
+      xyz[k] = cos_lat * cos_lon[j]
+      xyz[k + 1] = cos_lat * sin_lon[j]
+      xyz[k + 2] = sin_lat
+    }
+  }
+
+  return xyz
+}
+
+/**
+ * Longitude difference wrapped into [-180, 180)
+ */
+function wrapLon(lon: number): number {
+  return lon - 360 * Math.floor((lon + 180) / 360)
+}
+
+/**
+ * Whether (px, py) lies in the triangle a, b, c of either orientation
+ */
+function inTriangle(px: number, py: number, ax: number, ay: number,
+                    bx: number, by: number, cx: number, cy: number): boolean {
+  const d1 = (px - bx) * (ay - by) - (ax - bx) * (py - by)
+  const d2 = (px - cx) * (by - cy) - (bx - cx) * (py - cy)
+  const d3 = (px - ax) * (cy - ay) - (cx - ax) * (py - ay)
+  const neg = d1 < 0 || d2 < 0 || d3 < 0
+  const pos = d1 > 0 || d2 > 0 || d3 > 0
+  return !(neg && pos)
+}
+
+/**
+ * Locates the cell of a curvilinear grid containing a lon/lat point.
+ *
+ * Cells are bucketed by their lon/lat bounding boxes in a ScreenIndex laid
+ * over the 360 x 180 degree plane, so a lookup only tests the cells whose
+ * boxes contain the point. Cells crossing the antimeridian are inserted on
+ * both sides of it. Regular grids are located through their axes instead.
+ */
+export class CellLocator {
+  private readonly grid: Grid
+  private readonly index: ScreenIndex
+
+  constructor(grid: Grid) {
+    this.grid = grid
+    const {n_lat, n_lon, lons, lats} = grid
+    const n_cell_lon = Math.max(0, n_lon - 1)
+    const n_cells = Math.max(0, n_lat - 1) * n_cell_lon
+
+    // Buckets about the size of an average cell, but no finer than half a degree
+    this.index = new ScreenIndex(Math.max(0.5, Math.sqrt(360 * 180 / Math.max(1, n_cells))))
+    this.index.reset(360, 180)
+
+    const corners = [0, 1, n_lon + 1, n_lon]
+    for (let i = 0; i < n_lat - 1; i++) {
+      for (let j = 0; j < n_cell_lon; j++) {
+        const k = i * n_lon + j
+        const lon0 = wrapLon(lons[k])
+        let lon_lo = lon0
+        let lon_hi = lon0
+        let lat_lo = Infinity
+        let lat_hi = -Infinity
+        for (const offset of corners) {
+          const lon = lon0 + wrapLon(lons[k + offset] - lon0)
+          lon_lo = Math.min(lon_lo, lon)
+          lon_hi = Math.max(lon_hi, lon)
+          lat_lo = Math.min(lat_lo, lats[k + offset])
+          lat_hi = Math.max(lat_hi, lats[k + offset])
+        }
+        if (isNaN(lon_lo + lon_hi + lat_lo + lat_hi)) continue
+
+        const id = i * n_cell_lon + j
+        this.index.insert(id, lon_lo + 180, lat_lo + 90, lon_hi + 180, lat_hi + 90)
+        if (lon_lo < -180) {
+          this.index.insert(id, lon_lo + 540, lat_lo + 90, lon_hi + 540, lat_hi + 90)
+        } else if (lon_hi > 180) {
+          this.index.insert(id, lon_lo - 180, lat_lo + 90, lon_hi - 180, lat_hi + 90)
+        }
+      }
+    }
+  }
+
+  /**
+   * Row-major index of the cell containing lon/lat, or -1
+   */
+  locate(lon: number, lat: number): number {
+    lon = wrapLon(lon)
+    return this.index.find(lon + 180, lat + 90, (id) => this.contains(id, lon, lat))
+  }
+
+  private contains(id: number, lon: number, lat: number): boolean {
+    const {n_lon, lons, lats} = this.grid
+    const n_cell_lon = n_lon - 1
+    const k = Math.floor(id / n_cell_lon) * n_lon + id % n_cell_lon
+
+    // Corners unwrapped around the first one, which is moved next to the point
+    const x0 = lon + wrapLon(lons[k] - lon)
+    const x1 = x0 + wrapLon(lons[k + 1] - x0)
+    const x2 = x0 + wrapLon(lons[k + n_lon + 1] - x0)
+    const x3 = x0 + wrapLon(lons[k + n_lon] - x0)
+    const y0 = lats[k]
+    const y1 = lats[k + 1]
+    const y2 = lats[k + n_lon + 1]
+    const y3 = lats[k + n_lon]
+    return inTriangle(lon, lat, x0, y0, x1, y1, x2, y2) || inTriangle(lon, lat, x0, y0, x2, y2, x3, y3)
+  }
+}
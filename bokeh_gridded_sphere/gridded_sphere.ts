@@ -0,0 +1,2221 @@
+import * as p from "@bokehjs/core/properties"
+import {LayoutDOM, LayoutDOMView} from "@bokehjs/models/layouts/layout_dom"
+import {div} from "@bokehjs/core/dom"
+import {logger} from "@bokehjs/core/logging"
+import type {Arrayable} from "@bokehjs/core/types"
+import {ColumnarDataSource} from "@bokehjs/models/sources/columnar_data_source"
+import {unprojectSphere, unitVectors, projectUnitVectors, HORIZON_DEPTH} from "./projections"
+import type {Camera} from "./projections"
+import type {Grid} from "./grid"
+import {resolveGrid, gridUnitVectors, CellLocator} from "./grid"
+import {getPalette, getColorLUT, computeValueStats, rangeFromStats, cellColorIndices, cellColorIndex, cellValue, shadeRGBA} from "./palettes"
+import type {ValueStats} from "./palettes"
+import {QuadBuffer, drawGridQuads} from "./quads"
+import {FrameCache} from "./frames"
+import {ScreenIndex} from "./spatial"
+import {AxisIndex, rasterizeSphere} from "./raster"
+import {CanvasLayer} from "./layers"
+import {MarkerAtlas} from "./sprites"
+import {PolylineSet} from "./polylines"
+import {OverlayColumns, sourceColumns, recordColumns} from "./columns"
+import {ArcSet, arcRadius, greatCircleArcs, trajectoryArcs} from "./arcs"
+import {workerRenderingSupported, createRenderWorker} from "./offscreen"
+import type {WorkerMessage} from "./render_worker"
+import {SphereGeometry} from "./sphere_geometry"
+import {buildLodPyramid} from "./lod"
+import type {LodLevel} from "./lod"
+
+// Delay after the last interactive frame before redrawing at full resolution
+const LOD_REFINE_DELAY = 150
+
+// Coastline and border vertices closer than this many pixels to the
+// simplified line are dropped at the current zoom
+const POLYLINE_TOLERANCE = 0.5
+
+// Trajectories fade out behind the horizon in this many alpha steps, one
+// stroke per step, instead of a stroke per segment at its exact alpha
+const TRAJECTORY_ALPHA_BUCKETS = 16
+
+// Overlay columns, one entry per item, with the keys of the per-item objects
+// the *_data lists take; lines and trajectories hold their coordinates in
+// ragged lons/lats(/altitudes) columns instead of coords
+const SCATTER_NUMERIC = ["lon", "lat", "size", "border_width"]
+const SCATTER_OTHER = ["color", "border_color", "label"]
+const BAR_NUMERIC = ["lon", "lat", "height", "width", "border_width"]
+const BAR_OTHER = ["color", "border_color", "label"]
+const LINE_NUMERIC = ["width"]
+const LINE_OTHER = ["lons", "lats", "color", "label"]
+const TRAJECTORY_NUMERIC = ["width", "point_size"]
+const TRAJECTORY_OTHER = ["lons", "lats", "altitudes", "color", "show_points", "point_color", "label"]
+
+interface Line {
+  coords: Array<[number, number]>
+  color?: string
+  width?: number
+  label?: string
+}
+
+interface Trajectory {
+  coords: Array<{lon: number, lat: number, altitude: number}>
+  color?: string
+  width?: number
+  show_points?: boolean
+  point_size?: number
+  point_color?: string
+  label?: string
+}
+
+// Parts of the view that are redrawn independently; "background" only
+// composites the sphere's layers again
+type RenderLayer = "background" | "grid" | "overlays" | "colorbar"
+
+// A coarse level of the grid with the view's caches for it
+interface LodEntry {
+  level: LodLevel
+  xyz?: Float32Array
+  screen?: Float32Array
+  cell_rgba?: Uint32Array
+}
+
+export class GriddedSphereView extends LayoutDOMView {
+  declare model: GriddedSphere
+
+  private container_el?: HTMLDivElement
+  private canvas?: HTMLCanvasElement
+  private ctx?: CanvasRenderingContext2D
+  private colorbar_canvas?: HTMLCanvasElement
+  private colorbar_ctx?: CanvasRenderingContext2D
+  private tooltip_el?: HTMLDivElement
+  private mouse_x: number = 0
+  private mouse_y: number = 0
+  
+  private is_dragging: boolean = false
+  private drag_start_x: number = 0
+  private drag_start_y: number = 0
+  private drag_start_rotation: number = 0
+  private drag_start_tilt: number = 0
+  
+  private animation_id?: number
+  private rotation_resume_timeout?: number
+  
+  // Layers to redraw on the next animation frame
+  private readonly dirty_layers = new Set<RenderLayer>()
+  private render_frame_id?: number
+  
+  // Set while a drag, wheel or autorotation step changes the view; the next
+  // frame drawn after such a change may use a coarse level of detail
+  private interacting: boolean = false
+  private lod_frame: boolean = false
+  private refine_timeout?: number
+  // Coarsened grids, finest first, and the measured drawing cost per cell (ms)
+  private lod_levels?: LodEntry[]
+  private cell_cost?: number
+  
+  private grid?: Grid
+  
+  // Unit-sphere xyz, rebuilt only when the underlying lon/lat data changes
+  private grid_xyz?: Float32Array
+  private coast_lines?: PolylineSet
+  private country_lines?: PolylineSet
+  // Per-frame [screen_x, screen_y, depth] for grid vertices, reused across frames
+  private grid_screen?: Float32Array
+  // Packed palette colors with the NaN color in the last slot
+  private color_lut?: Uint32Array
+  // Range and NaN count of the current values, or of the whole cube; with
+  // cube_color_range "frame", each cube frame's are kept in frame_stats
+  private value_stats?: ValueStats
+  private readonly frame_stats = new Map<number, ValueStats>()
+  // Lookup table index of every grid cell; for cubes, the current frame's
+  // entry in frame_colors
+  private cell_colors?: Int32Array
+  private readonly frame_colors = new FrameCache(32)
+  // values_cube as a typed array, so frames can be viewed without copying
+  private cube?: Float32Array | Float64Array
+  // Final (lit) color of every grid cell, refilled in place when stale.
+  // Lighting is in world space, so neither this nor the per-cell lighting
+  // factors depend on rotation, tilt or zoom
+  private cell_rgba?: Uint32Array
+  private cell_rgba_valid: boolean = false
+  // Bumped whenever cell_rgba is refilled or recolored
+  private cell_rgba_version: number = 0
+  private cell_shade?: Float64Array
+  
+  // Playback clock for values_cube
+  private playback_id?: number
+  private playback_last?: number
+  // Front-facing cells, drawn in grid order, and the horizon band behind them
+  private readonly quads = new QuadBuffer()
+  private readonly edge_quads = new QuadBuffer()
+  
+  // The field and everything drawn over it are kept on separate layers and
+  // composited onto the visible canvas over the background color
+  private grid_layer?: CanvasLayer
+  private overlay_layer?: CanvasLayer
+  
+  // Worker mode: the field is drawn by a worker into a transferred canvas
+  // stacked under the main one, which then only holds the overlays. The
+  // grid and colors last sent are tracked so they are posted only on change
+  private render_worker?: Worker
+  private field_canvas?: HTMLCanvasElement
+  private worker_xyz?: Float32Array
+  private worker_rgba_version: number = -1
+  private worker_options_warned: boolean = false
+  
+  // Raster backend: axis lookups and a reused pixel buffer
+  private lon_index?: AxisIndex
+  private lat_index?: AxisIndex
+  // Curvilinear grids: cells bucketed by lon/lat, for the hover lookup
+  private cell_locator?: CellLocator
+  private raster_image?: ImageData
+  private raster_pixels?: Uint32Array
+  
+  // Overlay items, read from the *_source data sources or transposed once
+  // from the *_data lists, and the scatter points' unit vectors
+  private scatter_columns?: OverlayColumns
+  private bar_columns?: OverlayColumns
+  private line_columns?: OverlayColumns
+  private trajectory_columns?: OverlayColumns
+  private scatter_xyz?: Float32Array
+  private scatter_screen?: Float32Array
+  // Interpolated line and trajectory vertices, kept until their data or the
+  // interpolation radius changes, and their projections in the last frame
+  private line_arcs?: ArcSet
+  private trajectory_arcs?: ArcSet
+  private line_screen?: Float32Array
+  private trajectory_screen?: Float32Array
+  private trajectory_buckets: Uint8Array = new Uint8Array(0)
+  // Visible scatter points (vertex is the point index) for depth sorting
+  private readonly scatter_visible = new QuadBuffer()
+  
+  // Scatter markers pre-rendered per style and each point's atlas cell (-1
+  // when drawn directly)
+  private marker_atlas?: MarkerAtlas
+  private scatter_cells?: Int32Array
+  
+  // Hover hit-testing against the last frame: screen positions of scatter
+  // points and bar bases, by data index, and buckets over them
+  private readonly scatter_index = new ScreenIndex()
+  private readonly bar_index = new ScreenIndex()
+  private scatter_xy: Float64Array = new Float64Array(0)
+  private bar_xy: Float64Array = new Float64Array(0)
+
+  override get child_models(): LayoutDOM[] {
+    return []
+  }
+
+  override connect_signals(): void {
+    super.connect_signals()
+    
+    const {rotation, tilt, zoom} = this.model.properties
+    this.on_change([rotation, tilt, zoom], () => {
+      if (this.interacting) {
+        this.lod_frame = true
+      }
+      this.request_render("grid", "overlays")
+    })
+    this.connect(this.model.properties.palette.change, () => {
+      this.color_lut = undefined
+      this.invalidate_cell_colors()
+      this.request_render("grid", "colorbar")
+    })
+    this.connect(this.model.properties.nan_color.change, () => {
+      this.color_lut = undefined
+      this.invalidate_cell_rgba()
+      this.request_render("grid")
+    })
+    this.on_change([this.model.properties.vmin, this.model.properties.vmax], () => {
+      this.invalidate_cell_colors()
+      this.request_render("grid", "colorbar")
+    })
+    this.on_change([this.model.properties.values, this.model.properties.values_cube], () => {
+      this.cube = undefined
+      this.value_stats = undefined
+      this.frame_stats.clear()
+      this.lod_levels = undefined
+      this.invalidate_cell_colors()
+      this.request_render("grid", "colorbar")
+    })
+    this.connect(this.model.properties.cube_color_range.change, () => {
+      this.value_stats = undefined
+      this.frame_stats.clear()
+      this.lod_levels = undefined
+      this.invalidate_cell_colors()
+      this.request_render("grid", "colorbar")
+    })
+    this.connect(this.model.properties.values_patch.change, () => this.apply_values_patch())
+    this.connect(this.model.properties.time_index.change, () => {
+      // Cached frames stay valid; only the current frame changes, and with
+      // it the color range when each frame is scaled on its own
+      this.cell_colors = undefined
+      this.lod_levels = undefined
+      this.invalidate_cell_rgba()
+      this.request_render("grid", "colorbar")
+    })
+    this.connect(this.model.properties.frame_cache_size.change, () => {
+      this.frame_colors.capacity = this.model.frame_cache_size
+    })
+    this.connect(this.model.properties.playing.change, () => {
+      if (this.model.playing) {
+        this.start_playback()
+      } else {
+        this.stop_playback()
+      }
+    })
+    this.connect(this.model.properties.background_color.change, () => {
+      if (this.container_el) {
+        this.container_el.style.background = this.model.background_color
+      }
+      this.request_render("background", "colorbar")
+    })
+    this.connect(this.model.properties.colorbar_text_color.change, () => this.request_render("colorbar"))
+    this.connect(this.model.properties.colorbar_title.change, () => this.request_render("colorbar"))
+    this.connect(this.model.properties.show_colorbar.change, () => {
+      if (this.colorbar_canvas) {
+        this.colorbar_canvas.style.display = this.model.show_colorbar ? 'block' : 'none'
+      }
+    })
+    this.connect(this.model.properties.autorotate.change, () => {
+      if (this.model.autorotate) {
+        this.start_autorotation()
+      } else {
+        this.stop_autorotation()
+      }
+    })
+    
+    const {scatter_data, scatter_source, bar_data, bar_source} = this.model.properties
+    const {line_data, line_source, trajectory_data, trajectory_source} = this.model.properties
+    const invalidate_scatter = () => {
+      this.scatter_columns = undefined
+      this.scatter_xyz = undefined
+      this.scatter_cells = undefined
+    }
+    const invalidate_bars = () => this.bar_columns = undefined
+    const invalidate_lines = () => {
+      this.line_columns = undefined
+      this.line_arcs = undefined
+    }
+    const invalidate_trajectories = () => {
+      this.trajectory_columns = undefined
+      this.trajectory_arcs = undefined
+    }
+    this.connect_overlay(scatter_data, scatter_source, invalidate_scatter)
+    this.connect_overlay(bar_data, bar_source, invalidate_bars)
+    this.connect_overlay(line_data, line_source, invalidate_lines)
+    this.connect_overlay(trajectory_data, trajectory_source, invalidate_trajectories)
+    this.connect(this.model.properties.scatter_color.change, () => {
+      this.scatter_cells = undefined
+      this.request_render("overlays")
+    })
+    
+    this.connect(this.model.properties.backface_culling.change, () => this.request_render("grid"))
+    this.connect(this.model.properties.grid_renderer.change, () => this.request_render("grid"))
+    this.connect(this.model.properties.lod_factors.change, () => {
+      this.lod_levels = undefined
+    })
+    
+    const {enable_lighting, light_azimuth, light_elevation, light_intensity, ambient_light} = this.model.properties
+    this.on_change([light_azimuth, light_elevation, light_intensity, ambient_light], () => {
+      this.cell_shade = undefined
+    })
+    this.on_change([enable_lighting, light_azimuth, light_elevation, light_intensity, ambient_light], () => {
+      this.invalidate_cell_rgba()
+      this.request_render("grid")
+    })
+    
+    const {lons, lats, lon_axis, lat_axis, lon_start, lon_step, lat_start, lat_step, n_lat, n_lon} = this.model.properties
+    this.on_change([lons, lats, lon_axis, lat_axis, lon_start, lon_step, lat_start, lat_step, n_lat, n_lon], () => {
+      this.invalidate_grid()
+      this.request_render("grid", "colorbar")
+    })
+    this.on_change([this.model.properties.coast_lons, this.model.properties.coast_lats], () => {
+      this.coast_lines = undefined
+      this.request_render("overlays")
+    })
+    this.on_change([this.model.properties.country_lons, this.model.properties.country_lats], () => {
+      this.country_lines = undefined
+      this.request_render("overlays")
+    })
+    
+    // Follow edits to the geometry model in use; a replaced one is disconnected
+    let geometry: SphereGeometry | null = null
+    const update_geometry = () => this.invalidate_geometry()
+    const connect_geometry = () => {
+      if (geometry !== null) {
+        this.disconnect(geometry.change, update_geometry)
+      }
+      geometry = this.model.geometry
+      if (geometry !== null) {
+        this.connect(geometry.change, update_geometry)
+      }
+    }
+    this.connect(this.model.properties.geometry.change, () => {
+      connect_geometry()
+      this.invalidate_geometry()
+    })
+    connect_geometry()
+  }
+
+  /**
+   * Redraw the overlays when an overlay's item list or data source is set,
+   * or when the source in use changes, streams or is patched. A replaced
+   * source is disconnected, so it neither triggers redraws nor is kept alive.
+   */
+  private connect_overlay(data: p.Property<any[]>, source: p.Property<ColumnarDataSource | null>,
+                          invalidate: () => void): void {
+    const update = () => {
+      invalidate()
+      this.request_render("overlays")
+    }
+    let connected: ColumnarDataSource | null = null
+    const connect_source = () => {
+      if (connected !== null) {
+        this.disconnect(connected.change, update)
+        this.disconnect(connected.streaming, update)
+        this.disconnect(connected.patching, update)
+      }
+      connected = source.get_value()
+      if (connected !== null) {
+        this.connect(connected.change, update)
+        this.connect(connected.streaming, update)
+        this.connect(connected.patching, update)
+      }
+    }
+    this.connect(data.change, update)
+    this.connect(source.change, () => {
+      connect_source()
+      update()
+    })
+    connect_source()
+  }
+
+  private invalidate_grid(): void {
+    this.grid = undefined
+    this.grid_xyz = undefined
+    this.cell_shade = undefined
+    this.value_stats = undefined
+    this.frame_stats.clear()
+    this.lod_levels = undefined
+    this.invalidate_cell_colors()
+    this.lon_index = undefined
+    this.lat_index = undefined
+    this.cell_locator = undefined
+  }
+
+  private invalidate_geometry(): void {
+    this.invalidate_grid()
+    this.coast_lines = undefined
+    this.country_lines = undefined
+    this.request_render("grid", "overlays", "colorbar")
+  }
+
+  /**
+   * Mark layers for redrawing. However many properties change in between,
+   * the view is redrawn at most once per animation frame.
+   */
+  private request_render(...layers: RenderLayer[]): void {
+    for (const layer of layers) {
+      this.dirty_layers.add(layer)
+    }
+    if (this.render_frame_id === undefined) {
+      this.render_frame_id = requestAnimationFrame(() => this.flush_render())
+    }
+  }
+
+  private flush_render(): void {
+    this.render_frame_id = undefined
+    const dirty = this.dirty_layers
+    if (dirty.has("background") || dirty.has("grid") || dirty.has("overlays")) {
+      this.render_sphere(dirty.has("grid"), dirty.has("overlays"))
+    }
+    if (dirty.has("colorbar")) {
+      this.render_colorbar()
+    }
+    dirty.clear()
+  }
+
+  /**
+   * The shared geometry's grid when it defines one, otherwise this model's
+   */
+  private get_grid(): Grid {
+    if (this.grid === undefined) {
+      const shared = this.model.geometry !== null ? this.model.geometry.grid : null
+      this.grid = shared !== null ? shared : resolveGrid(this.model)
+    }
+    return this.grid
+  }
+
+  private get_color_lut(): Uint32Array {
+    if (this.color_lut === undefined) {
+      this.color_lut = getColorLUT(this.model.palette, this.model.nan_color)
+    }
+    return this.color_lut
+  }
+
+  /**
+   * Number of frames in values_cube, or 0 when the cube is not in use
+   */
+  private n_frames(): number {
+    const {n_lat, n_lon} = this.get_grid()
+    const n_vertices = n_lat * n_lon
+    return n_vertices > 0 ? Math.floor(this.model.values_cube.length / n_vertices) : 0
+  }
+
+  private frame_index(): number {
+    return Math.max(0, Math.min(this.n_frames() - 1, this.model.time_index))
+  }
+
+  private get_cube(): Float32Array | Float64Array {
+    if (this.cube === undefined) {
+      const cube = this.model.values_cube
+      this.cube = cube instanceof Float32Array || cube instanceof Float64Array ? cube : Float64Array.from(cube)
+    }
+    return this.cube
+  }
+
+  /**
+   * The values being displayed: the current frame of values_cube (a view,
+   * not a copy) when a cube is given, otherwise `values`
+   */
+  private get_values(): Arrayable<number> {
+    const n_frames = this.n_frames()
+    if (n_frames == 0) {
+      return this.model.values
+    }
+    const {n_lat, n_lon} = this.get_grid()
+    const n_vertices = n_lat * n_lon
+    const t = this.frame_index()
+    return this.get_cube().subarray(t * n_vertices, (t + 1) * n_vertices)
+  }
+
+  private get_value_stats(): ValueStats {
+    if (this.n_frames() > 0 && this.model.cube_color_range == "frame") {
+      const t = this.frame_index()
+      let stats = this.frame_stats.get(t)
+      if (stats === undefined) {
+        stats = computeValueStats(this.get_values())
+        this.frame_stats.set(t, stats)
+      }
+      return stats
+    }
+    if (this.value_stats === undefined) {
+      // With cube_color_range "cube" the cube is scaled as a whole, so colors
+      // are comparable across frames
+      const values = this.n_frames() > 0 ? this.get_cube() : this.model.values
+      this.value_stats = computeValueStats(values)
+    }
+    return this.value_stats
+  }
+
+  private get_value_range(): {vmin: number, vmax: number} {
+    return rangeFromStats(this.get_value_stats(), this.model.vmin, this.model.vmax)
+  }
+
+  private invalidate_cell_colors(): void {
+    this.cell_colors = undefined
+    this.frame_colors.clear()
+    this.invalidate_cell_rgba()
+  }
+
+  private invalidate_cell_rgba(): void {
+    this.cell_rgba_valid = false
+    if (this.lod_levels !== undefined) {
+      for (const lod of this.lod_levels) {
+        lod.cell_rgba = undefined
+      }
+    }
+  }
+
+  private get_cell_colors(grid: Grid): Int32Array {
+    if (this.cell_colors === undefined) {
+      const {vmin, vmax} = this.get_value_range()
+      const n_colors = this.get_color_lut().length - 1
+      
+      // Cube frames are cached, and evicted frames' buffers reused
+      let out: Int32Array | undefined
+      if (this.n_frames() > 0) {
+        const t = this.frame_index()
+        const cached = this.frame_colors.get(t)
+        if (cached !== undefined) {
+          this.cell_colors = cached
+          return cached
+        }
+        out = this.frame_colors.allocate(t, Math.max(0, (grid.n_lat - 1) * (grid.n_lon - 1)))
+      }
+      
+      this.cell_colors = cellColorIndices(this.get_values(), grid.n_lat, grid.n_lon, n_colors, vmin, vmax, out)
+    }
+    return this.cell_colors
+  }
+
+  private get_cell_rgba(grid: Grid): Uint32Array {
+    if (!this.cell_rgba_valid || this.cell_rgba === undefined) {
+      const cell_colors = this.get_cell_colors(grid)
+      const n_cells = cell_colors.length
+      const cell_rgba = this.cell_rgba !== undefined && this.cell_rgba.length == n_cells
+        ? this.cell_rgba : new Uint32Array(n_cells)
+      
+      this.cell_rgba = this.fill_cell_rgba(cell_colors, this.get_cell_shade(grid), cell_rgba)
+      this.cell_rgba_valid = true
+      this.cell_rgba_version++
+    }
+    return this.cell_rgba
+  }
+
+  /**
+   * Look up the palette color of every cell and apply its lighting factor
+   */
+  private fill_cell_rgba(cell_colors: Int32Array, cell_shade: Float64Array | null, out: Uint32Array): Uint32Array {
+    const lut = this.get_color_lut()
+    const n_cells = cell_colors.length
+    if (cell_shade === null) {
+      for (let c = 0; c < n_cells; c++) {
+        out[c] = lut[cell_colors[c]]
+      }
+    } else {
+      for (let c = 0; c < n_cells; c++) {
+        out[c] = shadeRGBA(lut[cell_colors[c]], cell_shade[c])
+      }
+    }
+    return out
+  }
+
+  /**
+   * Lighting factor of every cell, or null when lighting is disabled
+   */
+  private get_cell_shade(grid: Grid): Float64Array | null {
+    if (!this.model.enable_lighting) {
+      return null
+    }
+    
+    if (this.cell_shade === undefined) {
+      this.cell_shade = this.compute_cell_shade(grid)
+    }
+    return this.cell_shade
+  }
+
+  private compute_cell_shade(grid: Grid): Float64Array {
+    const {n_lat, n_lon, lons, lats} = grid
+    const light_az_rad = this.model.light_azimuth * Math.PI / 180
+    const light_el_rad = this.model.light_elevation * Math.PI / 180
+    const light_x = Math.cos(light_el_rad) * Math.sin(light_az_rad)
+    const light_y = Math.cos(light_el_rad) * Math.cos(light_az_rad)
+    const light_z = Math.sin(light_el_rad)
+    
+    const cell_shade = new Float64Array(Math.max(0, (n_lat - 1) * (n_lon - 1)))
+    for (let i = 0; i < n_lat - 1; i++) {
+      for (let j = 0; j < n_lon - 1; j++) {
+        const idx0 = i * n_lon + j
+        const idx3 = idx0 + n_lon
+        const avg_lon = (lons[idx0] + lons[idx0 + 1] + lons[idx3 + 1] + lons[idx3]) / 4
+        const avg_lat = (lats[idx0] + lats[idx0 + 1] + lats[idx3 + 1] + lats[idx3]) / 4
+        cell_shade[i * (n_lon - 1) + j] = this.calculate_lighting(avg_lon, avg_lat, light_x, light_y, light_z)
+      }
+    }
+    return cell_shade
+  }
+
+  /**
+   * Coarse levels of the displayed field, built on first use
+   */
+  private get_lod_levels(grid: Grid): LodEntry[] {
+    if (this.lod_levels === undefined) {
+      const levels = buildLodPyramid(grid, this.get_values(), this.model.lod_factors)
+      this.lod_levels = levels.map((level) => ({level}))
+    }
+    return this.lod_levels
+  }
+
+  private get_lod_xyz(lod: LodEntry): Float32Array {
+    if (lod.xyz === undefined) {
+      lod.xyz = gridUnitVectors(lod.level.grid)
+    }
+    return lod.xyz
+  }
+
+  /**
+   * Lit cell colors of a coarse level, on the full field's color range
+   */
+  private get_lod_rgba(lod: LodEntry): Uint32Array {
+    if (lod.cell_rgba === undefined) {
+      const {grid, values} = lod.level
+      const {vmin, vmax} = this.get_value_range()
+      const n_colors = this.get_color_lut().length - 1
+      const cell_colors = cellColorIndices(values, grid.n_lat, grid.n_lon, n_colors, vmin, vmax)
+      const cell_shade = this.model.enable_lighting ? this.compute_cell_shade(grid) : null
+      lod.cell_rgba = this.fill_cell_rgba(cell_colors, cell_shade, new Uint32Array(cell_colors.length))
+    }
+    return lod.cell_rgba
+  }
+
+  /**
+   * The coarsest detail an interactive frame needs: full resolution when the
+   * measured cost of drawing it fits in lod_frame_budget, otherwise the
+   * finest level that does (or the coarsest one)
+   */
+  private select_lod(grid: Grid): LodEntry | null {
+    const budget = this.model.lod_frame_budget
+    const cost = this.cell_cost
+    if (!(budget > 0) || cost === undefined || (grid.n_lat - 1) * (grid.n_lon - 1) * cost <= budget) {
+      return null
+    }
+    
+    const levels = this.get_lod_levels(grid)
+    for (const lod of levels) {
+      const {n_lat, n_lon} = lod.level.grid
+      if ((n_lat - 1) * (n_lon - 1) * cost <= budget) {
+        return lod
+      }
+    }
+    return levels.length > 0 ? levels[levels.length - 1] : null
+  }
+
+  private schedule_refine(): void {
+    if (this.refine_timeout !== undefined) {
+      clearTimeout(this.refine_timeout)
+    }
+    this.refine_timeout = window.setTimeout(() => {
+      this.refine_timeout = undefined
+      this.request_render("grid")
+    }, LOD_REFINE_DELAY)
+  }
+
+  /**
+   * Write `values_patch` into the values in place and recolor only the
+   * cells it touches. The value stats are kept up to date incrementally;
+   * when the automatic color range moves, every cell is recolored instead.
+   */
+  private apply_values_patch(): void {
+    const patch = this.model.values_patch
+    if (patch === null) return
+    
+    const values = this.model.values
+    const indices = patch.indices
+    
+    // While a cube is displayed, `values` is only kept in sync
+    if (this.n_frames() > 0) {
+      for (let k = 0; k < indices.length; k++) {
+        if (indices[k] >= 0 && indices[k] < values.length) {
+          values[indices[k]] = patch.values[k]
+        }
+      }
+      return
+    }
+    
+    const {vmin, vmax} = this.get_value_range()
+    const stats = this.value_stats!
+    
+    let stale_stats = false
+    for (let k = 0; k < indices.length; k++) {
+      const idx = indices[k]
+      if (idx < 0 || idx >= values.length) continue
+      
+      const old_value = values[idx]
+      const new_value = patch.values[k]
+      values[idx] = new_value
+      
+      // Overwriting the current min or max needs a rescan to find the next one
+      if (isNaN(old_value)) {
+        stats.nan_count--
+      } else if ((old_value == stats.min && !(new_value <= old_value)) ||
+                 (old_value == stats.max && !(new_value >= old_value))) {
+        stale_stats = true
+      }
+      if (isNaN(new_value)) {
+        stats.nan_count++
+      } else {
+        if (new_value < stats.min) stats.min = new_value
+        if (new_value > stats.max) stats.max = new_value
+      }
+    }
+    if (stale_stats) {
+      this.value_stats = undefined
+    }
+    this.lod_levels = undefined
+    
+    const range = this.get_value_range()
+    if (range.vmin != vmin || range.vmax != vmax) {
+      this.invalidate_cell_colors()
+      this.request_render("colorbar")
+    } else if (this.cell_colors !== undefined) {
+      this.recolor_cells(indices)
+    }
+    this.request_render("grid")
+  }
+
+  /**
+   * Recompute the cached colors of the cells around the given vertices
+   */
+  private recolor_cells(vertices: Arrayable<number>): void {
+    const grid = this.get_grid()
+    const {n_lat, n_lon} = grid
+    const cell_colors = this.cell_colors!
+    const cell_rgba = this.cell_rgba_valid ? this.cell_rgba : undefined
+    const cell_shade = this.get_cell_shade(grid)
+    const lut = this.get_color_lut()
+    const {vmin, vmax} = this.get_value_range()
+    const n_colors = lut.length - 1
+    
+    for (let k = 0; k < vertices.length; k++) {
+      const vertex = vertices[k]
+      const i = Math.floor(vertex / n_lon)
+      const j = vertex % n_lon
+      
+      // A vertex is a corner of up to four cells
+      for (let ci = Math.max(0, i - 1); ci <= Math.min(n_lat - 2, i); ci++) {
+        for (let cj = Math.max(0, j - 1); cj <= Math.min(n_lon - 2, j); cj++) {
+          const c = ci * (n_lon - 1) + cj
+          cell_colors[c] = cellColorIndex(this.model.values, n_lon, ci, cj, n_colors, vmin, vmax)
+          if (cell_rgba !== undefined) {
+            const rgba = lut[cell_colors[c]]
+            cell_rgba[c] = cell_shade !== null ? shadeRGBA(rgba, cell_shade[c]) : rgba
+          }
+        }
+      }
+    }
+    this.cell_rgba_version++
+  }
+
+  private get_axis_indices(lon_axis: Arrayable<number>, lat_axis: Arrayable<number>): [AxisIndex, AxisIndex] {
+    if (this.lon_index === undefined || this.lat_index === undefined) {
+      this.lon_index = new AxisIndex(lon_axis)
+      this.lat_index = new AxisIndex(lat_axis)
+    }
+    return [this.lon_index, this.lat_index]
+  }
+
+  /**
+   * Row-major index of the grid cell containing lon/lat, or -1 off the grid.
+   *
+   * Regular grids are located through their axes in O(1), as the raster
+   * backend does; curvilinear grids through a lon/lat index of their cells.
+   */
+  private locate_grid_cell(lon: number, lat: number): number {
+    const grid = this.get_grid()
+    
+    if (grid.lon_axis !== null && grid.lat_axis !== null) {
+      const [lon_index, lat_index] = this.get_axis_indices(grid.lon_axis, grid.lat_axis)
+      if (lon < lon_index.min) {
+        lon += 360
+      } else if (lon >= lon_index.min + 360) {
+        lon -= 360
+      }
+      const i = lat_index.cell(lat)
+      const j = lon_index.cell(lon)
+      return i < 0 || j < 0 ? -1 : i * (grid.n_lon - 1) + j
+    }
+    
+    if (this.cell_locator === undefined) {
+      this.cell_locator = new CellLocator(grid)
+    }
+    return this.cell_locator.locate(lon, lat)
+  }
+
+  private get_grid_xyz(): Float32Array {
+    if (this.grid_xyz === undefined) {
+      const grid = this.get_grid()
+      const geometry = this.model.geometry
+      this.grid_xyz = geometry !== null && geometry.grid === grid ? geometry.grid_xyz! : gridUnitVectors(grid)
+    }
+    return this.grid_xyz
+  }
+
+  /**
+   * Coastline polylines, taken from the shared geometry when it has any
+   */
+  private get_coast_lines(): PolylineSet {
+    if (this.coast_lines === undefined) {
+      const geometry = this.model.geometry
+      this.coast_lines = geometry !== null && geometry.coast_lons.length > 0
+        ? geometry.coast_lines : new PolylineSet(unitVectors(this.model.coast_lons, this.model.coast_lats))
+    }
+    return this.coast_lines
+  }
+
+  private get_country_lines(): PolylineSet {
+    if (this.country_lines === undefined) {
+      const geometry = this.model.geometry
+      this.country_lines = geometry !== null && geometry.country_lons.length > 0
+        ? geometry.country_lines : new PolylineSet(unitVectors(this.model.country_lons, this.model.country_lats))
+    }
+    return this.country_lines
+  }
+
+  /**
+   * Scatter points from scatter_source when set, otherwise scatter_data
+   */
+  private get_scatter_columns(): OverlayColumns {
+    if (this.scatter_columns === undefined) {
+      const source = this.model.scatter_source
+      this.scatter_columns = source !== null
+        ? sourceColumns(source) : recordColumns(this.model.scatter_data, SCATTER_NUMERIC, SCATTER_OTHER)
+    }
+    return this.scatter_columns
+  }
+
+  private get_scatter_xyz(): Float32Array {
+    if (this.scatter_xyz === undefined) {
+      const points = this.get_scatter_columns()
+      const lon = points.get("lon")
+      const lat = points.get("lat")
+      this.scatter_xyz = lon !== null && lat !== null ? unitVectors(lon, lat) : new Float32Array(0)
+    }
+    return this.scatter_xyz
+  }
+
+  /**
+   * Atlas cell of every scatter point's marker, redrawing the atlas with
+   * just the styles in use
+   */
+  private get_scatter_cells(): Int32Array {
+    if (this.scatter_cells === undefined) {
+      const points = this.get_scatter_columns()
+      const size = points.get("size")
+      const color = points.get("color")
+      const border_color = points.get("border_color")
+      const border_width = points.get("border_width")
+      
+      const atlas = this.marker_atlas ??= new MarkerAtlas()
+      atlas.clear()
+      
+      const n = points.length
+      const cells = new Int32Array(n)
+      let fill = "", radius = NaN, stroke = "", line_width = NaN, cell = -1
+      for (let i = 0; i < n; i++) {
+        const fill_i = color?.[i] || this.model.scatter_color
+        const radius_i = size?.[i] || 5
+        const stroke_i = border_color?.[i] || '#000000'
+        const line_width_i = border_width?.[i] || 1
+        // Neighbouring points usually share a style; skip the lookup then
+        if (fill_i !== fill || radius_i !== radius || stroke_i !== stroke || line_width_i !== line_width) {
+          fill = fill_i
+          radius = radius_i
+          stroke = stroke_i
+          line_width = line_width_i
+          cell = atlas.get(fill, radius, stroke, line_width)
+        }
+        cells[i] = cell
+      }
+      this.scatter_cells = cells
+    }
+    return this.scatter_cells
+  }
+
+  private get_bar_columns(): OverlayColumns {
+    if (this.bar_columns === undefined) {
+      const source = this.model.bar_source
+      this.bar_columns = source !== null
+        ? sourceColumns(source) : recordColumns(this.model.bar_data, BAR_NUMERIC, BAR_OTHER)
+    }
+    return this.bar_columns
+  }
+
+  private get_line_columns(): OverlayColumns {
+    if (this.line_columns === undefined) {
+      const source = this.model.line_source
+      if (source !== null) {
+        this.line_columns = sourceColumns(source)
+      } else {
+        const lines = (this.model.line_data as Line[]).map((line) => ({
+          ...line,
+          lons: line.coords.map((coord) => coord[0]),
+          lats: line.coords.map((coord) => coord[1]),
+        }))
+        this.line_columns = recordColumns(lines, LINE_NUMERIC, LINE_OTHER)
+      }
+    }
+    return this.line_columns
+  }
+
+  private get_trajectory_columns(): OverlayColumns {
+    if (this.trajectory_columns === undefined) {
+      const source = this.model.trajectory_source
+      if (source !== null) {
+        this.trajectory_columns = sourceColumns(source)
+      } else {
+        const trajectories = (this.model.trajectory_data as Trajectory[]).map((traj) => ({
+          ...traj,
+          lons: traj.coords.map((coord) => coord.lon),
+          lats: traj.coords.map((coord) => coord.lat),
+          altitudes: traj.coords.map((coord) => coord.altitude),
+        }))
+        this.trajectory_columns = recordColumns(trajectories, TRAJECTORY_NUMERIC, TRAJECTORY_OTHER)
+      }
+    }
+    return this.trajectory_columns
+  }
+
+  /**
+   * Great-circle arcs of the lines, interpolated finely enough for `scale`
+   */
+  private get_line_arcs(scale: number): ArcSet {
+    const radius = arcRadius(scale)
+    if (this.line_arcs === undefined || this.line_arcs.radius != radius) {
+      const lines = this.get_line_columns()
+      this.line_arcs = greatCircleArcs(lines.get("lons") ?? [], lines.get("lats") ?? [], radius)
+    }
+    return this.line_arcs
+  }
+
+  /**
+   * Trajectory paths, interpolated finely enough for `scale`
+   */
+  private get_trajectory_arcs(scale: number): ArcSet {
+    const radius = arcRadius(scale)
+    if (this.trajectory_arcs === undefined || this.trajectory_arcs.radius != radius) {
+      const trajectories = this.get_trajectory_columns()
+      this.trajectory_arcs = trajectoryArcs(trajectories.get("lons") ?? [], trajectories.get("lats") ?? [],
+                                            trajectories.get("altitudes"), radius)
+    }
+    return this.trajectory_arcs
+  }
+
+  override render(): void {
+    super.render()
+    
+    this.frame_colors.capacity = this.model.frame_cache_size
+    
+    const width = this.model.width ?? 800
+    const height = this.model.height ?? 800
+    
+    this.container_el = div({style: {
+      width: `${width + 140}px`,
+      height: `${height}px`,
+      background: this.model.background_color,
+      position: 'relative',
+      display: 'flex',
+      cursor: 'grab'
+    }})
+    
+    // Field canvas for worker mode, under the main canvas
+    this.stop_render_worker()
+    if (this.model.render_in_worker && workerRenderingSupported()) {
+      this.start_render_worker(this.container_el, width, height)
+    }
+    
+    // Main canvas
+    this.canvas = document.createElement('canvas')
+    this.canvas.width = width
+    this.canvas.height = height
+    this.canvas.style.position = 'relative'
+    this.container_el.appendChild(this.canvas)
+    
+    // Colorbar canvas
+    if (this.model.show_colorbar) {
+      this.colorbar_canvas = document.createElement('canvas')
+      this.colorbar_canvas.width = 150
+      this.colorbar_canvas.height = height
+      this.colorbar_canvas.style.marginLeft = '10px'
+      this.container_el.appendChild(this.colorbar_canvas)
+      this.colorbar_ctx = this.colorbar_canvas.getContext('2d')!
+    }
+    
+    // Tooltip
+    this.tooltip_el = div({style: {
+      position: 'absolute',
+      background: 'rgba(0, 0, 0, 0.85)',
+      color: 'white',
+      padding: '8px 12px',
+      borderRadius: '6px',
+      fontSize: '13px',
+      fontFamily: 'monospace',
+      pointerEvents: 'none',
+      display: 'none',
+      zIndex: '1000',
+      border: '1px solid rgba(255, 255, 255, 0.3)',
+      whiteSpace: 'nowrap'
+    }})
+    this.container_el.appendChild(this.tooltip_el)
+    
+    this.setup_interactions()
+    this.shadow_el.appendChild(this.container_el)
+    this.ctx = this.canvas.getContext('2d')!
+    this.render_sphere()
+    this.render_colorbar()
+    
+    if (this.model.autorotate) {
+      this.start_autorotation()
+    }
+    if (this.model.playing) {
+      this.start_playback()
+    }
+  }
+
+  private render_colorbar(): void {
+    if (!this.colorbar_ctx || !this.colorbar_canvas || !this.model.show_colorbar) return
+    
+    const ctx = this.colorbar_ctx
+    const canvas = this.colorbar_canvas
+    const width = canvas.width
+    const height = canvas.height
+    
+    // Clear with background color
+    ctx.fillStyle = this.model.background_color
+    ctx.fillRect(0, 0, width, height)
+    
+    const palette = getPalette(this.model.palette)
+    const {vmin, vmax} = this.get_value_range()
+    
+    // Colorbar dimensions
+    const bar_width = 30
+    const bar_height = height * 0.7
+    const bar_x = 35
+    const bar_y = (height - bar_height) / 2
+    
+    // Draw color gradient
+    const step = bar_height / palette.length
+    for (let i = 0; i < palette.length; i++) {
+      ctx.fillStyle = palette[palette.length - 1 - i]
+      ctx.fillRect(bar_x, bar_y + i * step, bar_width, step + 1)
+    }
+    
+    // Draw border with text color
+    ctx.strokeStyle = this.model.colorbar_text_color
+    ctx.lineWidth = 1
+    ctx.strokeRect(bar_x, bar_y, bar_width, bar_height)
+    
+    // Draw ticks and labels with text color
+    ctx.fillStyle = this.model.colorbar_text_color
+    ctx.font = '12px monospace'
+    ctx.textAlign = 'left'
+    
+    const n_ticks = 5
+    for (let i = 0; i < n_ticks; i++) {
+      const frac = i / (n_ticks - 1)
+      const value = vmin + (vmax - vmin) * (1 - frac)
+      const y = bar_y + frac * bar_height
+      
+      // Tick mark
+      ctx.beginPath()
+      ctx.moveTo(bar_x + bar_width, y)
+      ctx.lineTo(bar_x + bar_width + 5, y)
+      ctx.stroke()
+      
+      // Label
+      const label = value.toFixed(1)
+      ctx.fillText(label, bar_x + bar_width + 10, y + 4)
+    }
+    
+    // Title with text color
+    if (this.model.colorbar_title) {
+      ctx.save()
+      ctx.translate(12, height / 2)
+      ctx.rotate(-Math.PI / 2)
+      ctx.textAlign = 'center'
+      ctx.font = 'bold 13px monospace'
+      ctx.fillStyle = this.model.colorbar_text_color
+      ctx.fillText(this.model.colorbar_title, 0, 0)
+      ctx.restore()
+    }
+  }
+
+  private setup_interactions(): void {
+    if (!this.canvas) return
+    
+    this.canvas.onmousedown = (e) => {
+      this.is_dragging = true
+      this.drag_start_x = e.clientX
+      this.drag_start_y = e.clientY
+      this.drag_start_rotation = this.model.rotation
+      this.drag_start_tilt = this.model.tilt
+      this.container_el!.style.cursor = 'grabbing'
+      
+      this.stop_autorotation()
+      if (this.rotation_resume_timeout) {
+        clearTimeout(this.rotation_resume_timeout)
+      }
+    }
+    
+    this.canvas.onmousemove = (e) => {
+      const rect = this.canvas!.getBoundingClientRect()
+      this.mouse_x = e.clientX - rect.left
+      this.mouse_y = e.clientY - rect.top
+      
+      if (this.is_dragging) {
+        const dx = e.clientX - this.drag_start_x
+        const dy = e.clientY - this.drag_start_y
+        
+        this.interacting = true
+        const new_rotation = this.drag_start_rotation + dx * 0.5
+        this.model.rotation = ((new_rotation % 360) + 360) % 360
+        
+        const new_tilt = this.drag_start_tilt - dy * 0.5
+        this.model.tilt = Math.max(-90, Math.min(90, new_tilt))
+        this.interacting = false
+      } else if (this.model.enable_hover) {
+        this.update_tooltip()
+      }
+    }
+    
+    this.canvas.onmouseup = () => {
+      this.is_dragging = false
+      this.container_el!.style.cursor = 'grab'
+      
+      if (this.model.autorotate) {
+        if (this.rotation_resume_timeout) {
+          clearTimeout(this.rotation_resume_timeout)
+        }
+        this.rotation_resume_timeout = window.setTimeout(() => {
+          this.start_autorotation()
+        }, 1000)
+      }
+    }
+    
+    this.canvas.onmouseleave = () => {
+      this.is_dragging = false
+      this.container_el!.style.cursor = 'grab'
+      if (this.tooltip_el) {
+        this.tooltip_el.style.display = 'none'
+      }
+    }
+    
+    this.canvas.onwheel = (e) => {
+      e.preventDefault()
+      const delta = -Math.sign(e.deltaY) * 0.1
+      const new_zoom = this.model.zoom + delta
+      this.interacting = true
+      this.model.zoom = Math.max(0.5, Math.min(8.0, new_zoom))
+      this.interacting = false
+    }
+  }
+
+  private get_camera(): Camera {
+    const width = this.model.width ?? 800
+    const height = this.model.height ?? 800
+    const angle_rad = -this.model.rotation * Math.PI / 180
+    const tilt_rad = this.model.tilt * Math.PI / 180
+    
+    return {
+      cos_angle: Math.cos(angle_rad),
+      sin_angle: Math.sin(angle_rad),
+      cos_tilt: Math.cos(tilt_rad),
+      sin_tilt: Math.sin(tilt_rad),
+      scale: (Math.min(width, height) / 2) * 0.85 * this.model.zoom,
+      cx: width / 2,
+      cy: height / 2,
+    }
+  }
+
+  /**
+   * Redraw the given layers and composite all of them onto the visible canvas
+   */
+  private render_sphere(grid: boolean = true, overlays: boolean = true): void {
+    if (!this.ctx) return
+    
+    const ctx = this.ctx
+    const width = this.model.width ?? 800
+    const height = this.model.height ?? 800
+    
+    const camera = this.get_camera()
+    const {cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy} = camera
+    
+    if (this.render_worker !== undefined) {
+      // The worker draws the field; the background is the container's
+      this.lod_frame = false
+      if (grid) {
+        this.post_worker_frame(camera)
+      }
+      if (overlays || this.overlay_layer === undefined) {
+        if (this.overlay_layer === undefined) {
+          this.overlay_layer = new CanvasLayer()
+        }
+        this.overlay_layer.reset(width, height)
+        this.draw_overlays(cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy)
+      }
+      ctx.clearRect(0, 0, width, height)
+      ctx.drawImage(this.overlay_layer.canvas, 0, 0)
+      return
+    }
+    
+    if (grid || this.grid_layer === undefined) {
+      if (this.grid_layer === undefined) {
+        this.grid_layer = new CanvasLayer()
+      }
+      this.grid_layer.reset(width, height)
+      this.draw_grid(cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy)
+    }
+    
+    if (overlays || this.overlay_layer === undefined) {
+      if (this.overlay_layer === undefined) {
+        this.overlay_layer = new CanvasLayer()
+      }
+      this.overlay_layer.reset(width, height)
+      this.draw_overlays(cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy)
+    }
+    
+    ctx.fillStyle = this.model.background_color
+    ctx.fillRect(0, 0, width, height)
+    ctx.drawImage(this.grid_layer.canvas, 0, 0)
+    ctx.drawImage(this.overlay_layer.canvas, 0, 0)
+  }
+
+  /**
+   * Stack a field canvas under the main one and hand it to a render worker.
+   * If the worker cannot be created, e.g. because a content security policy
+   * forbids blob: workers, or fails to load, the canvas is removed again and
+   * the field is drawn on the main thread.
+   */
+  private start_render_worker(container: HTMLElement, width: number, height: number): void {
+    const field_canvas = document.createElement('canvas')
+    field_canvas.width = width
+    field_canvas.height = height
+    field_canvas.style.position = 'absolute'
+    field_canvas.style.left = '0'
+    field_canvas.style.top = '0'
+    container.appendChild(field_canvas)
+    
+    let worker: Worker
+    try {
+      worker = createRenderWorker(field_canvas)
+    } catch (error) {
+      field_canvas.remove()
+      logger.warn(`GriddedSphere: render worker unavailable, drawing on the main thread (${error})`)
+      return
+    }
+    
+    worker.addEventListener("error", (event) => {
+      if (this.render_worker !== worker) return
+      logger.warn(`GriddedSphere: render worker failed, drawing on the main thread (${event.message})`)
+      this.stop_render_worker()
+      this.request_render("grid")
+    })
+    this.render_worker = worker
+    this.field_canvas = field_canvas
+  }
+
+  /**
+   * Warn once if options the worker does not implement were set
+   */
+  private warn_worker_ignored_options(): void {
+    if (this.worker_options_warned) return
+    
+    const {lod_factors, lod_frame_budget} = this.model.properties
+    const ignored: string[] = []
+    if (this.model.grid_renderer == 'raster') {
+      ignored.push('grid_renderer="raster"')
+    }
+    for (const prop of [lod_factors, lod_frame_budget]) {
+      if (prop.dirty) {
+        ignored.push(prop.attr)
+      }
+    }
+    if (ignored.length > 0) {
+      logger.warn(`GriddedSphere: ${ignored.join(", ")} ignored while render_in_worker is on`)
+      this.worker_options_warned = true
+    }
+  }
+
+  /**
+   * Send the worker the grid and colors if they changed, then the camera
+   */
+  private post_worker_frame(camera: Camera): void {
+    this.warn_worker_ignored_options()
+    
+    const worker = this.render_worker!
+    const post = (msg: WorkerMessage, transfer: Transferable[] = []) => worker.postMessage(msg, transfer)
+    const grid = this.get_grid()
+    
+    // Copies are transferred, since the view keeps using its own buffers
+    const xyz = this.get_grid_xyz()
+    if (this.worker_xyz !== xyz) {
+      const copy = xyz.slice()
+      post({type: "grid", n_lat: grid.n_lat, n_lon: grid.n_lon, xyz: copy}, [copy.buffer])
+      this.worker_xyz = xyz
+    }
+    
+    const cell_rgba = this.get_cell_rgba(grid)
+    if (this.worker_rgba_version != this.cell_rgba_version) {
+      const copy = cell_rgba.slice()
+      post({type: "colors", cell_rgba: copy}, [copy.buffer])
+      this.worker_rgba_version = this.cell_rgba_version
+    }
+    
+    post({
+      type: "frame",
+      width: this.model.width ?? 800,
+      height: this.model.height ?? 800,
+      camera,
+      backface_culling: this.model.backface_culling,
+    })
+  }
+
+  private stop_render_worker(): void {
+    if (this.render_worker !== undefined) {
+      this.render_worker.terminate()
+      this.render_worker = undefined
+    }
+    this.field_canvas?.remove()
+    this.field_canvas = undefined
+    this.worker_xyz = undefined
+    this.worker_rgba_version = -1
+  }
+
+  private draw_grid(cos_angle: number, sin_angle: number, cos_tilt: number,
+                    sin_tilt: number, scale: number, cx: number, cy: number): void {
+    const lod_frame = this.lod_frame
+    this.lod_frame = false
+    
+    const grid = this.get_grid()
+    if (this.model.grid_renderer == 'raster' && grid.lon_axis !== null && grid.lat_axis !== null) {
+      this.draw_grid_raster(grid, cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy)
+    } else {
+      // While the view is moving, draw a coarse level if the full grid would
+      // not fit the frame budget, and come back at full detail once it stops
+      const lod = lod_frame ? this.select_lod(grid) : null
+      if (lod !== null) {
+        this.schedule_refine()
+      } else if (this.refine_timeout !== undefined) {
+        clearTimeout(this.refine_timeout)
+        this.refine_timeout = undefined
+      }
+      
+      const drawn = lod !== null ? lod.level.grid : grid
+      const xyz = lod !== null ? this.get_lod_xyz(lod) : this.get_grid_xyz()
+      const cell_rgba = lod !== null ? this.get_lod_rgba(lod) : this.get_cell_rgba(grid)
+      const screen = lod !== null ? lod.screen : this.grid_screen
+      
+      const start = performance.now()
+      const projected = this.draw_grid_quads(
+        drawn, xyz, cell_rgba, screen, cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy
+      )
+      const elapsed = performance.now() - start
+      if (lod !== null) {
+        lod.screen = projected
+      } else {
+        this.grid_screen = projected
+      }
+      
+      const n_cells = (drawn.n_lat - 1) * (drawn.n_lon - 1)
+      if (n_cells > 0) {
+        const cost = elapsed / n_cells
+        this.cell_cost = this.cell_cost === undefined ? cost : (this.cell_cost + cost) / 2
+      }
+    }
+  }
+
+  private draw_overlays(cos_angle: number, sin_angle: number, cos_tilt: number,
+                        sin_tilt: number, scale: number, cx: number, cy: number): void {
+    const width = this.model.width ?? 800
+    const height = this.model.height ?? 800
+    
+    if (this.model.show_coastlines && this.get_coast_lines().count > 0) {
+      this.draw_coastlines(cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy)
+    }
+    
+    if (this.model.show_countries && this.get_country_lines().count > 0) {
+      this.draw_countries(cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy)
+    }
+    
+    this.scatter_index.reset(width, height)
+    this.bar_index.reset(width, height)
+    
+    this.draw_lines(cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy)
+    this.draw_trajectories(cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy)
+    this.draw_bars(cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy)
+    this.draw_scatter(cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy)
+  }
+
+  /**
+   * Draw a grid as one path per cell and return its projected vertices
+   * (written into `screen` when its length matches)
+   */
+  private draw_grid_quads(grid: Grid, xyz: Float32Array, cell_rgba: Uint32Array, screen: Float32Array | undefined,
+                          cos_angle: number, sin_angle: number, cos_tilt: number,
+                          sin_tilt: number, scale: number, cx: number, cy: number): Float32Array {
+    // Rotate the cached unit vectors; no per-vertex trig is needed
+    screen = projectUnitVectors(xyz, cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy, screen)
+    
+    if (this.grid_layer) {
+      drawGridQuads(this.grid_layer.ctx, screen, grid.n_lat, grid.n_lon, cell_rgba, this.model.backface_culling,
+                    this.quads, this.edge_quads)
+    }
+    return screen
+  }
+
+  private draw_grid_raster(grid: Grid, cos_angle: number, sin_angle: number, cos_tilt: number,
+                           sin_tilt: number, scale: number, cx: number, cy: number): void {
+    if (!this.grid_layer || grid.lon_axis === null || grid.lat_axis === null) return
+    
+    const width = this.model.width ?? 800
+    const height = this.model.height ?? 800
+    
+    if (this.raster_image === undefined || this.raster_image.width != width || this.raster_image.height != height) {
+      this.raster_image = this.grid_layer.ctx.createImageData(width, height)
+      this.raster_pixels = new Uint32Array(this.raster_image.data.buffer)
+    }
+    const [lon_index, lat_index] = this.get_axis_indices(grid.lon_axis, grid.lat_axis)
+    rasterizeSphere(
+      this.raster_pixels!, width, height, lon_index, lat_index, grid.n_lon,
+      this.get_cell_rgba(grid), cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy
+    )
+    
+    // One pixel upload; pixels outside the disk stay transparent
+    this.grid_layer.ctx.putImageData(this.raster_image, 0, 0)
+  }
+
+  private draw_coastlines(cos_angle: number, sin_angle: number, cos_tilt: number, 
+                         sin_tilt: number, scale: number, cx: number, cy: number): void {
+    if (!this.overlay_layer) return
+    
+    this.overlay_layer.ctx.strokeStyle = this.model.coastline_color
+    this.overlay_layer.ctx.lineWidth = this.model.coastline_width
+    this.stroke_polylines(this.get_coast_lines(), cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy)
+  }
+
+  private draw_countries(cos_angle: number, sin_angle: number, cos_tilt: number, 
+                        sin_tilt: number, scale: number, cx: number, cy: number): void {
+    if (!this.overlay_layer) return
+    
+    this.overlay_layer.ctx.strokeStyle = this.model.country_color
+    this.overlay_layer.ctx.lineWidth = this.model.country_width
+    this.stroke_polylines(this.get_country_lines(), cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy)
+  }
+
+  private stroke_polylines(lines: PolylineSet, cos_angle: number, sin_angle: number, cos_tilt: number,
+                           sin_tilt: number, scale: number, cx: number, cy: number): void {
+    if (!this.overlay_layer) return
+    
+    // Depth is the dot product with the view direction, which lets whole
+    // segments behind the horizon be skipped by their bounding caps
+    const vx = sin_angle * cos_tilt
+    const vy = cos_angle * cos_tilt
+    const vz = -sin_tilt
+    const tolerance = POLYLINE_TOLERANCE / scale
+    
+    const {xyz, detail} = lines
+    const ctx = this.overlay_layer.ctx
+    ctx.beginPath()
+    
+    for (let k = 0; k < lines.count; k++) {
+      if (!lines.cap_visible(k, vx, vy, vz)) continue
+      
+      // Hidden vertices break the current polyline
+      let drawing = false
+      for (let v = lines.start[k]; v < lines.end[k]; v++) {
+        if (detail[v] < tolerance) continue
+        
+        const x = xyz[3 * v]
+        const y = xyz[3 * v + 1]
+        const z = xyz[3 * v + 2]
+        
+        const x_rot = x * cos_angle - y * sin_angle
+        const y_rot = x * sin_angle + y * cos_angle
+        const depth = y_rot * cos_tilt - z * sin_tilt
+        
+        if (depth > HORIZON_DEPTH) {
+          const px = cx + x_rot * scale
+          const py = cy - (y_rot * sin_tilt + z * cos_tilt) * scale
+          
+          if (!drawing) {
+            ctx.moveTo(px, py)
+            drawing = true
+          } else {
+            ctx.lineTo(px, py)
+          }
+        } else {
+          drawing = false
+        }
+      }
+    }
+    
+    ctx.stroke()
+  }
+
+  private draw_scatter(cos_angle: number, sin_angle: number, cos_tilt: number, 
+                      sin_tilt: number, scale: number, cx: number, cy: number): void {
+    const points = this.get_scatter_columns()
+    if (!this.overlay_layer || points.length == 0) return
+    
+    const ctx = this.overlay_layer.ctx
+    const size = points.get("size")
+    const color = points.get("color")
+    const border_color = points.get("border_color")
+    const border_width = points.get("border_width")
+    
+    const xyz = this.get_scatter_xyz()
+    const cells = this.get_scatter_cells()
+    const atlas = this.marker_atlas!
+    const n = xyz.length / 3
+    const s = this.scatter_screen = projectUnitVectors(xyz, cos_angle, sin_angle, cos_tilt, sin_tilt,
+                                                       scale, cx, cy, this.scatter_screen)
+    if (this.scatter_xy.length < 2 * n) {
+      this.scatter_xy = new Float64Array(2 * n)
+    }
+    const visible = this.scatter_visible
+    visible.reset(n)
+    
+    // Index the visible points
+    for (let i = 0; i < n; i++) {
+      if (s[3 * i + 2] > HORIZON_DEPTH) {
+        const px = s[3 * i]
+        const py = s[3 * i + 1]
+        const r = (size?.[i] || 5) + 3
+        this.scatter_xy[2 * i] = px
+        this.scatter_xy[2 * i + 1] = py
+        this.scatter_index.insert(i, px - r, py - r, px + r, py + r)
+        visible.push(i, s[3 * i + 2], 0)
+      }
+    }
+    
+    // Overlapping outlined markers need back-to-front order even when they
+    // share a style
+    const order = visible.sort_by_depth()
+    
+    for (let k = 0; k < visible.count; k++) {
+      const i = visible.vertex[order[k]]
+      const cell = cells[i]
+      if (cell >= 0) {
+        atlas.draw(ctx, cell, s[3 * i], s[3 * i + 1])
+        continue
+      }
+      ctx.beginPath()
+      ctx.arc(s[3 * i], s[3 * i + 1], size?.[i] || 5, 0, 2 * Math.PI)
+      ctx.fillStyle = color?.[i] || this.model.scatter_color
+      ctx.fill()
+      ctx.strokeStyle = border_color?.[i] || '#000000'
+      ctx.lineWidth = border_width?.[i] || 1
+      ctx.stroke()
+    }
+  }
+
+  private draw_trajectories(cos_angle: number, sin_angle: number, cos_tilt: number, 
+    sin_tilt: number, scale: number, cx: number, cy: number): void {
+    const trajectories = this.get_trajectory_columns()
+    if (!this.overlay_layer || trajectories.length == 0) return
+
+    const ctx = this.overlay_layer.ctx
+    const colors = trajectories.get("color")
+    const widths = trajectories.get("width")
+    const show_points_column = trajectories.get("show_points")
+    const point_sizes = trajectories.get("point_size")
+    const point_colors = trajectories.get("point_color")
+
+    // Only the rotation is redone per frame; the interpolated paths are cached
+    const arcs = this.get_trajectory_arcs(scale)
+    const s = this.trajectory_screen = projectUnitVectors(arcs.xyz, cos_angle, sin_angle, cos_tilt, sin_tilt,
+                                                          scale, cx, cy, this.trajectory_screen)
+
+    const fade = (depth: number) => {
+      if (depth > 0.1) {
+        return 1.0
+      } else if (depth < -0.3) {
+        return 0.08
+      } else {
+        // smooth ramp: t goes 0 (at depth -0.3) to 1 (at depth 0.1)
+        const t = (depth - (-0.3)) / (0.1 - (-0.3))
+        return 0.08 + (1.0 - 0.08) * (t * t)
+      }
+    }
+
+    // Alpha step of the segment starting at each vertex
+    const n_steps = TRAJECTORY_ALPHA_BUCKETS
+    if (this.trajectory_buckets.length < s.length / 3) {
+      this.trajectory_buckets = new Uint8Array(s.length / 3)
+    }
+    const buckets = this.trajectory_buckets
+    const used = new Uint8Array(n_steps)
+
+    for (let k = 0; k < arcs.count; k++) {
+      const color = colors?.[k] || this.model.trajectory_color
+      const width = widths?.[k] || 2.5
+      const show_points = show_points_column?.[k] ?? false
+      const point_size = point_sizes?.[k] || 4
+      const point_color = point_colors?.[k] || color
+
+      // --- Draw lines with depth-based alpha ---
+      ctx.lineCap = 'round'
+      ctx.lineJoin = 'round'
+      ctx.strokeStyle = color
+      ctx.lineWidth = width
+
+      const first = arcs.offsets[k]
+      const last = arcs.offsets[k + 1] - 1
+      used.fill(0)
+      for (let v = first; v < last; v++) {
+        const alpha = fade((s[3 * v + 2] + s[3 * v + 5]) / 2)
+        const b = Math.round((alpha - 0.08) / (1.0 - 0.08) * (n_steps - 1))
+        buckets[v] = b
+        used[b] = 1
+      }
+
+      // One path per step, faintest (furthest back) first; consecutive
+      // segments in the same step continue a single polyline
+      for (let b = 0; b < n_steps; b++) {
+        if (!used[b]) continue
+        ctx.globalAlpha = 0.08 + (1.0 - 0.08) * b / (n_steps - 1)
+        ctx.beginPath()
+        for (let v = first; v < last; v++) {
+          if (buckets[v] != b) continue
+          if (v == first || buckets[v - 1] != b) {
+            ctx.moveTo(s[3 * v], s[3 * v + 1])
+          }
+          ctx.lineTo(s[3 * v + 3], s[3 * v + 4])
+        }
+        ctx.stroke()
+      }
+
+      // --- Draw points with depth-based alpha ---
+      if (show_points) {
+        for (let j = arcs.knot_offsets[k]; j < arcs.knot_offsets[k + 1]; j++) {
+          const v = arcs.knots[j]
+          ctx.globalAlpha = fade(s[3 * v + 2])
+          ctx.beginPath()
+          ctx.arc(s[3 * v], s[3 * v + 1], point_size, 0, 2 * Math.PI)
+          ctx.fillStyle = point_color
+          ctx.fill()
+          ctx.strokeStyle = '#000000'
+          ctx.lineWidth = 1
+          ctx.stroke()
+        }
+      }
+
+      // Reset alpha after each trajectory
+      ctx.globalAlpha = 1.0
+    }
+  }
+
+
+  private draw_lines(cos_angle: number, sin_angle: number, cos_tilt: number, 
+                    sin_tilt: number, scale: number, cx: number, cy: number): void {
+    const lines = this.get_line_columns()
+    if (!this.overlay_layer || lines.length == 0) return
+    
+    const ctx = this.overlay_layer.ctx
+    const color = lines.get("color")
+    const width = lines.get("width")
+    
+    // Only the rotation is redone per frame; the great-circle arcs are cached
+    const arcs = this.get_line_arcs(scale)
+    const s = this.line_screen = projectUnitVectors(arcs.xyz, cos_angle, sin_angle, cos_tilt, sin_tilt,
+                                                    scale, cx, cy, this.line_screen)
+    
+    for (let k = 0; k < arcs.count; k++) {
+      ctx.strokeStyle = color?.[k] || this.model.line_color
+      ctx.lineWidth = width?.[k] || 2
+      ctx.beginPath()
+      
+      // Hidden vertices break the line
+      let drawing = false
+      for (let v = arcs.offsets[k]; v < arcs.offsets[k + 1]; v++) {
+        if (s[3 * v + 2] > HORIZON_DEPTH) {
+          if (!drawing) {
+            ctx.moveTo(s[3 * v], s[3 * v + 1])
+            drawing = true
+          } else {
+            ctx.lineTo(s[3 * v], s[3 * v + 1])
+          }
+        } else {
+          drawing = false
+        }
+      }
+      
+      ctx.stroke()
+    }
+  }
+
+  private calculate_lighting(lon: number, lat: number, light_x: number, light_y: number, light_z: number): number {
+    // Convert lon/lat to surface normal in world space
+    const lon_rad = lon * Math.PI / 180
+    const lat_rad = lat * Math.PI / 180
+    
+    const normal_x = Math.cos(lat_rad) * Math.cos(lon_rad)
+    const normal_y = Math.cos(lat_rad) * Math.sin(lon_rad)
+    const normal_z = Math.sin(lat_rad)
+    
+    // Calculate dot product (Lambert's cosine law)
+    const dot = normal_x * light_x + normal_y * light_y + normal_z * light_z
+    
+    // Clamp between 0 and 1, then apply intensity and ambient
+    const diffuse = Math.max(0, dot) * this.model.light_intensity
+    const lighting = this.model.ambient_light + diffuse
+    
+    return Math.min(1, lighting)
+  }
+
+  private draw_bars(cos_angle: number, sin_angle: number, cos_tilt: number, 
+                   sin_tilt: number, scale: number, cx: number, cy: number): void {
+    const bars = this.get_bar_columns()
+    const lon = bars.get("lon")
+    const lat = bars.get("lat")
+    if (!this.overlay_layer || bars.length == 0 || lon === null || lat === null) return
+    
+    const ctx = this.overlay_layer.ctx
+    const height = bars.get("height")
+    const width = bars.get("width")
+    const color = bars.get("color")
+    const border_color = bars.get("border_color")
+    const border_width = bars.get("border_width")
+    const label = bars.get("label")
+    
+    // Process each bar
+    const processed_bars = []
+    if (this.bar_xy.length < 2 * bars.length) {
+      this.bar_xy = new Float64Array(2 * bars.length)
+    }
+    
+    for (let bar_idx = 0; bar_idx < bars.length; bar_idx++) {
+      const lat_rad = lat[bar_idx] * Math.PI / 180
+      const lon_rad = -lon[bar_idx] * Math.PI / 180  // Note: negative lon
+      
+      // Base of bar (on sphere surface, radius = 1)
+      const x_base = Math.cos(lat_rad) * Math.cos(lon_rad)
+      const y_base = Math.cos(lat_rad) * Math.sin(lon_rad)
+      const z_base = Math.sin(lat_rad)
+      
+      // Top of bar (extended outward)
+      const bar_height_factor = height?.[bar_idx] || 100
+      const bar_radius = 1 + bar_height_factor * 0.0008  // Scale factor
+      const x_top = bar_radius * Math.cos(lat_rad) * Math.cos(lon_rad)
+      const y_top = bar_radius * Math.cos(lat_rad) * Math.sin(lon_rad)
+      const z_top = bar_radius * Math.sin(lat_rad)
+      
+      // Bar width and depth - REDUCED for smaller bars
+      const bar_width = (width?.[bar_idx] || 2) * 0.025  // Reduced from 0.025
+      const bar_depth = bar_width * 0.6  // Reduced from 0.6 for slimmer profile
+      
+      // Calculate perpendicular vectors for bar width (tangent)
+      const dx_width = -Math.sin(lon_rad) * bar_width / 2
+      const dy_width = Math.cos(lon_rad) * bar_width / 2
+      
+      // Calculate perpendicular vectors for bar depth (radial tangent)
+      // This is perpendicular to both the radial direction and the width direction
+      const dx_depth = -Math.cos(lat_rad) * Math.cos(lon_rad) * bar_depth / 2
+      const dy_depth = -Math.cos(lat_rad) * Math.sin(lon_rad) * bar_depth / 2
+      const dz_depth = Math.cos(lat_rad) * bar_depth / 2
+      
+      // Eight corners of the 3D bar (rectangular prism)
+      const corners = [
+        // Base corners (4 points)
+        {x: x_base - dx_width - dx_depth, y: y_base - dy_width - dy_depth, z: z_base - dz_depth},  // 0: base back-left
+        {x: x_base + dx_width - dx_depth, y: y_base + dy_width - dy_depth, z: z_base - dz_depth},  // 1: base back-right
+        {x: x_base + dx_width + dx_depth, y: y_base + dy_width + dy_depth, z: z_base + dz_depth},  // 2: base front-right
+        {x: x_base - dx_width + dx_depth, y: y_base - dy_width + dy_depth, z: z_base + dz_depth},  // 3: base front-left
+        // Top corners (4 points)
+        {x: x_top - dx_width - dx_depth, y: y_top - dy_width - dy_depth, z: z_top - dz_depth},     // 4: top back-left
+        {x: x_top + dx_width - dx_depth, y: y_top + dy_width - dy_depth, z: z_top - dz_depth},     // 5: top back-right
+        {x: x_top + dx_width + dx_depth, y: y_top + dy_width + dy_depth, z: z_top + dz_depth},     // 6: top front-right
+        {x: x_top - dx_width + dx_depth, y: y_top - dy_width + dy_depth, z: z_top + dz_depth}      // 7: top front-left
+      ]
+      
+      // Apply rotations to all corners
+      const rotated_corners = corners.map(corner => {
+        // Rotation around Z-axis (longitude rotation)
+        let x_rot = corner.x * cos_angle - corner.y * sin_angle
+        let y_rot = corner.x * sin_angle + corner.y * cos_angle
+        let z_rot = corner.z
+        
+        // Tilt around X-axis (latitude tilt)
+        const y_tilt = y_rot * cos_tilt - z_rot * sin_tilt
+        const z_tilt = y_rot * sin_tilt + z_rot * cos_tilt
+        
+        return {
+          x: x_rot,
+          y: y_tilt,
+          z: z_tilt,
+          screen_x: cx + x_rot * scale,
+          screen_y: cy - z_tilt * scale
+        }
+      })
+      
+      // The base corners are symmetric about the base, so their mean is its
+      // projection; index it for hover hit-testing
+      const base = rotated_corners.slice(0, 4)
+      const base_depth = base.reduce((sum, c) => sum + c.y, 0) / 4
+      if (base_depth > HORIZON_DEPTH) {
+        const base_x = base.reduce((sum, c) => sum + c.screen_x, 0) / 4
+        const base_y = base.reduce((sum, c) => sum + c.screen_y, 0) / 4
+        const half_width = width?.[bar_idx] || 2
+        this.bar_xy[2 * bar_idx] = base_x
+        this.bar_xy[2 * bar_idx + 1] = base_y
+        this.bar_index.insert(bar_idx, base_x - half_width, base_y + Math.min(-height?.[bar_idx] * 0.2, 5),
+                              base_x + half_width, base_y + 5)
+      }
+      
+      // Check if bar is visible
+      const is_visible = rotated_corners.some(c => c.y > -0.1)
+      
+      if (is_visible) {
+        // Calculate average depth for sorting
+        const avg_depth = rotated_corners.reduce((sum, c) => sum + c.y, 0) / rotated_corners.length
+        
+        processed_bars.push({
+          corners: rotated_corners,
+          color: color?.[bar_idx] || this.model.bar_color,
+          border_color: border_color?.[bar_idx] || '#000000',
+          border_width: border_width?.[bar_idx] || 1,
+          depth: avg_depth,
+          label: label?.[bar_idx]
+        })
+      }
+    }
+    
+    // Sort by depth (back to front)
+    processed_bars.sort((a, b) => a.depth - b.depth)
+    
+    // Draw bars with multiple faces
+    for (const bar of processed_bars) {
+      const c = bar.corners
+      const base_color = bar.color
+      
+      // Define faces with their corner indices and shading
+      const faces = [
+        // Back face (indices 0,1,5,4) - darkest
+        {indices: [0, 1, 5, 4], shade: 0.5},
+        // Left face (indices 0,4,7,3) - dark
+        {indices: [0, 4, 7, 3], shade: 0.65},
+        // Right face (indices 1,2,6,5) - medium
+        {indices: [1, 2, 6, 5], shade: 0.75},
+        // Front face (indices 3,7,6,2) - brightest
+        {indices: [3, 7, 6, 2], shade: 0.9},
+        // Top face (indices 4,5,6,7) - top
+        {indices: [4, 5, 6, 7], shade: 1.0}
+      ]
+      
+      // Draw each face
+      for (const face of faces) {
+        const face_corners = face.indices.map(i => c[i])
+        
+        // Only draw if face is facing forward (simple check)
+        const avg_y = face_corners.reduce((sum, p) => sum + p.y, 0) / face_corners.length
+        if (avg_y < -0.15) continue  // Skip faces pointing away
+        
+        // Apply shading
+        const shaded_color = this.darkenColor(base_color, face.shade)
+        
+        ctx.fillStyle = shaded_color
+        ctx.strokeStyle = bar.border_color
+        ctx.lineWidth = bar.border_width
+        
+        ctx.beginPath()
+        ctx.moveTo(face_corners[0].screen_x, face_corners[0].screen_y)
+        for (let i = 1; i < face_corners.length; i++) {
+          ctx.lineTo(face_corners[i].screen_x, face_corners[i].screen_y)
+        }
+        ctx.closePath()
+        ctx.fill()
+        ctx.stroke()
+      }
+    }
+  }
+
+  private darkenColor(color: string, factor: number): string {
+    const r = parseInt(color.slice(1, 3), 16)
+    const g = parseInt(color.slice(3, 5), 16)
+    const b = parseInt(color.slice(5, 7), 16)
+    
+    return `#${Math.floor(r * factor).toString(16).padStart(2, '0')}${Math.floor(g * factor).toString(16).padStart(2, '0')}${Math.floor(b * factor).toString(16).padStart(2, '0')}`
+  }
+
+  // private lightenColor(color: string, factor: number): string {
+  //   const r = parseInt(color.slice(1, 3), 16)
+  //   const g = parseInt(color.slice(3, 5), 16)
+  //   const b = parseInt(color.slice(5, 7), 16)
+    
+  //   return `#${Math.min(255, Math.floor(r * factor)).toString(16).padStart(2, '0')}${Math.min(255, Math.floor(g * factor)).toString(16).padStart(2, '0')}${Math.min(255, Math.floor(b * factor)).toString(16).padStart(2, '0')}`
+  // }
+
+  private update_tooltip(): void {
+    if (!this.tooltip_el || !this.canvas || !this.ctx) return
+    
+    const mouse_x = this.mouse_x
+    const mouse_y = this.mouse_y
+    
+    // Check bar data first
+    const bars = this.get_bar_columns()
+    const bar_width = bars.get("width")
+    const bar_height = bars.get("height")
+    const bar_xy = this.bar_xy
+    const bar_idx = this.bar_index.find(mouse_x, mouse_y, (i) => {
+      if (i >= bars.length) return false
+      const dist_x = Math.abs(mouse_x - bar_xy[2 * i])
+      const dist_y = mouse_y - bar_xy[2 * i + 1]
+      return dist_x < (bar_width?.[i] || 2) && dist_y > -bar_height?.[i] * 0.2 && dist_y < 5
+    })
+    if (bar_idx >= 0) {
+      const label = bars.get("label")?.[bar_idx]
+      this.tooltip_el.innerHTML = label || `Bar: ${Number(bar_height?.[bar_idx]).toFixed(2)}`
+      this.tooltip_el.style.display = 'block'
+      this.tooltip_el.style.left = `${mouse_x + 15}px`
+      this.tooltip_el.style.top = `${mouse_y - 30}px`
+      return
+    }
+    
+    // Check scatter points
+    const points = this.get_scatter_columns()
+    const point_size = points.get("size")
+    const scatter_xy = this.scatter_xy
+    const point_idx = this.scatter_index.find(mouse_x, mouse_y, (i) => {
+      if (i >= points.length) return false
+      const dist = Math.sqrt((mouse_x - scatter_xy[2 * i]) ** 2 + 
+                             (mouse_y - scatter_xy[2 * i + 1]) ** 2)
+      return dist < (point_size?.[i] || 5) + 3
+    })
+    if (point_idx >= 0) {
+      const label = points.get("label")?.[point_idx]
+      const lon = Number(points.get("lon")![point_idx])
+      const lat = Number(points.get("lat")![point_idx])
+      this.tooltip_el.innerHTML = label || `(${lon.toFixed(2)}, ${lat.toFixed(2)})`
+      this.tooltip_el.style.display = 'block'
+      this.tooltip_el.style.left = `${mouse_x + 15}px`
+      this.tooltip_el.style.top = `${mouse_y - 30}px`
+      return
+    }
+    
+    // Check grid values: inverse-project the mouse to lon/lat and look the
+    // value up by index, so no pixels are read back from the canvas
+    const {cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy} = this.get_camera()
+    const lonlat = unprojectSphere(
+      (this.mouse_x - cx) / scale, (cy - this.mouse_y) / scale,
+      cos_angle, sin_angle, cos_tilt, sin_tilt
+    )
+    const c = lonlat !== null ? this.locate_grid_cell(lonlat.lon, lonlat.lat) : -1
+    const {n_lat, n_lon} = this.get_grid()
+    const values = this.get_values()
+    
+    if (c >= 0 && values.length >= n_lat * n_lon) {
+      // The cell's value, which is what its color shows
+      const value = cellValue(values, n_lon, Math.floor(c / (n_lon - 1)), c % (n_lon - 1))
+      
+      this.tooltip_el.innerHTML = `Value: ${value.toFixed(2)}`
+      this.tooltip_el.style.display = 'block'
+      this.tooltip_el.style.left = `${this.mouse_x + 15}px`
+      this.tooltip_el.style.top = `${this.mouse_y - 30}px`
+    } else {
+      this.tooltip_el.style.display = 'none'
+    }
+  }
+
+  private start_autorotation(): void {
+    if (this.animation_id !== undefined) return
+    
+    const animate = () => {
+      if (!this.model.autorotate || this.is_dragging) return
+      
+      this.interacting = true
+      this.model.rotation = (this.model.rotation + this.model.rotation_speed * 0.5) % 360
+      this.interacting = false
+      this.animation_id = requestAnimationFrame(animate)
+    }
+    
+    animate()
+  }
+
+  private stop_autorotation(): void {
+    if (this.animation_id !== undefined) {
+      cancelAnimationFrame(this.animation_id)
+      this.animation_id = undefined
+    }
+  }
+
+  private start_playback(): void {
+    if (this.playback_id !== undefined) return
+    
+    const step = (now: number) => {
+      this.playback_id = undefined
+      if (!this.model.playing) return
+      
+      const n_frames = this.n_frames()
+      const interval = 1000 / Math.max(this.model.playback_fps, 1e-3)
+      if (this.playback_last === undefined) {
+        this.playback_last = now
+      } else if (n_frames > 0 && now - this.playback_last >= interval) {
+        this.playback_last = now
+        const next = this.frame_index() + 1
+        if (next < n_frames) {
+          this.model.time_index = next
+        } else if (this.model.playback_loop) {
+          this.model.time_index = 0
+        } else {
+          this.model.playing = false
+          return
+        }
+      }
+      this.playback_id = requestAnimationFrame(step)
+    }
+    
+    this.playback_id = requestAnimationFrame(step)
+  }
+
+  private stop_playback(): void {
+    if (this.playback_id !== undefined) {
+      cancelAnimationFrame(this.playback_id)
+      this.playback_id = undefined
+    }
+    this.playback_last = undefined
+  }
+
+  override remove(): void {
+    this.stop_autorotation()
+    this.stop_playback()
+    this.stop_render_worker()
+    if (this.render_frame_id !== undefined) {
+      cancelAnimationFrame(this.render_frame_id)
+      this.render_frame_id = undefined
+    }
+    if (this.rotation_resume_timeout) {
+      clearTimeout(this.rotation_resume_timeout)
+    }
+    if (this.refine_timeout !== undefined) {
+      clearTimeout(this.refine_timeout)
+    }
+    super.remove()
+  }
+}
+
+export namespace GriddedSphere {
+  export type Attrs = p.AttrsOf<Props>
+
+  export type Props = LayoutDOM.Props & {
+    lons: p.Property<Arrayable<number>>
+    lats: p.Property<Arrayable<number>>
+    values: p.Property<Arrayable<number>>
+    values_patch: p.Property<{indices: Arrayable<number>, values: Arrayable<number>} | null>
+    values_cube: p.Property<Arrayable<number>>
+    time_index: p.Property<number>
+    playing: p.Property<boolean>
+    playback_fps: p.Property<number>
+    playback_loop: p.Property<boolean>
+    frame_cache_size: p.Property<number>
+    cube_color_range: p.Property<"cube" | "frame">
+    lon_axis: p.Property<Arrayable<number>>
+    lat_axis: p.Property<Arrayable<number>>
+    lon_start: p.Property<number>
+    lon_step: p.Property<number>
+    lat_start: p.Property<number>
+    lat_step: p.Property<number>
+    n_lat: p.Property<number>
+    n_lon: p.Property<number>
+    palette: p.Property<string>
+    vmin: p.Property<number>
+    vmax: p.Property<number>
+    nan_color: p.Property<string>
+    rotation: p.Property<number>
+    tilt: p.Property<number>
+    zoom: p.Property<number>
+    autorotate: p.Property<boolean>
+    rotation_speed: p.Property<number>
+    show_coastlines: p.Property<boolean>
+    coastline_color: p.Property<string>
+    coastline_width: p.Property<number>
+    coast_lons: p.Property<Arrayable<number | null>>
+    coast_lats: p.Property<Arrayable<number | null>>
+    show_countries: p.Property<boolean>
+    country_color: p.Property<string>
+    country_width: p.Property<number>
+    country_lons: p.Property<Arrayable<number | null>>
+    country_lats: p.Property<Arrayable<number | null>>
+    enable_hover: p.Property<boolean>
+    scatter_data: p.Property<any[]>
+    scatter_source: p.Property<ColumnarDataSource | null>
+    scatter_color: p.Property<string>
+    line_data: p.Property<any[]>
+    line_source: p.Property<ColumnarDataSource | null>
+    line_color: p.Property<string>
+    bar_data: p.Property<any[]>
+    bar_source: p.Property<ColumnarDataSource | null>
+    bar_color: p.Property<string>
+    trajectory_data: p.Property<any[]>
+    trajectory_source: p.Property<ColumnarDataSource | null>
+    trajectory_color: p.Property<string>
+    show_colorbar: p.Property<boolean>
+    colorbar_title: p.Property<string>
+    background_color: p.Property<string>
+    colorbar_text_color: p.Property<string>
+    backface_culling: p.Property<boolean>
+    grid_renderer: p.Property<"path" | "raster">
+    lod_factors: p.Property<number[]>
+    lod_frame_budget: p.Property<number>
+    render_in_worker: p.Property<boolean>
+    geometry: p.Property<SphereGeometry | null>
+    enable_lighting: p.Property<boolean>
+    light_azimuth: p.Property<number>
+    light_elevation: p.Property<number>
+    light_intensity: p.Property<number>
+    ambient_light: p.Property<number>
+  }
+}
+
+export interface GriddedSphere extends GriddedSphere.Attrs {}
+
+export class GriddedSphere extends LayoutDOM {
+  declare properties: GriddedSphere.Props
+  declare __view_type__: GriddedSphereView
+
+  static override __module__ = "bokeh_gridded_sphere"
+
+  constructor(attrs?: Partial<GriddedSphere.Attrs>) {
+    super(attrs)
+  }
+
+  static {
+    this.prototype.default_view = GriddedSphereView
+
+    this.define<GriddedSphere.Props>(({Any, Arrayable, Bool, Enum, Float, Int, List, Nullable, Ref, String, Struct}) => ({
+      lons: [ Arrayable(Float), [] ],
+      lats: [ Arrayable(Float), [] ],
+      values: [ Arrayable(Float), [] ],
+      values_patch: [ Nullable(Struct({indices: Arrayable(Int), values: Arrayable(Float)})), null ],
+      values_cube: [ Arrayable(Float), [] ],
+      time_index: [ Int, 0 ],
+      playing: [ Bool, false ],
+      playback_fps: [ Float, 4 ],
+      playback_loop: [ Bool, true ],
+      frame_cache_size: [ Int, 32 ],
+      cube_color_range: [ Enum("cube", "frame"), "frame" ],
+      lon_axis: [ Arrayable(Float), [] ],
+      lat_axis: [ Arrayable(Float), [] ],
+      lon_start: [ Float, NaN ],
+      lon_step: [ Float, NaN ],
+      lat_start: [ Float, NaN ],
+      lat_step: [ Float, NaN ],
+      n_lat: [ Int, 30 ],
+      n_lon: [ Int, 60 ],
+      palette: [ String, 'Turbo256' ],
+      vmin: [ Float, NaN ],
+      vmax: [ Float, NaN ],
+      nan_color: [ String, '#808080' ],
+      rotation: [ Float, 0 ],
+      tilt: [ Float, 0 ],
+      zoom: [ Float, 1.0 ],
+      autorotate: [ Bool, false ],
+      rotation_speed: [ Float, 1.0 ],
+      show_coastlines: [ Bool, true ],
+      coastline_color: [ String, '#000000' ],
+      coastline_width: [ Float, 0.4 ],
+      coast_lons: [ Arrayable(Nullable(Float)), [] ],
+      coast_lats: [ Arrayable(Nullable(Float)), [] ],
+      show_countries: [ Bool, false ],
+      country_color: [ String, '#333333' ],
+      country_width: [ Float, 0.4 ],
+      country_lons: [ Arrayable(Nullable(Float)), [] ],
+      country_lats: [ Arrayable(Nullable(Float)), [] ],
+      enable_hover: [ Bool, true ],
+      scatter_data: [ List(Any), [] ],
+      scatter_source: [ Nullable(Ref(ColumnarDataSource)), null ],
+      scatter_color: [ String, '#ff0000' ],
+      line_data: [ List(Any), [] ],
+      line_source: [ Nullable(Ref(ColumnarDataSource)), null ],
+      line_color: [ String, '#0000ff' ],
+      bar_data: [ List(Any), [] ],
+      bar_source: [ Nullable(Ref(ColumnarDataSource)), null ],
+      bar_color: [ String, '#00ff00' ],
+      trajectory_data: [ List(Any), [] ],
+      trajectory_source: [ Nullable(Ref(ColumnarDataSource)), null ],
+      trajectory_color: [ String, '#ff00ff' ],
+      show_colorbar: [ Bool, true ],
+      colorbar_title: [ String, 'Value' ],
+      background_color: [ String, '#0a0a0a' ],
+      colorbar_text_color: [ String, '#ffffff' ],
+      backface_culling: [ Bool, false ],
+      grid_renderer: [ Enum("path", "raster"), "path" ],
+      lod_factors: [ List(Int), [2, 4, 8] ],
+      lod_frame_budget: [ Float, 30 ],
+      render_in_worker: [ Bool, false ],
+      geometry: [ Nullable(Ref(SphereGeometry)), null ],
+      enable_lighting: [ Bool, false ],
+      light_azimuth: [ Float, -45 ],
+      light_elevation: [ Float, 45 ],
+      light_intensity: [ Float, 0.8 ],
+      ambient_light: [ Float, 0.3 ],
+    }))
+  }
+}
\ No newline at end of file
@@ -0,0 +1,7 @@
+import * as GriddedSphere from "./gridded_sphere"
+import * as SphereGeometry from "./sphere_geometry"
+export {GriddedSphere, SphereGeometry}
+
+import {register_models} from "@bokehjs/base"
+register_models(GriddedSphere)
+register_models(SphereGeometry)
@@ -0,0 +1,30 @@
+/**
+ * Offscreen canvas layers composited onto the visible canvas
+ */
+
+/**
+ * One part of the scene drawn on a canvas of its own, so it is redrawn
+ * only when its own inputs change and otherwise just composited again
+ */
+export class CanvasLayer {
+  readonly canvas: HTMLCanvasElement
+  readonly ctx: CanvasRenderingContext2D
+
+  constructor() {
+    this.canvas = document.createElement('canvas')
+    this.ctx = this.canvas.getContext('2d')!
+  }
+
+  /**
+   * Clear the layer for redrawing, resizing it first if the view changed size
+   */
+  reset(width: number, height: number): void {
+    if (this.canvas.width != width || this.canvas.height != height) {
+      // Resizing a canvas also clears it
+      this.canvas.width = width
+      this.canvas.height = height
+    } else {
+      this.ctx.clearRect(0, 0, width, height)
+    }
+  }
+}
@@ -0,0 +1,131 @@
+/**
+ * Level-of-detail pyramid for interactive rendering of large grids
+ */
+
+import type {Arrayable} from "@bokehjs/core/types"
+import type {Grid} from "./grid"
+
+export interface LodLevel {
+  // Every factor-th vertex of the full grid is kept in each direction
+  factor: number
+  grid: Grid
+  values: Float64Array
+}
+
+/**
+ * Indices of the vertices kept along an axis of n vertices: every factor-th
+ * one, plus the last so the coarse grid covers the same extent
+ */
+function coarseIndices(n: number, factor: number): Int32Array {
+  const m = n > 0 ? Math.ceil((n - 1) / factor) + 1 : 0
+  const idx = new Int32Array(m)
+  for (let k = 0; k < m; k++) {
+    idx[k] = Math.min(k * factor, n - 1)
+  }
+  return idx
+}
+
+/**
+ * Coarsen a grid and its vertex values by `factor`.
+ *
+ * Each kept vertex takes the mean of the finite values in a window of
+ * factor + 1 vertices centred on it (clipped at the edges), so NaN gaps
+ * only show at the coarse level where no finite value is nearby. The mean
+ * is separable and computed row pass then column pass, in O(n_lat * n_lon).
+ */
+export function coarsenGrid(grid: Grid, values: Arrayable<number>, factor: number): LodLevel {
+  const {n_lat, n_lon} = grid
+  const lat_idx = coarseIndices(n_lat, factor)
+  const lon_idx = coarseIndices(n_lon, factor)
+  const m_lat = lat_idx.length
+  const m_lon = lon_idx.length
+  const half = factor >> 1
+
+  const lons = new Float64Array(m_lat * m_lon)
+  const lats = new Float64Array(m_lat * m_lon)
+  for (let I = 0; I < m_lat; I++) {
+    for (let J = 0; J < m_lon; J++) {
+      const k = lat_idx[I] * n_lon + lon_idx[J]
+      lons[I * m_lon + J] = grid.lons[k]
+      lats[I * m_lon + J] = grid.lats[k]
+    }
+  }
+
+  let lon_axis: Float64Array | null = null
+  let lat_axis: Float64Array | null = null
+  if (grid.lon_axis !== null && grid.lat_axis !== null) {
+    lon_axis = new Float64Array(m_lon)
+    lat_axis = new Float64Array(m_lat)
+    for (let J = 0; J < m_lon; J++) {
+      lon_axis[J] = grid.lon_axis[lon_idx[J]]
+    }
+    for (let I = 0; I < m_lat; I++) {
+      lat_axis[I] = grid.lat_axis[lat_idx[I]]
+    }
+  }
+
+  // Row pass: finite sum and count along lon for every full-resolution row
+  const row_sum = new Float64Array(n_lat * m_lon)
+  const row_count = new Float64Array(n_lat * m_lon)
+  const n_values = Math.min(values.length, n_lat * n_lon)
+  for (let i = 0; i < n_lat; i++) {
+    for (let J = 0; J < m_lon; J++) {
+      const j0 = Math.max(0, lon_idx[J] - half)
+      const j1 = Math.min(n_lon - 1, lon_idx[J] + half)
+      let sum = 0
+      let count = 0
+      for (let j = j0; j <= j1; j++) {
+        const k = i * n_lon + j
+        const v = k < n_values ? values[k] : NaN
+        if (!isNaN(v)) {
+          sum += v
+          count++
+        }
+      }
+      row_sum[i * m_lon + J] = sum
+      row_count[i * m_lon + J] = count
+    }
+  }
+
+  // Column pass over the row sums
+  const coarse = new Float64Array(m_lat * m_lon)
+  for (let I = 0; I < m_lat; I++) {
+    const i0 = Math.max(0, lat_idx[I] - half)
+    const i1 = Math.min(n_lat - 1, lat_idx[I] + half)
+    for (let J = 0; J < m_lon; J++) {
+      let sum = 0
+      let count = 0
+      for (let i = i0; i <= i1; i++) {
+        sum += row_sum[i * m_lon + J]
+        count += row_count[i * m_lon + J]
+      }
+      coarse[I * m_lon + J] = count > 0 ? sum / count : NaN
+    }
+  }
+
+  return {
+    factor,
+    grid: {n_lat: m_lat, n_lon: m_lon, lon_axis, lat_axis, lons, lats},
+    values: coarse,
+  }
+}
+
+/**
+ * Coarsened levels of a grid, finest first. Factors that would not shrink
+ * the grid, or would collapse it below one cell, are skipped.
+ */
+export function buildLodPyramid(grid: Grid, values: Arrayable<number>, factors: Arrayable<number>): LodLevel[] {
+  const sorted = Array.from(factors).filter((f) => f >= 2).sort((a, b) => a - b)
+  const levels: LodLevel[] = []
+  let n_cells = (grid.n_lat - 1) * (grid.n_lon - 1)
+  for (const factor of sorted) {
+    const f = Math.floor(factor)
+    const m_lat = Math.ceil((grid.n_lat - 1) / f) + 1
+    const m_lon = Math.ceil((grid.n_lon - 1) / f) + 1
+    const m_cells = (m_lat - 1) * (m_lon - 1)
+    if (m_lat < 2 || m_lon < 2 || m_cells >= n_cells) continue
+    levels.push(coarsenGrid(grid, values, f))
+    n_cells = m_cells
+  }
+  return levels
+}
@@ -0,0 +1,294 @@
+"""
+GriddedSphere - Python wrapper for gridded sphere visualization
+"""
+from bokeh.core.properties import (
+    Int, Float, String, List, Bool, Any, Array, Either, Enum, Instance, Nullable, Struct
+)
+from bokeh.model import Model
+from bokeh.models import ColumnarDataSource, ColumnDataSource, LayoutDOM
+import numpy as np
+
+from . import warn_if_stale
+from .geodata import load_polylines
+
+warn_if_stale()
+
+class SphereGeometry(Model):
+    """Geometry shared by several GriddedSphere instances
+    
+    Coastlines, country borders and optionally the grid are serialized once
+    per document however many spheres reference them, and projected once in
+    the browser for all of their views. A sphere uses the geometry's grid
+    when it defines one, and its coastlines/countries when they are set.
+    """
+    
+    # Implemented by the prebuilt extension bundle in dist/
+    __view_module__ = "bokeh_gridded_sphere"
+    
+    coast_lons = Either(Array(Any), List(Any), default=[])
+    coast_lats = Either(Array(Any), List(Any), default=[])
+    country_lons = Either(Array(Any), List(Any), default=[])
+    country_lats = Either(Array(Any), List(Any), default=[])
+    # Same grid layouts as GriddedSphere; no grid by default
+    lons = Either(Array(Any), List(Float), default=[])
+    lats = Either(Array(Any), List(Float), default=[])
+    lon_axis = Either(Array(Any), List(Float), default=[])
+    lat_axis = Either(Array(Any), List(Float), default=[])
+    lon_start = Float(float('nan'))
+    lon_step = Float(float('nan'))
+    lat_start = Float(float('nan'))
+    lat_step = Float(float('nan'))
+    n_lat = Int(0)
+    n_lon = Int(0)
+    
+    def __init__(self, **kwargs):
+        if len(kwargs.get('lon_axis', [])) and 'n_lon' not in kwargs:
+            kwargs['n_lon'] = len(kwargs['lon_axis'])
+        if len(kwargs.get('lat_axis', [])) and 'n_lat' not in kwargs:
+            kwargs['n_lat'] = len(kwargs['lat_axis'])
+        super().__init__(**kwargs)
+    
+    def __setattr__(self, name, value):
+        if name in GriddedSphere._float_array_props and isinstance(value, np.ndarray):
+            value = GriddedSphere._as_float_array(value)
+        super().__setattr__(name, value)
+    
+    @classmethod
+    def bundled(cls, countries=False, **kwargs):
+        """Geometry with the bundled coastlines, and country borders if requested"""
+        kwargs.setdefault('coast_lons', [])
+        kwargs.setdefault('coast_lats', [])
+        if len(kwargs['coast_lons']) == 0:
+            kwargs['coast_lons'], kwargs['coast_lats'] = GriddedSphere._load_coastlines_bundled()
+        if countries and len(kwargs.get('country_lons', [])) == 0:
+            kwargs['country_lons'], kwargs['country_lats'] = GriddedSphere._load_countries_bundled()
+        return cls(**kwargs)
+
+class GriddedSphere(LayoutDOM):
+    """Sphere with gridded data"""
+    
+    __view_module__ = "bokeh_gridded_sphere"
+    
+    # Grid arrays accept plain lists or NumPy arrays. NumPy arrays are sent as
+    # binary buffers and arrive in the browser as Float32Array/Float64Array.
+    lons = Either(Array(Any), List(Float), default=[])
+    lats = Either(Array(Any), List(Float), default=[])
+    values = Either(Array(Any), List(Float), default=[])
+    # Time series: a (n_time, n_lat, n_lon) cube sent as one flat binary
+    # buffer. When given it is displayed instead of ``values``, one frame at a
+    # time
+    values_cube = Either(Array(Any), List(Float), default=[])
+    time_index = Int(0)
+    # Built-in playback clock advancing time_index
+    playing = Bool(False)
+    playback_fps = Float(4.0)
+    playback_loop = Bool(True)
+    # Number of frames whose cell colors the browser keeps cached
+    frame_cache_size = Int(32)
+    # Automatic color range of a cube: each frame's own ("frame"), or the
+    # range over all frames ("cube") so colors are comparable across frames
+    cube_color_range = Enum("cube", "frame", default="frame")
+    # Last partial update of ``values``, set by patch_values(); only the
+    # changed vertices and their new values are sent
+    values_patch = Nullable(Struct(
+        indices=Either(Array(Any), List(Int)),
+        values=Either(Array(Any), List(Float)),
+    ), default=None)
+    # Regular grids can be given as 1-D axes, or as start/step with n_lon/n_lat,
+    # instead of a full mesh; the view generates the vertex positions itself.
+    lon_axis = Either(Array(Any), List(Float), default=[])
+    lat_axis = Either(Array(Any), List(Float), default=[])
+    lon_start = Float(float('nan'))
+    lon_step = Float(float('nan'))
+    lat_start = Float(float('nan'))
+    lat_step = Float(float('nan'))
+    n_lat = Int(30)
+    n_lon = Int(60)
+    palette = String("Turbo256")
+    vmin = Float(float('nan'))
+    vmax = Float(float('nan'))
+    nan_color = String("#808080")
+    rotation = Float(0)
+    tilt = Float(0)
+    zoom = Float(1.0)
+    autorotate = Bool(False)
+    rotation_speed = Float(1.0)
+    show_coastlines = Bool(True)
+    coastline_color = String("#000000")
+    coastline_width = Float(0.4)
+    # Polylines separated by NaN (or None in plain lists)
+    coast_lons = Either(Array(Any), List(Any), default=[])
+    coast_lats = Either(Array(Any), List(Any), default=[])
+    show_countries = Bool(False)
+    country_color = String("#333333")
+    country_width = Float(0.4)
+    country_lons = Either(Array(Any), List(Any), default=[])
+    country_lats = Either(Array(Any), List(Any), default=[])
+    enable_hover = Bool(True)
+    # Overlays take either a list of per-item dicts (*_data) or, for large or
+    # live data, a ColumnDataSource (*_source) with one row per item and the
+    # dicts' keys as columns. NumPy columns are sent as binary buffers, and
+    # stream()/patch() on the source update the view incrementally. Lines
+    # and trajectories hold ragged "lons"/"lats" (and "altitudes") columns
+    # instead of "coords". A dict of columns is wrapped in a source.
+    scatter_data = List(Any, default=[])
+    scatter_source = Nullable(Instance(ColumnarDataSource), default=None)
+    scatter_color = String("#ff0000")
+    line_data = List(Any, default=[])
+    line_source = Nullable(Instance(ColumnarDataSource), default=None)
+    line_color = String("#0000ff")
+    bar_data = List(Any, default=[])
+    bar_source = Nullable(Instance(ColumnarDataSource), default=None)
+    bar_color = String("#00ff00")
+    trajectory_data = List(Any, default=[])
+    trajectory_source = Nullable(Instance(ColumnarDataSource), default=None)
+    trajectory_color = String("#ff00ff")
+    show_colorbar = Bool(True)
+    colorbar_title = String("Value")
+    background_color = String("#0a0a0a")
+    colorbar_text_color = String("#ffffff")
+    # Draw only cells facing the viewer (no horizon band, no depth sort)
+    backface_culling = Bool(False)
+    # "raster" draws regular grids per pixel into one ImageData instead of
+    # one canvas path per cell; curvilinear grids always use "path"
+    grid_renderer = Enum("path", "raster", default="path")
+    # Shared coastlines/countries/grid; see SphereGeometry
+    geometry = Nullable(Instance(SphereGeometry), default=None)
+    # While dragging, zooming or autorotating, path rendering switches to a
+    # grid coarsened by one of these factors (NaN-aware means) whenever the
+    # full grid would take longer than lod_frame_budget ms to draw, and
+    # refines to full resolution once the motion stops. 0 disables it.
+    lod_factors = List(Int, default=[2, 4, 8])
+    lod_frame_budget = Float(30.0)
+    # Draw the field in a Web Worker on an OffscreenCanvas, keeping the main
+    # thread free for input and overlays. Falls back to the main thread
+    # where OffscreenCanvas is unavailable. Read when the view is created.
+    render_in_worker = Bool(False)
+    enable_lighting = Bool(False)
+    light_azimuth = Float(-45.0)
+    light_elevation = Float(45.0)
+    light_intensity = Float(0.8)
+    ambient_light = Float(0.3)
+    
+    def __init__(self, **kwargs):
+        # Grid dimensions follow the axes when only axes are given
+        if len(kwargs.get('lon_axis', [])) and 'n_lon' not in kwargs:
+            kwargs['n_lon'] = len(kwargs['lon_axis'])
+        if len(kwargs.get('lat_axis', [])) and 'n_lat' not in kwargs:
+            kwargs['n_lat'] = len(kwargs['lat_axis'])
+        # ... or the shape of a 3-D cube
+        cube = kwargs.get('values_cube')
+        if isinstance(cube, np.ndarray) and cube.ndim == 3:
+            kwargs.setdefault('n_lat', cube.shape[1])
+            kwargs.setdefault('n_lon', cube.shape[2])
+        
+        # Auto-load coastlines if show_coastlines=True and coast_lons is empty,
+        # unless they come from a shared geometry
+        geometry = kwargs.get('geometry')
+        shared_coast = geometry is not None and len(geometry.coast_lons) > 0
+        shared_countries = geometry is not None and len(geometry.country_lons) > 0
+        if (kwargs.get('show_coastlines', True) and not shared_coast
+                and len(kwargs.get('coast_lons', [])) == 0):
+            coast_lons_data, coast_lats_data = self._load_coastlines_bundled()
+            if len(coast_lons_data):
+                kwargs['coast_lons'] = coast_lons_data
+                kwargs['coast_lats'] = coast_lats_data
+        
+        # Auto-load countries if show_countries=True and country_lons is empty
+        if (kwargs.get('show_countries', False) and not shared_countries
+                and len(kwargs.get('country_lons', [])) == 0):
+            country_lons_data, country_lats_data = self._load_countries_bundled()
+            if len(country_lons_data):
+                kwargs['country_lons'] = country_lons_data
+                kwargs['country_lats'] = country_lats_data
+        
+        super().__init__(**kwargs)
+    
+    _float_array_props = ('lons', 'lats', 'values', 'values_cube', 'lon_axis', 'lat_axis',
+                          'coast_lons', 'coast_lats', 'country_lons', 'country_lats')
+    
+    _source_props = ('scatter_source', 'line_source', 'bar_source', 'trajectory_source')
+    
+    def __setattr__(self, name, value):
+        if name in self._float_array_props and isinstance(value, np.ndarray):
+            # patch_values writes into values, so it never aliases the caller's array
+            value = self._as_float_array(value, copy=(name == 'values'))
+        self._assign(name, value)
+    
+    def _assign(self, name, value):
+        """Set a property from a value already converted for transport"""
+        if name in self._source_props and isinstance(value, dict):
+            value = ColumnDataSource(data=value)
+        if name == 'values' and getattr(self, 'values_patch', None) is not None:
+            # A full update supersedes the last patch, so that repeating the
+            # same patch afterwards still registers as a change
+            super().__setattr__('values_patch', None)
+        super().__setattr__(name, value)
+    
+    def patch_values(self, key, data):
+        """Update part of ``values`` and send only the changed vertices.
+        
+        ``key`` selects vertices of the grid: flat indices, a slice or a
+        boolean mask over the flattened values, or a ``(lat, lon)`` tuple of
+        indices/slices for a 2-D region of the ``(n_lat, n_lon)`` grid.
+        ``data`` is broadcast to the selection.
+        
+        The values are updated in place here and in the browser, where only
+        the cells around the patched vertices are recolored.
+        """
+        values = self.values
+        if not isinstance(values, np.ndarray):
+            values = np.array(values, dtype=np.float64)
+        
+        flat = np.arange(values.size)
+        if isinstance(key, tuple):
+            flat = flat.reshape(self._grid_shape())
+        selected = flat[key]
+        indices = np.ravel(selected).astype(np.int32)
+        data = np.broadcast_to(np.asarray(data, dtype=values.dtype), np.shape(selected))
+        data = np.ascontiguousarray(np.ravel(data))
+        
+        values[indices] = data
+        if values is not self.values:
+            # Plain lists can't be patched in the browser; send them once. The
+            # array is new, so it skips the copy __setattr__ makes of values
+            self._assign('values', values)
+            return
+        self.values_patch = dict(indices=indices, values=data)
+    
+    def _grid_shape(self):
+        """(n_lat, n_lon) of the grid in use, which may be the geometry's"""
+        geometry = self.geometry
+        if geometry is not None and geometry.n_lat > 0 and geometry.n_lon > 0:
+            return geometry.n_lat, geometry.n_lon
+        return self.n_lat, self.n_lon
+    
+    @staticmethod
+    def _as_float_array(array, copy=False):
+        """Flatten to a contiguous float32/float64 array for binary transport
+
+        With ``copy`` the result never shares memory with ``array``.
+        """
+        array = np.ravel(array)
+        dtype = array.dtype if array.dtype in (np.float32, np.float64) else np.float64
+        if copy:
+            return np.array(array, dtype=dtype, order='C', copy=True)
+        return np.ascontiguousarray(array, dtype=dtype)
+    
+    @staticmethod
+    def _load_coastlines_bundled():
+        """Load pre-bundled coastline data (read once per process)"""
+        data = load_polylines("coastlines")
+        if data is None:
+            print("Warning: coastlines.npz not found")
+            return [], []
+        return data
+    
+    @staticmethod
+    def _load_countries_bundled():
+        """Load pre-bundled country boundary data (read once per process)"""
+        data = load_polylines("countries")
+        if data is None:
+            print("Warning: countries.npz not found")
+            return [], []
+        return data
\ No newline at end of file
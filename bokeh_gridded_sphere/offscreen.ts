@@ -0,0 +1,35 @@
+/**
+ * Main-thread side of rendering the gridded field in a worker
+ */
+
+// The worker script, bundled separately from render_worker.ts by build()
+// in __init__.py and embedded here so no extra file has to be served
+import render_worker from "./dist/render_worker.json"
+
+let worker_url: string | undefined
+
+/**
+ * Whether the browser can draw into a transferred canvas from a worker
+ */
+export function workerRenderingSupported(): boolean {
+  return typeof Worker !== 'undefined' && typeof OffscreenCanvas !== 'undefined' &&
+    typeof HTMLCanvasElement.prototype.transferControlToOffscreen === 'function'
+}
+
+/**
+ * Start a render worker and hand it control of `canvas`
+ *
+ * Throws if `canvas` was already transferred or the browser refuses to
+ * start a worker from a blob: URL. The canvas is transferred first, so no
+ * worker is left running when that fails.
+ */
+export function createRenderWorker(canvas: HTMLCanvasElement): Worker {
+  if (worker_url === undefined) {
+    worker_url = URL.createObjectURL(new Blob([render_worker.source], {type: "text/javascript"}))
+  }
+
+  const offscreen = canvas.transferControlToOffscreen()
+  const worker = new Worker(worker_url)
+  worker.postMessage({type: "init", canvas: offscreen}, [offscreen])
+  return worker
+}
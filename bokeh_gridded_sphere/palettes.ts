@@ -1,3 +1,7 @@
+import type {Arrayable} from "@bokehjs/core/types"
+import {color2rgba} from "@bokehjs/core/util/color"
+import {LITTLE_ENDIAN, packRGBA} from "./rgba"
+
 export const Turbo256 = ["#30123b","#311542","#32184a","#341b51","#351e58","#36215f","#372566","#38286d","#392b74","#3a2e7b","#3b3181","#3c3488","#3c378e","#3d3a94","#3e3d9a","#3e40a0","#3e43a5","#3f46ab","#3f49b0","#3f4cb5","#3f52bf","#3f55c4","#3e58c8","#3e5bcc","#3e5ed0","#3d61d4","#3d64d8","#3c68dc","#3c6bdf","#3b6ee2","#3a71e5","#3974e8","#3977eb","#387aed","#377df0","#3680f2","#3583f4","#3486f6","#3389f8","#328cfa","#318ffc","#2f92fd","#2e95fe","#2d98ff","#2c9bff","#2b9eff","#2aa1ff","#2aa4ff","#29a7fe","#28aafe","#28adfd","#28b0fc","#28b2fb","#28b5fa","#28b8f9","#28bbf8","#28bef6","#28c1f5","#29c3f3","#29c6f2","#2ac9f0","#2accee","#2bceec","#2cd1ea","#2dd3e8","#2ed6e6","#2fd8e4","#31dbe1","#32dddf","#34e0dd","#36e2da","#38e4d8","#3ae6d5","#3ce8d2","#3fead0","#41eccd","#44eeca","#46f0c7","#49f1c4","#4cf3c1","#4ff5be","#52f6bb","#55f8b8","#58f9b4","#5bfbb1","#5efcae","#62fdab","#65fea8","#69ffa4","#6cffa1","#70ff9e","#73ff9b","#77ff98","#7aff95","#7eff92","#81ff8f","#85ff8c","#88ff89","#8cff87","#8fff84","#93ff81","#96fe7f","#9afe7c","#9dfd7a","#a1fd77","#a4fc75","#a7fc73","#abfb71","#aefa6f","#b2f96d","#b5f86b","#b8f769","#bcf667","#bff665","#c2f564","#c5f462","#c9f360","#ccf25f","#cff15d","#d2f05c","#d5ef5a","#d9ee59","#dced57","#dfec56","#e2eb55","#e5ea53","#e8e952","#ebe851","#eee750","#f1e64f","#f4e54e","#f7e34d","#f9e24c","#fce14b","#ffe049","#ffdf48","#ffde47","#ffdd46","#ffdb45","#ffda43","#ffd942","#ffd741","#ffd640","#ffd53e","#ffd33d","#ffd23c","#ffd03a","#ffcf39","#ffcd37","#ffcc36","#ffca35","#ffc933","#ffc732","#ffc630","#ffc42f","#ffc32d","#ffc12c","#ffc02a","#ffbe29","#ffbd27","#ffbb26","#ffba24","#ffb823","#ffb621","#ffb520","#ffb31e","#ffb21d","#ffb01b","#ffaf1a","#ffad18","#ffac17","#ffaa15","#ffa914","#ffa712","#ffa611","#ffa40f","#ffa30e","#ffa10c","#ffa00b","#ff9e09","#ff9d08","#ff9b06","#ff9a05","#ff9803","#ff9702","#ff9500"]
 
 export const Viridis256 = ["#440154","#440256","#450457","#450559","#46075a","#46085c","#460a5d","#460b5e","#470d60","#470e61","#471063","#471164","#471365","#481467","#481668","#481769","#48186a","#481a6c","#481b6d","#481c6e","#481d6f","#481f70","#482071","#482173","#482374","#482475","#482576","#482677","#482878","#482979","#472a7a","#472c7a","#472d7b","#472e7c","#472f7d","#46307e","#46327e","#46337f","#463480","#453581","#453781","#453882","#443983","#443a83","#443b84","#433d84","#433e85","#423f85","#424086","#424186","#414287","#414487","#404588","#404688","#3f4788","#3f4889","#3e4989","#3e4a89","#3e4c8a","#3d4d8a","#3d4e8a","#3c4f8a","#3c508b","#3b518b","#3b528b","#3a538b","#3a548c","#39558c","#39568c","#38588c","#38598c","#375a8c","#375b8d","#365c8d","#365d8d","#355e8d","#355f8d","#34608d","#34618d","#33628d","#33638d","#32648e","#32658e","#31668e","#31678e","#31688e","#30698e","#306a8e","#2f6b8e","#2f6c8e","#2e6d8e","#2e6e8e","#2e6f8e","#2d708e","#2d718e","#2c718e","#2c728e","#2c738e","#2b748e","#2b758e","#2a768e","#2a778e","#2a788e","#29798e","#297a8e","#297b8e","#287c8e","#287d8e","#277e8e","#277f8e","#27808e","#26818e","#26828e","#26828e","#25838e","#25848e","#25858e","#24868e","#24878e","#23888e","#23898e","#238a8d","#228b8d","#228c8d","#228d8d","#218e8d","#218f8d","#21908d","#21918c","#20928c","#20928c","#20938c","#1f948c","#1f958b","#1f968b","#1f978b","#1f988b","#1f998a","#1f9a8a","#1e9b8a","#1e9c89","#1e9d89","#1f9e89","#1f9f88","#1fa088","#1fa188","#1fa187","#1fa287","#20a386","#20a486","#21a585","#21a685","#22a785","#22a884","#23a983","#24aa83","#25ab82","#25ac82","#26ad81","#27ad81","#28ae80","#29af7f","#2ab07f","#2cb17e","#2db27d","#2eb37c","#2fb47c","#31b57b","#32b67a","#34b679","#35b779","#37b878","#38b977","#3aba76","#3bbb75","#3dbc74","#3fbc73","#40bd72","#42be71","#44bf70","#46c06f","#48c16e","#4ac16d","#4cc26c","#4ec36b","#50c46a","#52c569","#54c568","#56c667","#58c765","#5ac864","#5cc863","#5ec962","#60ca60","#63cb5f","#65cb5e","#67cc5c","#69cd5b","#6ccd5a","#6ece58","#70cf57","#73d056","#75d054","#77d153","#7ad151","#7cd250","#7fd34e","#81d34d","#84d44b","#86d549","#89d548","#8bd646","#8ed645","#90d743","#93d741","#95d840","#98d83e","#9bd93c","#9dd93b","#a0da39","#a2da37","#a5db36","#a8db34","#aadc32","#addc30","#b0dd2f","#b2dd2d","#b5de2b","#b8de29","#bade28","#bddf26","#c0df25","#c2df23","#c5e021","#c8e020","#cae11f","#cde11d","#d0e11c","#d2e21b","#d5e21a","#d8e219","#dae319","#dde318","#dfe318","#e2e418","#e5e419","#e7e419","#eae51a","#ece51b","#efe51c","#f1e51d","#f4e61e","#f6e620","#f8e621","#fbe723","#fde725"]
@@ -711,52 +715,178 @@ export function getPalette(name: string): string[] {
 
 
 /**
- * Map value to color
+ * Map value to a palette index, or -1 for NaN
  */
-export function valueToColor(
+export function valueToIndex(
   value: number,
-  palette: string[],
+  n_colors: number,
   vmin: number,
-  vmax: number,
-  nan_color: string = '#808080'
-): string {
+  vmax: number
+): number {
   if (isNaN(value)) {
-    return nan_color
+    return -1
   }
   
   const normalized = (value - vmin) / (vmax - vmin)
-  const idx = Math.floor(normalized * (palette.length - 1))
-  const clamped_idx = Math.max(0, Math.min(palette.length - 1, idx))
+  const idx = Math.floor(normalized * (n_colors - 1))
+  return Math.max(0, Math.min(n_colors - 1, idx))
+}
+
+/**
+ * Summary of the values the automatic color range is taken from
+ */
+export interface ValueStats {
+  min: number
+  max: number
+  nan_count: number
+}
+
+/**
+ * Min, max and NaN count of the values in one streaming pass, without
+ * intermediate arrays or argument spreading, so large grids are safe
+ */
+export function computeValueStats(values: Arrayable<number>): ValueStats {
+  let min = Infinity
+  let max = -Infinity
+  let nan_count = 0
+  
+  for (let i = 0; i < values.length; i++) {
+    const v = values[i]
+    if (isNaN(v)) {
+      nan_count++
+    } else {
+      if (v < min) min = v
+      if (v > max) max = v
+    }
+  }
   
-  return palette[clamped_idx]
+  return {min, max, nan_count}
 }
 
 /**
- * Auto-calculate value range from data
+ * Color range from explicit limits, falling back to the data range
  */
-export function getValueRange(
-  values: number[],
+export function rangeFromStats(
+  stats: ValueStats,
   vmin?: number,
   vmax?: number
 ): {vmin: number, vmax: number} {
   let min = vmin
   let max = vmax
+  const has_data = stats.min <= stats.max
   
-  if (min === undefined || isNaN(min) || max === undefined || isNaN(max)) {
-    const valid_values = values.filter(v => !isNaN(v))
-    
-    if (valid_values.length > 0) {
-      if (min === undefined || isNaN(min)) {
-        min = Math.min(...valid_values)
-      }
-      if (max === undefined || isNaN(max)) {
-        max = Math.max(...valid_values)
-      }
-    } else {
-      min = min ?? 0
-      max = max ?? 1
-    }
+  if (min === undefined || isNaN(min)) {
+    min = has_data ? stats.min : 0
+  }
+  if (max === undefined || isNaN(max)) {
+    max = has_data ? stats.max : 1
   }
   
   return {vmin: min, vmax: max}
 }
+
+/**
+ * Palette index of every grid cell from the average of its four corners,
+ * row-major (n_lat - 1) x (n_lon - 1). NaN cells get index n_colors, the
+ * NaN slot of a color lookup table. `out` is filled in place when it has
+ * the right length.
+ */
+export function cellColorIndices(
+  values: Arrayable<number>,
+  n_lat: number,
+  n_lon: number,
+  n_colors: number,
+  vmin: number,
+  vmax: number,
+  out?: Int32Array
+): Int32Array {
+  const n_cell_lon = Math.max(0, n_lon - 1)
+  const n_cells = Math.max(0, n_lat - 1) * n_cell_lon
+  const indices = out !== undefined && out.length == n_cells ? out : new Int32Array(n_cells)
+  
+  for (let i = 0; i < n_lat - 1; i++) {
+    for (let j = 0; j < n_cell_lon; j++) {
+      indices[i * n_cell_lon + j] = cellColorIndex(values, n_lon, i, j, n_colors, vmin, vmax)
+    }
+  }
+  
+  return indices
+}
+
+/**
+ * Palette index of the single cell (i, j), as stored by cellColorIndices
+ */
+export function cellColorIndex(
+  values: Arrayable<number>,
+  n_lon: number,
+  i: number,
+  j: number,
+  n_colors: number,
+  vmin: number,
+  vmax: number
+): number {
+  const idx = valueToIndex(cellValue(values, n_lon, i, j), n_colors, vmin, vmax)
+  return idx < 0 ? n_colors : idx
+}
+
+/**
+ * The value cell (i, j) is colored by: the average of its four corners,
+ * NaN if any of them is
+ */
+export function cellValue(values: Arrayable<number>, n_lon: number, i: number, j: number): number {
+  const idx0 = i * n_lon + j
+  const idx3 = idx0 + n_lon
+  return (values[idx0] + values[idx0 + 1] + values[idx3 + 1] + values[idx3]) / 4
+}
+
+/**
+ * Scale the RGB channels of a packed pixel, leaving alpha untouched
+ */
+export function shadeRGBA(rgba: number, factor: number): number {
+  if (LITTLE_ENDIAN) {
+    const r = rgba & 0xff
+    const g = (rgba >>> 8) & 0xff
+    const b = (rgba >>> 16) & 0xff
+    return packRGBA(Math.floor(r * factor), Math.floor(g * factor), Math.floor(b * factor), rgba >>> 24)
+  } else {
+    const r = rgba >>> 24
+    const g = (rgba >>> 16) & 0xff
+    const b = (rgba >>> 8) & 0xff
+    return packRGBA(Math.floor(r * factor), Math.floor(g * factor), Math.floor(b * factor), rgba & 0xff)
+  }
+}
+
+export function colorToRGBA(color: string): number {
+  const [r, g, b, a] = color2rgba(color)
+  return packRGBA(r, g, b, a)
+}
+
+const rgba_cache = new Map<string, Uint32Array>()
+
+/**
+ * Packed RGBA table for a palette, parsed once per palette name
+ */
+export function getPaletteRGBA(name: string): Uint32Array {
+  let rgba = rgba_cache.get(name)
+  if (rgba === undefined) {
+    const palette = getPalette(name)
+    rgba = new Uint32Array(palette.length)
+    for (let i = 0; i < palette.length; i++) {
+      rgba[i] = colorToRGBA(palette[i])
+    }
+    rgba_cache.set(name, rgba)
+  }
+  return rgba
+}
+
+/**
+ * Palette lookup table with the NaN color appended: entries 0..n-1 are the
+ * palette and entry n is the NaN slot
+ */
+export function getColorLUT(name: string, nan_color: string): Uint32Array {
+  const rgba = getPaletteRGBA(name)
+  const lut = new Uint32Array(rgba.length + 1)
+  lut.set(rgba)
+  lut[rgba.length] = colorToRGBA(nan_color)
+  return lut
+}
@@ -0,0 +1,156 @@
+/**
+ * Coastline and border polylines prepared for zoom-dependent drawing
+ */
+
+import {HORIZON_DEPTH} from "./projections"
+
+/**
+ * NaN-separated polylines of unit vectors, split into segments, each with a
+ * bounding cap for horizon culling and a Douglas-Peucker detail per vertex
+ * for simplification at the current pixel scale
+ */
+export class PolylineSet {
+  readonly xyz: Float32Array
+  // Segment k spans vertices start[k] until end[k] (exclusive)
+  readonly start: Uint32Array
+  readonly end: Uint32Array
+  // Center unit vector of each segment's bounding cap and the cosine and
+  // sine of its angular radius, five floats per segment
+  readonly caps: Float32Array
+  // Distance from the simplified line at which each vertex gets kept;
+  // nested, so a vertex is only kept with the vertices it was split from
+  readonly detail: Float32Array
+
+  constructor(xyz: Float32Array) {
+    this.xyz = xyz
+    const n = Math.floor(xyz.length / 3)
+
+    const start: number[] = []
+    const end: number[] = []
+    let first = -1
+    for (let v = 0; v <= n; v++) {
+      if (v == n || isNaN(xyz[3 * v])) {
+        // A lone vertex draws nothing
+        if (first >= 0 && v - first > 1) {
+          start.push(first)
+          end.push(v)
+        }
+        first = -1
+      } else if (first < 0) {
+        first = v
+      }
+    }
+    this.start = new Uint32Array(start)
+    this.end = new Uint32Array(end)
+
+    this.caps = new Float32Array(5 * start.length)
+    this.detail = new Float32Array(n)
+    for (let k = 0; k < start.length; k++) {
+      this.compute_cap(k)
+      this.compute_detail(start[k], end[k] - 1)
+    }
+  }
+
+  get count(): number {
+    return this.start.length
+  }
+
+  private compute_cap(k: number): void {
+    const xyz = this.xyz
+    let sx = 0, sy = 0, sz = 0
+    for (let v = this.start[k]; v < this.end[k]; v++) {
+      sx += xyz[3 * v]
+      sy += xyz[3 * v + 1]
+      sz += xyz[3 * v + 2]
+    }
+
+    const norm = Math.sqrt(sx * sx + sy * sy + sz * sz)
+    let cos_r = -1
+    if (norm > 1e-9) {
+      sx /= norm
+      sy /= norm
+      sz /= norm
+      cos_r = 1
+      for (let v = this.start[k]; v < this.end[k]; v++) {
+        cos_r = Math.min(cos_r, sx * xyz[3 * v] + sy * xyz[3 * v + 1] + sz * xyz[3 * v + 2])
+      }
+      // Widen slightly so float32 rounding never culls a visible vertex
+      cos_r = Math.max(-1, cos_r - 1e-5)
+    }
+
+    const o = 5 * k
+    this.caps[o] = sx
+    this.caps[o + 1] = sy
+    this.caps[o + 2] = sz
+    this.caps[o + 3] = cos_r
+    this.caps[o + 4] = Math.sqrt(1 - cos_r * cos_r)
+  }
+
+  /**
+   * Douglas-Peucker over vertices a..b, recording for every interior vertex
+   * its distance from the great circle through the vertices it splits
+   * (from a itself when they coincide, as for closed rings)
+   */
+  private compute_detail(a: number, b: number): void {
+    const xyz = this.xyz
+    const detail = this.detail
+    detail[a] = Infinity
+    detail[b] = Infinity
+
+    const stack = [a, b, Infinity]
+    while (stack.length > 0) {
+      const limit = stack.pop()!
+      const j = stack.pop()!
+      const i = stack.pop()!
+      if (j - i < 2) continue
+
+      const ax = xyz[3 * i], ay = xyz[3 * i + 1], az = xyz[3 * i + 2]
+      const bx = xyz[3 * j], by = xyz[3 * j + 1], bz = xyz[3 * j + 2]
+      let nx = ay * bz - az * by
+      let ny = az * bx - ax * bz
+      let nz = ax * by - ay * bx
+      const norm = Math.sqrt(nx * nx + ny * ny + nz * nz)
+      const degenerate = norm < 1e-9
+      if (!degenerate) {
+        nx /= norm
+        ny /= norm
+        nz /= norm
+      }
+
+      let max_dist = -1
+      let split = i + 1
+      for (let v = i + 1; v < j; v++) {
+        const x = xyz[3 * v], y = xyz[3 * v + 1], z = xyz[3 * v + 2]
+        const dist = degenerate
+          ? Math.sqrt((x - ax) ** 2 + (y - ay) ** 2 + (z - az) ** 2)
+          : Math.abs(x * nx + y * ny + z * nz)
+        if (dist > max_dist) {
+          max_dist = dist
+          split = v
+        }
+      }
+
+      const d = Math.min(max_dist, limit)
+      detail[split] = d
+      stack.push(i, split, d, split, j, d)
+    }
+  }
+
+  /**
+   * Whether any vertex of segment k can be in front of the horizon, given
+   * the view direction (vx, vy, vz) along which depth is measured
+   */
+  cap_visible(k: number, vx: number, vy: number, vz: number): boolean {
+    const o = 5 * k
+    const caps = this.caps
+    const cos_t = caps[o] * vx + caps[o + 1] * vy + caps[o + 2] * vz
+    const cos_r = caps[o + 3]
+    if (cos_t >= cos_r) {
+      // The view direction itself lies within the cap
+      return true
+    }
+    // Largest depth in the cap, at the angle between the two minus its radius
+    const sin_t = Math.sqrt(Math.max(0, 1 - cos_t * cos_t))
+    return cos_t * cos_r + sin_t * caps[o + 4] > HORIZON_DEPTH
+  }
+}
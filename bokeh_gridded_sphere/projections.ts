@@ -12,6 +12,24 @@ export interface Point3D extends Point2D {
   visible: boolean
 }
 
+/**
+ * View rotation, tilt and zoom resolved to the terms the projections use
+ */
+export interface Camera {
+  cos_angle: number
+  sin_angle: number
+  cos_tilt: number
+  sin_tilt: number
+  scale: number
+  cx: number
+  cy: number
+}
+
+/**
+ * Points with a rotated depth below this are behind the sphere's horizon
+ */
+export const HORIZON_DEPTH = -0.15
+
 /**
  * Sphere projection with rotation and tilt
  */
@@ -39,8 +57,102 @@ export function projectSphere(
     x: x_rot,
     y: z_tilt,
     depth: y_tilt,
-    visible: y_tilt > -0.15
+    visible: y_tilt > HORIZON_DEPTH
+  }
+}
+
+/**
+ * Inverse of projectSphere for the visible hemisphere.
+ *
+ * Takes a position relative to the sphere's center in units of its radius
+ * (x to the right, y up) and returns the lon/lat under it, or null outside
+ * the sphere's disk.
+ */
+export function unprojectSphere(
+  x_rot: number,
+  z_tilt: number,
+  cos_angle: number,
+  sin_angle: number,
+  cos_tilt: number,
+  sin_tilt: number
+): {lon: number, lat: number} | null {
+  const r2 = x_rot * x_rot + z_tilt * z_tilt
+  if (!(r2 <= 1)) {
+    return null
+  }
+  
+  // Undo tilt, then rotation
+  const y_tilt = Math.sqrt(1 - r2)
+  const y_rot = y_tilt * cos_tilt + z_tilt * sin_tilt
+  const z = z_tilt * cos_tilt - y_tilt * sin_tilt
+  const x = x_rot * cos_angle + y_rot * sin_angle
+  const y = y_rot * cos_angle - x_rot * sin_angle
+  
+  return {
+    lon: -Math.atan2(y, x) * 180 / Math.PI,
+    lat: Math.asin(Math.max(-1, Math.min(1, z))) * 180 / Math.PI
+  }
+}
+
+/**
+ * Unit-sphere positions for lon/lat pairs, packed as [x0, y0, z0, x1, ...].
+ * Null entries (polyline separators) become NaN.
+ */
+export function unitVectors(lons: ArrayLike<number | null>, lats: ArrayLike<number | null>): Float32Array {
+  const n = lons.length
+  const xyz = new Float32Array(3 * n)
+  
+  for (let i = 0; i < n; i++) {
+    const lon = lons[i]
+    const lat = lats[i]
+    if (lon === null || lat === null) {
+      xyz[3 * i] = xyz[3 * i + 1] = xyz[3 * i + 2] = NaN
+      continue
+    }
+    
+    const lat_rad = lat * Math.PI / 180
+    const lon_rad = lon * Math.PI / 180
+    xyz[3 * i] = Math.cos(lat_rad) * Math.cos(-lon_rad)
+    xyz[3 * i + 1] = Math.cos(lat_rad) * Math.sin(-lon_rad)
+    xyz[3 * i + 2] = Math.sin(lat_rad)
   }
+  
+  return xyz
+}
+
+/**
+ * Rotate and project packed unit vectors to screen space.
+ *
+ * Writes [screen_x, screen_y, depth] per vertex into `out`, which is reused
+ * when it already has the right length.
+ */
+export function projectUnitVectors(
+  xyz: Float32Array,
+  cos_angle: number,
+  sin_angle: number,
+  cos_tilt: number,
+  sin_tilt: number,
+  scale: number,
+  cx: number,
+  cy: number,
+  out?: Float32Array
+): Float32Array {
+  const screen = out !== undefined && out.length == xyz.length ? out : new Float32Array(xyz.length)
+  
+  for (let i = 0; i < xyz.length; i += 3) {
+    const x = xyz[i]
+    const y = xyz[i + 1]
+    const z = xyz[i + 2]
+    
+    const x_rot = x * cos_angle - y * sin_angle
+    const y_rot = x * sin_angle + y * cos_angle
+    
+    screen[i] = cx + x_rot * scale
+    screen[i + 1] = cy - (y_rot * sin_tilt + z * cos_tilt) * scale
+    screen[i + 2] = y_rot * cos_tilt - z * sin_tilt
+  }
+  
+  return screen
 }
 
 /**
@@ -0,0 +1,211 @@
+/**
+ * Reusable quad buffer for the gridded field and drawing the field with it
+ *
+ * This module is also bundled into the render worker, so it must not import
+ * anything that needs BokehJS.
+ */
+
+import {HORIZON_DEPTH} from "./projections"
+import {unpackRGBA} from "./rgba"
+
+/**
+ * A 2D context of a page canvas or of a canvas transferred to a worker
+ */
+export type Context2D = CanvasRenderingContext2D | OffscreenCanvasRenderingContext2D
+
+/**
+ * Structure-of-arrays storage for visible grid cells.
+ *
+ * Buffers grow to the largest grid seen and are reused across frames, so
+ * building and depth-sorting a frame allocates nothing per cell.
+ */
+export class QuadBuffer {
+  count: number = 0
+  // Average rotated depth of each quad
+  depth: Float32Array = new Float32Array(0)
+  // Index of the quad's first vertex (i * n_lon + j)
+  vertex: Uint32Array = new Uint32Array(0)
+  // Packed RGBA fill color, lighting included
+  color: Uint32Array = new Uint32Array(0)
+
+  // Draw order (a permutation of 0..count-1) and radix sort scratch space
+  private depth_bits: Uint32Array = new Uint32Array(0)
+  private order: Uint32Array = new Uint32Array(0)
+  private keys: Uint32Array = new Uint32Array(0)
+  private order_tmp: Uint32Array = new Uint32Array(0)
+  private keys_tmp: Uint32Array = new Uint32Array(0)
+  private readonly histogram = new Uint32Array(256)
+
+  reset(capacity: number): void {
+    if (this.depth.length < capacity) {
+      this.depth = new Float32Array(capacity)
+      this.depth_bits = new Uint32Array(this.depth.buffer)
+      this.vertex = new Uint32Array(capacity)
+      this.color = new Uint32Array(capacity)
+      this.order = new Uint32Array(capacity)
+      this.keys = new Uint32Array(capacity)
+      this.order_tmp = new Uint32Array(capacity)
+      this.keys_tmp = new Uint32Array(capacity)
+    }
+    this.count = 0
+  }
+
+  push(vertex: number, depth: number, color: number): void {
+    const k = this.count++
+    this.vertex[k] = vertex
+    this.depth[k] = depth
+    this.color[k] = color
+  }
+
+  /**
+   * Quad indices ordered back to front; only the first `count` entries are
+   * meaningful.
+   *
+   * Float32 depths are mapped to order-preserving unsigned keys and sorted
+   * with a stable LSD radix sort, so no comparator or temporary objects are
+   * involved.
+   */
+  sort_by_depth(): Uint32Array {
+    const n = this.count
+    const depth_bits = this.depth_bits
+    const keys = this.keys
+    const order = this.order
+
+    for (let k = 0; k < n; k++) {
+      const bits = depth_bits[k]
+      keys[k] = bits & 0x80000000 ? ~bits >>> 0 : (bits | 0x80000000) >>> 0
+      order[k] = k
+    }
+
+    // Four 8-bit passes, ping-ponging so the result ends in keys/order
+    this.radix_pass(0, keys, order, this.keys_tmp, this.order_tmp)
+    this.radix_pass(8, this.keys_tmp, this.order_tmp, keys, order)
+    this.radix_pass(16, keys, order, this.keys_tmp, this.order_tmp)
+    this.radix_pass(24, this.keys_tmp, this.order_tmp, keys, order)
+
+    return order
+  }
+
+  private radix_pass(shift: number, src_keys: Uint32Array, src_order: Uint32Array,
+                     dst_keys: Uint32Array, dst_order: Uint32Array): void {
+    const n = this.count
+    const histogram = this.histogram
+    histogram.fill(0)
+    for (let k = 0; k < n; k++) {
+      histogram[(src_keys[k] >>> shift) & 0xff]++
+    }
+    let offset = 0
+    for (let b = 0; b < 256; b++) {
+      const c = histogram[b]
+      histogram[b] = offset
+      offset += c
+    }
+    for (let k = 0; k < n; k++) {
+      const dst = histogram[(src_keys[k] >>> shift) & 0xff]++
+      dst_keys[dst] = src_keys[k]
+      dst_order[dst] = src_order[k]
+    }
+  }
+}
+
+/**
+ * Draw a grid as one path per cell from its projected vertices
+ * ([screen_x, screen_y, depth] per vertex, as from projectUnitVectors).
+ *
+ * Front-facing cells go into `quads`; unless back faces are culled, cells
+ * behind them that still reach above the horizon go into `edge_quads`.
+ * Front faces of a convex sphere never overlap each other, so only the
+ * back-facing horizon band needs a depth sort; it is drawn first and the
+ * front faces follow in grid order.
+ */
+export function drawGridQuads(ctx: Context2D, screen: Float32Array, n_lat: number, n_lon: number,
+                              cell_rgba: Uint32Array, backface_culling: boolean,
+                              quads: QuadBuffer, edge_quads: QuadBuffer): void {
+  const n_cells = Math.max(0, (n_lat - 1) * (n_lon - 1))
+  quads.reset(n_cells)
+  edge_quads.reset(backface_culling ? 0 : n_cells)
+
+  for (let i = 0; i < n_lat - 1; i++) {
+    for (let j = 0; j < n_lon - 1; j++) {
+      const idx0 = i * n_lon + j
+      const idx1 = idx0 + 1
+      const idx3 = idx0 + n_lon
+      const idx2 = idx3 + 1
+
+      const d0 = screen[3 * idx0 + 2]
+      const d1 = screen[3 * idx1 + 2]
+      const d2 = screen[3 * idx2 + 2]
+      const d3 = screen[3 * idx3 + 2]
+
+      // The average rotated depth is the cell normal dotted with the view
+      // direction, so a positive value means the cell faces the viewer
+      const avg_depth = (d0 + d1 + d2 + d3) / 4
+      const front_facing = avg_depth > 0
+
+      if (front_facing || (!backface_culling &&
+          (d0 > HORIZON_DEPTH || d1 > HORIZON_DEPTH || d2 > HORIZON_DEPTH || d3 > HORIZON_DEPTH))) {
+        const target = front_facing ? quads : edge_quads
+        target.push(idx0, avg_depth, cell_rgba[i * (n_lon - 1) + j])
+      }
+    }
+  }
+
+  if (edge_quads.count > 0) {
+    fillQuads(ctx, edge_quads, edge_quads.sort_by_depth(), screen, n_lon)
+  }
+  fillQuads(ctx, quads, null, screen, n_lon)
+}
+
+function fillQuads(ctx: Context2D, quads: QuadBuffer, order: Uint32Array | null, screen: Float32Array,
+                   n_lon: number): void {
+  // Only touch canvas state when the color changes
+  let current_color = -1
+  ctx.lineWidth = 1.1
+
+  for (let k = 0; k < quads.count; k++) {
+    const q = order !== null ? order[k] : k
+    const rgba = quads.color[q]
+
+    if (rgba != current_color) {
+      const color = rgbaToCSS(rgba)
+      ctx.fillStyle = color
+      ctx.strokeStyle = color
+      current_color = rgba
+    }
+
+    const v0 = 3 * quads.vertex[q]
+    const v1 = v0 + 3
+    const v3 = v0 + 3 * n_lon
+    const v2 = v3 + 3
+
+    ctx.beginPath()
+    ctx.moveTo(screen[v0], screen[v0 + 1])
+    ctx.lineTo(screen[v1], screen[v1 + 1])
+    ctx.lineTo(screen[v2], screen[v2 + 1])
+    ctx.lineTo(screen[v3], screen[v3 + 1])
+    ctx.closePath()
+    ctx.fill()
+    ctx.stroke()
+  }
+}
+
+// CSS strings of packed pixels, so repeated colors are not rebuilt every frame
+const css_cache = new Map<number, string>()
+
+/**
+ * CSS color for a packed pixel, for use at the Canvas 2D boundary
+ */
+function rgbaToCSS(rgba: number): string {
+  let css = css_cache.get(rgba)
+  if (css === undefined) {
+    if (css_cache.size >= 65536) {
+      css_cache.clear()
+    }
+    const [r, g, b, a] = unpackRGBA(rgba)
+    css = a == 255
+      ? `#${((1 << 24) | (r << 16) | (g << 8) | b).toString(16).slice(1)}`
+      : `rgba(${r},${g},${b},${a / 255})`
+    css_cache.set(rgba, css)
+  }
+  return css
+}
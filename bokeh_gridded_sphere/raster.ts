@@ -0,0 +1,129 @@
+/**
+ * Per-pixel rasterizer for regular gridded fields
+ */
+
+import type {Arrayable} from "@bokehjs/core/types"
+
+/**
+ * Locates the cell of a monotonic axis containing a coordinate
+ */
+export class AxisIndex {
+  private readonly axis: Arrayable<number>
+  private readonly n: number
+  private readonly lo: number
+  private readonly hi: number
+  private readonly descending: boolean
+  private readonly step: number
+  private readonly uniform: boolean
+
+  constructor(axis: Arrayable<number>) {
+    this.axis = axis
+    this.n = axis.length
+    const first = axis[0]
+    const last = axis[this.n - 1]
+    this.descending = last < first
+    this.lo = Math.min(first, last)
+    this.hi = Math.max(first, last)
+    this.step = (last - first) / (this.n - 1)
+
+    // Uniform axes are located arithmetically, others by binary search
+    let uniform = this.n >= 2
+    for (let i = 1; i < this.n && uniform; i++) {
+      uniform = Math.abs(axis[i] - axis[i - 1] - this.step) <= Math.abs(this.step) * 1e-4
+    }
+    this.uniform = uniform
+  }
+
+  get min(): number {
+    return this.lo
+  }
+
+  /**
+   * Index i such that v lies between axis[i] and axis[i + 1], or -1
+   */
+  cell(v: number): number {
+    if (!(v >= this.lo && v <= this.hi) || this.n < 2) {
+      return -1
+    }
+
+    if (this.uniform) {
+      return Math.min(this.n - 2, Math.floor((v - this.axis[0]) / this.step))
+    }
+
+    let lo = 0
+    let hi = this.n - 1
+    while (hi - lo > 1) {
+      const mid = (lo + hi) >> 1
+      if ((this.axis[mid] <= v) != this.descending) {
+        lo = mid
+      } else {
+        hi = mid
+      }
+    }
+    return lo
+  }
+}
+
+/**
+ * Fill `pixels` (a width x height RGBA buffer) with the visible hemisphere.
+ *
+ * Each pixel inside the sphere's disk is inverse-projected through the tilt
+ * and rotation to lon/lat and takes the cached (already lit) color of its
+ * grid cell, so the cost depends on the number of pixels rather than the
+ * number of cells. Pixels outside the disk are left transparent.
+ */
+export function rasterizeSphere(
+  pixels: Uint32Array,
+  width: number,
+  height: number,
+  lon_index: AxisIndex,
+  lat_index: AxisIndex,
+  n_lon: number,
+  cell_rgba: Uint32Array,
+  cos_angle: number,
+  sin_angle: number,
+  cos_tilt: number,
+  sin_tilt: number,
+  scale: number,
+  cx: number,
+  cy: number
+): void {
+  pixels.fill(0)
+
+  const x0 = Math.max(0, Math.floor(cx - scale))
+  const x1 = Math.min(width, Math.ceil(cx + scale))
+  const y0 = Math.max(0, Math.floor(cy - scale))
+  const y1 = Math.min(height, Math.ceil(cy + scale))
+  const lon_min = lon_index.min
+  const n_cell_lon = n_lon - 1
+
+  for (let py = y0; py < y1; py++) {
+    const z_tilt = (cy - (py + 0.5)) / scale
+    for (let px = x0; px < x1; px++) {
+      const x_rot = ((px + 0.5) - cx) / scale
+      const r2 = x_rot * x_rot + z_tilt * z_tilt
+      if (r2 > 1) continue
+
+      // Same inverse as unprojectSphere, inlined for the per-pixel loop
+      const y_tilt = Math.sqrt(1 - r2)
+      const y_rot = y_tilt * cos_tilt + z_tilt * sin_tilt
+      const z = z_tilt * cos_tilt - y_tilt * sin_tilt
+      const x = x_rot * cos_angle + y_rot * sin_angle
+      const y = y_rot * cos_angle - x_rot * sin_angle
+
+      const lat = Math.asin(Math.max(-1, Math.min(1, z))) * 180 / Math.PI
+      let lon = -Math.atan2(y, x) * 180 / Math.PI
+      if (lon < lon_min) {
+        lon += 360
+      } else if (lon >= lon_min + 360) {
+        lon -= 360
+      }
+
+      const i = lat_index.cell(lat)
+      const j = lon_index.cell(lon)
+      if (i < 0 || j < 0) continue
+
+      pixels[py * width + px] = cell_rgba[i * n_cell_lon + j]
+    }
+  }
+}
@@ -0,0 +1,90 @@
+/**
+ * Render worker: draws the gridded field off the main thread
+ *
+ * This is the entry of a bundle of its own, built by build() in __init__.py
+ * and started by createRenderWorker(), so it and everything it imports must
+ * work without BokehJS.
+ */
+
+import {projectUnitVectors} from "./projections"
+import type {Camera} from "./projections"
+import {QuadBuffer, drawGridQuads} from "./quads"
+
+export interface FrameMessage {
+  type: "frame"
+  width: number
+  height: number
+  camera: Camera
+  backface_culling: boolean
+}
+
+/**
+ * Messages posted to the worker. The canvas and grid buffers are
+ * transferred once; afterwards only frames (camera and style) are posted.
+ */
+export type WorkerMessage =
+  {type: "init", canvas: OffscreenCanvas} |
+  {type: "grid", n_lat: number, n_lon: number, xyz: Float32Array} |
+  {type: "colors", cell_rgba: Uint32Array} |
+  FrameMessage
+
+// The grid's unit vectors and cell colors, kept between frames
+let ctx: OffscreenCanvasRenderingContext2D | null = null
+let n_lat = 0
+let n_lon = 0
+let xyz: Float32Array = new Float32Array(0)
+let cell_rgba: Uint32Array = new Uint32Array(0)
+let screen: Float32Array | undefined
+const quads = new QuadBuffer()
+const edge_quads = new QuadBuffer()
+
+// Frames arriving while one is drawn are coalesced into the latest
+let pending: FrameMessage | null = null
+
+/**
+ * Draw the latest frame the same way the view's path renderer does
+ */
+function draw(): void {
+  const frame = pending
+  pending = null
+  if (frame === null || ctx === null) return
+
+  const {width, height, backface_culling} = frame
+  const canvas = ctx.canvas
+  if (canvas.width != width || canvas.height != height) {
+    canvas.width = width
+    canvas.height = height
+  } else {
+    ctx.clearRect(0, 0, width, height)
+  }
+
+  const n_cells = Math.max(0, (n_lat - 1) * (n_lon - 1))
+  if (cell_rgba.length != n_cells || xyz.length != 3 * n_lat * n_lon) return
+
+  const {cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy} = frame.camera
+  screen = projectUnitVectors(xyz, cos_angle, sin_angle, cos_tilt, sin_tilt, scale, cx, cy, screen)
+  drawGridQuads(ctx, screen, n_lat, n_lon, cell_rgba, backface_culling, quads, edge_quads)
+}
+
+self.onmessage = (event: MessageEvent<WorkerMessage>) => {
+  const msg = event.data
+  switch (msg.type) {
+    case "init":
+      ctx = msg.canvas.getContext("2d")
+      break
+    case "grid":
+      n_lat = msg.n_lat
+      n_lon = msg.n_lon
+      xyz = msg.xyz
+      break
+    case "colors":
+      cell_rgba = msg.cell_rgba
+      break
+    case "frame":
+      if (pending === null) {
+        setTimeout(draw, 0)
+      }
+      pending = msg
+      break
+  }
+}
@@ -0,0 +1,27 @@
+/**
+ * Packed RGBA pixels in the platform's byte order
+ *
+ * This module is also bundled into the render worker, so it must not import
+ * anything that needs BokehJS.
+ */
+
+export const LITTLE_ENDIAN = new Uint8Array(new Uint32Array([1]).buffer)[0] == 1
+
+/**
+ * Pack 8-bit RGBA channels into one pixel in the platform's byte order, so
+ * the result can be written straight into a Uint32Array view of ImageData
+ */
+export function packRGBA(r: number, g: number, b: number, a: number = 255): number {
+  return LITTLE_ENDIAN
+    ? ((a << 24) | (b << 16) | (g << 8) | r) >>> 0
+    : ((r << 24) | (g << 16) | (b << 8) | a) >>> 0
+}
+
+/**
+ * The [r, g, b, a] channels of a packed pixel
+ */
+export function unpackRGBA(rgba: number): [number, number, number, number] {
+  return LITTLE_ENDIAN
+    ? [rgba & 0xff, (rgba >>> 8) & 0xff, (rgba >>> 16) & 0xff, rgba >>> 24]
+    : [rgba >>> 24, (rgba >>> 16) & 0xff, (rgba >>> 8) & 0xff, rgba & 0xff]
+}
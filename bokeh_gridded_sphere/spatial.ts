@@ -0,0 +1,141 @@
+/**
+ * Screen-space spatial index for hover hit-testing
+ */
+
+/**
+ * Uniform-grid index over screen-space boxes. CellLocator in grid.ts lays
+ * one over lon/lat degrees instead.
+ *
+ * Boxes are inserted while a frame is drawn and bucketed lazily on the
+ * first lookup, so frames that are never hovered only pay for the inserts.
+ * Within a bucket, items keep their insertion order, so a lookup returns
+ * the earliest inserted item that passes the hit test.
+ */
+export class ScreenIndex {
+  private readonly cell_size: number
+  private n_cols: number = 0
+  private n_rows: number = 0
+  private count: number = 0
+  private built: boolean = false
+
+  // x0, y0, x1, y1 and id of every inserted box
+  private boxes: Float32Array = new Float32Array(0)
+  private ids: Uint32Array = new Uint32Array(0)
+
+  // Bucket contents in CSR form: entries[starts[b]..starts[b + 1]]
+  private starts: Uint32Array = new Uint32Array(1)
+  private entries: Uint32Array = new Uint32Array(0)
+
+  constructor(cell_size: number = 32) {
+    this.cell_size = cell_size
+  }
+
+  /**
+   * Start a new frame covering a width x height canvas
+   */
+  reset(width: number, height: number): void {
+    this.n_cols = Math.max(1, Math.ceil(width / this.cell_size))
+    this.n_rows = Math.max(1, Math.ceil(height / this.cell_size))
+    this.count = 0
+    this.built = false
+  }
+
+  insert(id: number, x0: number, y0: number, x1: number, y1: number): void {
+    if (!(x1 >= 0 && y1 >= 0 && x0 < this.n_cols * this.cell_size && y0 < this.n_rows * this.cell_size)) {
+      return
+    }
+
+    if (this.count == this.ids.length) {
+      const capacity = Math.max(64, 2 * this.count)
+      const boxes = new Float32Array(4 * capacity)
+      const ids = new Uint32Array(capacity)
+      boxes.set(this.boxes)
+      ids.set(this.ids)
+      this.boxes = boxes
+      this.ids = ids
+    }
+
+    const k = this.count++
+    this.boxes[4 * k] = x0
+    this.boxes[4 * k + 1] = y0
+    this.boxes[4 * k + 2] = x1
+    this.boxes[4 * k + 3] = y1
+    this.ids[k] = id
+    this.built = false
+  }
+
+  /**
+   * The first item whose box contains (x, y) and for which `hit` returns
+   * true, or -1
+   */
+  find(x: number, y: number, hit: (id: number) => boolean): number {
+    const col = Math.floor(x / this.cell_size)
+    const row = Math.floor(y / this.cell_size)
+    if (this.count == 0 || col < 0 || row < 0 || col >= this.n_cols || row >= this.n_rows) {
+      return -1
+    }
+
+    if (!this.built) {
+      this.build()
+    }
+
+    const bucket = row * this.n_cols + col
+    const boxes = this.boxes
+    for (let e = this.starts[bucket]; e < this.starts[bucket + 1]; e++) {
+      const k = this.entries[e]
+      if (x >= boxes[4 * k] && x <= boxes[4 * k + 2] && y >= boxes[4 * k + 1] && y <= boxes[4 * k + 3] &&
+          hit(this.ids[k])) {
+        return this.ids[k]
+      }
+    }
+    return -1
+  }
+
+  private bucket_range(k: number): [number, number, number, number] {
+    const last_col = this.n_cols - 1
+    const last_row = this.n_rows - 1
+    const boxes = this.boxes
+    return [
+      Math.max(0, Math.min(last_col, Math.floor(boxes[4 * k] / this.cell_size))),
+      Math.max(0, Math.min(last_row, Math.floor(boxes[4 * k + 1] / this.cell_size))),
+      Math.max(0, Math.min(last_col, Math.floor(boxes[4 * k + 2] / this.cell_size))),
+      Math.max(0, Math.min(last_row, Math.floor(boxes[4 * k + 3] / this.cell_size))),
+    ]
+  }
+
+  private build(): void {
+    const n_buckets = this.n_cols * this.n_rows
+    const starts = new Uint32Array(n_buckets + 1)
+
+    // Count the entries of every bucket, then prefix-sum into offsets
+    let total = 0
+    for (let k = 0; k < this.count; k++) {
+      const [c0, r0, c1, r1] = this.bucket_range(k)
+      for (let r = r0; r <= r1; r++) {
+        for (let c = c0; c <= c1; c++) {
+          starts[r * this.n_cols + c + 1]++
+        }
+      }
+      total += (c1 - c0 + 1) * (r1 - r0 + 1)
+    }
+    for (let b = 0; b < n_buckets; b++) {
+      starts[b + 1] += starts[b]
+    }
+
+    // Fill in insertion order, so buckets stay ordered by insertion
+    const entries = this.entries.length >= total ? this.entries : new Uint32Array(total)
+    const fill = starts.slice(0, n_buckets)
+    for (let k = 0; k < this.count; k++) {
+      const [c0, r0, c1, r1] = this.bucket_range(k)
+      for (let r = r0; r <= r1; r++) {
+        for (let c = c0; c <= c1; c++) {
+          entries[fill[r * this.n_cols + c]++] = k
+        }
+      }
+    }
+
+    this.starts = starts
+    this.entries = entries
+    this.built = true
+  }
+}
@@ -0,0 +1,124 @@
+import * as p from "@bokehjs/core/properties"
+import {Model} from "@bokehjs/model"
+import type {Arrayable} from "@bokehjs/core/types"
+import type {Grid} from "./grid"
+import {resolveGrid, gridUnitVectors} from "./grid"
+import {unitVectors} from "./projections"
+import {PolylineSet} from "./polylines"
+
+export namespace SphereGeometry {
+  export type Attrs = p.AttrsOf<Props>
+
+  export type Props = Model.Props & {
+    coast_lons: p.Property<Arrayable<number | null>>
+    coast_lats: p.Property<Arrayable<number | null>>
+    country_lons: p.Property<Arrayable<number | null>>
+    country_lats: p.Property<Arrayable<number | null>>
+    lons: p.Property<Arrayable<number>>
+    lats: p.Property<Arrayable<number>>
+    lon_axis: p.Property<Arrayable<number>>
+    lat_axis: p.Property<Arrayable<number>>
+    lon_start: p.Property<number>
+    lon_step: p.Property<number>
+    lat_start: p.Property<number>
+    lat_step: p.Property<number>
+    n_lat: p.Property<number>
+    n_lon: p.Property<number>
+  }
+}
+
+export interface SphereGeometry extends SphereGeometry.Attrs {}
+
+/**
+ * Coastlines, country borders and optionally a grid shared by several
+ * spheres. The model is serialized once per document, and the unit vectors
+ * derived from it are cached on it, so every view referencing it reuses
+ * the same buffers, simplification levels and bounding caps.
+ */
+export class SphereGeometry extends Model {
+  declare properties: SphereGeometry.Props
+
+  static override __module__ = "bokeh_gridded_sphere"
+
+  private _coast_lines?: PolylineSet
+  private _country_lines?: PolylineSet
+  private _grid?: Grid | null
+  private _grid_xyz?: Float32Array
+
+  constructor(attrs?: Partial<SphereGeometry.Attrs>) {
+    super(attrs)
+  }
+
+  override connect_signals(): void {
+    super.connect_signals()
+
+    const {coast_lons, coast_lats, country_lons, country_lats} = this.properties
+    this.on_change([coast_lons, coast_lats], () => {
+      this._coast_lines = undefined
+    })
+    this.on_change([country_lons, country_lats], () => {
+      this._country_lines = undefined
+    })
+
+    const {lons, lats, lon_axis, lat_axis, lon_start, lon_step, lat_start, lat_step, n_lat, n_lon} = this.properties
+    this.on_change([lons, lats, lon_axis, lat_axis, lon_start, lon_step, lat_start, lat_step, n_lat, n_lon], () => {
+      this._grid = undefined
+      this._grid_xyz = undefined
+    })
+  }
+
+  get coast_lines(): PolylineSet {
+    if (this._coast_lines === undefined) {
+      this._coast_lines = new PolylineSet(unitVectors(this.coast_lons, this.coast_lats))
+    }
+    return this._coast_lines
+  }
+
+  get country_lines(): PolylineSet {
+    if (this._country_lines === undefined) {
+      this._country_lines = new PolylineSet(unitVectors(this.country_lons, this.country_lats))
+    }
+    return this._country_lines
+  }
+
+  /**
+   * The shared grid, or null when this geometry does not define one
+   */
+  get grid(): Grid | null {
+    if (this._grid === undefined) {
+      const grid = resolveGrid(this)
+      this._grid = grid.n_lat > 0 && grid.n_lon > 0 ? grid : null
+    }
+    return this._grid
+  }
+
+  get grid_xyz(): Float32Array | null {
+    const grid = this.grid
+    if (grid === null) {
+      return null
+    }
+    if (this._grid_xyz === undefined) {
+      this._grid_xyz = gridUnitVectors(grid)
+    }
+    return this._grid_xyz
+  }
+
+  static {
+    this.define<SphereGeometry.Props>(({Arrayable, Float, Int, Nullable}) => ({
+      coast_lons: [ Arrayable(Nullable(Float)), [] ],
+      coast_lats: [ Arrayable(Nullable(Float)), [] ],
+      country_lons: [ Arrayable(Nullable(Float)), [] ],
+      country_lats: [ Arrayable(Nullable(Float)), [] ],
+      lons: [ Arrayable(Float), [] ],
+      lats: [ Arrayable(Float), [] ],
+      lon_axis: [ Arrayable(Float), [] ],
+      lat_axis: [ Arrayable(Float), [] ],
+      lon_start: [ Float, NaN ],
+      lon_step: [ Float, NaN ],
+      lat_start: [ Float, NaN ],
+      lat_step: [ Float, NaN ],
+      n_lat: [ Int, 0 ],
+      n_lon: [ Int, 0 ],
+    }))
+  }
+}
@@ -0,0 +1,101 @@
+/**
+ * Pre-rendered scatter markers stamped with drawImage
+ */
+
+/**
+ * Circle markers drawn once per distinct style into a shared atlas canvas.
+ *
+ * A point is then a single drawImage from its style's cell, with no path
+ * building and no fill/stroke state changes between points. Cells are
+ * packed in rows; a style that no longer fits, or a marker larger than
+ * `max_size`, gets no cell and is drawn directly instead.
+ */
+export class MarkerAtlas {
+  readonly canvas: HTMLCanvasElement
+  private readonly ctx: CanvasRenderingContext2D
+  private readonly keys: Map<string, number> = new Map()
+
+  // x, y and size of every cell
+  private cells: number[] = []
+
+  // Packing cursor: next free x in the current row, its top and height
+  private x: number = 0
+  private y: number = 0
+  private row_height: number = 0
+
+  constructor(readonly size: number = 512, readonly max_size: number = 64) {
+    this.canvas = document.createElement('canvas')
+    this.canvas.width = size
+    this.canvas.height = size
+    this.ctx = this.canvas.getContext('2d')!
+  }
+
+  get count(): number {
+    return this.cells.length / 3
+  }
+
+  /**
+   * Drop all cells, e.g. when the default marker color changes
+   */
+  clear(): void {
+    this.keys.clear()
+    this.cells = []
+    this.x = this.y = this.row_height = 0
+    this.ctx.clearRect(0, 0, this.size, this.size)
+  }
+
+  /**
+   * Cell of a filled and outlined circle, drawing it on first use.
+   * Returns -1 when the marker has to be drawn directly.
+   */
+  get(fill: string, radius: number, stroke: string, line_width: number): number {
+    const key = `${fill}|${radius}|${stroke}|${line_width}`
+    const known = this.keys.get(key)
+    if (known !== undefined) return known
+
+    // Antialiased edges reach about a pixel past the outline
+    const size = Math.ceil(2 * (radius + line_width / 2)) + 2
+    if (size > this.max_size) {
+      this.keys.set(key, -1)
+      return -1
+    }
+    if (this.x + size > this.size) {
+      this.x = 0
+      this.y += this.row_height
+      this.row_height = 0
+    }
+    if (this.y + size > this.size) {
+      this.keys.set(key, -1)
+      return -1
+    }
+
+    const ctx = this.ctx
+    ctx.beginPath()
+    ctx.arc(this.x + size / 2, this.y + size / 2, radius, 0, 2 * Math.PI)
+    ctx.fillStyle = fill
+    ctx.fill()
+    ctx.strokeStyle = stroke
+    ctx.lineWidth = line_width
+    ctx.stroke()
+
+    const cell = this.count
+    this.cells.push(this.x, this.y, size)
+    this.keys.set(key, cell)
+    this.x += size
+    this.row_height = Math.max(this.row_height, size)
+    return cell
+  }
+
+  /**
+   * Stamp a cell centred on (x, y), snapped to whole pixels so the copy is
+   * not resampled
+   */
+  draw(ctx: CanvasRenderingContext2D, cell: number, x: number, y: number): void {
+    const cells = this.cells
+    const sx = cells[3 * cell]
+    const sy = cells[3 * cell + 1]
+    const size = cells[3 * cell + 2]
+    const half = size / 2
+    ctx.drawImage(this.canvas, sx, sy, size, size, Math.round(x - half), Math.round(y - half), size, size)
+  }
+}
@@ -0,0 +1,35 @@
+/**
+ * Stand-in for BokehJS at the start of the render worker script
+ *
+ * The worker bundle is built like any extension bundle, so it registers
+ * itself with Bokeh.register_plugin(). Inside the worker there is no BokehJS;
+ * this provides just enough of it to load the bundle's modules and run its
+ * entry. The bundle has no external modules, so none are resolved here.
+ */
+self.Bokeh = {
+  register_plugin(modules, entry) {
+    const cache = {}
+
+    const require = (id) => {
+      let mod = cache[id]
+      if (mod === undefined) {
+        if (modules[id] === undefined) {
+          throw new Error(`render worker: cannot find module '${id}'`)
+        }
+        mod = cache[id] = {exports: {}}
+        const exports = mod.exports
+
+        const __esModule = () => {
+          Object.defineProperty(exports, "__esModule", {value: true})
+        }
+        const __esExport = (name, value) => {
+          Object.defineProperty(exports, name, {enumerable: true, get: () => value})
+        }
+        modules[id].call(exports, require, mod, exports, __esModule, __esExport)
+      }
+      return mod.exports
+    }
+
+    return require(entry)
+  },
+}
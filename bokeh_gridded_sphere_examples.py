@@ -1,7 +1,7 @@
 # ============================================================================
 # Example 0: SIMPLE GRIDDED DATA ON SPHERE
 # ============================================================================
-from gridded_sphere_py import GriddedSphere
+from bokeh_gridded_sphere import GriddedSphere
 from bokeh.plotting import show
 import numpy as np
 from points import cities
@@ -12,9 +12,9 @@ lons_grid, lats_grid = np.meshgrid(lons, lats)
 values = 30 - 50 * np.abs(lats_grid) / 90;values += 10 * np.sin(np.radians(lons_grid) * 3) * np.cos(np.radians(lats_grid) * 2)
 # Create sphere
 sphere1 = GriddedSphere(
-    lons=lons_grid.flatten().tolist(),
-    lats=lats_grid.flatten().tolist(),
-    values=values.flatten().tolist(),
+    lon_axis=lons,
+    lat_axis=lats,
+    values=values,
     n_lat=n_lat,
     n_lon=n_lon,
     palette='Spectral',
@@ -24,9 +24,9 @@ show(sphere1)
 
 # another example
 sphere2 = GriddedSphere(
-    lons=lons_grid.flatten().tolist(),
-    lats=lats_grid.flatten().tolist(),
-    values=values.flatten().tolist(),
+    lon_axis=lons,
+    lat_axis=lats,
+    values=values,
     n_lat=n_lat,
     n_lon=n_lon,
     palette='terrain',
@@ -45,7 +45,7 @@ show(sphere2)
 
 
 from bokeh.plotting import show
-from gridded_sphere_py import GriddedSphere
+from bokeh_gridded_sphere import GriddedSphere
 import numpy as np
 
 # Create realistic Earth-like gridded data
@@ -88,9 +88,9 @@ for i in range(n_bars):
     })
 
 sphere2 = GriddedSphere(
-    lons=lon_grid.flatten().tolist(),
-    lats=lat_grid.flatten().tolist(),
-    values=temperature.flatten().tolist(),
+    lon_axis=lons,
+    lat_axis=lats,
+    values=temperature,
     n_lat=n_lat,
     n_lon=n_lon,
     palette='inferno',
@@ -149,9 +149,9 @@ earthquakes = [
 ]
 
 sphere_scatter = GriddedSphere(
-    lons=lon_grid.flatten().tolist(),
-    lats=lat_grid.flatten().tolist(),
-    values=temperature.flatten().tolist(),
+    lon_axis=lons,
+    lat_axis=lats,
+    values=temperature,
     n_lat=n_lat,
     n_lon=n_lon,
     palette='terrain',
@@ -304,9 +304,9 @@ port_cities = [
 ]
 
 sphere_lines = GriddedSphere(
-    lons=lon_grid.flatten().tolist(),
-    lats=lat_grid.flatten().tolist(),
-    values=temperature.flatten().tolist(),
+    lon_axis=lons,
+    lat_axis=lats,
+    values=temperature,
     n_lat=n_lat,
     n_lon=n_lon,
     palette='Blues',
@@ -337,7 +337,7 @@ show(sphere_lines)
 
 
 import numpy as np
-from gridded_sphere_py import GriddedSphere
+from bokeh_gridded_sphere import GriddedSphere
 from bokeh.io import show
 
 def make_ring(inclination_deg, raan_deg, altitude, n=300):
@@ -395,9 +395,9 @@ add_ring(trajectories, inclination_deg=98,   raan_deg=60, altitude=225, color='#
 
 
 sphere = GriddedSphere(
-    lons=lon_grid.flatten().tolist(),
-    lats=lat_grid.flatten().tolist(),
-    values=temperature.flatten().tolist(),
+    lon_axis=lons,
+    lat_axis=lats,
+    values=temperature,
     n_lat=n_lat, n_lon=n_lon,
     palette='summer',
     show_colorbar=True,
@@ -419,7 +419,7 @@ show(sphere)
 
 from bokeh.plotting import show
 from bokeh.layouts import column
-from gridded_sphere_py import GriddedSphere
+from bokeh_gridded_sphere import GriddedSphere
 import numpy as np
 
 # Create some sample gridded data
@@ -437,9 +437,9 @@ temperature = 30 - 40 * np.abs(np.sin(np.radians(lat_grid)))
 # === Example 1: Classic day-night terminator ===
 # Light from the right side (like afternoon sun)
 sphere1 = GriddedSphere(
-    lons=lon_grid.flatten().tolist(),
-    lats=lat_grid.flatten().tolist(),
-    values=temperature.flatten().tolist(),
+    lon_axis=lons,
+    lat_axis=lats,
+    values=temperature,
     n_lat=n_lat,
     n_lon=n_lon,
     palette='Spectral',  
@@ -554,9 +554,9 @@ temperature_anomalies = [
 ]
 
 sphere_combined = GriddedSphere(
-    lons=lon_grid.flatten().tolist(),
-    lats=lat_grid.flatten().tolist(),
-    values=temperature.flatten().tolist(),
+    lon_axis=lons,
+    lat_axis=lats,
+    values=temperature,
     n_lat=n_lat,
     n_lon=n_lon,
     palette='RdYlBu_r',
@@ -602,7 +602,7 @@ from bokeh.layouts import column, row
 from bokeh.models import (
     Slider, Button, Div, CustomJS, ColumnDataSource, Range1d
 )
-from gridded_sphere_py import GriddedSphere
+from bokeh_gridded_sphere import GriddedSphere
 
 # ---------------------------------------------------------------------------
 # Grid setup
@@ -628,16 +628,19 @@ for i in range(n_years):
     noise = 1.5 * i**2 *np.sin(np.radians(lat_grid * 1.3 + i * 37)) \
           * np.cos(np.radians(lon_grid * 0.8 + i * 53))
     temp  = base + trend + noise
-    all_values.append(temp.flatten().tolist())
+    all_values.append(temp)
     yearly_mean.append(float(np.mean(temp)))
 
 # ---------------------------------------------------------------------------
 # Sphere with initial data
 # ---------------------------------------------------------------------------
 sphere = GriddedSphere(
-    lons=lon_grid.flatten().tolist(),
-    lats=lat_grid.flatten().tolist(),
-    values=all_values[0],
+    lon_axis=lons,
+    lat_axis=lats,
+    values_cube=np.stack(all_values),
+    # Each year is colored on its own range; 'cube' would use one range for
+    # all years so they can be compared, at the cost of contrast early on
+    cube_color_range='frame',
     n_lat=n_lat,
     n_lon=n_lon,
     palette='Spectral',
@@ -660,9 +663,6 @@ sphere = GriddedSphere(
     coastline_width=0.9,
 )
 
-# Store all years of data in sphere.tags (THIS IS THE KEY!)
-sphere.tags = all_values
-
 # ---------------------------------------------------------------------------
 # Timeseries plot
 # ---------------------------------------------------------------------------
@@ -734,7 +734,6 @@ stop_btn = Button(label='⏹  Stop', button_type='default', width=110, height=36
 
 # ---------------------------------------------------------------------------
 # CustomJS: slider change -> update sphere + timeseries + label
-# FORCE UPDATE by changing colorbar_title which triggers re-render
 # ---------------------------------------------------------------------------
 update_cb = CustomJS(args=dict(
     sphere=sphere,
@@ -746,24 +745,10 @@ update_cb = CustomJS(args=dict(
 ), code="""
     const idx = slider.value;
     
-    // Access the data stored in sphere.tags
-    const newValues = sphere.tags[idx];
-    
-    // Update sphere values
-    sphere.values = newValues;
-    
-    // FORCE UPDATE: Change colorbar_title to trigger re-render
+    // Show year idx of the cube (the sphere redraws on its own)
+    sphere.time_index = idx;
     sphere.colorbar_title = 'Temperature (°C) — ' + years[idx];
     
-    // Alternative force update methods (try if above doesn't work):
-    // Method 1: Toggle palette
-    //const currentPalette = sphere.palette;
-    //sphere.palette = 'Viridis256';
-    //sphere.palette = currentPalette;
-    
-    // Method 2: Slightly adjust rotation
-    sphere.rotation = sphere.rotation + 0.0000001;
-    
     // Update timeseries: reveal points 0..idx
     const x = [];
     const y = [];
@@ -1,8 +0,0 @@
-"""
-Pre-processed coastline data for fast loading
-Generated from Natural Earth 110m coastline GeoJSON
-"""
-
-COAST_LONS = [-163.712896, -163.105801, -161.245113, -160.246208, -159.482405, -159.208184, -161.127601, -162.439847, -163.027408, -163.066604, -163.712896, None, -6.197885, -6.032985, -6.788857, -8.561617, -9.977086, -9.166283, -9.688525, -8.327987, -7.572168, -6.733847, -5.661949, -6.197885, None, 141.00021, 142.735247, 144.583971, 145.273128, 145.829786, 145.981922, 147.648073, 147.891108, 146.970905, 147.191874, 148.084636, 148.734105, 149.306835, 149.266631, 150.038728, 149.738798, 150.801628, 150.690575, 150.028393, 149.78231, 148.923138, 147.913018, 147.135443, 146.567881, 146.048481, 144.744168, 143.897088, 143.286376, 143.413913, 142.628431, 142.068259, 141.033852, 140.143415, 139.127767, 138.881477, 137.614474, 138.039099, 138.668621, 138.407914, 137.92784, 135.98925, 135.164598, 133.66288, 133.367705, 132.983956, 132.756941, 132.753789, 131.989804, 133.066845, 133.780031, 133.696212, 132.232373, 131.836222, 130.94284, 130.519558, 131.867538, 132.380116, 133.985548, 134.143368, 134.422627, 135.457603, 136.293314, 137.440738, 138.329727, 139.184921, 139.926684, 141.00021, None, 114.204017, 114.599961, 115.45071, 116.220741, 116.725103, 117.129626, 117.643393, 117.689075, 118.347691, 119.181904, 119.110694, 118.439727, 118.618321, 117.882035, 117.313232, 118.04833, 117.875627, 118.996747, 117.811858, 117.478339, 117.521644, 116.560048, 116.533797, 116.148084, 116.000858, 114.864803, 114.468652, 113.755672, 113.256994, 112.068126, 111.703291, 111.04824, 110.223846, 110.070936, 109.571948, 109.091874, 108.952658, 109.069136, 109.66326, 110.396135, 111.168853, 111.370081, 111.796928, 112.995615, 113.712935, 114.204017, None, -93.612756, -94.156909, -95.608681, -96.820932, -96.288587, -94.85082, -93.977747, -93.612756, None, -93.840003, -94.295608, -96.169654, -96.436304, -94.422577, -93.720656, -93.840003, None, -96.754399, -95.559278, -95.830295, -97.309843, -98.124289, -98.552868, -98.631984, -97.337231, -96.754399, None, -88.15035, -89.764722, -92.422441, -92.768285, -92.889906, -93.893824, -95.962457, -97.121379, -96.745123, -94.684086, -93.573921, -91.605023, -90.741846, -90.969661, -89.822238, -89.187083, -87.838276, -86.379192, -84.789625, -82.753445, -81.128531, -80.057511, -79.833933, -80.457771, -81.948843, -83.228894, -86.097452, -88.15035, None, -111.264443, -109.854452, -110.186938, -112.051191, -113.534279, -112.724587, -111.264443, None, -110.963661, -109.663146, -110.881314, -112.542091, -112.525891, -111.50001, -110.963661, None, -66.282434, -65.771303, -65.591004, -65.847164, -66.599934, -67.184162, -67.242428, -67.100679, -66.282434, None, -77.569601, -76.896619, -76.365359, -76.199659, -76.902561, -77.206341, -77.766023, -78.337719, -78.217727, -77.797365, -77.569601, None, -82.268151, -81.404457, -80.618769, -79.679524, -79.281486, -78.347434, -77.993296, -77.146422, -76.523825, -76.19462, -75.598222, -75.67106, -74.933896, -74.178025, -74.296648, -74.961595, -75.63468, -76.323656, -77.755481, -77.085108, -77.492655, -78.137292, -78.482827, -78.719867, -79.285, -80.217475, -80.517535, -81.820943, -82.169992, -81.795002, -82.775898, -83.494459, -83.9088, -84.052151, -84.54703, -84.974911, -84.447062, -84.230357, -83.77824, -83.267548, -82.510436, -82.268151, None, -55.600218, -56.134036, -56.795882, -56.143105, -55.471492, -55.822401, -54.935143, -54.473775, -53.476549, -53.786014, -53.086134, -52.958648, -52.648099, -53.069158, -53.521456, -54.178936, -53.961869, -54.240482, -55.400773, -55.997481, -55.291219, -56.250799, -57.325229, -59.266015, -59.419494, -58.796586, -59.231625, -58.391805, -57.35869, -56.73865, -55.870977, -55.406974, -55.600218, None, -83.882626, -82.787577, -81.642014, -81.55344, -80.817361, -80.103451, -80.99102, -82.547178, -83.108798, -84.100417, -85.523405, -85.866769, -87.221983, -86.35276, -86.224886, -85.883848, -85.161308, -84.975764, -84.464012, -83.882626, None, -78.770639, -77.824624, -75.605845, -74.228616, -74.099141, -72.242226, -71.200015, -68.786054, -67.91497, -66.969033, -68.805123, -66.449866, -64.862314, -63.424934, -61.851981, -62.163177, -63.918444, -65.14886, -66.721219, -68.015016, -68.141287, -67.089646, -65.73208, -65.320168, -64.669406, -65.013804, -66.275045, -68.783186, -67.369681, -66.328297, -66.165568, -68.877367, -71.023437, -72.235379, -71.886278, -73.378306, -74.834419, -74.818503, -77.70998, -78.555949, -77.897281, -76.018274, -73.959795, -74.293883, -73.944912, -72.651167, -72.92606, -73.311618, -74.843307, -76.869101, -76.228649, -77.28737, -78.168634, -78.957242, -79.492455, -81.305471, -84.944706, -87.060003, -88.681713, -89.51342, -88.467721, -89.888151, -90.20516, -89.436577, -88.408242, -85.826151, -86.562179, -85.774371, -84.850112, -82.31559, -80.600088, -80.748942, -78.770639, None, -94.503658, -92.420012, -90.509793, -92.003965, -93.196296, -94.269047, -95.409856, -96.033745, -96.018268, -95.495793, -94.503658, None, -100.43836, -101.54, -100.356427, -99.163864, -97.38, -97.12, -98.053596, -96.54, -96.72, -98.35965, -99.322847, -100.01482, -102.48, -102.48, -100.43836, None, -107.819434, -106.92892, -105.880999, -105.704989, -106.313479, -109.699991, -112.223067, -113.743801, -113.871338, -111.794204, -116.312197, -117.710406, -116.346019, -115.404862, -112.590564, -110.814212, -109.06711, -110.497255, -109.581109, -108.54859, -108.21141, -107.819434, None, -122.854924, -121.157535, -119.103939, -117.570131, -116.198587, -116.335813, -117.106051, -118.040412, -119.899317, -121.499994, -122.854924, None, -121.537873, -120.109769, -117.555636, -116.584429, -115.510799, -116.767932, -119.22, -120.46, -120.46, -123.092197, -123.62, -125.928949, -125.5, -124.80729, -123.94, -124.917744, -121.537873, None, -166.467792, -165.67443, -165.579164, -166.19277, -166.848337, -167.455277, -166.467792, None, -153.228729, -152.564791, -152.141147, -153.006314, -154.00509, -154.516403, -154.670993, -153.76278, -153.228729, None, -132.710008, -131.749989, -132.04948, -131.179042, -131.577829, -132.180428, -132.549992, -133.054612, -133.239665, -133.180005, -132.710008, None, -125.415001, -124.920767, -123.922508, -123.510001, -124.01289, -125.655012, -125.954994, -126.850004, -127.029993, -128.059335, -128.444583, -128.358413, -127.30858, -126.695, -125.755006, -125.415001, None, -171.731657, -171.114434, -170.491112, -169.682505, -168.689439, -168.771941, -169.52944, -170.290556, -170.671386, -171.553063, -171.791111, -171.731657, None, -105.492289, -103.529282, -100.825158, -100.060192, -99.670939, -101.30394, -102.949809, -105.176133, -104.210429, -105.41958, -105.492289, None, 32.946961, 33.667227, 34.576474, 33.900804, 34.004881, 32.979827, 32.490296, 32.256667, 32.802474, 32.946961, None, 26.290003, 26.164998, 24.724982, 24.735007, 23.514978, 23.69998, 24.246665, 25.025015, 25.769208, 25.745023, 26.290003, None, 49.543519, 49.808981, 50.056511, 50.217431, 50.476537, 50.377111, 50.200275, 49.860606, 49.672607, 49.863344, 49.774564, 49.498612, 49.435619, 49.041792, 48.548541, 47.930749, 47.547723, 47.095761, 46.282478, 45.409508, 44.833574, 44.03972, 43.763768, 43.697778, 43.345654, 43.254187, 43.433298, 43.893683, 43.89637, 44.374325, 44.464397, 44.232422, 44.042976, 43.963084, 44.312469, 44.446517, 44.944937, 45.502732, 45.872994, 46.312243, 46.882183, 47.70513, 48.005215, 47.868996, 48.293828, 48.84506, 48.863509, 49.194651, 49.543519, None, 167.216801, 167.844877, 167.515181, 167.180008, 167.216801, None, 166.793158, 166.649859, 166.629137, 167.107712, 167.270028, 167.001207, 166.793158, None, 134.210134, 134.112776, 134.290336, 134.499625, 134.727002, 134.724624, 134.210134, None, -48.660616, -48.151396, -46.662857, -45.154758, -43.920828, -43.48995, -43.372438, -43.333267, -44.880537, -46.506174, -48.386421, -50.482107, -52.851988, -54.164259, -53.987991, -51.853134, -50.991326, -50.364595, -49.914131, -49.306959, -48.660616, None, -66.290031, -64.037688, -61.883246, -61.138976, -60.610119, -59.572095, -59.865849, -60.159656, -62.255393, -64.488125, -65.741666, -65.741666, -66.290031, None, -73.915819, -73.230331, -72.074717, -71.780962, -71.72218, -71.741791, -71.173815, -70.253252, -69.724447, -69.489422, -69.058518, -68.725541, -68.451346, -68.333834, -68.510128, -68.784297, -69.959471, -71.075889, -72.388134, -71.8985, -73.073622, -74.19004, -74.953895, -75.012625, -73.915819, None, -102.330725, -101.703967, -100.430919, -98.98155, -97.884743, -96.787937, -96.20035, -96.983765, -98.198083, -99.432013, -100.783455, -101.801868, -102.330725, None, -122.621735, -122.406244, -121.211511, -119.91885, -118.724143, -119.292119, -120.232216, -121.622829, -122.621735, None, -127.28313, -126.558471, -125.559566, -124.031881, -124.619468, -125.91218, -127.28313, None, 165.77999, 166.599991, 167.120011, 166.740035, 166.189732, 165.474375, 164.829815, 164.167995, 164.029606, 164.459967, 165.020036, 165.460009, 165.77999, None, 152.640017, 153.019994, 153.140038, 152.827292, 152.638673, 152.406026, 151.953237, 151.384279, 150.66205, 150.939965, 151.479984, 151.820015, 152.239989, 152.640017, None, 151.30139, 150.754447, 150.241197, 149.709963, 148.890065, 148.318937, 148.401826, 149.298412, 149.845562, 149.99625, 150.139756, 150.236908, 150.807467, 151.089672, 151.647881, 151.537862, 152.136792, 152.338743, 152.318693, 151.982796, 151.459107, 151.30139, None, 162.119025, 162.398646, 161.700032, 161.319797, 161.917383, 162.119025, None, 161.679982, 161.529397, 160.788253, 160.579997, 160.920028, 161.280006, 161.679982, None, 160.852229, 160.462588, 159.849447, 159.640003, 159.702945, 160.362956, 160.688518, 160.852229, None, 159.640003, 159.875027, 159.917402, 159.133677, 158.586114, 158.21115, 158.359978, 158.820001, 159.640003, None, 157.14, 157.538426, 157.33942, 156.90203, 156.491358, 156.542828, 157.14, None, 154.759991, 155.062918, 155.547746, 156.019965, 155.880026, 155.599991, 155.166994, 154.729192, 154.514114, 154.652504, 154.759991, None, 176.885824, 176.508017, 176.01244, 175.239567, 175.067898, 174.650973, 175.22763, 174.900157, 173.824047, 173.852262, 174.574802, 174.743474, 174.696965, 174.292028, 174.319004, 173.840997, 173.054171, 172.636005, 173.007042, 173.551298, 174.32939, 174.612009, 175.336616, 175.357596, 175.808887, 175.95849, 176.763195, 177.438813, 178.010354, 178.517094, 178.274731, 177.97046, 177.206993, 176.939981, 177.032946, 176.885824, None, 169.667815, 170.52492, 171.12509, 171.569714, 171.948709, 172.097227, 172.79858, 173.020375, 173.247234, 173.958405, 174.247587, 174.248517, 173.876447, 173.22274, 172.711246, 173.080113, 172.308584, 171.452925, 171.185138, 170.616697, 169.831422, 169.332331, 168.411354, 167.763745, 166.676886, 166.509144, 167.046373, 168.303763, 168.949409, 169.667815, None, 147.689259, 148.289068, 148.359865, 148.017301, 147.914052, 147.564564, 146.870343, 146.663327, 146.048378, 145.43193, 145.29509, 144.718071, 144.743755, 145.397978, 146.364121, 146.908584, 147.689259, None, 126.148714, 125.088623, 124.221648, 124.028947, 123.659667, 122.811036, 122.183064, 121.299191, 120.580268, 119.893695, 119.298899, 119.007341, 118.505718, 118.024972, 117.295507, 116.625109, 115.564347, 115.026809, 115.048616, 115.545123, 115.714674, 115.679379, 115.801645, 115.689611, 115.160909, 114.997043, 115.040038, 114.641974, 114.616498, 114.173579, 114.048884, 113.477498, 113.338953, 113.778358, 113.440962, 113.936901, 114.232852, 114.216161, 113.721255, 113.625344, 113.393523, 113.502044, 113.706993, 113.843418, 113.736552, 114.149756, 114.225307, 114.647762, 115.460167, 115.947373, 116.711615, 117.166316, 117.441545, 118.229559, 118.836085, 118.987807, 119.252494, 119.805225, 120.85622, 121.399856, 121.655086, 122.241665, 122.286624, 122.312772, 123.012574, 123.433789, 123.859345, 123.503242, 123.817073, 124.258287, 124.379726, 124.926153, 125.167275, 125.670087, 125.685796, 126.125149, 126.142823, 126.582589, 127.065867, 127.804633, 128.35969, 128.985543, 129.621473, 129.4096, 129.888641, 130.339466, 130.183506, 130.617795, 131.223495, 131.735091, 132.575298, 132.557212, 131.824698, 132.357224, 133.019561, 133.550846, 134.393068, 134.678632, 135.298491, 135.882693, 136.258381, 136.492475, 136.95162, 136.685125, 136.305407, 135.961758, 136.077617, 135.783836, 135.428664, 135.500184, 136.295175, 137.06536, 137.580471, 138.303217, 138.585164, 139.108543, 139.260575, 140.215142, 140.875412, 141.07111, 141.274095, 141.398222, 141.702183, 141.56338, 141.63552, 141.519869, 141.65092, 141.842691, 141.68699, 141.928629, 142.118488, 142.143706, 142.51526, 142.79731, 142.866763, 143.115947, 143.158632, 143.522124, 143.597158, 143.561811, 143.922099, 144.563714, 144.894856, 145.374724, 145.271991, 145.48526, 145.636982, 145.888853, 146.160309, 146.063674, 146.387478, 147.471082, 148.177602, 148.848414, 148.717465, 149.28942, 149.678337, 150.077382, 150.482939, 150.727265, 150.899554, 151.609175, 152.07354, 152.855197, 153.136162, 153.161949, 153.092909, 153.569469, 153.512108, 153.339095, 153.069241, 153.08955, 152.891578, 152.450002, 151.709117, 151.343972, 151.010555, 150.714139, 150.32822, 150.075212, 149.946124, 149.997284, 149.423882, 148.304622, 147.381733, 146.922123, 146.317922, 145.489652, 144.876976, 145.032212, 144.485682, 143.609974, 142.745427, 142.17833, 141.606582, 140.638579, 139.992158, 139.806588, 139.574148, 139.082808, 138.120748, 138.449462, 138.207564, 137.71917, 136.829406, 137.352371, 137.503886, 137.890116, 137.810328, 136.996837, 136.372017, 135.989043, 135.208213, 135.239218, 134.613417, 134.085904, 134.273903, 132.990777, 132.288081, 131.326331, 129.535794, 128.240938, 127.102867, 126.148714, None, 81.787959, 81.637322, 81.21802, 80.348357, 79.872469, 79.695167, 80.147801, 80.838818, 81.304319, 81.787959, None, 129.370998, 130.471344, 130.834836, 129.990547, 129.155249, 128.590684, 127.898891, 128.135879, 129.370998, None, 126.874923, 126.183802, 125.989034, 127.000651, 127.249215, 126.874923, None, 127.932378, 128.004156, 128.594559, 128.688249, 128.635952, 128.12017, 127.968034, 128.379999, 128.100016, 127.696475, 127.39949, 127.600512, 127.932378, None, 122.927567, 124.077522, 125.065989, 125.240501, 124.437035, 123.685505, 122.723083, 121.056725, 120.183083, 120.04087, 120.935905, 121.475821, 123.340565, 123.258399, 122.822664, 122.38853, 121.508274, 122.454572, 122.271896, 123.170963, 123.162333, 122.628515, 122.236394, 122.719569, 121.738234, 121.489463, 121.619171, 120.898182, 120.972389, 120.305453, 120.390047, 120.430717, 119.796543, 119.366906, 119.653606, 119.498835, 119.078344, 118.767769, 119.180974, 119.323394, 119.825999, 120.035702, 120.885779, 121.666817, 122.927567, None, 120.295014, 118.967808, 119.90031, 120.425756, 120.775502, 120.715609, 120.295014, None, 121.341669, 122.007365, 122.903537, 122.756983, 121.254491, 119.924391, 119.920929, 120.715092, 121.341669, None, 118.260616, 118.87846, 119.126507, 117.970402, 117.277731, 116.740141, 117.083737, 117.632024, 117.900018, 118.260616, None, 108.486846, 108.623479, 110.539227, 110.759576, 112.614811, 112.978768, 114.478935, 115.705527, 114.564511, 113.464734, 112.559672, 111.522061, 110.58615, 109.427667, 108.693655, 108.277763, 106.454102, 106.280624, 105.365486, 106.051646, 107.265009, 108.072091, 108.486846, None, 104.369991, 104.53949, 104.887893, 105.622111, 106.108593, 105.857446, 105.817655, 104.710384, 103.868213, 102.584261, 102.156173, 101.399113, 100.902503, 100.141981, 99.26374, 98.970011, 98.601351, 97.699598, 97.176942, 96.424017, 95.380876, 95.293026, 95.936863, 97.484882, 98.369169, 99.142559, 99.693998, 100.641434, 101.658012, 102.498271, 103.07684, 103.838396, 103.437645, 104.010789, 104.369991, None, 120.833896, 120.323436, 121.180128, 121.527394, 121.26219, 120.833896, None, 122.586089, 122.837081, 122.947411, 123.49885, 123.337774, 124.077936, 123.982438, 123.62308, 123.309921, 122.995831, 122.380055, 122.586089, None, 126.376814, 126.478513, 126.537424, 126.196773, 125.831421, 125.363852, 125.683161, 125.396512, 124.219788, 123.93872, 124.243662, 123.610161, 123.296071, 122.825506, 122.085499, 121.919928, 122.312359, 122.942398, 123.487688, 123.841154, 124.60147, 124.764612, 125.471391, 125.412118, 126.222714, 126.306637, 126.376814, None, 109.47521, 108.655208, 108.626217, 109.119056, 110.211599, 110.786551, 111.010051, 110.570647, 110.339188, 109.47521, None, 121.777818, 121.175632, 120.74708, 120.220083, 120.106189, 120.69468, 121.495044, 121.951244, 121.777818, None, 141.884601, 140.959489, 140.976336, 140.59977, 140.774074, 140.253279, 138.975528, 137.217599, 135.792983, 135.120983, 135.079435, 133.340316, 132.156771, 130.986145, 132.000036, 131.33279, 130.686318, 130.20242, 130.447676, 129.814692, 129.408411, 130.353935, 130.878451, 131.884229, 132.617673, 134.608301, 135.677538, 136.723831, 137.390612, 138.857602, 139.426405, 140.05479, 139.883379, 140.305783, 141.368973, 141.914263, 141.884601, None, 144.613427, 145.320825, 145.543137, 144.059662, 143.18385, 141.611491, 141.067286, 139.955106, 139.817544, 140.312087, 141.380549, 141.671952, 141.967645, 143.14287, 143.910162, 144.613427, None, 8.709991, 9.210012, 9.809975, 9.669519, 9.214818, 8.806936, 8.428302, 8.388253, 8.159998, 8.709991, None, 8.746009, 9.390001, 9.560016, 9.229752, 8.775723, 8.544213, 8.746009, None, 12.370904, 12.690006, 12.089991, 11.043543, 10.903914, 12.370904, None, -4.211495, -3.005005, -4.073828, -3.055002, -1.959281, -2.219988, -3.119003, -2.085009, -1.114991, -0.430485, 0.184981, 0.469977, 1.681531, 1.559988, 1.050562, 1.449865, 0.550334, -0.787517, -2.489998, -2.956274, -3.617448, -4.542508, -5.245023, -5.776567, -4.30999, -3.414851, -4.984367, -5.267296, -4.222347, -4.770013, -4.579999, -3.09208, -2.945009, -3.630005, -4.844169, -5.082527, -4.719112, -5.047981, -5.586398, -5.644999, -6.149981, -5.786825, -5.009999, -4.211495, None, -14.508695, -14.739637, -13.609732, -14.909834, -17.794438, -18.656246, -19.972755, -22.762972, -21.778484, -23.955044, -22.184403, -22.227423, -24.326184, -23.650515, -22.134922, -20.576284, -19.056842, -17.798624, -16.167819, -14.508695, None, 142.914616, 143.260848, 143.235268, 143.648007, 144.654148, 143.173928, 142.558668, 143.533492, 143.505277, 142.747701, 142.09203, 141.906925, 142.018443, 141.904445, 142.1358, 142.179983, 141.594076, 141.682546, 142.606934, 142.209749, 142.654786, 142.914616, None, 118.504581, 117.174275, 117.664477, 118.386914, 118.987342, 119.511496, 119.689677, 119.029458, 118.504581, None, 122.336957, 122.174279, 122.515654, 122.252311, 121.662786, 121.505018, 121.728829, 122.258925, 122.701276, 123.950295, 123.855107, 124.181289, 124.077419, 123.298035, 122.928652, 122.671355, 122.03465, 121.126385, 120.628637, 120.679384, 120.991819, 120.693336, 120.564145, 120.070429, 119.920929, 119.883773, 120.286436, 120.390047, 120.715867, 121.321308, 121.937601, 122.246006, 122.336957, None, 122.03837, 121.883548, 122.483821, 123.120217, 123.100838, 122.637714, 122.00261, 121.967367, 122.03837, None, 125.502552, 125.783413, 125.011884, 125.032761, 125.277449, 124.801819, 124.760168, 124.459101, 124.302522, 124.891013, 124.87799, 124.266762, 125.227116, 125.502552, None, -77.353361, -76.836674, -76.086384, -75.6746, -75.664704, -75.480426, -74.906895, -74.276753, -74.197223, -73.414764, -72.627835, -72.238195, -71.75409, -71.399822, -71.137461, -71.331584, -71.360006, -71.94705, -71.620868, -71.633064, -72.074174, -71.695644, -71.264559, -71.039999, -71.350084, -71.400623, -70.155299, -70.293843, -69.943245, -69.5843, -68.882999, -68.233271, -68.194127, -67.296249, -66.227864, -65.655238, -64.890452, -64.329479, -64.318007, -63.079322, -61.880946, -62.730119, -62.388512, -61.588767, -60.830597, -60.671252, -60.150096, -59.758285, -59.101684, -58.482962, -58.454876, -58.078103, -57.542219, -57.147436, -55.949318, -55.84178, -55.03325, -53.958045, -53.618453, -52.882141, -51.823343, -51.657797, -51.29999, -51.069771, -50.508875, -49.974076, -49.947101, -50.699251, -50.388211, -48.620567, -48.584497, -47.824956, -46.566584, -44.905703, -44.417619, -44.581589, -43.418791, -41.472657, -39.978665, -38.500383, -37.223252, -36.452937, -35.597796, -35.235389, -34.89603, -34.729993, -35.128212, -35.636967, -37.046519, -37.683612, -38.423877, -38.673887, -38.953276, -38.882298, -39.161092, -39.267339, -39.583521, -39.760823, -40.774741, -40.944756, -41.754164, -41.988284, -43.074704, -44.647812, -45.352136, -46.472093, -47.648972, -48.495458, -48.641005, -48.474736, -48.66152, -48.888457, -49.587329, -50.696874, -51.576226, -52.256081, -52.7121, -53.373662, -53.806426, -54.935866, -55.67409, -56.215297, -57.139685, -57.817861, -58.427074, -58.495442, -57.22583, -57.362359, -56.737487, -56.788285, -57.749157, -59.231857, -61.237445, -62.335957, -62.125763, -62.330531, -62.145994, -62.745803, -63.770495, -64.73209, -65.118035, -64.978561, -64.303408, -63.755948, -63.458059, -64.378804, -65.181804, -65.328823, -65.565269, -66.509966, -67.293794, -67.580546, -66.597066, -65.641027, -65.985088, -67.166179, -67.816088, -68.728745, -69.138539, -68.815561, -68.149995, -68.571545, -69.461284, -69.94278, -70.845102, -71.006332, -71.429795, -72.557943, -73.702757, -74.946763, None, -77.881571, -77.476661, -77.318815, -77.533221, -77.307601, -77.496272, -77.12769, -77.510431, -77.931543, -78.42761, -78.662118, -78.617831, -78.990935, -78.855259, -79.542762, -80.09061, -80.020898, -80.399325, -80.58337, -80.933659, -80.764806, -80.967765, -80.368784, -79.986559, -79.770293, -80.302561, -81.09967, -81.410943, -80.926347, -81.249996, -80.537482, -79.760578, -79.44592, -79.036953, -78.092153, -77.106192, -76.259242, -76.423469, -76.009205, -75.237883, -73.44453, -71.462041, -71.37525, -70.372572, -70.16442, -70.091246, -70.403966, -70.724954, -70.905124, -71.489894, -71.370083, -71.668721, -71.43845, -71.861732, -72.553137, -73.166717, -73.588061, -73.505559, -73.217593, -73.677099, -74.017957, -74.331943, -73.701336, -73.3889, -72.717804, -73.240356, -74.351709, -74.692154, -75.644395, -74.126581, -75.18277, -75.608015, -75.479754, -74.976632, -75.260026, -74.946763, None, -74.662543, -73.838097, -72.434178, -71.107721, -70.591784, -70.267488, -69.345658, -68.634126, -68.250015, -67.749993, -66.449995, -65.050003, -65.500002, -66.449995, -66.959912, -67.291029, -68.148625, -68.639991, -69.232099, -69.958076, -71.005686, -72.263904, -73.285211, -74.662543, None, 44.846958, 46.799139, 48.318477, 48.522806, 49.09719, 50.039768, 51.522933, 51.136187, 49.793685, 48.894411, 48.754937, 47.586119, 46.502826, 47.072455, 44.846958, None, 53.50829, 55.902459, 55.631933, 57.868644, 61.170044, 64.498368, 66.210925, 68.15706, 68.852211, 68.180573, 64.637326, 61.583508, 58.477082, 56.986786, 55.419336, 55.622838, 57.535693, 56.944979, 53.677375, 53.412017, 51.601895, 51.455754, 52.478275, 52.444169, 54.427614, 53.50829, None, 27.407506, 25.924651, 23.024466, 20.075188, 19.897266, 18.462264, 17.368015, 20.455992, 21.907945, 22.919253, 25.447625, 27.407506, None, 24.724104, 22.490338, 20.726001, 21.416088, 20.811888, 22.884268, 23.281349, 24.724104, None, 15.142828, 15.522546, 16.990829, 18.251837, 21.543833, 19.027397, 18.47172, 17.59441, 17.118211, 15.913169, 13.762602, 14.669575, 13.170597, 11.222292, 10.444562, 13.170752, 13.718522, 15.142828, None, -77.881571, -78.214936, -78.429161, -78.182096, -78.435465, -78.622121, -79.120307, -79.557877, -79.760578, -80.164481, -80.382659, -80.480689, -80.00369, -80.276671, -80.421158, -80.886401, -81.059543, -81.189716, -81.519515, -81.721311, -82.131441, -82.390934, -82.605495, -82.820081, -82.850958, -82.965783, -83.508437, -83.711474, -83.596313, -83.632642, -83.909886, -84.303402, -84.647644, -84.713351, -84.97566, -84.911375, -85.110923, -85.339488, -85.660787, -85.797445, -85.791709, -85.659314, -85.80052, -85.941725, -85.71254, -86.058488, -86.52585, -86.745992, -87.167516, -87.668493, -87.557467, -87.392386, -87.316654, -87.489409, -87.64126, -87.793111, -87.904112, -88.483302, -88.843228, -89.256743, -89.812394, -90.095555, -90.608624, -91.23241, -91.689747, -92.22775, -93.359464, -93.875169, -94.691656, -95.250227, -96.053382, -96.557434, -97.263592, -98.01303, -98.947676, -99.697397, -100.829499, -101.666089, -101.918528, -102.478132, -103.50099, -103.917527, -104.99201, -105.493038, -105.731396, -105.397773, -105.500661, -105.270752, -105.265817, -105.603161, -105.693414, -106.028716, -106.90998, -107.915449, -108.401905, -109.260199, -109.444089, -109.291644, -109.801458, -110.391732, -110.641019, -111.178919, -111.759607, -112.228235, -112.271824, -112.809594, -113.163811, -113.148669, -113.871881, -114.205737, -114.776451, -114.9367, -114.771232, -114.673899, -114.330974, -113.588875, -113.424053, -113.271969, -113.140039, -112.962298, -112.761587, -112.457911, -112.244952, -111.616489, -111.284675, -110.987819, -110.710007, -110.655049, -110.172856, -109.771847, -109.409104, -109.433392, -109.854219, -110.031392, -110.295071, -110.949501, -111.670568, -112.182036, -112.148989, -112.300711, -112.777297, -113.464671, -113.59673, -113.848937, -114.465747, -115.055142, -114.982253, -114.570366, -114.199329, -114.162018, -114.931842, -115.518654, -115.887365, -116.25835, -116.721526, -117.127755, -117.295938, -117.944, -118.410602, -118.519895, -119.081, -119.438841, -120.367789, -120.622864, -120.74433, -121.714581, -122.547476, -122.512, -122.953187, -123.727197, -123.865173, -124.39806, -124.178849, -124.213705, -124.53284, -124.14214, -124.020535, -123.89893, -124.079635, -124.39567, -124.68721, -124.566101, -123.12, -122.58737, -122.339995, -122.500011, -122.84, -122.97421, -124.910251, -125.6246, -127.435601, -127.99275, -127.85033, -129.129787, -129.305228, -130.514974, -130.536109, -131.085817, -131.967211, -132.25001, -133.539182, -134.078064, -135.038212, -136.628063, -137.800007, -139.867788, -140.825275, -142.574444, -143.958882, -145.925558, -147.114374, -148.224306, -148.018066, -148.570823, -149.727858, -150.608243, -151.716393, -151.859433, -151.409719, -150.346941, -150.621111, -151.895839, -152.57833, -154.019172, -153.287511, -154.232492, -155.307491, -156.308335, -156.556097, -158.117217, -158.433321, -159.603327, -160.28972, -161.223048, -162.237766, -163.069447, -164.785569, -164.942226, -163.84834, -162.870001, -161.804175, -160.563605, -160.07056, -158.684443, -158.461097, -157.72277, -157.550274, -157.041675, -158.194731, -158.517218, -159.058606, -159.711667, -159.981289, -160.355271, -161.355003, -161.968894, -162.054987, -161.874171, -162.518059, -163.818341, -164.662218, -165.346388, -165.350832, -166.121379, -165.734452, -164.919179, -164.562508, -163.753332, -163.067224, -162.260555, -161.53445, -160.772507, -160.958335, -161.518068, -160.777778, -161.391926, -162.45305, -162.757786, -163.546394, -164.96083, -166.425288, -166.845004, -168.11056, -166.705271, -164.47471, -163.652512, -163.788602, -161.677774, -162.489715, -163.719717, -164.430991, -165.390287, -166.764441, -166.204707, -164.430811, -163.168614, -162.930566, -161.908897, -160.934797, -159.039176, -158.119723, -156.580825, -155.06779, -154.344165, -153.900006, -152.210006, -152.270002, -150.739992, -149.720003, -147.613362, -145.689991, -144.920012, -143.589447, -142.072511, -140.985988, -139.120521, -137.546353, -136.503575, -135.625747, -134.414632, -132.929245, -131.431352, -129.794708, -129.107721, -128.361565, -128.138168, -127.447125, -125.756324, -124.424829, -124.289669, -123.061088, -122.683488, -121.47227, -119.94288, -117.602687, -116.22644, -115.246888, -113.897952, -115.304894, -113.497279, -110.798012, -109.946178, -108.880196, -107.792381, -108.812991, -108.167216, -106.950004, -106.150001, -105.342815, -104.337915, -103.221162, -101.454344, -99.901959, -98.44321, -98.558604, -97.669485, -96.119916, -96.125884, -95.489437, -94.68499, -94.232821, -95.304074, -96.471315, -96.391139, -95.208808, -93.889974, -92.878175, -91.519654, -92.406912, -90.547103, -90.551496, -89.215143, -88.019661, -88.317498, -87.350167, -86.30607, -85.576631, -85.521984, -84.100804, -82.622574, -81.280434, -81.220205, -81.964371, -81.259272, -81.386525, -83.344571, -84.735417, -85.769436, -86.067609, -87.031426, -87.323243, -88.482966, -89.914429, -90.703993, -90.770035, -91.933427, -93.15697, -94.241529, -94.629309, -94.684603, -93.215028, -92.764616, -92.297022, -90.897676, -89.039521, -88.039789, -87.324199, -86.071201, -85.011808, -83.360539, -82.272854, -82.436203, -82.125033, -81.400736, -79.912894, -79.143019, -78.601915, -79.124209, -79.829566, -78.228734, -77.095599, -76.541369, -76.623199, -77.302253, -78.516881, -77.336747, -77.772715, -78.106881, -77.41067, -75.696201, -74.668202, -73.83988, -72.908542, -71.677092, -71.3737, -69.590424, -69.620319, -69.287884, -68.374555, -67.649767, -66.201768, -65.245185, -64.58352, -63.804756, -62.502355, -61.396557, -61.798651, -60.468526, -59.569614, -57.975086, -57.333213, -56.936881, -56.158117, -55.756307, -55.683391, -56.409161, -57.126921, -58.774831, -60.0331, -61.723669, -63.862505, -65.363317, -66.399042, -67.236304, -68.511136, -69.953632, -71.104569, -70.255215, -68.64999, -66.552444, -65.056256, -64.170987, -65.115451, -64.798546, -64.472183, -63.173296, -61.52071, -60.518135, -60.448604, -59.802882, -61.039886, -63.254712, -64.246564, -65.364067, -66.1234, -66.161718, -64.425494, -66.026042, -67.137421, -66.96466, -68.03252, -69.06, -70.11617, -70.645476, -70.814897, -70.825, -70.494994, -70.080006, -70.184987, -69.884979, -69.965026, -70.639998, -71.120382, -71.853826, -72.294987, -72.876425, -73.71, -72.241244, -71.945009, -73.345001, -73.98199, -73.952325, -74.256702, -73.96244, -74.178387, -74.906042, -74.980405, -75.20003, -75.528046, -75.319997, -75.071835, -75.05673, -75.377461, -75.940243, -76.031271, -75.72205, -76.23287, -76.35, -76.542725, -76.32933, -76.989998, -76.30162, -76.25874, -75.9718, -75.868051, -75.727491, -76.363189, -77.397635, -78.05496, -78.554347, -79.06067, -79.20357, -80.301325, -80.86498, -81.33629, -81.490421, -81.31371, -80.979987, -80.535585, -80.529989, -80.056539, -80.088015, -80.13156, -80.38103, -80.680005, -81.17212, -81.329991, -81.709994, -82.240013, -82.70515, -82.85526, -82.650014, -82.93, -83.70959, -84.1, -85.10882, -85.28784, -85.7731, -86.399992, -87.530362, -88.417828, -89.18049, -89.593831, -89.413735, -89.43, -89.21767, -89.40823, -89.77928, -90.15463, -90.880225, -91.626785, -92.49906, -93.22637, -93.84842, -94.690003, -95.600257, -96.594047, -97.140008, -97.369994, -97.379994, -97.329997, -97.140008, -97.528072, -97.702946, -97.776042, -97.872367, -97.699044, -97.38896, -97.189333, -96.525576, -96.292127, -95.900885, -94.839063, -94.42573, -93.548651, -92.786114, -92.037348, -91.407903, -90.77187, -90.53359, -90.451476, -90.278618, -89.601321, -88.543866, -87.658417, -87.05189, -86.811982, -86.845908, -87.383291, -87.621054, -87.43675, -87.58656, -87.837191, -88.090664, -88.300031, -88.296336, -88.106813, -88.123479, -88.285355, -88.197867, -88.302641, -88.239518, -88.355428, -88.551825, -88.732434, -88.930613, -88.604586, -88.518364, -88.189986, -88.121153, -87.901813, -87.61568, -87.522921, -87.367762, -86.903191, -86.440946, -86.119234, -86.001954, -85.683317, -85.444004, -85.182444, -84.983722, -84.52698, -84.368256, -84.063055, -83.773977, -83.410381, -83.147219, -83.233234, -83.284162, -83.182126, -83.4125, -83.519832, -83.552207, -83.498515, -83.473323, -83.626104, -83.719613, -83.650858, -83.85547, -83.808936, -83.655612, -83.590009, -83.40232, -83.015677, -82.546196, None, -82.546196, -82.187123, -82.207586, -81.808567, -81.714154, -81.439287, -80.947302, -80.521901, -79.9146, -79.573303, -79.021192, -79.05845, -78.500888, -78.055928, -77.729514, -77.353361, None, -71.712361, -71.587304, -71.380004, -70.806706, -70.214365, -69.950815, -69.76925, -69.222126, -69.254346, -68.809412, -68.317943, -68.689316, -69.164946, -69.623988, -69.952934, -70.133233, -70.517137, -70.669298, -70.99995, -71.40021, -71.657662, -71.708305, -72.372476, -72.844411, -73.454555, -73.922433, -74.458034, -74.369925, -73.449542, -72.694937, -72.334882, -72.79165, -72.784105, -73.415022, -73.189791, -72.579673, -71.712361, None, 14.761249, 15.520324, 15.160243, 15.309898, 15.099988, 14.335229, 13.826733, 12.431004, 12.570944, 13.741156, 14.761249, None, 37.539135, 38.679996, 39.955009, None, 132.371176, 132.924373, 133.492968, 133.904106, 134.638428, 134.766379, 134.203416, 133.79295, 133.280268, 133.014858, 132.363115, 132.371176, None, -16.256883, -16.377651, -16.277838, -16.536324, -17.063423, -17.020428, -16.973248, -16.589137, -16.261922, -16.326414, -15.982611, -15.426004, -15.089332, -14.824645, -14.800926, -14.43994, -13.773805, -13.139942, -12.618837, -11.688919, -10.900957, -10.399592, -9.564811, -9.814718, -9.434793, -9.300693, -8.657476, -7.654178, -6.912544, -6.244342, -5.929994, -5.193863, -4.591006, -3.640057, -2.604306, -2.169914, -1.208603, -0.127454, 0.503877, 1.466919, 3.161699, 4.815758, 5.32012, 6.26182, 7.330385, 7.737078, 8.420964, 9.509994, 10.210002, 10.18065, 11.028867, 11.100026, 10.600005, 10.593287, 10.939519, 10.807847, 10.149593, 10.339659, 10.856836, 11.108501, 11.488787, 12.663341, 13.083264, 13.918665, 15.245612, 15.713956, 16.611627, 18.021102, 19.086412, 19.57403, 20.053381, 19.82032, 20.133996, 20.854521, 21.543006, 22.895791, 23.236804, 23.609133, 23.927511, 24.921146, 25.1648, 26.495313, 27.457632, 28.450491, 28.913512, 29.683439, 30.095042, 30.976952, 31.687968, 31.960406, 32.192485, 32.993935, 33.77337, 34.265433, 34.556372, 34.488107, 34.752587, 34.955417, 35.098457, 35.126053, 35.482207, 35.979592, 35.998403, 35.905023, 36.149763, 35.782085, 36.160822, 35.550936, 34.714553, 34.026895, 32.509158, 31.699595, 30.621625, 30.391096, 29.699976, 28.732903, 27.641187, 27.048768, 26.318218, 26.8047, 26.170785, 27.28002, 28.819978, 29.240004, 31.145934, 32.347979, 33.513283, 35.167704, 36.913127, 38.347665, 39.512607, 40.373433, 41.554084, 41.703171, 41.45347, 40.875469, 40.321394, 39.955009, 38.679996, 37.539135, 36.675467, 37.403175, 38.232943, 37.673701, 39.147668, 39.121209, 38.223538, 37.425137, 36.759855, 35.823685, 34.962342, 35.020788, 35.510009, 36.529998, 36.334713, 35.239999, 33.882511, 33.326421, 33.546924, 32.454174, 32.630804, 33.588162, 33.298567, 31.74414, 31.675307, 30.748749, 30.377609, 29.603289, 29.626543, 29.141612, 28.837858, 28.558081, 28.039095, 27.673898, 27.99672, 28.115525, 28.988443, 28.806438, 27.619017, 27.192377, 26.358009, 26.043351, 26.056942, 25.447677, 24.925848, 23.714811, 24.407999, 23.899968, 23.342999, 22.813988, 22.626299, 22.849748, 23.350027, 22.973099, 23.530016, 24.025025, 24.040011, 23.115003, 23.409972, 22.774972, 23.154225, 22.490028, 21.670026, 21.295011, 21.120034, 20.730032, 20.217712, 20.150016, 19.98, 19.960002, 19.406082, 19.319059, 19.40355, 19.540027, 19.371769, 19.162479, 18.882135, 18.450016, 17.50997, 16.930006, 16.015385, 15.174454, 15.37625, 14.920309, 14.901602, 14.258748, 13.952255, 13.656976, 13.679403, 13.71506, 13.93763, 13.141606, 12.328581, 12.383875, 12.261453, 12.589237, 13.526906, 14.029821, 15.14257, 15.926191, 16.169897, 15.889346, 16.785002, 17.519169, 18.376687, 18.480247, 18.293385, 17.73838, 16.869596, 16.448743, 17.17149, 17.052841, 16.635088, 16.100961, 15.684087, 15.687963, 15.891981, 16.109332, 15.718814, 15.413613, 14.998496, 14.703268, 14.060672, 13.627985, 12.888082, 12.106683, 11.191906, 10.511948, 10.200029, 9.702488, 8.888946, 8.428561, 7.850767, 7.435185, 6.529245, 4.556963, 3.100411, 2.985999, 3.039484, 2.091842, 0.810525, 0.721331, 0.106692, -0.278711, 0.111291, -0.467124, -0.683389, -1.438382, -2.146453, -3.415781, -4.368901, -4.995219, -5.37716, -5.866432, -6.236694, -6.520191, -7.453726, -7.855613, -8.382816, -8.898857, -8.746101, -8.839998, -9.287464, -9.526571, -9.446989, -9.048305, -8.977353, -8.768684, -8.790853, -8.990789, -9.034818, -8.984433, -9.392884, -7.97819, -6.754492, -5.411886, -4.347843, -3.517532, -1.901351, -1.384225, -1.193798, -2.225724, -2.963276, -4.491555, -4.59235, -3.295814, -1.616511, -1.933494, -0.989469, 1.338761, 1.639001, 2.513573, 3.314971, 3.830289, 4.705997, 6.074183, 6.90514, 7.100425, 7.936239, 8.121706, 8.800734, 8.572118, 8.526229, 8.120311, 8.089977, 8.256582, 8.543438, 9.424469, 9.775559, 10.580006, 10.546106, 10.25, 10.369993, 10.912182, 10.667804, 10.369993, 9.649985, 9.921906, 9.93958, 10.950112, 10.939467, 11.956252, 12.51844, 13.647467, 14.119686, 14.8029, 16.363477, 17.622832, 18.620859, 18.696255, 19.66064, 19.888481, 21.268449, 21.0558, 21.090424, 21.581866, 22.524341, 23.318453, 24.12073, 24.312863, 24.428928, 24.061198, 23.42656, 23.339795, 24.604214, 25.864189, 26.949136, 27.981114, 29.117686, 28.069998, 26.255173, 24.496624, 22.869695, 22.290764, 21.322244, 21.544866, 21.059211, 21.536029, 22.442744, 24.730512, 25.398068, 25.294043, 23.903379, 22.183173, 21.213517, 21.369631, 19.778876, 17.847779, 17.119555, 17.831346, 18.787722, 17.869225, 16.829185, 16.44771, 15.879786, 14.666681, 14.100721, 12.942911, 12.625101, 11.787942, 11.027369, 10.356557, 8.382, 7.048748, 5.665835, 5.308234, 4.992078, 5.9129, 8.553411, 10.527709, 12.358347, 14.761146, 16.435927, 19.184028, 21.378416, 23.023742, 24.546543, 26.37005, 28.165547, 31.293418, 30.005435, 31.101079, 32.132747, 33.775489, 36.513978, 40.292352, 41.059851, 41.125945, 40.01583, 38.38296, 33.918685, 33.184466, 34.81477, 34.878574, 34.94391, 36.23129, 37.01273, 37.14197, 36.539579, 37.17604, 39.59345, 40.4356, 39.7626, 42.09309, 43.01604, 43.94975, 44.532249, 43.698398, 44.17479, 43.452831, 46.250025, 46.82134, 45.55517, 45.562005, 46.34915, 47.89416, 48.13876, 53.71743, 54.47171, 53.48582, 54.753015, 55.44268, 57.31702, 58.802, 59.94142, 61.07784, 60.03, 60.550031, 63.50401, 64.888115, 68.51216, 69.18068, 68.16444, 68.13522, 66.93008, 67.25976, 66.72492, 66.69466, 68.54006, 69.19636, 69.94, 72.58754, 72.79603, 71.84811, 72.47011, 72.79188, 72.564698, 73.66787, 73.2387, 71.28, 72.42301, 72.82077, 73.92099, 74.18651, 75.052, 74.46926, 74.93584, 73.84236, 73.60187, 74.3998, 73.1011, 74.89082, 74.65926, 75.15801, 75.68351, 75.28898, 76.35911, 75.90313, 77.57664, 79.652017, 81.500018, 80.610718, 80.511086, 82.249998, 84.655226, 86.822329, 86.009562, 87.166804, 88.315674, 90.259948, 92.900614, 93.234237, 95.86002, 96.678213, 98.922572, 100.759669, 101.035311, 101.990809, 104.351595, 106.066632, 104.70501, 106.970143, 107.239997, 108.15374, 111.07726, 113.33151, 114.13417, 113.88539, 112.779194, 110.15125, 109.4, 110.64, 112.11919, 113.01954, 113.52958, 113.96881, 115.56782, 118.77633, 119.02, 123.200677, 123.25777, 125.38, 126.97644, 128.59126, 129.05157, 128.46, 129.71599, 131.288555, 132.2535, 133.85766, 135.56193, 137.49755, 138.23409, 139.86983, 139.14791, 140.46817, 149.500002, 150.351164, 152.968886, 157.00688, 158.99779, 159.83031, 159.70866, 160.94053, 162.27907, 164.05248, 165.94037, 167.862952, 169.57763, 170.81688, 170.0082, 170.45345, 173.64391, 175.72403, 178.599983, 180, None, 180, 178.7072, 177.41128, 178.313, 178.90825, 179.37034, 179.48636, 179.228265, 177.3643, 174.56929, 173.68013, 172.15, 170.6985, 170.33085, 168.90042, 166.29498, 165.84, 164.87674, 163.5393, 163.21711, 162.01733, 162.05297, 163.19191, 163.057934, 162.126345, 161.70146, 162.11749, 160.368744, 160.02173, 158.53094, 158.23118, 156.78979, 156.42, 155.991853, 155.433645, 155.91442, 156.758163, 156.810356, 158.36433, 160.150669, 161.87204, 163.669679, 164.473558, 163.258387, 162.657907, 160.12148, 159.30232, 156.72068, 154.21806, 155.04375, 152.81185, 151.26573, 151.33815, 149.78371, 148.54481, 145.48722, 142.19782, 138.958475, 135.12619, 136.70171, 137.19342, 138.164725, 138.80463, 139.901518, 141.34531, 141.379205, 140.59742, 140.51308, 140.061973, 138.554727, 138.219708, 136.862375, 135.515377, 134.869422, 133.536893, 132.906234, 132.278055, 130.935863, 130.780007, 130.400031, 129.965949, 129.667362, 129.705189, 129.188115, 129.0104, 128.633368, 127.967414, 127.533436, 127.50212, 127.385434, 127.783343, 128.349716, 129.21292, 129.46045, 129.468304, 129.091377, 128.18585, 127.386519, 126.485748, 126.37392, 126.559231, 126.117398, 126.860143, 126.174759, 125.689104, 125.568439, 125.27533, 125.240087, 124.981033, 124.712161, 124.985994, 125.221949, 125.132859, 125.38659, 125.321116, 124.737482, 124.265625, 122.86757, 122.131388, 121.054554, 121.585995, 121.376757, 122.168595, 121.640359, 120.768629, 119.639602, 119.023464, 118.042749, 117.532702, 118.059699, 118.87815, 118.911636, 119.702802, 120.823457, 121.711259, 122.357937, 122.519995, 121.104164, 120.637009, 119.664562, 119.151208, 120.227525, 120.620369, 121.229014, 121.908146, 121.891919, 121.264257, 121.503519, 122.092114, 121.938428, 121.684439, 121.125661, 120.395473, 119.585497, 118.656871, 117.281606, 115.890735, 114.763827, 114.152547, 113.80678, 113.241078, 111.843592, 110.785466, 110.509358, 110.444039, 109.889861, 109.627655, 109.864488, 108.522813, 108.05018, 106.715068, 105.881682, 105.662006, 106.426817, 107.361954, 108.269495, 108.877107, 109.33527, 109.200136, 108.36613, 107.220929, 106.405113, 105.158264, 104.795185, 105.076202, 104.334335, 103.49728, 103.09069, 102.584932, 101.687158, 100.83181, 100.978467, 100.097797, 100.018733, 99.478921, 99.153772, 99.222399, 99.873832, 100.279647, 100.459274, 101.017328, 101.623079, 102.141187, 102.371147, 102.961705, 103.381215, 103.438575, 103.332122, 103.429429, 103.502448, 103.854674, 104.247932, 104.228811, 103.519707, 102.573615, 101.390638, 101.27354, 100.695435, 100.557408, 100.196706, 100.30626, 100.085757, 99.690691, 99.519642, 98.988253, 98.503786, 98.339662, 98.150009, 98.25915, 98.553551, 98.457174, 98.764546, 98.428339, 98.509574, 98.103604, 97.777732, 97.597072, 97.16454, 96.505769, 95.369352, 94.808405, 94.188804, 94.533486, 94.324817, 93.540988, 93.663255, 93.078278, 92.368554, 92.082886, 92.025215, 91.834891, 91.417087, 90.496006, 90.586957, 90.272971, 89.847467, 89.70205, 89.418863, 89.031961, 88.888766, 88.208497, 86.975704, 87.033169, 86.499351, 85.060266, 83.941006, 83.189217, 82.192792, 82.191242, 81.692719, 80.791999, 80.324896, 80.025069, 80.233274, 80.286294, 79.862547, 79.857999, 79.340512, 78.885345, 79.18972, 78.277941, 77.941165, 77.539898, 76.592979, 76.130061, 75.746467, 75.396101, 74.864816, 74.616717, 74.443859, 73.534199, 73.119909, 72.820909, 72.824475, 72.630533, 71.175273, 70.470459, 69.16413, 69.644928, 69.349597, 68.176645, 67.443667, 67.145442, 66.372828, 64.530408, 62.905701, 61.497363, 59.616134, 58.525761, 57.397251, 56.970766, 56.492139, 55.72371, 54.71509, 53.493097, 52.483598, 51.520763, 50.852948, 50.115009, 49.57685, 48.941333, 48.567971, 47.974519, 48.183189, 48.093943, 48.416094, 48.807595, 49.299554, 49.470914, 50.152422, 50.212935, 50.113303, 50.239859, 50.527387, 50.660557, 50.810108, 50.743911, 51.013352, 51.286462, 51.589079, 51.6067, 51.389608, 51.579519, 51.757441, 51.794389, 52.577081, 53.404007, 54.008001, 54.693024, 55.439025, 56.070821, 56.362017, 56.485679, 56.391421, 56.261042, 56.396847, 56.84514, 57.403453, 58.136948, 58.729211, 59.180502, 59.450098, 59.80806, 59.806148, 59.442191, 59.282408, 58.861141, 58.487986, 58.034318, 57.826373, 57.665762, 57.7887, 57.694391, 57.234264, 56.609651, 56.512189, 56.283521, 55.661492, 55.269939, 55.2749, 54.791002, 54.239253, 53.570508, 53.108573, 52.385206, 52.191729, 52.168165, 51.172515, 49.574576, 48.679231, 48.238947, 47.938914, 47.354454, 46.717076, 45.877593, 45.62505, 45.406459, 45.144356, 44.989533, 44.494576, 44.175113, 43.482959, 43.222871, 43.251448, 43.087944, 42.892245, 42.604873, 42.805015, 42.702438, 42.823671, 42.779332, 42.649573, 42.347989, 42.270888, 41.754382, 41.221391, 40.939341, 40.247652, 39.801685, 39.139399, 39.023696, 39.066329, 38.492772, 38.02386, 37.483635, 37.154818, 37.209491, 36.931627, 36.639604, 36.249137, 35.640182, 35.130187, 34.632336, 34.787779, 34.83222, 34.956037, 34.922603, 34.641741, 34.42656, 34.154536, 33.921372, 33.58811, 33.136768, 32.42322, 32.320436, 32.734829, 33.348745, 34.104565, 34.473896, 34.795065, 35.692426, 35.493731, 35.525977, 36.690712, 36.86623, 37.188717, 36.969403, 37.114717, 37.481775, 37.862733, 38.41009, 38.990623, 39.26611, 39.814294, 41.179275, 41.734952, 42.276831, 42.589576, 43.081226, 43.317852, 43.286381, 42.715874, 43.145305, 43.47066, 43.666668, 44.117804, 44.614259, 45.556941, 46.645401, 47.525658, 48.021596, 48.378784, 48.948206, 49.267773, 49.728624, 50.258772, 50.732025, 51.111227, 51.133861, 51.041515, 51.045288, 50.834189, 50.552398, 50.070929, 49.452723, 48.594533, 47.740787, 46.564734, 45.563969, 44.068143, 43.135951, 42.0416, 41.810968, 41.585142, 40.884771, 40.63785, 40.26304, 40.1212, 39.800083, 39.604901, 39.20222, 38.740509, 38.799782, 39.440001, 39.469974, 39.194693, 39.252002, 39.186528, 39.535758, 39.949583, 40.316589, 40.478387, 40.437253, 40.560811, 40.59962, 40.775475, 40.477251, 40.089264, 39.452559, 38.538351, 37.411133, 36.281279, 35.896497, 35.1984, 34.786383, 34.701893, 35.176127, 35.373428, 35.385848, 35.562546, 35.533935, 35.371774, 35.60747, 35.458746, 35.040735, 34.215824, 33.01321, 32.574632, 32.660363, 32.915955, 32.83012, 32.580265, 32.462133, 32.203389, 31.521001, 31.325561, 30.901763, 30.622813, 30.055716, 28.925553, 28.219756, 27.464608, 26.419452, 25.909664, 25.780628, 25.172862, 24.677853, 23.594043, 22.988189, 22.574157, 21.542799, 20.689053, 20.071261, 19.616405, 19.193278, 18.855315, 18.424643, 18.377411, 18.244499, 18.25008, 17.92519, 18.24791, 18.221762, 17.566918, 17.064416, 17.062918, 16.344977, 15.601818, 15.210472, 14.989711, 14.743214, 14.408144, 14.385717, 14.257714, 13.868642, 13.352498, 12.826845, 12.608564, 11.794919, 11.734199, 11.640096, 11.778537, 12.123581, 12.175619, 12.500095, 12.738479, 13.312914, 13.633721, 13.738728, 13.686379, 13.387328, 13.120988, 12.87537, 12.929061, 13.236433, 12.93304, 12.728298, 12.227347, 12.322432, 12.182337, 11.914963, 11.093773, 10.066135, 9.405245, 8.797996, 8.830087, 9.04842, 9.291351, 9.492889, 9.305613, 9.649158, 9.795196, 9.404367, 8.948116, 8.744924, 8.488816, 8.500288, 7.462108, 7.082596, 6.698072, 5.898173, 5.362805, 5.033574, 4.325607, 3.57418, 2.691702, 1.865241, 1.060122, -0.507638, -1.063625, -1.964707, -2.856125, -3.311084, -4.00882, -4.649917, -5.834496, -6.528769, -7.518941, -7.712159, -7.974107, -9.004794, -9.91342, -10.765384, -11.438779, -11.708195, -12.428099, -12.949049, -13.124025, -13.24655, -13.685154, -14.074045, -14.330076, -14.579699, -14.693232, -14.839554, -15.130311, -15.66418, -16.085214, -16.314787, -16.308947, -16.613838, -16.677452, -16.841525, -16.713729, -17.126107, -17.625043, -17.185173, -16.700706, -16.463098, -16.549708, -16.270552, -16.146347, -16.256883, None, -177.55001, -179.999989, None, -179.999989, -179.793309, -179.917359, -179.999989, None, 125.947072, 126.644704, 126.957243, 127.335928, 126.967992, 125.925885, 125.08852, 124.43595, 123.579982, 123.459989, 123.550009, 123.980009, 124.968682, 125.086246, 125.947072, None, -180, -179.942499, -179.058677, -177.256772, -176.084673, -175.829882, -174.382503, -173.116559, -172.889106, -169.951223, -168.999989, -168.530199, -167.022099, -164.182144, -161.929775, -158.07138, -155.192253, -150.942099, -148.533073, -145.888919, -143.107719, -142.89228, -146.829068, -150.060732, -150.902928, -153.586201, -153.409907, -153.037759, -152.665637, -152.861517, -154.526299, -155.29018, -156.83745, -154.408787, -152.097662, -150.648293, -148.865998, -147.22075, -146.41775, -146.770286, -148.062947, -149.531901, -151.588416, -153.390322, -155.329376, -155.975668, -157.268302, -158.051768, -158.365134, -157.875474, -156.974573, -155.329376, -153.742832, -152.920247, -151.33378, -150.00195, -148.748486, -147.612483, -146.10441, -146.143529, -146.496091, -146.202311, -144.909625, -144.322038, -142.794353, -141.638765, -140.209007, -138.857591, -137.506201, -136.428902, -135.214584, -134.431195, -133.745655, -132.257167, -130.92531, -129.554283, -128.242038, -126.890621, -125.402082, -124.011495, -122.562152, -121.073612, -119.702559, -118.684145, -117.469801, -116.216312, -115.021552, -113.944331, -113.297988, -112.945452, -112.299083, -111.261059, -110.066325, -108.714909, -107.559346, -106.149148, -104.876074, -103.367949, -102.016507, -100.645531, -100.1167, -100.763043, -101.252703, -102.545337, -103.113313, -103.328752, -103.681289, -102.917485, -101.60524, -100.312528, -99.13738, -98.118889, -97.688037, -96.336595, -95.043961, -93.672907, -92.439003, -91.420564, -90.088733, -89.226951, -88.423951, -87.268337, -86.014822, -85.192236, -83.879991, -82.665646, -81.470913, -80.687447, -80.295791, -79.296886, -77.925858, -76.907367, -76.221879, -74.890049, -73.852024, -72.833533, -71.619215, -70.209042, -68.935916, -67.956622, -67.369061, -67.134036, -67.251548, -67.56494, -67.917477, -68.230843, -68.485452, -68.544209, -68.446282, -67.976233, -67.5845, -67.427843, -67.62367, -67.741183, -67.251548, -66.703184, -66.056815, -65.371327, -64.568276, -64.176542, -63.628152, -63.001394, -62.041686, -61.414928, -60.709855, -59.887269, -59.162585, -58.594557, -57.811143, -57.223582, -57.59573, -58.614143, -59.045073, -59.789342, -60.611928, -61.297416, -62.0221, -62.51176, -62.648858, -62.590128, -62.120079, -62.805567, -63.74569, -64.294106, -64.881693, -65.508425, -65.665082, -65.312545, -64.783715, -63.961103, -63.1973, -62.785955, -62.570516, -62.276736, -61.806661, -61.512906, -61.375809, -61.081977, -61.003661, -60.690269, -60.827367, -61.375809, -61.96337, -63.295201, -63.74569, -64.352836, -65.860987, -67.192818, -68.446282, -69.797724, -70.600724, -72.206776, -73.969536, -75.555977, -77.24037, -76.926979, -75.399294, -74.282876, -73.656119, -74.772536, -76.4961, -77.925858, -77.984666, -78.023785, -76.848637, -76.633224, -75.360097, -73.244852, -71.442946, -70.013163, -68.191646, -65.704279, -63.25603, -61.552026, -59.691416, -58.712121, -58.222487, -57.008117, -55.362894, -53.619771, -51.543644, -49.76135, -47.273931, -44.825708, -42.808363, -42.16202, -40.771433, -38.244818, -36.26667, -34.386397, -32.310296, -30.097098, -28.549802, -29.254901, -29.685805, -29.685805, -31.624808, -33.681324, -35.639912, -35.914107, -35.77701, -35.326546, -33.896763, -32.212369, -30.998051, -29.783732, -28.882779, -27.511752, -26.160336, -25.474822, -23.927552, -22.458598, -21.224694, -20.010375, -18.913543, -17.522982, -16.641589, -15.701491, -15.40771, -16.46532, -16.112784, -15.446855, -14.408805, -13.311973, -12.293508, -11.510067, -11.020433, -10.295774, -9.101015, -8.611381, -7.416622, -7.377451, -6.868232, -5.790985, -5.536375, -4.341667, -3.048981, -1.795492, -0.659489, -0.228637, 0.868195, 1.886686, 3.022638, 4.139055, 5.157546, 6.273912, 7.13572, 7.742866, 8.48711, 9.525135, 10.249845, 10.817821, 11.953824, 12.404287, 13.422778, 14.734998, 15.126757, 15.949342, 17.026589, 18.201711, 19.259373, 20.375739, 21.452985, 21.923034, 22.569403, 23.666184, 24.841357, 25.977309, 27.093726, 28.09258, 29.150242, 30.031583, 30.971733, 31.990172, 32.754053, 33.302443, 33.870419, 34.908495, 35.300202, 36.16201, 37.200035, 37.905108, 38.649404, 39.667894, 40.020431, 40.921358, 41.959434, 42.938702, 44.113876, 44.897291, 45.719928, 46.503343, 47.44344, 48.344419, 48.990736, 49.930885, 50.753471, 50.949325, 51.791547, 52.614133, 53.613038, 54.53355, 55.414943, 56.355041, 57.158093, 57.255968, 58.137361, 58.744508, 59.939318, 60.605221, 61.427806, 62.387489, 63.19049, 64.052349, 64.992447, 65.971715, 66.911864, 67.891133, 68.890038, 69.712624, 69.673453, 69.555941, 68.596258, 67.81274, 67.949889, 69.066307, 68.929157, 68.419989, 67.949889, 68.71377, 69.869307, 71.024895, 71.573285, 71.906288, 72.454627, 73.08141, 73.33602, 73.864877, 74.491557, 75.62756, 76.626465, 77.644904, 78.134539, 78.428371, 79.113859, 80.093127, 80.93535, 81.483792, 82.051767, 82.776426, 83.775331, 84.676206, 85.655527, 86.752359, 87.477017, 87.986289, 88.358411, 88.828408, 89.67063, 90.630365, 91.5901, 92.608539, 93.548637, 94.17542, 95.017591, 95.781472, 96.682399, 97.759646, 98.68021, 99.718182, 100.384188, 100.893356, 101.578896, 102.832411, 103.478676, 104.242557, 104.90846, 106.181561, 107.160881, 108.081393, 109.15864, 110.235835, 111.058472, 111.74396, 112.860378, 113.604673, 114.388088, 114.897308, 115.602381, 116.699161, 117.384701, 118.57946, 119.832924, 120.871, 121.654415, 122.320369, 123.221296, 124.122274, 125.160247, 126.100396, 127.001427, 127.882768, 128.80328, 129.704259, 130.781454, 131.799945, 132.935896, 133.85646, 134.757387, 135.031582, 135.070753, 135.697485, 135.873805, 136.206705, 136.618049, 137.460271, 138.596223, 139.908442, 140.809421, 142.121692, 143.061842, 144.374061, 145.490427, 146.195552, 145.999699, 146.646067, 147.723263, 148.839629, 150.132314, 151.483705, 152.502247, 153.638199, 154.284567, 155.165857, 155.92979, 156.811132, 158.025528, 159.181013, 159.670699, 160.80665, 161.570479, 162.686897, 163.842434, 164.919681, 166.11444, 167.309095, 168.425616, 169.463589, 170.501665, 171.20679, 171.089227, 170.560422, 170.109958, 169.75737, 169.287321, 167.975101, 167.387489, 166.094803, 165.644391, 164.958851, 164.234193, 163.822797, 163.568239, 163.47026, 163.489897, 164.057873, 164.273363, 164.743464, 166.604126, 166.995781, 165.193876, 163.666217, 161.766385, 160.924162, 160.747894, 160.316964, 159.788211, 161.120016, 161.629287, 162.490992, 163.705336, 165.095949, 166.604126, 168.895665, 169.404782, 172.283934, 172.477049, 173.224083, 175.985672, 178.277212, 180, None, -180, -177.55001, -174.92825, -175.01425, -174.33983, -174.57182, -171.85731, -169.89958, -170.89107, -172.53025, -172.555, -172.95533, -173.89184, -174.65392, -175.98353, -176.20716, -177.22266, -178.35993, -178.90332, -178.68611, -179.88377, -179.43268, -180, None, -180, -179.871875, -179.02433, -177.577945, -177.663575, -178.69378, -180, None, 180, 178.903425, 178.7253, 180, None, 180, 179.364143, 178.725059, 178.596839, 179.096609, 179.413509, 180, None, -61.2, -60, -59.15, -58.55, -57.75, -58.05, -59.4, -59.85, -60.7, -61.2, None, 68.935, 69.58, 70.525, 70.56, 70.28, 68.745, 68.72, 68.8675, 68.935, None, 178.12557, 178.3736, 178.71806, 178.55271, 177.93266, 177.38146, 177.28504, 177.67087, 178.12557, None, -61.68, -61.105, -60.895, -60.935, -61.77, -61.95, -61.66, -61.68, None, -155.40214, -155.22452, -155.06226, -154.80741, -154.83147, -155.22217, -155.54211, -155.68817, -155.93665, -155.90806, -156.07347, -156.02368, -155.85008, -155.91907, -155.86108, -155.78505, -155.40214, None, -155.99566, -156.07926, -156.41445, -156.58673, -156.70167, -156.71055, -156.61258, -156.25711, -155.99566, None, -156.75824, -156.78933, -157.32521, -157.25027, -156.75824, None, -158.0252, -157.94161, -157.65283, -157.70703, -157.7786, -158.12667, -158.2538, -158.29265, -158.0252, None, -159.36569, -159.34512, -159.46372, -159.80051, -159.74877, -159.5962, -159.36569, None, -78.19087, -77.89, -77.54, -77.53466, -77.78, -78.03405, -78.40848, -78.19087, None, -78.98, -78.51, -77.85, -77.82, -78.91, -78.98, None, -77.79, -77, -77.17255, -77.35641, -77.34, -77.78802, -77.79, None, -64.01486, -63.6645, -62.9393, -62.01208, -62.50391, -62.87433, -64.1428, -64.39261, -64.01486, None, 46.68201, 47.67591, 48.64541, 49.10116, 50.034083, 51.191945, 52.042023, 53.042737, 53.220866, 53.040876, 52.16739, 51.316899, 51.278503, 50.305643, 50.339129, 50.891292, 51.342427, 52.501426, 52.692112, 52.446339, 52.50246, 52.814689, 52.91675, 53.721713, 54.008311, 54.736845, 53.858139, 52.915251, 52.693973, 53.357808, 53.101028, 53.880929, 53.735511, 53.921598, 53.82579, 52.264025, 50.842354, 50.147771, 49.199612, 48.88327, 48.856532, 49.223228, 49.395259, 49.569202, 50.392821, 50.08483, 49.618915, 49.110264, 48.58437, 47.49252, 47.59094, 46.68201, None, -64.51912, -64.17322, -62.85829, -61.835585, -61.806305, -62.29318, -63.58926, -64.51912, None, -80.315395, -79.92939, -79.52002, -79.26582, -79.65752, -80.09956, -80.36215, -80.315395, None, -83.99367, -83.25048, -81.87699, -81.89825, -83.06857, -83.77462, -83.99367, None, -75.21597, -75.86588, -76.98687, -77.2364, -76.81166, -75.89521, -75.1145, -75.10333, -75.21597, None, -96.557401, -95.647689, -96.269511, -97.617401, -98.431808, -99.797401, -98.917412, -98.218255, -97.157401, -96.557401, None, -106.522588, -105.40245, -104.774839, -104.464755, -102.785374, -100.980782, -101.089302, -102.731166, -102.093298, -102.430254, -104.24, -105.96, -107.122551, -109, -111.534149, -113.3132, -113.854957, -115.22, -116.107946, -117.34, -116.674733, -115.131132, -113.721399, -112.416104, -114.349991, -116.486838, -117.904813, -118.432378, -116.113114, -117.655681, -119.401983, -118.56268, -117.866418, -115.189087, -114.16716, -114.666329, -112.441012, -111.0504, -109.920339, -109.006545, -108.188352, -107.68598, -108.396401, -107.516455, -106.522588, None, -79.775833, -80.876099, -80.833885, -80.353058, -78.064438, -76.34, -76.251404, -77.314438, -78.39167, -79.486252, -79.775833, None, 139.86312, 140.81171, 142.06207, 143.48283, 143.60385, 142.08763, 140.038155, 139.86312, None, 148.22223, 150.73167, 149.575925, 147.977465, 146.11919, 146.358485, 148.22223, None, 138.831075, 141.471615, 145.086285, 144.3, 140.61381, 138.95544, 136.97439, 137.51176, 138.831075, None, -98.577001, -98.5, -97.735585, -97.704415, -98.16, -99.808734, -100.883656, -100.862908, -102.502084, -102.565517, -101.489743, -99.983478, -98.577001, None, 102.837815, 105.37243, 105.07547, 99.43814, 101.2649, 102.08635, 102.837815, None, 93.77766, 95.940895, 97.88385, 100.186655, 99.93976, 97.75794, 94.97259, 93.31288, 92.5454, 91.18107, 93.77766, None, -96.016433, -95.323453, -94.298425, -94.735426, -92.409832, -91.132881, -87.81, -87.02, -85.814343, -87.187567, -89.035361, -90.804349, -92.876677, -93.951159, -93.935734, -93.145239, -94.973991, -96.076146, -96.709724, -96.016433, None, -91.58702, -90.1, -88.93227, -86.97024, -85.5, -84.260005, -83.18, -82.42, -81.1, -79.30664, -76.25, -75.71878, -72.83153, -70.665765, -68.5, -65.82735, -63.68, -61.85, -61.89388, -64.334, -66.75342, -67.65755, -65.48031, -67.84, -69.4697, -71.18, -73.2428, -73.88, -76.90773, -75.52924, -76.22046, -75.39345, -76.34354, -77.88851, -78.36269, -79.75951, -79.61965, -77.91089, -77.88911, -80.56125, -83.17439, -86.11184, -87.6, -89.49068, -89.6161, -87.76739, -88.26, -87.65, -84.97634, -86.34, -87.96192, -87.15198, -85.37868, -85.09495, -86.50734, -86.93179, -84.19844, -83.408696, -81.84823, -84.1, -87.59895, -89.36663, -90.2, -91.36786, -91.58702, None, -46.76379, -43.40644, -39.89753, -38.62214, -35.08787, -27.10046, -20.84539, -22.69182, -26.51753, -31.9, -31.39646, -27.85666, -24.84448, -22.90328, -22.07175, -23.16961, -20.62363, -15.76818, -12.77018, -12.20855, -16.28533, -16.85, -20.04624, -17.73035, -18.9, -19.70499, -19.67353, -18.47285, -20.03503, -21.67944, -19.83407, -19.59896, -20.66818, -19.37281, -21.59422, -20.43454, -20.76234, -22.17221, -23.56593, -22.31311, -22.29954, -24.27834, -24.79296, -23.44296, -22.13281, -21.75356, -23.53603, -24.30702, -25.54341, -25.20135, -26.36276, -23.72742, -22.34902, -25.02927, -27.74737, -30.67371, -31.77665, -32.81105, -34.20196, -36.35284, -37.04378, -38.37505, -39.81222, -40.66899, -40.68281, -41.1887, -42.81938, -42.41666, -42.86619, -43.3784, -44.7875, -46.26364, -48.26294, -49.23308, -49.90039, -51.63325, -52.14014, -52.27659, -53.66166, -53.30161, -53.96911, -52.9804, -51.47536, -51.08041, -50.87122, -52.013585, -52.55792, -53.45629, -54.68336, -54.75001, -54.35884, -53.431315, -51.39014, -53.10937, -54.00422, -55, -55.83468, -54.71819, -55.32634, -56.12003, -57.32363, -58.59679, -58.58516, -61.26861, -63.39165, -66.06427, -68.50438, -69.66485, -71.40257, -68.77671, -66.76397, -71.04293, -73.297, -73.15938, -69.37345, -65.7107, -65.3239, -68.02298, -67.15129, -63.68925, -62.23444, -62.65116, -60.28249, -57.20744, -54.13442, -53.04328, -50.39061, -48.00386, -46.59984, -44.523, -46.9007, -46.76379, None, -106.6, -105.26, -104.5, -105.38, -106.94, -106.6, None]
-
-COAST_LATS = [-78.595667, -78.223339, -78.380177, -78.693646, -79.046338, -79.497008, -79.634209, -79.281465, -78.928774, -78.869966, -78.595667, None, 53.867565, 53.15319, 52.260118, 51.669301, 51.820455, 52.864629, 53.881363, 54.664519, 55.131622, 55.17286, 54.554603, 53.867565, None, -2.600151, -3.289153, -3.861418, -4.373738, -4.876498, -5.465609, -6.083659, -6.614015, -6.721657, -7.388024, -8.044108, -9.104664, -9.071436, -9.514406, -9.684318, -9.872937, -10.293687, -10.582713, -10.652476, -10.393267, -10.280923, -10.130441, -9.492444, -8.942555, -8.067414, -7.630128, -7.91533, -8.245491, -8.983069, -9.326821, -9.159596, -9.117893, -8.297168, -8.096043, -8.380935, -8.411683, -7.597882, -7.320225, -6.232849, -5.393366, -4.546544, -4.462931, -3.538853, -4.024819, -4.112979, -3.746283, -3.311787, -2.820551, -2.460418, -2.479848, -2.214542, -2.212526, -1.617162, -1.432522, -0.93772, -0.695461, -0.369538, -0.78021, -1.151867, -2.769185, -3.367701, -2.307042, -1.703513, -1.702635, -2.051296, -2.409, -2.600151, None, 4.525874, 4.900011, 5.44773, 6.143191, 6.924771, 6.928053, 6.422166, 5.98749, 5.708696, 5.407836, 5.016128, 4.966519, 4.478202, 4.137551, 3.234428, 2.28769, 1.827641, 0.902219, 0.784242, 0.102475, -0.803723, -1.487609, -2.483517, -4.012726, -3.657037, -4.106984, -3.495704, -3.43917, -3.118776, -3.478392, -2.994442, -3.049426, -2.934032, -1.592874, -1.314907, -0.459507, 0.415375, 1.341934, 2.006493, 1.663775, 1.850637, 2.697303, 2.885897, 3.102395, 3.893509, 4.525874, None, 74.979997, 74.592347, 74.666864, 74.927623, 75.377828, 75.647218, 75.29649, 74.979997, None, 77.519997, 77.491343, 77.555111, 77.834629, 77.820005, 77.634331, 77.519997, None, 78.765813, 78.418315, 78.056941, 77.850597, 78.082857, 78.458105, 78.87193, 78.831984, 78.765813, None, 74.392307, 74.515555, 74.837758, 75.38682, 75.882655, 76.319244, 76.441381, 76.751078, 77.161389, 77.097878, 76.776296, 76.778518, 76.449597, 76.074013, 75.847774, 75.610166, 75.566189, 75.482421, 75.699204, 75.784315, 75.713983, 75.336849, 74.923127, 74.657304, 74.442459, 74.564028, 74.410032, 74.392307, None, 78.152982, 77.996325, 77.697015, 77.409229, 77.732207, 78.05105, 78.152982, None, 78.804441, 78.601973, 78.406946, 78.407902, 78.550555, 78.849994, 78.804441, None, 18.514762, 18.426679, 18.228035, 17.975906, 17.981823, 17.946553, 18.374486, 18.520601, 18.514762, None, 18.490525, 18.400867, 18.160701, 17.886867, 17.868238, 17.701116, 17.861597, 18.225968, 18.454533, 18.524218, 18.490525, None, 23.188611, 23.117271, 23.106006, 22.765303, 22.399202, 22.512166, 22.277194, 21.657851, 21.20682, 21.220565, 21.016624, 20.735091, 20.693905, 20.284654, 20.050379, 19.923435, 19.873774, 19.952891, 19.855481, 20.413354, 20.673105, 20.739949, 21.028613, 21.598114, 21.559175, 21.827324, 22.037079, 22.192057, 22.387109, 22.636965, 22.68815, 22.168518, 22.154565, 21.910575, 21.801228, 21.896028, 22.20495, 22.565755, 22.788118, 22.983042, 23.078747, 23.188611, None, 51.317075, 50.68701, 49.812309, 50.150117, 49.935815, 49.587129, 49.313011, 49.556691, 49.249139, 48.516781, 48.687804, 48.157164, 47.535548, 46.655499, 46.618292, 46.807066, 47.625207, 47.752279, 46.884994, 46.91972, 47.389562, 47.632545, 47.572807, 47.603348, 47.899454, 48.251525, 48.523188, 49.125581, 50.718274, 51.287438, 51.632094, 51.588273, 51.317075, None, 65.109618, 64.766693, 64.455136, 63.979609, 64.057486, 63.725981, 63.411246, 63.651722, 64.101876, 63.569712, 63.052379, 63.637253, 63.541238, 64.035833, 64.822917, 65.738778, 65.657285, 65.217518, 65.371772, 65.109618, None, 72.352199, 72.749617, 72.243678, 71.767144, 71.33084, 71.556925, 70.920013, 70.525024, 70.121948, 69.186087, 68.720198, 68.067163, 67.847539, 66.928473, 66.862121, 66.160251, 64.998669, 65.426033, 66.388041, 66.262726, 65.689789, 65.108455, 64.648406, 64.382737, 63.392927, 62.674185, 62.945099, 63.74567, 62.883966, 62.280075, 61.930897, 62.330149, 62.910708, 63.397836, 63.679989, 64.193963, 64.679101, 64.389093, 64.229542, 64.572906, 65.309192, 65.326969, 65.454765, 65.811771, 66.310578, 67.284576, 67.726926, 68.069437, 68.554627, 68.894736, 69.147769, 69.76954, 69.826488, 70.16688, 69.871808, 69.743185, 69.966634, 70.260001, 70.410741, 70.762089, 71.218186, 71.222552, 72.235074, 73.129464, 73.537889, 73.803816, 73.157447, 72.534126, 73.340278, 73.750951, 72.716544, 72.061907, 72.352199, None, 74.134907, 74.100025, 73.856732, 72.966244, 72.771992, 72.024596, 72.061881, 72.940277, 73.43743, 73.862417, 74.134907, None, 72.705898, 73.36, 73.843865, 73.633387, 73.76, 73.47, 72.990532, 72.56, 71.66, 71.272859, 71.356394, 71.738257, 72.482921, 72.83, 72.705898, None, 75.845526, 76.012828, 75.969394, 75.479527, 75.005267, 74.850005, 74.416957, 74.394271, 74.720297, 75.162493, 75.04343, 75.222231, 76.199018, 76.478872, 76.141348, 75.549187, 75.473223, 76.429805, 76.794176, 76.67832, 76.20168, 75.845526, None, 76.116543, 76.864533, 77.51222, 77.498319, 77.645287, 76.876962, 76.530032, 76.481172, 76.053239, 75.900019, 76.116543, None, 74.448944, 74.24136, 74.185756, 73.896058, 73.475205, 73.222921, 72.52, 71.82, 71.383602, 70.901642, 71.34, 71.868688, 72.292261, 73.02256, 73.68, 74.292727, 74.448944, None, 60.38417, 60.293607, 59.909987, 59.754441, 59.941406, 60.213069, 60.38417, None, 57.96902, 57.901427, 57.591059, 57.115842, 56.734677, 56.992749, 57.461196, 57.816575, 57.96902, None, 54.040009, 54.120004, 52.984621, 52.180433, 52.182371, 52.639707, 53.100015, 53.411469, 53.85108, 54.169975, 54.040009, None, 49.950001, 49.475275, 49.062484, 48.510011, 48.370846, 48.825005, 49.179996, 49.53, 49.814996, 49.994959, 50.539138, 50.770648, 50.552574, 50.400903, 50.295018, 49.950001, None, 63.782515, 63.592191, 63.694975, 63.431116, 63.297506, 63.188598, 62.976931, 63.194438, 63.375822, 63.317789, 63.405846, 63.782515, None, 79.301594, 79.165349, 78.800462, 78.32478, 77.907545, 78.018985, 78.343229, 78.380332, 78.67742, 78.918336, 79.301594, None, 35.386703, 35.373216, 35.671596, 35.245782, 34.978098, 34.571869, 34.701655, 35.103232, 35.145504, 35.386703, None, 35.29999, 35.004995, 34.919988, 35.084991, 35.279992, 35.705004, 35.368022, 35.424996, 35.354018, 35.179998, 35.29999, None, -12.469833, -12.895285, -13.555761, -14.758789, -15.226512, -15.706069, -16.000263, -15.414253, -15.710152, -16.451037, -16.875042, -17.106036, -17.953064, -19.118781, -20.496888, -22.391501, -23.781959, -24.94163, -25.178463, -25.601434, -25.346101, -24.988345, -24.460677, -23.574116, -22.776904, -22.057413, -21.336475, -21.163307, -20.830459, -20.072366, -19.435454, -18.961995, -18.331387, -17.409945, -16.850444, -16.216219, -16.179374, -15.974373, -15.793454, -15.780018, -15.210182, -14.594303, -14.091233, -13.663869, -13.784068, -13.089175, -12.487868, -12.040505, -12.469833, None, -15.891846, -16.466333, -16.59785, -16.159995, -15.891846, None, -15.668811, -15.392704, -14.626497, -14.93392, -15.740021, -15.614602, -15.668811, None, -6.895238, -6.142467, -5.783058, -5.445042, -5.737582, -6.214401, -6.895238, None, -78.047019, -78.04707, -77.831476, -78.04707, -78.478104, -79.08556, -79.516645, -80.026123, -80.339644, -80.594357, -80.829485, -81.025442, -80.966685, -80.633528, -80.222028, -79.94773, -79.614623, -79.183487, -78.81121, -78.45857, -78.047019, None, -80.255773, -80.294892, -80.39287, -79.981371, -79.628679, -80.040179, -80.549657, -81.000327, -80.863178, -80.921934, -80.588827, -80.549657, -80.255773, None, -71.269345, -71.151781, -71.190951, -70.681473, -70.309145, -69.505783, -69.035476, -68.878741, -69.251018, -69.623347, -70.074017, -70.505153, -70.955824, -71.406494, -71.798408, -72.170685, -72.307886, -72.503843, -72.484206, -72.092343, -72.229493, -72.366694, -72.072758, -71.661259, -71.269345, None, -71.894164, -71.717793, -71.854994, -71.933335, -72.070536, -71.952972, -72.521206, -72.442865, -72.482035, -72.442865, -72.501621, -72.305664, -71.894164, None, -73.657778, -73.32462, -73.500991, -73.657726, -73.481354, -73.834098, -74.088811, -74.010469, -73.657778, None, -73.461769, -73.246226, -73.481354, -73.873268, -73.834098, -73.736119, -73.461769, None, -21.080005, -21.700019, -22.159991, -22.399976, -22.129708, -21.679607, -21.14982, -20.444747, -20.105646, -20.120012, -20.459991, -20.800022, -21.080005, None, -3.659983, -3.980015, -4.499983, -4.766427, -4.176127, -3.789743, -3.462062, -3.035422, -2.741486, -2.500002, -2.779985, -2.999972, -3.240009, -3.659983, None, -5.840728, -6.083711, -6.317754, -6.316513, -6.02604, -5.747142, -5.437756, -5.583742, -5.505503, -5.026101, -5.001348, -5.53222, -5.455842, -5.113693, -4.757074, -4.167807, -4.14879, -4.312966, -4.867661, -5.478063, -5.56028, -5.840728, None, -10.482719, -10.826367, -10.820011, -10.204751, -10.446649, -10.482719, None, -9.599982, -9.784312, -8.917543, -8.320009, -8.320009, -9.120011, -9.599982, None, -9.872937, -9.89521, -9.794027, -9.63998, -9.24295, -9.400304, -9.610162, -9.872937, None, -8.020027, -8.33732, -8.53829, -8.114181, -7.754824, -7.421872, -7.320018, -7.560003, -8.020027, None, -7.021638, -7.34782, -7.404767, -7.176874, -6.765943, -6.599338, -7.021638, None, -5.339984, -5.566792, -6.200655, -6.540014, -6.819997, -6.919991, -6.535931, -5.900776, -5.139118, -5.042379, -5.339984, None, -40.065978, -40.604756, -41.289624, -41.688308, -41.425895, -41.281821, -40.459236, -39.908882, -39.508854, -39.146602, -38.797683, -38.027808, -37.381129, -36.711092, -36.534824, -36.121981, -35.237125, -34.529107, -34.450662, -35.006183, -35.265496, -36.156346, -37.209098, -36.526194, -36.798942, -37.555382, -37.881253, -37.961248, -37.579825, -37.695373, -38.582813, -39.166343, -39.145776, -39.449736, -39.879943, -40.065978, None, -43.555326, -43.031688, -42.512754, -41.767424, -41.514417, -40.956104, -40.493962, -40.919052, -41.331999, -40.926701, -41.349155, -41.770008, -42.233184, -42.970038, -43.372288, -43.853344, -43.865694, -44.242467, -44.897104, -45.908929, -46.355775, -46.641235, -46.619945, -46.290197, -46.219917, -45.852705, -45.110941, -44.123973, -43.935819, -43.555326, None, -40.808258, -40.875438, -42.062393, -42.407024, -43.211522, -42.937689, -43.634597, -43.580854, -43.549745, -42.693776, -42.03361, -41.162552, -40.703975, -40.792549, -41.137644, -41.000546, -40.808258, None, -32.215966, -32.728751, -32.959487, -33.483847, -33.890179, -33.914467, -34.003402, -33.821036, -33.930177, -33.976065, -34.509366, -34.464149, -34.746819, -35.064733, -35.025459, -35.025097, -34.386428, -34.196517, -33.623425, -33.487258, -33.259572, -32.900369, -32.205062, -31.612437, -30.601594, -30.030725, -29.461044, -28.810231, -28.516399, -28.118077, -27.334714, -26.543134, -26.116545, -26.549025, -25.621278, -25.911235, -26.298446, -25.786281, -24.998939, -24.683971, -24.384713, -23.80635, -23.560215, -23.059987, -22.475475, -21.755829, -22.517488, -21.82952, -21.495173, -21.068688, -20.701682, -20.623547, -20.746899, -20.374208, -20.263311, -20.044203, -19.952942, -19.976506, -19.683708, -19.239756, -18.705318, -18.197649, -17.798603, -17.254915, -16.4052, -17.268558, -17.069035, -16.596506, -16.111316, -16.327944, -15.56706, -15.0751, -14.680396, -14.51007, -14.230656, -14.347341, -14.095987, -13.952791, -13.817968, -14.276906, -14.86917, -14.875991, -14.969784, -14.42067, -13.618703, -13.357376, -13.10752, -12.536392, -12.183649, -12.302453, -12.114041, -11.603012, -11.273782, -11.128519, -11.376411, -11.786515, -12.042365, -11.941183, -12.248606, -11.962267, -12.049342, -11.857209, -12.351959, -12.887223, -13.29123, -13.324509, -13.724278, -14.223989, -14.715432, -14.997741, -15.550265, -15.870762, -16.215082, -16.807604, -16.806622, -17.062679, -17.371601, -17.710805, -17.369069, -16.832047, -16.38887, -15.840532, -15.044921, -14.561333, -14.270395, -13.698078, -12.944688, -12.741548, -12.407614, -11.877466, -11.328042, -11.042737, -10.668186, -11.157355, -11.784707, -11.90563, -12.325656, -12.834358, -13.400422, -13.763656, -14.548311, -14.171176, -14.594458, -14.984976, -15.428205, -16.285672, -16.784918, -16.906926, -17.761655, -18.280073, -18.958274, -19.480723, -19.955939, -20.39121, -20.633469, -21.260511, -22.342512, -22.122784, -22.556142, -22.402353, -23.462237, -24.076256, -24.457835, -25.267501, -26.071173, -26.641319, -27.2603, -28.110067, -28.995077, -29.458202, -30.35024, -30.923642, -31.640446, -32.550003, -33.041342, -33.816023, -34.31036, -35.17346, -35.671879, -36.420206, -37.109052, -37.425261, -37.772681, -37.809061, -38.219217, -38.606532, -39.035757, -38.593768, -38.417448, -37.896188, -38.085324, -38.809465, -38.538268, -38.380034, -38.308514, -38.019333, -37.402936, -36.643603, -36.138362, -35.732754, -35.612296, -35.127261, -34.384723, -35.076825, -35.260535, -34.707339, -34.130268, -33.640479, -32.900007, -33.752771, -34.094766, -34.890118, -34.47867, -33.947953, -33.222778, -32.848072, -32.617234, -32.011224, -31.982647, -31.495803, -31.590423, -31.948489, -32.282267, -32.215966, None, 7.523055, 6.481775, 6.197141, 5.96837, 6.763463, 8.200843, 9.824078, 9.268427, 8.564206, 7.523055, None, -2.802154, -3.093764, -3.858472, -3.446301, -3.362637, -3.428679, -3.393436, -2.84365, -2.802154, None, -3.790931, -3.607376, -3.177222, -3.129318, -3.459065, -3.790931, None, 2.174596, 1.628531, 1.540811, 1.132386, 0.258486, 0.356413, -0.252077, -0.780004, -0.899996, -0.266598, 1.011722, 1.810691, 2.174596, None, 0.875192, 0.917102, 1.643259, 1.419836, 0.427881, 0.235593, 0.431137, 0.381217, 0.237247, -0.519658, -1.408906, -0.955962, -0.615673, -1.076213, -0.930951, -1.516858, -1.904483, -3.186058, -3.5295, -4.683693, -5.340604, -5.634591, -5.282933, -4.464172, -4.851331, -4.574553, -4.188478, -3.602105, -2.627643, -2.931604, -4.097579, -5.528241, -5.6734, -5.379878, -4.459417, -3.494412, -3.487022, -2.801999, -2.147104, -1.353147, 0.154254, 0.566477, 1.309223, 1.013944, 0.875192, None, -10.25865, -9.557969, -9.36134, -9.665921, -9.969675, -10.239581, -10.25865, None, -8.53674, -8.46062, -8.094234, -8.649808, -8.933666, -8.810418, -8.444859, -8.236965, -8.53674, None, -8.362383, -8.280683, -8.705825, -8.906639, -9.040895, -9.032885, -8.457158, -8.449303, -8.095681, -8.362383, None, -6.421985, -6.777674, -6.877358, -6.465186, -6.946036, -7.594213, -7.776528, -8.370807, -8.751817, -8.348947, -8.376181, -8.302129, -8.122605, -7.740664, -7.6416, -7.766657, -7.3549, -6.9249, -6.851416, -5.895919, -5.954985, -6.345762, -6.421985, None, -1.084843, -1.782372, -2.340425, -2.428844, -3.061777, -4.305525, -5.852356, -5.873285, -5.037315, -4.220259, -3.614146, -2.799777, -2.050262, -0.650348, 0.183142, 1.042882, 1.823507, 2.453184, 3.308791, 3.86886, 4.970782, 5.479821, 5.439513, 5.246321, 4.26837, 3.59035, 3.174329, 2.099381, 2.083697, 1.3987, 0.561361, 0.104542, -0.711946, -1.059212, -1.084843, None, 12.704496, 13.466413, 13.429697, 13.06959, 12.20556, 12.704496, None, 9.981045, 10.261183, 10.881868, 10.940624, 10.267384, 11.232726, 10.278779, 9.950091, 9.318269, 9.022189, 9.713361, 9.981045, None, 8.414706, 7.750354, 7.189406, 6.274294, 7.293715, 6.786485, 6.049657, 5.581003, 6.161355, 6.885136, 7.36061, 7.833527, 7.418876, 7.457375, 6.899424, 7.192119, 8.034962, 8.316237, 8.693036, 8.240324, 8.514158, 8.960409, 8.986997, 9.760335, 9.286074, 8.782487, 8.414706, None, 18.197701, 18.507682, 19.367888, 19.821039, 20.101254, 20.077534, 19.69593, 19.255879, 18.678395, 18.197701, None, 24.394274, 22.790857, 21.970571, 22.814861, 23.556263, 24.538451, 25.295459, 24.997596, 24.394274, None, 39.180865, 38.174001, 37.142074, 36.343983, 35.842877, 35.13814, 34.6676, 34.606286, 33.464805, 33.849071, 34.596545, 34.375938, 33.904933, 33.885761, 33.149992, 31.450355, 31.029579, 31.418238, 32.319475, 32.61031, 33.296056, 33.604151, 34.232743, 34.749714, 35.433393, 35.731618, 35.527134, 37.304984, 36.827391, 37.827485, 38.215988, 39.438807, 40.563312, 41.195005, 41.37856, 39.991616, 39.180865, None, 43.960909, 44.384733, 43.262114, 42.988358, 41.995215, 42.678791, 41.584594, 41.569556, 42.563759, 43.333273, 43.388825, 44.772125, 45.551483, 44.510358, 44.1741, 43.960909, None, 40.899984, 41.209991, 40.500009, 39.177376, 39.240473, 38.906618, 39.171847, 40.378311, 40.950007, 40.899984, None, 42.628122, 43.009985, 42.152518, 41.380007, 41.583612, 42.256542, 42.628122, None, 56.111407, 55.609991, 54.800015, 55.364864, 55.779955, 56.111407, None, 58.550845, 58.635, 57.553025, 57.690019, 57.6848, 56.870017, 55.973793, 55.909998, 54.624986, 54.464376, 53.325014, 52.929999, 52.73952, 52.099998, 51.806761, 51.289428, 50.765739, 50.774989, 50.500019, 50.69688, 50.228356, 50.341837, 49.96, 50.159678, 51.210001, 51.426009, 51.593466, 51.9914, 52.301356, 52.840005, 53.495004, 53.404441, 53.985, 54.615013, 54.790971, 55.061601, 55.508473, 55.783986, 55.311146, 56.275015, 56.78501, 57.818848, 58.630013, 58.550845, None, 66.455892, 65.808748, 65.126671, 64.364082, 63.678749, 63.496383, 63.643635, 63.960179, 64.402116, 64.89113, 65.084968, 65.378594, 65.611189, 66.262519, 66.410469, 65.732112, 66.276627, 65.993853, 66.526818, 66.455892, None, 53.704578, 52.74076, 51.75666, 50.7476, 48.976391, 49.306551, 47.861575, 46.836728, 46.137908, 46.740765, 45.966755, 46.805929, 47.780133, 48.859189, 49.615163, 50.952342, 51.935435, 53.301966, 53.762145, 54.225476, 54.365881, 53.704578, None, 9.316383, 8.3675, 9.066889, 9.6845, 10.376292, 11.369668, 10.554291, 10.003653, 9.316383, None, 18.224883, 17.810283, 17.093505, 16.262444, 15.931018, 15.124814, 14.328376, 14.218202, 14.336541, 13.782131, 13.237771, 12.997527, 12.536677, 13.027526, 13.55292, 13.185836, 13.784482, 13.636687, 13.857656, 14.271016, 14.525393, 14.756671, 14.396279, 14.970869, 15.406347, 16.363704, 16.034629, 17.599081, 18.505227, 18.504065, 18.218552, 18.478976, 18.224883, None, 11.415841, 11.891755, 11.582213, 11.58366, 11.165934, 10.741308, 10.441017, 10.905691, 11.415841, None, 12.162695, 11.046148, 11.311455, 10.975816, 10.358722, 10.134679, 10.837995, 10.88993, 11.495371, 11.415583, 11.79419, 12.557761, 12.535721, 12.162695, None, 8.670505, 8.638749, 9.336821, 9.443248, 9.774003, 10.61899, 11.083045, 11.102036, 11.310473, 11.227015, 11.731972, 11.95555, 12.437303, 12.376041, 12.112982, 11.776284, 11.539994, 11.423282, 10.96946, 10.446494, 9.865651, 9.072263, 9.13722, 9.859993, 10.211935, 10.968969, 11.375482, 11.846822, 12.162307, 11.459611, 11.443385, 10.885744, 10.554653, 10.545868, 10.648627, 10.200799, 10.077215, 10.389599, 10.641418, 10.701724, 10.715625, 10.420269, 9.948204, 9.873067, 9.38134, 8.580174, 8.602757, 8.367035, 7.999202, 7.347691, 6.832787, 6.809094, 6.321268, 5.97315, 5.772878, 5.953125, 6.025291, 5.756548, 5.646529, 5.409851, 4.565768, 4.156232, 4.120007, 3.650398, 1.901564, 1.736483, 1.04619, 0.222984, -0.078445, -0.235489, -1.237805, -0.581618, -0.941028, -1.55174, -2.13775, -2.691308, -2.38311, -2.912018, -2.873054, -3.700652, -4.820946, -5.109404, -5.149504, -5.464937, -6.738193, -7.343221, -8.996401, -9.649282, -11.040721, -12.171195, -13.038119, -13.057652, -13.79337, -15.667054, -17.208407, -17.867746, -18.262296, -19.599113, -20.904512, -21.937317, -22.370676, -22.97007, -22.967693, -23.351959, -23.796842, -24.088969, -24.885199, -25.877025, -26.623646, -27.175912, -28.186135, -28.674115, -29.224469, -30.984465, -31.777698, -32.24537, -33.196578, -33.768378, -34.396815, -34.952647, -34.752659, -34.859836, -34.430456, -34.462547, -33.909454, -34.43149, -35.288027, -35.97739, -36.413126, -36.901572, -38.183871, -38.720169, -38.928425, -38.827707, -39.424105, -40.172586, -40.676897, -41.028761, -41.166789, -40.802677, -41.064315, -42.058001, -42.359016, -42.043687, -42.563138, -42.873558, -43.495381, -44.501366, -45.036786, -45.039628, -45.551896, -46.301773, -47.033873, -47.236135, -48.133289, -48.697337, -49.869669, -50.264167, -50.73251, -51.771103, -52.349983, -52.299443, -52.29195, -52.53793, -52.8992, -53.833251, -53.856454, -53.531409, -52.835069, -52.262753, None, 7.223771, 6.691116, 5.845354, 5.582812, 4.667984, 4.087606, 3.849636, 3.325017, 2.696606, 2.629556, 2.267355, 1.766404, 1.69137, 1.380924, 0.982938, 0.768429, 0.36034, -0.283703, -0.906663, -1.057455, -1.965048, -2.246943, -2.685159, -2.220794, -2.657512, -3.404856, -4.036394, -4.736765, -5.690557, -6.136834, -6.541668, -7.194341, -7.930833, -8.386568, -10.377712, -12.222716, -13.535039, -13.823187, -14.649286, -15.265683, -16.359363, -17.363488, -17.773747, -18.347975, -19.756468, -21.393319, -23.628997, -25.705924, -27.64038, -28.861442, -30.095682, -30.920645, -32.418899, -33.909093, -35.50884, -37.12378, -37.156285, -38.282883, -39.258689, -39.942213, -41.794813, -43.224958, -43.365776, -42.117532, -42.383356, -44.454961, -44.103044, -45.763976, -46.647643, -46.939253, -47.711919, -48.673773, -50.378372, -51.043396, -51.629355, -52.262753, None, -52.837498, -53.047408, -53.715377, -54.074322, -53.615848, -52.931239, -52.518293, -52.63627, -53.100014, -53.849994, -54.450009, -54.70002, -55.19999, -55.250012, -54.896804, -55.301224, -55.611851, -55.580018, -55.499041, -55.198439, -55.053849, -54.495123, -53.957533, -52.837498, None, 80.58981, 80.771918, 80.78401, 80.514569, 80.753986, 80.918885, 80.699726, 80.54728, 80.415428, 80.339567, 80.175468, 80.010181, 80.247247, 80.559424, 80.58981, None, 73.749814, 74.627486, 75.081412, 75.60939, 76.251883, 76.439055, 76.809782, 76.939697, 76.544811, 76.233642, 75.737755, 75.260885, 74.309056, 73.333044, 72.371268, 71.540595, 70.720464, 70.632743, 70.762658, 71.206662, 71.474759, 72.014881, 72.229442, 72.774731, 73.627548, 73.749814, None, 80.056406, 79.517834, 79.400038, 79.566823, 79.842362, 79.85988, 80.318896, 80.598156, 80.357679, 80.657144, 80.40734, 80.056406, None, 77.853853, 77.444937, 77.677042, 77.935037, 78.254629, 78.454953, 78.079524, 77.853853, None, 79.67431, 80.016098, 80.050876, 79.70175, 78.956111, 78.562595, 77.826671, 77.637949, 76.80942, 76.770456, 77.380342, 77.735669, 78.024928, 78.869295, 79.652399, 80.010465, 79.660409, 79.67431, None, 7.223771, 7.512255, 8.052041, 8.319182, 8.387705, 8.718124, 8.996092, 8.932375, 8.584515, 8.333316, 8.298409, 8.090308, 7.547524, 7.419754, 7.271572, 7.220541, 7.817921, 7.647906, 7.70661, 8.108963, 8.175393, 8.292362, 8.291613, 8.290864, 8.073823, 8.225054, 8.446927, 8.656836, 8.830443, 9.051386, 9.290803, 9.487354, 9.615537, 9.908052, 10.086723, 9.795992, 9.55704, 9.834542, 9.933347, 10.134886, 10.439337, 10.754331, 10.824792, 10.895278, 11.088445, 11.403439, 11.806877, 12.143962, 12.458258, 12.90991, 13.064552, 12.914018, 12.984686, 13.297535, 13.341021, 13.38448, 13.149017, 13.163951, 13.259759, 13.458533, 13.520622, 13.735338, 13.909771, 13.927832, 14.126218, 14.538829, 15.61543, 15.94019, 16.200975, 16.128318, 15.752088, 15.653515, 15.917065, 16.107312, 16.566043, 16.706164, 17.171071, 17.649026, 17.91609, 17.975751, 18.292295, 18.748572, 19.316134, 19.946767, 20.434102, 20.531719, 20.816895, 21.076285, 21.422104, 21.871146, 22.26908, 22.773752, 23.7678, 24.548915, 25.172314, 25.580609, 25.824884, 26.442934, 26.676176, 27.162115, 27.859876, 27.941241, 28.467953, 28.954409, 29.266844, 30.021114, 30.786881, 31.170966, 31.567608, 31.524045, 31.799532, 31.393485, 30.913617, 30.162681, 29.750432, 29.061611, 28.826174, 28.754783, 28.411289, 28.42519, 27.780217, 27.525814, 27.171753, 26.662817, 25.73259, 25.294632, 24.826004, 24.298595, 24.265548, 23.811183, 23.364672, 23.185588, 22.818272, 22.823078, 23.430973, 24.000964, 24.484423, 24.738413, 25.470125, 26.012004, 26.32196, 26.768186, 26.63946, 26.900064, 27.14209, 27.722727, 27.7982, 27.741485, 28.115003, 28.566112, 29.279479, 29.556362, 30.180794, 30.836464, 31.635744, 32.535327, 33.046225, 33.621236, 33.740909, 34.027782, 34.078, 34.348477, 34.447097, 34.60856, 35.156872, 36.161514, 37.551765, 37.783379, 38.113695, 38.951654, 39.766979, 40.313199, 41.142037, 41.999633, 42.76599, 43.70838, 44.615895, 45.52341, 46.86475, 47.72017, 48.184433, 48.379715, 48.04, 47.095989, 47.360004, 48.180005, 49, 49.002538, 49.984572, 50.416561, 50.830593, 51.715836, 52.329623, 52.755385, 53.561589, 54.287565, 54.802753, 55.178906, 55.497776, 56.369996, 57.178887, 58.123068, 58.187715, 58.212209, 58.499995, 59.537762, 59.727517, 60.084447, 59.99918, 60.45861, 60.884656, 60.672989, 59.978329, 59.914173, 59.705658, 59.368211, 59.155821, 59.744984, 60.725803, 61.033588, 61.284451, 60.727198, 60.061657, 59.350279, 58.864728, 58.146374, 57.727795, 57.422774, 56.979985, 56.463608, 55.994154, 55.566686, 55.643581, 55.364735, 55.024187, 54.689737, 54.404173, 54.572225, 55.039431, 55.348043, 55.894986, 56.008055, 56.418055, 57.016675, 57.216947, 57.570001, 58.328326, 58.918885, 58.615802, 58.787781, 58.424186, 58.93139, 58.572549, 59.071123, 58.670838, 58.671665, 59.266951, 59.633621, 59.989724, 59.798056, 60.267484, 60.507496, 61.073895, 61.500019, 62.074997, 62.633076, 63.146378, 63.219449, 63.059459, 63.541962, 63.455817, 63.766108, 64.222799, 64.402788, 64.788604, 64.777235, 64.559445, 64.338605, 64.55916, 64.446945, 64.686672, 65.088896, 65.669997, 66.088318, 66.57666, 66.57666, 66.077207, 66.11612, 66.735565, 67.116395, 67.616338, 68.042772, 68.358877, 68.883031, 68.915535, 69.371115, 69.858062, 70.33333, 70.44769, 70.891642, 70.824721, 71.357764, 71.147776, 70.696409, 70.889989, 70.829992, 70.600006, 70.430017, 70.53001, 70.214035, 70.12001, 69.989992, 70.152514, 69.851964, 69.711998, 69.471005, 68.990001, 68.898017, 69.315123, 69.62743, 69.505344, 69.944517, 70.1937, 69.779255, 70.012859, 70.483838, 70.377203, 69.480565, 70.158405, 69.399692, 69.563713, 69.85553, 69.797781, 69.377859, 69.011292, 68.841483, 68.905924, 68.3989, 67.902626, 67.688168, 67.806094, 67.981045, 67.381443, 67.887329, 68.311645, 68.653949, 68.699993, 68.799987, 68.561216, 68.018019, 68.097756, 67.646879, 67.805629, 67.781651, 68.403939, 68.578657, 68.239401, 67.293386, 68.090702, 68.06383, 69.069014, 69.685721, 70.089779, 71.194828, 71.92052, 71.760168, 71.318696, 70.191271, 69.699984, 69.49767, 68.474994, 69.258719, 68.615089, 67.873377, 67.198741, 67.921462, 68.784561, 69.882091, 69.805404, 69.658255, 69.162032, 68.66568, 68.132534, 67.597166, 67.110788, 66.411554, 66.2573, 66.558315, 66.056253, 65.212971, 64.775633, 64.098982, 64.032733, 63.610174, 62.960214, 62.83508, 62.02469, 60.89866, 60.110207, 58.948805, 58.782123, 57.84572, 57.087084, 57.284669, 56.851724, 56.471618, 55.999114, 55.723834, 55.30262, 55.244897, 55.148314, 54.282268, 53.277033, 52.15785, 51.208399, 51.533935, 52.562063, 54.14145, 54.667723, 55.136454, 55.837419, 56.534224, 57.202633, 58.05209, 58.804576, 59.852626, 60.757894, 62.319659, 62.550549, 62.278395, 62.181114, 62.443786, 62.105073, 61.525366, 61.137199, 61.061415, 60.221234, 58.957358, 58.801062, 58.212054, 58.767318, 59.870713, 60.335594, 59.442574, 58.167096, 56.967427, 56.339455, 55.775485, 55.204073, 54.945484, 54.626485, 53.780335, 53.647475, 53.270366, 52.146636, 51.77069, 51.419704, 51.064299, 50.242773, 50.080458, 50.290987, 50.29817, 50.228976, 49.511552, 49.068375, 47.74489, 46.821716, 46.986073, 48.299998, 49.133074, 49.232783, 48.742503, 48.070865, 46.992972, 46.238496, 45.739017, 45.883763, 47.007932, 46.282653, 45.920402, 45.265248, 44.670142, 44.265515, 43.545249, 43.618682, 44.465116, 45.292042, 45.259305, 45.137504, 44.8097, 44.3252, 43.98, 43.68405, 43.090238, 42.865291, 42.334987, 41.804994, 41.780008, 42.144999, 41.922816, 41.637175, 41.474988, 41.494444, 41.319985, 41.269988, 41.220637, 40.931102, 41.11948, 40.930008, 40.630001, 40.628011, 40.75075, 40.473499, 40.42763, 39.709256, 38.939536, 39.196393, 39.248457, 39.498494, 38.959999, 38.782032, 38.40412, 38.015509, 37.216902, 37.256589, 37.93705, 38.319215, 39.15, 38.717615, 38.08326, 38.239992, 37.917945, 36.9664, 36.89726, 36.551258, 35.55075, 34.808547, 34.51201, 33.92547, 33.861344, 33.49395, 33.15839, 32.509355, 32.0333, 31.44049, 30.729985, 30.03552, 29.180002, 28.47213, 28.039994, 26.88, 26.205765, 25.816775, 25.20616, 25.079994, 25.201253, 25.639986, 25.869997, 26.729997, 27.49504, 27.88624, 28.549989, 29.1, 29.93656, 30.09, 29.63615, 29.68612, 30.15261, 30.400005, 30.274328, 30.384916, 30.31598, 30.159994, 29.89419, 29.48864, 29.29108, 29.15961, 29.30714, 29.11743, 29.148535, 29.677, 29.5523, 29.78375, 29.71363, 29.48001, 28.738634, 28.307471, 27.830007, 27.380009, 26.689999, 26.210003, 25.869997, 24.992144, 24.272343, 22.93258, 22.444212, 21.898689, 21.411019, 20.635433, 19.890931, 19.320397, 18.828024, 18.562717, 18.144371, 18.423837, 18.524839, 18.704595, 18.876083, 19.28412, 19.867418, 20.707522, 20.999855, 21.261726, 21.493675, 21.458846, 21.543543, 21.331515, 20.849865, 20.255405, 19.646553, 19.472403, 19.04013, 18.259816, 18.516648, 18.499982, 18.353273, 18.348674, 18.076675, 17.644143, 17.489475, 17.131694, 17.036066, 16.530774, 16.265467, 16.233661, 15.887273, 15.70638, 15.855389, 15.719997, 15.688655, 15.864458, 15.878799, 15.797279, 15.84694, 15.756713, 15.782835, 15.893449, 16.005406, 15.953652, 15.885749, 15.909158, 15.995923, 15.857224, 15.835158, 15.648244, 15.424072, 15.270903, 14.995829, 14.899866, 14.676624, 14.310703, 13.970078, 13.567699, 13.127054, 12.869292, 12.419087, 12.32085, 11.893124, 11.629032, 11.373311, 11.103044, 10.938764, 10.785001, 10.395438, 9.992982, 9.566161, None, 9.566161, 9.207449, 8.995575, 8.950617, 9.031955, 8.786234, 8.858504, 9.111072, 9.312765, 9.61161, 9.552931, 9.454565, 9.420459, 9.24773, 8.946844, 8.670505, None, 19.714456, 19.884911, 19.904987, 19.880286, 19.622885, 19.648, 19.293267, 19.313214, 19.015196, 18.9791, 18.612198, 18.205142, 18.422648, 18.380713, 18.428307, 18.245915, 18.184291, 18.426886, 18.283329, 17.598564, 17.757573, 18.044997, 18.214961, 18.145611, 18.217906, 18.030993, 18.34255, 18.664908, 18.526053, 18.445799, 18.668422, 19.101625, 19.483591, 19.639551, 19.915684, 19.871501, 19.714456, None, 38.143874, 38.231181, 37.444046, 37.134219, 36.619987, 36.996631, 37.104531, 37.61295, 38.126381, 38.034966, 38.143874, None, 44.657223, 44.279985, 43.434998, None, 33.463642, 34.060299, 33.944621, 34.364931, 34.149234, 33.806335, 33.201178, 33.521985, 33.28957, 32.704567, 32.989382, 33.463642, None, 19.096716, 19.593817, 20.092521, 20.567866, 20.999752, 21.42231, 21.885745, 22.158234, 22.67934, 23.017768, 23.723358, 24.359134, 24.520261, 25.103533, 25.636265, 26.254418, 26.618892, 27.640148, 28.038186, 28.148644, 28.832142, 29.098586, 29.933574, 31.177736, 32.038096, 32.564679, 33.240245, 33.697065, 34.110476, 35.145865, 35.759988, 35.755182, 35.330712, 35.399855, 35.179093, 35.168396, 35.714849, 35.888662, 36.301273, 36.605647, 36.783905, 36.865037, 36.716519, 37.110655, 37.118381, 36.885708, 36.946427, 37.349994, 37.230002, 36.724038, 37.092103, 36.899996, 36.41, 35.947444, 35.698984, 34.833507, 34.330773, 33.785742, 33.76874, 33.293343, 33.136996, 32.792779, 32.87882, 32.711957, 32.265085, 31.376251, 31.18218, 30.763575, 30.266396, 30.525811, 30.985758, 31.751783, 32.238188, 32.706789, 32.843215, 32.638577, 32.191498, 32.18726, 32.016677, 31.899345, 31.569159, 31.585669, 31.321267, 31.025755, 30.870054, 31.186856, 31.473402, 31.555852, 31.429606, 30.933616, 31.26034, 31.024076, 30.967464, 31.219361, 31.548824, 31.605539, 32.072926, 32.827376, 33.080539, 33.0909, 33.90545, 34.610058, 34.644914, 35.410009, 35.821535, 36.274995, 36.650606, 36.565443, 36.795532, 36.21996, 36.107564, 36.644275, 36.677865, 36.262981, 36.144357, 36.676831, 36.658822, 37.653361, 38.208133, 38.98576, 39.463612, 40.420014, 40.460011, 41.219991, 41.087622, 41.736264, 42.01896, 42.040225, 41.335358, 40.948586, 41.102763, 41.013673, 41.535656, 41.962943, 42.645123, 43.013628, 43.128634, 43.434998, 44.279985, 44.657223, 45.24468, 45.404516, 46.240873, 46.636585, 47.044726, 47.263369, 47.10219, 47.022221, 46.6987, 46.645964, 46.273197, 45.651219, 45.409993, 45.46999, 45.113216, 44.939996, 44.361479, 44.564877, 45.034771, 45.327466, 45.519186, 45.851569, 46.080598, 46.333348, 46.706245, 46.5831, 46.03241, 45.293308, 45.035391, 44.82021, 44.913874, 43.707462, 43.293172, 42.577892, 42.007359, 41.622886, 41.299934, 41.054962, 40.999823, 40.690566, 40.151994, 40.617754, 40.824123, 40.852545, 40.947062, 40.687129, 40.124993, 39.962006, 39.960998, 40.476005, 40.256561, 39.659311, 39.190011, 38.970903, 38.510001, 38.219993, 37.655015, 37.920011, 37.409991, 37.30501, 36.422506, 36.41, 36.844986, 37.644989, 38.310323, 38.769985, 39.340235, 39.624998, 39.694993, 39.915006, 40.250773, 40.72723, 41.409566, 41.719986, 41.877548, 41.95501, 42.281502, 42.479991, 42.849995, 43.209998, 43.507215, 44.243191, 44.317915, 44.738484, 45.07606, 45.233777, 44.802124, 45.136935, 45.484149, 45.500324, 45.591016, 45.736692, 45.381778, 44.885374, 44.600482, 44.091366, 43.587727, 42.761008, 41.95514, 41.961315, 41.740295, 41.541082, 41.179606, 40.877143, 40.355625, 40.168866, 39.810774, 40.277671, 40.442235, 39.795401, 39.4247, 38.902871, 38.843572, 37.985899, 37.908849, 38.214593, 38.750942, 38.964547, 39.544072, 40.048357, 40.172949, 40.60455, 40.786348, 41.188287, 41.25309, 41.704535, 42.355425, 42.931463, 43.920007, 44.036279, 44.366336, 44.231228, 43.767148, 43.693845, 43.128892, 43.399651, 43.075201, 42.473015, 41.89212, 41.226089, 41.014732, 40.678318, 40.123934, 39.309978, 38.738514, 38.292366, 37.642354, 37.443064, 36.674144, 36.6589, 36.677839, 36.324708, 35.94685, 36.029817, 36.367677, 36.942913, 37.097788, 36.838269, 36.97888, 36.868809, 37.651346, 38.266243, 38.358486, 38.737429, 39.392066, 39.755093, 40.159306, 40.760639, 41.184334, 41.543459, 41.880571, 42.592775, 43.026625, 43.748338, 43.567909, 43.57424, 43.403449, 43.455901, 43.422802, 44.02261, 46.014918, 47.064363, 47.570327, 47.954954, 48.68416, 48.901692, 48.644421, 49.776342, 49.347376, 50.127173, 50.946606, 51.148506, 51.345781, 51.620545, 53.091798, 53.510403, 53.482162, 53.693932, 53.748296, 53.527792, 54.020786, 54.395646, 54.962744, 55.517723, 56.540012, 56.809969, 57.110003, 57.172066, 57.447941, 57.730017, 57.215733, 56.890016, 56.609982, 56.458621, 56.081383, 56.190007, 55.469999, 54.983104, 54.596642, 54.363607, 54.008693, 54.196486, 54.470371, 54.075511, 53.757029, 54.050706, 54.513159, 54.851536, 54.682606, 54.438719, 54.426084, 54.86616, 55.190482, 56.031076, 56.783873, 57.411871, 57.753374, 57.006236, 57.025693, 57.793424, 58.383413, 58.257375, 58.612753, 59.18724, 59.465854, 59.61109, 59.445803, 59.475388, 60.028068, 60.503517, 60.423961, 60.057316, 59.846373, 60.391921, 60.72017, 61.705329, 62.607393, 63.189735, 63.81781, 64.902344, 65.111427, 65.534346, 66.006927, 65.723741, 65.026005, 64.413588, 63.609554, 62.7494, 61.341166, 60.636583, 60.081914, 58.953766, 58.719827, 57.041118, 56.104302, 56.200885, 55.407781, 55.361737, 56.30708, 57.441817, 58.856149, 59.469807, 58.313288, 58.078884, 58.588155, 59.663232, 61.970998, 62.614473, 63.454008, 64.486038, 65.879726, 67.810642, 68.563205, 69.817444, 70.255169, 70.202072, 71.030497, 70.986262, 71.185474, 70.453788, 70.186259, 69.55808, 69.905966, 69.301403, 69.063433, 67.932391, 67.457123, 66.791582, 66.26618, 65.999538, 66.759595, 66.632522, 65.90015, 65.436213, 64.41437, 64.10945, 63.84983, 64.33471, 64.76446, 65.14322, 64.52079, 64.76446, 65.49682, 66.47623, 66.41858, 66.06908, 66.756339, 67.352427, 67.961614, 68.570802, 68.249995, 67.68997, 67.56652, 67.010044, 66.66767, 66.88455, 67.52238, 68.85738, 68.80815, 68.20131, 68.086846, 68.43866, 68.46628, 68.88082, 68.27844, 68.94069, 69.52, 69.85, 69.547383, 69.234835, 68.09233, 68.61563, 69.14436, 69.35649, 69.45461, 69.92873, 70.70889, 71.02897, 71.9345, 72.84336, 73.04, 72.77629, 72.22006, 71.40898, 71.09019, 70.39114, 69.020852, 68.4079, 67.7404, 66.32, 66.17267, 66.53267, 66.78946, 67.28429, 67.76047, 68.32899, 68.98918, 69.07146, 69.62763, 70.63175, 71.44717, 72.12119, 72.83227, 72.85497, 72.30056, 71.33556, 71.15287, 71.87401, 72.267165, 72.320108, 71.749988, 72.582857, 73.648218, 73.850015, 73.805909, 73.936883, 74.459667, 75.116449, 75.143941, 75.639983, 75.773334, 76.047193, 76.140004, 75.91547, 76.446884, 76.43027, 76.861872, 77.287531, 77.697919, 77.373882, 77.127386, 76.974191, 76.479983, 76.723353, 76.71, 76.22224, 75.84764, 75.32779, 75.031855, 74.47673, 74.18, 74.04, 73.78774, 73.97693, 73.33505, 73.59488, 73.75285, 73.58772, 73.12, 72.971205, 73.73503, 73.56, 73.56549, 73.03871, 72.39872, 71.98, 71.19304, 70.786997, 71.8363, 71.38642, 71.65525, 71.34763, 71.62803, 71.48783, 72.41619, 72.84941, 72.199986, 71.606431, 70.842214, 71.03141, 70.86672, 70.45324, 69.72198, 69.43728, 69.64204, 69.66823, 69.47199, 69.568768, 68.6938, 69.01363, 69.65276, 70.09703, 69.81743, 69.87725, 69.400002, 68.963646, None, 64.979709, 64.53493, 64.60821, 64.07593, 63.25197, 62.98262, 62.56894, 62.304104, 62.5219, 61.76915, 61.65261, 60.95, 60.33618, 59.88177, 60.573564, 59.78855, 60.16, 59.7316, 59.868697, 59.21101, 58.24328, 57.83912, 57.61503, 56.159234, 56.115868, 55.28568, 54.85514, 54.344332, 53.20257, 52.95868, 51.94269, 51.01105, 51.7, 53.158952, 55.381013, 56.76792, 57.364716, 57.832026, 58.05575, 59.314778, 60.343, 61.140894, 62.550601, 62.466265, 61.642491, 60.54423, 61.77396, 61.43442, 59.75818, 59.14495, 58.88385, 58.78089, 59.50396, 59.65573, 59.16448, 59.33637, 59.03998, 57.08804, 54.72959, 54.60355, 53.97732, 53.755014, 54.25455, 54.189664, 53.08957, 52.238776, 51.23967, 50.04553, 48.446707, 46.999664, 46.307949, 45.143498, 43.988995, 43.398204, 42.81147, 42.798499, 43.284542, 42.552752, 42.220007, 42.280004, 41.941368, 41.601104, 40.882828, 40.661808, 40.485436, 40.189847, 40.025413, 39.75685, 39.323931, 39.213472, 39.050898, 38.612243, 37.432392, 36.784189, 35.632141, 35.082484, 34.890377, 34.475674, 34.390046, 34.93456, 35.684541, 36.725485, 36.893924, 37.749686, 37.94001, 37.752089, 37.669071, 37.857224, 37.948821, 38.108346, 38.548474, 38.665857, 38.848559, 39.387958, 39.551385, 39.660344, 39.928493, 39.637788, 39.170452, 38.897471, 39.360854, 39.750261, 40.422443, 40.94639, 40.593388, 39.898056, 39.252333, 39.204274, 38.737636, 38.061476, 37.897325, 37.448464, 37.156389, 37.870428, 37.481123, 37.454484, 36.930614, 36.651329, 36.11144, 35.609791, 34.909859, 34.360332, 33.376723, 32.460319, 31.692174, 30.949352, 30.676267, 30.142915, 29.83252, 29.018022, 28.225513, 28.135673, 27.053207, 25.740781, 24.547391, 23.624501, 22.782873, 22.668074, 22.22376, 22.54834, 22.051367, 21.550494, 21.397144, 20.565412, 20.341033, 20.282457, 21.008227, 21.395051, 21.715212, 21.55238, 20.696851, 19.75205, 19.058165, 18.004121, 16.697457, 16.079742, 15.276691, 13.426028, 11.666859, 11.008321, 10.364484, 9.53084, 8.59976, 9.241038, 9.918491, 10.486544, 10.632555, 11.153661, 12.186595, 12.64574, 12.627085, 13.412722, 13.406856, 12.307001, 10.846367, 9.963061, 9.239255, 9.207862, 8.295153, 7.429573, 6.856869, 6.740622, 6.221636, 6.128205, 5.524495, 4.855001, 4.181606, 3.726698, 3.382869, 2.791019, 2.515454, 1.631141, 1.293048, 1.226334, 1.967115, 2.760814, 3.270292, 3.93914, 4.76728, 5.312493, 6.040562, 6.464489, 6.848213, 7.343454, 7.907993, 8.382305, 7.794512, 8.350007, 8.973923, 9.93296, 10.675266, 11.441292, 12.032987, 13.122378, 13.64046, 14.837286, 16.100568, 16.928734, 16.427241, 15.71439, 15.803454, 16.037936, 17.27724, 18.213514, 19.366493, 19.726962, 19.855145, 20.670883, 21.192195, 21.70157, 22.182936, 22.765019, 22.805017, 22.392794, 21.836368, 22.039146, 21.857116, 21.966179, 22.055708, 21.690588, 21.703172, 21.495562, 20.743308, 20.151638, 19.478579, 18.30201, 17.671221, 17.016636, 16.556664, 16.310219, 15.951972, 15.899185, 15.136415, 13.835771, 13.006261, 12.056215, 10.357275, 10.308854, 9.546136, 9.216544, 8.933047, 8.252959, 7.965535, 8.899276, 10.29963, 11.308251, 11.781245, 12.741936, 13.992583, 14.617222, 15.990652, 17.92857, 19.208234, 20.419503, 21.356009, 20.757441, 20.877331, 22.089298, 22.450775, 22.84318, 23.691965, 23.944844, 24.663611, 25.425141, 25.237039, 25.218409, 25.078237, 25.380157, 25.609962, 25.739902, 26.966106, 27.143305, 26.964633, 26.480658, 26.812369, 27.580849, 27.86569, 28.814521, 30.147773, 29.985715, 30.31709, 29.926778, 29.975819, 29.534477, 29.306299, 28.552004, 27.689628, 27.461218, 27.109999, 26.689663, 26.277027, 25.943972, 25.60805, 25.327808, 24.999896, 24.754743, 25.482424, 26.006992, 26.114582, 25.801113, 25.21567, 24.627386, 24.245497, 24.294073, 24.019826, 24.177439, 24.151317, 24.121758, 24.797892, 25.439145, 26.055464, 26.395934, 26.309118, 25.895991, 25.714606, 24.924732, 24.241673, 23.878594, 23.747931, 23.565668, 22.992395, 22.660271, 22.533612, 22.310525, 21.714541, 21.433886, 21.114035, 20.428986, 20.481437, 20.243002, 19.736005, 19.06757, 18.94471, 18.947991, 18.574267, 18.087113, 17.876067, 17.884128, 17.632309, 17.228354, 16.950697, 17.044981, 16.707663, 16.651051, 16.382411, 15.938433, 15.59742, 15.17525, 14.708767, 14.003202, 13.94809, 14.007233, 13.59222, 13.399699, 13.347764, 13.290946, 13.026905, 12.953938, 12.699587, 12.721653, 12.58595, 12.6368, 13.22095, 13.767584, 14.06263, 14.802249, 15.213335, 15.261963, 15.718886, 15.911742, 16.347891, 16.774635, 17.075806, 17.474722, 17.833046, 18.6716, 19.486485, 20.174635, 20.338862, 21.291905, 21.986875, 22.579656, 23.688451, 24.078686, 24.285495, 24.858483, 25.084542, 25.602959, 25.826228, 26.570136, 27.37652, 28.063352, 28.058546, 28.607427, 28.957483, 29.356555, 29.501326, 29.099413, 28.343981, 27.823315, 27.6487, 27.971368, 28.417646, 29.851072, 29.760432, 28.705225, 27.699886, 26.142281, 25.598567, 25.033744, 23.926705, 23.752375, 23.10244, 22.204847, 22, 21.018847, 20.837436, 19.807964, 18.614084, 18.367871, 17.998307, 16.840626, 15.922723, 15.435647, 14.49108, 13.921037, 13.343992, 13.000421, 12.699639, 12.390148, 11.974928, 11.735641, 11.46204, 11.27771, 10.864169, 10.445538, 10.442205, 10.698029, 10.816549, 11.127228, 11.193064, 11.375482, 11.410622, 11.430336, 11.578906, 11.679572, 12.021902, 12.024641, 11.748146, 11.166502, 10.640901, 10.279735, 9.198741, 8.081729, 6.80465, 5.339106, 4.219407, 2.855278, 2.045767, 1.052804, 0.292179, -0.919168, -1.446475, -1.683256, -2.08256, -2.49979, -2.57309, -3.277681, -3.68117, -4.346556, -4.67677, -5.908941, -6.475677, -6.839996, -7.09998, -7.703922, -8.007831, -8.485528, -9.112363, -10.098401, -10.317096, -10.765441, -11.761711, -12.639177, -14.201975, -14.691764, -15.406294, -16.100774, -16.720891, -17.101023, -17.586368, -18.659688, -18.84226, -19.552811, -19.784012, -20.497043, -21.254361, -21.840837, -22.14, -22.09, -23.070788, -23.535359, -23.706563, -24.12261, -24.478351, -24.816314, -25.357573, -25.727318, -26.148584, -26.215867, -26.742192, -27.470158, -28.301011, -28.752405, -29.257387, -29.401978, -29.909957, -30.423776, -31.140269, -32.172041, -32.771953, -33.226964, -33.61495, -33.66704, -33.944646, -33.796851, -33.987176, -33.794474, -33.916431, -33.864083, -34.258839, -34.417175, -34.795137, -34.819166, -34.462599, -34.444306, -33.997873, -34.136521, -33.867752, -33.281431, -32.611291, -32.429131, -31.661633, -30.725721, -29.878641, -29.875954, -28.576705, -27.821247, -27.090956, -26.117372, -25.39292, -23.853014, -22.656653, -22.111208, -21.699037, -20.872834, -19.673166, -19.045349, -18.069129, -17.301889, -16.673142, -15.793816, -14.878316, -14.449144, -13.5477, -13.137906, -12.48363, -12.038645, -11.297863, -10.731076, -10.373578, -9.766897, -9.166934, -8.959091, -8.562629, -7.596539, -6.927122, -6.294448, -6.100092, -5.789931, -5.037987, -3.978827, -2.969483, -2.144313, -1.111301, -0.779074, -0.459351, 0.268666, 1.01012, 1.160911, 2.283866, 3.073404, 3.734527, 3.904129, 4.352215, 4.495617, 4.771983, 4.412108, 4.464689, 4.240594, 4.262453, 4.887971, 5.611802, 6.270651, 6.2583, 6.258817, 6.142158, 5.928837, 5.343473, 5.000548, 4.710462, 4.994476, 4.984296, 5.179813, 5.168264, 4.993701, 4.705088, 4.338288, 4.364566, 4.355755, 4.832419, 5.593561, 6.140711, 6.785917, 6.860098, 7.262942, 7.798646, 8.163946, 8.903049, 9.494744, 9.886167, 10.01572, 10.214467, 10.656301, 10.876572, 11.040412, 11.458474, 11.524594, 11.806515, 11.958702, 12.170911, 12.384852, 13.151394, 13.594959, 14.373516, 14.729541, 14.919477, 15.621527, 16.135036, 16.673892, 17.166963, 18.108482, 19.096716, None, 68.199998, 68.963646, None, -16.067133, -16.020882, -16.501783, -16.555217, None, -8.432095, -8.398247, -8.273345, -8.397317, -8.668256, -9.106007, -9.393173, -10.140001, -10.359987, -10.239995, -9.900016, -9.290027, -8.89279, -8.656887, -8.432095, None, -84.71338, -84.721443, -84.139412, -84.452933, -84.099259, -84.117914, -84.534323, -84.117914, -84.061019, -83.884647, -84.117914, -84.23739, -84.570497, -84.82521, -85.138731, -85.37391, -85.09956, -85.295517, -85.609038, -85.315102, -85.040752, -84.570497, -84.531274, -84.296146, -83.904232, -83.68869, -83.23802, -82.82652, -82.454192, -82.042692, -81.768394, -81.41565, -81.102129, -81.160937, -81.004151, -81.337309, -81.043373, -80.671045, -80.337938, -79.926439, -79.652089, -79.358205, -79.299397, -79.162248, -79.064269, -78.691941, -78.37842, -78.025676, -76.889208, -76.987238, -77.300759, -77.202729, -77.06558, -77.496665, -77.398738, -77.183144, -76.908845, -76.575739, -76.477761, -76.105432, -75.733155, -75.380411, -75.20404, -75.537198, -75.341241, -75.086476, -75.066891, -74.968912, -74.733784, -74.518242, -74.302699, -74.361456, -74.439849, -74.302699, -74.479019, -74.459434, -74.322285, -74.420263, -74.518242, -74.479019, -74.498605, -74.518242, -74.479019, -74.185084, -74.028349, -74.243892, -74.06752, -73.714828, -74.028349, -74.381041, -74.714199, -74.420263, -74.79254, -74.910104, -75.184454, -75.125698, -74.949327, -74.988497, -75.125698, -75.302018, -74.870934, -74.537827, -74.185084, -74.106742, -73.734414, -73.362085, -72.617531, -72.75468, -72.813436, -72.75468, -72.911415, -73.20535, -73.558042, -73.61685, -73.479701, -73.283744, -73.16618, -73.401307, -73.322914, -72.558723, -73.009393, -73.185765, -73.087787, -73.479701, -73.518871, -73.636435, -73.851978, -73.479701, -73.126957, -73.518871, -73.420893, -73.636435, -73.969542, -73.871615, -73.656021, -73.401307, -73.264158, -73.146543, -73.009393, -72.793851, -72.48033, -72.049245, -71.637746, -71.245832, -70.853918, -70.462055, -70.109312, -69.717398, -69.325536, -68.953207, -68.541707, -68.149845, -67.71876, -67.326846, -66.876176, -66.58224, -66.209963, -65.896391, -65.602507, -65.171422, -64.897072, -64.642307, -64.583551, -64.27003, -64.074073, -63.956509, -63.701744, -63.388224, -63.27066, -63.525424, -63.858531, -64.152466, -64.368009, -64.211222, -64.309201, -64.544329, -64.799094, -65.093029, -65.484943, -65.85722, -66.190326, -66.425506, -66.503847, -66.837005, -67.150475, -67.581611, -67.953888, -68.365336, -68.678908, -68.913984, -69.227557, -69.619419, -69.991748, -70.383662, -70.716768, -71.089046, -72.010075, -72.382352, -72.774266, -73.16618, -73.695243, -74.106742, -74.439849, -74.576998, -74.929741, -75.262848, -75.635125, -75.791911, -76.007453, -76.222996, -76.634495, -76.673666, -76.634495, -76.712888, -76.712888, -77.104802, -77.281071, -77.555421, -77.908112, -78.221633, -78.123655, -78.37842, -78.789919, -79.181833, -79.514939, -79.887216, -80.259545, -80.416331, -80.69063, -81.004151, -81.317672, -81.474458, -81.748757, -82.042692, -82.37585, -82.846106, -83.218434, -82.865691, -82.571755, -82.258235, -82.003521, -81.729171, -81.709586, -81.846735, -82.081915, -81.65083, -81.356894, -81.337309, -81.121715, -80.906172, -80.769023, -80.592651, -80.337938, -79.985195, -79.632503, -79.260226, -79.299397, -79.456132, -79.456132, -79.083855, -78.339249, -78.123655, -77.888527, -77.653451, -77.359515, -77.06558, -76.673666, -76.497346, -76.360145, -76.281803, -76.242581, -76.105432, -75.909475, -75.674347, -75.439219, -75.125698, -74.79254, -74.498605, -74.106742, -73.871615, -73.460115, -73.146543, -72.950586, -72.715458, -72.401937, -72.010075, -71.539767, -71.265417, -71.324225, -71.657331, -71.696502, -71.324225, -70.932311, -71.030289, -71.402618, -71.461374, -71.285054, -71.167439, -71.226246, -71.637746, -71.30464, -71.128268, -70.991119, -70.853918, -70.61879, -70.462055, -70.246513, -69.89377, -70.148534, -70.011334, -70.481641, -70.834332, -70.638375, -70.246513, -69.972163, -70.030919, -70.403248, -70.030919, -69.913355, -69.874184, -69.89377, -70.011334, -70.070141, -70.403248, -70.697183, -70.520811, -70.481641, -70.481641, -70.462055, -70.324854, -70.207291, -69.93294, -69.75662, -69.658642, -69.384292, -68.835643, -68.502588, -68.659271, -69.012015, -69.247142, -69.168749, -69.521441, -69.776206, -69.541078, -69.109942, -68.933622, -68.600515, -68.463314, -68.267409, -68.051867, -67.816739, -67.601196, -67.71876, -67.366069, -67.091718, -67.111304, -66.876176, -66.523484, -66.249134, -66.053177, -65.896391, -65.818049, -65.876806, -65.974784, -66.249134, -66.680219, -67.013325, -67.287675, -67.405239, -67.67959, -67.953888, -68.012696, -67.816739, -67.405239, -67.62073, -67.738346, -67.85591, -67.934303, -67.934303, -68.972792, -69.227557, -69.678227, -69.93294, -70.305269, -70.697183, -70.677546, -71.06946, -71.441789, -71.853288, -72.166809, -72.264788, -72.088416, -71.696502, -71.324225, -71.010704, -70.716768, -70.364025, -69.874184, -69.776206, -69.737035, -69.619419, -69.462685, -69.070771, -68.698442, -68.326217, -68.071504, -67.875547, -67.542389, -67.366069, -67.209282, -67.307261, -67.209282, -67.091718, -67.150475, -66.876176, -66.209912, -66.484262, -66.954569, -67.150475, -67.228868, -67.111304, -67.189697, -67.209282, -67.111304, -67.170112, -67.385654, -67.248505, -67.248505, -67.111304, -67.248505, -66.915347, -66.58224, -66.30789, -65.563285, -65.700486, -65.974784, -66.327527, -66.934932, -66.954569, -66.954569, -66.837005, -66.699804, -66.425506, -66.13157, -66.092348, -65.876806, -66.072763, -66.386283, -66.699804, -66.660634, -66.915347, -67.170112, -67.26809, -67.189697, -66.876176, -66.562655, -66.484262, -66.621463, -66.71939, -66.562655, -66.562655, -66.660634, -66.758612, -66.58224, -66.425506, -66.386283, -66.386283, -66.288305, -66.209963, -65.720071, -65.308571, -65.58287, -66.033592, -66.445091, -66.778198, -66.954569, -66.895761, -66.876176, -66.817368, -66.817368, -66.797783, -66.837005, -66.915347, -67.228868, -67.601196, -67.895132, -68.13026, -68.385025, -68.561293, -68.718131, -68.874814, -68.894502, -68.561293, -68.835643, -69.149216, -69.384292, -69.48227, -69.599834, -69.991748, -70.226876, -70.579619, -70.736354, -70.716768, -70.775525, -70.755939, -70.834332, -70.971482, -71.206661, -71.402618, -71.696502, -72.088416, -72.441159, -72.89183, -73.244521, -73.656021, -73.812807, -74.165499, -74.381041, -74.772955, -75.145284, -75.458805, -75.870304, -76.242581, -76.693303, -77.06558, -77.457442, -77.829771, -78.182514, -78.319612, -78.750748, -78.907483, -79.123025, -79.162248, -79.730482, -80.200737, -80.573066, -80.945395, -81.278501, -81.690001, -82.062278, -82.395435, -82.708956, -83.022477, -83.335998, -83.825891, -84.041433, -84.117914, -84.41371, -84.158997, -84.472518, -84.71338, None, 68.963636, 68.199998, 67.20589, 66.58435, 66.33556, 67.06219, 66.91308, 65.97724, 65.54139, 65.43791, 64.46079, 64.25269, 64.2826, 64.63125, 64.92288, 65.35667, 65.52024, 65.39052, 65.74044, 66.11211, 65.87456, 65.40411, 64.979709, None, 71.515714, 71.55762, 71.55553, 71.26948, 71.13277, 70.89302, 70.832199, None, 70.832199, 70.78114, 71.0988, 71.515714, None, -16.555217, -16.801354, -17.012042, -16.63915, -16.433984, -16.379054, -16.067133, None, -51.85, -51.25, -51.5, -51.1, -51.55, -51.9, -52.2, -51.85, -52.3, -51.85, None, -48.625, -48.94, -49.065, -49.255, -49.71, -49.775, -49.2425, -48.83, -48.625, None, -17.50481, -17.33992, -17.62846, -18.15059, -18.28799, -18.16432, -17.72465, -17.38114, -17.50481, None, 10.76, 10.89, 10.855, 10.11, 10, 10.09, 10.365, 10.76, None, 20.07975, 19.99302, 19.8591, 19.50871, 19.45328, 19.23972, 19.08348, 18.91619, 19.05939, 19.33888, 19.70294, 19.81422, 19.97729, 20.17395, 20.26721, 20.2487, 20.07975, None, 20.76404, 20.64397, 20.57241, 20.783, 20.8643, 20.92676, 21.01249, 20.91745, 20.76404, None, 21.17684, 21.06873, 21.09777, 21.21958, 21.17684, None, 21.71696, 21.65272, 21.32217, 21.26442, 21.27729, 21.31244, 21.53919, 21.57912, 21.71696, None, 22.21494, 21.982, 21.88299, 22.06533, 22.1382, 22.23618, 22.21494, None, 25.2103, 25.17, 24.34, 23.75975, 23.71, 24.28615, 24.57564, 25.2103, None, 26.79, 26.87, 26.84, 26.58, 26.42, 26.79, None, 27.04, 26.59, 25.87918, 26.00735, 26.53, 26.92516, 27.04, None, 47.03601, 46.55001, 46.41587, 46.44314, 46.03339, 45.96818, 46.39265, 46.72747, 47.03601, None, 44.6092, 45.64149, 45.80629, 46.39933, 46.60899, 47.048705, 46.804637, 46.853006, 46.234646, 45.259047, 45.408391, 45.245998, 44.514854, 44.609836, 44.284016, 44.031034, 43.132975, 42.792298, 42.443895, 42.027151, 41.78333, 41.135371, 41.868117, 42.123191, 41.551211, 40.951015, 40.631034, 40.876523, 40.033629, 39.975286, 39.290574, 38.952093, 37.906136, 37.198918, 36.965031, 36.700422, 36.872814, 37.374567, 37.582874, 38.32026, 38.815486, 39.049219, 39.399482, 40.176101, 40.256561, 40.526157, 40.572924, 41.282287, 41.80888, 42.98658, 43.66016, 44.6092, None, 49.87304, 49.95718, 49.70641, 49.28855, 49.10506, 49.08717, 49.40069, 49.87304, None, 62.085565, 62.3856, 62.36371, 62.158675, 61.63308, 61.7181, 62.01649, 62.085565, None, 62.4528, 62.91409, 62.90458, 62.7108, 62.15922, 62.18231, 62.4528, None, 67.44425, 67.14886, 67.09873, 67.58809, 68.14856, 68.28721, 68.01036, 67.58202, 67.44425, None, 69.68003, 69.107695, 68.757044, 69.06003, 68.950702, 69.40003, 69.710035, 70.143523, 69.86003, 69.68003, None, 73.076005, 72.672593, 71.698415, 70.99298, 70.497764, 70.024305, 69.584487, 69.504027, 69.119606, 68.752806, 68.91, 69.18, 69.119244, 68.78, 68.630059, 68.53554, 69.007442, 69.28, 69.168207, 69.96, 70.066525, 70.237315, 70.192357, 70.366351, 70.600006, 70.52045, 70.540552, 70.909212, 71.309188, 71.295183, 71.558578, 72.307835, 72.70595, 73.314595, 73.121454, 72.652775, 72.955392, 72.45041, 72.961128, 72.633345, 71.650872, 72.065472, 73.089544, 73.235995, 73.076005, None, 72.802902, 73.333183, 73.693184, 73.75972, 73.651932, 73.102685, 72.826385, 72.855545, 72.876656, 72.742203, 72.802902, None, 73.36983, 73.76506, 73.85758, 73.47525, 73.21244, 73.20544, 73.31692, 73.36983, None, 75.345845, 75.08406, 74.68892, 74.778355, 75.17298, 75.49682, 75.345845, None, 76.13676, 76.09289, 75.562625, 74.82, 74.84768, 74.61148, 75.26167, 75.94917, 76.13676, None, 76.588607, 76.72, 76.25656, 75.74344, 75, 74.897444, 75.057357, 75.640758, 75.563812, 76.336581, 76.305369, 76.64633, 76.588607, None, 79.28129, 78.71334, 78.30689, 77.921, 79.23399, 79.34641, 79.28129, None, 81.0246, 81.2504, 80.746975, 79.780135, 78.88094, 78.7562, 79.044745, 79.4265, 80.14379, 80.34146, 81.0246, None, 80.602316, 80.907284, 80.97728, 81.206465, 81.257392, 80.723445, 80.32, 79.66, 79.336915, 79.03931, 78.287211, 78.215329, 78.343332, 78.751007, 79.113724, 79.380116, 79.372468, 79.705006, 80.157769, 80.602316, None, 81.89429, 82.085, 82.11751, 82.27961, 82.652273, 82.6, 82.32, 82.86, 83.02, 83.13056, 83.172059, 83.06404, 83.23324, 83.169781, 83.106322, 83.02801, 82.9, 82.6286, 82.36165, 81.92775, 81.72527, 81.50141, 81.50657, 80.9, 80.61683, 79.8, 79.63415, 79.430162, 79.32309, 79.19766, 79.01907, 78.52581, 78.18296, 77.89991, 77.50859, 77.20968, 76.98336, 77.022045, 76.777955, 76.17812, 76.45403, 76.29901, 76.42, 76.47239, 76.95213, 77.17833, 77.9, 77.970222, 77.53873, 78.18, 78.37181, 78.75867, 78.9969, 79.34543, 79.73624, 80.25145, 80.20836, 80.1, 80.46442, 80.58, 80.51627, 80.85569, 81.26, 81.5531, 81.89429, None, 82.62796, 83.22516, 83.18018, 83.54905, 83.64513, 83.51966, 82.72669, 82.34165, 82.29765, 82.2, 82.02154, 82.13178, 81.78697, 82.09317, 81.73449, 81.15271, 81.52462, 81.91245, 81.71885, 81.29154, 80.58004, 80.35, 80.17708, 80.12912, 79.4, 78.75128, 77.63859, 76.98565, 76.94434, 76.62795, 76.09808, 75.24838, 75.15585, 74.29561, 74.22382, 73.81713, 73.46436, 73.30955, 73.30663, 72.62928, 72.18409, 72.59788, 72.3302, 72.08016, 71.46898, 70.66369, 70.471, 70.85649, 71.43094, 70.75226, 70.22646, 70.18401, 70.12946, 69.2588, 68.47046, 68.12503, 68.12078, 67.73547, 66.67974, 65.9789, 65.93768, 65.69213, 65.45848, 64.83997, 64.13902, 63.48246, 62.68233, 61.90093, 61.07404, 60.09772, 60.03676, 60.85328, 60.85843, 61.40681, 62.38336, 63.62691, 64.27842, 65.1767, 66.09957, 66.8365, 67.18899, 68.35759, 68.72958, 69.14781, 69.9291, 69.574925, 69.42616, 69.283625, 69.61003, 70.28932, 70.821315, 70.835755, 70.56978, 71.20485, 71.54719, 71.406537, 71.65444, 72.58625, 72.95861, 73.64977, 74.71026, 75.09861, 75.51727, 76.10238, 76.1752, 76.13486, 76.06141, 76.37975, 77.00857, 77.32312, 77.37595, 77.63595, 78.04419, 78.43271, 78.91388, 79.39436, 79.75814, 80.11721, 80.51582, 81.21396, 81.3211, 81.77042, 82.03363, 82.19074, 82.19962, 81.88833, 82.43883, 82.06481, 81.985945, 81.6607, 82.19979, 82.62796, None, 73.6, 73.64, 73.42, 72.76, 73.46, 73.6, None]
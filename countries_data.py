@@ -1,8 +0,0 @@
-"""
-Pre-processed country boundary data for fast loading
-Generated from countries_tiny.geojson
-"""
-
-COUNTRY_LONS = [61.210817, 62.230651, 62.984662, 63.193538, 63.982896, 64.546479, 64.746105, 65.588948, 65.745631, 66.217385, 66.518607, 67.075782, 67.83, 68.135562, 68.859446, 69.196273, 69.518785, 70.116578, 70.270574, 70.376304, 70.806821, 71.348131, 71.239404, 71.541918, 71.448693, 71.844638, 72.193041, 72.63689, 73.260056, 73.948696, 74.980002, 75.158028, 74.575893, 74.067552, 72.920025, 71.846292, 71.262348, 71.498768, 71.613076, 71.115019, 71.156773, 70.881803, 69.930543, 70.323594, 69.687147, 69.262522, 69.317764, 68.926677, 68.556932, 67.792689, 67.683394, 66.938891, 66.381458, 66.346473, 65.046862, 64.350419, 64.148002, 63.550261, 62.549857, 60.874248, 61.781222, 61.699314, 60.941945, 60.863655, 60.536078, 60.9637, 60.52843, 60.803193, 61.210817, None, 16.326528, 16.57318, 16.860191, 17.089996, 17.47297, 18.134222, 18.464176, 19.016752, 19.166613, 19.417502, 20.037723, 20.091622, 20.601823, 20.514748, 21.728111, 21.746456, 21.949131, 21.801801, 21.875182, 22.208753, 22.155268, 22.402798, 22.837345, 23.456791, 23.912215, 24.017894, 23.904154, 24.079905, 23.930922, 24.016137, 21.933886, 21.887843, 22.562478, 23.215048, 21.377176, 18.956187, 18.263309, 14.209707, 14.058501, 13.462362, 12.814081, 12.215461, 11.734199, 11.640096, 11.778537, 12.123581, 12.175619, 12.500095, 12.738479, 13.312914, 13.633721, 13.738728, 13.686379, 13.387328, 13.120988, 12.87537, 12.929061, 13.236433, 12.93304, 12.728298, 12.227347, 12.322432, 12.735171, 13.024869, 13.375597, 16.326528, None, 12.436688, 12.182337, 11.914963, 12.318608, 12.62076, 12.995517, 12.631612, 12.468004, 12.436688, None, 20.590247, 20.463175, 20.605182, 21.02004, 20.99999, 20.674997, 20.615, 20.150016, 19.98, 19.960002, 19.406082, 19.319059, 19.40355, 19.540027, 19.371769, 19.304486, 19.738051, 19.801613, 20.0707, 20.283755, 20.52295, 20.590247, None, 51.579519, 51.757441, 51.794389, 52.577081, 53.404007, 54.008001, 54.693024, 55.439025, 56.070821, 56.261042, 56.396847, 55.886233, 55.804119, 55.981214, 55.528632, 55.525841, 55.234489, 55.208341, 55.006803, 52.000733, 51.617708, 51.579519, None, -65.5, -66.45, -66.95992, -67.56244, -68.63335, -68.63401, -68.25, -67.75, -66.45, -65.05, -65.5, None, -64.964892, -64.377021, -63.986838, -62.846468, -62.685057, -60.846565, -60.028966, -58.807128, -57.777217, -57.63366, -58.618174, -57.60976, -56.486702, -55.695846, -54.788795, -54.625291, -54.13005, -53.628349, -53.648735, -54.490725, -55.162286, -56.2909, -57.625133, -57.874937, -58.14244, -58.132648, -58.349611, -58.427074, -58.495442, -57.22583, -57.362359, -56.737487, -56.788285, -57.749157, -59.231857, -61.237445, -62.335957, -62.125763, -62.330531, -62.145994, -62.745803, -63.770495, -64.73209, -65.118035, -64.978561, -64.303408, -63.755948, -63.458059, -64.378804, -65.181804, -65.328823, -65.565269, -66.509966, -67.293794, -67.580546, -66.597066, -65.641027, -65.985088, -67.166179, -67.816088, -68.728745, -69.138539, -68.815561, -68.149995, -68.571545, -69.498362, -71.914804, -72.329404, -72.309974, -72.975747, -73.328051, -73.415436, -72.648247, -72.331161, -72.447355, -71.917258, -71.552009, -71.659316, -71.222779, -71.329801, -71.793623, -71.464056, -71.915424, -72.148898, -71.746804, -71.915734, -71.680761, -71.413517, -70.814664, -71.118625, -71.121881, -70.364769, -70.388049, -69.817309, -69.814777, -70.074399, -70.535069, -69.919008, -70.01355, -69.65613, -69.001235, -68.295542, -68.5948, -68.386001, -68.417653, -67.328443, -66.985234, -67.106674, -66.273339, -64.964892, None, 43.582746, 44.97248, 45.179496, 45.560351, 45.359175, 45.891907, 45.610012, 46.034534, 46.483499, 46.50572, 46.143623, 45.735379, 45.739978, 45.298145, 45.001987, 44.79399, 44.400009, 43.656436, 43.752658, 43.582746, None, -59.572095, -59.865849, -60.159656, -62.255393, -64.488125, -65.741666, -65.741666, -66.290031, -64.037688, -61.883246, -61.138976, -60.610119, -59.572095, None, -159.208184, -161.127601, -162.439847, -163.027408, -163.066604, -163.712896, -163.105801, -161.245113, -160.246208, -159.482405, -159.208184, None, -45.154758, -43.920828, -43.48995, -43.372438, -43.333267, -44.880537, -46.506174, -48.386421, -50.482107, -52.851988, -54.164259, -53.987991, -51.853134, -50.991326, -50.364595, -49.914131, -49.306959, -48.660616, -48.660616, -48.151396, -46.662857, -45.154758, None, -121.211511, -119.918851, -118.724143, -119.292119, -120.232217, -121.62283, -122.621735, -122.621735, -122.406245, -121.211511, None, -125.559566, -124.031882, -124.619469, -125.912181, -127.28313, -127.28313, -126.558472, -125.559566, None, -98.98155, -97.884743, -96.787937, -96.20035, -96.983765, -98.198083, -99.432013, -100.783455, -101.801868, -102.330725, -101.703967, -100.430919, -98.98155, None, -68.451346, -68.333834, -68.510128, -68.784297, -69.959471, -71.075889, -72.388134, -71.8985, -73.073622, -74.19004, -74.953895, -75.012625, -73.915819, -73.915819, -73.230331, -72.074717, -71.780962, -71.72218, -71.741791, -71.173815, -70.253252, -69.724447, -69.489422, -69.058518, -68.725541, -68.451346, None, -58.614143, -59.045073, -59.789342, -60.611928, -61.297416, -62.0221, -62.51176, -62.648858, -62.590128, -62.120079, -62.805567, -63.74569, -64.294106, -64.881693, -65.508425, -65.665082, -65.312545, -64.783715, -63.961103, -63.1973, -62.785955, -62.570516, -62.276736, -61.806661, -61.512906, -61.375809, -61.081977, -61.003661, -60.690269, -60.827367, -61.375809, -61.96337, -63.295201, -63.74569, -64.352836, -65.860987, -67.192818, -68.446282, -69.797724, -70.600724, -72.206776, -73.969536, -75.555977, -77.24037, -76.926979, -75.399294, -74.282876, -73.656119, -74.772536, -76.4961, -77.925858, -77.984666, -78.023785, -76.848637, -76.633224, -75.360097, -73.244852, -71.442946, -70.013163, -68.191646, -65.704279, -63.25603, -61.552026, -59.691416, -58.712121, -58.222487, -57.008117, -55.362894, -53.619771, -51.543644, -49.76135, -47.273931, -44.825708, -42.808363, -42.16202, -40.771433, -38.244818, -36.26667, -34.386397, -32.310296, -30.097098, -28.549802, -29.254901, -29.685805, -29.685805, -31.624808, -33.681324, -35.639912, -35.914107, -35.77701, -35.326546, -33.896763, -32.212369, -30.998051, -29.783732, -28.882779, -27.511752, -26.160336, -25.474822, -23.927552, -22.458598, -21.224694, -20.010375, -18.913543, -17.522982, -16.641589, -15.701491, -15.40771, -16.46532, -16.112784, -15.446855, -14.408805, -13.311973, -12.293508, -11.510067, -11.020433, -10.295774, -9.101015, -8.611381, -7.416622, -7.377451, -6.868232, -5.790985, -5.536375, -4.341667, -3.048981, -1.795492, -0.659489, -0.228637, 0.868195, 1.886686, 3.022638, 4.139055, 5.157546, 6.273912, 7.13572, 7.742866, 8.48711, 9.525135, 10.249845, 10.817821, 11.953824, 12.404287, 13.422778, 14.734998, 15.126757, 15.949342, 17.026589, 18.201711, 19.259373, 20.375739, 21.452985, 21.923034, 22.569403, 23.666184, 24.841357, 25.977309, 27.093726, 28.09258, 29.150242, 30.031583, 30.971733, 31.990172, 32.754053, 33.302443, 33.870419, 34.908495, 35.300202, 36.16201, 37.200035, 37.905108, 38.649404, 39.667894, 40.020431, 40.921358, 41.959434, 42.938702, 44.113876, 44.897291, 45.719928, 46.503343, 47.44344, 48.344419, 48.990736, 49.930885, 50.753471, 50.949325, 51.791547, 52.614133, 53.613038, 54.53355, 55.414943, 56.355041, 57.158093, 57.255968, 58.137361, 58.744508, 59.939318, 60.605221, 61.427806, 62.387489, 63.19049, 64.052349, 64.992447, 65.971715, 66.911864, 67.891133, 68.890038, 69.712624, 69.673453, 69.555941, 68.596258, 67.81274, 67.949889, 69.066307, 68.929157, 68.419989, 67.949889, 68.71377, 69.869307, 71.024895, 71.573285, 71.906288, 72.454627, 73.08141, 73.33602, 73.864877, 74.491557, 75.62756, 76.626465, 77.644904, 78.134539, 78.428371, 79.113859, 80.093127, 80.93535, 81.483792, 82.051767, 82.776426, 83.775331, 84.676206, 85.655527, 86.752359, 87.477017, 87.986289, 88.358411, 88.828408, 89.67063, 90.630365, 91.5901, 92.608539, 93.548637, 94.17542, 95.017591, 95.781472, 96.682399, 97.759646, 98.68021, 99.718182, 100.384188, 100.893356, 101.578896, 102.832411, 103.478676, 104.242557, 104.90846, 106.181561, 107.160881, 108.081393, 109.15864, 110.235835, 111.058472, 111.74396, 112.860378, 113.604673, 114.388088, 114.897308, 115.602381, 116.699161, 117.384701, 118.57946, 119.832924, 120.871, 121.654415, 122.320369, 123.221296, 124.122274, 125.160247, 126.100396, 127.001427, 127.882768, 128.80328, 129.704259, 130.781454, 131.799945, 132.935896, 133.85646, 134.757387, 135.031582, 135.070753, 135.697485, 135.873805, 136.206705, 136.618049, 137.460271, 138.596223, 139.908442, 140.809421, 142.121692, 143.061842, 144.374061, 145.490427, 146.195552, 145.999699, 146.646067, 147.723263, 148.839629, 150.132314, 151.483705, 152.502247, 153.638199, 154.284567, 155.165857, 155.92979, 156.811132, 158.025528, 159.181013, 159.670699, 160.80665, 161.570479, 162.686897, 163.842434, 164.919681, 166.11444, 167.309095, 168.425616, 169.463589, 170.501665, 171.20679, 171.089227, 170.560422, 170.109958, 169.75737, 169.287321, 167.975101, 167.387489, 166.094803, 165.644391, 164.958851, 164.234193, 163.822797, 163.568239, 163.47026, 163.489897, 164.057873, 164.273363, 164.743464, 166.604126, 166.995781, 165.193876, 163.666217, 161.766385, 160.924162, 160.747894, 160.316964, 159.788211, 161.120016, 161.629287, 162.490992, 163.705336, 165.095949, 166.604126, 168.895665, 169.404782, 172.283934, 172.477049, 173.224083, 175.985672, 178.277212, 180, -179.942499, -179.058677, -177.256772, -177.140807, -176.084673, -175.947235, -175.829882, -174.382503, -173.116559, -172.889106, -169.951223, -168.999989, -168.530199, -167.022099, -164.182144, -161.929775, -158.07138, -155.192253, -150.942099, -148.533073, -145.888918, -143.107718, -142.892279, -146.829068, -150.060732, -150.902928, -153.586201, -153.409907, -153.037759, -152.665637, -152.861517, -154.526299, -155.29018, -156.83745, -154.408787, -152.097662, -150.648293, -148.865998, -147.22075, -146.417749, -146.770286, -148.062947, -149.531901, -151.588416, -153.390322, -155.329376, -155.975668, -157.268302, -158.051768, -158.365134, -157.875474, -156.974573, -155.329376, -153.742832, -152.920247, -151.33378, -150.00195, -148.748486, -147.612483, -146.104409, -146.143528, -146.496091, -146.20231, -144.909624, -144.322037, -142.794353, -141.638764, -140.209007, -138.85759, -137.5062, -136.428901, -135.214583, -134.431194, -133.745654, -132.257168, -130.925311, -129.554284, -128.242038, -126.890622, -125.402082, -124.011496, -122.562152, -121.073613, -119.70256, -118.684145, -117.469801, -116.216312, -115.021552, -113.944331, -113.297988, -112.945452, -112.299083, -111.261059, -110.066325, -108.714909, -107.559346, -106.149148, -104.876074, -103.367949, -102.016507, -100.645531, -100.1167, -100.763043, -101.252703, -102.545337, -103.113313, -103.328752, -103.681289, -102.917485, -101.60524, -100.312528, -99.13738, -98.118889, -97.688037, -96.336595, -95.043961, -93.672907, -92.439003, -91.420564, -90.088733, -89.226951, -88.423951, -87.268337, -86.014822, -85.192236, -83.879991, -82.665646, -81.470913, -80.687447, -80.295791, -79.296886, -77.925858, -76.907367, -76.221879, -74.890049, -73.852024, -72.833533, -71.619215, -70.209042, -68.935916, -67.956622, -67.369061, -67.134036, -67.251548, -67.56494, -67.917477, -68.230843, -68.485452, -68.544209, -68.446282, -67.976233, -67.5845, -67.427843, -67.62367, -67.741183, -67.251548, -66.703184, -66.056815, -65.371327, -64.568276, -64.176542, -63.628152, -63.001394, -62.041686, -61.414928, -60.709855, -59.887269, -59.162585, -58.594557, -57.811143, -57.223582, -57.59573, -58.614143, None, 68.935, 69.58, 70.525, 70.56, 70.28, 68.745, 68.72, 68.8675, 68.935, None, 145.397978, 146.364121, 146.908584, 147.689259, 148.289068, 148.359865, 148.017301, 147.914052, 147.564564, 146.870343, 146.663327, 146.048378, 145.43193, 145.29509, 144.718071, 144.743755, 145.397978, None, 143.561811, 143.922099, 144.563714, 144.894908, 145.374724, 145.271991, 145.48526, 145.637033, 145.888904, 146.160309, 146.063674, 146.387478, 147.471082, 148.177602, 148.848414, 148.717465, 149.28942, 149.678337, 150.077382, 150.482939, 150.727265, 150.899554, 151.609175, 152.07354, 152.855197, 153.136162, 153.161949, 153.092909, 153.569469, 153.512108, 153.339095, 153.069241, 153.089602, 152.891578, 152.450002, 151.709117, 151.343972, 151.010555, 150.714139, 150.32822, 150.075212, 149.946124, 149.997284, 149.423882, 148.304622, 147.381733, 146.922123, 146.317922, 145.489652, 144.876976, 145.032212, 144.485682, 143.609974, 142.745427, 142.17833, 141.606582, 140.638579, 139.992158, 139.806588, 139.574148, 139.082808, 138.120748, 138.449462, 138.207564, 137.71917, 136.829406, 137.352371, 137.503886, 137.890116, 137.810328, 136.996837, 136.372069, 135.989043, 135.208213, 135.239218, 134.613417, 134.085904, 134.273903, 132.990777, 132.288081, 131.326331, 129.535794, 128.240938, 127.102867, 126.148714, 125.088623, 124.221648, 124.028947, 123.659667, 122.811036, 122.183064, 121.299191, 120.580268, 119.893695, 119.298899, 119.007341, 118.505718, 118.024972, 117.295507, 116.625109, 115.564347, 115.026809, 115.048616, 115.545123, 115.714674, 115.679379, 115.801645, 115.689611, 115.160909, 114.997043, 115.040038, 114.641974, 114.616498, 114.173579, 114.048884, 113.477498, 113.338953, 113.778358, 113.440962, 113.936901, 114.232852, 114.216161, 113.721255, 113.625344, 113.393523, 113.502044, 113.706993, 113.843418, 113.736552, 114.149756, 114.225307, 114.647762, 115.460167, 115.947373, 116.711615, 117.166316, 117.441545, 118.229559, 118.836085, 118.987807, 119.252494, 119.805225, 120.85622, 121.399856, 121.655138, 122.241665, 122.286624, 122.312772, 123.012574, 123.433789, 123.859345, 123.503242, 123.817073, 124.258287, 124.379726, 124.926153, 125.167275, 125.670087, 125.685796, 126.125149, 126.142823, 126.582589, 127.065867, 127.804633, 128.35969, 128.985543, 129.621473, 129.4096, 129.888641, 130.339466, 130.183506, 130.617795, 131.223495, 131.735091, 132.575298, 132.557212, 131.824698, 132.357224, 133.019561, 133.550846, 134.393068, 134.678632, 135.298491, 135.882693, 136.258381, 136.492475, 136.95162, 136.685125, 136.305407, 135.961758, 136.077617, 135.783836, 135.428664, 135.500184, 136.295175, 137.06536, 137.580471, 138.303217, 138.585164, 139.108543, 139.260575, 140.215245, 140.875463, 141.07111, 141.274095, 141.398222, 141.702183, 141.56338, 141.63552, 141.519869, 141.65092, 141.842691, 141.68699, 141.928629, 142.118488, 142.143706, 142.51526, 142.79731, 142.866763, 143.115947, 143.158632, 143.522124, 143.597158, 143.561811, None, 16.979667, 16.903754, 16.340584, 16.534268, 16.202298, 16.011664, 15.137092, 14.632472, 13.806475, 12.376485, 12.153088, 11.164828, 11.048556, 10.442701, 9.932448, 9.47997, 9.632932, 9.594226, 9.896068, 10.402084, 10.544504, 11.426414, 12.141357, 12.62076, 12.932627, 13.025851, 12.884103, 13.243357, 13.595946, 14.338898, 14.901447, 15.253416, 16.029647, 16.499283, 16.960288, 16.879983, 16.979667, None, 45.001987, 45.298145, 45.739978, 45.735379, 46.143623, 45.457722, 44.952688, 44.79399, 45.001987, None, 47.373315, 47.815666, 47.987283, 48.584353, 49.110264, 49.618915, 50.08483, 50.392821, 49.569202, 49.395259, 49.223228, 48.856532, 48.883249, 48.634375, 48.010744, 48.355529, 48.060095, 47.685079, 46.50572, 46.483499, 46.034534, 45.610012, 45.891907, 45.359175, 45.560351, 45.179496, 44.97248, 45.217426, 45.962601, 46.501637, 46.637908, 46.145432, 46.404951, 46.686071, 47.373315, None, 29.339998, 29.276384, 29.024926, 29.632176, 29.938359, 30.469696, 30.527677, 30.743013, 30.752263, 30.50556, 30.116333, 29.753512, 29.339998, None, 3.314971, 4.047071, 4.973991, 5.606976, 6.156658, 6.043073, 5.782417, 5.674052, 4.799222, 4.286023, 3.588184, 3.123252, 2.658422, 2.513573, 3.314971, None, 2.691702, 1.865241, 1.618951, 1.664478, 1.463043, 1.425061, 1.077795, 0.772336, 0.899563, 1.24347, 1.447178, 1.935986, 2.154474, 2.490164, 2.848643, 3.61118, 3.572216, 3.797112, 3.60007, 3.705438, 3.220352, 2.912308, 2.723793, 2.749063, 2.691702, None, -2.827496, -3.511899, -3.980449, -4.330247, -4.779884, -4.954653, -5.404342, -5.470565, -5.197843, -5.220942, -4.427166, -4.280405, -4.006391, -3.522803, -3.103707, -2.967694, -2.191825, -2.001035, -1.066363, -0.515854, -0.266257, 0.374892, 0.295646, 0.429928, 0.993046, 1.024103, 2.177108, 2.154474, 1.935986, 1.447178, 1.24347, 0.899563, 0.023803, -0.438702, -0.761576, -1.203358, -2.940409, -2.963896, -2.827496, None, 92.672721, 92.652257, 92.303234, 92.368554, 92.082886, 92.025215, 91.834891, 91.417087, 90.496006, 90.586957, 90.272971, 89.847467, 89.70205, 89.418863, 89.031961, 88.876312, 88.52977, 88.69994, 88.084422, 88.306373, 88.931554, 88.209789, 88.563049, 89.355094, 89.832481, 89.920693, 90.872211, 91.799596, 92.376202, 91.915093, 91.46773, 91.158963, 91.706475, 91.869928, 92.146035, 92.672721, None, 22.65715, 22.944832, 23.332302, 24.100679, 25.569272, 26.065159, 27.2424, 27.970107, 28.558081, 28.039095, 27.673898, 27.99672, 27.135739, 26.117042, 26.106138, 25.197201, 24.492645, 23.692074, 22.952377, 22.881374, 22.380526, 22.545012, 22.436595, 22.604801, 22.986019, 22.500157, 22.410446, 22.65715, None, -77.53466, -77.78, -78.03405, -78.40848, -78.19087, -77.89, -77.54, -77.53466, None, -77.82, -78.91, -78.98, -78.51, -77.85, -77.82, None, -77, -77.17255, -77.35641, -77.34, -77.78802, -77.79, -77, None, 19.005486, 19.36803, 19.11761, 19.59976, 19.454, 19.21852, 19.03165, 18.70648, 18.56, 17.674922, 17.297373, 16.916156, 16.456443, 16.23966, 15.750026, 15.959367, 16.318157, 16.534939, 17.002146, 17.861783, 18.553214, 19.005486, None, 23.484128, 24.450684, 25.536354, 25.768433, 26.588279, 26.494331, 27.10246, 28.176709, 29.229513, 29.371572, 29.896294, 30.873909, 30.971836, 30.757534, 31.384472, 31.791424, 31.731273, 32.405599, 32.693643, 32.304519, 31.497644, 31.305201, 31.540018, 31.785998, 30.927549, 30.619454, 30.555117, 30.157364, 29.254938, 28.992835, 28.617613, 28.241615, 27.454066, 26.337959, 25.327788, 24.553106, 24.005078, 23.527071, 23.508002, 23.199494, 23.799199, 23.804935, 23.527536, 23.484128, None, -89.14308, -89.150909, -89.029857, -88.848344, -88.490123, -88.300031, -88.296336, -88.106813, -88.123479, -88.285355, -88.197867, -88.302641, -88.239518, -88.355428, -88.551825, -88.732434, -88.930613, -89.229122, -89.150806, -89.14308, None, -64.7799734332998, -64.7873319183061, -64.7946942710173, -64.8094297981283, -64.8167896352437, -64.8101968029642, -64.7962291465484, -64.7815086336978, -64.7997025513437, -64.8066707691087, -64.8225587873683, -64.8287548840306, -64.8306732143498, -64.8399924854972, -64.8566090462354, -64.8682296789446, -64.8628241459563, -64.8748651338951, -64.8717752856644, -64.8671422127295, -64.8559068764437, -64.8597429072279, -64.8439233486717, -64.8350242329311, -64.8338690593672, -64.8520298651164, -64.8635922932573, -64.8686668994079, -64.8721354593415, -64.8779667328485, -64.8780046844321, -64.8849776658292, -64.8783230004629, -64.863194968877, -64.8519819555722, -64.842311980074, -64.8388242605209, -64.8334002575532, -64.8256389530584, -64.8205697556026, -64.8105087275579, -64.7900177727338, -64.7745415970416, -64.7644742436426, -64.7551803442276, -64.7423982971436, -64.7206991797682, -64.7117851247134, -64.6962778813133, -64.6768921127452, -64.6567136927777, -64.6532168823499, -64.6605720384429, -64.65125819471, -64.6462011670816, -64.6613227512832, -64.6690666074397, -64.6834270548595, -64.6954617672714, -64.70438689565, -64.7117569982798, -64.7061764744404, -64.700531552697, -64.6940348033967, -64.6895164826082, -64.6864150099255, -64.6824635995504, -64.6835876652835, -64.6801998697415, -64.6672170444687, -64.6598811264978, -64.6737331235384, -64.6887090648183, -64.706732854446, -64.7149301576112, -64.7185967666669, -64.7214189847314, -64.7270616067222, -64.734962460882, -64.7383521549094, -64.7411729976333, -64.7423019216485, -64.7462482354281, -64.7566773739613, -64.768738200563, -64.7799734332998, None, -62.846468, -63.986838, -64.377021, -64.964892, -66.273339, -67.106674, -67.82818, -68.219913, -68.757167, -68.442225, -68.966818, -69.100247, -69.590424, -68.959635, -69.389764, -69.160347, -69.339535, -68.948887, -68.929224, -68.88008, -68.66508, -69.529678, -68.786158, -68.271254, -68.048192, -67.173801, -66.646908, -65.338435, -65.444837, -65.321899, -65.402281, -64.316353, -63.196499, -62.80306, -62.127081, -61.713204, -61.084121, -60.503304, -60.459198, -60.264326, -60.251149, -60.542966, -60.15839, -58.24122, -58.388058, -58.280804, -57.734558, -57.498371, -57.676009, -57.949997, -57.853802, -58.166392, -58.183471, -59.115042, -60.043565, -61.786326, -62.265961, -62.291179, -62.685057, -62.846468, None, -57.625133, -56.2909, -55.162286, -54.490725, -53.648735, -53.628349, -54.13005, -54.625291, -54.428946, -54.293476, -54.29296, -54.652834, -55.027902, -55.400747, -55.517639, -55.610683, -55.797958, -56.473317, -56.88151, -57.937156, -57.870674, -58.166392, -57.853802, -57.949997, -57.676009, -57.498371, -57.734558, -58.280804, -58.388058, -58.24122, -60.15839, -60.542966, -60.251149, -60.264326, -60.459198, -60.503304, -61.084121, -61.713204, -62.127081, -62.80306, -63.196499, -64.316353, -65.402281, -65.321899, -65.444837, -65.338435, -66.646908, -67.173801, -68.048192, -68.271254, -68.786158, -69.529678, -70.093752, -70.548686, -70.481894, -71.302412, -72.184891, -72.563033, -73.226713, -73.015383, -73.571059, -73.987235, -73.723401, -73.724487, -73.120027, -73.219711, -72.964507, -72.891928, -71.748406, -70.928843, -70.794769, -69.893635, -69.444102, -69.420486, -69.577065, -70.020656, -70.015566, -69.452396, -69.252434, -69.218638, -69.804597, -69.816973, -67.868565, -67.53781, -67.259998, -67.065048, -66.876326, -66.325765, -65.548267, -65.354713, -64.611012, -64.199306, -64.083085, -63.368788, -63.422867, -64.269999, -64.408828, -64.368494, -64.816064, -64.628659, -63.888343, -63.093198, -62.804533, -62.08543, -60.966893, -60.601179, -60.733574, -60.213683, -59.980959, -60.111002, -59.767406, -59.53804, -59.815413, -59.974525, -59.718546, -59.646044, -59.030862, -58.540013, -58.429477, -58.11345, -57.660971, -57.335823, -56.782704, -56.539386, -55.995698, -55.9056, -56.073342, -55.973322, -55.569755, -55.097587, -54.524754, -54.088063, -53.778521, -53.554839, -53.418465, -52.939657, -52.556425, -52.249338, -51.657797, -51.317146, -51.069771, -50.508875, -49.974076, -49.947101, -50.699251, -50.388211, -48.620567, -48.584497, -47.824956, -46.566584, -44.905703, -44.417619, -44.581589, -43.418791, -41.472657, -39.978665, -38.500383, -37.223252, -36.452937, -35.597796, -35.235389, -34.89603, -34.729993, -35.128212, -35.636967, -37.046519, -37.683612, -38.423877, -38.673887, -38.953276, -38.882298, -39.161092, -39.267339, -39.583521, -39.760823, -40.774741, -40.944756, -41.754164, -41.988284, -43.074704, -44.647812, -45.352136, -46.472093, -47.648972, -48.495458, -48.641005, -48.474736, -48.66152, -48.888457, -49.587329, -50.696874, -51.576226, -52.256081, -52.7121, -53.373662, -53.650544, -53.209589, -53.787952, -54.572452, -55.60151, -55.973245, -56.976026, -57.625133, None, 114.204017, 114.599961, 115.45071, 115.4057, 115.347461, 114.869557, 114.659596, 114.204017, None, 91.696657, 92.103712, 92.033484, 91.217513, 90.373275, 89.744528, 88.835643, 88.814248, 89.47581, 90.015829, 90.730514, 91.258854, 91.696657, None, 25.649163, 25.850391, 26.164791, 27.296505, 27.724747, 27.727228, 28.02137, 28.794656, 29.432188, 28.017236, 27.11941, 26.786407, 26.485753, 25.941652, 25.765849, 25.664666, 25.025171, 24.211267, 23.73357, 23.312097, 22.824271, 22.579532, 22.105969, 21.605896, 20.889609, 20.66647, 20.758609, 20.165726, 19.895768, 19.895458, 20.881134, 20.910641, 21.65504, 23.196858, 23.579006, 24.217365, 24.520705, 25.084443, 25.264226, 25.649163, None, 15.27946, 16.106232, 16.290562, 16.456185, 16.705988, 17.96493, 18.389555, 18.911022, 18.81201, 19.094008, 20.059685, 21.000868, 21.723822, 22.231129, 22.864165, 22.977544, 23.554304, 23.55725, 23.394779, 23.459013, 23.805813, 24.567369, 25.114932, 25.124131, 25.796648, 26.213418, 26.465909, 27.213409, 27.374226, 27.044065, 26.402761, 25.650455, 25.278798, 25.128833, 24.805029, 24.410531, 23.297214, 22.84148, 22.704124, 22.405124, 21.659123, 20.927591, 20.290679, 19.467784, 18.932312, 18.542982, 18.453065, 17.8099, 17.133042, 16.537058, 16.012852, 15.907381, 15.862732, 15.405396, 15.03622, 14.950953, 14.478372, 14.558936, 14.459407, 14.53656, 14.776545, 15.27946, None, -63.6645, -62.9393, -62.01208, -62.50391, -62.87433, -64.1428, -64.39261, -64.01486, -63.6645, None, -61.806305, -62.29318, -63.58926, -64.51912, -64.17322, -62.85829, -61.835585, -61.806305, None, -123.510002, -124.012891, -125.655013, -125.954994, -126.850004, -127.029993, -128.059336, -128.444584, -128.358414, -127.308581, -126.695001, -125.755007, -125.415002, -124.920768, -123.922509, -123.510002, None, -56.134036, -56.795882, -56.143105, -55.471492, -55.822401, -54.935143, -54.473775, -53.476549, -53.786014, -53.086134, -52.958648, -52.648099, -53.069158, -53.521456, -54.178936, -53.961869, -54.240482, -55.400773, -55.997481, -55.291219, -56.250799, -57.325229, -59.266015, -59.419494, -58.796586, -59.231625, -58.391805, -57.35869, -56.73865, -55.870977, -55.406974, -55.600218, -56.134036, None, -132.710008, -131.74999, -132.04948, -131.179043, -131.57783, -132.180428, -132.549992, -133.054611, -133.239664, -133.180004, -132.710008, None, -79.26582, -79.65752, -80.09956, -80.36215, -80.315395, -79.92939, -79.52002, -79.26582, None, -81.89825, -83.06857, -83.77462, -83.99367, -83.25048, -81.87699, -81.89825, None, -85.161308, -84.975764, -84.464012, -83.882626, -82.787577, -81.642014, -81.55344, -80.817361, -80.103451, -80.99102, -82.547178, -83.108798, -84.100417, -85.523405, -85.866769, -87.221983, -86.35276, -86.224886, -85.883848, -85.161308, None, -75.86588, -76.98687, -77.2364, -76.81166, -75.89521, -75.1145, -75.10333, -75.21597, -75.86588, None, -95.647681, -96.269521, -97.617401, -98.431801, -99.797401, -98.917401, -98.218261, -97.157401, -96.557401, -96.257401, -95.647681, None, -90.5471, -90.55151, -89.21515, -88.01966, -88.31749, -87.35017, -86.30607, -85.57664, -85.52197, -84.10081, -82.62258, -81.28043, -81.2202, -81.96436, -81.25928, -81.38653, -83.34456, -84.73542, -85.76943, -86.0676, -87.03143, -87.32324, -88.48296, -89.91444, -90.70398, -90.77004, -91.93342, -93.15698, -94.24153, -94.62931, -94.6846, -93.21502, -92.76462, -92.29703, -90.89769, -89.03953, -88.03978, -87.32421, -86.07121, -85.01181, -83.36055, -82.27285, -82.4362, -82.12502, -81.40075, -79.91289, -79.14301, -78.60191, -79.12421, -79.82958, -78.22874, -77.0956, -76.54137, -76.62319, -77.30226, -78.51688, -77.33676, -77.77272, -78.10687, -77.41067, -75.69621, -74.6682, -73.83988, -72.90853, -71.67708, -71.37369, -69.59042, -69.62033, -69.2879, -68.37455, -67.64976, -66.20178, -65.24517, -64.58352, -63.80475, -62.50236, -61.39655, -61.79866, -60.46853, -59.56962, -57.97508, -57.3332, -56.93689, -56.15811, -55.75632, -55.68338, -56.40916, -57.12691, -58.77482, -60.03309, -61.72366, -63.86251, -65.36331, -66.39905, -67.23631, -68.51114, -69.95362, -71.10458, -70.25522, -68.65, -66.55243, -65.05626, -64.17099, -65.11545, -64.79854, -64.47219, -63.17329, -61.52072, -60.51815, -60.4486, -59.80287, -61.03988, -63.25471, -64.24656, -65.36406, -66.1234, -66.16173, -64.42549, -66.02605, -67.13741, -67.79134, -67.79046, -68.23444, -68.905, -69.237216, -69.99997, -70.305, -70.66, -71.08482, -71.405, -71.50506, -73.34783, -74.867, -75.31821, -76.375, -76.5, -76.820034, -77.737885, -78.72028, -79.171674, -79.01, -78.92, -78.939362, -80.247448, -81.277747, -82.439278, -82.690089, -83.02981, -83.142, -83.12, -82.9, -82.43, -82.137642, -82.337763, -82.550925, -83.592851, -83.469551, -83.616131, -83.890765, -84.091851, -84.14212, -84.3367, -84.6049, -84.543749, -84.779238, -84.87608, -85.652363, -86.461991, -87.439793, -88.378114, -89.272917, -89.6, -90.83, -91.64, -92.61, -93.63087, -94.32914, -94.64, -94.81758, -95.15609, -95.15907, -97.22872, -100.65, -104.04826, -107.05, -110.05, -113, -116.04818, -117.03121, -120, -122.84, -122.97421, -124.91024, -125.62461, -127.43561, -127.99276, -127.85032, -129.12979, -129.30523, -130.51497, -130.53611, -129.98, -130.00778, -131.70781, -132.73042, -133.35556, -134.27111, -134.945, -135.47583, -136.47972, -137.4525, -138.34089, -139.039, -140.013, -140.99778, -140.9925, -140.986, -139.12052, -137.54636, -136.50358, -135.62576, -134.41464, -132.92925, -131.43136, -129.79471, -129.10773, -128.36156, -128.13817, -127.44712, -125.75632, -124.42483, -124.28968, -123.06108, -122.6835, -121.47226, -119.94288, -117.60268, -116.22643, -115.2469, -113.89794, -115.30489, -113.49727, -110.798, -109.94619, -108.8802, -107.79239, -108.81299, -108.16721, -106.95, -106.15, -105.34282, -104.33791, -103.22115, -101.45433, -99.90195, -98.4432, -98.5586, -97.66948, -96.11991, -96.12588, -95.48943, -94.685, -94.23282, -95.30408, -96.47131, -96.39115, -95.2088, -93.88997, -92.87818, -91.51964, -92.40692, -90.5471, None, -114.16717, -114.66634, -112.44102, -111.05039, -109.92035, -109.00654, -108.18835, -107.68599, -108.39639, -107.51645, -106.52259, -105.40246, -104.77484, -104.46476, -102.78537, -100.98078, -101.08929, -102.73116, -102.09329, -102.43024, -104.24, -105.96, -107.12254, -109, -111.534149, -113.3132, -113.85496, -115.22, -116.10794, -117.34, -116.67473, -115.13112, -113.72141, -112.4161, -114.35, -116.48684, -117.9048, -118.43238, -116.11311, -117.65568, -119.40199, -118.56267, -117.86642, -115.18909, -114.16717, None, -104.5, -105.38, -106.94, -106.6, -105.26, -104.5, None, -76.34, -76.251404, -77.314438, -78.39167, -79.486252, -79.775833, -80.876099, -80.833885, -80.353058, -78.064438, -76.34, None, -86.562179, -85.774371, -84.850112, -82.31559, -80.600088, -80.748942, -78.770639, -77.824624, -75.605845, -74.228616, -74.099141, -72.242226, -71.200015, -68.786054, -67.91497, -66.969033, -68.805123, -66.449866, -64.862314, -63.424934, -61.851981, -62.163177, -63.918444, -65.14886, -66.721219, -68.015016, -68.141287, -67.089646, -65.73208, -65.320168, -64.669406, -65.013804, -66.275045, -68.783186, -67.369681, -66.328297, -66.165568, -68.877367, -71.023437, -72.235379, -71.886278, -73.378306, -74.834419, -74.818503, -77.70998, -78.555949, -77.897281, -76.018274, -73.959795, -74.293883, -73.944912, -72.651167, -72.92606, -73.311618, -74.843307, -76.869101, -76.228649, -77.28737, -78.168634, -78.957242, -79.492455, -81.305471, -84.944706, -87.060003, -88.681713, -89.51342, -88.467721, -89.888151, -90.20516, -89.436577, -88.408242, -85.826151, -86.562179, None, -100.35642, -99.16387, -97.38, -97.12, -98.05359, -96.54, -96.72, -98.35966, -99.32286, -100.01482, -102.5, -102.48, -100.43836, -101.54, -100.35642, None, -93.196296, -94.269047, -95.409856, -96.033745, -96.018268, -95.495793, -94.503658, -92.420012, -90.509793, -92.003965, -93.196296, None, -120.46, -123.09219, -123.62, -125.928949, -125.5, -124.80729, -123.94, -124.91775, -121.53788, -120.10978, -117.55564, -116.58442, -115.51081, -116.76794, -119.22, -120.46, -120.46, None, -93.612756, -94.156909, -95.608681, -96.820932, -96.288587, -94.85082, -93.977747, -93.612756, None, -98.5, -97.735585, -97.704415, -98.16, -99.80874, -100.88366, -100.86292, -102.50209, -102.56552, -101.48973, -99.98349, -98.57699, -98.5, None, -108.21141, -107.81943, -106.92893, -105.881, -105.70498, -106.31347, -109.7, -112.22307, -113.74381, -113.87135, -111.79421, -116.31221, -117.7104, -116.34602, -115.40487, -112.59056, -110.81422, -109.0671, -110.49726, -109.5811, -108.54859, -108.21141, None, -94.684086, -93.573921, -91.605023, -90.741846, -90.969661, -89.822238, -89.187083, -87.838276, -86.379192, -84.789625, -82.753445, -81.128531, -80.057511, -79.833933, -80.457771, -81.948843, -83.228894, -86.097452, -88.15035, -89.764722, -92.422441, -92.768285, -92.889906, -93.893824, -95.962457, -97.121379, -96.745123, -94.684086, None, -116.198587, -116.335813, -117.106051, -118.040412, -119.899318, -121.499995, -122.854924, -122.854925, -121.157535, -119.103939, -117.570131, -116.198587, None, -93.840003, -94.295608, -96.169654, -96.436304, -94.422577, -93.720656, -93.840003, None, -110.186938, -112.051191, -113.534279, -112.724587, -111.264443, -109.854452, -110.186938, None, -109.663146, -110.881314, -112.542091, -112.525891, -111.50001, -110.963661, -109.663146, None, -95.830295, -97.309843, -98.124289, -98.552868, -98.631984, -97.337231, -96.754399, -95.559278, -95.830295, None, -100.060192, -99.670939, -101.30394, -102.949809, -105.176133, -104.210429, -105.41958, -105.492289, -103.529282, -100.825158, -100.060192, None, -87.02, -85.81435, -87.18756, -89.03535, -90.80436, -92.87669, -93.95116, -93.93574, -93.14524, -94.974, -96.07614, -96.70972, -96.01644, -95.32345, -94.29843, -94.73542, -92.40984, -91.13289, -89.45, -87.81, -87.02, None, -68.5, -65.82735, -63.68, -61.85, -61.89388, -64.334, -66.75342, -67.65755, -65.48031, -67.84, -69.4697, -71.18, -73.2428, -73.88, -76.90773, -75.52924, -76.22046, -75.39345, -76.34354, -77.88851, -78.36269, -79.75951, -79.61965, -77.91089, -77.88911, -80.56125, -83.17439, -86.11184, -87.6, -89.49068, -89.6161, -87.76739, -88.26, -87.65, -84.97634, -86.34, -87.96192, -87.15198, -85.37868, -85.09495, -86.50734, -86.93179, -84.19844, -83.408696, -81.84823, -84.1, -87.59895, -89.36663, -90.2, -91.36786, -91.58702, -90.1, -88.93227, -86.97024, -85.5, -84.260005, -83.18, -82.42, -81.1, -79.30664, -76.25, -75.71878, -72.83153, -70.665765, -68.5, None, 9.594226, 9.632932, 9.47997, 9.932448, 10.442701, 10.363378, 9.922837, 9.182882, 8.966306, 8.489952, 8.31663, 7.755992, 7.273851, 6.843593, 6.5001, 6.022609, 6.037389, 6.768714, 6.736571, 7.192202, 7.466759, 8.317301, 8.522612, 9.594226, None, -68.63401, -68.63335, -67.56244, -66.95992, -67.29103, -68.14863, -68.639991, -69.2321, -69.95809, -71.00568, -72.2639, -73.2852, -74.66253, -73.8381, -72.43418, -71.10773, -70.59178, -70.26748, -69.34565, -68.63401, None, -68.219913, -67.82818, -67.106674, -66.985234, -67.328443, -68.417653, -68.386001, -68.5948, -68.295542, -69.001235, -69.65613, -70.01355, -69.919008, -70.535069, -70.074399, -69.814777, -69.817309, -70.388049, -70.364769, -71.121881, -71.118625, -70.814664, -71.413517, -71.680761, -71.915734, -71.746804, -72.148898, -71.915424, -71.464056, -71.793623, -71.329801, -71.222779, -71.659316, -71.552009, -71.917258, -72.447355, -72.331161, -72.648247, -73.415436, -73.328051, -72.975747, -72.309974, -72.329404, -71.914804, -69.498362, -68.571545, -69.461284, -69.94278, -70.845102, -71.006332, -71.429795, -72.557943, -73.702757, -73.702757, -74.946763, -75.260026, -74.976632, -75.479754, -75.608015, -75.18277, -74.126581, -75.644395, -74.692154, -74.351709, -73.240356, -72.717804, -73.3889, -73.701336, -74.331943, -74.017957, -73.677099, -73.217593, -73.505559, -73.588061, -73.166717, -72.553137, -71.861732, -71.43845, -71.668721, -71.370083, -71.489894, -70.905124, -70.724954, -70.403966, -70.091246, -70.16442, -70.372572, -69.858444, -69.590424, -69.100247, -68.966818, -68.442225, -68.757167, -68.219913, None, 110.339188, 109.47521, 108.655208, 108.626217, 109.119056, 110.211599, 110.786551, 111.010051, 110.570647, 110.339188, None, 127.657407, 129.397818, 130.582293, 130.987282, 132.506672, 133.373596, 135.026311, 134.500814, 134.112362, 133.769644, 133.097127, 131.883454, 131.025212, 131.288555, 131.144688, 130.633866, 130.640016, 129.994267, 129.596669, 128.052215, 128.208433, 127.343783, 126.869083, 126.182045, 125.079942, 124.265625, 122.86757, 122.131388, 121.054554, 121.585995, 121.376757, 122.168595, 121.640359, 120.768629, 119.639602, 119.023464, 118.042749, 117.532702, 118.059699, 118.87815, 118.911636, 119.702802, 120.823457, 121.711259, 122.357937, 122.519995, 121.104164, 120.637009, 119.664562, 119.151208, 120.227525, 120.620369, 121.229014, 121.908146, 121.891919, 121.264257, 121.503519, 122.092114, 121.938428, 121.684439, 121.125661, 120.395473, 119.585497, 118.656871, 117.281606, 115.890735, 114.763827, 114.152547, 113.80678, 113.241078, 111.843592, 110.785466, 110.444039, 109.889861, 109.627655, 109.864488, 108.522813, 108.05018, 107.04342, 106.567273, 106.725403, 105.811247, 105.329209, 104.476858, 103.504515, 102.706992, 102.170436, 101.652018, 101.80312, 101.270026, 101.180005, 101.150033, 100.416538, 99.983489, 99.240899, 99.531992, 98.898749, 98.660262, 97.60472, 97.724609, 98.671838, 98.712094, 98.68269, 98.246231, 97.911988, 97.327114, 96.248833, 96.586591, 96.117679, 95.404802, 94.56599, 93.413348, 92.503119, 91.696657, 91.258854, 90.730514, 90.015829, 89.47581, 88.814248, 88.730326, 88.120441, 86.954517, 85.82332, 85.011638, 84.23458, 83.898993, 83.337115, 82.327513, 81.525804, 81.111256, 79.721367, 78.738894, 78.458446, 79.176129, 79.208892, 78.811086, 78.912269, 77.837451, 76.192848, 75.896897, 75.158028, 74.980002, 74.829986, 74.864816, 74.257514, 73.928852, 73.675379, 73.960013, 73.822244, 74.776862, 75.467828, 76.526368, 76.904484, 78.187197, 78.543661, 80.11943, 80.25999, 80.18015, 80.866206, 79.966106, 81.947071, 82.458926, 83.180484, 85.16429, 85.720484, 85.768233, 86.598776, 87.35997, 87.751264, 88.013832, 88.854298, 90.280826, 90.970809, 90.585768, 90.94554, 92.133891, 93.480734, 94.688929, 95.306875, 95.762455, 96.349396, 97.451757, 99.515817, 100.845866, 101.83304, 103.312278, 104.522282, 104.964994, 106.129316, 107.744773, 109.243596, 110.412103, 111.129682, 111.829588, 111.667737, 111.348377, 111.873306, 112.436062, 113.463907, 114.460332, 115.985096, 116.717868, 117.421701, 118.874326, 119.66327, 119.772824, 118.866574, 118.064143, 117.295507, 116.308953, 115.742837, 115.485282, 116.191802, 116.678801, 117.879244, 119.288461, 119.279366, 120.18205, 120.738191, 120.725789, 120.177089, 121.003085, 122.245748, 123.571507, 125.068211, 125.946349, 126.564399, 126.939157, 127.287456, 127.657407, None, -2.856125, -3.311084, -4.00882, -4.649917, -5.834496, -6.528769, -7.518941, -7.712159, -7.635368, -7.539715, -7.570153, -7.993693, -8.311348, -8.60288, -8.385452, -8.485446, -8.439298, -8.280703, -8.221792, -8.299049, -8.203499, -7.8321, -8.079114, -8.309616, -8.229337, -8.029944, -7.89959, -7.622759, -6.850507, -6.666461, -6.493965, -6.205223, -6.050452, -5.816926, -5.404342, -4.954653, -4.779884, -4.330247, -3.980449, -3.511899, -2.827496, -2.56219, -2.983585, -3.24437, -2.810701, -2.856125, None, 13.075822, 12.951334, 12.35938, 11.751665, 11.276449, 9.649158, 9.795196, 9.404367, 8.948116, 8.744924, 8.488816, 8.500288, 8.757533, 9.233163, 9.522706, 10.118277, 10.497375, 11.058788, 11.745774, 11.839309, 12.063946, 12.218872, 12.753672, 12.955468, 13.1676, 13.308676, 13.57295, 14.415379, 14.468192, 14.577178, 14.181336, 14.213531, 14.495787, 14.893386, 14.960152, 14.923565, 15.467873, 14.909354, 14.627201, 14.171466, 13.954218, 14.544467, 14.979996, 15.120866, 15.436092, 15.27946, 14.776545, 14.53656, 14.459407, 14.558936, 14.478372, 14.950953, 15.03622, 15.405396, 15.862732, 15.907381, 16.012852, 15.940919, 15.146342, 14.337813, 13.075822, None, 30.83386, 30.773347, 31.174149, 30.85267, 30.468508, 30.086154, 29.875779, 29.819503, 29.587838, 29.579466, 29.291887, 29.254835, 29.117479, 29.024926, 29.276384, 29.339998, 29.519987, 29.419993, 29.620032, 30.199997, 30.740015, 30.346086, 29.002912, 28.734867, 28.449871, 28.673682, 28.49607, 28.372253, 28.642417, 29.341548, 29.616001, 29.699614, 28.934286, 28.523562, 28.155109, 27.388799, 27.16442, 26.553088, 25.75231, 25.418118, 24.78317, 24.314516, 24.257155, 23.912215, 23.456791, 22.837345, 22.402798, 22.155268, 22.208753, 21.875182, 21.801801, 21.949131, 21.746456, 21.728111, 20.514748, 20.601823, 20.091622, 20.037723, 19.417502, 19.166613, 19.016752, 18.464176, 18.134222, 17.47297, 17.089996, 16.860191, 16.57318, 16.326528, 13.375597, 13.024869, 12.735171, 12.322432, 12.182337, 12.436688, 12.468004, 12.631612, 12.995517, 13.25824, 13.600235, 14.144956, 14.209035, 14.582604, 15.170992, 15.75354, 16.00629, 15.972803, 16.407092, 16.865307, 17.523716, 17.638645, 17.663553, 17.82654, 17.774192, 17.898835, 18.094276, 18.393792, 18.453065, 18.542982, 18.932312, 19.467784, 20.290679, 20.927591, 21.659123, 22.405124, 22.704124, 22.84148, 23.297214, 24.410531, 24.805029, 25.128833, 25.278798, 25.650455, 26.402761, 27.044065, 27.374226, 27.979977, 28.428994, 28.696678, 29.159078, 29.715995, 29.9535, 30.83386, None, 12.995517, 12.62076, 12.318608, 11.914963, 11.093773, 11.855122, 11.478039, 11.820964, 12.495703, 12.575284, 13.109619, 13.992407, 14.29921, 14.425456, 14.316418, 13.843321, 14.276266, 14.026669, 13.282631, 13.003114, 13.075822, 14.337813, 15.146342, 15.940919, 16.012852, 16.537058, 17.133042, 17.8099, 18.453065, 18.393792, 18.094276, 17.898835, 17.774192, 17.82654, 17.663553, 17.638645, 17.523716, 16.865307, 16.407092, 15.972803, 16.00629, 15.75354, 15.170992, 14.582604, 14.209035, 14.144956, 13.600235, 13.25824, 12.995517, None, -75.373223, -75.801466, -76.292314, -76.57638, -77.424984, -77.668613, -77.855061, -78.855259, -78.990935, -78.617831, -78.662118, -78.42761, -77.931543, -77.510431, -77.12769, -77.496272, -77.307601, -77.533221, -77.318815, -77.476661, -77.881571, -77.753414, -77.431108, -77.242566, -77.474723, -77.353361, -76.836674, -76.086384, -75.6746, -75.664704, -75.480426, -74.906895, -74.276753, -74.197223, -73.414764, -72.627835, -72.238195, -71.75409, -71.399822, -71.137461, -71.331584, -71.973922, -72.227575, -72.614658, -72.905286, -73.027604, -73.304952, -72.78873, -72.660495, -72.439862, -72.360901, -72.479679, -72.444487, -72.198352, -71.960176, -70.674234, -70.093313, -69.38948, -68.985319, -68.265052, -67.695087, -67.34144, -67.521532, -67.744697, -67.823012, -67.621836, -67.337564, -67.303173, -67.809938, -67.447092, -67.181294, -66.876326, -67.065048, -67.259998, -67.53781, -67.868565, -69.816973, -69.804597, -69.218638, -69.252434, -69.452396, -70.015566, -70.020656, -69.577065, -69.420486, -69.444102, -69.893635, -70.394044, -70.692682, -70.047709, -70.813476, -71.413646, -71.774761, -72.325787, -73.070392, -73.659504, -74.122395, -74.441601, -75.106625, -75.373223, None, -82.965783, -83.508437, -83.711474, -83.596313, -83.632642, -83.909886, -84.303402, -84.647644, -84.713351, -84.97566, -84.911375, -85.110923, -85.339488, -85.660787, -85.797445, -85.791709, -85.659314, -85.941725, -85.71254, -85.561852, -84.903003, -84.673069, -84.355931, -84.190179, -83.895054, -83.655612, -83.40232, -83.015677, -82.546196, -82.932891, -82.927155, -82.719183, -82.868657, -82.829771, -82.913176, -82.965783, None, -82.268151, -81.404457, -80.618769, -79.679524, -79.281486, -78.347434, -77.993296, -77.146422, -76.523825, -76.19462, -75.598222, -75.67106, -74.933896, -74.178025, -74.296648, -74.961595, -75.63468, -76.323656, -77.755481, -77.085108, -77.492655, -78.137292, -78.482827, -78.719867, -79.285, -80.217475, -80.517535, -81.820943, -82.169992, -81.795002, -82.775898, -83.494459, -83.9088, -84.052151, -84.54703, -84.974911, -84.447062, -84.230357, -83.77824, -83.267548, -82.510436, -82.268151, None, 32.73178, 32.802474, 32.946961, 33.667227, 34.576474, 33.900804, 33.973617, 33.86644, 33.675392, 33.525685, 33.475817, 33.455922, 33.383833, 33.190977, 32.919572, 32.73178, None, 33.973617, 34.004881, 32.979827, 32.490296, 32.256667, 32.73178, 32.919572, 33.190977, 33.383833, 33.455922, 33.475817, 33.525685, 33.675392, 33.86644, 33.973617, None, 16.960288, 16.499283, 16.029647, 15.253416, 14.901447, 14.338898, 13.595946, 13.031329, 12.521024, 12.415191, 12.240111, 12.966837, 13.338132, 14.056228, 14.307013, 14.570718, 15.016996, 15.490972, 16.238627, 16.176253, 16.719476, 16.868769, 17.554567, 17.649445, 18.392914, 18.853144, 18.554971, 18.399994, 18.170498, 18.104973, 17.913512, 17.886485, 17.545007, 17.101985, 16.960288, None, 9.921906, 9.93958, 10.950112, 10.939467, 11.956252, 12.51844, 13.647467, 14.119686, 14.353315, 14.074521, 14.4376, 14.685026, 14.607098, 15.016996, 14.570718, 14.307013, 14.056228, 13.338132, 12.966837, 12.240111, 12.415191, 12.521024, 13.031329, 13.595946, 13.243357, 12.884103, 13.025851, 12.932627, 12.62076, 12.141357, 11.426414, 10.544504, 10.402084, 9.896068, 9.594226, 8.522612, 8.317301, 7.466759, 7.593676, 8.099279, 6.65823, 6.18632, 6.242751, 6.043073, 6.156658, 5.988658, 6.589397, 6.84287, 7.092053, 6.90514, 7.100425, 7.936239, 8.121706, 8.800734, 8.572118, 8.526229, 9.282049, 9.921906, None, 43.081226, 43.317852, 43.286381, 42.715874, 43.145305, 42.776852, 42.55493, 42.31414, 41.75557, 41.73959, 41.66176, 42, 42.35156, 42.779642, 43.081226, None, 12.690006, 12.089991, 11.043543, 10.903914, 12.370904, 12.690006, None, 10.912182, 10.667804, 10.369993, 9.649985, 9.921906, 9.282049, 8.526229, 8.120311, 8.089977, 8.256582, 8.543438, 9.424469, 9.775559, 10.580006, 10.546106, 10.25, 10.369993, 10.912182, None, -71.712361, -71.587304, -70.806706, -70.214365, -69.950815, -69.76925, -69.222126, -69.254346, -68.809412, -68.317943, -68.689316, -69.164946, -69.623988, -69.952934, -70.133233, -70.517137, -70.669298, -70.99995, -71.40021, -71.657662, -71.708305, -71.687738, -71.945112, -71.701303, -71.624873, -71.712361, None, 11.999506, 8.572893, 5.677566, 4.267419, 3.158133, 3.146661, 2.683588, 2.060991, 1.823228, -1.550055, -4.923337, -8.6844, -8.665124, -8.66559, -8.674116, -7.059228, -6.060632, -5.242129, -4.859646, -3.690441, -3.647498, -3.06898, -2.616605, -1.307899, -1.124551, -1.388049, -1.733455, -1.792986, -2.169914, -1.208603, -0.127454, 0.503877, 1.466919, 3.161699, 4.815758, 5.32012, 6.26182, 7.330385, 7.737078, 8.420964, 8.217824, 8.376368, 8.140981, 7.524482, 7.612642, 8.430473, 8.439103, 9.055603, 9.48214, 9.805634, 9.859998, 9.683885, 9.756128, 9.629056, 9.716286, 9.319411, 9.910693, 9.948261, 10.303847, 10.771364, 11.560669, 11.999506, None, -80.302561, -79.770293, -79.986559, -80.368784, -80.967765, -80.764806, -80.933659, -80.58337, -80.399325, -80.020898, -80.09061, -79.542762, -78.855259, -77.855061, -77.668613, -77.424984, -76.57638, -76.292314, -75.801466, -75.373223, -75.233723, -75.544996, -76.635394, -77.837905, -78.450684, -78.639897, -79.205289, -79.624979, -80.028908, -80.442242, -80.469295, -80.184015, -80.302561, None, 34.9226, 34.64174, 34.42655, 34.15451, 33.92136, 33.58811, 33.13676, 32.42323, 32.32046, 32.73482, 33.34876, 34.10455, 34.47387, 34.79507, 35.69241, 35.49372, 35.52598, 36.69069, 36.86623, 32.9, 29.02, 25, 25, 25, 24.70007, 24.95762, 24.80287, 25.16482, 26.49533, 27.45762, 28.45048, 28.91353, 29.68342, 30.09503, 30.97693, 31.68796, 31.96041, 32.19247, 32.99392, 33.7734, 34.26544, 34.9226, None, 42.35156, 42.00975, 41.59856, 41.155194, 40.8966, 40.026219, 39.34061, 39.0994, 38.51295, 37.90607, 37.59377, 36.42951, 36.323189, 36.75386, 36.85253, 37.16747, 37.904, 38.41009, 38.990623, 39.26611, 39.814294, 41.179275, 41.734952, 42.276831, 42.589576, 43.081226, 42.779642, 42.35156, None, -9.034818, -8.984433, -9.392884, -7.97819, -6.754492, -5.411886, -4.347843, -3.517532, -1.901351, -1.502771, 0.338047, 0.701591, 1.826793, 2.985999, 3.039484, 2.091842, 0.810525, 0.721331, 0.106692, -0.278711, 0.111291, -0.467124, -0.683389, -1.438382, -2.146453, -3.415781, -4.368901, -4.995219, -5.37716, -5.866432, -6.236694, -6.520191, -7.453726, -7.537105, -7.166508, -7.029281, -7.374092, -7.098037, -7.498632, -7.066592, -7.026413, -6.86402, -6.851127, -6.389088, -6.668606, -7.251309, -7.422513, -8.013175, -8.263857, -8.671946, -9.034818, None, 24.312863, 24.428928, 24.061198, 23.42656, 23.339795, 24.604214, 25.864189, 26.949136, 27.981114, 28.131699, 27.420166, 27.716686, 27.288185, 26.463532, 25.60281, 25.164594, 24.312863, None, 37.90607, 38.51295, 39.0994, 39.34061, 40.02625, 40.8966, 41.1552, 41.59856, 42.00975, 42.35156, 42, 41.66176, 41.73959, 41.75557, 42.31414, 42.55493, 42.776852, 42.55876, 42.92812, 43.29699, 43.67875, 46.94834, 47.78942, 44.9636, 43.66087, 42.76967, 42.12861, 41.855083, 41.1718, 40.76848, 39.85494, 39.559384, 38.89251, 38.67114, 38.43697, 38.120915, 36.855093, 36.159079, 35.817448, 35.817448, 35.298007, 34.70702, 34.25032, 34.0751, 33.56829, 32.95418, 33.2948, 33.8255, 33.97498, 33.96162, 34.25745, 34.73115, 34.83163, 35.26049, 35.86363, 36.27022, 36.42951, 37.59377, 37.90607, None, 28.59193, 28.445944, 29.977426, 29.054589, 30.21765, 29.54443, 30.444685, 30.035872, 31.516092, 31.139991, 30.211107, 28.069998, 26.255173, 24.496624, 22.869695, 22.290764, 21.322244, 21.544866, 21.059211, 21.536029, 22.442744, 24.730512, 25.398068, 25.294043, 23.903379, 23.56588, 23.539473, 21.978535, 20.645593, 21.244936, 22.356238, 23.66205, 24.735679, 25.689213, 26.179622, 27.732292, 29.015573, 28.59193, None, 178.3736, 178.71806, 178.55271, 177.93266, 177.38146, 177.28504, 177.67087, 178.12557, 178.3736, None, 179.364143, 178.725059, 178.596839, 179.096609, 179.413509, 180, 180, 179.364143, None, -179.917369, -180, -180, -179.79332, -179.917369, None, -61.2, -60, -59.15, -58.55, -57.75, -58.05, -59.4, -59.85, -60.7, -61.2, None, 9.560016, 9.229752, 8.775723, 8.544213, 8.746009, 9.390001, 9.560016, None, 3.588184, 4.286023, 4.799222, 5.674052, 5.897759, 6.18632, 6.65823, 8.099279, 7.593676, 7.466759, 7.192202, 6.736571, 6.768714, 6.037389, 6.022609, 6.5001, 6.843593, 6.802355, 7.096652, 6.749955, 7.007562, 7.549596, 7.435185, 6.529245, 4.556963, 3.100411, 2.985999, 1.826793, 0.701591, 0.338047, -1.502771, -1.901351, -1.384225, -1.193798, -2.225724, -2.963276, -4.491555, -4.59235, -3.295814, -1.616511, -1.933494, -0.989469, 1.338761, 1.639001, 2.513573, 2.658422, 3.123252, 3.588184, None, 11.093773, 10.066135, 9.405245, 8.797996, 8.830087, 9.04842, 9.291351, 9.492889, 9.830284, 11.285079, 11.276449, 11.751665, 12.35938, 12.951334, 13.075822, 13.003114, 13.282631, 14.026669, 14.276266, 13.843321, 14.316418, 14.425456, 14.29921, 13.992407, 13.109619, 12.575284, 12.495703, 11.820964, 11.478039, 11.855122, 11.093773, None, -5.661949, -6.197885, -6.95373, -7.572168, -7.366031, -7.572168, -6.733847, -5.661949, None, -3.005005, -4.073828, -3.055002, -1.959281, -2.219988, -3.119003, -2.085009, -2.005676, -1.114991, -0.430485, 0.184981, 0.469977, 1.681531, 1.559988, 1.050562, 1.449865, 0.550334, -0.787517, -2.489998, -2.956274, -3.617448, -4.542508, -5.245023, -5.776567, -4.30999, -3.414851, -3.422719, -4.984367, -5.267296, -4.222347, -4.770013, -4.579999, -3.093831, -3.09208, -2.945009, -3.614701, -3.630005, -4.844169, -5.082527, -4.719112, -5.047981, -5.586398, -5.644999, -6.149981, -5.786825, -5.009999, -4.211495, -3.005005, None, 41.554084, 41.703171, 41.45347, 40.875469, 40.321394, 39.955009, 40.076965, 40.922185, 42.394395, 43.756017, 43.9312, 44.537623, 45.470279, 45.77641, 46.404951, 46.145432, 46.637908, 46.501637, 45.962601, 45.217426, 44.97248, 43.582746, 42.619549, 41.554084, None, 1.060122, -0.507638, -1.063625, -1.964707, -2.856125, -2.810701, -3.24437, -2.983585, -2.56219, -2.827496, -2.963896, -2.940409, -1.203358, -0.761576, -0.438702, 0.023803, -0.049785, 0.36758, 0.365901, 0.461192, 0.712029, 0.490957, 0.570384, 0.836931, 1.060122, None, -8.439298, -8.722124, -8.926065, -9.208786, -9.403348, -9.33728, -9.755342, -10.016567, -10.230094, -10.505477, -10.494315, -10.65477, -10.622395, -10.839152, -11.117481, -11.917277, -12.150338, -12.425929, -12.596719, -12.711958, -13.24655, -13.685154, -14.074045, -14.330076, -14.579699, -14.693232, -14.839554, -15.130311, -14.685687, -14.382192, -14.121406, -13.9008, -13.743161, -13.828272, -13.718744, -13.700476, -13.217818, -12.499051, -12.278599, -12.203565, -11.658301, -11.513943, -11.456169, -11.297574, -11.036556, -10.87083, -10.593224, -10.165214, -9.890993, -9.567912, -9.327616, -9.127474, -8.905265, -8.786099, -8.376305, -8.581305, -8.620321, -8.407311, -8.282357, -8.335377, -8.029944, -8.229337, -8.309616, -8.079114, -7.8321, -8.203499, -8.299049, -8.221792, -8.280703, -8.439298, None, -16.841525, -16.713729, -15.624596, -15.39877, -15.081735, -14.687031, -14.376714, -14.046992, -13.844963, -14.277702, -14.712197, -15.141163, -15.511813, -15.691001, -15.931296, -16.841525, None, -15.130311, -15.66418, -16.085214, -16.314787, -16.308947, -16.613838, -16.677452, -16.147717, -15.816574, -15.548477, -13.700476, -13.718744, -13.828272, -13.743161, -13.9008, -14.121406, -14.382192, -14.685687, -15.130311, None, 9.492889, 9.305613, 9.649158, 11.276449, 11.285079, 9.830284, 9.492889, None, 23.69998, 24.246665, 25.025015, 25.769208, 25.745023, 26.290003, 26.164998, 24.724982, 24.735007, 23.514978, 23.69998, None, 26.604196, 26.294602, 26.056942, 25.447677, 24.925848, 23.714811, 24.407999, 23.899968, 23.342999, 22.813988, 22.626299, 22.849748, 23.350027, 22.973099, 23.530016, 24.025025, 24.040011, 23.115003, 23.409972, 22.774972, 23.154225, 22.490028, 21.670026, 21.295011, 21.120034, 20.730032, 20.217712, 20.150016, 20.615, 20.674997, 20.99999, 21.02004, 21.674161, 22.055378, 22.597308, 22.76177, 22.952377, 23.692074, 24.492645, 25.197201, 26.106138, 26.117042, 26.604196, None, -46.76379, -43.40644, -39.89753, -38.62214, -35.08787, -27.10046, -20.84539, -22.69182, -26.51753, -31.9, -31.39646, -27.85666, -24.84448, -22.90328, -22.07175, -23.16961, -20.62363, -15.76818, -12.77018, -12.20855, -16.28533, -16.85, -20.04624, -17.73035, -18.9, -19.70499, -19.67353, -18.47285, -20.03503, -21.67944, -19.83407, -19.59896, -20.66818, -19.37281, -21.59422, -20.43454, -20.76234, -22.17221, -23.56593, -22.31311, -22.29954, -24.27834, -24.79296, -23.44296, -22.13281, -21.75356, -23.53603, -24.30702, -25.54341, -25.20135, -26.36276, -23.72742, -22.34902, -25.02927, -27.74737, -30.67371, -31.77665, -32.81105, -34.20196, -36.35284, -37.04378, -38.37505, -39.81222, -40.66899, -40.68281, -41.1887, -42.81938, -42.41666, -42.86619, -43.3784, -44.7875, -46.26364, -48.26294, -49.23308, -49.90039, -51.63325, -52.14014, -52.27659, -53.66166, -53.30161, -53.96911, -52.9804, -51.47536, -51.08041, -50.87122, -52.013585, -52.55792, -53.45629, -54.68336, -54.75001, -54.35884, -53.431315, -51.39014, -53.10937, -54.00422, -55, -55.83468, -54.71819, -55.32634, -56.12003, -57.32363, -58.59679, -58.58516, -61.26861, -63.39165, -66.06427, -68.50438, -69.66485, -71.40257, -68.77671, -66.76397, -71.04293, -73.297, -73.15938, -69.37345, -65.7107, -65.3239, -68.02298, -67.15129, -63.68925, -62.23444, -62.65116, -60.28249, -57.20744, -54.13442, -53.04328, -50.39061, -48.00386, -46.59984, -44.523, -46.9007, -46.76379, None, -90.095555, -90.608624, -91.23241, -91.689747, -92.22775, -92.20323, -92.087216, -92.229249, -91.74796, -90.464473, -90.438867, -90.600847, -90.711822, -91.08167, -91.453921, -91.002269, -91.00152, -90.067934, -89.14308, -89.150806, -89.229122, -88.930613, -88.604586, -88.518364, -88.225023, -88.68068, -89.154811, -89.22522, -89.145535, -89.353326, -89.587343, -89.534219, -89.721934, -90.064678, -90.095555, None, -52.556425, -52.939657, -53.418465, -53.554839, -53.778521, -54.088063, -54.524754, -54.27123, -54.184284, -54.011504, -54.399542, -54.478633, -53.958045, -53.618453, -52.882141, -51.823343, -51.657797, -52.249338, -52.556425, None, -59.758285, -59.101684, -58.482962, -58.454876, -58.078103, -57.542219, -57.147436, -57.307246, -57.914289, -57.86021, -58.044694, -57.601569, -57.281433, -57.150098, -56.539386, -56.782704, -57.335823, -57.660971, -58.11345, -58.429477, -58.540013, -59.030862, -59.646044, -59.718546, -59.974525, -59.815413, -59.53804, -59.767406, -60.111002, -59.980959, -60.213683, -60.733574, -61.410303, -61.139415, -61.159336, -60.543999, -60.295668, -60.637973, -60.550588, -59.758285, None, -87.316654, -87.489409, -87.793111, -87.723503, -87.859515, -88.065343, -88.503998, -88.541231, -88.843073, -89.058512, -89.353326, -89.145535, -89.22522, -89.154811, -88.68068, -88.225023, -88.121153, -87.901813, -87.61568, -87.522921, -87.367762, -86.903191, -86.440946, -86.119234, -86.001954, -85.683317, -85.444004, -85.182444, -84.983722, -84.52698, -84.368256, -84.063055, -83.773977, -83.410381, -83.147219, -83.489989, -83.628585, -83.975721, -84.228342, -84.449336, -84.649582, -84.820037, -84.924501, -85.052787, -85.148751, -85.165365, -85.514413, -85.698665, -85.801295, -86.096264, -86.312142, -86.520708, -86.755087, -86.733822, -86.880557, -87.005769, -87.316654, None, 18.829838, 19.072769, 19.390476, 19.005486, 18.553214, 17.861783, 17.002146, 16.534939, 16.318157, 15.959367, 15.750026, 16.23966, 16.456443, 16.916156, 17.297373, 17.674922, 18.56, 18.450016, 17.50997, 16.930006, 16.015385, 15.174454, 15.37625, 14.920309, 14.901602, 14.258748, 13.952255, 13.656976, 13.679403, 13.71506, 14.411968, 14.595109, 14.935244, 15.327675, 15.323954, 15.67153, 15.768733, 16.564808, 16.882515, 17.630066, 18.456062, 18.829838, None, -73.189791, -72.579673, -71.712361, -71.624873, -71.701303, -71.945112, -71.687738, -71.708305, -72.372476, -72.844411, -73.454555, -73.922433, -74.458034, -74.369925, -73.449542, -72.694937, -72.334882, -72.79165, -72.784105, -73.415022, -73.189791, None, 16.202298, 16.534268, 16.340584, 16.903754, 16.979667, 17.488473, 17.857133, 18.696513, 18.777025, 19.174365, 19.661364, 19.769471, 20.239054, 20.473562, 20.801294, 21.872236, 22.085608, 22.64082, 22.710531, 22.099768, 21.626515, 21.021952, 20.220192, 19.596045, 18.829838, 18.456062, 17.630066, 16.882515, 16.564808, 16.370505, 16.202298, None, 120.715609, 120.295014, 118.967808, 119.90031, 120.425756, 120.775502, 120.715609, None, 124.43595, 123.579982, 123.459989, 123.550009, 123.980009, 124.968682, 125.07002, 125.08852, 124.43595, None, 117.900018, 118.260616, 118.87846, 119.126507, 117.970402, 117.277731, 116.740141, 117.083737, 117.632024, 117.900018, None, 122.903537, 122.756983, 121.254491, 119.924391, 119.920929, 120.715092, 121.341669, 122.007365, 122.903537, None, 108.623479, 110.539227, 110.759576, 112.614811, 112.978768, 114.478935, 115.705527, 114.564511, 113.464734, 112.559672, 111.522061, 110.58615, 109.427667, 108.693655, 108.277763, 106.454102, 106.280624, 105.365486, 106.051646, 107.265009, 108.072091, 108.486846, 108.623479, None, 134.724624, 134.210134, 134.112776, 134.290336, 134.499625, 134.727002, 134.724624, None, 127.249215, 126.874923, 126.183802, 125.989034, 127.000651, 127.249215, None, 130.471344, 130.834836, 129.990547, 129.155249, 128.590684, 127.898891, 128.135879, 129.370998, 130.471344, None, 134.143368, 134.422627, 135.457603, 136.293314, 137.440738, 138.329727, 139.184921, 139.926684, 141.00021, 141.017057, 141.033852, 140.143415, 139.127767, 138.881477, 137.614474, 138.039099, 138.668621, 138.407914, 137.92784, 135.98925, 135.164598, 133.66288, 133.367705, 132.983956, 132.756941, 132.753789, 131.989804, 133.066845, 133.780031, 133.696212, 132.232373, 131.836222, 130.94284, 130.519558, 131.867538, 132.380116, 133.985548, 134.143368, None, 125.240501, 124.437035, 123.685505, 122.723083, 121.056725, 120.183083, 120.04087, 120.935905, 121.475821, 123.340565, 123.258399, 122.822715, 122.38853, 121.508274, 122.454572, 122.271896, 123.170963, 123.162333, 122.628515, 122.236394, 122.719569, 121.738234, 121.489463, 121.619171, 120.898182, 120.972389, 120.305453, 120.390047, 120.430717, 119.796543, 119.366906, 119.653606, 119.498835, 119.078344, 118.767769, 119.180974, 119.323394, 119.825999, 120.035702, 120.885779, 121.666817, 122.927567, 124.077522, 125.065989, 125.240501, None, 128.688249, 128.635952, 128.12017, 127.968034, 128.379999, 128.100016, 127.696475, 127.39949, 127.600512, 127.932378, 128.004156, 128.594559, 128.688249, None, 117.875627, 118.996747, 117.811858, 117.478339, 117.521644, 116.560048, 116.533797, 116.148084, 116.000858, 114.864803, 114.468652, 113.755672, 113.256994, 112.068126, 111.703291, 111.04824, 110.223846, 110.070936, 109.571948, 109.091874, 108.952658, 109.069136, 109.66326, 109.830227, 110.514061, 111.159138, 111.797548, 112.380252, 112.859809, 113.80585, 114.621355, 115.134037, 115.519078, 115.865517, 117.015214, 117.882035, 117.313232, 118.04833, 117.875627, None, 105.817655, 104.710384, 103.868213, 102.584261, 102.156173, 101.399113, 100.902503, 100.141981, 99.26374, 98.970011, 98.601351, 97.699598, 97.176942, 96.424017, 95.380876, 95.293026, 95.936863, 97.484882, 98.369169, 99.142559, 99.693998, 100.641434, 101.658012, 102.498271, 103.07684, 103.838396, 103.437645, 104.010789, 104.369991, 104.53949, 104.887893, 105.622111, 106.108593, 105.857446, 105.817655, None, 77.837451, 78.912269, 78.811086, 79.208892, 79.176129, 78.458446, 78.738894, 79.721367, 81.111256, 80.476721, 80.088425, 81.057203, 81.999987, 83.304249, 84.675018, 85.251779, 86.024393, 87.227472, 88.060238, 88.174804, 88.043133, 88.120441, 88.730326, 88.814248, 88.835643, 89.744528, 90.373275, 91.217513, 92.033484, 92.103712, 91.696657, 92.503119, 93.413348, 94.56599, 95.404802, 96.117679, 96.586591, 96.248833, 97.327114, 97.402561, 97.051989, 97.133999, 96.419366, 95.124768, 95.155153, 94.603249, 94.552658, 94.106742, 93.325188, 93.286327, 93.060294, 93.166128, 92.672721, 92.146035, 91.869928, 91.706475, 91.158963, 91.46773, 91.915093, 92.376202, 91.799596, 90.872211, 89.920693, 89.832481, 89.355094, 88.563049, 88.209789, 88.931554, 88.306373, 88.084422, 88.69994, 88.52977, 88.876312, 89.031961, 88.888766, 88.208497, 86.975704, 87.033169, 86.499351, 85.060266, 83.941006, 83.189217, 82.192792, 82.191242, 81.692719, 80.791999, 80.324896, 80.025069, 80.233274, 80.286294, 79.862547, 79.857999, 79.340512, 78.885345, 79.18972, 78.277941, 77.941165, 77.539898, 76.592979, 76.130061, 75.746467, 75.396101, 74.864816, 74.616717, 74.443859, 73.534199, 73.119909, 72.820909, 72.824475, 72.630533, 71.175273, 70.470459, 69.16413, 69.644928, 69.349597, 68.176645, 68.842599, 71.04324, 70.844699, 70.282873, 70.168927, 69.514393, 70.616496, 71.777666, 72.823752, 73.450638, 74.42138, 74.405929, 75.258642, 74.451559, 74.104294, 73.749948, 74.240203, 75.757061, 76.871722, 77.837451, None, -6.197885, -6.032985, -6.788857, -8.561617, -9.977086, -9.166283, -9.688525, -8.327987, -7.572168, -7.366031, -7.572168, -6.95373, -6.197885, None, 53.921598, 54.800304, 55.511578, 56.180375, 56.619366, 57.330434, 58.436154, 59.234762, 60.377638, 61.123071, 61.210817, 60.803193, 60.52843, 60.9637, 60.536078, 60.863655, 60.941945, 61.699314, 61.781222, 60.874248, 61.369309, 61.771868, 62.72783, 62.755426, 63.233898, 63.316632, 61.874187, 61.497363, 59.616134, 58.525761, 57.397251, 56.970766, 56.492139, 55.72371, 54.71509, 53.493097, 52.483598, 51.520763, 50.852948, 50.115009, 49.57685, 48.941333, 48.567971, 48.014568, 48.004698, 47.685286, 47.849204, 47.334661, 46.109362, 45.416691, 45.64846, 46.151788, 46.07634, 45.420618, 44.77267, 44.225756, 44.421403, 44.109225, 44.79399, 44.952688, 45.457722, 46.143623, 46.50572, 47.685079, 48.060095, 48.355529, 48.010744, 48.634375, 48.883249, 49.199612, 50.147771, 50.842354, 52.264025, 53.82579, 53.921598, None, 45.420618, 46.07634, 46.151788, 45.64846, 45.416691, 46.109362, 47.334661, 47.849204, 47.685286, 48.004698, 48.014568, 48.567971, 47.974519, 47.302622, 46.568713, 44.709499, 41.889981, 40.399994, 39.195468, 38.792341, 41.006159, 41.383965, 41.289707, 41.837064, 42.349591, 42.779126, 43.942259, 44.293452, 44.772699, 45.420618, None, -14.508695, -14.739637, -13.609732, -14.909834, -17.794438, -18.656246, -19.972755, -22.762972, -21.778484, -23.955044, -22.184403, -22.227423, -24.326184, -23.650515, -22.134922, -20.576284, -19.056842, -17.798624, -16.167819, -14.508695, None, 35.719918, 35.545665, 35.18393, 34.974641, 35.225892, 34.970507, 34.927408, 35.397561, 35.420918, 34.922603, 34.265433, 34.556372, 34.488107, 34.752587, 34.955417, 35.098457, 35.126053, 35.460709, 35.552797, 35.821101, 35.836397, 35.700798, 35.719918, None, 15.520376, 15.160243, 15.309898, 15.099988, 14.335229, 13.826733, 12.431004, 12.570944, 13.741156, 14.761249, 15.520376, None, 9.210012, 9.809975, 9.669519, 9.214818, 8.806936, 8.428302, 8.388253, 8.159998, 8.709991, 9.210012, None, 12.376485, 13.806475, 13.69811, 13.93763, 13.141606, 12.328581, 12.383875, 12.261453, 12.589237, 13.526906, 14.029821, 15.14257, 15.926191, 16.169897, 15.889346, 16.785002, 17.519169, 18.376687, 18.480247, 18.293385, 17.73838, 16.869596, 16.448743, 17.17149, 17.052841, 16.635088, 16.100961, 15.684087, 15.687963, 15.891981, 16.109332, 15.718814, 15.413613, 14.998496, 14.703268, 14.060672, 13.627985, 12.888082, 12.106683, 11.191906, 10.511948, 10.200029, 9.702488, 8.888946, 8.428561, 7.850767, 7.435185, 7.549596, 7.007562, 6.749955, 7.096652, 6.802355, 6.843593, 7.273851, 7.755992, 8.31663, 8.489952, 8.966306, 9.182882, 9.922837, 10.363378, 10.442701, 11.048556, 11.164828, 12.153088, 12.376485, None, -77.569601, -76.896619, -76.365359, -76.199659, -76.902561, -77.206341, -77.766023, -78.337719, -78.217727, -77.797365, -77.569601, None, 35.545665, 35.719918, 36.834062, 38.792341, 39.195468, 39.004886, 37.002166, 37.998849, 37.66812, 37.503582, 36.740528, 36.501214, 36.068941, 34.956037, 34.922603, 35.420918, 35.397561, 35.545252, 35.545665, None, 134.638428, 134.766379, 134.203416, 133.79295, 133.280268, 133.014858, 132.363115, 132.371176, 132.924373, 133.492968, 133.904106, 134.638428, None, 140.976388, 140.59977, 140.774074, 140.253279, 138.975528, 137.217599, 135.792983, 135.120983, 135.079435, 133.340316, 132.156771, 130.986145, 132.000036, 131.33279, 130.686318, 130.20242, 130.447676, 129.814692, 129.408463, 130.353935, 130.878451, 131.884229, 132.617673, 134.608301, 135.677538, 136.723831, 137.390612, 138.857602, 139.426405, 140.05479, 139.883379, 140.305783, 141.368973, 141.914263, 141.884601, 140.959489, 140.976388, None, 143.910162, 144.613427, 145.320825, 145.543137, 144.059662, 143.18385, 141.611491, 141.067286, 139.955106, 139.817544, 140.312087, 141.380549, 141.671952, 141.967645, 143.14287, 143.910162, None, 70.962315, 70.388965, 69.070027, 68.632483, 68.259896, 67.985856, 66.714047, 66.510649, 66.023392, 66.098012, 64.900824, 63.185787, 62.0133, 61.05832, 60.239972, 58.689989, 58.503127, 55.928917, 55.968191, 55.455251, 54.755345, 54.079418, 52.944293, 52.50246, 52.446339, 52.692112, 52.501426, 51.342427, 50.891292, 50.339129, 50.305643, 51.278503, 51.316899, 52.16739, 53.040876, 53.220866, 53.042737, 52.042023, 51.191945, 50.034083, 49.10116, 48.593241, 48.694734, 48.057253, 47.315231, 46.466446, 47.043672, 46.751596, 47.54948, 48.577841, 48.702382, 50.766648, 52.328724, 54.532878, 55.716941, 56.777961, 58.363291, 59.642282, 59.932807, 61.337424, 61.588003, 59.967534, 60.927269, 60.739993, 61.699986, 60.978066, 61.436591, 65.178534, 65.666876, 68.1691, 69.068167, 70.865267, 71.180131, 72.22415, 73.508516, 73.425679, 74.384845, 76.8911, 76.525179, 77.800916, 80.03556, 80.568447, 81.945986, 83.383004, 83.935115, 84.416377, 85.11556, 85.54127, 86.829357, 87.35997, 86.598776, 85.768233, 85.720484, 85.16429, 83.180484, 82.458926, 81.947071, 79.966106, 80.866206, 80.18015, 80.25999, 79.643645, 79.142177, 77.658392, 76.000354, 75.636965, 74.212866, 73.645304, 73.489758, 71.844638, 71.186281, 70.962315, None, 40.993, 41.58513, 40.88477, 40.63785, 40.26304, 40.12119, 39.80006, 39.60489, 39.20222, 37.7669, 37.69869, 34.07262, 33.903711, 33.893569, 34.18, 34.6721, 35.03599, 34.59607, 34.47913, 34.005, 34.620196, 35.298007, 35.817448, 35.817448, 36.159079, 36.855093, 38.120915, 38.43697, 38.67114, 38.89251, 39.559384, 39.85494, 40.76848, 41.1718, 41.855083, 40.98105, 40.993, None, 70.962315, 71.186281, 71.844638, 73.489758, 73.645304, 74.212866, 75.636965, 76.000354, 77.658392, 79.142177, 79.643645, 80.25999, 80.11943, 78.543661, 78.187197, 76.904484, 76.526368, 75.467828, 74.776862, 73.822244, 73.960013, 73.675379, 71.784694, 70.549162, 69.464887, 69.55961, 70.648019, 71.014198, 71.774875, 73.055417, 71.870115, 71.157859, 70.420022, 71.259248, 70.962315, None, 103.49728, 103.09069, 102.584932, 102.348099, 102.988422, 104.281418, 105.218777, 106.043946, 106.496373, 107.382727, 107.614548, 107.491403, 105.810524, 106.24967, 105.199915, 104.334335, 103.49728, None, 128.349716, 129.21292, 129.46045, 129.468304, 129.091377, 128.18585, 127.386519, 126.485748, 126.37392, 126.559231, 126.117398, 126.860143, 126.174759, 126.237339, 126.68372, 127.073309, 127.780035, 128.205746, 128.349716, None, 20.76216, 20.71731, 20.59023, 20.52295, 20.28374, 20.0707, 20.25758, 20.49679, 20.63508, 20.81448, 20.95651, 21.143395, 21.27421, 21.43866, 21.63302, 21.77505, 21.66292, 21.54332, 21.576636, 21.3527, 20.76216, None, 47.974519, 48.183189, 48.093943, 48.416094, 47.708851, 47.459822, 46.568713, 47.302622, 47.974519, None, 105.218777, 105.544338, 105.589039, 104.779321, 104.716947, 103.956477, 103.200192, 102.998706, 102.413005, 102.113592, 101.059548, 101.035931, 101.282015, 100.606294, 100.548881, 100.115988, 100.329101, 101.180005, 101.270026, 101.80312, 101.652018, 102.170436, 102.754896, 103.203861, 104.435, 104.822574, 104.183388, 103.896532, 105.094598, 105.925762, 106.556008, 107.312706, 107.564525, 107.382727, 106.496373, 106.043946, 105.218777, None, 35.821101, 35.552797, 35.460709, 35.126053, 35.482207, 35.979592, 35.998403, 36.448194, 36.61175, 36.06646, 35.821101, None, -7.712159, -7.974107, -9.004794, -9.91342, -10.765384, -11.438779, -11.199802, -11.146704, -10.695595, -10.230094, -10.016567, -9.755342, -9.33728, -9.403348, -9.208786, -8.926065, -8.722124, -8.439298, -8.485446, -8.385452, -8.60288, -8.311348, -7.993693, -7.570153, -7.539715, -7.635368, -7.712159, None, 14.8513, 14.143871, 13.581425, 11.999506, 11.560669, 10.771364, 10.303847, 9.948261, 9.910693, 9.319411, 9.716286, 9.629056, 9.756128, 9.683885, 9.859998, 9.805634, 9.48214, 9.970017, 10.056575, 9.950225, 10.636901, 10.94479, 11.432253, 11.488787, 12.66331, 13.08326, 13.91868, 15.24563, 15.71394, 16.61162, 18.02109, 19.08641, 19.57404, 20.05335, 19.82033, 20.13397, 20.85452, 21.54298, 22.89576, 23.2368, 23.60913, 23.9275, 24.92114, 25.16482, 24.80287, 24.95762, 24.70007, 25, 25, 25, 25, 23.85, 23.83766, 19.84926, 15.86085, 14.8513, None, 81.787959, 81.637322, 81.21802, 80.348357, 79.872469, 79.695167, 80.147801, 80.838818, 81.304319, 81.787959, None, 28.978263, 29.325166, 29.018415, 28.8484, 28.291069, 28.107205, 27.749397, 26.999262, 27.532511, 28.074338, 28.5417, 28.978263, None, 22.731099, 22.651052, 22.757764, 22.315724, 21.268449, 21.0558, 22.201157, 23.878264, 24.860684, 25.000934, 25.533047, 26.494331, 26.588279, 25.768433, 25.536354, 24.450684, 23.484128, 23.243987, 22.731099, None, 6.043073, 6.242751, 6.18632, 5.897759, 5.674052, 5.782417, 6.043073, None, 21.0558, 21.090424, 21.581866, 22.524341, 23.318453, 24.12073, 24.312863, 25.164594, 25.60281, 26.463532, 27.288185, 27.770016, 27.855282, 28.176709, 27.10246, 26.494331, 25.533047, 25.000934, 24.860684, 23.878264, 22.201157, 21.0558, None, -5.193863, -4.591006, -3.640057, -2.604306, -2.169914, -1.792986, -1.733455, -1.388049, -1.124551, -1.307899, -2.616605, -3.06898, -3.647498, -3.690441, -4.859646, -5.242129, -6.060632, -7.059228, -8.674116, -8.66559, -8.817809, -8.817828, -8.794884, -9.413037, -9.735343, -10.189424, -10.551263, -11.392555, -11.71822, -12.030759, -12.500963, -13.89111, -14.221168, -14.630833, -14.750955, -17.002962, -17.020428, -16.973248, -16.589137, -16.261922, -16.326414, -15.982611, -15.426004, -15.089332, -14.824645, -14.800926, -14.43994, -13.773805, -13.139942, -13.121613, -12.618837, -11.688919, -10.900957, -10.399592, -9.564811, -9.814718, -9.434793, -9.300693, -8.657476, -7.654178, -6.912544, -6.244342, -5.929994, -5.193863, None, 26.619337, 26.857824, 27.522537, 28.259547, 28.670891, 29.122698, 29.050868, 29.415135, 29.559674, 29.908852, 29.83821, 30.024659, 29.759972, 29.170654, 29.072107, 28.862972, 28.933717, 28.659987, 28.485269, 28.233554, 28.054443, 28.160018, 28.12803, 27.551166, 27.233873, 26.924176, 26.619337, None, 49.543519, 49.808981, 50.056511, 50.217431, 50.476537, 50.377111, 50.200275, 49.860606, 49.672607, 49.863344, 49.774564, 49.498612, 49.435619, 49.041792, 48.548541, 47.930749, 47.547723, 47.095761, 46.282478, 45.409508, 44.833574, 44.03972, 43.763768, 43.697778, 43.345654, 43.254187, 43.433298, 43.893683, 43.89637, 44.374325, 44.464397, 44.232422, 44.042976, 43.963084, 44.312469, 44.446517, 44.944937, 45.502732, 45.872994, 46.312243, 46.882183, 47.70513, 48.005215, 47.869047, 48.293828, 48.84506, 48.863509, 49.194651, 49.543519, None, -97.140008, -97.528072, -97.702946, -97.776042, -97.872367, -97.699044, -97.38896, -97.189333, -96.525576, -96.292127, -95.900885, -94.839063, -94.42573, -93.548651, -92.786114, -92.037348, -91.407903, -90.77187, -90.53359, -90.451476, -90.278618, -89.601321, -88.543866, -87.658417, -87.05189, -86.811982, -86.845908, -87.383291, -87.621054, -87.43675, -87.58656, -87.837191, -88.090664, -88.300031, -88.490123, -88.848344, -89.029857, -89.150909, -89.14308, -90.067934, -91.00152, -91.002269, -91.453921, -91.08167, -90.711822, -90.600847, -90.438867, -90.464473, -91.74796, -92.229249, -92.087216, -92.20323, -92.22775, -93.359464, -93.875169, -94.691656, -95.250227, -96.053382, -96.557434, -97.263592, -98.01303, -98.947676, -99.697397, -100.829499, -101.666089, -101.918528, -102.478132, -103.50099, -103.917527, -104.99201, -105.493038, -105.731396, -105.397773, -105.500661, -105.270752, -105.265817, -105.603161, -105.693414, -106.028716, -106.90998, -107.915449, -108.401905, -109.260199, -109.444089, -109.291644, -109.801458, -110.391732, -110.641019, -111.178919, -111.759607, -112.228235, -112.271824, -112.809594, -113.163811, -113.148669, -113.871881, -114.205737, -114.776451, -114.9367, -114.771232, -114.673899, -114.330974, -113.588875, -113.424053, -113.271969, -113.140039, -112.962298, -112.761587, -112.457911, -112.244952, -111.616489, -111.284675, -110.987819, -110.710007, -110.655049, -110.172856, -109.771847, -109.409104, -109.433392, -109.854219, -110.031392, -110.295071, -110.949501, -111.670568, -112.182036, -112.148989, -112.300711, -112.777297, -113.464671, -113.59673, -113.848937, -114.465747, -115.055142, -114.982253, -114.570366, -114.199329, -114.162018, -114.931842, -115.518654, -115.887365, -116.25835, -116.721526, -117.12776, -115.99135, -114.72139, -114.815, -113.30498, -111.02361, -109.035, -108.24194, -108.24, -106.50759, -106.1429, -105.63159, -105.03737, -104.70575, -104.45697, -103.94, -103.11, -102.48, -101.6624, -100.9576, -100.45584, -100.11, -99.52, -99.3, -99.02, -98.24, -97.53, -97.140008, None, 20.59023, 20.71731, 20.76216, 21.3527, 21.576636, 21.91708, 22.380526, 22.881374, 22.952377, 22.76177, 22.597308, 22.055378, 21.674161, 21.02004, 20.60518, 20.46315, 20.59023, None, -12.17075, -11.834208, -11.666078, -11.349095, -10.650791, -10.086846, -9.700255, -9.550238, -5.537744, -5.315277, -5.488523, -5.971129, -6.453787, -4.923337, -1.550055, 1.823228, 2.060991, 2.683588, 3.146661, 3.158133, 4.267419, 4.27021, 3.723422, 3.638259, 2.749993, 1.385528, 1.015783, 0.374892, -0.266257, -0.515854, -1.066363, -2.001035, -2.191825, -2.967694, -3.103707, -3.522803, -4.006391, -4.280405, -4.427166, -5.220942, -5.197843, -5.470565, -5.404342, -5.816926, -6.050452, -6.205223, -6.493965, -6.666461, -6.850507, -7.622759, -7.89959, -8.029944, -8.335377, -8.282357, -8.407311, -8.620321, -8.581305, -8.376305, -8.786099, -8.905265, -9.127474, -9.327616, -9.567912, -9.890993, -10.165214, -10.593224, -10.87083, -11.036556, -11.297574, -11.456169, -11.513943, -11.467899, -11.553398, -11.927716, -12.124887, -12.17075, None, 14.566171, 14.532684, 14.436463, 14.352334, 14.3513, 14.448348, 14.537025, 14.566171, None, 14.313473, 14.253632, 14.194204, 14.180354, 14.263243, 14.303758, 14.320914, 14.313473, None, 99.543309, 98.959676, 98.253724, 97.797783, 97.375896, 97.859123, 98.493761, 98.903348, 98.537376, 98.192074, 98.430819, 99.097755, 99.212012, 99.196354, 99.587286, 99.038121, 98.553551, 98.457174, 98.764546, 98.428339, 98.509574, 98.103604, 97.777732, 97.597072, 97.16454, 96.505769, 95.369352, 94.808405, 94.188804, 94.533486, 94.324817, 93.540988, 93.663255, 93.078278, 92.368554, 92.303234, 92.652257, 92.672721, 93.166128, 93.060294, 93.286327, 93.325188, 94.106742, 94.552658, 94.603249, 95.155153, 95.124768, 96.419366, 97.133999, 97.051989, 97.402561, 97.327114, 97.911988, 98.246231, 98.68269, 98.712094, 98.671838, 97.724609, 97.60472, 98.660262, 98.898749, 99.531992, 99.240899, 99.983489, 100.416538, 101.150033, 101.180005, 100.329101, 100.115988, 99.543309, None, 19.801613, 19.738051, 19.30449, 19.37177, 19.16246, 18.88214, 18.45, 18.56, 18.70648, 19.03165, 19.21852, 19.48389, 19.63, 19.95857, 20.3398, 20.25758, 20.0707, 19.801613, None, 87.751264, 88.805567, 90.713667, 92.234712, 93.104219, 94.147566, 94.815949, 95.814028, 97.259728, 98.231762, 97.82574, 98.861491, 99.981732, 100.88948, 102.065223, 102.255909, 103.676545, 104.621552, 105.886591, 106.888804, 107.868176, 108.475167, 109.402449, 110.662011, 111.581231, 112.89774, 114.362456, 114.96211, 115.485695, 116.678801, 116.191802, 115.485282, 115.742837, 116.308953, 117.295507, 118.064143, 118.866574, 119.772824, 119.66327, 118.874326, 117.421701, 116.717868, 115.985096, 114.460332, 113.463907, 112.436062, 111.873306, 111.348377, 111.667737, 111.829588, 111.129682, 110.412103, 109.243596, 107.744773, 106.129316, 104.964994, 104.522282, 103.312278, 101.83304, 100.845866, 99.515817, 97.451757, 96.349396, 95.762455, 95.306875, 94.688929, 93.480734, 92.133891, 90.94554, 90.585768, 90.970809, 90.280826, 88.854298, 88.013832, 87.751264, None, 34.559989, 35.312398, 36.514082, 36.775151, 37.471284, 37.827645, 38.427557, 39.52103, 40.316589, 40.478387, 40.437253, 40.560811, 40.59962, 40.775475, 40.477251, 40.089264, 39.452559, 38.538351, 37.411133, 36.281279, 35.896497, 35.1984, 34.786383, 34.701893, 35.176127, 35.373428, 35.385848, 35.562546, 35.533935, 35.371774, 35.60747, 35.458746, 35.040735, 34.215824, 33.01321, 32.574632, 32.660363, 32.915955, 32.83012, 32.071665, 31.985779, 31.837778, 31.752408, 31.930589, 31.670398, 31.191409, 32.244988, 32.508693, 32.659743, 32.772708, 32.611994, 32.654886, 32.849861, 32.847639, 32.328239, 31.852041, 31.636498, 31.173064, 30.338955, 30.274256, 30.179481, 33.214025, 33.7897, 34.064825, 34.459633, 34.517666, 34.307291, 34.381292, 35.03381, 35.339063, 35.771905, 35.686845, 35.267956, 34.907151, 34.559989, 34.280006, 34.559989, None, -12.17075, -12.830658, -13.435738, -14.099521, -14.577348, -15.135737, -15.623666, -16.12069, -16.463098, -16.549708, -16.270552, -16.146347, -16.256883, -16.377651, -16.277838, -16.536324, -17.063423, -16.845194, -12.929102, -13.118754, -12.874222, -11.937224, -11.969419, -8.687294, -8.6844, -4.923337, -6.453787, -5.971129, -5.488523, -5.315277, -5.537744, -9.550238, -9.700255, -10.086846, -10.650791, -11.349095, -11.666078, -11.834208, -12.17075, None, 34.559989, 34.280006, 34.559989, 34.907151, 35.267956, 35.686845, 35.771905, 35.339063, 35.03381, 34.381292, 34.307291, 34.517666, 34.459633, 34.064825, 33.7897, 33.214025, 32.688165, 32.991764, 33.306422, 33.114289, 33.31531, 33.485688, 33.231388, 32.759375, 33.739729, 33.940838, 34.280006, 34.559989, None, 101.075516, 101.154219, 101.814282, 102.141187, 102.371147, 102.961705, 103.381215, 103.438575, 103.332122, 103.429429, 103.502448, 103.854674, 104.247932, 104.228811, 103.519707, 102.573615, 101.390638, 101.27354, 100.695435, 100.557408, 100.196706, 100.30626, 100.085757, 100.259596, 101.075516, None, 118.618321, 117.882035, 117.015214, 115.865517, 115.519078, 115.134037, 114.621355, 113.80585, 112.859809, 112.380252, 111.797548, 111.159138, 110.514061, 109.830227, 109.66326, 110.396135, 111.168853, 111.370081, 111.796928, 112.995615, 113.712935, 114.204017, 114.659596, 114.869557, 115.347461, 115.4057, 115.45071, 116.220741, 116.725103, 117.129626, 117.643393, 117.689075, 118.347691, 119.181904, 119.110694, 118.439727, 118.618321, None, 16.344977, 15.601818, 15.210472, 14.989711, 14.743214, 14.408144, 14.385717, 14.257714, 13.868642, 13.352498, 12.826845, 12.608564, 11.794919, 11.734199, 12.215461, 12.814081, 13.462362, 14.058501, 14.209707, 18.263309, 18.956187, 21.377176, 23.215048, 24.033862, 24.682349, 25.07695, 25.084443, 24.520705, 24.217365, 23.579006, 23.196858, 21.65504, 20.910641, 20.881134, 19.895458, 19.895768, 19.894734, 19.002127, 18.464899, 17.836152, 17.387497, 17.218929, 16.824017, 16.344977, None, 165.77999, 166.599991, 167.120011, 166.740035, 166.189732, 165.474375, 164.829815, 164.167995, 164.029606, 164.459967, 165.020036, 165.460009, 165.77999, None, 2.154474, 2.177108, 1.024103, 0.993046, 0.429928, 0.295646, 0.374892, 1.015783, 1.385528, 2.749993, 3.638259, 3.723422, 4.27021, 4.267419, 5.677566, 8.572893, 11.999506, 13.581425, 14.143871, 14.8513, 15.096888, 15.471077, 15.487148, 15.903247, 15.685741, 15.300441, 15.247731, 13.972202, 13.540394, 13.956699, 13.954477, 14.595781, 14.495787, 14.213531, 14.181336, 13.995353, 13.318702, 13.083987, 12.302071, 11.527803, 10.989593, 10.701032, 10.114814, 9.524928, 9.014933, 7.804671, 7.330747, 6.820442, 6.445426, 5.443058, 4.368344, 4.107946, 3.967283, 3.680634, 3.61118, 2.848643, 2.490164, 2.154474, None, 8.500288, 7.462108, 7.082596, 6.698072, 5.898173, 5.362805, 5.033574, 4.325607, 3.57418, 2.691702, 2.749063, 2.723793, 2.912308, 3.220352, 3.705438, 3.60007, 3.797112, 3.572216, 3.61118, 3.680634, 3.967283, 4.107946, 4.368344, 5.443058, 6.445426, 6.820442, 7.330747, 7.804671, 9.014933, 9.524928, 10.114814, 10.701032, 10.989593, 11.527803, 12.302071, 13.083987, 13.318702, 13.995353, 14.181336, 14.577178, 14.468192, 14.415379, 13.57295, 13.308676, 13.1676, 12.955468, 12.753672, 12.218872, 12.063946, 11.839309, 11.745774, 11.058788, 10.497375, 10.118277, 9.522706, 9.233163, 8.757533, 8.500288, None, -85.71254, -86.058488, -86.52585, -86.745992, -87.167516, -87.668493, -87.557467, -87.392386, -87.316654, -87.005769, -86.880557, -86.733822, -86.755087, -86.520708, -86.312142, -86.096264, -85.801295, -85.698665, -85.514413, -85.165365, -85.148751, -85.052787, -84.924501, -84.820037, -84.649582, -84.449336, -84.228342, -83.975721, -83.628585, -83.489989, -83.147219, -83.233234, -83.284162, -83.182126, -83.4125, -83.519832, -83.552207, -83.498515, -83.473323, -83.626104, -83.719613, -83.650858, -83.85547, -83.808936, -83.655612, -83.895054, -84.190179, -84.355931, -84.673069, -84.903003, -85.561852, -85.71254, None, 6.074183, 6.90514, 7.092053, 6.84287, 6.589397, 5.988658, 6.156658, 5.606976, 4.973991, 4.047071, 3.314971, 3.830289, 4.705997, 6.074183, None, 28.165547, 31.293418, 30.005435, 31.101079, 29.399581, 28.59193, 29.015573, 27.732292, 26.179622, 25.689213, 24.735679, 23.66205, 22.356238, 21.244936, 20.645593, 20.025269, 19.87856, 17.993868, 17.729182, 16.768879, 16.108712, 15.108411, 13.55569, 13.919905, 13.571916, 12.579935, 11.930569, 11.992064, 12.631147, 12.300366, 11.468272, 11.027369, 10.356557, 8.382, 7.048748, 5.665835, 5.308234, 4.992078, 5.9129, 8.553411, 10.527709, 12.358347, 14.761146, 16.435927, 19.184028, 21.378416, 23.023742, 24.546543, 26.37005, 28.165547, None, 24.72412, 22.49032, 20.72601, 21.41611, 20.8119, 22.88426, 23.28134, 24.72412, None, 18.25183, 21.54383, 19.02737, 18.47172, 17.59441, 17.1182, 15.91315, 13.76259, 14.66956, 13.1706, 11.22231, 10.44453, 13.17077, 13.71852, 15.14282, 15.52255, 16.99085, 18.25183, None, 25.447625, 27.407506, 25.924651, 23.024466, 20.075188, 19.897266, 18.462264, 17.368015, 20.455992, 21.907945, 22.919253, 25.447625, None, 88.120441, 88.043133, 88.174804, 88.060238, 87.227472, 86.024393, 85.251779, 84.675018, 83.304249, 81.999987, 81.057203, 80.088425, 80.476721, 81.111256, 81.525804, 82.327513, 83.337115, 83.898993, 84.23458, 85.011638, 85.82332, 86.954517, 88.120441, None, 173.020375, 173.247234, 173.958405, 174.247587, 174.248517, 173.876447, 173.22274, 172.711246, 173.080113, 172.308584, 171.452925, 171.185138, 170.616697, 169.831422, 169.332331, 168.411354, 167.763745, 166.676886, 166.509144, 167.046424, 168.303763, 168.949409, 169.667815, 170.52492, 171.12509, 171.569714, 171.948709, 172.097227, 172.79858, 173.020375, None, 174.612009, 175.336616, 175.357596, 175.808887, 175.95849, 176.763195, 177.438813, 178.010354, 178.517094, 178.274731, 177.97046, 177.206993, 176.939981, 177.032946, 176.885824, 176.508017, 176.01244, 175.239567, 175.067898, 174.650973, 175.22763, 174.900157, 173.824047, 173.852262, 174.574802, 174.743474, 174.697017, 174.292028, 174.319004, 173.840997, 173.054171, 172.636005, 173.007042, 173.551298, 174.32939, 174.612009, None, 58.861141, 58.487986, 58.034318, 57.826373, 57.665762, 57.7887, 57.694391, 57.234264, 56.609651, 56.512189, 56.283521, 55.661492, 55.269939, 55.2749, 54.791002, 54.239253, 53.570508, 53.108573, 52.782184, 52.00001, 54.999982, 55.666659, 55.208341, 55.234489, 55.525841, 55.528632, 55.981214, 55.804119, 55.886233, 56.396847, 56.84514, 57.403453, 58.136948, 58.729211, 59.180502, 59.450098, 59.80806, 59.806148, 59.442191, 59.282408, 58.861141, None, 56.391421, 56.261042, 56.070821, 56.362017, 56.485679, 56.391421, None, 75.158028, 75.896897, 76.192848, 77.837451, 76.871722, 75.757061, 74.240203, 73.749948, 74.104294, 74.451559, 75.258642, 74.405929, 74.42138, 73.450638, 72.823752, 71.777666, 70.616496, 69.514393, 70.168927, 70.282873, 70.844699, 71.04324, 68.842599, 68.176645, 67.443667, 67.145442, 66.372828, 64.530408, 62.905701, 61.497363, 61.874187, 63.316632, 63.233898, 62.755426, 62.72783, 61.771868, 61.369309, 60.874248, 62.549857, 63.550261, 64.148002, 64.350419, 65.046862, 66.346473, 66.381458, 66.938891, 67.683394, 67.792689, 68.556932, 68.926677, 69.317764, 69.262522, 69.687147, 70.323594, 69.930543, 70.881803, 71.156773, 71.115019, 71.613076, 71.498768, 71.262348, 71.846292, 72.920025, 74.067552, 74.575893, 75.158028, None, -77.881571, -78.214936, -78.429161, -78.182096, -78.435465, -78.622121, -79.120307, -79.557877, -79.760578, -80.164481, -80.382659, -80.480689, -80.00369, -80.276671, -80.421158, -80.886401, -81.059543, -81.189716, -81.519515, -81.721311, -82.131441, -82.390934, -82.820081, -82.850958, -82.965783, -82.913176, -82.829771, -82.868657, -82.719183, -82.927155, -82.932891, -82.546196, -82.187123, -82.207586, -81.808567, -81.714154, -81.439287, -80.947302, -80.521901, -79.9146, -79.573303, -79.021192, -79.05845, -78.500888, -78.055928, -77.729514, -77.353361, -77.474723, -77.242566, -77.431108, -77.753414, -77.881571, None, -69.590424, -69.858444, -70.372572, -71.37525, -71.462041, -73.44453, -75.237883, -76.009205, -76.423469, -76.259242, -77.106192, -78.092153, -79.036953, -79.44592, -79.760578, -80.537482, -81.249996, -80.926347, -81.410943, -81.09967, -80.302561, -80.184015, -80.469295, -80.442242, -80.028908, -79.624979, -79.205289, -78.639897, -78.450684, -77.837905, -76.635394, -75.544996, -75.233723, -75.373223, -75.106625, -74.441601, -74.122395, -73.659504, -73.070392, -72.325787, -71.774761, -71.413646, -70.813476, -70.047709, -70.692682, -70.394044, -69.893635, -70.794769, -70.928843, -71.748406, -72.891928, -72.964507, -73.219711, -73.120027, -73.724487, -73.723401, -73.987235, -73.571059, -73.015383, -73.226713, -72.563033, -72.184891, -71.302412, -70.481894, -70.548686, -70.093752, -69.529678, -68.66508, -68.88008, -68.929224, -68.948887, -69.339535, -69.160347, -69.389764, -68.959635, -69.590424, None, 126.376814, 126.478513, 126.537424, 126.196773, 125.831421, 125.363852, 125.683161, 125.396512, 124.219788, 123.93872, 124.243662, 123.610212, 123.296071, 122.825506, 122.085499, 121.919928, 122.312359, 122.942398, 123.487688, 123.841154, 124.60147, 124.764612, 125.471391, 125.412118, 126.222714, 126.306637, 126.376814, None, 123.982438, 123.623183, 123.309921, 122.995883, 122.380055, 122.586089, 122.837081, 122.947411, 123.49885, 123.337774, 124.077936, 123.982438, None, 118.504581, 117.174275, 117.664477, 118.386914, 118.987342, 119.511496, 119.689677, 119.029458, 118.504581, None, 121.883548, 122.483821, 123.120217, 123.100838, 122.637714, 122.00261, 121.967367, 122.03837, 121.883548, None, 125.502552, 125.783465, 125.011884, 125.032761, 125.277449, 124.801819, 124.760168, 124.459101, 124.302522, 124.891013, 124.87799, 124.266762, 125.227116, 125.502552, None, 121.527394, 121.26219, 120.833896, 120.323436, 121.180128, 121.527394, None, 121.321308, 121.937601, 122.246006, 122.336957, 122.174279, 122.515654, 122.252311, 121.662786, 121.50507, 121.728829, 122.258925, 122.701276, 123.950295, 123.855107, 124.181289, 124.077419, 123.298035, 122.928652, 122.671355, 122.03465, 121.126385, 120.628637, 120.679384, 120.991819, 120.693336, 120.564145, 120.070429, 119.920929, 119.883773, 120.286488, 120.390047, 120.715867, 121.321308, None, 155.880026, 155.599991, 155.166994, 154.729192, 154.514114, 154.652504, 154.759991, 155.062918, 155.547746, 156.019965, 155.880026, None, 151.982796, 151.459107, 151.30139, 150.754447, 150.241197, 149.709963, 148.890065, 148.318937, 148.401826, 149.298412, 149.845562, 149.99625, 150.139756, 150.236908, 150.807467, 151.089672, 151.647881, 151.537862, 152.136792, 152.338743, 152.318693, 151.982796, None, 147.191874, 148.084636, 148.734105, 149.306835, 149.266631, 150.038728, 149.738798, 150.801628, 150.690575, 150.028393, 149.78231, 148.923138, 147.913018, 147.135443, 146.567881, 146.048481, 144.744168, 143.897088, 143.286376, 143.413913, 142.628431, 142.068259, 141.033852, 141.017057, 141.00021, 142.735247, 144.583971, 145.27318, 145.829786, 145.981922, 147.648073, 147.891108, 146.970905, 147.191874, None, 153.140038, 152.827292, 152.638673, 152.406026, 151.953237, 151.384279, 150.66205, 150.939965, 151.479984, 151.820015, 152.239989, 152.640017, 153.019994, 153.140038, None, 15.016996, 14.607098, 14.685026, 14.4376, 14.074521, 14.353315, 14.119686, 14.8029, 16.363477, 17.622832, 18.620859, 18.696255, 19.66064, 20.892245, 22.731099, 23.243987, 23.484128, 23.527536, 23.804935, 23.799199, 23.199494, 23.508002, 23.527071, 24.029986, 23.922757, 23.426508, 22.51845, 22.776419, 22.558138, 21.607808, 20.887955, 20.415839, 19.825023, 19.320713, 18.909575, 18.853144, 18.392914, 17.649445, 17.554567, 16.868769, 16.719476, 16.176253, 16.238627, 15.490972, 15.016996, None, -66.282434, -65.771303, -65.591004, -65.847164, -66.599934, -67.184162, -67.242428, -67.100679, -66.282434, None, 130.640016, 130.780007, 130.400031, 129.965949, 129.667362, 129.705189, 129.188115, 129.0104, 128.633368, 127.967414, 127.533436, 127.50212, 127.385434, 127.783343, 128.349716, 128.205746, 127.780035, 127.073309, 126.68372, 126.237339, 126.174759, 125.689104, 125.568439, 125.27533, 125.240087, 124.981033, 124.712161, 124.985994, 125.221949, 125.132859, 125.38659, 125.321116, 124.737482, 124.265625, 125.079942, 126.182045, 126.869083, 127.343783, 128.208433, 128.052215, 129.596669, 129.994267, 130.640016, None, -9.034818, -8.671946, -8.263857, -8.013175, -7.422513, -7.251309, -6.668606, -6.389088, -6.851127, -6.86402, -7.026413, -7.066592, -7.498632, -7.098037, -7.374092, -7.029281, -7.166508, -7.537105, -7.453726, -7.855613, -8.382816, -8.898857, -8.746101, -8.839998, -9.287464, -9.526571, -9.446989, -9.048305, -8.977353, -8.768684, -8.790853, -8.990789, -9.034818, None, -62.685057, -62.291179, -62.265961, -61.786326, -60.043565, -59.115042, -58.183471, -58.166392, -57.870674, -57.937156, -56.88151, -56.473317, -55.797958, -55.610683, -55.517639, -55.400747, -55.027902, -54.652834, -54.29296, -54.293476, -54.428946, -54.625291, -54.788795, -55.695846, -56.486702, -57.60976, -58.618174, -57.63366, -57.777217, -58.807128, -60.028966, -60.846565, -62.685057, None, 50.810108, 50.743911, 51.013352, 51.286462, 51.589079, 51.6067, 51.389608, 51.112415, 50.810108, None, 22.710531, 23.142236, 23.760958, 24.402056, 24.866317, 25.207743, 25.945941, 26.19745, 26.619337, 26.924176, 27.233873, 27.551166, 28.12803, 28.160018, 28.054443, 28.233554, 28.679779, 29.149725, 29.603289, 29.626543, 29.141612, 28.837858, 28.558081, 27.970107, 27.2424, 26.065159, 25.569272, 24.100679, 23.332302, 22.944832, 22.65715, 22.474008, 22.705726, 22.459022, 22.145088, 21.562023, 21.483526, 20.874313, 20.762175, 20.220192, 21.021952, 21.626515, 22.099768, 22.710531, None, 143.648007, 144.654148, 143.173928, 142.558668, 143.533492, 143.505277, 142.747701, 142.09203, 141.906925, 142.018443, 141.904445, 142.1358, 142.179983, 141.594076, 141.682546, 142.606934, 142.209749, 142.654786, 142.914616, 143.260848, 143.235268, 143.648007, None, 22.731099, 20.892245, 19.66064, 19.888481, 21.268449, 22.315724, 22.757764, 22.651052, 22.731099, None, -175.01425, -174.33983, -174.57182, -171.85731, -169.89958, -170.89107, -172.53025, -172.555, -172.95533, -173.89184, -174.65392, -175.98353, -176.20716, -177.22266, -178.35993, -178.90332, -178.68611, -179.88377, -179.43268, -180, -180, -177.55, -174.92825, -175.01425, None, 180, 178.903425, 178.7253, 180, 180, None, -178.69378, -180, -180, -179.871875, -179.02433, -177.577945, -177.663575, -178.69378, None, 143.60385, 142.08763, 140.038155, 139.86312, 140.81171, 142.06207, 143.48283, 143.60385, None, 150.73167, 149.575925, 147.977465, 146.11919, 146.358485, 148.22223, 150.73167, None, 145.086285, 144.3, 140.61381, 138.95544, 136.97439, 137.51176, 138.831075, 141.471615, 145.086285, None, 57.535693, 56.944979, 53.677375, 53.412017, 51.601895, 51.455754, 52.478275, 52.444169, 54.427614, 53.50829, 55.902459, 55.631933, 57.868644, 61.170044, 64.498368, 66.210977, 68.15706, 68.852211, 68.180573, 64.637326, 61.583508, 58.477082, 56.986786, 55.419336, 55.622838, 57.535693, None, 106.97013, 107.24, 108.1538, 111.07726, 113.33151, 114.13417, 113.88539, 112.77918, 110.15125, 109.4, 110.64, 112.11919, 113.01954, 113.52958, 113.96881, 115.56782, 118.77633, 119.02, 123.20066, 123.25777, 125.38, 126.97644, 128.59126, 129.05157, 128.46, 129.71599, 131.28858, 132.2535, 133.85766, 135.56193, 137.49755, 138.23409, 139.86983, 139.14791, 140.46817, 149.5, 150.35118, 152.9689, 157.00688, 158.99779, 159.83031, 159.70866, 160.94053, 162.27907, 164.05248, 165.94037, 167.83567, 169.57763, 170.81688, 170.0082, 170.45345, 173.64391, 175.72403, 178.6, 180, 180, 179.99281, 178.7072, 177.41128, 178.313, 178.90825, 179.37034, 179.48636, 179.22825, 177.3643, 174.56929, 173.68013, 172.15, 170.6985, 170.33085, 168.90046, 166.29498, 165.84, 164.87674, 163.53929, 163.21711, 162.01733, 162.05297, 163.19191, 163.05794, 162.12958, 161.70146, 162.11749, 160.36877, 160.02173, 158.53094, 158.23118, 156.78979, 156.42, 155.99182, 155.43366, 155.91442, 156.75815, 156.81035, 158.36433, 160.15064, 161.87204, 163.66969, 164.47355, 163.25842, 162.65791, 160.12148, 159.30232, 156.72068, 154.21806, 155.04375, 152.81185, 151.26573, 151.33815, 149.78371, 148.54481, 145.48722, 142.19782, 138.95848, 135.12619, 136.70171, 137.19342, 138.1647, 138.80463, 139.90151, 141.34531, 141.37923, 140.59742, 140.51308, 140.06193, 138.55472, 138.21971, 136.86232, 135.51535, 134.86939, 133.53687, 132.90627, 132.27807, 130.93587, 130.78, 130.64, 130.633866, 131.144688, 131.288555, 131.02519, 131.883454, 133.09712, 133.769644, 134.11235, 134.50081, 135.026311, 133.373596, 132.50669, 130.98726, 130.582293, 129.397818, 127.6574, 127.287456, 126.939157, 126.564399, 125.946349, 125.068211, 123.57147, 122.245748, 121.003085, 120.177089, 120.725789, 120.7382, 120.18208, 119.27939, 119.288461, 117.879244, 116.678801, 115.485695, 114.96211, 114.362456, 112.89774, 111.581231, 110.662011, 109.402449, 108.475167, 107.868176, 106.888804, 105.886591, 104.62158, 103.676545, 102.25589, 102.06521, 100.88948, 99.981732, 98.861491, 97.82574, 98.231762, 97.25976, 95.81402, 94.815949, 94.147566, 93.10421, 92.234712, 90.713667, 88.805567, 87.751264, 87.35997, 86.829357, 85.54127, 85.11556, 84.416377, 83.935115, 83.383004, 81.945986, 80.568447, 80.03556, 77.800916, 76.525179, 76.8911, 74.38482, 73.425679, 73.508516, 72.22415, 71.180131, 70.865267, 69.068167, 68.1691, 65.66687, 65.178534, 61.4366, 60.978066, 61.699986, 60.739993, 60.927269, 59.967534, 61.588003, 61.337424, 59.932807, 59.642282, 58.36332, 56.77798, 55.71694, 54.532878, 52.328724, 50.766648, 48.702382, 48.577841, 47.54948, 46.751596, 47.043672, 46.466446, 47.31524, 48.05725, 48.694734, 48.59325, 49.10116, 48.64541, 47.67591, 46.68201, 47.59094, 47.49252, 48.58437, 47.987283, 47.815666, 47.373315, 46.686071, 46.404951, 45.7764, 45.470279, 44.537623, 43.93121, 43.75599, 42.3944, 40.92219, 40.076965, 39.955009, 38.68, 37.53912, 36.67546, 37.40317, 38.23295, 37.67372, 39.14767, 39.1212, 38.223538, 38.255112, 38.77057, 39.738278, 39.89562, 39.67465, 40.080789, 40.06904, 38.594988, 38.010631, 37.39346, 36.626168, 35.356116, 35.37791, 35.022183, 34.224816, 34.141978, 34.391731, 33.7527, 32.715761, 32.412058, 32.15944, 31.78597, 31.540018, 31.305201, 31.49764, 32.304519, 32.693643, 32.405599, 31.731273, 31.791424, 31.384472, 30.757534, 30.971836, 30.873909, 29.896294, 29.371572, 29.229513, 28.176709, 27.855282, 27.770016, 27.288185, 27.716686, 27.42015, 28.131699, 27.98112, 29.1177, 28.07, 30.211107, 31.139991, 31.516092, 30.035872, 30.444685, 29.54443, 30.21765, 29.054589, 29.977426, 28.445944, 28.59193, 29.39955, 31.10108, 32.13272, 33.77547, 36.51396, 40.29234, 41.05987, 41.12595, 40.01583, 38.38295, 33.91871, 33.18444, 34.81477, 34.878574, 34.94391, 36.23129, 37.01273, 37.14197, 36.539579, 37.17604, 39.59345, 40.4356, 39.7626, 42.09309, 43.01604, 43.94975, 44.53226, 43.69839, 44.18795, 43.45282, 46.25, 46.82134, 45.55517, 45.56202, 46.34915, 47.89416, 48.13876, 50.22766, 53.71743, 54.47171, 53.48582, 54.72628, 55.44268, 57.31702, 58.802, 59.94142, 61.07784, 60.03, 60.55, 63.504, 64.888115, 68.51216, 69.18068, 68.16444, 68.13522, 66.93008, 67.25976, 66.72492, 66.69466, 68.54006, 69.19636, 69.94, 72.58754, 72.79603, 71.84811, 72.47011, 72.79188, 72.5647, 73.66787, 73.2387, 71.28, 72.42301, 72.82077, 73.92099, 74.18651, 75.052, 74.46926, 74.93584, 73.84236, 73.60187, 74.3998, 73.1011, 74.89082, 74.65926, 75.15801, 75.68351, 75.28898, 76.35911, 75.90313, 77.57665, 79.65202, 81.5, 80.61071, 80.51109, 82.25, 84.65526, 86.8223, 86.00956, 87.16682, 88.31571, 90.26, 92.90058, 93.23421, 95.86, 96.67821, 98.92254, 100.75967, 101.03532, 101.99084, 104.3516, 106.06664, 104.705, 106.97013, None, 105.07547, 99.43814, 101.2649, 102.08635, 102.837815, 105.37243, 105.07547, None, 51.136187, 49.793685, 48.894411, 48.754937, 47.586119, 46.502826, 47.072455, 44.846958, 46.799139, 48.318477, 48.522806, 49.09719, 50.039768, 51.522933, 51.136187, None, 99.93976, 97.75794, 94.97259, 93.31288, 92.5454, 91.18107, 93.77766, 95.940895, 97.88385, 100.186655, 99.93976, None, 30.419105, 30.816135, 30.758309, 30.469696, 29.938359, 29.632176, 29.024926, 29.117479, 29.254835, 29.291887, 29.579466, 29.821519, 30.419105, None, -8.794884, -8.817828, -8.66559, -8.665124, -8.6844, -8.687294, -11.969419, -11.937224, -12.874222, -13.118754, -12.929102, -16.845194, -17.063423, -17.020428, -17.002962, -14.750955, -14.630833, -14.221168, -13.89111, -12.500963, -12.030759, -11.71822, -11.392555, -10.551263, -10.189424, -9.735343, -9.413037, -8.794884, None, 42.779332, 42.649573, 42.347989, 42.270888, 41.754382, 41.221391, 40.939341, 40.247652, 39.801685, 39.139399, 39.023696, 39.066329, 38.492772, 38.02386, 37.483635, 37.154818, 37.209491, 36.931627, 36.639604, 36.249137, 35.640182, 35.130187, 34.632336, 34.787779, 34.83222, 34.956037, 36.068941, 36.501214, 36.740528, 37.503582, 37.66812, 37.998849, 37.002166, 39.004886, 39.195468, 40.399994, 41.889981, 44.709499, 46.568713, 47.459822, 47.708851, 48.416094, 48.807595, 49.299554, 49.470914, 50.152422, 50.212935, 50.113303, 50.239859, 50.527387, 50.660557, 50.810108, 51.112415, 51.389608, 51.579519, 51.617708, 52.000733, 55.006803, 55.208341, 55.666659, 54.999982, 52.00001, 49.116672, 48.183344, 47.466695, 47.000005, 46.749994, 46.366659, 45.399999, 45.216651, 44.062613, 43.791519, 43.380794, 43.115798, 43.218375, 42.779332, None, 33.963393, 33.824963, 33.842131, 33.721959, 33.206938, 33.086766, 33.206938, 32.743419, 32.67475, 32.073892, 32.314235, 32.400072, 31.850716, 31.352862, 30.837841, 29.996639, 29.618957, 29.515953, 29.000932, 28.966597, 27.97089, 27.833551, 27.112521, 26.752006, 26.477328, 25.962307, 25.790633, 25.069604, 24.794926, 24.537415, 24.194068, 23.88698, 23.805813, 23.459013, 23.394779, 23.55725, 23.554304, 22.977544, 22.864165, 22.87622, 22.50869, 22.49762, 22.28801, 21.93681, 22.03759, 22.29658, 22.18329, 22.51202, 22.30351, 22.56795, 23.02459, 23.88689, 23.83766, 23.85, 25, 25, 29.02, 32.9, 36.86623, 37.18872, 36.96941, 37.1147, 37.48179, 37.86276, 38.41009, 37.904, 37.16747, 36.85253, 36.75389, 36.32322, 36.42951, 36.27022, 35.86363, 35.26049, 34.83163, 34.73115, 34.25745, 33.96162, 33.963393, None, 33.963393, 33.97498, 33.8255, 33.2948, 32.95418, 33.56829, 34.0751, 34.25032, 34.70702, 35.298007, 34.620196, 34.005, 33.39, 32.68642, 31.88145, 31.24556, 30.83385, 29.95349, 29.715995, 29.159078, 28.696678, 28.428994, 27.979977, 27.374226, 27.213409, 26.465909, 26.213418, 25.796648, 25.124131, 25.114932, 24.567369, 23.88698, 24.194068, 24.537415, 24.794926, 25.069604, 25.790633, 25.962307, 26.477328, 26.752006, 27.112521, 27.833551, 27.97089, 28.966597, 29.000932, 29.515953, 29.618957, 29.996639, 30.837841, 31.352862, 31.850716, 32.400072, 32.314235, 32.073892, 32.67475, 32.743419, 33.206938, 33.086766, 33.206938, 33.721959, 33.842131, 33.824963, 33.963393, None, -16.713729, -17.126107, -17.625043, -17.185173, -16.700706, -16.463098, -16.12069, -15.623666, -15.135737, -14.577348, -14.099521, -13.435738, -12.830658, -12.17075, -12.124887, -11.927716, -11.553398, -11.467899, -11.513943, -11.658301, -12.203565, -12.278599, -12.499051, -13.217818, -13.700476, -15.548477, -15.816574, -16.147717, -16.677452, -16.841525, -15.931296, -15.691001, -15.511813, -15.141163, -14.712197, -14.277702, -13.844963, -14.046992, -14.376714, -14.687031, -15.081735, -15.39877, -15.624596, -16.713729, None, 162.119025, 162.398646, 161.700032, 161.319797, 161.917383, 162.119025, None, 160.852229, 160.462588, 159.849447, 159.640003, 159.702945, 160.362956, 160.688518, 160.852229, None, 161.679982, 161.529397, 160.788253, 160.579997, 160.920028, 161.280006, 161.679982, None, 159.875027, 159.917402, 159.133677, 158.586114, 158.21115, 158.359978, 158.820001, 159.640003, 159.875027, None, 157.538426, 157.33942, 156.90203, 156.491358, 156.542828, 157.14, 157.538426, None, -11.438779, -11.708195, -12.428099, -12.949049, -13.124025, -13.24655, -12.711958, -12.596719, -12.425929, -12.150338, -11.917277, -11.117481, -10.839152, -10.622395, -10.65477, -10.494315, -10.505477, -10.230094, -10.695595, -11.146704, -11.199802, -11.438779, None, -87.793111, -87.904112, -88.483302, -88.843228, -89.256743, -89.812394, -90.095555, -90.064678, -89.721934, -89.534219, -89.587343, -89.353326, -89.058512, -88.843073, -88.541231, -88.503998, -88.065343, -87.859515, -87.723503, -87.793111, None, 48.93813, 48.486736, 47.78942, 46.948328, 43.67875, 43.296975, 42.92812, 42.55876, 42.776852, 43.145305, 43.47066, 43.666668, 44.117804, 44.614259, 45.556941, 46.645401, 47.525658, 48.021596, 48.378784, 48.948206, 48.942005, 48.938491, 48.938233, 48.93813, None, 49.72862, 50.25878, 50.73202, 51.1112, 51.13387, 51.04153, 51.04531, 50.83418, 50.55239, 50.07092, 49.4527, 48.59455, 47.74079, 46.56476, 45.56399, 44.06815, 43.13597, 42.04157, 41.81095, 41.58513, 40.993, 40.98105, 41.855083, 42.12861, 42.76967, 43.66087, 44.9636, 47.78942, 48.486736, 48.93813, 48.938233, 48.938491, 48.942005, 48.948205, 49.26776, 49.72862, None, 20.874313, 21.483526, 21.562023, 22.145088, 22.459022, 22.705726, 22.474008, 22.65715, 22.410446, 22.500157, 22.986019, 22.604801, 22.436595, 22.545012, 22.380526, 21.91708, 21.576636, 21.54332, 21.66292, 21.77505, 21.63302, 21.43866, 21.27421, 21.143395, 20.95651, 20.81448, 20.63508, 20.49679, 20.25758, 20.3398, 19.95857, 19.63, 19.48389, 19.21852, 19.454, 19.59976, 19.11761, 19.36803, 19.00548, 19.390476, 19.072769, 18.82982, 19.596045, 20.220192, 20.762175, 20.874313, None, -57.147436, -55.949318, -55.84178, -55.03325, -53.958045, -54.478633, -54.399542, -54.006931, -54.181726, -54.269705, -54.524754, -55.097587, -55.569755, -55.973322, -56.073342, -55.9056, -55.995698, -56.539386, -57.150098, -57.281433, -57.601569, -58.044694, -57.86021, -57.914289, -57.307246, -57.147436, None, 18.853144, 18.909575, 19.320713, 19.825023, 20.415839, 20.887955, 21.607808, 22.558138, 22.280842, 22.085608, 21.872236, 20.801294, 20.473562, 20.239054, 19.769471, 19.661364, 19.174365, 18.777025, 18.696513, 17.857133, 17.488473, 16.979667, 16.879983, 16.960288, 17.101985, 17.545007, 17.886485, 17.913512, 18.104973, 18.170498, 18.399994, 18.554971, 18.853144, None, 13.806475, 14.632472, 15.137092, 16.011664, 16.202298, 16.370505, 16.564808, 15.768733, 15.67153, 15.323954, 15.327675, 14.935244, 14.595109, 14.411968, 13.71506, 13.93763, 13.69811, 13.806475, None, 22.183173, 21.213517, 21.369631, 19.778876, 17.847779, 17.119555, 17.831346, 18.787722, 17.869225, 16.829185, 16.44771, 15.879786, 14.666681, 14.100721, 12.942911, 12.625101, 11.787942, 11.027369, 11.468272, 12.300366, 12.631147, 11.992064, 11.930569, 12.579935, 13.571916, 13.919905, 13.55569, 15.108411, 16.108712, 16.768879, 17.729182, 17.993868, 19.87856, 20.025269, 20.645593, 21.978535, 23.539473, 23.56588, 23.903379, 22.183173, None, 17.061767, 17.210083, 16.430053, 16.364135, 17.061767, None, 19.35791, 18.8031, 18.825073, 18.995361, 18.951416, 18.693237, 18.709716, 18.462524, 18.319702, 18.105468, 18.187866, 18.072509, 18.154907, 18.094482, 18.660278, 19.039306, 19.105224, 19.374389, 19.35791, None, 20.846557, 21.066284, 20.9729, 20.824584, 20.695495, 20.819091, 20.799865, 20.846557, None, 32.071665, 31.86806, 31.282773, 30.685962, 30.676609, 30.949667, 31.04408, 31.333158, 31.837778, 31.985779, 32.071665, None, 38.792341, 36.834062, 35.719918, 35.700798, 35.836397, 35.821101, 36.06646, 36.61175, 36.448194, 35.998403, 35.905023, 36.149763, 36.41755, 36.685389, 36.739494, 37.066761, 38.167727, 38.699891, 39.52258, 40.673259, 41.212089, 42.349591, 41.837064, 41.289707, 41.383965, 41.006159, 38.792341, None, 14.495787, 14.595781, 13.954477, 13.956699, 13.540394, 13.97217, 15.247731, 15.300441, 15.685741, 15.903247, 15.487148, 15.47106, 15.096888, 14.8513, 15.86085, 19.84926, 23.83766, 23.88689, 23.02459, 22.56795, 22.30351, 22.51202, 22.18329, 22.29658, 22.03759, 21.93681, 22.28801, 22.49762, 22.50869, 22.87622, 22.864165, 22.231129, 21.723822, 21.000868, 20.059685, 19.094008, 18.81201, 18.911022, 18.389555, 17.96493, 16.705988, 16.456185, 16.290562, 16.106232, 15.27946, 15.436092, 15.120866, 14.979996, 14.544467, 13.954218, 14.171466, 14.627201, 14.909354, 15.467873, 14.923565, 14.960152, 14.89336, 14.495787, None, 1.865241, 1.060122, 0.836931, 0.570384, 0.490957, 0.712029, 0.461192, 0.365901, 0.36758, -0.049785, 0.023803, 0.899563, 0.772336, 1.077795, 1.425061, 1.463043, 1.664478, 1.618951, 1.865241, None, 102.584932, 101.687158, 100.83181, 100.978467, 100.097797, 100.018733, 99.478921, 99.153772, 99.222399, 99.873832, 100.279647, 100.459274, 101.017328, 101.623079, 102.141187, 101.814282, 101.154219, 101.075516, 100.259596, 100.085757, 99.690691, 99.519642, 98.988253, 98.503786, 98.339662, 98.150009, 98.25915, 98.553551, 99.038121, 99.587286, 99.196354, 99.212012, 99.097755, 98.430819, 98.192074, 98.537376, 98.903348, 98.493761, 97.859123, 97.375896, 97.797783, 98.253724, 98.959676, 99.543309, 100.115988, 100.548881, 100.606294, 101.282015, 101.035931, 101.059548, 102.113592, 102.413005, 102.998706, 103.200192, 103.956477, 104.716947, 104.779321, 105.589039, 105.544338, 105.218777, 104.281418, 102.988422, 102.348099, 102.584932, None, 71.014198, 70.648019, 69.55961, 69.464887, 70.549162, 71.784694, 73.675379, 73.928852, 74.257514, 74.864816, 74.829986, 74.980002, 73.948696, 73.260056, 72.63689, 72.193041, 71.844638, 71.448693, 71.541918, 71.239404, 71.348131, 70.806821, 70.376304, 70.270574, 70.116578, 69.518785, 69.196273, 68.859446, 68.135562, 67.83, 68.392033, 68.176025, 67.44222, 67.701429, 68.536416, 69.011633, 69.329495, 70.666622, 70.45816, 70.601407, 71.014198, None, 61.210817, 61.123071, 60.377638, 59.234762, 58.436154, 57.330434, 56.619366, 56.180375, 55.511578, 54.800304, 53.921598, 53.735511, 53.880929, 53.101028, 53.357808, 52.693973, 52.915251, 53.858139, 54.736845, 54.008311, 53.721713, 52.91675, 52.814689, 52.50246, 52.944293, 54.079418, 54.755345, 55.455251, 55.968191, 57.096391, 56.932215, 57.78653, 58.629011, 59.976422, 60.083341, 60.465953, 61.547179, 61.882714, 62.37426, 63.518015, 64.170223, 65.215999, 66.54615, 66.518607, 66.217385, 65.745631, 65.588948, 64.746105, 64.546479, 63.982896, 63.193538, 62.984662, 62.230651, 61.210817, None, 124.968682, 125.086246, 125.947072, 126.644704, 126.957243, 127.335928, 126.967992, 125.925885, 125.08852, 125.07002, 124.968682, None, -61.68, -61.105, -60.895, -60.935, -61.77, -61.95, -61.66, -61.68, None, 9.48214, 9.055603, 8.439103, 8.430473, 7.612642, 7.524482, 8.140981, 8.376368, 8.217824, 8.420964, 9.509994, 10.210002, 10.18065, 11.028867, 11.100026, 10.600005, 10.593287, 10.939519, 10.807847, 10.149593, 10.339659, 10.856836, 11.108501, 11.488787, 11.432253, 10.94479, 10.636901, 9.950225, 10.056575, 9.970017, 9.48214, None, 36.913127, 38.347665, 39.512607, 40.373433, 41.554084, 42.619549, 43.582746, 43.752658, 43.656436, 44.400009, 44.79399, 44.109225, 44.421403, 44.225756, 44.772699, 44.293452, 43.942259, 42.779126, 42.349591, 41.212089, 40.673259, 39.52258, 38.699891, 38.167727, 37.066761, 36.739494, 36.685389, 36.41755, 36.149763, 35.782085, 36.160822, 35.550936, 34.714553, 34.026895, 32.509158, 31.699595, 30.621625, 30.391096, 29.699976, 28.732903, 27.641187, 27.048768, 26.318218, 26.8047, 26.170785, 27.28002, 28.819978, 29.240004, 31.145934, 32.347979, 33.513283, 35.167704, 36.913127, None, 27.192377, 26.358009, 26.043351, 26.056942, 26.294602, 26.604196, 26.117042, 27.135739, 27.99672, 28.115525, 28.988443, 28.806438, 27.619017, 27.192377, None, 121.777818, 121.175632, 120.74708, 120.220083, 120.106189, 120.69468, 121.495044, 121.951244, 121.777818, None, 33.903711, 34.07262, 37.69869, 37.7669, 39.20222, 38.74054, 38.79977, 39.44, 39.47, 39.19469, 39.25203, 39.18652, 39.53574, 39.9496, 40.31659, 39.521, 38.427557, 37.82764, 37.47129, 36.775151, 36.514082, 35.312398, 34.559989, 34.28, 33.940838, 33.73972, 32.759375, 32.191865, 31.556348, 31.157751, 30.74, 30.2, 29.62, 29.419993, 29.519987, 29.339998, 29.753512, 30.11632, 30.50554, 30.75224, 30.74301, 30.52766, 30.46967, 30.758309, 30.816135, 30.419105, 30.76986, 31.86617, 33.903711, None, 31.86617, 30.76986, 30.419105, 29.821519, 29.579466, 29.587838, 29.8195, 29.875779, 30.086154, 30.468508, 30.85267, 31.174149, 30.77332, 30.83385, 31.24556, 31.88145, 32.68642, 33.39, 34.005, 34.47913, 34.59607, 35.03599, 34.6721, 34.18, 33.893569, 33.903711, 31.86617, None, 31.785998, 32.159412, 32.412058, 32.715761, 33.7527, 34.391731, 34.141978, 34.224816, 35.022183, 35.377924, 35.356116, 36.626168, 37.39346, 38.010631, 38.594988, 40.069058, 40.080789, 39.674664, 39.895632, 39.738278, 38.770585, 38.255112, 38.223538, 37.425137, 36.759855, 35.823685, 34.962342, 35.020788, 35.510009, 36.529998, 36.334713, 35.239999, 33.882511, 33.326421, 33.546924, 32.454174, 32.630804, 33.588162, 33.298567, 31.74414, 31.675307, 30.748749, 30.377609, 29.603289, 29.149725, 28.679779, 28.233554, 28.485269, 28.659987, 28.933717, 28.862972, 29.072107, 29.170654, 29.759972, 30.024659, 29.83821, 29.908852, 29.559674, 29.415135, 29.050868, 29.122698, 28.670891, 28.259547, 27.522537, 26.857824, 26.619337, 26.19745, 25.945941, 25.207743, 24.866317, 24.402056, 23.760958, 23.142236, 22.710531, 22.64082, 22.085608, 22.280842, 22.558138, 22.776419, 22.51845, 23.426508, 23.922757, 24.029986, 23.527071, 24.005078, 24.553106, 25.327788, 26.337959, 27.454066, 28.241615, 28.617613, 28.992835, 29.254938, 30.157364, 30.555117, 30.619454, 30.927549, 31.785998, None, -57.625133, -56.976026, -55.973245, -55.60151, -54.572452, -53.787952, -53.209589, -53.650544, -53.373662, -53.806426, -54.935866, -55.67409, -56.215297, -57.139685, -57.817861, -58.427074, -58.349611, -58.132648, -58.14244, -57.874937, -57.625133, None, -155.54211, -155.68817, -155.93665, -155.90806, -156.07347, -156.02368, -155.85008, -155.91907, -155.86108, -155.78505, -155.40214, -155.22452, -155.06226, -154.80741, -154.83147, -155.22217, -155.54211, None, -156.07926, -156.41445, -156.58673, -156.70167, -156.71055, -156.61258, -156.25711, -155.99566, -156.07926, None, -156.75824, -156.78933, -157.32521, -157.25027, -156.75824, None, -157.65283, -157.70703, -157.7786, -158.12667, -158.2538, -158.29265, -158.0252, -157.94161, -157.65283, None, -159.34512, -159.46372, -159.80051, -159.74877, -159.5962, -159.36569, -159.34512, None, -94.81758, -94.64, -94.32914, -93.63087, -92.61, -91.64, -90.83, -89.6, -89.272917, -88.378114, -87.439793, -86.461991, -85.652363, -84.87608, -84.779238, -84.543749, -84.6049, -84.3367, -84.14212, -84.091851, -83.890765, -83.616131, -83.469551, -83.592851, -82.550925, -82.337763, -82.137642, -82.43, -82.9, -83.12, -83.142, -83.02981, -82.690089, -82.439278, -81.277747, -80.247448, -78.939362, -78.92, -79.01, -79.171674, -78.72028, -77.737885, -76.820034, -76.5, -76.375, -75.31821, -74.867, -73.34783, -71.50506, -71.405, -71.08482, -70.66, -70.305, -69.99997, -69.237216, -68.905, -68.23444, -67.79046, -67.79134, -67.13741, -66.96466, -68.03252, -69.06, -70.11617, -70.645476, -70.81489, -70.825, -70.495, -70.08, -70.185, -69.88497, -69.96503, -70.64, -71.12039, -71.86, -72.295, -72.87643, -73.71, -72.24126, -71.945, -73.345, -73.982, -73.952325, -74.25671, -73.96244, -74.17838, -74.90604, -74.98041, -75.20002, -75.52805, -75.32, -75.071835, -75.05673, -75.37747, -75.94023, -76.03127, -75.72205, -76.23287, -76.35, -76.542725, -76.32933, -76.989998, -76.30162, -76.25874, -75.9718, -75.86804, -75.72749, -76.36318, -77.397635, -78.05496, -78.55435, -79.06067, -79.20357, -80.301325, -80.86498, -81.33629, -81.49042, -81.31371, -80.98, -80.535585, -80.53, -80.056539, -80.088015, -80.13156, -80.38103, -80.68, -81.17213, -81.33, -81.71, -82.24, -82.70515, -82.85526, -82.65, -82.93, -83.70959, -84.1, -85.10882, -85.28784, -85.7731, -86.4, -87.53036, -88.41782, -89.18049, -89.593831, -89.413735, -89.43, -89.21767, -89.40823, -89.77928, -90.15463, -90.880225, -91.626785, -92.49906, -93.22637, -93.84842, -94.69, -95.60026, -96.59404, -97.14, -97.37, -97.38, -97.33, -97.14, -97.53, -98.24, -99.02, -99.3, -99.52, -100.11, -100.45584, -100.9576, -101.6624, -102.48, -103.11, -103.94, -104.45697, -104.70575, -105.03737, -105.63159, -106.1429, -106.50759, -108.24, -108.24194, -109.035, -111.02361, -113.30498, -114.815, -114.72139, -115.99135, -117.12776, -117.295938, -117.944, -118.410602, -118.519895, -119.081, -119.438841, -120.36778, -120.62286, -120.74433, -121.71457, -122.54747, -122.51201, -122.95319, -123.7272, -123.86517, -124.39807, -124.17886, -124.2137, -124.53284, -124.14214, -124.020535, -123.89893, -124.079635, -124.39567, -124.68721, -124.566101, -123.12, -122.58736, -122.34, -122.5, -122.84, -120, -117.03121, -116.04818, -113, -110.05, -107.05, -104.04826, -100.65, -97.22872, -95.15907, -95.15609, -94.81758, None, -153.006314, -154.00509, -154.516403, -154.670993, -153.76278, -153.228729, -152.564791, -152.141147, -153.006314, None, -165.579164, -166.19277, -166.848337, -167.455277, -166.467792, -165.67443, -165.579164, None, -171.731657, -171.114434, -170.491112, -169.682505, -168.689439, -168.771941, -169.52944, -170.290556, -170.671386, -171.553063, -171.791111, -171.731657, None, -155.06779, -154.344165, -153.900006, -152.210006, -152.270002, -150.739992, -149.720003, -147.613362, -145.68999, -144.920011, -143.589446, -142.07251, -140.985988, -140.992499, -140.99777, -140.012998, -139.039, -138.34089, -137.4525, -136.47972, -135.47583, -134.945, -134.27111, -133.355549, -132.73042, -131.70781, -130.00778, -129.979994, -130.53611, -131.085818, -131.967211, -132.250011, -133.539181, -134.078063, -135.038211, -136.628062, -137.800006, -139.867787, -140.825274, -142.574444, -143.958881, -145.925557, -147.114374, -148.224306, -148.018066, -148.570823, -149.727858, -150.608243, -151.716393, -151.859433, -151.409719, -150.346941, -150.621111, -151.895839, -152.57833, -154.019172, -153.287511, -154.232492, -155.307491, -156.308335, -156.556097, -158.117217, -158.433321, -159.603327, -160.28972, -161.223048, -162.237766, -163.069447, -164.785569, -164.942226, -163.84834, -162.870001, -161.804175, -160.563605, -160.07056, -158.684443, -158.461097, -157.72277, -157.550274, -157.041675, -158.194731, -158.517218, -159.058606, -159.711667, -159.981289, -160.355271, -161.355003, -161.968894, -162.054987, -161.874171, -162.518059, -163.818341, -164.662218, -165.346388, -165.350832, -166.121379, -165.734452, -164.919179, -164.562508, -163.753332, -163.067224, -162.260555, -161.53445, -160.772507, -160.958335, -161.518068, -160.777778, -161.391926, -162.45305, -162.757786, -163.546394, -164.96083, -166.425288, -166.845004, -168.11056, -166.705271, -164.47471, -163.652512, -163.788602, -161.677774, -162.489715, -163.719717, -164.430991, -165.390287, -166.764441, -166.204707, -164.430811, -163.168614, -162.930566, -161.908897, -160.934797, -159.039176, -158.119723, -156.580825, -155.06779, None, 66.518607, 66.54615, 65.215999, 64.170223, 63.518015, 62.37426, 61.882714, 61.547179, 60.465953, 60.083341, 59.976422, 58.629011, 57.78653, 56.932215, 57.096391, 55.968191, 55.928917, 58.503127, 58.689989, 60.239972, 61.05832, 62.0133, 63.185787, 64.900824, 66.098012, 66.023392, 66.510649, 66.714047, 67.985856, 68.259896, 68.632483, 69.070027, 70.388965, 70.962315, 71.259248, 70.420022, 71.157859, 71.870115, 73.055417, 71.774875, 71.014198, 70.601407, 70.45816, 70.666622, 69.329495, 69.011633, 68.536416, 67.701429, 67.44222, 68.176025, 68.392033, 67.83, 67.075782, 66.518607, None, -71.331584, -71.360006, -71.94705, -71.620868, -71.633064, -72.074174, -71.695644, -71.264559, -71.039999, -71.350084, -71.400623, -70.155299, -70.293843, -69.943245, -69.5843, -68.882999, -68.233271, -68.194127, -67.296249, -66.227864, -65.655238, -64.890452, -64.329479, -64.318007, -63.079322, -61.880946, -62.730119, -62.388512, -61.588767, -60.830597, -60.671252, -60.150096, -59.758285, -60.550588, -60.637973, -60.295668, -60.543999, -61.159336, -61.139415, -61.410303, -60.733574, -60.601179, -60.966893, -62.08543, -62.804533, -63.093198, -63.888343, -64.628659, -64.816064, -64.368494, -64.408828, -64.269999, -63.422867, -63.368788, -64.083085, -64.199306, -64.611012, -65.354713, -65.548267, -66.325765, -66.876326, -67.181294, -67.447092, -67.809938, -67.303173, -67.337564, -67.621836, -67.823012, -67.744697, -67.521532, -67.34144, -67.695087, -68.265052, -68.985319, -69.38948, -70.093313, -70.674234, -71.960176, -72.198352, -72.444487, -72.479679, -72.360901, -72.439862, -72.660495, -72.78873, -73.304952, -73.027604, -72.905286, -72.614658, -72.227575, -71.973922, -71.331584, None, 108.05018, 106.715068, 105.881682, 105.662006, 106.426817, 107.361954, 108.269495, 108.877107, 109.33527, 109.200136, 108.36613, 107.220929, 106.405113, 105.158264, 104.795185, 105.076202, 104.334335, 105.199915, 106.24967, 105.810524, 107.491403, 107.614548, 107.382727, 107.564525, 107.312706, 106.556008, 105.925762, 105.094598, 103.896532, 104.183388, 104.822574, 104.435, 103.203861, 102.754896, 102.170436, 102.706992, 103.504515, 104.476858, 105.329209, 105.811247, 106.725403, 106.567273, 107.04342, 108.05018, None, 167.844877, 167.515181, 167.180008, 167.216801, 167.844877, None, 167.107712, 167.270028, 167.001207, 166.793158, 166.649859, 166.629137, 167.107712, None, 35.545665, 35.545252, 35.397561, 34.927408, 34.970507, 35.225892, 34.974641, 35.18393, 35.545665, None, 53.108573, 52.385206, 52.191729, 52.168165, 51.172515, 49.574576, 48.679231, 48.238947, 47.938914, 47.354454, 46.717076, 45.877593, 45.62505, 45.406459, 45.144356, 44.989533, 44.494576, 44.175113, 43.482959, 43.222871, 43.251448, 43.087944, 42.892245, 42.604873, 42.805015, 42.702438, 42.823671, 42.779332, 43.218375, 43.115798, 43.380794, 43.791519, 44.062613, 45.216651, 45.399999, 46.366659, 46.749994, 47.000005, 47.466695, 48.183344, 49.116672, 52.00001, 52.782184, 53.108573, None, 31.521001, 31.325561, 30.901763, 30.622813, 30.055716, 28.925553, 28.219756, 27.464608, 26.419452, 25.909664, 25.780628, 25.172862, 24.677853, 23.594043, 22.988189, 22.574157, 21.542799, 20.689053, 20.071261, 19.616405, 19.193278, 18.855315, 18.424643, 18.377411, 18.244499, 18.25008, 17.92519, 18.24791, 18.221762, 17.566918, 17.064416, 17.062918, 16.344977, 16.824017, 17.218929, 17.387497, 17.836152, 18.464899, 19.002127, 19.894734, 19.895768, 20.165726, 20.758609, 20.66647, 20.889609, 21.605896, 22.105969, 22.579532, 22.824271, 23.312097, 23.73357, 24.211267, 25.025171, 25.664666, 25.765849, 25.941652, 26.485753, 26.786407, 27.11941, 28.017236, 29.432188, 29.839037, 30.322883, 30.659865, 31.191409, 31.670398, 31.930589, 31.752408, 31.837778, 31.333158, 31.04408, 30.949667, 30.676609, 30.685962, 31.282773, 31.86806, 32.071665, 32.83012, 32.580265, 32.462133, 32.203389, 31.521001, None, 32.759375, 33.231388, 33.485688, 33.31531, 33.114289, 33.306422, 32.991764, 32.688165, 33.214025, 30.179481, 30.274256, 29.516834, 28.947463, 28.825869, 28.467906, 27.598243, 27.044427, 26.706773, 26.381935, 25.264226, 25.084443, 25.07695, 24.682349, 24.033862, 23.215048, 22.562478, 21.887843, 21.933886, 24.016137, 23.930922, 24.079905, 23.904154, 24.017894, 23.912215, 24.257155, 24.314516, 24.78317, 25.418118, 25.75231, 26.553088, 27.16442, 27.388799, 28.155109, 28.523562, 28.934286, 29.699614, 29.616001, 29.341548, 28.642417, 28.372253, 28.49607, 28.673682, 28.449871, 28.734867, 29.002912, 30.346086, 30.740015, 31.157751, 31.556348, 32.191865, 32.759375, None, 31.191409, 30.659865, 30.322883, 29.839037, 29.432188, 28.794656, 28.02137, 27.727228, 27.724747, 27.296505, 26.164791, 25.850391, 25.649163, 25.264226, 26.381935, 26.706773, 27.044427, 27.598243, 28.467906, 28.825869, 28.947463, 29.516834, 30.274256, 30.338955, 31.173064, 31.636498, 31.852041, 32.328239, 32.847639, 32.849861, 32.654886, 32.611994, 32.772708, 32.659743, 32.508693, 32.244988, 31.191409, None]
-
-COUNTRY_LATS = [35.650072, 35.270664, 35.404041, 35.857166, 36.007957, 36.312073, 37.111818, 37.305217, 37.661164, 37.39379, 37.362784, 37.356144, 37.144994, 37.023115, 37.344336, 37.151144, 37.608997, 37.588223, 37.735165, 38.138396, 38.486282, 38.258905, 37.953265, 37.905774, 37.065645, 36.738171, 36.948288, 37.047558, 37.495257, 37.421566, 37.41999, 37.133031, 37.020841, 36.836176, 36.720007, 36.509942, 36.074388, 35.650563, 35.153203, 34.733126, 34.348911, 33.988856, 34.02012, 33.358533, 33.105499, 32.501944, 31.901412, 31.620189, 31.71331, 31.58293, 31.303154, 31.304911, 30.738899, 29.887943, 29.472181, 29.560031, 29.340819, 29.468331, 29.318572, 29.829239, 30.73585, 31.379506, 31.548075, 32.18292, 32.981269, 33.528832, 33.676446, 34.404102, 35.650072, None, -5.87747, -6.622645, -7.222298, -7.545689, -8.068551, -7.987678, -7.847014, -7.988246, -7.738184, -7.155429, -7.116361, -6.94309, -6.939318, -7.299606, -7.290872, -7.920085, -8.305901, -8.908707, -9.523708, -9.894796, -11.084801, -10.993075, -11.017622, -10.867863, -10.926826, -11.237298, -11.722282, -12.191297, -12.565848, -12.911046, -12.898437, -16.08031, -16.898451, -17.523116, -17.930636, -17.789095, -17.309951, -17.353101, -17.423381, -16.971212, -16.941343, -17.111668, -17.301889, -16.673142, -15.793816, -14.878316, -14.449144, -13.5477, -13.137906, -12.48363, -12.038645, -11.297863, -10.731076, -10.373578, -9.766897, -9.166934, -8.959091, -8.562629, -7.596539, -6.927122, -6.294448, -6.100092, -5.965682, -5.984389, -5.864241, -5.87747, None, -5.684304, -5.789931, -5.037987, -4.60623, -4.438023, -4.781103, -4.991271, -5.248362, -5.684304, None, 41.855404, 41.515089, 41.086226, 40.842727, 40.580004, 40.435, 40.110007, 39.624998, 39.694993, 39.915006, 40.250773, 40.72723, 41.409566, 41.719986, 41.877548, 42.195745, 42.688247, 42.500093, 42.58863, 42.32026, 42.21787, 41.855404, None, 24.245497, 24.294073, 24.019826, 24.177439, 24.151317, 24.121758, 24.797892, 25.439145, 26.055464, 25.714606, 24.924732, 24.920831, 24.269604, 24.130543, 23.933604, 23.524869, 23.110993, 22.70833, 22.496948, 23.001154, 24.014219, 24.245497, None, -55.2, -55.25, -54.89681, -54.87001, -54.8695, -52.63637, -53.1, -53.85, -54.45, -54.7, -55.2, None, -22.075862, -22.798091, -21.993644, -22.034985, -22.249029, -23.880713, -24.032796, -24.771459, -25.16234, -25.603657, -27.123719, -27.395899, -27.548499, -27.387837, -26.621786, -25.739255, -25.547639, -26.124865, -26.923473, -27.474757, -27.881915, -28.852761, -30.216295, -31.016556, -32.044504, -33.040567, -33.263189, -33.909454, -34.43149, -35.288027, -35.97739, -36.413126, -36.901572, -38.183871, -38.72022, -38.928425, -38.827707, -39.424105, -40.172586, -40.676897, -41.028761, -41.166789, -40.802677, -41.064315, -42.058001, -42.359016, -42.043687, -42.563138, -42.873558, -43.495381, -44.501366, -45.036786, -45.039628, -45.551896, -46.301773, -47.033925, -47.236135, -48.133289, -48.697337, -49.869669, -50.264218, -50.73251, -51.771104, -52.349983, -52.299444, -52.142761, -52.009022, -51.425956, -50.67701, -50.74145, -50.378785, -49.318436, -48.878618, -48.244238, -47.738533, -46.884838, -45.560733, -44.973689, -44.784243, -44.407522, -44.207172, -43.787611, -43.408565, -42.254888, -42.051386, -40.832339, -39.808164, -38.916022, -38.552995, -37.576827, -36.658124, -36.005089, -35.169688, -34.193571, -33.273886, -33.09121, -31.36501, -30.336339, -29.367923, -28.459141, -27.521214, -26.89934, -26.506909, -26.185016, -24.518555, -24.025303, -22.986349, -22.735925, -21.83231, -22.075862, None, 41.092143, 41.248129, 40.985354, 40.81229, 40.561504, 40.218476, 39.899994, 39.628021, 39.464155, 38.770605, 38.741201, 39.319719, 39.473999, 39.471751, 39.740004, 39.713003, 40.005, 40.253564, 40.740201, 41.092143, None, -80.040179, -80.549657, -81.000327, -80.863178, -80.921934, -80.588827, -80.549657, -80.255773, -80.294944, -80.39287, -79.981371, -79.628679, -80.040179, None, -79.497059, -79.634209, -79.281465, -78.928774, -78.869966, -78.595667, -78.223338, -78.380176, -78.693645, -79.046338, -79.497059, None, -78.04707, -78.478103, -79.08556, -79.516645, -80.026123, -80.339644, -80.594357, -80.829485, -81.025442, -80.966685, -80.633528, -80.222028, -79.94773, -79.614623, -79.183487, -78.811209, -78.458569, -78.047018, -78.047019, -78.04707, -77.831476, -78.04707, None, -73.50099, -73.657725, -73.481353, -73.834097, -74.08881, -74.010468, -73.657778, -73.657777, -73.324619, -73.50099, None, -73.481353, -73.873268, -73.834097, -73.736118, -73.461769, -73.461768, -73.246226, -73.481353, None, -71.933334, -72.070535, -71.952971, -72.521205, -72.442864, -72.482035, -72.442864, -72.50162, -72.305663, -71.894164, -71.717792, -71.854993, -71.933334, None, -70.955823, -71.406493, -71.798407, -72.170736, -72.307885, -72.503842, -72.484257, -72.092343, -72.229492, -72.366693, -72.072757, -71.661258, -71.269345, -71.269344, -71.15178, -71.190951, -70.681473, -70.309196, -69.505782, -69.035475, -68.87874, -69.251017, -69.623346, -70.074016, -70.505153, -70.955823, None, -64.152467, -64.36801, -64.211223, -64.309202, -64.54433, -64.799094, -65.09303, -65.484942, -65.857219, -66.190326, -66.425505, -66.503847, -66.837004, -67.150474, -67.58161, -67.953887, -68.365335, -68.678908, -68.913984, -69.227556, -69.619419, -69.991747, -70.383661, -70.716768, -71.089045, -72.010074, -72.382351, -72.774265, -73.166179, -73.695242, -74.106742, -74.439848, -74.576997, -74.92974, -75.262847, -75.635124, -75.79191, -76.007452, -76.222995, -76.634494, -76.673665, -76.634494, -76.712887, -76.712887, -77.104802, -77.28107, -77.55542, -77.908112, -78.221633, -78.123654, -78.378419, -78.789918, -79.181833, -79.514939, -79.887216, -80.259545, -80.416331, -80.69063, -81.004151, -81.317672, -81.474458, -81.748757, -82.042692, -82.37585, -82.846106, -83.218434, -82.865691, -82.571755, -82.258235, -82.003521, -81.729171, -81.709586, -81.846735, -82.081915, -81.65083, -81.356894, -81.337309, -81.121715, -80.906172, -80.769023, -80.592651, -80.337938, -79.985195, -79.632503, -79.260226, -79.299397, -79.456132, -79.456132, -79.083855, -78.339248, -78.123654, -77.888526, -77.65345, -77.359515, -77.065579, -76.673665, -76.497345, -76.360144, -76.281803, -76.24258, -76.105431, -75.909474, -75.674346, -75.439218, -75.125698, -74.79254, -74.498604, -74.106742, -73.871614, -73.460114, -73.146542, -72.950585, -72.715457, -72.401936, -72.010074, -71.539767, -71.265416, -71.324224, -71.65733, -71.696501, -71.324224, -70.93231, -71.030289, -71.402617, -71.461373, -71.285053, -71.167438, -71.226246, -71.637745, -71.304639, -71.128267, -70.991118, -70.853917, -70.618789, -70.462055, -70.246512, -69.893769, -70.148534, -70.011333, -70.48164, -70.834332, -70.638375, -70.246512, -69.972162, -70.030918, -70.403247, -70.030918, -69.913354, -69.874183, -69.893769, -70.011333, -70.07014, -70.403247, -70.697182, -70.520811, -70.48164, -70.48164, -70.462055, -70.324854, -70.20729, -69.93294, -69.75662, -69.658641, -69.384291, -68.835642, -68.502588, -68.659271, -69.012014, -69.247142, -69.168748, -69.52144, -69.776205, -69.541077, -69.109941, -68.933621, -68.600514, -68.463313, -68.267408, -68.051866, -67.816738, -67.601196, -67.718759, -67.366068, -67.091718, -67.111303, -66.876175, -66.523484, -66.249133, -66.053176, -65.89639, -65.818049, -65.876805, -65.974783, -66.249133, -66.680218, -67.013324, -67.287675, -67.405239, -67.679589, -67.953887, -68.012695, -67.816738, -67.405239, -67.620729, -67.738345, -67.855909, -67.934302, -67.934302, -68.972791, -69.227556, -69.678226, -69.93294, -70.305268, -70.697182, -70.677545, -71.069459, -71.441788, -71.853287, -72.166808, -72.264787, -72.088415, -71.696501, -71.324224, -71.010703, -70.716768, -70.364024, -69.874183, -69.776205, -69.737034, -69.619419, -69.462684, -69.07077, -68.698441, -68.326216, -68.071503, -67.875546, -67.542388, -67.366068, -67.209282, -67.30726, -67.209282, -67.091718, -67.150474, -66.876175, -66.209911, -66.484261, -66.954568, -67.150474, -67.228867, -67.111303, -67.189696, -67.209282, -67.111303, -67.170111, -67.385653, -67.248504, -67.248504, -67.111303, -67.248504, -66.915346, -66.58224, -66.30789, -65.563284, -65.700485, -65.974783, -66.327527, -66.934931, -66.954568, -66.954568, -66.837004, -66.699804, -66.425505, -66.13157, -66.092347, -65.876805, -66.072762, -66.386283, -66.699804, -66.660633, -66.915346, -67.170111, -67.268089, -67.189696, -66.876175, -66.562654, -66.484261, -66.621462, -66.719389, -66.562654, -66.562654, -66.660633, -66.758611, -66.58224, -66.425505, -66.386283, -66.386283, -66.288304, -66.209963, -65.72007, -65.308571, -65.582869, -66.033591, -66.44509, -66.778197, -66.954568, -66.895761, -66.876175, -66.817367, -66.817367, -66.797782, -66.837004, -66.915346, -67.228867, -67.601196, -67.895131, -68.130259, -68.385024, -68.561292, -68.71813, -68.874813, -68.894502, -68.561292, -68.835642, -69.149215, -69.384291, -69.482269, -69.599833, -69.991747, -70.226875, -70.579618, -70.736353, -70.716768, -70.775524, -70.755938, -70.834332, -70.971481, -71.20666, -71.402617, -71.696501, -72.088415, -72.441159, -72.891829, -73.24452, -73.65602, -73.812806, -74.165498, -74.38104, -74.772954, -75.145283, -75.458804, -75.870303, -76.24258, -76.693302, -77.065579, -77.457442, -77.82977, -78.182514, -78.319611, -78.750748, -78.907483, -79.123025, -79.162248, -79.730482, -80.200737, -80.573066, -80.945395, -81.278501, -81.690001, -82.062278, -82.395435, -82.708956, -83.022477, -83.335998, -83.825891, -84.041433, -84.117914, -84.41371, -84.158997, -84.472518, -84.71338, -84.721443, -84.139412, -84.452933, -84.417941, -84.099259, -84.110449, -84.117914, -84.534323, -84.117914, -84.061019, -83.884647, -84.117914, -84.23739, -84.570497, -84.82521, -85.138731, -85.37391, -85.09956, -85.295517, -85.609038, -85.315102, -85.040752, -84.570497, -84.531274, -84.296146, -83.904232, -83.68869, -83.23802, -82.82652, -82.454192, -82.042692, -81.768394, -81.41565, -81.102129, -81.160937, -81.004151, -81.337309, -81.043373, -80.671045, -80.337938, -79.926439, -79.652089, -79.358205, -79.299397, -79.162248, -79.064269, -78.69194, -78.378419, -78.025676, -76.889207, -76.987238, -77.300759, -77.202728, -77.065579, -77.496664, -77.398737, -77.183143, -76.908845, -76.575738, -76.47776, -76.105431, -75.733154, -75.380411, -75.204039, -75.537197, -75.34124, -75.086475, -75.06689, -74.968911, -74.733783, -74.518241, -74.302699, -74.361455, -74.439848, -74.302699, -74.479019, -74.459433, -74.322284, -74.420263, -74.518241, -74.479019, -74.498604, -74.518241, -74.479019, -74.185083, -74.028348, -74.243891, -74.067519, -73.714828, -74.028348, -74.38104, -74.714198, -74.420263, -74.79254, -74.910103, -75.184454, -75.125698, -74.949326, -74.988497, -75.125698, -75.302018, -74.870933, -74.537826, -74.185083, -74.106742, -73.734413, -73.362084, -72.61753, -72.754679, -72.813436, -72.754679, -72.911414, -73.20535, -73.558041, -73.616849, -73.4797, -73.283743, -73.166179, -73.401307, -73.322914, -72.558722, -73.009393, -73.185764, -73.087786, -73.4797, -73.518871, -73.636434, -73.851977, -73.4797, -73.126956, -73.518871, -73.420892, -73.636434, -73.969541, -73.871614, -73.65602, -73.401307, -73.264157, -73.146542, -73.009393, -72.79385, -72.480329, -72.049244, -71.637745, -71.245831, -70.853917, -70.462055, -70.109311, -69.717397, -69.325535, -68.953206, -68.541707, -68.149844, -67.718759, -67.326845, -66.876175, -66.58224, -66.209963, -65.89639, -65.602506, -65.171423, -64.897073, -64.642308, -64.583552, -64.270031, -64.074074, -63.95651, -63.701745, -63.388224, -63.27066, -63.525425, -63.858532, -64.152467, None, -48.625, -48.94, -49.065, -49.255, -49.71, -49.775, -49.2425, -48.83, -48.625, None, -40.792549, -41.137695, -41.000546, -40.808258, -40.875438, -42.062445, -42.407024, -43.211522, -42.937689, -43.634597, -43.580854, -43.549745, -42.693776, -42.03361, -41.162552, -40.703975, -40.792549, None, -13.763656, -14.548311, -14.171176, -14.594458, -14.984976, -15.428205, -16.285672, -16.784918, -16.906926, -17.761655, -18.280073, -18.958274, -19.480723, -19.955939, -20.39121, -20.633469, -21.260511, -22.342512, -22.122784, -22.556142, -22.402405, -23.462237, -24.076256, -24.457887, -25.267501, -26.071173, -26.641319, -27.2603, -28.110067, -28.995077, -29.458202, -30.35024, -30.923642, -31.640446, -32.550003, -33.041342, -33.816023, -34.31036, -35.17346, -35.671879, -36.420206, -37.109052, -37.425261, -37.772681, -37.809061, -38.219217, -38.606532, -39.035757, -38.593768, -38.417448, -37.896188, -38.085324, -38.809465, -38.538268, -38.380034, -38.308514, -38.019333, -37.402936, -36.643603, -36.138362, -35.732754, -35.612296, -35.127261, -34.384723, -35.076825, -35.260535, -34.707339, -34.130268, -33.640479, -32.900007, -33.752771, -34.094766, -34.890118, -34.47867, -33.947953, -33.222778, -32.848072, -32.617234, -32.011224, -31.982647, -31.495803, -31.590423, -31.948489, -32.282267, -32.215966, -32.728751, -32.959487, -33.483847, -33.890179, -33.914467, -34.003402, -33.821036, -33.930177, -33.976065, -34.509366, -34.464149, -34.746819, -35.064733, -35.025459, -35.025097, -34.386428, -34.196517, -33.623425, -33.487258, -33.259572, -32.900369, -32.205062, -31.612437, -30.601594, -30.030725, -29.461095, -28.810231, -28.516399, -28.118077, -27.334765, -26.543134, -26.116545, -26.549025, -25.621278, -25.911235, -26.298446, -25.786281, -24.998939, -24.683971, -24.384764, -23.80635, -23.560215, -23.059987, -22.475475, -21.755881, -22.517488, -21.82952, -21.495173, -21.068688, -20.701682, -20.623599, -20.746899, -20.374208, -20.263311, -20.044203, -19.952942, -19.976506, -19.683708, -19.239756, -18.705318, -18.197649, -17.798603, -17.254967, -16.4052, -17.268558, -17.069035, -16.596506, -16.111316, -16.327944, -15.56706, -15.0751, -14.680396, -14.51007, -14.230656, -14.347341, -14.095987, -13.952791, -13.817968, -14.276906, -14.86917, -14.875991, -14.969784, -14.42067, -13.618703, -13.357376, -13.10752, -12.536392, -12.183649, -12.302453, -12.114041, -11.603012, -11.273782, -11.128519, -11.376411, -11.786515, -12.042365, -11.941183, -12.248606, -11.962267, -12.049342, -11.857209, -12.351959, -12.887223, -13.29123, -13.324509, -13.724278, -14.223989, -14.715432, -14.997741, -15.550265, -15.870762, -16.215082, -16.807604, -16.806622, -17.062679, -17.371601, -17.710805, -17.369069, -16.832047, -16.38887, -15.840532, -15.044921, -14.561333, -14.270395, -13.698078, -12.944688, -12.741548, -12.407614, -11.877466, -11.328042, -11.042737, -10.668186, -11.157355, -11.784707, -11.90563, -12.325656, -12.834358, -13.400422, -13.763656, None, 48.123497, 47.714866, 47.712902, 47.496171, 46.852386, 46.683611, 46.658703, 46.431817, 46.509306, 46.767559, 47.115393, 46.941579, 46.751359, 46.893546, 46.920728, 47.10281, 47.347601, 47.525058, 47.580197, 47.302488, 47.566399, 47.523766, 47.703083, 47.672388, 47.467646, 47.637584, 48.289146, 48.416115, 48.877172, 48.555305, 48.964402, 49.039074, 48.733899, 48.785808, 48.596982, 48.470013, 48.123497, None, 39.740004, 39.471751, 39.473999, 39.319719, 38.741201, 38.874139, 39.335765, 39.713003, 39.740004, None, 41.219732, 41.151416, 41.405819, 41.80887, 41.282287, 40.572924, 40.526157, 40.256561, 40.176101, 39.399482, 39.049219, 38.815486, 38.320245, 38.270378, 38.794015, 39.288765, 39.582235, 39.508364, 38.770605, 39.464155, 39.628021, 39.899994, 40.218476, 40.561504, 40.81229, 40.985354, 41.248129, 41.411452, 41.123873, 41.064445, 41.181673, 41.722802, 41.860675, 41.827137, 41.219732, None, -4.499983, -3.293907, -2.839258, -2.917858, -2.348487, -2.413858, -2.807632, -3.034285, -3.35933, -3.568567, -4.090138, -4.452389, -4.499983, None, 51.345781, 51.267259, 51.475024, 51.037298, 50.803721, 50.128052, 50.090328, 49.529484, 49.985373, 49.907497, 50.378992, 50.780363, 50.796848, 51.148506, 51.345781, None, 6.258817, 6.142158, 6.832038, 9.12859, 9.334624, 9.825395, 10.175607, 10.470808, 10.997339, 11.110511, 11.547719, 11.64115, 11.94015, 12.233052, 12.235636, 11.660167, 11.327939, 10.734746, 10.332186, 10.06321, 9.444153, 9.137608, 8.506845, 7.870734, 6.258817, None, 9.642461, 9.900326, 9.862344, 9.610835, 9.821985, 10.152714, 10.370737, 10.95127, 11.375146, 11.713859, 12.542646, 13.228444, 13.472485, 13.337662, 13.541267, 13.79815, 14.246418, 14.559008, 14.973815, 15.116158, 14.924309, 14.928908, 14.444235, 13.988733, 13.33575, 12.851826, 12.625018, 11.94015, 11.64115, 11.547719, 11.110511, 10.997339, 11.018682, 11.098341, 10.93693, 11.009819, 10.96269, 10.395335, 9.642461, None, 22.041239, 21.324048, 21.475485, 20.670883, 21.192195, 21.70157, 22.182936, 22.765019, 22.805017, 22.392794, 21.836368, 22.039146, 21.857116, 21.966179, 22.055708, 22.879146, 23.631142, 24.233715, 24.501657, 24.866079, 25.238692, 25.768066, 26.446526, 26.014407, 25.965082, 25.26975, 25.132601, 25.147432, 24.976693, 24.130414, 24.072639, 23.503527, 22.985264, 23.624346, 23.627499, 22.041239, None, 44.234923, 43.823785, 43.897011, 43.741051, 43.688445, 43.943494, 44.175986, 43.812468, 43.707462, 43.293172, 42.577892, 42.007359, 42.141485, 41.826905, 41.328899, 41.234486, 41.583896, 41.309081, 41.337994, 41.999297, 42.32026, 42.461362, 42.580321, 42.898519, 43.211161, 43.642814, 44.008063, 44.234923, None, 23.75975, 23.71, 24.28615, 24.57564, 25.2103, 25.17, 24.34, 23.75975, None, 26.58, 26.42, 26.79, 26.87, 26.84, 26.58, None, 26.59, 25.87918, 26.00735, 26.53, 26.92516, 27.04, 26.59, None, 44.860234, 44.863, 44.42307, 44.03847, 43.5681, 43.52384, 43.43253, 43.20011, 42.65, 43.028563, 43.446341, 43.667722, 44.04124, 44.351143, 44.818712, 45.233777, 45.004127, 45.211608, 45.233777, 45.06774, 45.08159, 44.860234, None, 53.912498, 53.905702, 54.282423, 54.846963, 55.167176, 55.615107, 55.783314, 56.16913, 55.918344, 55.670091, 55.789463, 55.550976, 55.081548, 54.811771, 54.157056, 53.974639, 53.794029, 53.618045, 53.351421, 53.132726, 53.167427, 53.073996, 52.742052, 52.101678, 52.042353, 51.822806, 51.319503, 51.416138, 51.368234, 51.602044, 51.427714, 51.572227, 51.592303, 51.832289, 51.910656, 51.888461, 51.617444, 51.578454, 52.023647, 52.486977, 52.691099, 53.089731, 53.470122, 53.912498, None, 17.808319, 17.955468, 18.001511, 17.883198, 18.486831, 18.499982, 18.353273, 18.348674, 18.076675, 17.644143, 17.489475, 17.131694, 17.036066, 16.530774, 16.265467, 16.233635, 15.887273, 15.886938, 17.015577, 17.808319, None, 32.3072000581802, 32.3039237143428, 32.3032682700388, 32.3098175728414, 32.3058845718466, 32.3022833180511, 32.2934409732427, 32.2868973114514, 32.2796896417328, 32.2747767569465, 32.2669111289395, 32.2669075473817, 32.2583944840235, 32.254782282336, 32.2547740387514, 32.2616393614322, 32.2724481933959, 32.2757120264753, 32.2819371582026, 32.2930760547989, 32.2960321186471, 32.3015842021933, 32.3140553852543, 32.3242161760006, 32.3294587561557, 32.3110911879954, 32.3048469433363, 32.30910745083, 32.3041908606301, 32.3038632800462, 32.2907757831692, 32.2819261366004, 32.2613001418681, 32.2465799485801, 32.2485519134663, 32.2492123317296, 32.2475773472534, 32.2462714714698, 32.2472637398594, 32.2531698880328, 32.2561208974156, 32.2659446936992, 32.2718413023427, 32.2855931353214, 32.2908326702531, 32.2996734994024, 32.3137542201258, 32.3176823360806, 32.3275029115532, 32.3324095397555, 32.3451776458469, 32.3494356627941, 32.3589423487763, 32.3615600906466, 32.36975169749, 32.3763135008721, 32.388444543924, 32.3854968316788, 32.3763221285869, 32.3704254760469, 32.368132600249, 32.3600110593559, 32.3590601356818, 32.3640708659835, 32.3633598579866, 32.3547797587266, 32.3540628176846, 32.3626447677968, 32.3631199096979, 32.3597751617473, 32.3497625771755, 32.3390281851635, 32.3342439408053, 32.3429010723036, 32.3552188753513, 32.3552239212394, 32.3518830231342, 32.3466461715475, 32.3442819830499, 32.3407216514918, 32.3311790864627, 32.323311561213, 32.318538611581, 32.3130509130175, 32.3088369816572, 32.3072000581802, None, -22.034985, -21.993644, -22.798091, -22.075862, -21.83231, -22.735925, -22.872919, -21.494347, -20.372658, -19.405068, -18.981683, -18.260125, -17.580012, -16.500698, -15.660129, -15.323974, -14.953195, -14.453639, -13.602684, -12.899729, -12.5613, -10.951734, -11.03638, -11.014521, -10.712059, -10.306812, -9.931331, -9.761988, -10.511451, -10.895872, -11.56627, -12.461978, -12.627033, -13.000653, -13.198781, -13.489202, -13.479384, -13.775955, -14.354007, -14.645979, -15.077219, -15.09391, -16.258284, -16.299573, -16.877109, -17.27171, -17.552468, -18.174188, -18.96184, -19.400004, -19.969995, -20.176701, -19.868399, -19.356906, -19.342747, -19.633737, -20.513735, -21.051635, -22.249029, -22.034985, None, -30.216295, -28.852761, -27.881915, -27.474757, -26.923473, -26.124865, -25.547639, -25.739255, -25.162185, -24.5708, -24.021014, -23.839578, -24.001274, -23.956935, -23.571998, -22.655619, -22.35693, -22.0863, -22.282154, -22.090176, -20.732688, -20.176701, -19.969995, -19.400004, -18.96184, -18.174188, -17.552468, -17.27171, -16.877109, -16.299573, -16.258284, -15.09391, -15.077219, -14.645979, -14.354007, -13.775955, -13.479384, -13.489202, -13.198781, -13.000653, -12.627033, -12.461978, -11.56627, -10.895872, -10.511451, -9.761988, -9.931331, -10.306812, -10.712059, -11.014521, -11.03638, -10.951734, -11.123972, -11.009147, -9.490118, -10.079436, -10.053598, -9.520194, -9.462213, -9.032833, -8.424447, -7.52383, -7.340999, -6.918595, -6.629931, -6.089189, -5.741251, -5.274561, -4.593983, -4.401591, -4.251265, -4.298187, -1.556287, -1.122619, -0.549992, -0.185156, 0.541414, 0.706159, 0.602651, 0.985677, 1.089081, 1.714805, 1.692455, 2.037163, 1.719999, 1.130112, 1.253361, 0.724452, 0.789254, 1.095282, 1.328731, 1.492855, 1.916369, 2.2009, 2.411068, 2.497006, 3.126786, 3.79721, 4.056445, 4.148481, 4.02053, 3.770571, 4.006965, 4.162124, 4.536468, 4.918098, 5.200277, 5.244486, 5.014061, 4.574967, 4.423503, 3.958803, 3.606499, 2.755233, 2.24963, 1.786894, 1.317698, 1.268088, 1.463942, 1.507195, 1.682585, 1.948538, 1.863711, 1.899523, 1.817667, 2.021996, 2.220795, 2.510364, 2.421506, 2.523748, 2.311849, 2.105557, 2.376703, 2.334897, 2.053389, 2.124858, 2.504705, 3.241094, 4.156232, 4.203491, 3.650398, 1.901564, 1.736483, 1.04619, 0.222984, -0.078445, -0.235489, -1.237805, -0.581618, -0.941028, -1.55174, -2.13775, -2.691308, -2.38311, -2.912018, -2.873054, -3.700652, -4.820946, -5.109404, -5.149504, -5.464937, -6.738193, -7.343221, -8.996401, -9.649282, -11.040721, -12.171195, -13.038119, -13.057652, -13.79337, -15.667054, -17.208407, -17.867746, -18.262296, -19.599113, -20.904512, -21.937317, -22.370676, -22.97007, -22.967693, -23.351959, -23.796842, -24.088969, -24.885199, -25.877025, -26.623698, -27.175912, -28.186135, -28.674115, -29.224469, -30.984465, -31.777698, -32.24537, -33.196578, -33.768378, -33.202004, -32.727666, -32.047243, -31.494511, -30.853879, -30.883076, -30.109686, -30.216295, None, 4.525874, 4.900011, 5.44773, 4.955228, 4.316636, 4.348314, 4.007637, 4.525874, None, 27.771742, 27.452614, 26.83831, 26.808648, 26.875724, 26.719403, 27.098966, 27.299316, 28.042759, 28.296439, 28.064954, 28.040614, 27.771742, None, -18.536026, -18.714413, -19.293086, -20.39152, -20.499059, -20.851802, -21.485975, -21.639454, -22.091313, -22.827754, -23.574323, -24.240691, -24.616327, -24.696373, -25.174845, -25.486816, -25.71967, -25.670216, -25.390129, -25.26869, -25.500459, -25.979448, -26.280256, -26.726534, -26.828543, -26.477453, -25.868136, -24.917962, -24.76779, -21.849157, -21.814327, -18.252219, -18.219146, -17.869038, -18.281261, -17.889347, -17.887125, -17.661816, -17.73654, -18.536026, None, 7.421925, 7.497088, 7.754307, 7.734774, 7.508328, 7.890914, 8.281304, 8.630895, 8.982915, 9.074847, 9.012706, 9.475985, 10.567056, 10.971889, 11.142395, 10.714463, 10.089255, 9.681218, 9.265068, 8.954286, 8.666319, 8.229188, 7.825104, 7.500085, 6.979316, 6.546603, 5.946717, 5.550953, 5.233944, 5.127853, 5.150875, 5.256088, 5.170408, 4.927245, 4.897247, 5.108784, 4.609693, 4.710126, 4.633051, 4.02916, 4.224342, 4.322786, 4.691678, 5.031528, 4.709506, 4.201785, 3.504386, 3.560196, 3.728197, 3.198255, 2.26764, 2.557389, 3.013537, 3.335301, 3.851367, 4.210389, 4.732605, 5.030598, 5.451761, 6.226959, 6.408498, 7.421925, None, 46.55001, 46.41587, 46.44314, 46.03339, 45.96818, 46.39265, 46.72747, 47.03601, 46.55001, None, 49.10506, 49.08717, 49.40069, 49.87304, 49.95718, 49.70641, 49.28855, 49.10506, None, 48.510011, 48.370846, 48.825005, 49.179996, 49.53, 49.814996, 49.994959, 50.539138, 50.770648, 50.552574, 50.400903, 50.295018, 49.950001, 49.475275, 49.062484, 48.510011, None, 50.68701, 49.812309, 50.150117, 49.935815, 49.587129, 49.313011, 49.556691, 49.249139, 48.516781, 48.687804, 48.157164, 47.535548, 46.655499, 46.618292, 46.807066, 47.625207, 47.752279, 46.884994, 46.91972, 47.389562, 47.632545, 47.572807, 47.603348, 47.899454, 48.251525, 48.523188, 49.125581, 50.718274, 51.287438, 51.632094, 51.588273, 51.317075, 50.68701, None, 54.040009, 54.120004, 52.984621, 52.180433, 52.182371, 52.639707, 53.100015, 53.411469, 53.85108, 54.169975, 54.040009, None, 62.158675, 61.63308, 61.7181, 62.01649, 62.085565, 62.3856, 62.36371, 62.158675, None, 62.7108, 62.15922, 62.18231, 62.4528, 62.91409, 62.90458, 62.7108, None, 65.657285, 65.217518, 65.371772, 65.109618, 64.766693, 64.455136, 63.979609, 64.057486, 63.725981, 63.411246, 63.651722, 64.101876, 63.569712, 63.052379, 63.637253, 63.541238, 64.035833, 64.822917, 65.738778, 65.657285, None, 67.14886, 67.09873, 67.58809, 68.14856, 68.28721, 68.01036, 67.58202, 67.44425, 67.14886, None, 69.10769, 68.75704, 69.06003, 68.9507, 69.40003, 69.71003, 70.14354, 69.86003, 69.68003, 69.49003, 69.10769, None, 69.49766, 68.47499, 69.25873, 68.61508, 67.87338, 67.19872, 67.92146, 68.78456, 69.88211, 69.80539, 69.65826, 69.16202, 68.66567, 68.13253, 67.59716, 67.11078, 66.41154, 66.2573, 66.55833, 66.05625, 65.21297, 64.77563, 64.09897, 64.03273, 63.61017, 62.96021, 62.83508, 62.02469, 60.89865, 60.11021, 58.94882, 58.78212, 57.84571, 57.08709, 57.28468, 56.85172, 56.47162, 55.99914, 55.72383, 55.3026, 55.24489, 55.14832, 54.28227, 53.27703, 52.15788, 51.20842, 51.53393, 52.56208, 54.14145, 54.66772, 55.13645, 55.83741, 56.53423, 57.20263, 58.05209, 58.80458, 59.85261, 60.75788, 62.31964, 62.55053, 62.2784, 62.18111, 62.4438, 62.10507, 61.52535, 61.13717, 61.06141, 60.22125, 58.95736, 58.80106, 58.21206, 58.76731, 59.87071, 60.33558, 59.4426, 58.16708, 56.96745, 56.33945, 55.77548, 55.20407, 54.94549, 54.6265, 53.78032, 53.64749, 53.27036, 52.14664, 51.7707, 51.41972, 51.0643, 50.24277, 50.08046, 50.29099, 50.2982, 50.22897, 49.51156, 49.06836, 47.74488, 46.82171, 46.98606, 48.3, 49.1331, 49.23278, 48.74248, 48.07085, 46.99297, 46.23849, 45.73902, 45.88377, 47.00793, 46.28264, 45.9204, 45.26525, 44.67014, 44.26553, 43.54523, 43.61867, 44.46512, 45.29204, 45.25931, 45.13753, 45.70281, 47.06636, 47.35486, 47.185, 47.447781, 46.69307, 45.915, 45.46, 45.30524, 45.255, 45.0082, 45.00738, 45.00048, 44.81645, 44.09631, 44.018459, 43.628784, 43.629056, 43.625089, 43.466339, 43.27, 42.965, 42.863611, 42.3662, 42.209026, 41.675105, 41.675105, 41.832796, 41.975681, 42.08, 42.43, 42.98, 43.571088, 44.44, 45.347517, 45.816894, 45.994686, 46.116927, 46.116927, 46.275419, 46.512226, 46.40877, 46.4396, 46.538684, 46.637102, 46.900083, 47.220219, 47.553338, 47.94, 48.302918, 48.019808, 48.01, 48.27, 48.14, 48.45, 48.60926, 48.67074, 48.84, 49.38905, 49.38425, 49, 49.0007, 49, 48.99986, 49, 49, 49, 49, 49, 49, 49, 49.002538, 49.98456, 50.41656, 50.83061, 51.71583, 52.32961, 52.75538, 53.56159, 54.28757, 54.80278, 55.285, 55.91583, 56.55212, 57.69289, 58.41028, 58.86111, 59.27056, 59.78778, 59.46389, 58.905, 59.56211, 60, 60.27682, 60.30639, 66.00003, 69.712, 69.47102, 68.99002, 68.89804, 69.31512, 69.62743, 69.50534, 69.94451, 70.19369, 69.77927, 70.01286, 70.48384, 70.37721, 69.48058, 70.1584, 69.39969, 69.56372, 69.85553, 69.79778, 69.37786, 69.01128, 68.84151, 68.90591, 68.3989, 67.90261, 67.68815, 67.80612, 67.98104, 67.38144, 67.88736, 68.31164, 68.65392, 68.7, 68.8, 68.56122, 68.018, 68.09775, 67.64689, 67.80566, 67.78165, 68.40394, 68.57864, 68.23939, 67.29338, 68.0907, 68.06383, 69.06903, 69.68571, 70.08976, 71.19482, 71.92053, 71.76015, 71.31869, 70.19129, 69.69997, 69.49766, None, 73.12145, 72.65277, 72.9554, 72.4504, 72.96113, 72.63335, 71.65089, 72.06548, 73.08953, 73.23598, 73.07601, 72.67259, 71.6984, 70.99297, 70.49776, 70.02432, 69.58447, 69.50402, 69.11962, 68.75282, 68.91, 69.18, 69.11922, 68.78, 68.630059, 68.53554, 69.00744, 69.28, 69.16821, 69.96, 70.06655, 70.2373, 70.19237, 70.36638, 70.6, 70.52045, 70.54056, 70.9092, 71.30918, 71.2952, 71.55859, 72.30785, 72.70594, 73.31459, 73.12145, None, 73.42, 72.76, 73.46, 73.6, 73.64, 73.42, None, 73.102685, 72.826385, 72.855545, 72.876656, 72.742203, 72.802902, 73.333183, 73.693184, 73.75972, 73.651932, 73.102685, None, 73.157447, 72.534126, 73.340278, 73.750951, 72.716544, 72.061907, 72.352173, 72.749617, 72.243678, 71.767144, 71.33084, 71.556925, 70.920013, 70.525024, 70.121948, 69.186087, 68.720198, 68.067163, 67.847539, 66.928473, 66.862121, 66.160251, 64.998669, 65.426033, 66.388041, 66.262726, 65.689789, 65.108455, 64.648406, 64.382737, 63.392927, 62.674185, 62.945099, 63.74567, 62.883966, 62.280075, 61.930897, 62.330149, 62.910708, 63.397836, 63.679989, 64.193963, 64.679076, 64.389093, 64.229542, 64.572906, 65.309192, 65.326969, 65.454765, 65.811771, 66.310578, 67.284576, 67.726926, 68.069437, 68.554627, 68.894736, 69.147769, 69.76954, 69.826488, 70.16688, 69.871808, 69.743185, 69.966634, 70.260001, 70.410741, 70.762038, 71.218186, 71.222552, 72.235074, 73.129464, 73.537889, 73.803816, 73.157447, None, 73.84389, 73.63339, 73.76, 73.47, 72.99052, 72.56, 71.66, 71.27285, 71.35639, 71.73827, 72.51, 72.83, 72.70588, 73.36, 73.84389, None, 72.771992, 72.024596, 72.061881, 72.940277, 73.43743, 73.862417, 74.134907, 74.100025, 73.856732, 72.966244, 72.771992, None, 71.383602, 70.90164, 71.34, 71.868688, 72.292261, 73.02256, 73.68, 74.29275, 74.44893, 74.24135, 74.18577, 73.89607, 73.47519, 73.22292, 72.52, 71.82, 71.383602, None, 74.979997, 74.592347, 74.666864, 74.927623, 75.377828, 75.647218, 75.29649, 74.979997, None, 76.72, 76.25656, 75.74344, 75, 74.89744, 75.05736, 75.64075, 75.5638, 76.3366, 76.30537, 76.64634, 76.58859, 76.72, None, 76.20168, 75.84552, 76.01282, 75.9694, 75.47951, 75.00527, 74.85, 74.41696, 74.39427, 74.72029, 75.1625, 75.04343, 75.2222, 76.19903, 76.47887, 76.14134, 75.54919, 75.47321, 76.42982, 76.79417, 76.67832, 76.20168, None, 77.097878, 76.776296, 76.778518, 76.449597, 76.074013, 75.847774, 75.610166, 75.566189, 75.482421, 75.699204, 75.784315, 75.713983, 75.336849, 74.923127, 74.657304, 74.442459, 74.564028, 74.410032, 74.392307, 74.515555, 74.837758, 75.38682, 75.882655, 76.319244, 76.441381, 76.751078, 77.161389, 77.097878, None, 77.645287, 76.876962, 76.530032, 76.481172, 76.053213, 75.900019, 76.116543, 76.116543, 76.864508, 77.51222, 77.498319, 77.645287, None, 77.519997, 77.491343, 77.555111, 77.834629, 77.820005, 77.634331, 77.519997, None, 77.697015, 77.409229, 77.732207, 78.05105, 78.152956, 77.996325, 77.697015, None, 78.601973, 78.40692, 78.407902, 78.550555, 78.849994, 78.804441, 78.601973, None, 78.056941, 77.850597, 78.082857, 78.458105, 78.87193, 78.831984, 78.765813, 78.418315, 78.056941, None, 78.324754, 77.907545, 78.018985, 78.343229, 78.380332, 78.67742, 78.918336, 79.301594, 79.165349, 78.800462, 78.324754, None, 79.66, 79.3369, 79.0393, 78.28723, 78.21533, 78.34333, 78.75099, 79.11373, 79.3801, 79.37248, 79.70502, 80.15777, 80.60233, 80.90729, 80.97727, 81.20646, 81.25739, 80.72345, 80.509322, 80.32, 79.66, None, 83.106322, 83.02801, 82.9, 82.6286, 82.36165, 81.92775, 81.72527, 81.50141, 81.50657, 80.9, 80.61683, 79.8, 79.63415, 79.430162, 79.32309, 79.19766, 79.01907, 78.52581, 78.18296, 77.89991, 77.50859, 77.20968, 76.98336, 77.022045, 76.777955, 76.17812, 76.45403, 76.29901, 76.42, 76.47239, 76.95213, 77.17833, 77.9, 77.970222, 77.53873, 78.18, 78.37181, 78.75867, 78.9969, 79.34543, 79.73624, 80.25145, 80.20836, 80.1, 80.46442, 80.58, 80.51627, 80.85569, 81.26, 81.5531, 81.89429, 82.085, 82.11751, 82.27961, 82.652273, 82.6, 82.32, 82.86, 83.02, 83.13056, 83.172059, 83.06404, 83.23324, 83.169781, 83.106322, None, 47.525058, 47.347601, 47.10281, 46.920728, 46.893546, 46.483571, 46.314899, 46.440215, 46.036932, 46.005151, 46.163642, 45.82449, 45.776948, 45.991147, 46.429673, 46.27299, 46.725779, 47.287708, 47.541801, 47.449766, 47.620582, 47.61358, 47.830828, 47.525058, None, -52.63637, -54.8695, -54.87001, -54.89681, -55.30124, -55.61183, -55.580018, -55.49906, -55.19843, -55.05383, -54.49514, -53.95752, -52.83749, -53.04743, -53.7154, -54.07433, -53.61583, -52.93123, -52.5183, -52.63637, None, -21.494347, -22.872919, -22.735925, -22.986349, -24.025303, -24.518555, -26.185016, -26.506909, -26.89934, -27.521214, -28.459141, -29.367923, -30.336339, -31.36501, -33.09121, -33.273886, -34.193571, -35.169688, -36.005089, -36.658124, -37.576827, -38.552995, -38.916022, -39.808164, -40.832339, -42.051386, -42.254888, -43.408565, -43.787611, -44.207172, -44.407522, -44.784243, -44.973689, -45.560733, -46.884838, -47.738533, -48.244238, -48.878618, -49.318436, -50.378785, -50.74145, -50.67701, -51.425956, -52.009022, -52.142761, -52.299444, -52.291951, -52.537931, -52.899201, -53.833252, -53.856455, -53.53141, -52.835069, -52.83507, -52.262754, -51.629355, -51.043396, -50.378372, -48.673773, -47.711919, -46.939253, -46.647643, -45.763976, -44.103044, -44.454961, -42.383356, -42.117532, -43.365776, -43.224958, -41.794813, -39.942213, -39.258689, -38.282883, -37.156285, -37.12378, -35.50884, -33.909093, -32.418899, -30.920645, -30.095682, -28.861442, -27.64038, -25.705924, -23.628997, -21.393319, -19.756468, -18.347975, -18.092694, -17.580012, -18.260125, -18.981683, -19.405068, -20.372658, -21.494347, None, 18.678395, 18.197701, 18.507682, 19.367888, 19.821039, 20.101254, 20.077534, 19.69593, 19.255879, 18.678395, None, 49.76027, 49.4406, 48.729687, 47.790132, 47.78897, 48.183442, 48.47823, 47.57844, 47.212467, 46.116927, 45.144066, 45.321162, 44.967953, 44.11152, 42.92999, 42.903015, 42.395009, 42.985387, 42.424982, 41.994285, 41.466772, 41.503152, 41.816569, 41.107336, 40.569824, 39.928493, 39.637788, 39.170452, 38.897471, 39.360854, 39.750261, 40.422443, 40.94639, 40.593388, 39.898056, 39.252333, 39.204274, 38.737636, 38.061476, 37.897325, 37.448464, 37.156389, 37.870428, 37.481123, 37.454484, 36.930614, 36.651329, 36.11144, 35.609791, 34.909859, 34.360332, 33.376723, 32.460319, 31.692174, 30.949352, 30.676267, 30.142915, 29.83252, 29.018022, 28.225513, 28.135673, 27.053207, 25.740781, 24.547391, 23.624501, 22.782873, 22.668074, 22.22376, 22.54834, 22.051367, 21.550494, 21.397144, 20.341033, 20.282457, 21.008227, 21.395051, 21.715212, 21.55238, 21.811899, 22.218205, 22.794268, 22.976892, 23.352063, 22.81915, 22.703757, 22.708795, 22.464753, 22.318199, 21.174367, 21.201652, 21.436573, 21.849984, 21.558839, 21.742937, 22.118314, 22.949039, 23.142722, 24.063286, 23.897405, 25.083637, 25.918703, 26.743536, 27.508812, 27.747221, 28.335945, 28.261583, 28.411031, 28.83098, 29.452802, 29.031717, 29.277438, 28.640629, 27.896876, 27.771742, 28.040614, 28.064954, 28.296439, 28.042759, 27.299316, 28.086865, 27.876542, 27.974262, 28.203576, 28.642774, 28.839894, 29.320226, 29.463732, 30.115268, 30.422717, 30.183481, 30.882715, 31.515906, 32.618164, 32.48378, 32.994395, 33.506198, 34.321936, 35.49401, 35.898403, 36.666806, 37.133031, 37.41999, 37.990007, 38.378846, 38.606507, 38.505815, 39.431237, 39.660008, 39.893973, 40.366425, 40.562072, 40.427946, 41.066486, 41.185316, 41.582243, 42.123941, 42.349999, 42.920068, 43.180362, 44.917517, 45.317027, 45.53965, 47.330031, 47.000956, 47.452969, 48.455751, 48.549182, 49.214981, 49.297198, 48.599463, 48.069082, 47.693549, 46.888146, 45.719716, 45.286073, 45.115076, 44.975472, 44.352332, 44.241331, 43.319449, 42.725635, 42.74889, 42.524691, 42.663804, 42.514873, 41.907468, 41.908347, 41.59741, 42.134328, 42.481516, 42.519446, 42.871234, 43.406834, 43.743118, 44.073176, 44.457442, 45.102079, 45.011646, 44.808893, 45.339817, 45.727235, 46.388202, 46.672733, 46.805412, 46.69268, 47.048059, 47.74706, 48.06673, 47.697709, 47.85341, 47.726545, 48.135383, 49.134598, 49.888531, 49.510983, 50.142883, 50.582908, 51.643566, 51.964115, 52.516226, 52.753886, 53.251401, 53.431726, 53.458804, 53.161045, 52.792799, 51.784255, 51.353894, 50.739797, 49.76027, None, 4.994476, 4.984296, 5.179813, 5.168264, 4.993701, 4.705088, 4.338288, 4.364566, 5.188159, 5.313345, 5.707352, 6.12619, 6.193033, 6.467564, 6.911801, 7.395208, 7.686043, 7.68718, 8.123329, 8.316444, 8.455453, 8.575704, 9.376224, 9.789532, 10.12902, 10.206535, 10.297382, 10.147236, 10.138994, 10.430811, 10.411303, 10.524061, 10.096361, 10.222555, 10.370737, 10.152714, 9.821985, 9.610835, 9.862344, 9.900326, 9.642461, 8.219628, 7.379705, 6.250472, 5.389051, 4.994476, None, 2.267097, 2.321616, 2.192812, 2.326758, 2.261051, 2.283866, 3.073404, 3.734527, 3.904129, 4.352215, 4.495617, 4.771983, 5.479666, 6.444491, 6.453482, 7.03877, 7.055358, 6.644427, 6.981383, 7.397042, 7.799808, 8.305824, 8.717763, 9.417772, 9.640626, 10.160362, 10.798566, 11.572369, 11.904752, 12.085361, 12.483657, 12.802035, 12.859396, 12.219048, 11.555574, 10.891325, 9.982337, 9.992129, 9.920919, 10.021378, 9.549495, 8.965861, 8.796104, 8.38215, 7.692812, 7.421925, 6.408498, 6.226959, 5.451761, 5.030598, 4.732605, 4.210389, 3.851367, 3.335301, 3.013537, 2.557389, 2.26764, 1.727673, 1.964015, 2.227875, 2.267097, None, 3.509166, 2.339883, 2.204465, 1.849396, 1.583805, 1.062313, 0.59738, -0.20531, -0.587406, -1.341313, -1.620056, -2.21511, -2.292211, -2.839258, -3.293907, -4.499983, -5.419979, -5.939999, -6.520015, -7.079981, -8.340007, -8.238257, -8.407032, -8.526559, -9.164918, -9.605925, -10.789884, -11.793647, -11.971569, -12.360744, -12.178895, -13.257227, -13.248958, -12.698604, -12.272481, -12.132747, -11.608748, -11.92444, -11.784965, -11.330936, -11.238694, -11.262826, -10.951993, -10.926826, -10.867863, -11.017622, -10.993075, -11.084801, -9.894796, -9.523708, -8.908707, -8.305901, -7.920085, -7.290872, -7.299606, -6.939318, -6.94309, -7.116361, -7.155429, -7.738184, -7.988246, -7.847014, -7.987678, -8.068551, -7.545689, -7.222298, -6.622645, -5.87747, -5.864241, -5.984389, -5.965682, -6.100092, -5.789931, -5.684304, -5.248362, -4.991271, -4.781103, -4.882957, -4.500138, -4.510009, -4.793092, -4.970239, -4.343507, -3.855165, -3.535133, -2.712392, -1.740927, -1.225816, -0.74383, -0.424832, -0.058084, 0.288923, 0.855659, 1.741832, 2.365722, 2.900443, 3.504386, 4.201785, 4.709506, 5.031528, 4.691678, 4.322786, 4.224342, 4.02916, 4.633051, 4.710126, 4.609693, 5.108784, 4.897247, 4.927245, 5.170408, 5.256088, 5.150875, 5.127853, 5.233944, 4.408413, 4.287155, 4.455077, 4.389267, 4.600805, 4.173699, 3.509166, None, -4.781103, -4.438023, -4.60623, -5.037987, -3.978827, -3.426871, -2.765619, -2.514161, -2.391688, -1.948511, -2.42874, -2.470805, -1.998276, -1.333407, -0.552627, 0.038758, 1.19693, 1.395677, 1.314184, 1.830896, 2.267097, 2.227875, 1.964015, 1.727673, 2.26764, 3.198255, 3.728197, 3.560196, 3.504386, 2.900443, 2.365722, 1.741832, 0.855659, 0.288923, -0.058084, -0.424832, -0.74383, -1.225816, -1.740927, -2.712392, -3.535133, -3.855165, -4.343507, -4.970239, -4.793092, -4.510009, -4.500138, -4.882957, -4.781103, None, -0.152032, 0.084801, 0.416047, 0.256936, 0.395687, 0.825893, 0.809925, 1.380924, 1.69137, 1.766404, 2.267355, 2.629556, 2.696606, 3.325017, 3.849636, 4.087606, 4.667984, 5.582812, 5.845354, 6.691116, 7.223771, 7.70984, 7.638061, 7.935278, 8.524286, 8.670505, 8.638749, 9.336821, 9.443248, 9.774003, 10.61899, 11.083045, 11.102036, 11.310473, 11.227015, 11.731972, 11.95555, 12.437303, 12.376041, 12.112982, 11.776284, 11.608672, 11.108702, 10.821975, 10.450344, 9.73677, 9.152, 9.085027, 8.625288, 8.405275, 8.002638, 7.632506, 7.423785, 7.340431, 6.991615, 7.087785, 6.960376, 6.099861, 6.206805, 6.153268, 6.267318, 6.095468, 5.55687, 5.221129, 4.503937, 3.839482, 3.542342, 3.318454, 2.820655, 2.600281, 2.250638, 1.253361, 1.130112, 1.719999, 2.037163, 1.692455, 1.714805, 1.089081, 0.985677, 0.602651, 0.706159, 0.541414, -0.185156, -0.549992, -1.122619, -1.556287, -4.298187, -3.766591, -3.742872, -2.725156, -2.256865, -2.342802, -2.16979, -2.434218, -2.308954, -1.260491, -1.002833, -0.53082, -0.057205, -0.152032, None, 8.225028, 8.446927, 8.656836, 8.830443, 9.051386, 9.290803, 9.487354, 9.615537, 9.908052, 10.086723, 9.795992, 9.55704, 9.834542, 9.933347, 10.134886, 10.439337, 10.754331, 10.895278, 11.088445, 11.217119, 10.952303, 11.082657, 10.999226, 10.79345, 10.726839, 10.938764, 10.395438, 9.992982, 9.566135, 9.476812, 9.07433, 8.925709, 8.807266, 8.626295, 8.423517, 8.225028, None, 23.188611, 23.117271, 23.10598, 22.765303, 22.399202, 22.512166, 22.277194, 21.657851, 21.20682, 21.220565, 21.016624, 20.735091, 20.693905, 20.284628, 20.050379, 19.923435, 19.873774, 19.952891, 19.855481, 20.413354, 20.673105, 20.739949, 21.028613, 21.598114, 21.559175, 21.827324, 22.037079, 22.192057, 22.387109, 22.636965, 22.68815, 22.168518, 22.154565, 21.910575, 21.801228, 21.896028, 22.20495, 22.565755, 22.788118, 22.983042, 23.078747, 23.188611, None, 35.140026, 35.145504, 35.386703, 35.373216, 35.671596, 35.245756, 35.058506, 35.093595, 35.017863, 35.038688, 35.000345, 35.101424, 35.162712, 35.173125, 35.087833, 35.140026, None, 35.058506, 34.978098, 34.571869, 34.701655, 35.103232, 35.140026, 35.087833, 35.173125, 35.162712, 35.101424, 35.000345, 35.038688, 35.017863, 35.093595, 35.058506, None, 48.596982, 48.785808, 48.733899, 49.039074, 48.964402, 48.555305, 48.877172, 49.307068, 49.547415, 49.969121, 50.266338, 50.484076, 50.733234, 50.926918, 51.117268, 51.002339, 51.106674, 50.78473, 50.697733, 50.422607, 50.215747, 50.473974, 50.362146, 50.049038, 49.988629, 49.49623, 49.495015, 49.315001, 49.271515, 49.043983, 48.996493, 48.903475, 48.800019, 48.816969, 48.596982, None, 54.983104, 54.596642, 54.363607, 54.008693, 54.196486, 54.470371, 54.075511, 53.757029, 53.248171, 52.981263, 52.62485, 52.089947, 51.745188, 51.106674, 51.002339, 51.117268, 50.926918, 50.733234, 50.484076, 50.266338, 49.969121, 49.547415, 49.307068, 48.877172, 48.416115, 48.289146, 47.637584, 47.467646, 47.672388, 47.703083, 47.523766, 47.566399, 47.302488, 47.580197, 47.525058, 47.830828, 47.61358, 47.620582, 48.333019, 49.017784, 49.201958, 49.463803, 49.902226, 50.128052, 50.803721, 51.851616, 51.852029, 52.22844, 53.144043, 53.482162, 53.693932, 53.748296, 53.527792, 54.020786, 54.395646, 54.962744, 54.830865, 54.983104, None, 12.699639, 12.390148, 11.974928, 11.735641, 11.46204, 10.926879, 11.10511, 11.0342, 11.05091, 11.35511, 11.6312, 12.1, 12.54223, 12.455416, 12.699639, None, 55.609991, 54.800015, 55.364864, 55.779955, 56.111407, 55.609991, None, 56.458621, 56.081383, 56.190007, 55.469999, 54.983104, 54.830865, 54.962744, 55.517723, 56.540012, 56.809969, 57.110003, 57.172066, 57.447941, 57.730017, 57.215733, 56.890016, 56.609982, 56.458621, None, 19.714456, 19.884911, 19.880286, 19.622885, 19.648, 19.293267, 19.313214, 19.015196, 18.979074, 18.612198, 18.205142, 18.422648, 18.380713, 18.428307, 18.245915, 18.184291, 18.426886, 18.283329, 17.598564, 17.757573, 18.044997, 18.31666, 18.6169, 18.785417, 19.169838, 19.714456, None, 23.471668, 21.565661, 19.601207, 19.155265, 19.057364, 19.693579, 19.85623, 20.142233, 20.610809, 22.792666, 24.974574, 27.395744, 27.589479, 27.656426, 28.841289, 29.579228, 29.7317, 30.000443, 30.501188, 30.896952, 31.637294, 31.724498, 32.094346, 32.262889, 32.651522, 32.864015, 33.919713, 34.527919, 35.168396, 35.714849, 35.888662, 36.301273, 36.605647, 36.783905, 36.865037, 36.716519, 37.110655, 37.118381, 36.885708, 36.946427, 36.433177, 35.479876, 34.655146, 34.097376, 33.344115, 32.748337, 32.506285, 32.102692, 30.307556, 29.424638, 28.95999, 28.144174, 27.688259, 27.140953, 26.512206, 26.094325, 25.365455, 24.936954, 24.379313, 24.562532, 24.097909, 23.471668, None, -3.404856, -2.657512, -2.220794, -2.685159, -2.246943, -1.965048, -1.057455, -0.906663, -0.283703, 0.36034, 0.768429, 0.982938, 1.380924, 0.809925, 0.825893, 0.395687, 0.256936, 0.416047, 0.084801, -0.152032, -0.911417, -1.56161, -2.608678, -3.003021, -3.873097, -4.547784, -4.959129, -4.454198, -4.346091, -4.425724, -4.059287, -3.821162, -3.404856, None, 29.50133, 29.09942, 28.34399, 27.8233, 27.6487, 27.97136, 28.41765, 29.85108, 29.76043, 28.70523, 27.69989, 26.14227, 25.59856, 25.03375, 23.92671, 23.75237, 23.10244, 22.20485, 22, 22, 22, 22, 25.6825, 29.238655, 30.04419, 30.6616, 31.08929, 31.56915, 31.58568, 31.32126, 31.02577, 30.87005, 31.18686, 31.4734, 31.55586, 31.4296, 30.9336, 31.26034, 31.02407, 30.96746, 31.21936, 29.50133, None, 12.54223, 12.86582, 13.45209, 13.77332, 14.11864, 14.519579, 14.53155, 14.74064, 14.50547, 14.95943, 14.2131, 14.42211, 14.822481, 16.291874, 16.95655, 17.26314, 17.42754, 17.998307, 16.840626, 15.922723, 15.435647, 14.49108, 13.921037, 13.343992, 13.000421, 12.699639, 12.455416, 12.54223, None, 41.880571, 42.592775, 43.026625, 43.748338, 43.567909, 43.57424, 43.403449, 43.455901, 43.422802, 43.034014, 42.579546, 42.795734, 42.343385, 42.473015, 41.89212, 41.226089, 41.014732, 40.678318, 40.123934, 39.309978, 38.738514, 38.292366, 37.642354, 37.443064, 36.674144, 36.6589, 36.677839, 36.324708, 35.94685, 36.029817, 36.367677, 36.942913, 37.097788, 37.428904, 37.803894, 38.075764, 38.373059, 39.030073, 39.629571, 39.711892, 40.184524, 40.330872, 41.111083, 41.381815, 41.883387, 41.918346, 41.792075, 41.790886, 42.280469, 42.134689, 41.880571, None, 57.793424, 58.383413, 58.257375, 58.612753, 59.18724, 59.465854, 59.61109, 59.445803, 59.475388, 59.300825, 58.724581, 57.791899, 57.474528, 57.476389, 57.847529, 57.970157, 57.793424, None, 14.95943, 14.50547, 14.74064, 14.53155, 14.51959, 14.11864, 13.77333, 13.45209, 12.86582, 12.54223, 12.1, 11.6312, 11.35511, 11.05091, 11.0342, 11.10511, 10.926879, 10.57258, 10.02194, 9.54048, 9.18358, 7.99688, 8.003, 5.00162, 4.95755, 4.25259, 4.23413, 3.918912, 3.91909, 4.25702, 3.83879, 3.42206, 3.50074, 3.61607, 3.58851, 3.598605, 4.447864, 4.447864, 4.776966, 5.338232, 5.506, 6.59422, 6.82607, 7.22595, 7.71334, 7.78497, 8.35458, 8.37916, 8.68456, 9.58358, 10.63009, 10.91017, 11.31896, 12.08286, 12.57828, 13.56333, 14.42211, 14.2131, 14.95943, None, 69.064777, 68.364613, 67.698297, 66.944286, 65.80598, 64.948672, 64.204453, 63.552814, 62.867687, 62.357693, 61.780028, 60.503517, 60.423961, 60.057316, 59.846373, 60.391921, 60.72017, 61.705329, 62.607393, 63.189735, 63.81781, 64.902344, 65.111427, 65.534346, 66.006927, 66.396051, 67.936009, 68.616846, 69.106247, 69.370443, 68.841741, 68.891247, 68.649557, 69.092114, 69.825299, 70.164193, 69.766491, 69.064777, None, -17.33992, -17.62846, -18.15059, -18.28799, -18.16432, -17.72465, -17.38114, -17.50481, -17.33992, None, -16.801354, -17.012042, -16.63915, -16.433984, -16.379054, -16.067133, -16.555217, -16.801354, None, -16.501783, -16.555217, -16.067133, -16.020882, -16.501783, None, -51.85, -51.25, -51.5, -51.1, -51.55, -51.9, -52.2, -51.85, -52.3, -51.85, None, 42.152492, 41.380007, 41.583612, 42.256517, 42.628122, 43.009985, 42.152492, None, 50.378992, 49.907497, 49.985373, 49.529484, 49.442667, 49.463803, 49.201958, 49.017784, 48.333019, 47.620582, 47.449766, 47.541801, 47.287708, 46.725779, 46.27299, 46.429673, 45.991147, 45.70858, 45.333099, 45.028518, 44.254767, 44.127901, 43.693845, 43.128892, 43.399651, 43.075201, 42.473015, 42.343385, 42.795734, 42.579546, 43.034014, 43.422802, 44.02261, 46.014918, 47.064363, 47.570327, 47.954954, 48.68416, 48.901692, 48.644421, 49.776342, 49.347376, 50.127173, 50.946606, 51.148506, 50.796848, 50.780363, 50.378992, None, -3.978827, -2.969483, -2.144313, -1.111301, -0.779074, -0.459351, 0.268666, 1.01012, 1.067894, 1.057662, 2.261051, 2.326758, 2.192812, 2.321616, 2.267097, 1.830896, 1.314184, 1.395677, 1.19693, 0.038758, -0.552627, -1.333407, -1.998276, -2.470805, -2.42874, -1.948511, -2.391688, -2.514161, -2.765619, -3.426871, -3.978827, None, 54.554603, 53.867565, 54.073702, 54.059956, 54.595841, 55.131622, 55.17286, 54.554603, None, 58.635, 57.553025, 57.690019, 57.6848, 56.870017, 55.973793, 55.909998, 55.804903, 54.624986, 54.464376, 53.325014, 52.929999, 52.73952, 52.099998, 51.806761, 51.289428, 50.765739, 50.774989, 50.500019, 50.69688, 50.228356, 50.341837, 49.96, 50.159678, 51.210001, 51.426009, 51.426848, 51.593466, 51.9914, 52.301356, 52.840005, 53.495004, 53.404547, 53.404441, 53.985, 54.600937, 54.615013, 54.790971, 55.061601, 55.508473, 55.783986, 55.311146, 56.275015, 56.78501, 57.818848, 58.630013, 58.550845, 58.635, None, 41.535656, 41.962943, 42.645123, 43.013628, 43.128634, 43.434998, 43.553104, 43.382159, 43.220308, 42.740828, 42.554974, 42.711993, 42.502781, 42.092444, 41.860675, 41.722802, 41.181673, 41.064445, 41.123873, 41.411452, 41.248129, 41.092143, 41.583173, 41.535656, None, 5.928837, 5.343473, 5.000548, 4.710462, 4.994476, 5.389051, 6.250472, 7.379705, 8.219628, 9.642461, 10.395335, 10.96269, 11.009819, 10.93693, 11.098341, 11.018682, 10.706918, 10.191213, 9.465004, 8.677223, 8.312465, 7.411744, 6.914359, 6.279979, 5.928837, None, 7.686043, 7.711674, 7.309037, 7.313921, 7.526905, 7.928534, 8.541055, 8.428504, 8.406206, 8.348896, 8.715541, 8.977178, 9.26791, 9.688246, 10.045873, 10.046984, 9.858572, 9.835834, 9.620188, 9.342712, 8.903049, 9.494744, 9.886167, 10.01572, 10.214467, 10.656301, 10.876572, 11.040412, 11.527824, 11.509272, 11.677117, 11.678719, 11.811269, 12.142644, 12.247186, 12.586183, 12.575874, 12.33209, 12.35444, 12.465648, 12.386583, 12.442988, 12.076834, 12.077971, 12.211245, 12.177887, 11.923975, 11.844084, 12.060479, 12.194243, 12.334286, 12.30806, 12.088358, 11.812561, 11.393646, 11.136246, 10.810891, 10.909257, 10.792597, 10.494812, 10.206535, 10.12902, 9.789532, 9.376224, 8.575704, 8.455453, 8.316444, 8.123329, 7.68718, 7.686043, None, 13.151394, 13.594959, 13.623587, 13.860369, 13.876492, 13.630357, 13.62568, 13.794068, 13.505042, 13.280585, 13.298207, 13.509512, 13.27857, 13.270353, 13.130284, 13.151394, None, 11.040412, 11.458474, 11.524594, 11.806515, 11.958702, 12.170911, 12.384852, 12.547762, 12.515567, 12.62817, 12.586183, 12.247186, 12.142644, 11.811269, 11.678719, 11.677117, 11.509272, 11.527824, 11.040412, None, 1.01012, 1.160911, 2.283866, 2.261051, 1.057662, 1.067894, 1.01012, None, 35.705004, 35.368022, 35.424996, 35.354018, 35.179998, 35.29999, 35.004995, 34.919988, 35.084991, 35.279992, 35.705004, None, 41.562115, 40.936261, 40.824123, 40.852545, 40.947062, 40.687129, 40.124993, 39.962006, 39.960998, 40.476005, 40.256561, 39.659311, 39.190011, 38.970903, 38.510001, 38.219993, 37.655015, 37.920011, 37.409991, 37.30501, 36.422506, 36.41, 36.844986, 37.644989, 38.310323, 38.769985, 39.340235, 39.624998, 40.110007, 40.435, 40.580004, 40.842727, 40.931275, 41.149866, 41.130487, 41.3048, 41.337994, 41.309081, 41.583896, 41.234486, 41.328899, 41.826905, 41.562115, None, 82.62796, 83.22516, 83.18018, 83.54905, 83.64513, 83.51966, 82.72669, 82.34165, 82.29765, 82.2, 82.02154, 82.13178, 81.78697, 82.09317, 81.73449, 81.15271, 81.52462, 81.91245, 81.71885, 81.29154, 80.58004, 80.35, 80.17708, 80.12912, 79.4, 78.75128, 77.63859, 76.98565, 76.94434, 76.62795, 76.09808, 75.24838, 75.15585, 74.29561, 74.22382, 73.81713, 73.46436, 73.30955, 73.30663, 72.62928, 72.18409, 72.59788, 72.3302, 72.08016, 71.46898, 70.66369, 70.471, 70.85649, 71.43094, 70.75226, 70.22646, 70.18401, 70.12946, 69.2588, 68.47046, 68.12503, 68.12078, 67.73547, 66.67974, 65.9789, 65.93768, 65.69213, 65.45848, 64.83997, 64.13902, 63.48246, 62.68233, 61.90093, 61.07404, 60.09772, 60.03676, 60.85328, 60.85843, 61.40681, 62.38336, 63.62691, 64.27842, 65.1767, 66.09957, 66.8365, 67.18899, 68.35759, 68.72958, 69.14781, 69.9291, 69.574925, 69.42616, 69.283625, 69.61003, 70.28932, 70.821315, 70.835755, 70.56978, 71.20485, 71.54719, 71.406537, 71.65444, 72.58625, 72.95861, 73.64977, 74.71026, 75.09861, 75.51727, 76.10238, 76.1752, 76.13486, 76.06141, 76.37975, 77.00857, 77.32312, 77.37595, 77.63595, 78.04419, 78.43271, 78.91388, 79.39436, 79.75814, 80.11721, 80.51582, 81.21396, 81.3211, 81.77042, 82.03363, 82.19074, 82.19962, 81.88833, 82.43883, 82.06481, 81.985945, 81.6607, 82.19979, 82.62796, None, 13.735338, 13.909771, 13.927832, 14.126218, 14.538829, 14.830103, 15.064585, 15.251447, 16.066565, 16.069562, 16.41011, 16.470778, 16.687483, 16.918477, 17.252177, 17.254658, 17.817595, 17.819326, 17.808319, 17.015577, 15.886938, 15.887273, 15.70638, 15.855389, 15.727722, 15.346247, 15.066419, 14.874286, 14.678019, 14.424133, 14.362586, 14.244816, 14.134228, 13.88197, 13.735338, None, 2.504705, 2.124858, 2.053389, 2.334897, 2.376703, 2.105557, 2.311849, 2.738748, 3.194172, 3.62257, 4.212611, 4.896756, 5.756548, 5.646529, 5.409851, 4.565768, 4.156232, 3.241094, 2.504705, None, 8.367035, 7.999202, 7.347691, 6.832787, 6.809094, 6.321268, 5.97315, 5.073567, 4.812626, 4.576801, 4.060864, 3.334655, 3.333492, 2.768927, 1.899523, 1.863711, 1.948538, 1.682585, 1.507195, 1.463942, 1.268088, 1.317698, 1.786894, 2.24963, 2.755233, 3.606499, 3.958803, 4.423503, 4.574967, 5.014061, 5.244486, 5.200277, 5.959068, 6.234297, 6.696077, 6.856584, 7.043911, 7.415, 7.779603, 8.367035, None, 12.984686, 13.297535, 13.38448, 13.78505, 13.893312, 13.964626, 13.845486, 13.980155, 14.140507, 14.340029, 14.424133, 14.678019, 14.874286, 15.066419, 15.346247, 15.727722, 15.688655, 15.864458, 15.878799, 15.797279, 15.84694, 15.756713, 15.782835, 15.893449, 16.005406, 15.953652, 15.885749, 15.909158, 15.995923, 15.857224, 15.835158, 15.648244, 15.424072, 15.270903, 14.995829, 15.016267, 14.880074, 14.749436, 14.748764, 14.621614, 14.666805, 14.819587, 14.790493, 14.551541, 14.560197, 14.35437, 14.079012, 13.960078, 13.836055, 14.038187, 13.771356, 13.778487, 13.754845, 13.263093, 13.254204, 13.025794, 12.984686, None, 45.908878, 45.521511, 45.236516, 44.860234, 45.08159, 45.06774, 45.233777, 45.211608, 45.004127, 45.233777, 44.818712, 44.351143, 44.04124, 43.667722, 43.446341, 43.028563, 42.65, 42.479991, 42.849995, 43.209998, 43.507215, 44.243191, 44.317915, 44.738484, 45.07606, 45.233777, 44.802124, 45.136935, 45.484149, 45.500324, 45.466166, 45.634941, 45.471695, 45.452316, 45.731783, 45.834154, 46.238108, 46.503751, 46.380632, 45.951769, 45.759481, 45.908878, None, 19.915684, 19.871501, 19.714456, 19.169838, 18.785417, 18.6169, 18.31666, 18.044997, 18.214961, 18.145611, 18.217906, 18.030993, 18.34255, 18.664908, 18.526053, 18.445799, 18.668422, 19.101625, 19.483591, 19.639551, 19.915684, None, 46.852386, 47.496171, 47.712902, 47.714866, 48.123497, 47.867466, 47.758429, 47.880954, 48.081768, 48.111379, 48.266615, 48.202691, 48.327567, 48.56285, 48.623854, 48.319971, 48.422264, 48.15024, 47.882194, 47.672439, 46.994238, 46.316088, 46.127469, 46.17173, 45.908878, 45.759481, 45.951769, 46.380632, 46.503751, 46.841327, 46.852386, None, -10.239581, -10.25865, -9.557969, -9.36134, -9.665921, -9.969675, -10.239581, None, -10.140001, -10.359987, -10.239995, -9.900016, -9.290027, -8.89279, -9.089987, -9.393173, -10.140001, None, -8.095681, -8.362383, -8.280683, -8.705825, -8.906639, -9.040895, -9.032937, -8.457158, -8.449303, -8.095681, None, -8.094234, -8.649808, -8.933666, -8.810418, -8.444859, -8.236965, -8.53674, -8.46062, -8.094234, None, -6.777674, -6.877358, -6.465186, -6.946036, -7.594213, -7.776528, -8.370807, -8.751817, -8.348947, -8.376181, -8.302129, -8.122605, -7.740664, -7.6416, -7.766657, -7.3549, -6.9249, -6.851416, -5.895919, -5.954985, -6.345762, -6.421985, -6.777674, None, -6.214401, -6.895238, -6.142467, -5.783058, -5.445042, -5.737582, -6.214401, None, -3.459065, -3.790983, -3.607376, -3.177273, -3.129318, -3.459065, None, -3.093764, -3.858472, -3.446301, -3.362637, -3.428679, -3.393436, -2.84365, -2.802154, -3.093764, None, -1.151867, -2.769185, -3.367753, -2.307042, -1.703513, -1.702686, -2.051296, -2.409052, -2.600151, -5.859022, -9.117893, -8.297168, -8.096043, -8.380935, -8.411683, -7.597882, -7.320225, -6.232849, -5.393366, -4.546544, -4.462931, -3.538853, -4.024819, -4.112979, -3.746283, -3.311787, -2.820551, -2.460418, -2.479848, -2.214542, -2.212526, -1.617162, -1.432522, -0.93772, -0.695461, -0.369538, -0.78021, -1.151867, None, 1.419836, 0.427881, 0.235593, 0.431137, 0.381217, 0.237247, -0.519658, -1.408906, -0.955962, -0.615673, -1.076213, -0.930951, -1.516858, -1.904483, -3.186058, -3.5295, -4.683693, -5.340604, -5.634591, -5.282933, -4.464172, -4.851331, -4.574553, -4.188478, -3.602105, -2.627643, -2.931604, -4.097579, -5.528241, -5.6734, -5.379878, -4.459417, -3.494412, -3.487022, -2.801999, -2.147104, -1.353147, 0.154254, 0.566477, 1.309223, 1.013944, 0.875192, 0.917102, 1.643259, 1.419836, None, 1.132386, 0.258486, 0.356413, -0.252077, -0.780004, -0.899996, -0.266598, 1.011722, 1.810691, 2.174596, 1.628531, 1.540811, 1.132386, None, 1.827641, 0.902219, 0.784242, 0.102475, -0.803723, -1.487661, -2.483517, -4.012726, -3.657037, -4.106984, -3.495704, -3.43917, -3.118776, -3.478392, -2.994442, -3.049426, -2.934032, -1.592874, -1.314907, -0.459507, 0.415375, 1.341934, 2.006467, 1.338136, 0.773131, 0.976478, 0.904441, 1.410121, 1.49779, 1.217549, 1.430688, 2.821482, 3.169238, 4.306559, 4.306094, 4.137551, 3.234428, 2.28769, 1.827641, None, -5.852356, -5.873285, -5.037315, -4.220259, -3.614146, -2.799777, -2.050262, -0.650348, 0.183142, 1.042882, 1.823507, 2.453184, 3.308791, 3.86886, 4.970782, 5.479821, 5.439513, 5.246321, 4.26837, 3.59035, 3.174329, 2.099381, 2.083697, 1.3987, 0.561361, 0.104542, -0.711946, -1.059212, -1.084843, -1.782372, -2.340425, -2.428844, -3.061777, -4.305525, -5.852356, None, 35.49401, 34.321936, 33.506198, 32.994395, 32.48378, 32.618164, 31.515906, 30.882715, 30.183481, 29.729865, 28.79447, 28.416095, 27.925479, 27.364506, 27.234901, 26.726198, 26.630985, 26.397898, 26.414615, 26.810405, 27.445819, 27.876542, 28.086865, 27.299316, 27.098966, 26.719403, 26.875724, 26.808648, 26.83831, 27.452614, 27.771742, 27.896876, 28.640629, 29.277438, 29.031717, 29.452802, 28.83098, 28.411031, 28.261583, 27.882536, 27.699059, 27.083774, 27.264589, 26.573572, 26.001307, 25.162495, 24.675238, 23.850741, 24.078556, 23.043658, 22.703111, 22.27846, 22.041239, 23.627499, 23.624346, 22.985264, 23.503527, 24.072639, 24.130414, 24.976693, 25.147432, 25.132601, 25.26975, 25.965082, 26.014407, 26.446526, 25.768066, 25.238692, 24.866079, 24.501657, 24.233715, 23.631142, 22.879146, 22.055708, 21.690588, 21.703172, 21.495562, 20.743308, 20.151638, 19.478579, 18.30201, 17.671221, 17.016636, 16.556664, 16.310219, 15.951972, 15.899185, 15.136415, 13.835771, 13.006261, 12.056215, 10.357275, 10.308854, 9.546136, 9.216544, 8.933047, 8.252959, 7.965535, 8.899276, 10.29963, 11.308251, 11.781245, 12.741936, 13.992583, 14.617222, 15.990652, 17.92857, 19.208234, 20.419503, 21.356009, 20.757441, 20.877331, 22.089298, 22.450775, 22.84318, 23.691965, 24.359134, 24.356524, 25.215102, 25.722229, 26.491872, 26.940966, 27.989196, 27.91318, 28.961592, 29.976413, 30.979815, 31.692639, 32.271105, 32.7649, 33.441473, 34.317699, 34.748887, 34.504923, 34.653544, 35.49401, None, 53.867565, 53.153164, 52.260118, 51.669301, 51.820455, 52.864629, 53.881363, 54.664519, 55.131622, 54.595841, 54.059956, 54.073702, 53.867565, None, 37.198918, 37.392421, 37.964117, 37.935127, 38.121394, 38.029229, 37.522309, 37.412988, 36.527383, 36.491597, 35.650072, 34.404102, 33.676446, 33.528832, 32.981269, 32.18292, 31.548075, 31.379506, 30.73585, 29.829239, 29.303276, 28.699334, 28.259645, 27.378923, 27.217047, 26.756532, 26.239975, 25.078237, 25.380157, 25.609962, 25.739902, 26.966106, 27.143305, 26.964633, 26.480658, 26.812369, 27.580849, 27.86569, 28.814521, 30.147773, 29.985715, 30.31709, 29.926778, 30.452457, 30.985137, 30.984853, 31.709176, 32.469155, 33.017287, 33.967798, 34.748138, 35.093259, 35.677383, 35.977546, 37.17045, 37.971584, 38.281281, 39.428136, 39.713003, 39.335765, 38.874139, 38.741201, 38.770605, 39.508364, 39.582235, 39.288765, 38.794015, 38.270378, 38.320245, 37.582874, 37.374567, 36.872814, 36.700422, 36.965031, 37.198918, None, 35.977546, 35.677383, 35.093259, 34.748138, 33.967798, 33.017287, 32.469155, 31.709176, 30.984853, 30.985137, 30.452457, 29.926778, 29.975819, 30.05907, 29.099025, 29.178891, 31.190009, 31.889992, 32.161009, 33.378686, 34.419372, 35.628317, 36.358815, 36.605854, 37.229873, 37.385264, 37.256228, 37.001514, 37.170445, 35.977546, None, 66.455892, 65.808748, 65.126671, 64.364082, 63.678749, 63.496383, 63.643635, 63.960179, 64.402116, 64.89113, 65.084968, 65.378594, 65.611189, 66.262519, 66.410469, 65.732112, 66.276601, 65.993853, 66.526792, 66.455892, None, 32.709192, 32.393992, 32.532511, 31.866582, 31.754341, 31.616778, 31.353435, 31.489086, 31.100066, 29.501326, 31.219361, 31.548824, 31.605539, 32.072926, 32.827376, 33.080539, 33.0909, 33.08904, 33.264275, 33.277426, 32.868123, 32.716014, 32.709192, None, 38.231155, 37.444046, 37.134219, 36.619987, 36.996631, 37.104531, 37.61295, 38.126381, 38.034966, 38.143874, 38.231155, None, 41.209991, 40.500009, 39.177376, 39.240473, 38.906618, 39.171847, 40.378311, 40.950007, 40.899984, 41.209991, None, 46.767559, 46.509306, 46.016778, 45.591016, 45.736692, 45.381778, 44.885374, 44.600482, 44.091366, 43.587727, 42.761008, 41.95514, 41.961315, 41.740295, 41.541082, 41.179606, 40.877143, 40.355625, 40.168866, 39.810774, 40.277671, 40.442235, 39.795401, 39.4247, 38.902871, 38.843572, 37.985899, 37.908849, 38.214593, 38.750942, 38.964547, 39.544072, 40.048357, 40.172949, 40.60455, 40.786348, 41.188287, 41.25309, 41.704535, 42.355425, 42.931463, 43.920007, 44.036279, 44.366336, 44.231228, 43.767148, 43.693845, 44.127901, 44.254767, 45.028518, 45.333099, 45.70858, 45.991147, 45.776948, 45.82449, 46.163642, 46.005151, 46.036932, 46.440215, 46.314899, 46.483571, 46.893546, 46.751359, 46.941579, 47.115393, 46.767559, None, 18.490525, 18.400867, 18.160701, 17.886867, 17.868238, 17.701116, 17.861597, 18.225968, 18.454533, 18.524218, 18.490525, None, 32.393992, 32.709192, 32.312938, 33.378686, 32.161009, 32.010217, 31.508413, 30.5085, 30.338665, 30.003776, 29.865283, 29.505254, 29.197495, 29.356555, 29.501326, 31.100066, 31.489086, 31.782505, 32.393992, None, 34.149234, 33.806335, 33.201178, 33.521985, 33.28957, 32.704567, 32.989382, 33.463642, 34.060299, 33.944621, 34.364931, 34.149234, None, 37.142074, 36.343983, 35.842877, 35.138114, 34.6676, 34.606286, 33.464805, 33.849071, 34.596545, 34.375938, 33.904933, 33.885761, 33.149992, 31.450355, 31.029579, 31.418238, 32.319475, 32.61031, 33.296056, 33.604151, 34.232743, 34.749714, 35.433393, 35.731618, 35.527134, 37.304984, 36.827391, 37.827485, 38.215962, 39.438807, 40.563312, 41.195005, 41.37856, 39.991616, 39.180865, 38.174001, 37.142074, None, 44.1741, 43.960883, 44.384733, 43.262088, 42.988358, 41.995215, 42.678791, 41.584594, 41.569556, 42.563759, 43.333273, 43.388825, 44.772125, 45.551483, 44.510358, 44.1741, None, 42.266154, 42.081308, 41.384244, 40.668681, 40.662325, 41.135991, 41.168444, 41.987644, 41.994646, 42.99766, 43.728081, 43.650075, 43.504477, 44.405817, 44.784037, 45.500014, 45.586804, 44.995858, 41.308642, 41.259859, 42.043971, 42.324109, 42.116034, 41.783316, 42.027151, 42.443895, 42.792298, 43.132975, 44.031034, 44.284016, 44.609836, 44.514854, 45.245998, 45.408391, 45.259047, 46.234646, 46.853006, 46.804637, 47.048705, 46.60899, 46.39933, 46.561034, 47.075628, 47.743753, 47.715847, 48.394152, 49.152039, 49.356006, 50.454698, 49.87476, 50.605128, 51.692762, 51.718652, 51.02624, 50.621717, 51.043551, 51.063653, 50.545442, 50.842194, 50.79907, 51.272659, 51.96042, 52.447548, 52.719986, 52.979996, 53.664993, 54.006265, 54.354228, 54.601267, 54.970392, 55.38525, 55.169734, 54.133285, 54.376655, 54.035617, 53.48981, 53.546861, 54.490524, 54.177003, 53.404415, 50.864751, 51.388336, 50.812196, 51.069183, 50.889246, 50.3114, 50.117303, 49.692859, 49.826675, 49.214981, 48.549182, 48.455751, 47.452969, 47.000956, 47.330031, 45.53965, 45.317027, 44.917517, 43.180362, 42.920068, 42.349999, 42.496683, 42.856092, 42.960686, 42.988022, 42.8779, 43.298339, 43.091272, 42.500894, 42.845395, 42.704293, 42.266154, None, -0.85829, -1.68325, -2.08255, -2.49979, -2.57309, -3.27768, -3.68116, -4.34653, -4.67677, -3.67712, -3.09699, -1.05982, -0.95, 0.109814, 0.515, 1.17694, 1.90584, 3.05374, 3.5556, 4.249885, 4.847123, 5.506, 5.338232, 4.776966, 4.447864, 4.447864, 3.598605, 3.58851, 3.61607, 3.50074, 3.42206, 3.83879, 4.25702, 3.91909, 3.918912, 2.78452, -0.85829, None, 42.266154, 42.704293, 42.845395, 42.500894, 43.091272, 43.298339, 42.8779, 42.988022, 42.960686, 42.856092, 42.496683, 42.349999, 42.123941, 41.582243, 41.185316, 41.066486, 40.427946, 40.562072, 40.366425, 39.893973, 39.660008, 39.431237, 39.279463, 39.604198, 39.526683, 40.103211, 39.935754, 40.244366, 40.145844, 40.866033, 41.3929, 41.143587, 41.519998, 42.167711, 42.266154, None, 10.632555, 11.153661, 12.186595, 13.394247, 14.225721, 14.416743, 14.273212, 13.881091, 14.570584, 14.202441, 13.535531, 12.337206, 11.567615, 10.961812, 10.88931, 10.486544, 10.632555, None, 38.612243, 37.432392, 36.784189, 35.632141, 35.082484, 34.890377, 34.475674, 34.390046, 34.93456, 35.684541, 36.725485, 36.893924, 37.749686, 37.840378, 37.804773, 38.256115, 38.304536, 38.370397, 38.612243, None, 42.05186, 41.84711, 41.85541, 42.21787, 42.32025, 42.58863, 42.81275, 42.88469, 43.21671, 43.27205, 43.13094, 43.068685, 42.90959, 42.86255, 42.67717, 42.6827, 42.43922, 42.32025, 42.245224, 42.2068, 42.05186, None, 29.975819, 29.534477, 29.306299, 28.552004, 28.526063, 29.002519, 29.099025, 30.05907, 29.975819, None, 14.273212, 14.723934, 15.570316, 16.441865, 17.428859, 18.240954, 18.309632, 17.961695, 17.932782, 18.109102, 17.512497, 18.408928, 19.462585, 19.508344, 20.109238, 20.41785, 20.786122, 21.436573, 21.201652, 21.174367, 22.318199, 22.464753, 21.675137, 20.766562, 20.758733, 19.886642, 19.624668, 19.265181, 18.666975, 17.485315, 16.604284, 15.908538, 15.202173, 14.202441, 14.570584, 13.881091, 14.273212, None, 33.277426, 33.264275, 33.08904, 33.0909, 33.90545, 34.610058, 34.644914, 34.593935, 34.201789, 33.824912, 33.277426, None, 4.364566, 4.355755, 4.832419, 5.593561, 6.140711, 6.785917, 7.105846, 7.396706, 7.939464, 8.406206, 8.428504, 8.541055, 7.928534, 7.526905, 7.313921, 7.309037, 7.711674, 7.686043, 7.395208, 6.911801, 6.467564, 6.193033, 6.12619, 5.707352, 5.313345, 5.188159, 4.364566, None, 22.86295, 22.491289, 23.040506, 23.471668, 24.097909, 24.562532, 24.379313, 24.936954, 25.365455, 26.094325, 26.512206, 27.140953, 27.688259, 28.144174, 28.95999, 29.424638, 30.307556, 30.539325, 30.961831, 31.37607, 31.761421, 32.081815, 32.368903, 33.136996, 32.79278, 32.87882, 32.71196, 32.26508, 31.37626, 31.18218, 30.76357, 30.26639, 30.52582, 30.98576, 31.75179, 32.2382, 32.7068, 32.8432, 32.63858, 32.19149, 32.18726, 32.01667, 31.89936, 31.56915, 31.08929, 30.6616, 30.04419, 29.238655, 25.6825, 22, 20.00304, 20, 19.58047, 21.49509, 23.40972, 22.86295, None, 7.523055, 6.481775, 6.197141, 5.96837, 6.763463, 8.200843, 9.824078, 9.268427, 8.564206, 7.523055, None, -28.955597, -29.257387, -29.743766, -30.070051, -30.226217, -30.545732, -30.645106, -29.875954, -29.242711, -28.851469, -28.647502, -28.955597, None, 54.327537, 54.582741, 54.856574, 55.015299, 55.190482, 56.031076, 56.337802, 56.273671, 56.372528, 56.164531, 56.100297, 55.615107, 55.167176, 54.846963, 54.282423, 53.905702, 53.912498, 54.220567, 54.327537, None, 50.128052, 49.902226, 49.463803, 49.442667, 49.529484, 50.090328, 50.128052, None, 56.031076, 56.783873, 57.411871, 57.753374, 57.006236, 57.025693, 57.793424, 57.970157, 57.847529, 57.476389, 57.474528, 57.244258, 56.759326, 56.16913, 55.783314, 55.615107, 56.100297, 56.164531, 56.372528, 56.273671, 56.337802, 56.031076, None, 35.755182, 35.330712, 35.399855, 35.179093, 35.168396, 34.527919, 33.919713, 32.864015, 32.651522, 32.262889, 32.094346, 31.724498, 31.637294, 30.896952, 30.501188, 30.000443, 29.7317, 29.579228, 28.841289, 27.656426, 27.656426, 27.656426, 27.120696, 27.088476, 26.860945, 26.860945, 26.990808, 26.883424, 26.104092, 26.030866, 24.770116, 23.691009, 22.310163, 21.86094, 21.5006, 21.420734, 21.42231, 21.885745, 22.158234, 22.67934, 23.017768, 23.723358, 24.359134, 24.520261, 25.103533, 25.636265, 26.254418, 26.618892, 27.640148, 27.654148, 28.038186, 28.148644, 28.832142, 29.098586, 29.933574, 31.177736, 32.038096, 32.564679, 33.240245, 33.697065, 34.110476, 35.145865, 35.759988, 35.755182, None, 48.220726, 48.368211, 48.467119, 48.155562, 48.118149, 47.849095, 47.510227, 47.346645, 46.928583, 46.674361, 46.525326, 46.423937, 46.349988, 46.379262, 46.517678, 46.437889, 46.25883, 45.939987, 45.596907, 45.488283, 45.944586, 46.371563, 46.810476, 47.405117, 47.826771, 48.123264, 48.220726, None, -12.469833, -12.895285, -13.555761, -14.758789, -15.226512, -15.706069, -16.000263, -15.414253, -15.710204, -16.451037, -16.875042, -17.106036, -17.953064, -19.118781, -20.496888, -22.391501, -23.781959, -24.94163, -25.178463, -25.601434, -25.346101, -24.988345, -24.460677, -23.574116, -22.776904, -22.057413, -21.336475, -21.163307, -20.830459, -20.072366, -19.435454, -18.961995, -18.331387, -17.409945, -16.850496, -16.216219, -16.179374, -15.974373, -15.793454, -15.780018, -15.210182, -14.594303, -14.091233, -13.663869, -13.784068, -13.089175, -12.487868, -12.040557, -12.469833, None, 25.869997, 24.992144, 24.272343, 22.93258, 22.444212, 21.898689, 21.411019, 20.635433, 19.890931, 19.320371, 18.828024, 18.562717, 18.144371, 18.423837, 18.524839, 18.704569, 18.876083, 19.28412, 19.867418, 20.707522, 20.999855, 21.261726, 21.493675, 21.458846, 21.543543, 21.331515, 20.849865, 20.255405, 19.646553, 19.472403, 19.04013, 18.259816, 18.516648, 18.499982, 18.486831, 17.883198, 18.001511, 17.955468, 17.808319, 17.819326, 17.817595, 17.254658, 17.252177, 16.918477, 16.687483, 16.470778, 16.41011, 16.069562, 16.066565, 15.251447, 15.064585, 14.830103, 14.538829, 15.61543, 15.940164, 16.200975, 16.128318, 15.752088, 15.653515, 15.917065, 16.107312, 16.566043, 16.706164, 17.171071, 17.649026, 17.91609, 17.975751, 18.292295, 18.748572, 19.316134, 19.946767, 20.434102, 20.531719, 20.816895, 21.076285, 21.422104, 21.871146, 22.26908, 22.773752, 23.767774, 24.548915, 25.172314, 25.580609, 25.824884, 26.442934, 26.676176, 27.162115, 27.859876, 27.941241, 28.467953, 28.954409, 29.266844, 30.021114, 30.786881, 31.170966, 31.567608, 31.524045, 31.799532, 31.393485, 30.913617, 30.162681, 29.750432, 29.061611, 28.826174, 28.754783, 28.411289, 28.42519, 27.780217, 27.525814, 27.171727, 26.662817, 25.73259, 25.294606, 24.826004, 24.298595, 24.265548, 23.811183, 23.364672, 23.185588, 22.818272, 22.823078, 23.430973, 24.000964, 24.484423, 24.738413, 25.470125, 26.012004, 26.32196, 26.768186, 26.63946, 26.900064, 27.14209, 27.722727, 27.7982, 27.741485, 28.115003, 28.566112, 29.279479, 29.556362, 30.180794, 30.836464, 31.635744, 32.53534, 32.61239, 32.72083, 32.52528, 32.03914, 31.33472, 31.34194, 31.34222, 31.754854, 31.75452, 31.39995, 31.08383, 30.64402, 30.12173, 29.57196, 29.27, 28.97, 29.76, 29.7793, 29.38071, 28.69612, 28.11, 27.54, 26.84, 26.37, 26.06, 25.84, 25.869997, None, 41.85541, 41.84711, 42.05186, 42.2068, 42.245224, 42.30364, 42.32026, 41.999297, 41.337994, 41.3048, 41.130487, 41.149866, 40.931275, 40.842727, 41.08622, 41.51509, 41.85541, None, 14.616834, 14.799097, 15.388208, 15.411256, 15.132746, 15.330486, 15.264107, 15.486497, 15.50169, 16.201854, 16.325102, 20.640833, 24.956591, 24.974574, 22.792666, 20.610809, 20.142233, 19.85623, 19.693579, 19.057364, 19.155265, 16.852227, 16.184284, 15.56812, 15.409525, 15.323561, 14.968182, 14.928908, 14.924309, 15.116158, 14.973815, 14.559008, 14.246418, 13.79815, 13.541267, 13.337662, 13.472485, 13.228444, 12.542646, 11.713859, 11.375146, 10.95127, 10.370737, 10.222555, 10.096361, 10.524061, 10.411303, 10.430811, 10.138994, 10.147236, 10.297382, 10.206535, 10.494812, 10.792597, 10.909257, 10.810891, 11.136246, 11.393646, 11.812561, 12.088358, 12.30806, 12.334286, 12.194243, 12.060479, 11.844084, 11.923975, 12.177887, 12.211245, 12.077971, 12.076834, 12.442988, 12.754519, 13.141214, 13.422075, 13.994727, 14.616834, None, 35.852721, 35.820191, 35.821664, 35.872281, 35.978399, 35.957444, 35.886285, 35.852721, None, 36.027569, 36.012143, 36.042245, 36.060383, 36.075809, 36.062295, 36.03625, 36.027569, None, 20.186598, 19.752981, 19.708203, 18.62708, 18.445438, 17.567946, 16.837836, 16.177824, 15.308497, 15.123703, 14.622028, 13.827503, 13.269294, 12.804748, 11.892763, 10.960546, 9.93296, 10.675266, 11.441292, 12.032987, 13.122378, 13.64046, 14.837286, 16.100568, 16.928734, 16.427241, 15.71439, 15.803454, 16.037936, 17.27724, 18.213514, 19.366493, 19.726962, 19.855145, 20.670883, 21.475485, 21.324048, 22.041239, 22.27846, 22.703111, 23.043658, 24.078556, 23.850741, 24.675238, 25.162495, 26.001307, 26.573572, 27.264589, 27.083774, 27.699059, 27.882536, 28.261583, 28.335945, 27.747221, 27.508812, 26.743536, 25.918703, 25.083637, 23.897405, 24.063286, 23.142722, 22.949039, 22.118314, 21.742937, 21.558839, 21.849984, 21.436573, 20.786122, 20.41785, 20.186598, None, 42.500093, 42.688247, 42.19574, 41.87755, 41.95502, 42.28151, 42.48, 42.65, 43.20011, 43.43253, 43.52384, 43.35229, 43.21378, 43.10604, 42.89852, 42.81275, 42.58863, 42.500093, None, 49.297198, 49.470521, 50.331812, 50.802171, 50.49529, 50.480537, 50.013433, 49.977467, 49.726061, 50.422401, 51.010995, 52.047366, 51.634006, 51.516856, 51.259921, 50.510561, 50.089966, 50.275329, 50.406019, 50.274296, 49.793705, 49.282548, 49.292961, 49.130128, 49.377968, 49.543565, 50.248303, 50.140247, 49.805177, 49.888531, 49.134598, 48.135383, 47.726545, 47.85341, 47.697709, 48.06673, 47.74706, 47.048059, 46.69268, 46.805412, 46.672733, 46.388202, 45.727235, 45.339817, 44.808893, 45.011646, 45.102079, 44.457442, 44.073176, 43.743118, 43.406834, 42.871234, 42.519446, 42.481516, 42.134328, 41.59741, 41.908347, 41.907468, 42.514873, 42.663804, 42.524691, 42.74889, 42.725635, 43.319449, 44.241331, 44.352332, 44.975472, 45.115076, 45.286073, 45.719716, 46.888146, 47.693549, 48.069082, 48.599463, 49.297198, None, -11.52002, -11.439146, -11.720938, -11.594537, -11.568751, -11.268769, -11.285202, -10.896854, -10.317096, -10.765441, -11.761711, -12.639177, -14.201975, -14.691764, -15.406294, -16.100774, -16.720891, -17.101023, -17.586368, -18.659688, -18.84226, -19.552811, -19.784012, -20.497043, -21.254361, -21.840837, -22.14, -22.09, -23.070788, -23.535359, -23.706563, -24.12261, -24.478351, -24.816314, -25.357573, -25.727318, -26.148584, -26.215867, -26.742192, -26.73382, -26.29178, -25.843332, -25.484284, -24.369417, -23.658969, -22.25151, -21.116489, -20.395292, -20.30429, -19.715592, -19.419383, -18.67209, -17.979057, -16.713398, -16.392074, -16.319417, -16.07199, -15.860944, -15.880839, -15.507787, -14.796099, -13.97186, -14.451831, -14.35995, -14.61301, -15.013709, -15.478641, -16.18356, -16.8013, -16.10744, -15.896859, -14.611046, -13.887834, -13.565425, -13.579998, -12.280025, -11.52002, None, 14.616834, 15.303692, 16.039383, 16.304302, 16.598264, 16.587282, 16.369337, 16.455663, 16.135036, 16.673892, 17.166963, 18.108482, 19.096716, 19.593817, 20.092521, 20.567866, 20.999752, 21.333323, 21.327071, 22.77122, 23.284832, 23.374594, 25.933353, 25.881056, 27.395744, 24.974574, 24.956591, 20.640833, 16.325102, 16.201854, 15.50169, 15.486497, 15.264107, 15.330486, 15.132746, 15.411256, 15.388208, 14.799097, 14.616834, None, -11.52002, -12.280025, -13.579998, -13.565425, -13.887834, -14.611046, -15.896859, -16.10744, -16.8013, -16.18356, -15.478641, -15.013709, -14.61301, -14.35995, -14.451831, -13.97186, -13.712858, -12.783871, -12.435778, -11.607198, -10.79655, -10.525559, -9.676722, -9.230599, -9.417151, -9.693674, -10.16, -11.52002, None, 6.204867, 5.691384, 5.810808, 6.221636, 6.128205, 5.524495, 4.855001, 4.181606, 3.726698, 3.382869, 2.791019, 2.515454, 1.631141, 1.293048, 1.226334, 1.967115, 2.760814, 3.270292, 3.93914, 4.76728, 5.312493, 6.040562, 6.464489, 6.642825, 6.204867, None, 4.478202, 4.137551, 4.306094, 4.306559, 3.169238, 2.821482, 1.430688, 1.217549, 1.49779, 1.410121, 0.904441, 0.976478, 0.773131, 1.338136, 2.006467, 1.663775, 1.850637, 2.697303, 2.885897, 3.102395, 3.893509, 4.525874, 4.007637, 4.348314, 4.316636, 4.955228, 5.44773, 6.143191, 6.924771, 6.928053, 6.422166, 5.98749, 5.708696, 5.407836, 5.016128, 4.966519, 4.478202, None, -28.576705, -27.821247, -27.090956, -26.117372, -25.39292, -23.853014, -22.656653, -22.111208, -21.699037, -20.872834, -19.673166, -19.045349, -18.069129, -17.301889, -17.111668, -16.941343, -16.971212, -17.423381, -17.353101, -17.309951, -17.789095, -17.930636, -17.523116, -17.295843, -17.353411, -17.578823, -17.661816, -17.887125, -17.889347, -18.281261, -17.869038, -18.219146, -18.252219, -21.814327, -21.849157, -24.76779, -28.461105, -28.972443, -29.045462, -28.856378, -28.783514, -28.355943, -28.082162, -28.576705, None, -21.080005, -21.700019, -22.159991, -22.399976, -22.129708, -21.679607, -21.14982, -20.444747, -20.105646, -20.120012, -20.459991, -20.800022, -21.080005, None, 11.94015, 12.625018, 12.851826, 13.33575, 13.988733, 14.444235, 14.928908, 14.968182, 15.323561, 15.409525, 15.56812, 16.184284, 16.852227, 19.155265, 19.601207, 21.565661, 23.471668, 23.040506, 22.491289, 22.86295, 21.308519, 21.048457, 20.730415, 20.387619, 19.95718, 17.92795, 16.627306, 15.684366, 14.367134, 13.996691, 13.353449, 13.330427, 12.859396, 12.802035, 12.483657, 12.461565, 13.556356, 13.596147, 13.037189, 13.32898, 13.387323, 13.246918, 13.277252, 12.851102, 12.826659, 13.343527, 13.098038, 13.115091, 13.492768, 13.865924, 13.747482, 13.531216, 12.956109, 12.552903, 11.660167, 12.235636, 12.233052, 11.94015, None, 4.771983, 4.412108, 4.464689, 4.240594, 4.262453, 4.887971, 5.611802, 6.270651, 6.2583, 6.258817, 7.870734, 8.506845, 9.137608, 9.444153, 10.06321, 10.332186, 10.734746, 11.327939, 11.660167, 12.552903, 12.956109, 13.531216, 13.747482, 13.865924, 13.492768, 13.115091, 13.098038, 13.343527, 12.826659, 12.851102, 13.277252, 13.246918, 13.387323, 13.32898, 13.037189, 13.596147, 13.556356, 12.461565, 12.483657, 12.085361, 11.904752, 11.572369, 10.798566, 10.160362, 9.640626, 9.417772, 8.717763, 8.305824, 7.799808, 7.397042, 6.981383, 6.644427, 7.055358, 7.03877, 6.453482, 6.444491, 5.479666, 4.771983, None, 11.088445, 11.403439, 11.806877, 12.143962, 12.458258, 12.90991, 13.064552, 12.914018, 12.984686, 13.025794, 13.254204, 13.263093, 13.754845, 13.778487, 13.771356, 14.038187, 13.836055, 13.960078, 14.079012, 14.35437, 14.560197, 14.551541, 14.790493, 14.819587, 14.666805, 14.621614, 14.748764, 14.749436, 14.880074, 15.016267, 14.995829, 14.899866, 14.676624, 14.310703, 13.970078, 13.567699, 13.127054, 12.869292, 12.419087, 12.32085, 11.893124, 11.629032, 11.373311, 11.103044, 10.938764, 10.726839, 10.79345, 10.999226, 11.082657, 10.952303, 11.217119, 11.088445, None, 53.510403, 53.482162, 53.144043, 52.22844, 51.852029, 51.851616, 50.803721, 51.037298, 51.475024, 51.267259, 51.345755, 51.620545, 53.091798, 53.510403, None, 71.185474, 70.453788, 70.186259, 69.55808, 69.156916, 69.064777, 69.766491, 70.164193, 69.825299, 69.092114, 68.649557, 68.891247, 68.841741, 69.370443, 69.106247, 69.065139, 68.407194, 68.567391, 68.010552, 68.013937, 67.302456, 66.193867, 64.787028, 64.445421, 64.049114, 64.066219, 63.128318, 61.800362, 61.293572, 60.117933, 59.432393, 58.856149, 59.469807, 58.313288, 58.078884, 58.588155, 59.663232, 61.970998, 62.614473, 63.454008, 64.486038, 65.879726, 67.810642, 68.563205, 69.817444, 70.255169, 70.202072, 71.030497, 70.986262, 71.185474, None, 77.85385, 77.44493, 77.67704, 77.93504, 78.25463, 78.45494, 78.07954, 77.85385, None, 79.70175, 78.95611, 78.5626, 77.82669, 77.63796, 76.80941, 76.77045, 77.38035, 77.73565, 78.02493, 78.8693, 79.65239, 80.01046, 79.66039, 79.67431, 80.01608, 80.05086, 79.70175, None, 80.40734, 80.056406, 79.517834, 79.400012, 79.566823, 79.842362, 79.85988, 80.318896, 80.598156, 80.357679, 80.657144, 80.40734, None, 27.876542, 27.445819, 26.810405, 26.414615, 26.397898, 26.630985, 26.726198, 27.234901, 27.364506, 27.925479, 28.416095, 28.79447, 29.729865, 30.183481, 30.422717, 30.115268, 29.463732, 29.320226, 28.839894, 28.642774, 28.203576, 27.974262, 27.876542, None, -40.919052, -41.331999, -40.926701, -41.349155, -41.770008, -42.233184, -42.970038, -43.372288, -43.853344, -43.865694, -44.242519, -44.897104, -45.908929, -46.355775, -46.641235, -46.619945, -46.290197, -46.219917, -45.852705, -45.110941, -44.123973, -43.935819, -43.555326, -43.031688, -42.512754, -41.767424, -41.514417, -40.956104, -40.493962, -40.919052, None, -36.156397, -37.209098, -36.526194, -36.798942, -37.555382, -37.881253, -37.961248, -37.579825, -37.695373, -38.582813, -39.166343, -39.145776, -39.449736, -39.879943, -40.065978, -40.604808, -41.289624, -41.688308, -41.425895, -41.281821, -40.459236, -39.908933, -39.508854, -39.146602, -38.797683, -38.027808, -37.381129, -36.711092, -36.534824, -36.121981, -35.237125, -34.529107, -34.450662, -35.006183, -35.265496, -36.156397, None, 21.114035, 20.428986, 20.481437, 20.243002, 19.736005, 19.06757, 18.94471, 18.947991, 18.574267, 18.087113, 17.876067, 17.884128, 17.632309, 17.228354, 16.950697, 17.044981, 16.707663, 16.651051, 17.349742, 19.000003, 19.999994, 22.000001, 22.70833, 23.110993, 23.524869, 23.933604, 24.130543, 24.269604, 24.920831, 24.924732, 24.241673, 23.878594, 23.747931, 23.565668, 22.992395, 22.660271, 22.533612, 22.310525, 21.714541, 21.433886, 21.114035, None, 25.895991, 25.714606, 26.055464, 26.395934, 26.309118, 25.895991, None, 37.133031, 36.666806, 35.898403, 35.49401, 34.653544, 34.504923, 34.748887, 34.317699, 33.441473, 32.7649, 32.271105, 31.692639, 30.979815, 29.976413, 28.961592, 27.91318, 27.989196, 26.940966, 26.491872, 25.722229, 25.215102, 24.356524, 24.359134, 23.691965, 23.944844, 24.663611, 25.425141, 25.237039, 25.218409, 25.078237, 26.239975, 26.756532, 27.217047, 27.378923, 28.259645, 28.699334, 29.303276, 29.829239, 29.318572, 29.468331, 29.340819, 29.560031, 29.472181, 29.887943, 30.738899, 31.304911, 31.303154, 31.58293, 31.71331, 31.620189, 31.901412, 32.501944, 33.105499, 33.358533, 34.02012, 33.988856, 34.348911, 34.733126, 35.153203, 35.650563, 36.074388, 36.509942, 36.720007, 36.836176, 37.020841, 37.133031, None, 7.223771, 7.512255, 8.052041, 8.319182, 8.387705, 8.718124, 8.996092, 8.932375, 8.584515, 8.333316, 8.298409, 8.090308, 7.547524, 7.419754, 7.271572, 7.220541, 7.817921, 7.647906, 7.70661, 8.108963, 8.175393, 8.292362, 8.290864, 8.073823, 8.225028, 8.423517, 8.626295, 8.807266, 8.925709, 9.07433, 9.476812, 9.566135, 9.207449, 8.995575, 8.950617, 9.031955, 8.786234, 8.858504, 9.111072, 9.312765, 9.61161, 9.552931, 9.454565, 9.420459, 9.24773, 8.946844, 8.670505, 8.524286, 7.935278, 7.638061, 7.70984, 7.223771, None, -17.580012, -18.092694, -18.347975, -17.773799, -17.363488, -16.359363, -15.265683, -14.649286, -13.823187, -13.535039, -12.222716, -10.377712, -8.386568, -7.930833, -7.194341, -6.541668, -6.136834, -5.690557, -4.736765, -4.036394, -3.404856, -3.821162, -4.059287, -4.425724, -4.346091, -4.454198, -4.959129, -4.547784, -3.873097, -3.003021, -2.608678, -1.56161, -0.911417, -0.152032, -0.057205, -0.53082, -1.002833, -1.260491, -2.308954, -2.434218, -2.16979, -2.342802, -2.256865, -2.725156, -3.742872, -3.766591, -4.298187, -4.251265, -4.401591, -4.593983, -5.274561, -5.741251, -6.089189, -6.629931, -6.918595, -7.340999, -7.52383, -8.424447, -9.032833, -9.462213, -9.520194, -10.053598, -10.079436, -9.490118, -11.009147, -11.123972, -10.951734, -12.5613, -12.899729, -13.602684, -14.453639, -14.953195, -15.323974, -15.660129, -16.500698, -17.580012, None, 8.414706, 7.750354, 7.189381, 6.274294, 7.293715, 6.786485, 6.049657, 5.581003, 6.161355, 6.885136, 7.36061, 7.833527, 7.418876, 7.457375, 6.899424, 7.192119, 8.034962, 8.316237, 8.69301, 8.240324, 8.514158, 8.960409, 8.986997, 9.760335, 9.286074, 8.782487, 8.414706, None, 10.278779, 9.950091, 9.318269, 9.022189, 9.713361, 9.981045, 10.261157, 10.881868, 10.940624, 10.267384, 11.232726, 10.278779, None, 9.316383, 8.3675, 9.066889, 9.6845, 10.376292, 11.369668, 10.554291, 10.003653, 9.316383, None, 11.891755, 11.582187, 11.58366, 11.165934, 10.741308, 10.441017, 10.905691, 11.415841, 11.891755, None, 12.162695, 11.046122, 11.311455, 10.975816, 10.358722, 10.134679, 10.837995, 10.88993, 11.495371, 11.415583, 11.79419, 12.557761, 12.535721, 12.162695, None, 13.06959, 12.20556, 12.704496, 13.466413, 13.429697, 13.06959, None, 18.504065, 18.218552, 18.47895, 18.224883, 17.810283, 17.093505, 16.262444, 15.931018, 15.124814, 14.328376, 14.218202, 14.336541, 13.782131, 13.237771, 12.997527, 12.536677, 13.027526, 13.55292, 13.185836, 13.784482, 13.636687, 13.857656, 14.271016, 14.525393, 14.756671, 14.396279, 14.970869, 15.406347, 16.363704, 16.034629, 17.599081, 18.505227, 18.504065, None, -6.819997, -6.919991, -6.535931, -5.900828, -5.139118, -5.042431, -5.339984, -5.566792, -6.200655, -6.540014, -6.819997, None, -5.478063, -5.56028, -5.840728, -6.083763, -6.317754, -6.316513, -6.02604, -5.747142, -5.437756, -5.583742, -5.505503, -5.026101, -5.001348, -5.53222, -5.455842, -5.113693, -4.757074, -4.167807, -4.14879, -4.312966, -4.867661, -5.478063, None, -7.388024, -8.044108, -9.104664, -9.071436, -9.514406, -9.684318, -9.872937, -10.293687, -10.582713, -10.652476, -10.393267, -10.280923, -10.130441, -9.492444, -8.942555, -8.067414, -7.630128, -7.91533, -8.245491, -8.983069, -9.326821, -9.159596, -9.117893, -5.859022, -2.600151, -3.289153, -3.861418, -4.373738, -4.876498, -5.465609, -6.083659, -6.614015, -6.721657, -7.388024, None, -4.499983, -4.766427, -4.176127, -3.789743, -3.462062, -3.035422, -2.741486, -2.500002, -2.779985, -2.999972, -3.240009, -3.659983, -3.980015, -4.499983, None, 51.106674, 51.745188, 52.089947, 52.62485, 52.981263, 53.248171, 53.757029, 54.050706, 54.513159, 54.851536, 54.682606, 54.438719, 54.426084, 54.312525, 54.327537, 54.220567, 53.912498, 53.470122, 53.089731, 52.691099, 52.486977, 52.023647, 51.578454, 50.705407, 50.424881, 50.308506, 49.476774, 49.027395, 49.085738, 49.470107, 49.328772, 49.431453, 49.217125, 49.571574, 49.435846, 49.49623, 49.988629, 50.049038, 50.362146, 50.473974, 50.215747, 50.422607, 50.697733, 50.78473, 51.106674, None, 18.514762, 18.426679, 18.228035, 17.975906, 17.981823, 17.946553, 18.37446, 18.520601, 18.514762, None, 42.395009, 42.220007, 42.280004, 41.941368, 41.601104, 40.882828, 40.661808, 40.485436, 40.189847, 40.025413, 39.75685, 39.323931, 39.213472, 39.050898, 38.612243, 38.370397, 38.304536, 38.256115, 37.804773, 37.840378, 37.749686, 37.94001, 37.752089, 37.669071, 37.857224, 37.948821, 38.108346, 38.548474, 38.665857, 38.848559, 39.387958, 39.551385, 39.660344, 39.928493, 40.569824, 41.107336, 41.816569, 41.503152, 41.466772, 41.994285, 42.424982, 42.985387, 42.395009, None, 41.880571, 42.134689, 42.280469, 41.790886, 41.792075, 41.918346, 41.883387, 41.381815, 41.111083, 40.330872, 40.184524, 39.711892, 39.629571, 39.030073, 38.373059, 38.075764, 37.803894, 37.428904, 37.097788, 36.838269, 36.97888, 36.868809, 37.651346, 38.266243, 38.358486, 38.737429, 39.392066, 39.755093, 40.159306, 40.760639, 41.184334, 41.543459, 41.880571, None, -22.249029, -21.051635, -20.513735, -19.633737, -19.342747, -19.356906, -19.868399, -20.176701, -20.732688, -22.090176, -22.282154, -22.0863, -22.35693, -22.655619, -23.571998, -23.956935, -24.001274, -23.839578, -24.021014, -24.5708, -25.162185, -25.739255, -26.621786, -27.387837, -27.548499, -27.395899, -27.123719, -25.603657, -25.16234, -24.771459, -24.032796, -23.880713, -22.249029, None, 24.754743, 25.482424, 26.006992, 26.114582, 25.801113, 25.21567, 24.627386, 24.556331, 24.754743, None, 47.882194, 48.096341, 47.985598, 47.981878, 47.737526, 47.891056, 47.987149, 48.220881, 48.220726, 48.123264, 47.826771, 47.405117, 46.810476, 46.371563, 45.944586, 45.488283, 45.304031, 45.464925, 45.293308, 45.035391, 44.82021, 44.913874, 43.707462, 43.812468, 44.175986, 43.943494, 43.688445, 43.741051, 43.897011, 43.823785, 44.234923, 44.409228, 44.578003, 44.702517, 44.478422, 44.768947, 45.18117, 45.416375, 45.734573, 46.127469, 46.316088, 46.994238, 47.672439, 47.882194, None, 50.7476, 48.976391, 49.306551, 47.861575, 46.836728, 46.137908, 46.740765, 45.966755, 46.805929, 47.780133, 48.859189, 49.615163, 50.952342, 51.935435, 53.301966, 53.762145, 54.225476, 54.365881, 53.704578, 52.74076, 51.75666, 50.7476, None, 54.327537, 54.312525, 54.426084, 54.86616, 55.190482, 55.015299, 54.856574, 54.582741, 54.327537, None, 66.58435, 66.33556, 67.06219, 66.91308, 65.97724, 65.54139, 65.43791, 64.46079, 64.25269, 64.2826, 64.63125, 64.92288, 65.35667, 65.52024, 65.39052, 65.74044, 66.11211, 65.87456, 65.40411, 64.979709, 68.963636, 68.2, 67.20589, 66.58435, None, 70.832199, 70.78114, 71.0988, 71.515714, 70.832199, None, 70.89302, 70.832199, 71.515714, 71.55762, 71.55553, 71.26948, 71.13277, 70.89302, None, 73.21244, 73.20544, 73.31692, 73.36983, 73.76506, 73.85758, 73.47525, 73.21244, None, 75.08406, 74.68892, 74.778355, 75.17298, 75.49682, 75.345845, 75.08406, None, 75.562625, 74.82, 74.84768, 74.61148, 75.26167, 75.94917, 76.13676, 76.09289, 75.562625, None, 70.720464, 70.632743, 70.762658, 71.206662, 71.474759, 72.014881, 72.229442, 72.774731, 73.627548, 73.749814, 74.627486, 75.081412, 75.60939, 76.251883, 76.439055, 76.809782, 76.939697, 76.544811, 76.233642, 75.737755, 75.260885, 74.309056, 73.333044, 72.371268, 71.540595, 70.720464, None, 76.97419, 76.48, 76.72335, 76.71, 76.22224, 75.84764, 75.32779, 75.03186, 74.47673, 74.18, 74.04, 73.78774, 73.97693, 73.33505, 73.59488, 73.75285, 73.58772, 73.12, 72.97122, 73.73503, 73.56, 73.56549, 73.03871, 72.39872, 71.98, 71.19304, 70.78699, 71.8363, 71.38642, 71.65525, 71.34763, 71.62803, 71.48783, 72.41619, 72.84941, 72.2, 71.60643, 70.84222, 71.03141, 70.86672, 70.45324, 69.72198, 69.43728, 69.64204, 69.66823, 69.47199, 69.58269, 68.6938, 69.01363, 69.65276, 70.09703, 69.81743, 69.87725, 69.4, 68.963636, 64.979709, 64.97433, 64.53493, 64.60821, 64.07593, 63.25197, 62.98262, 62.56894, 62.3041, 62.5219, 61.76915, 61.65261, 60.95, 60.33618, 59.88177, 60.57355, 59.78855, 60.16, 59.7316, 59.86871, 59.21101, 58.24328, 57.83912, 57.61503, 56.15924, 56.12219, 55.28568, 54.85514, 54.34433, 53.20257, 52.95868, 51.94269, 51.01105, 51.7, 53.15895, 55.38103, 56.76792, 57.3647, 57.83204, 58.05575, 59.31477, 60.343, 61.1409, 62.55061, 62.46627, 61.6425, 60.54423, 61.77396, 61.43442, 59.75818, 59.14495, 58.88385, 58.78089, 59.50396, 59.65573, 59.16448, 59.33637, 59.03998, 57.08805, 54.72959, 54.60355, 53.97732, 53.75501, 54.25455, 54.18968, 53.08957, 52.23877, 51.23967, 50.04553, 48.44671, 46.99965, 46.30795, 45.1435, 43.989, 43.39821, 42.81147, 42.79849, 43.28456, 42.55274, 42.22, 42.395, 42.903015, 42.92999, 44.11152, 44.96796, 45.321162, 45.14409, 46.116927, 47.21248, 47.57845, 48.47823, 48.183442, 47.78896, 47.79013, 48.729687, 49.4406, 49.76027, 50.739797, 51.353894, 51.784255, 52.792799, 53.161045, 53.4588, 53.431726, 53.251401, 52.753886, 52.516226, 51.96411, 51.64355, 50.58292, 50.142883, 49.510983, 49.888531, 49.805177, 50.140247, 50.248303, 49.543565, 49.377968, 49.130128, 49.292961, 49.282548, 49.793705, 50.274296, 50.406019, 50.27532, 50.089966, 50.51056, 51.25991, 51.516856, 51.634006, 52.047366, 51.010995, 50.422401, 49.72605, 49.97746, 50.013433, 50.480537, 50.49529, 50.802171, 50.331812, 49.470521, 49.297198, 49.214981, 49.826675, 49.692859, 50.117303, 50.3114, 50.889246, 51.069183, 50.812196, 51.388336, 50.864751, 53.404415, 54.177003, 54.490524, 53.54685, 53.48981, 54.035617, 54.376655, 54.133285, 55.169734, 55.38525, 54.970392, 54.60125, 54.354228, 54.00625, 53.664993, 52.979996, 52.719986, 52.447548, 51.96042, 51.272659, 50.79907, 50.842194, 50.545442, 51.06364, 51.04355, 50.62171, 51.02624, 51.718652, 51.692762, 50.605128, 49.87476, 50.454698, 49.356006, 49.152039, 48.394152, 47.71585, 47.74377, 47.075628, 46.56104, 46.39933, 45.80629, 45.64149, 44.6092, 43.66016, 42.98658, 41.80888, 41.405819, 41.151416, 41.219732, 41.827137, 41.860675, 42.09244, 42.502781, 42.711993, 42.55496, 42.74083, 43.2203, 43.38215, 43.553104, 43.434998, 44.28, 44.65721, 45.24469, 45.40451, 46.24087, 46.63657, 47.04475, 47.26336, 47.10219, 47.5464, 47.82562, 47.898937, 48.23241, 48.78382, 49.30743, 49.60105, 49.926462, 49.915662, 50.383953, 50.225591, 50.577197, 50.77394, 51.207572, 51.255993, 51.566413, 51.768882, 52.335075, 52.238465, 52.288695, 52.06125, 52.10168, 52.742052, 53.073996, 53.16743, 53.132726, 53.351421, 53.618045, 53.794029, 53.974639, 54.157056, 54.811771, 55.081548, 55.550976, 55.789463, 55.670091, 55.918344, 56.16913, 56.759326, 57.244258, 57.474528, 57.791899, 58.72457, 59.300825, 59.47537, 60.02805, 60.50352, 61.780028, 62.357693, 62.867687, 63.552814, 64.204453, 64.948672, 65.80598, 66.944286, 67.698297, 68.364613, 69.064777, 69.15692, 69.55811, 69.90595, 69.30142, 69.06342, 67.9324, 67.45713, 66.79158, 66.26618, 65.99953, 66.75961, 66.63253, 65.90015, 65.436213, 64.41437, 64.10945, 63.84983, 64.33471, 64.76446, 65.14322, 64.52079, 64.76446, 65.49682, 66.47623, 66.41858, 66.06908, 66.75634, 67.35245, 67.95051, 68.57079, 68.25, 67.68997, 67.56652, 67.01005, 66.66767, 66.88455, 67.52238, 67.99867, 68.85738, 68.80815, 68.20131, 68.09702, 68.43866, 68.46628, 68.88082, 68.27844, 68.94069, 69.52, 69.85, 69.54739, 69.234835, 68.09233, 68.61563, 69.14436, 69.35649, 69.45461, 69.92873, 70.70889, 71.02897, 71.9345, 72.84336, 73.04, 72.77629, 72.22006, 71.40898, 71.09019, 70.39114, 69.02085, 68.4079, 67.7404, 66.32, 66.17267, 66.53267, 66.78946, 67.28429, 67.76047, 68.32899, 68.98918, 69.07146, 69.62763, 70.63175, 71.44717, 72.12119, 72.83227, 72.85497, 72.30056, 71.33556, 71.15287, 71.87401, 72.26717, 72.32011, 71.75, 72.58285, 73.6482, 73.85, 73.80591, 73.93688, 74.45967, 75.11643, 75.14393, 75.64, 75.77333, 76.0472, 76.14, 75.91548, 76.44689, 76.43028, 76.86189, 77.28754, 77.69792, 77.37389, 77.1274, 76.97419, None, 78.30689, 77.921, 79.23399, 79.34641, 79.28129, 78.71334, 78.30689, None, 80.54728, 80.415428, 80.339567, 80.175468, 80.010181, 80.247247, 80.559424, 80.58981, 80.771918, 80.78401, 80.514569, 80.753986, 80.918885, 80.699726, 80.54728, None, 78.88094, 78.7562, 79.044745, 79.4265, 80.14379, 80.34146, 81.0246, 81.2504, 80.746975, 79.780135, 78.88094, None, -1.134659, -1.698914, -2.28725, -2.413858, -2.348487, -2.917858, -2.839258, -2.292211, -2.21511, -1.620056, -1.341313, -1.443322, -1.134659, None, 27.120696, 27.656426, 27.656426, 27.589479, 27.395744, 25.881056, 25.933353, 23.374594, 23.284832, 22.77122, 21.327071, 21.333323, 20.999752, 21.42231, 21.420734, 21.5006, 21.86094, 22.310163, 23.691009, 24.770116, 26.030866, 26.104092, 26.883424, 26.990808, 26.860945, 26.860945, 27.088476, 27.120696, None, 16.347891, 16.774635, 17.075806, 17.474722, 17.833046, 18.6716, 19.486485, 20.174635, 20.338862, 21.291905, 21.986875, 22.579656, 23.688451, 24.078686, 24.285495, 24.858483, 25.084542, 25.602959, 25.826228, 26.570136, 27.37652, 28.063352, 28.058546, 28.607427, 28.957483, 29.356555, 29.197495, 29.505254, 29.865283, 30.003776, 30.338665, 30.5085, 31.508413, 32.010217, 32.161009, 31.889992, 31.190009, 29.178891, 29.099025, 29.002519, 28.526063, 28.552004, 27.689628, 27.461218, 27.109999, 26.689663, 26.277027, 25.943972, 25.60805, 25.327808, 24.999896, 24.754743, 24.556331, 24.627386, 24.245497, 24.014219, 23.001154, 22.496948, 22.70833, 22.000001, 19.999994, 19.000003, 18.616668, 18.166669, 17.116682, 16.949999, 17.283338, 17.233315, 17.333335, 17.433329, 17.410359, 17.319977, 17.579987, 17.08844, 16.66689, 16.347891, None, 9.464285, 9.484061, 9.981915, 10.325262, 10.720112, 11.441141, 12.179338, 12.248008, 12.024832, 11.97333, 11.681484, 11.080626, 10.531271, 9.810241, 9.707237, 10.290927, 10.084919, 9.793074, 9.604232, 9.398224, 9.398224, 9.604232, 9.638567, 9.466893, 9.55273, 10.136421, 10.411099, 10.27376, 9.810241, 8.917538, 8.728696, 8.61973, 8.666319, 8.954286, 9.265068, 9.681218, 10.089255, 10.714463, 11.142395, 11.38461, 11.67936, 12.26024, 12.64605, 12.58818, 12.95546, 13.37232, 13.78648, 14.09318, 14.32682, 14.94429, 15.68072, 15.61084, 19.58047, 20, 20.00304, 22, 22, 22, 22, 21.01885, 20.83744, 19.80796, 18.61409, 18.36786, 17.998307, 17.42754, 17.26314, 16.95655, 16.29186, 14.82249, 14.42211, 13.56333, 12.57828, 12.08286, 11.31896, 10.91017, 10.63009, 9.58358, 9.464285, None, 9.464285, 8.68456, 8.37916, 8.35458, 7.78497, 7.71334, 7.22595, 6.82607, 6.59422, 5.506, 4.847123, 4.249885, 3.79, 3.79232, 3.55827, 3.7819, 3.50917, 4.1737, 4.600805, 4.389267, 4.455077, 4.287155, 4.408413, 5.233944, 5.550953, 5.946717, 6.546603, 6.979316, 7.500085, 7.825104, 8.229188, 8.61973, 8.728696, 8.917538, 9.810241, 10.27376, 10.411099, 10.136421, 9.55273, 9.466893, 9.638567, 9.604232, 9.398224, 9.398224, 9.604232, 9.793074, 10.084919, 10.290927, 9.707237, 9.810241, 10.531271, 11.080626, 11.681484, 11.97333, 12.024832, 12.248008, 12.179338, 11.441141, 10.720112, 10.325262, 9.981915, 9.484061, 9.464285, None, 13.594959, 14.373516, 14.729541, 14.919477, 15.621527, 16.135036, 16.455663, 16.369337, 16.587282, 16.598264, 16.304302, 16.039383, 15.303692, 14.616834, 13.994727, 13.422075, 13.141214, 12.754519, 12.442988, 12.386583, 12.465648, 12.35444, 12.33209, 12.575874, 12.586183, 12.62817, 12.515567, 12.547762, 12.384852, 13.151394, 13.130284, 13.270353, 13.27857, 13.509512, 13.298207, 13.280585, 13.505042, 13.794068, 13.62568, 13.630357, 13.876492, 13.860369, 13.623587, 13.594959, None, -10.482719, -10.826367, -10.820011, -10.204751, -10.446701, -10.482719, None, -9.872937, -9.89521, -9.794027, -9.63998, -9.24295, -9.400304, -9.610162, -9.872937, None, -9.599982, -9.784312, -8.917543, -8.320009, -8.320009, -9.120011, -9.599982, None, -8.33732, -8.53829, -8.114181, -7.754824, -7.421872, -7.320018, -7.560003, -8.020027, -8.33732, None, -7.34782, -7.404767, -7.176874, -6.765943, -6.599338, -7.021638, -7.34782, None, 6.785917, 6.860098, 7.262942, 7.798646, 8.163946, 8.903049, 9.342712, 9.620188, 9.835834, 9.858572, 10.046984, 10.045873, 9.688246, 9.26791, 8.977178, 8.715541, 8.348896, 8.406206, 7.939464, 7.396706, 7.105846, 6.785917, None, 13.38448, 13.149017, 13.163951, 13.259734, 13.458533, 13.520622, 13.735338, 13.88197, 14.134228, 14.244816, 14.362586, 14.424133, 14.340029, 14.140507, 13.980155, 13.845486, 13.964626, 13.893312, 13.78505, 13.38448, None, 9.451749, 8.837626, 8.003, 7.996877, 9.18358, 9.540477, 10.02194, 10.57258, 10.926879, 11.46204, 11.27771, 10.864169, 10.445538, 10.442205, 10.698029, 10.816549, 11.127228, 11.193064, 11.375482, 11.410622, 11.394266, 10.982327, 9.9735, 9.451749, None, 11.5789, 11.67957, 12.0219, 12.02464, 11.74815, 11.16651, 10.6409, 10.27972, 9.19874, 8.08173, 6.80466, 5.33911, 4.2194, 2.85529, 2.04576, 1.05283, 0.2922, -0.91916, -1.44647, -1.68325, -0.85829, 2.78452, 3.918912, 4.23413, 4.25259, 4.95755, 5.00162, 8.003, 8.837626, 9.451749, 9.9735, 10.982327, 11.394266, 11.410617, 11.43033, 11.5789, None, 45.416375, 45.18117, 44.768947, 44.478422, 44.702517, 44.578003, 44.409228, 44.234923, 44.008063, 43.642814, 43.211161, 42.898519, 42.580321, 42.461362, 42.32026, 42.30364, 42.245224, 42.32025, 42.43922, 42.6827, 42.67717, 42.86255, 42.90959, 43.068685, 43.13094, 43.27205, 43.21671, 42.88469, 42.81275, 42.89852, 43.10604, 43.21378, 43.35229, 43.52384, 43.5681, 44.03847, 44.42307, 44.863, 44.86023, 45.236516, 45.521511, 45.90888, 46.17173, 46.127469, 45.734573, 45.416375, None, 5.97315, 5.772878, 5.953125, 6.025291, 5.756548, 4.896756, 4.212611, 3.620038, 3.18978, 2.732392, 2.311849, 2.523748, 2.421506, 2.510364, 2.220795, 2.021996, 1.817667, 1.899523, 2.768927, 3.333492, 3.334655, 4.060864, 4.576801, 4.812626, 5.073567, 5.97315, None, 49.49623, 49.435846, 49.571574, 49.217125, 49.431453, 49.328772, 49.470107, 49.085738, 48.825392, 48.422264, 48.319971, 48.623854, 48.56285, 48.327567, 48.202691, 48.266615, 48.111379, 48.081768, 47.880954, 47.758429, 47.867466, 48.123497, 48.470013, 48.596982, 48.816969, 48.800019, 48.903475, 48.996493, 49.043983, 49.271515, 49.315001, 49.495015, 49.49623, None, 46.509306, 46.431817, 46.658703, 46.683611, 46.852386, 46.841327, 46.503751, 46.238108, 45.834154, 45.731783, 45.452316, 45.471695, 45.634941, 45.466166, 45.500324, 45.591016, 46.016778, 46.509306, None, 65.723741, 65.026005, 64.413588, 63.609554, 62.7494, 61.341166, 60.636583, 60.081914, 58.953766, 58.719827, 57.041118, 56.104302, 56.200885, 55.407781, 55.361737, 56.30708, 57.441817, 58.856149, 59.432393, 60.117933, 61.293572, 61.800362, 63.128318, 64.066219, 64.049114, 64.445421, 64.787028, 66.193867, 67.302456, 68.013937, 68.010552, 68.567391, 68.407194, 69.065139, 69.106247, 68.616846, 67.936009, 66.396051, 66.006927, 65.723741, None, 57.385783, 57.326521, 56.179196, 56.556455, 57.385783, None, 57.958588, 57.651279, 57.444949, 57.441993, 57.370976, 57.305756, 57.204734, 57.127295, 56.926992, 56.891003, 57.109402, 57.267163, 57.394664, 57.545312, 57.929434, 57.941098, 57.993543, 57.996454, 57.958588, None, 63.82371, 63.829768, 63.71567, 63.579121, 63.59134, 63.714454, 63.780059, 63.82371, None, -26.73382, -27.177927, -27.285879, -26.743845, -26.398078, -26.022649, -25.731452, -25.660191, -25.843332, -26.29178, -26.73382, None, 33.378686, 32.312938, 32.709192, 32.716014, 32.868123, 33.277426, 33.824912, 34.201789, 34.593935, 34.644914, 35.410009, 35.821535, 36.040617, 36.259699, 36.81752, 36.623036, 36.90121, 36.712927, 36.716054, 37.091276, 37.074352, 37.229873, 36.605854, 36.358815, 35.628317, 34.419372, 33.378686, None, 12.859396, 13.330427, 13.353449, 13.996691, 14.367134, 15.68437, 16.627306, 17.92795, 19.95718, 20.387619, 20.730415, 21.04845, 21.308519, 22.86295, 23.40972, 21.49509, 19.58047, 15.61084, 15.68072, 14.94429, 14.32682, 14.09318, 13.78648, 13.37232, 12.95546, 12.58818, 12.64605, 12.26024, 11.67936, 11.38461, 11.142395, 10.971889, 10.567056, 9.475985, 9.012706, 9.074847, 8.982915, 8.630895, 8.281304, 7.890914, 7.508328, 7.734774, 7.754307, 7.497088, 7.421925, 7.692812, 8.38215, 8.796104, 8.965861, 9.549495, 10.021378, 9.920919, 9.992129, 9.982337, 10.891325, 11.555574, 12.21905, 12.859396, None, 6.142158, 5.928837, 6.279979, 6.914359, 7.411744, 8.312465, 8.677223, 9.465004, 10.191213, 10.706918, 11.018682, 10.997339, 10.470808, 10.175607, 9.825395, 9.334624, 9.12859, 6.832038, 6.142158, None, 12.186595, 12.64574, 12.627085, 13.412722, 13.406856, 12.307001, 10.846367, 9.963061, 9.239255, 9.207862, 8.295153, 7.429573, 6.856869, 6.740622, 6.221636, 5.810808, 5.691384, 6.204867, 6.642825, 6.464489, 6.848213, 7.343454, 7.907993, 8.382305, 7.794512, 8.350007, 8.973923, 9.93296, 10.960546, 11.892763, 12.804748, 13.269294, 13.827503, 14.622028, 15.123703, 15.308497, 16.177824, 16.837836, 17.567946, 18.445438, 18.62708, 19.708203, 19.752981, 20.186598, 20.41785, 20.109238, 19.508344, 19.462585, 18.408928, 17.512497, 18.109102, 17.932782, 17.961695, 18.309632, 18.240954, 17.428859, 16.441865, 15.570316, 14.723934, 14.273212, 14.416743, 14.225721, 13.394247, 12.186595, None, 40.244366, 39.935754, 40.103211, 39.526683, 39.604198, 39.279463, 39.431237, 38.505815, 38.606507, 38.378846, 37.990007, 37.41999, 37.421566, 37.495257, 37.047558, 36.948288, 36.738171, 37.065645, 37.905774, 37.953265, 38.258905, 38.486282, 38.138396, 37.735165, 37.588223, 37.608997, 37.151144, 37.344336, 37.023115, 37.144994, 38.157025, 38.901553, 39.140144, 39.580478, 39.533453, 40.086158, 40.727824, 40.960213, 40.496495, 40.218527, 40.244366, None, 35.650072, 36.491597, 36.527383, 37.412988, 37.522309, 38.029229, 38.121394, 37.935127, 37.964117, 37.392421, 37.198918, 37.906136, 38.952093, 39.290574, 39.975286, 40.033629, 40.876523, 40.631034, 40.951015, 41.551211, 42.123191, 41.868117, 41.135371, 41.783316, 42.116034, 42.324109, 42.043971, 41.259859, 41.308642, 41.32231, 41.826026, 42.170553, 42.751551, 42.223082, 41.425146, 41.220327, 41.26637, 41.084857, 40.053886, 39.363257, 38.892407, 38.402695, 37.974685, 37.362784, 37.39379, 37.661164, 37.305217, 37.111818, 36.312073, 36.007957, 35.857166, 35.404041, 35.270664, 35.650072, None, -8.89279, -8.656887, -8.432095, -8.398247, -8.273345, -8.397317, -8.668256, -9.106007, -9.393173, -9.089987, -8.89279, None, 10.76, 10.89, 10.855, 10.11, 10, 10.09, 10.365, 10.76, None, 30.307556, 32.102692, 32.506285, 32.748337, 33.344115, 34.097376, 34.655146, 35.479876, 36.433177, 36.946427, 37.349994, 37.230002, 36.724038, 37.092103, 36.899996, 36.41, 35.947444, 35.698984, 34.833507, 34.330773, 33.785742, 33.76874, 33.293343, 33.136996, 32.368903, 32.081815, 31.761421, 31.37607, 30.961831, 30.539325, 30.307556, None, 41.335358, 40.948586, 41.102763, 41.013673, 41.535656, 41.583173, 41.092143, 40.740201, 40.253564, 40.005, 39.713003, 39.428136, 38.281281, 37.971584, 37.170445, 37.001514, 37.256228, 37.385264, 37.229873, 37.074352, 37.091276, 36.716054, 36.712927, 36.90121, 36.623036, 36.81752, 36.259699, 36.040617, 35.821535, 36.274995, 36.650606, 36.565443, 36.795532, 36.21996, 36.107564, 36.644275, 36.677865, 36.262981, 36.144357, 36.676831, 36.658822, 37.653361, 38.208133, 38.98576, 39.463612, 40.420014, 40.460011, 41.219991, 41.087622, 41.736264, 42.01896, 42.040225, 41.335358, None, 40.690566, 40.151994, 40.617754, 40.824123, 40.936261, 41.562115, 41.826905, 42.141485, 42.007359, 41.622886, 41.299934, 41.054962, 40.999823, 40.690566, None, 24.394274, 22.790857, 21.970571, 22.814861, 23.556263, 24.538451, 25.295459, 24.997596, 24.394274, None, -0.95, -1.05982, -3.09699, -3.67712, -4.67677, -5.90895, -6.47566, -6.84, -7.1, -7.7039, -8.00781, -8.48551, -9.11237, -10.0984, -10.3171, -10.89688, -11.285202, -11.26879, -11.56876, -11.594537, -11.720938, -11.439146, -11.52002, -10.16, -9.693674, -9.41715, -9.230599, -8.930359, -8.762049, -8.594579, -8.34, -7.08, -6.52, -5.939999, -5.419979, -4.499983, -4.452389, -4.09012, -3.56858, -3.35931, -3.03431, -2.80762, -2.41383, -2.28725, -1.698914, -1.134659, -1.01455, -1.02736, -0.95, None, -1.02736, -1.01455, -1.134659, -1.443322, -1.341313, -0.587406, -0.2053, 0.59738, 1.062313, 1.583805, 1.849396, 2.204465, 2.33989, 3.50917, 3.7819, 3.55827, 3.79232, 3.79, 4.249885, 3.5556, 3.05374, 1.90584, 1.17694, 0.515, 0.109814, -0.95, -1.02736, None, 52.101678, 52.061267, 52.288695, 52.238465, 52.335075, 51.768882, 51.566413, 51.255993, 51.207572, 50.773955, 50.577197, 50.225591, 50.383953, 49.915662, 49.926462, 49.601055, 49.30743, 48.783818, 48.232405, 47.898937, 47.825608, 47.5464, 47.10219, 47.022221, 46.6987, 46.645964, 46.273197, 45.651219, 45.409993, 45.46999, 45.113216, 44.939996, 44.361479, 44.564877, 45.034771, 45.327466, 45.519186, 45.851569, 46.080598, 46.333348, 46.706245, 46.5831, 46.03241, 45.293308, 45.464925, 45.304031, 45.488283, 45.596907, 45.939987, 46.25883, 46.437889, 46.517678, 46.379262, 46.349988, 46.423937, 46.525326, 46.674361, 46.928583, 47.346645, 47.510227, 47.849095, 48.118149, 48.155562, 48.467119, 48.368211, 48.220726, 48.220881, 47.987149, 47.891056, 47.737526, 47.981878, 47.985598, 48.096341, 47.882194, 48.15024, 48.422264, 48.825392, 49.085738, 49.027395, 49.476774, 50.308506, 50.424881, 50.705407, 51.578454, 51.617444, 51.888461, 51.910656, 51.832289, 51.592303, 51.572227, 51.427714, 51.602044, 51.368234, 51.416138, 51.319503, 51.822806, 52.042353, 52.101678, None, -30.216295, -30.109686, -30.883076, -30.853879, -31.494511, -32.047243, -32.727666, -33.202004, -33.768378, -34.396815, -34.952647, -34.752659, -34.859836, -34.430456, -34.462547, -33.909454, -33.263189, -33.040567, -32.044504, -31.016556, -30.216295, None, 19.08348, 18.91619, 19.05939, 19.33888, 19.70294, 19.81422, 19.97729, 20.17395, 20.26721, 20.2487, 20.07975, 19.99302, 19.8591, 19.50871, 19.45328, 19.23972, 19.08348, None, 20.64397, 20.57241, 20.783, 20.8643, 20.92676, 21.01249, 20.91745, 20.76404, 20.64397, None, 21.17684, 21.06873, 21.09777, 21.21958, 21.17684, None, 21.32217, 21.26442, 21.27729, 21.31244, 21.53919, 21.57912, 21.71696, 21.65272, 21.32217, None, 21.982, 21.88299, 22.06533, 22.1382, 22.23618, 22.21494, 21.982, None, 49.38905, 48.84, 48.67074, 48.60926, 48.45, 48.14, 48.27, 48.01, 48.019808, 48.302918, 47.94, 47.553338, 47.220219, 46.900083, 46.637102, 46.538684, 46.4396, 46.40877, 46.512226, 46.275419, 46.116927, 46.116927, 45.994686, 45.816894, 45.347517, 44.44, 43.571088, 42.98, 42.43, 42.08, 41.975681, 41.832796, 41.675105, 41.675105, 42.209026, 42.3662, 42.863611, 42.965, 43.27, 43.466339, 43.625089, 43.629056, 43.628784, 44.018459, 44.09631, 44.81645, 45.00048, 45.00738, 45.0082, 45.255, 45.30524, 45.46, 45.915, 46.69307, 47.447781, 47.185, 47.35486, 47.06636, 45.70281, 45.13753, 44.8097, 44.3252, 43.98, 43.68405, 43.090238, 42.8653, 42.335, 41.805, 41.78, 42.145, 41.92283, 41.63717, 41.475, 41.49445, 41.32, 41.27, 41.22065, 40.931102, 41.11948, 40.93, 40.63, 40.628, 40.75075, 40.47351, 40.42763, 39.70926, 38.93954, 39.1964, 39.24845, 39.4985, 38.96, 38.782032, 38.40412, 38.01551, 37.21689, 37.2566, 37.93705, 38.319215, 39.15, 38.717615, 38.08326, 38.239992, 37.917945, 36.9664, 36.89726, 36.55125, 35.55074, 34.80854, 34.51201, 33.92547, 33.86133, 33.49395, 33.15839, 32.509355, 32.0333, 31.44049, 30.72999, 30.03552, 29.18, 28.47213, 28.04, 26.88, 26.205765, 25.816775, 25.20616, 25.08, 25.20126, 25.64, 25.87, 26.73, 27.49504, 27.88624, 28.55, 29.1, 29.93656, 30.09, 29.63615, 29.68612, 30.15261, 30.4, 30.27433, 30.3849, 30.31598, 30.159994, 29.89419, 29.48864, 29.29108, 29.15961, 29.30714, 29.11743, 29.148535, 29.677, 29.5523, 29.78375, 29.71363, 29.48, 28.73863, 28.30748, 27.83, 27.38, 26.69, 26.21, 25.87, 25.84, 26.06, 26.37, 26.84, 27.54, 28.11, 28.69612, 29.38071, 29.7793, 29.76, 28.97, 29.27, 29.57196, 30.12173, 30.64402, 31.08383, 31.39995, 31.75452, 31.754854, 31.34222, 31.34194, 31.33472, 32.03914, 32.52528, 32.72083, 32.61239, 32.53534, 33.046225, 33.621236, 33.740909, 34.027782, 34.078, 34.348477, 34.44711, 34.60855, 35.15686, 36.16153, 37.55176, 37.78339, 38.11371, 38.95166, 39.76699, 40.3132, 41.14202, 41.99964, 42.76599, 43.70838, 44.615895, 45.52341, 46.86475, 47.72017, 48.184433, 48.379715, 48.04, 47.096, 47.36, 48.18, 49, 49, 49, 49, 49, 49, 49, 48.99986, 49, 49.0007, 49, 49.38425, 49.38905, None, 57.115842, 56.734677, 56.992749, 57.461196, 57.816575, 57.968968, 57.901427, 57.591059, 57.115842, None, 59.909987, 59.754441, 59.941406, 60.213069, 60.38417, 60.293607, 59.909987, None, 63.782515, 63.592191, 63.694975, 63.431116, 63.297506, 63.188598, 62.976931, 63.194438, 63.375822, 63.317789, 63.405846, 63.782515, None, 71.147776, 70.696409, 70.889989, 70.829992, 70.600006, 70.430017, 70.53001, 70.214035, 70.12001, 69.989992, 70.152514, 69.851938, 69.711998, 66.000029, 60.306397, 60.276838, 60.000007, 59.56211, 58.905, 59.46389, 59.78778, 59.27056, 58.86111, 58.410285, 57.69289, 56.55212, 55.91583, 55.284998, 54.802753, 55.178906, 55.497776, 56.369996, 57.178887, 58.123068, 58.187715, 58.212209, 58.499995, 59.537762, 59.727517, 60.084447, 59.99918, 60.45861, 60.884656, 60.672989, 59.978329, 59.914173, 59.705658, 59.368211, 59.155821, 59.744984, 60.725803, 61.033588, 61.284425, 60.727198, 60.061657, 59.350279, 58.864728, 58.146374, 57.727795, 57.422774, 56.979985, 56.463608, 55.994154, 55.566686, 55.643581, 55.364735, 55.024187, 54.689737, 54.404173, 54.572225, 55.039431, 55.348043, 55.894986, 56.008055, 56.418055, 57.016675, 57.216921, 57.570001, 58.328326, 58.918885, 58.615802, 58.787781, 58.424186, 58.93139, 58.572549, 59.071123, 58.670838, 58.671665, 59.266925, 59.633621, 59.989724, 59.798056, 60.267484, 60.507496, 61.073895, 61.500019, 62.074997, 62.633076, 63.146378, 63.219449, 63.059459, 63.541936, 63.455817, 63.766108, 64.222799, 64.402788, 64.788604, 64.777235, 64.559445, 64.338605, 64.55916, 64.446945, 64.686672, 65.088896, 65.669997, 66.088318, 66.57666, 66.57666, 66.077207, 66.11612, 66.735565, 67.116395, 67.616338, 68.042772, 68.358877, 68.883031, 68.915535, 69.371115, 69.858062, 70.33333, 70.44769, 70.891642, 70.824721, 71.357764, 71.147776, None, 37.362784, 37.974685, 38.402695, 38.892407, 39.363257, 40.053886, 41.084857, 41.26637, 41.220327, 41.425146, 42.223082, 42.751551, 42.170553, 41.826026, 41.32231, 41.308642, 44.995858, 45.586804, 45.500014, 44.784037, 44.405817, 43.504477, 43.650075, 43.728081, 42.99766, 41.994646, 41.987644, 41.168444, 41.135991, 40.662325, 40.668681, 41.384244, 42.081308, 42.266154, 42.167711, 41.519998, 41.143587, 41.3929, 40.866033, 40.145844, 40.244366, 40.218527, 40.496495, 40.960213, 40.727824, 40.086158, 39.533453, 39.580478, 39.140144, 38.901553, 38.157025, 37.144994, 37.356144, 37.362784, None, 11.776284, 11.539994, 11.423282, 10.96946, 10.446494, 9.865651, 9.072263, 9.137195, 9.859993, 10.211935, 10.968969, 11.375482, 11.846822, 12.162307, 11.459611, 11.443385, 10.885744, 10.554653, 10.545868, 10.648627, 10.200799, 10.077215, 10.389599, 10.641418, 10.701724, 10.715625, 10.420269, 9.948204, 9.873067, 9.38134, 8.580174, 8.602757, 8.367035, 7.779603, 7.415, 7.043911, 6.856584, 6.696077, 6.234297, 5.959068, 5.200277, 4.918098, 4.536468, 4.162124, 4.006965, 3.770571, 4.02053, 4.148481, 4.056445, 3.79721, 3.126786, 2.497006, 2.411068, 2.2009, 1.916369, 1.492855, 1.328731, 1.095282, 0.789254, 0.724452, 1.253361, 2.250638, 2.600281, 2.820655, 3.318454, 3.542342, 3.839482, 4.503937, 5.221129, 5.55687, 6.095468, 6.267318, 6.153268, 6.206805, 6.099861, 6.960376, 7.087785, 6.991615, 7.340431, 7.423785, 7.632506, 8.002638, 8.405275, 8.625288, 9.085027, 9.152, 9.73677, 10.450344, 10.821975, 11.108702, 11.608672, 11.776284, None, 21.55238, 20.696851, 19.75205, 19.058165, 18.004121, 16.697457, 16.079742, 15.276691, 13.426028, 11.666859, 11.008321, 10.364484, 9.53084, 8.59976, 9.241038, 9.918491, 10.486544, 10.88931, 10.961812, 11.567615, 12.337206, 13.535531, 14.202441, 15.202173, 15.908538, 16.604284, 17.485315, 18.666975, 19.265181, 19.624668, 19.886642, 20.758733, 20.766562, 21.675137, 22.464753, 22.708795, 22.703757, 22.81915, 23.352063, 22.976892, 22.794268, 22.218205, 21.811899, 21.55238, None, -16.466333, -16.59785, -16.159995, -15.891846, -16.466333, None, -14.93392, -15.740021, -15.614602, -15.668811, -15.392704, -14.626497, -14.93392, None, 32.393992, 31.782505, 31.489086, 31.353435, 31.616778, 31.754341, 31.866582, 32.532511, 32.393992, None, 16.651051, 16.382411, 15.938433, 15.59742, 15.17525, 14.708767, 14.003202, 13.94809, 14.007233, 13.59222, 13.399699, 13.347764, 13.290946, 13.026905, 12.953938, 12.699587, 12.721653, 12.58595, 12.6368, 13.22095, 13.767584, 14.06263, 14.802249, 15.213335, 15.261963, 15.718886, 15.911742, 16.347891, 16.66689, 17.08844, 17.579987, 17.319977, 17.410359, 17.433329, 17.333335, 17.233315, 17.283338, 16.949999, 17.116682, 18.166669, 18.616668, 19.000003, 17.349742, 16.651051, None, -29.257387, -29.401978, -29.909957, -30.423776, -31.140269, -32.172041, -32.771953, -33.226964, -33.61495, -33.66704, -33.944646, -33.796851, -33.987176, -33.794474, -33.916431, -33.864083, -34.258839, -34.417175, -34.795137, -34.819166, -34.462599, -34.444306, -33.997873, -34.136521, -33.867752, -33.281431, -32.611291, -32.429131, -31.661633, -30.725721, -29.878641, -29.875954, -28.576705, -28.082162, -28.355943, -28.783514, -28.856378, -29.045462, -28.972443, -28.461105, -24.76779, -24.917962, -25.868136, -26.477453, -26.828543, -26.726534, -26.280256, -25.979448, -25.500459, -25.26869, -25.390129, -25.670216, -25.71967, -25.486816, -25.174845, -24.696373, -24.616327, -24.240691, -23.574323, -22.827754, -22.091313, -22.102216, -22.271612, -22.151567, -22.25151, -23.658969, -24.369417, -25.484284, -25.843332, -25.660191, -25.731452, -26.022649, -26.398078, -26.743845, -27.285879, -27.177927, -26.73382, -26.742192, -27.470158, -28.301011, -28.752405, -29.257387, None, -9.230599, -9.676722, -10.525559, -10.79655, -11.607198, -12.435778, -12.783871, -13.712858, -13.97186, -14.796099, -15.507787, -15.644678, -16.043051, -16.389749, -16.4684, -17.290831, -17.938026, -17.961229, -17.846042, -17.73654, -17.661816, -17.578823, -17.353411, -17.295843, -17.523116, -16.898451, -16.08031, -12.898437, -12.911046, -12.565848, -12.191297, -11.722282, -11.237298, -10.926826, -10.951993, -11.262826, -11.238694, -11.330936, -11.784965, -11.92444, -11.608748, -12.132747, -12.272481, -12.698604, -13.248958, -13.257227, -12.178895, -12.360744, -11.971569, -11.793647, -10.789884, -9.605925, -9.164918, -8.526559, -8.407032, -8.238257, -8.340007, -8.594579, -8.762049, -8.930359, -9.230599, None, -22.25151, -22.151567, -22.271612, -22.102216, -22.091313, -21.639454, -21.485975, -20.851802, -20.499059, -20.39152, -19.293086, -18.714413, -18.536026, -17.73654, -17.846042, -17.961229, -17.938026, -17.290831, -16.4684, -16.389749, -16.043051, -15.644678, -15.507787, -15.880839, -15.860944, -16.07199, -16.319417, -16.392074, -16.713398, -17.979057, -18.67209, -19.419383, -19.715592, -20.30429, -20.395292, -21.116489, -22.25151, None]
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from bokeh_gridded_sphere import GriddedSphere
+from bokeh_gridded_sphere.geodata import load_polylines, save_polylines
+
+N_LAT, N_LON = 3, 4
+
+
+def make_sphere(values=None):
+    if values is None:
+        values = np.arange(N_LAT * N_LON, dtype=np.float64)
+    return GriddedSphere(n_lat=N_LAT, n_lon=N_LON, values=values)
+
+
+@pytest.mark.parametrize("key, indices", [
+    (5, [5]),
+    (slice(2, 5), [2, 3, 4]),
+    ((1, slice(1, 3)), [5, 6]),
+    (np.arange(N_LAT * N_LON) % 5 == 0, [0, 5, 10]),
+    (np.array([7, 1, 11]), [7, 1, 11]),
+])
+def test_patch_values_keys(key, indices):
+    sphere = make_sphere()
+    sphere.patch_values(key, -1.0)
+
+    expected = np.arange(N_LAT * N_LON, dtype=np.float64)
+    expected[indices] = -1.0
+    np.testing.assert_array_equal(sphere.values, expected)
+
+    patch = sphere.values_patch
+    assert patch["indices"].dtype == np.int32
+    assert patch["indices"].tolist() == indices
+    assert patch["values"].tolist() == [-1.0] * len(indices)
+
+
+def test_patch_values_broadcasts_to_region():
+    sphere = make_sphere()
+    sphere.patch_values((slice(0, 2), slice(2, 4)), [[20, 30], [60, 70]])
+
+    assert sphere.values_patch["indices"].tolist() == [2, 3, 6, 7]
+    assert sphere.values_patch["values"].tolist() == [20, 30, 60, 70]
+    assert sphere.values[[2, 3, 6, 7]].tolist() == [20, 30, 60, 70]
+
+
+def test_patch_values_keeps_float32():
+    sphere = make_sphere(np.zeros(N_LAT * N_LON, dtype=np.float32))
+    sphere.patch_values(0, 1.5)
+
+    assert sphere.values.dtype == np.float32
+    assert sphere.values_patch["values"].dtype == np.float32
+
+
+def test_patch_values_list_resends_values():
+    values = [0.0] * (N_LAT * N_LON)
+    sphere = make_sphere(values)
+    sphere.patch_values(3, 1.0)
+
+    assert sphere.values_patch is None
+    assert isinstance(sphere.values, np.ndarray)
+    assert sphere.values[3] == 1.0
+    assert values[3] == 0.0
+
+
+def test_patch_values_array_sends_patch_in_place():
+    values = np.zeros(N_LAT * N_LON)
+    sphere = make_sphere(values)
+    current = sphere.values
+    sphere.patch_values(3, 1.0)
+
+    assert sphere.values is current
+    assert sphere.values[3] == 1.0
+    assert values[3] == 0.0
+    assert sphere.values_patch["indices"].tolist() == [3]
+
+
+def test_values_assignment_clears_patch():
+    sphere = make_sphere()
+    sphere.patch_values(0, 1.0)
+    sphere.values = np.ones(N_LAT * N_LON)
+    assert sphere.values_patch is None
+
+    # Repeating the earlier patch is a change again
+    sphere.patch_values(0, 1.0)
+    assert sphere.values_patch["indices"].tolist() == [0]
+
+
+def test_polylines_round_trip(tmp_path):
+    nan = float("nan")
+    lons = [nan, 0, 1, 2, nan, nan, 10, 11, nan, 20, 21, 22, nan]
+    lats = [nan, 5, 6, 7, nan, nan, 15, 16, nan, 25, 26, 27, nan]
+    save_polylines("lines", lons, lats, directory=tmp_path)
+
+    with np.load(tmp_path / "lines.npz") as data:
+        assert data["offsets"].tolist() == [0, 3, 5, 8]
+
+    loaded_lons, loaded_lats = load_polylines("lines", directory=tmp_path)
+    assert loaded_lons.dtype == np.float32
+    assert not loaded_lons.flags.writeable
+    np.testing.assert_array_equal(loaded_lons, [0, 1, 2, nan, 10, 11, nan, 20, 21, 22])
+    np.testing.assert_array_equal(loaded_lats, [5, 6, 7, nan, 15, 16, nan, 25, 26, 27])
+
+
+def test_load_polylines_missing(tmp_path):
+    assert load_polylines("missing", directory=tmp_path) is None